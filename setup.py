@@ -45,6 +45,9 @@ setup_kwds = dict(
     )
 # #}
 # change setup_kwds below before the next pkglts tag
+setup_kwds['package_data'] = {'cbzreader': ['icons/*.png']}
+setup_kwds['entry_points']['console_scripts'] = ['cbzreader = cbzreader.cli:main']
+setup_kwds['entry_points']['gui_scripts'] = ['cbzreader-gui = cbzreader.launch:launch']
 
 # do not change things below
 # {# pkglts, pysetup.call
@@ -0,0 +1,139 @@
+"""
+Replace books on disk so that a crash leaves either the old or the new
+version, never a truncated archive.
+"""
+import errno
+import os
+from pathlib import Path
+
+
+def read_umask():
+    """Current umask of process.
+
+    Notes: the umask can only be read by setting it. A restrictive one
+           is set meanwhile, so that files created by other threads are
+           at worst private. Only called once, at import.
+
+    Returns:
+        (int)
+    """
+    umask = os.umask(0o077)
+    os.umask(umask)
+    return umask
+
+
+_umask = read_umask()
+
+
+def default_mode():
+    """Permissions of a newly created file, given umask of process at
+    start up.
+
+    Returns:
+        (int)
+    """
+    return 0o666 & ~_umask
+
+
+def temp_book_path(pth):
+    """Create an empty file to write a book before moving it into place.
+
+    Notes: file gets the permissions of the book it will replace, or of
+           a newly created file, instead of the private ones of mkstemp.
+
+    Args:
+        pth (Path): final path of book
+
+    Returns:
+        (Path): in same directory as final path, with a unique name
+    """
+    from tempfile import mkstemp  # only needed when saving, slow to import
+
+    pth = Path(pth)
+    fd, tmp_pth = mkstemp(prefix=f".{pth.name}.", suffix=".tmp", dir=pth.parent)
+    try:
+        try:
+            mode = pth.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = default_mode()
+
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        else:  # windows, only the read only flag is meaningful anyway
+            os.chmod(tmp_pth, mode)
+    finally:
+        os.close(fd)
+
+    return Path(tmp_pth)
+
+
+def sync_file(fhw):
+    """Make sure content of file has reached the disk.
+
+    Args:
+        fhw (file): file opened for writing
+
+    Returns:
+        (None)
+    """
+    fhw.flush()
+    os.fsync(fhw.fileno())
+
+
+def sync_dir(dir_pth):
+    """Make sure entries of directory, e.g. a rename, have reached the disk.
+
+    Notes: no op on platforms where directories can not be opened.
+
+    Args:
+        dir_pth (Path): path to directory
+
+    Returns:
+        (None)
+    """
+    if os.name != "posix":
+        return
+
+    fd = os.open(dir_pth, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def replace_book(tmp_pth, pth):
+    """Move a fully written book into place, replacing any existing one.
+
+    Notes: the rename is atomic if both paths are on the same file system.
+           Otherwise data is streamed into a temporary file next to the
+           final path first, which is then renamed.
+
+    Args:
+        tmp_pth (Path): book to move, already synced on disk
+        pth (Path): final path of book
+
+    Returns:
+        (None)
+    """
+    pth = Path(pth)
+    try:
+        os.replace(tmp_pth, pth)
+    except OSError as err:
+        if err.errno != errno.EXDEV:
+            raise
+
+        import shutil
+
+        local_pth = temp_book_path(pth)
+        try:
+            with open(tmp_pth, 'rb') as fhr, open(local_pth, 'wb') as fhw:
+                shutil.copyfileobj(fhr, fhw, 1024 * 1024)
+                sync_file(fhw)
+            os.replace(local_pth, pth)
+        except BaseException:
+            local_pth.unlink()
+            raise
+
+        os.unlink(tmp_pth)
+
+    sync_dir(pth.parent)
@@ -0,0 +1,217 @@
+"""
+Persistent index of the pages of books, so that reopening a known book
+does not require to parse and sort its central directory again.
+"""
+from pathlib import Path
+from threading import RLock
+from zipfile import ZipInfo
+
+from .sqlite_store import open_db
+from .user_cache import cache_dir
+
+schema_version = 1
+"""(int) Version of schema, index files of older versions are rebuilt."""
+
+schema = """
+CREATE TABLE IF NOT EXISTS books (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    path TEXT NOT NULL,
+    ind INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    header_offset INTEGER NOT NULL,
+    compress_type INTEGER NOT NULL,
+    compress_size INTEGER NOT NULL,
+    file_size INTEGER NOT NULL,
+    crc INTEGER NOT NULL,
+    flag_bits INTEGER NOT NULL,
+    date_time INTEGER NOT NULL,
+    external_attr INTEGER NOT NULL,
+    format TEXT,
+    width INTEGER,
+    height INTEGER,
+    PRIMARY KEY (path, ind)
+);
+"""
+
+
+def book_key(pth):
+    """Key used to store book in index.
+
+    Args:
+        pth (Path): path to book
+
+    Returns:
+        (str)
+    """
+    return str(Path(pth).absolute())
+
+
+def dos_date_time(date_time):
+    """Pack date the way zip archives store it.
+
+    Args:
+        date_time (tuple): year, month, day, hour, minute, second
+
+    Returns:
+        (int)
+    """
+    year, month, day, hour, minute, second = date_time
+    return (year - 1980) << 25 | month << 21 | day << 16 | hour << 11 | minute << 5 | second // 2
+
+
+def unpack_dos_date_time(packed):
+    """Date packed by dos_date_time.
+
+    Args:
+        packed (int): packed date
+
+    Returns:
+        (tuple): year, month, day, hour, minute, second
+    """
+    return ((packed >> 25) + 1980, (packed >> 21) & 0xF, (packed >> 16) & 0x1F,
+            (packed >> 11) & 0x1F, (packed >> 5) & 0x3F, (packed & 0x1F) * 2)
+
+
+def page_info(row):
+    """Rebuild zip description of page from stored fields.
+
+    Args:
+        row (tuple): name, header_offset, compress_type, compress_size,
+                     file_size, crc, flag_bits, date_time, external_attr
+
+    Returns:
+        (ZipInfo)
+    """
+    name, header_offset, compress_type, compress_size, file_size, crc, flag_bits, date_time, external_attr = row
+    info = ZipInfo(name, unpack_dos_date_time(date_time))
+    info.header_offset = header_offset
+    info.compress_type = compress_type
+    info.compress_size = compress_size
+    info.file_size = file_size
+    info.CRC = crc
+    info.flag_bits = flag_bits
+    info.external_attr = external_attr
+    return info
+
+
+class BookIndex:
+    """Pages of books, with their location in the archive and, when
+    known, their format and size.
+
+    Entries are keyed by path and invalidated as soon as the modification
+    time or size of the book changes.
+    """
+
+    def __init__(self, db_pth=None):
+        """Open or create index.
+
+        Args:
+            db_pth (Path): path to database, default in user cache dir
+        """
+        if db_pth is None:
+            db_pth = cache_dir() / "book_index.sqlite"
+
+        self._lock = RLock()
+        self._db = open_db(db_pth, schema, schema_version)
+
+    def close(self):
+        """Close underlying database.
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            self._db.close()
+
+    def lookup(self, pth, stat=None):
+        """Pages of book if index is up to date.
+
+        Args:
+            pth (Path): path to book
+            stat (os.stat_result): result of pth.stat() if already known
+
+        Returns:
+            (list of (ZipInfo, str|None, (int, int)|None)|None): for each
+            page in reading order its zip description, format and size.
+            None if book is unknown or has been modified.
+        """
+        if stat is None:
+            stat = Path(pth).stat()
+
+        key = book_key(pth)
+        with self._lock:
+            row = self._db.execute("SELECT mtime_ns, size FROM books WHERE path = ?", (key,)).fetchone()
+            if row is None or row != (stat.st_mtime_ns, stat.st_size):
+                return None
+
+            rows = self._db.execute("SELECT name, header_offset, compress_type, compress_size, "
+                                    "file_size, crc, flag_bits, date_time, external_attr, format, width, height "
+                                    "FROM pages WHERE path = ? ORDER BY ind", (key,)).fetchall()
+
+        entries = []
+        for row in rows:
+            fmt, width, height = row[9:]
+            size = None if width is None else (width, height)
+            entries.append((page_info(row[:9]), fmt, size))
+
+        return entries
+
+    def store(self, pth, infos, stat=None):
+        """Record pages of book, replacing any previous entry.
+
+        Args:
+            pth (Path): path to book
+            infos (list of ZipInfo): pages in reading order
+            stat (os.stat_result): result of pth.stat() if already known
+
+        Returns:
+            (None)
+        """
+        if stat is None:
+            stat = Path(pth).stat()
+
+        key = book_key(pth)
+        rows = [(key, ind, info.filename, info.header_offset, info.compress_type, info.compress_size,
+                 info.file_size, info.CRC, info.flag_bits, dos_date_time(info.date_time), info.external_attr)
+                for ind, info in enumerate(infos)]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM pages WHERE path = ?", (key,))
+            self._db.execute("INSERT OR REPLACE INTO books VALUES (?, ?, ?)",
+                             (key, stat.st_mtime_ns, stat.st_size))
+            self._db.executemany("INSERT INTO pages (path, ind, name, header_offset, compress_type, "
+                                 "compress_size, file_size, crc, flag_bits, date_time, external_attr) "
+                                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def update_pages(self, pth, descr):
+        """Record format and size of some pages of a book.
+
+        Args:
+            pth (Path): path to book
+            descr (dict): name of page: (format, (width, height))
+
+        Returns:
+            (None)
+        """
+        key = book_key(pth)
+        rows = [(fmt, size[0], size[1], key, name) for name, (fmt, size) in descr.items()]
+        with self._lock, self._db:
+            self._db.executemany("UPDATE pages SET format = ?, width = ?, height = ? "
+                                 "WHERE path = ? AND name = ?", rows)
+
+    def forget(self, pth):
+        """Remove book from index.
+
+        Args:
+            pth (Path): path to book
+
+        Returns:
+            (None)
+        """
+        key = book_key(pth)
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM pages WHERE path = ?", (key,))
+            self._db.execute("DELETE FROM books WHERE path = ?", (key,))
@@ -0,0 +1,114 @@
+"""
+Write books in a background thread so that reading can go on while a
+large book is saved.
+"""
+from threading import Lock, Thread
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from .atomic_save import temp_book_path
+
+
+class BookSaver(QObject):
+    """Asynchronous writing of the current book of an explorer.
+
+    The archive is written from a snapshot of the book into a temporary
+    file next to its final path. Moving it into place, with
+    Explorer.install_book, is left to the receiver of `written`.
+
+    Notes: the current book of the explorer must not be closed until
+           `written` or `failed` is emitted.
+    """
+
+    progress = pyqtSignal(int, int)  # number of pages written, total number of pages
+    written = pyqtSignal(object, object)  # path to temporary archive, final path of book
+    failed = pyqtSignal(object, str)  # final path of book, error message
+    _done = pyqtSignal()
+
+    def __init__(self, explorer, parent=None):
+        """Create an idle saver.
+
+        Args:
+            explorer (Explorer): explorer whose current book is saved
+            parent (QObject): Qt parent
+        """
+        super().__init__(parent)
+
+        self._ex = explorer
+        self._lock = Lock()
+        self._worker = None
+        self._result = None  # (tmp path, path, error message or None) of finished save
+
+        self._done.connect(self.finish)
+
+    def busy(self):
+        """Whether a save is in progress.
+
+        Returns:
+            (bool)
+        """
+        return self._worker is not None
+
+    def save(self, pth, nb_workers=None):
+        """Start saving current book.
+
+        Notes: must be called from the GUI thread.
+
+        Args:
+            pth (Path): path to archive to create
+            nb_workers (int): number of worker processes used to encode
+                              pages, see Explorer.write_book
+
+        Returns:
+            (None)
+        """
+        assert not self.busy()
+
+        snapshot = self._ex.snapshot()
+        tmp_pth = temp_book_path(pth)
+        self._worker = Thread(target=self._run, args=(snapshot, tmp_pth, pth, nb_workers),
+                              name="cbz-save", daemon=True)
+        self._worker.start()
+
+    def finish(self):
+        """Wait for current save and report its outcome.
+
+        Notes: called automatically once book is written, call it
+               explicitly to complete a save before closing the explorer.
+
+        Returns:
+            (None)
+        """
+        if self._worker is None:
+            return
+
+        self._worker.join()
+        self._worker = None
+
+        with self._lock:
+            tmp_pth, pth, error = self._result
+            self._result = None
+
+        if error is None:
+            self.written.emit(tmp_pth, pth)
+        else:
+            if tmp_pth.exists():
+                tmp_pth.unlink()
+            self.failed.emit(pth, error)
+
+    def _run(self, snapshot, tmp_pth, pth, nb_workers):
+        """Body of worker thread.
+
+        Returns:
+            (None)
+        """
+        try:
+            self._ex.write_book(tmp_pth, snapshot, self.progress.emit, nb_workers)
+            error = None
+        except Exception as err:  # reported to GUI
+            error = str(err)
+
+        with self._lock:
+            self._result = (tmp_pth, pth, error)
+
+        self._done.emit()
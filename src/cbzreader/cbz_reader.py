@@ -1,14 +1,17 @@
-from glob import glob
-from os import mkdir, remove, rename, rmdir
+from io import BytesIO
+from os import remove, rename
 from pickle import dump, dumps, load, loads
 from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 from PIL import Image
 from PyQt5.QtCore import Qt, QCoreApplication
 from PyQt5.QtWidgets import (QFileDialog, QMainWindow, QMessageBox)
-from os.path import basename, dirname, exists, expanduser, join, splitext
+from os.path import basename, exists, expanduser, splitext
+from pathlib import Path
 
 from . import cbz_reader_ui
+from .dir_listing import DirListing
+from .explorer import display_image, encode_image
 
 box_filename = "_img_boxes.pkl"
 im_exts = (".png", ".jpg", ".jpeg", ".gif")
@@ -23,7 +26,7 @@ class CBZReader(QMainWindow):
 
         # private attributes
         self._cbz_file = None  # ref on currently opened zip
-        self._buf_dir = None  # name of directory that store buffered images
+        self._listing = DirListing()  # cbz files in directories
         self.clear()
 
         # setup gui
@@ -54,17 +57,10 @@ class CBZReader(QMainWindow):
         # if None, means full page
 
         self._im_buf = [None] * 2  # buffer of images to be displayed
+        self._im_edited = {}  # edited images, take precedence over archive content
 
         self._file_modified = False  # flag activated if current file is edited
 
-        # clean buffer directory
-        if self._buf_dir is not None:
-            for name in glob(join(self._buf_dir, "*.*")):
-                remove(name)
-
-            rmdir(self._buf_dir)
-            self._buf_dir = None
-
     ########################################################
     #
     #	accessors
@@ -82,22 +78,6 @@ class CBZReader(QMainWindow):
         """
         return not self._ac_show_mouse.isChecked()
 
-    def create_buffer_dir(self):
-        """Create a new empty directory
-        """
-        ind = 0
-        while exists("_tmp_buf_%.4d" % ind):
-            ind += 1
-
-        self._buf_dir = "_tmp_buf_%.4d" % ind
-        mkdir(self._buf_dir)
-
-    def bufname(self, name):
-        """Returns the name of the file in the buffer
-        directory associated to this image.
-        """
-        return join(self._buf_dir, basename(name))
-
     def current_page(self):
         """Return current page in buffer 0
         """
@@ -157,59 +137,35 @@ class CBZReader(QMainWindow):
         self._ac_full_page.setEnabled(self._box_ind is not None)
 
     def _load_img(self, name):
-        bufname = self.bufname(name)
-        if exists(bufname):
-            try:
-                img = Image.open(bufname)
-            except IOError:  # bad image format
-                return None
-            img.load()
-        else:
-            data = self._cbz_file.read(name)
-            f = open(bufname, 'wb')
-            f.write(data)
-            f.close()
-
-            try:
-                img = Image.open(bufname)
-            except IOError:  # bad image format
-                return None
+        if name in self._im_edited:
+            return self._im_edited[name]
 
-            if img.mode == "RGB":
-                img.load()
-            else:
-                img = img.convert("RGB")
-                img.save(bufname)
+        try:
+            img = Image.open(BytesIO(self._cbz_file.read(name)))
+        except IOError:  # bad image format
+            return None
 
-        return img
+        return display_image(img)
 
     def _next_file(self):
         if self._cbz_name is None:
             return None
 
-        cbz_names = sorted(glob(join(dirname(self._cbz_name), "*.cbz")))
-        if len(cbz_names) == 1:  # no other cbz in this directory
-            return None
-
-        ind = cbz_names.index(self._cbz_name)
-        if (ind + 1) == len(cbz_names):  # last file in directory
+        _, name = self._listing.neighbours(Path(self._cbz_name))
+        if name is None:  # last file in directory
             return None
 
-        return cbz_names[ind + 1]
+        return str(name)
 
     def _prev_file(self):
         if self._cbz_name is None:
             return None
 
-        cbz_names = sorted(glob(join(dirname(self._cbz_name), "*.cbz")))
-        if len(cbz_names) == 1:  # no other cbz in this directory
+        name, _ = self._listing.neighbours(Path(self._cbz_name))
+        if name is None:  # first file in directory
             return None
 
-        ind = cbz_names.index(self._cbz_name)
-        if ind == 0:  # first file in directory
-            return None
-
-        return cbz_names[ind - 1]
+        return str(name)
 
     ########################################################
     #
@@ -343,8 +299,6 @@ class CBZReader(QMainWindow):
             self._page_ind = min(page_ind, len(self._im_names) - 1)
 
         # bufferize
-        self.create_buffer_dir()
-
         name = self._im_names[self._page_ind]
         self._im_buf[0] = self._load_img(name)
         if name in self._im_boxes:
@@ -380,14 +334,13 @@ class CBZReader(QMainWindow):
         self.setEnabled(False)  # save is potentialy a long operation
         QCoreApplication.instance().processEvents()
 
-        tmp_name = self.bufname(name)
+        tmp_name = name + ".tmp"
         fw = ZipFile(tmp_name, 'w')
 
         # write images
         boxes = self._im_boxes
         self._im_boxes = {}
         for i, imname in enumerate(self._im_names):
-            bufname = self.bufname(imname)
             pname = ("page%.4d" % i) + splitext(basename(imname))[1]
             # copy boxes
             try:
@@ -396,8 +349,12 @@ class CBZReader(QMainWindow):
                 pass
 
             # write image
-            if exists(bufname):
-                fw.write(bufname, pname, ZIP_DEFLATED)  # TODO date info
+            if imname in self._im_edited:
+                data = encode_image(self._im_edited[imname],
+                                    Image.registered_extensions()[splitext(pname)[1].lower()])
+                info = ZipInfo(pname)  # TODO date info
+                info.compress_type = ZIP_DEFLATED
+                fw.writestr(info, data)
             else:
                 print(imname)
                 data = self._cbz_file.read(imname)
@@ -728,8 +685,8 @@ class CBZReader(QMainWindow):
         self._im_buf[0] = page
         self.update_display()
 
-        # update buffer file
-        page.save(self.bufname(name))
+        # keep edited page until save
+        self._im_edited[name] = page
         self._file_modified = True
 
     def swap_left(self):
@@ -21,6 +21,7 @@ prev = "Left"
 full_page = "P"
 rotate = "R"
 full_screen = ["F11", "Return"]
+thumbnails = "T"
 
 ############################################
 #
@@ -1,9 +1,9 @@
 import cbz_reader_cfg as sh
 from PyQt5.QtCore import QObject, SIGNAL
-from PyQt5.QtWidgets import (QAction, QColor, QIcon, QShortcut)
+from PyQt5.QtWidgets import (QAction, QColor, QShortcut)
 
 from .image_view import ImageView
-from . import icons_rc
+from .reader_ui import icon
 
 def setup_ui(mw):
     mw._im_view = ImageView()
@@ -14,7 +14,7 @@ def setup_ui(mw):
     QObject.connect(mw._im_view, SIGNAL("knife"), mw.cut_image)
 
     mw.setMinimumSize(100, 100)
-    mw.setWindowIcon(QIcon(":images/cbzreader.png"))
+    mw.setWindowIcon(icon("cbzreader"))
 
     pal = mw.palette()
     pal.setColor(pal.Window, QColor(0, 0, 0))
@@ -30,12 +30,12 @@ def setup_ui(mw):
     #
     ############################################
     mw._ac_open = QAction("Open", mw)
-    mw._ac_open.setIcon(QIcon(":images/open.png"))
+    mw._ac_open.setIcon(icon("open"))
     QObject.connect(mw._ac_open, trig, mw.action_open)
     QShortcut(sh.open, mw, mw._ac_open.trigger)
 
     mw._ac_save = QAction("Save", mw)
-    mw._ac_save.setIcon(QIcon(":images/save.png"))
+    mw._ac_save.setIcon(icon("save"))
     QObject.connect(mw._ac_save, trig, mw.action_save)
     QShortcut(sh.save, mw, mw._ac_save.trigger)
 
@@ -44,17 +44,17 @@ def setup_ui(mw):
     QShortcut(sh.save_as, mw, mw._ac_save_as.trigger)
 
     mw._ac_snapshot = QAction("Snapshot", mw)
-    mw._ac_snapshot.setIcon(QIcon(":images/snapshot.png"))
+    mw._ac_snapshot.setIcon(icon("snapshot"))
     QObject.connect(mw._ac_snapshot, trig, mw.action_snapshot)
     QShortcut(sh.snapshot, mw, mw._ac_snapshot.trigger)
 
     mw._ac_next_cbz = QAction("Next cbz", mw)
-    mw._ac_next_cbz.setIcon(QIcon(":images/next_cbz.png"))
+    mw._ac_next_cbz.setIcon(icon("next_cbz"))
     QObject.connect(mw._ac_next_cbz, trig, mw.action_next_cbz)
     QShortcut(sh.next_cbz, mw, mw._ac_next_cbz.trigger)
 
     mw._ac_prev_cbz = QAction("Prev cbz", mw)
-    mw._ac_prev_cbz.setIcon(QIcon(":images/prev_cbz.png"))
+    mw._ac_prev_cbz.setIcon(icon("prev_cbz"))
     QObject.connect(mw._ac_prev_cbz, trig, mw.action_prev_cbz)
     QShortcut(sh.prev_cbz, mw, mw._ac_prev_cbz.trigger)
 
@@ -79,13 +79,13 @@ def setup_ui(mw):
     #
     ############################################
     mw._ac_next = QAction("Next", mw)
-    mw._ac_next.setIcon(QIcon(":images/next.png"))
+    mw._ac_next.setIcon(icon("next"))
     QObject.connect(mw._ac_next, trig, mw.display_next)
     for txt in sh.next:
         QShortcut(txt, mw, mw._ac_next.trigger)
 
     mw._ac_prev = QAction("Prev", mw)
-    mw._ac_prev.setIcon(QIcon(":images/prev.png"))
+    mw._ac_prev.setIcon(icon("prev"))
     QObject.connect(mw._ac_prev, trig, mw.display_prev)
     QShortcut(sh.prev, mw, mw._ac_prev.trigger)
 
@@ -0,0 +1,305 @@
+"""
+Command line tool to inspect and edit many books without any GUI.
+
+Notes: only relies on core modules, PyQt5 is never imported.
+"""
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from zipfile import ZipFile
+
+from .explorer import Explorer
+from .page_cache import PageCache
+
+
+def parse_pages(spec, nb):
+    """Indices of pages described by a human readable list.
+
+    Raises: ValueError if spec is malformed or refers to missing pages.
+
+    Args:
+        spec (str): comma separated page numbers or ranges, starting
+                    at 1, e.g. '1,3,5-7'. Negative numbers count from
+                    the end, e.g. '-1' is last page.
+        nb (int): number of pages in book
+
+    Returns:
+        (list of int): sorted indices, starting at 0
+    """
+    def page_index(txt):
+        num = int(txt)
+        ind = num - 1 if num > 0 else nb + num
+        if num == 0 or not 0 <= ind < nb:
+            raise ValueError(f"no page {num} in book of {nb} pages")
+        return ind
+
+    pages = set()
+    for item in spec.split(","):
+        item = item.strip()
+        first, sep, last = item.partition("-") if not item.startswith("-") else (item, "", "")
+        if sep:
+            pages.update(range(page_index(first), page_index(last) + 1))
+        else:
+            pages.add(page_index(first))
+
+    return sorted(pages)
+
+
+def book_info(ex, args):
+    """Summary of book.
+
+    Returns:
+        (list of str)
+    """
+    pth = ex.current_book()
+    return [f"{pth}: {ex.page_number():d} pages, {pth.stat().st_size:d} bytes"]
+
+
+def book_list(ex, args):
+    """Pages of book in reading order.
+
+    Returns:
+        (list of str)
+    """
+    lines = []
+    for i in range(ex.page_number()):
+        try:
+            w, h = ex.page_size(i)
+            descr = f"{w:d}x{h:d}"
+        except UserWarning:
+            descr = "bad format"
+
+        lines.append(f"{i + 1:4d} {ex.page_name(i)} {descr}")
+
+    return lines
+
+
+def book_extract(ex, args):
+    """Write pages of book as image files, without decoding them.
+
+    Returns:
+        (list of str)
+    """
+    pth = ex.current_book()
+    out_dir = (pth.parent if args.output is None else Path(args.output)) / pth.stem
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    pages = range(ex.page_number()) if args.pages is None else parse_pages(args.pages, ex.page_number())
+    for i in pages:
+        ext = ex.page_name(i).split(".")[-1].lower()
+        (out_dir / f"page{i:04d}.{ext}").write_bytes(ex.page_data(i))
+
+    return [f"{pth}: {len(pages):d} pages extracted in {out_dir}"]
+
+
+def save(ex, args):
+    """Save edited book, in place unless an output is given.
+
+    Returns:
+        (Path): path to saved book
+    """
+    pth = ex.current_book() if args.output is None else Path(args.output)
+    ex.save_book(pth, nb_workers=args.workers)
+    return pth
+
+
+def book_repack(ex, args):
+    """Rewrite book with pages named in reading order.
+
+    Returns:
+        (list of str)
+    """
+    src = ex.current_book()
+    pth = save(ex, args)
+    return [f"{src}: repacked into {pth}"]
+
+
+def book_rotate(ex, args):
+    """Turn some pages upside down.
+
+    Returns:
+        (list of str)
+    """
+    src = ex.current_book()
+    pages = parse_pages(args.pages, ex.page_number())
+    for i in pages:
+        ex.transpose(i)
+
+    pth = save(ex, args)
+    return [f"{src}: {len(pages):d} pages rotated into {pth}"]
+
+
+def book_delete_pages(ex, args):
+    """Remove some pages.
+
+    Returns:
+        (list of str)
+    """
+    src = ex.current_book()
+    pages = parse_pages(args.pages, ex.page_number())
+    for i in reversed(pages):
+        ex.delete_page(i)
+
+    pth = save(ex, args)
+    return [f"{src}: {len(pages):d} pages deleted into {pth}"]
+
+
+def book_verify(ex, args):
+    """Check integrity of archive and decode every page.
+
+    Raises: UserWarning if book is damaged.
+
+    Returns:
+        (list of str)
+    """
+    pth = ex.current_book()
+    with ZipFile(pth) as cbz:
+        bad = cbz.testzip()
+    if bad is not None:
+        raise UserWarning(f"bad CRC for '{bad}'")
+
+    errors = []
+    for i in range(ex.page_number()):
+        try:
+            ex.open_page(i)
+        except UserWarning as err:
+            errors.append(str(err))
+
+    if errors:
+        raise UserWarning(", ".join(errors))
+
+    return [f"{pth}: OK"]
+
+
+commands = {
+    "info": (book_info, "print number of pages and size of books"),
+    "list": (book_list, "list pages of books with their size"),
+    "extract": (book_extract, "write pages as image files"),
+    "repack": (book_repack, "rewrite books with pages named in reading order"),
+    "rotate": (book_rotate, "turn some pages upside down"),
+    "delete-pages": (book_delete_pages, "remove some pages"),
+    "verify": (book_verify, "check archives and decode every page"),
+}
+
+
+def process_book(pth, args):
+    """Apply command to a single book.
+
+    Notes: defined at module level to be callable in worker processes.
+
+    Args:
+        pth (str): path to book
+        args (Namespace): parsed command line
+
+    Returns:
+        (bool, list of str): whether command succeeded and lines to print
+    """
+    func, _ = commands[args.command]
+    try:
+        ex = Explorer(pth, cache=PageCache(max_bytes=0))  # pages are seldom read twice
+        try:
+            return True, func(ex, args)
+        finally:
+            ex.close()
+    except Exception as err:  # report and go on with other books
+        return False, [f"{pth}: {err}"]
+
+
+def library(args):
+    """Update catalog of books below some directories and print its books.
+
+    Args:
+        args (Namespace): parsed command line
+
+    Returns:
+        (int): exit status
+    """
+    from .library import Library  # sqlite is only needed by this command
+
+    lib = Library()
+    try:
+        for root in args.roots:
+            lib.scan(root)
+            for pth, nb_pages in lib.search(args.search, root):
+                print(f"{pth}: {'?' if nb_pages is None else nb_pages} pages")
+    finally:
+        lib.close()
+
+    return 0
+
+
+def build_parser():
+    """Parser of command line.
+
+    Returns:
+        (ArgumentParser)
+    """
+    parser = ArgumentParser(prog="cbzreader", description="Inspect and edit cbz books.")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of books processed in parallel")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, (func, descr) in commands.items():
+        sub = subparsers.add_parser(name, help=descr, description=descr)
+        sub.add_argument("books", nargs="+", help="paths to cbz files")
+        if name in ("extract", "repack", "rotate", "delete-pages"):
+            sub.add_argument("-o", "--output", default=None,
+                             help="parent of directories of pages for extract, output book "
+                                  "otherwise (books are modified in place by default)")
+        if name in ("rotate", "delete-pages"):
+            sub.add_argument("-p", "--pages", required=True, help="pages, e.g. '1,3,5-7' or '-1'")
+        elif name == "extract":
+            sub.add_argument("-p", "--pages", default=None, help="pages, e.g. '1,3,5-7', all by default")
+
+    descr = "index books below directories and list them"
+    sub = subparsers.add_parser("library", help=descr, description=descr)
+    sub.add_argument("roots", nargs="+", help="top directories of library")
+    sub.add_argument("-s", "--search", default="", help="only books whose path contains this text")
+
+    return parser
+
+
+def main(argv=None):
+    """Entry point of the cbzreader command.
+
+    Args:
+        argv (list of str): command line arguments, sys.argv[1:] if None
+
+    Returns:
+        (int): exit status, 1 if some book failed
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "library":
+        return library(args)
+
+    if getattr(args, "output", None) is not None and len(args.books) > 1 and args.command != "extract":
+        parser.error("--output can only be used with a single book")
+
+    pool = None
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        args.workers = 1  # books are already processed in parallel
+        pool = ProcessPoolExecutor(args.jobs)
+        results = pool.map(process_book, args.books, [args] * len(args.books))
+    else:
+        args.workers = None
+        results = (process_book(pth, args) for pth in args.books)
+
+    ok = True
+    try:
+        for success, lines in results:  # in order of books, as soon as available
+            out = sys.stdout if success else sys.stderr
+            for line in lines:
+                print(line, file=out)
+            ok = ok and success
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Cache of the books found in directories, used to find the siblings of
+the current book without listing its directory each time.
+"""
+import os
+from bisect import bisect_left, bisect_right
+from fnmatch import fnmatch
+from pathlib import Path
+from threading import RLock, Thread
+from time import time_ns
+
+mtime_margin_ns = 2 * 10 ** 9
+"""(int) Listings made less than this after a change of directory are not
+trusted, since file systems with coarse timestamps might hide later changes."""
+
+
+class DirListing:
+    """Sorted lists of books per directory.
+
+    A listing is reused as long as the modification time of its directory
+    has not changed, which costs a single stat call.
+    """
+
+    def __init__(self, pattern="*.cbz"):
+        """Create an empty cache.
+
+        Args:
+            pattern (str): glob pattern of book names
+        """
+        self._pattern = pattern
+        self._lock = RLock()
+        self._listings = {}  # dir: (mtime_ns, listed_at_ns, sorted books)
+
+    def books(self, dir_pth):
+        """Books in directory, sorted by path.
+
+        Args:
+            dir_pth (Path): path to directory
+
+        Returns:
+            (list of Path)
+        """
+        dir_pth = Path(dir_pth)
+        mtime_ns = dir_pth.stat().st_mtime_ns
+        with self._lock:
+            try:
+                listed_mtime_ns, listed_at_ns, books = self._listings[dir_pth]
+                if listed_mtime_ns == mtime_ns and listed_at_ns - mtime_ns > mtime_margin_ns:
+                    return books
+            except KeyError:
+                pass
+
+        listed_at_ns = time_ns()
+        books = sorted(dir_pth / entry.name for entry in os.scandir(dir_pth)
+                       if not entry.name.startswith(".") and fnmatch(entry.name, self._pattern))
+
+        with self._lock:
+            self._listings[dir_pth] = (mtime_ns, listed_at_ns, books)
+
+        return books
+
+    def neighbours(self, pth):
+        """Books just before and after given one in its directory.
+
+        Notes: given book does not need to exist anymore.
+
+        Args:
+            pth (Path): path to book
+
+        Returns:
+            (Path|None, Path|None): previous and next books, None if
+                                    book is first or last respectively
+        """
+        pth = Path(pth)
+        books = self.books(pth.parent)
+
+        ind = bisect_left(books, pth)
+        prev_book = books[ind - 1] if ind > 0 else None
+
+        ind = bisect_right(books, pth)
+        next_book = books[ind] if ind < len(books) else None
+
+        return prev_book, next_book
+
+    def refresh_async(self, dir_pth):
+        """Make sure listing of directory is up to date, in background.
+
+        Args:
+            dir_pth (Path): path to directory
+
+        Returns:
+            (Thread): already started
+        """
+        th = Thread(target=self._refresh, args=(dir_pth,), name="cbz-listing", daemon=True)
+        th.start()
+        return th
+
+    def _refresh(self, dir_pth):
+        """List directory if needed, ignoring errors.
+
+        Args:
+            dir_pth (Path): path to directory
+
+        Returns:
+            (None)
+        """
+        try:
+            self.books(dir_pth)
+        except OSError:  # directory removed meanwhile, will fail again when really needed
+            pass
+
+    def forget(self, dir_pth):
+        """Drop cached listing of directory.
+
+        Args:
+            dir_pth (Path): path to directory
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            self._listings.pop(Path(dir_pth), None)
@@ -0,0 +1,221 @@
+"""
+Persistent cache of decoded pages, keyed by page content so that
+identical pages of different books, e.g. repacks of the same issue, are
+only decoded once, even across sessions.
+"""
+import os
+from queue import Full, Queue
+from threading import RLock, Thread
+
+from PIL import Image
+
+from .explorer import draft_fits
+from .sqlite_store import LruTable, open_db
+from .user_cache import cache_dir
+
+schema_version = 1
+"""(int) Version of schema, caches of older versions are emptied."""
+
+schema = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    full_width INTEGER NOT NULL,
+    full_height INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    nbytes INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (key, width)
+);
+CREATE INDEX IF NOT EXISTS pages_last_used ON pages (last_used);
+"""
+
+default_max_bytes = 2 ** 30
+"""(int) Default budget of cache on disk, in bytes."""
+
+max_pending_writes = 8
+"""(int) Number of decoded pages waiting to be written above which new
+ones are dropped rather than held in memory."""
+
+
+class DiskPageCache:
+    """Raw pixels of decoded pages stored in files, bounded by their total
+    size.
+
+    A page can be stored at several resolutions, e.g. full resolution
+    and JPEG draft. Least recently used entries are evicted once the
+    budget is exceeded. Files are written by a background thread so that
+    storing a page never delays its display.
+    """
+
+    def __init__(self, dir_pth=None, max_bytes=default_max_bytes):
+        """Open or create cache.
+
+        Args:
+            dir_pth (Path): directory of cache, default in user cache dir
+            max_bytes (int): maximal total size of stored pages
+        """
+        if dir_pth is None:
+            dir_pth = cache_dir() / "pages"
+
+        dir_pth.mkdir(parents=True, exist_ok=True)
+        self._dir = dir_pth
+        self._lock = RLock()
+        self._db = open_db(dir_pth / "index.sqlite", schema, schema_version, on_rebuild=self._remove_files)
+        self._table = LruTable(self._db, self._lock, "pages", ("key", "width"), max_bytes)
+
+        self._queue = Queue(max_pending_writes)
+        self._writer = Thread(target=self._run, name="cbz-page-writer", daemon=True)
+        self._writer.start()
+
+    def close(self):
+        """Write pending pages and close underlying database.
+
+        Returns:
+            (None)
+        """
+        self._queue.put(None)
+        self._writer.join()
+        with self._lock:
+            self._db.close()
+
+    def nbytes(self):
+        """Total size of stored pages.
+
+        Returns:
+            (int)
+        """
+        return self._table.nbytes()
+
+    def _remove_files(self):
+        """Remove all stored pixels, e.g. once their index is dropped.
+
+        Returns:
+            (None)
+        """
+        for pth in self._dir.glob("*.raw"):
+            pth.unlink(missing_ok=True)
+
+    def _file(self, key, width):
+        """Path to file storing pixels of a page.
+
+        Args:
+            key (str): identifier of page content
+            width (int): width of stored image
+
+        Returns:
+            (Path)
+        """
+        return self._dir / f"{key}-{width:d}.raw"
+
+    def get(self, key, size=None):
+        """Stored version of a page, marked as recently used.
+
+        Args:
+            key (str): identifier of page content
+            size (int, int): size of display area, a reduced version is
+                             returned if it still fills it, see
+                             explorer.draft_fits. Full resolution if None.
+
+        Returns:
+            (Image, (int, int))|None: image and size of page at full
+                                      resolution, None if not stored
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT width, height, full_width, full_height, mode FROM pages "
+                                    "WHERE key = ? ORDER BY width", (key,)).fetchall()
+
+        for width, height, full_w, full_h, mode in rows:  # smallest first
+            full_size = (full_w, full_h)
+            if (width, height) == full_size or (size is not None and
+                                               draft_fits((width, height), full_size, size)):
+                try:
+                    data = self._file(key, width).read_bytes()
+                except FileNotFoundError:  # evicted meanwhile
+                    return None
+
+                self._table.touch((key, width))
+
+                img = Image.frombuffer(mode, (width, height), data, "raw", mode, 0, 1)
+                return img, full_size
+
+        return None
+
+    def put(self, key, img, full_size):
+        """Store decoded page in background.
+
+        Notes: page is dropped if too many are already waiting. Palette
+               images are never stored, raw pixels would lose their palette.
+
+        Args:
+            key (str): identifier of page content
+            img (Image): decoded page, not modified afterwards
+            full_size (int, int): size of page at full resolution
+
+        Returns:
+            (None)
+        """
+        if img.mode == "P":
+            return
+
+        try:
+            self._queue.put_nowait((key, img, full_size))
+        except Full:
+            pass
+
+    def flush(self):
+        """Wait until all pages passed to put have been written.
+
+        Returns:
+            (None)
+        """
+        self._queue.join()
+
+    def _run(self):
+        """Main loop of writer thread.
+
+        Returns:
+            (None)
+        """
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+
+                self._write(*item)
+            except Exception as err:  # keep writer alive whatever happens
+                print(f"unable to store page in cache: {err}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, key, img, full_size):
+        """Store decoded page, evicting least recently used ones if needed.
+
+        Args:
+            key (str): identifier of page content
+            img (Image): decoded page
+            full_size (int, int): size of page at full resolution
+
+        Returns:
+            (None)
+        """
+        data = img.tobytes()
+        if len(data) > self._table.max_bytes():
+            return
+
+        width, height = img.size
+        pth = self._file(key, width)
+        tmp_pth = pth.with_suffix(f".{os.getpid():d}.tmp")  # cache might be shared by several readers
+        tmp_pth.write_bytes(data)
+        os.replace(tmp_pth, pth)
+
+        try:
+            evicted = self._table.put((key, width, height, full_size[0], full_size[1], img.mode), len(data))
+        except Exception:  # no file left behind without its entry
+            pth.unlink(missing_ok=True)
+            raise
+
+        for old_key, old_width in evicted:
+            self._file(old_key, old_width).unlink(missing_ok=True)
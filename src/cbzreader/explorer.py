@@ -2,76 +2,287 @@
 An explorer is used to navigate through the different cbz files in a directory
 and display the content of each.
 """
+import mmap
+import os
 from datetime import datetime
 from io import BytesIO
+from math import ceil
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
-from PIL import Image
+from threading import RLock, Thread
+from weakref import WeakSet
+from zipfile import ZIP_STORED, BadZipFile, ZipFile, ZipInfo
+from PIL import Image, ImageChops
+
+from .atomic_save import replace_book, sync_file, temp_book_path
+from .dir_listing import DirListing
+from .member_io import (MemoryFile, inflate_member, member_data_view, read_raw_member, stored_member_view,
+                        write_raw_member)
+from .page_cache import PageCache
+from .page_overlay import PageOverlay
 
 im_exts = ("png", "jpg", "jpeg", "gif")
 
+parallel_min_pages = 4
+"""(int) Minimal number of pages to encode to justify starting worker processes."""
+
+display_modes = ("L", "P", "RGB", "RGBA")
+"""(tuple of str) Image modes displayed without any conversion of pixels."""
+
+jpeg_modes = ("L", "RGB", "CMYK")
+"""(tuple of str) Image modes that can be written as JPEG."""
+
+gray_sample_size = 64
+"""(int) Side of the grid of pixels sampled to detect grayscale pages."""
+
+gray_tolerance = 8
+"""(int) Maximal difference between the channels of a sampled pixel for
+it to count as gray, absorbs the chroma noise of JPEG scans."""
+
+
+def page_format(name):
+    """Image format associated to the extension of a page.
+
+    Args:
+        name (str): name of page in archive
+
+    Returns:
+        (str): PIL format, JPEG if extension is unknown
+    """
+    return Image.registered_extensions().get("." + name.split(".")[-1].lower(), "JPEG")
+
+
+def encode_image(img, fmt, fhw=None):
+    """Encode image in given format.
+
+    Notes: defined at module level to be callable in worker processes.
+
+    Args:
+        img (Image): image to encode
+        fmt (str): PIL format
+        fhw (file): file to write into, if None encoded bytes are returned
+
+    Returns:
+        (bytes|None)
+    """
+    params = {}
+    if fmt == "JPEG":
+        params["quality"] = 95
+        if img.mode not in jpeg_modes:  # e.g. png page with alpha named as jpeg
+            img = img.convert("RGB")
+
+    if fhw is not None:
+        img.save(fhw, fmt, **params)
+        return None
+
+    data = BytesIO()
+    img.save(data, fmt, **params)
+    return data.getvalue()
+
+
+def new_page_info(name):
+    """Description of an encoded page to add to an archive.
+
+    Args:
+        name (str): name of page in archive
+
+    Returns:
+        (ZipInfo)
+    """
+    info = ZipInfo(name, datetime.now().timetuple()[:6])
+    info.compress_type = ZIP_STORED  # images are already compressed
+    return info
+
+
+def display_image(img):
+    """Decode image, keeping its pixels as stored when they can be displayed.
+
+    Notes: only modes without Qt counterpart, e.g. CMYK, 16 bits grayscale
+           or transparent palettes, are converted.
+
+    Args:
+        img (Image): freshly opened image
+
+    Returns:
+        (Image): loaded image in one of `display_modes`
+    """
+    if img.mode in display_modes and not (img.mode == "P" and "transparency" in img.info):
+        img.load()
+        return img
+
+    bands = img.getbands()
+    if "A" in bands or "transparency" in img.info:
+        return img.convert("RGBA")
+
+    return img.convert("L" if len(bands) == 1 else "RGB")
+
+
+def is_grayscale(img):
+    """Whether an RGB image is effectively gray, e.g. a black and white
+    scan stored in color.
+
+    Notes: only pixels on a regular grid are checked.
+
+    Args:
+        img (Image): image in RGB mode
+
+    Returns:
+        (bool)
+    """
+    w, h = img.size
+    sample = img.resize((min(w, gray_sample_size), min(h, gray_sample_size)), Image.NEAREST)
+    r, g, b = sample.split()
+    return all(ImageChops.difference(a, b).getextrema()[1] <= gray_tolerance for a, b in ((r, g), (g, b)))
+
+
+def fit_size(img_size, box_size):
+    """Size of image once scaled to fit in box, keeping aspect ratio.
+
+    Args:
+        img_size (int, int): width, height of image
+        box_size (int, int): width, height of box
+
+    Returns:
+        (int, int)
+    """
+    w, h = img_size
+    ratio = min(box_size[0] / w, box_size[1] / h)
+    return max(1, ceil(w * ratio)), max(1, ceil(h * ratio))
+
+
+def draft_fits(draft_size, full_size, box_size):
+    """Check whether reduced image has enough pixels to fill box.
+
+    Args:
+        draft_size (int, int): width, height of reduced image
+        full_size (int, int): width, height of image at full resolution
+        box_size (int, int): width, height of box
+
+    Returns:
+        (bool)
+    """
+    w, h = fit_size(full_size, box_size)
+    return draft_size[0] >= w and draft_size[1] >= h
+
 
 class Explorer:
-    def __init__(self, pth=None):
+    def __init__(self, pth=None, cache=None, index=None, listing=None, disk_cache=None):
         """Create an explorer initialize on given path.
 
         Args:
             pth (str): path to current file
+            cache (PageCache): cache of decoded pages, a new one with
+                               default budget if None
+            index (BookIndex): persistent index of pages of books, if None
+                               books are always fully parsed when opened
+            listing (DirListing): cache of books in directories, used to
+                                  find siblings of current book
+            disk_cache (DiskPageCache): persistent cache of decoded pages
+                                        shared by all books, if None pages
+                                        are decoded each time they are
+                                        opened
         """
         self._pth = None  # path to currently opened book
-        self._buf_dir = None  # directory to write images temporarily
+        self._cbz = None  # archive handle, only opened when needed
+        self._cbz_lock = RLock()  # serialize access to archive handle
+        self._cbz_map = None  # memory map of archive to read stored pages without copy
+        self._views = WeakSet()  # files handed over to PIL that still refer to map
         self._pages = None  # list of page names in currently open book
+        self._infos = {}  # name: location of page in archive
+        self._page_sizes = {}  # full resolution size of pages whose header has been read
+        self._page_formats = {}  # image format of pages whose header has been read
+        self._index = index
+        self._listing = DirListing() if listing is None else listing
+        self._preopened = None  # (path, explorer, thread) of book opened in background
+        self._cache = PageCache() if cache is None else cache  # decoded pages
+        self._disk_cache = disk_cache
+        self._overlay = PageOverlay()  # edited pages of current book
 
         if pth is not None:
             self.set_book(Path(pth))
 
-    def _clear_buffer_dir(self):
-        """Remove all images in buffer_dir and actual dir itself.
+    def close(self):
+        """Cleanly close the explorer.
 
         Returns:
             (None)
         """
-        if self._buf_dir is not None:
-            for pth in self._buf_dir.glob("*.*"):
-                pth.unlink()
+        ex = self._take_preopened(None)
+        if ex is not None:
+            ex.close()
 
-            self._buf_dir.rmdir()
-            self._buf_dir = None
+        self.close_book()
 
-    def _create_buffer_dir(self):
-        """Create a new empty directory
+    def close_book(self):
+        """Cleanly close current open book
 
         Returns:
             (None)
         """
-        assert self._buf_dir is None  # need to clear it first
+        self._release_archive()
 
-        ind = 0
-        while Path(f"_tmp_buf_{ind:04d}").exists():
-            ind += 1
+        # edited versions of pages are lost with the book
+        for name in self._overlay.names():
+            self._cache.discard((self._pth, name))
+            self._cache.discard((self._pth, name, "draft"))
+        self._overlay.clear()
 
-        self._buf_dir = Path(f"_tmp_buf_{ind:04d}")
-        self._buf_dir.mkdir()
+        # remember what has been learned about pages for next time
+        if self._index is not None and self._pth is not None:
+            descr = {name: (fmt, self._page_sizes[name]) for name, fmt in self._page_formats.items()}
+            if descr:
+                self._index.update_pages(self._pth, descr)
 
-    def close(self):
-        """Cleanly close the explorer.
+        self._infos = {}
+        self._page_sizes = {}
+        self._page_formats = {}
+
+        self._pth = None
+
+        if self._pages is not None:
+            self._pages = None
+
+    def _release_archive(self):
+        """Close files opened on archive of current book, pages and edits
+        are kept.
 
         Returns:
             (None)
         """
-        self._clear_buffer_dir()
-        self.close_book()
+        with self._cbz_lock:
+            if self._cbz is not None:
+                self._cbz.close()
+                self._cbz = None
+
+            if self._cbz_map is not None:
+                for fhr in list(self._views):
+                    fhr.close()
+                self._views = WeakSet()
+                self._cbz_map.close()
+                self._cbz_map = None
+
+    @staticmethod
+    def _map_archive(pth):
+        """Map archive in memory.
 
-    def close_book(self):
-        """Cleanly close current open book
+        Args:
+            pth (Path): path to archive
 
         Returns:
-            (None)
+            (mmap|None): None if file system does not support it
         """
-        self._pth = None
+        try:
+            with pth.open('rb') as fhr:
+                return mmap.mmap(fhr.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # no mapping on this file system, use regular reads
+            return None
 
-        if self._pages is not None:
-            self._pages = None
+    def cache(self):
+        """Cache of decoded pages, use it to tune budget or read counters.
+
+        Returns:
+            (PageCache)
+        """
+        return self._cache
 
     def set_book(self, pth):
         """Open given book as current.
@@ -85,11 +296,117 @@ class Explorer:
         assert pth.suffix == ".cbz"
 
         self.close_book()
-        self._clear_buffer_dir()
+
+        ex = self._take_preopened(pth)
+        if ex is not None:  # take over book already opened in background
+            with self._cbz_lock, ex._cbz_lock:
+                self._cbz, ex._cbz = ex._cbz, None
+                self._cbz_map, ex._cbz_map = ex._cbz_map, None
+                self._views, ex._views = ex._views, WeakSet()
+                self._infos = ex._infos
+                self._pages = ex._pages
+                self._page_sizes = ex._page_sizes
+                self._page_formats = ex._page_formats
+                self._pth = pth
+
+            ex.close_book()
+            return
+
+        stat = pth.stat()
+        entries = None if self._index is None else self._index.lookup(pth, stat)
+
+        with self._cbz_lock:
+            if entries is None:
+                self._cbz = ZipFile(pth, 'r')
+                infos = sorted([info for info in self._cbz.infolist()
+                                if info.filename.split(".")[-1].lower() in im_exts],
+                               key=lambda info: info.filename)
+                if self._index is not None:
+                    self._index.store(pth, infos, stat)
+            else:  # known book, no need to parse archive
+                infos = [info for info, _, _ in entries]
+                for info, fmt, size in entries:
+                    if size is not None:
+                        self._page_sizes[info.filename] = size
+                        self._page_formats[info.filename] = fmt
+
+            self._cbz_map = self._map_archive(pth)
 
         self._pth = pth
-        with ZipFile(pth, 'r') as cbz:
-            self._pages = sorted([n for n in cbz.namelist() if n.split(".")[-1].lower() in im_exts])
+        self._infos = {info.filename: info for info in infos}
+        self._pages = [info.filename for info in infos]
+
+    def preopen_book(self, pth, nb_pages=2, size=None):
+        """Open a book and decode its first pages in background, so that
+        a later call to set_book with the same book is immediate.
+
+        Notes: book opened previously in background, if any, is closed.
+
+        Args:
+            pth (Path): path to book
+            nb_pages (int): number of pages to decode
+            size (int, int): size of display area, see open_page
+
+        Returns:
+            (None)
+        """
+        if self._preopened is not None and self._preopened[0] == pth:
+            return
+
+        ex = self._take_preopened(None)
+        if ex is not None:
+            ex.close()
+
+        ex = Explorer(cache=self._cache, index=self._index, listing=self._listing, disk_cache=self._disk_cache)
+
+        def run():
+            try:
+                ex.set_book(pth)
+                for page in range(min(nb_pages, ex.page_number())):
+                    ex.open_page(page, size)
+            except (OSError, UserWarning, BadZipFile) as err:  # set_book will fail again if needed
+                print(f"unable to preopen '{pth}': {err}")
+
+        th = Thread(target=run, name="cbz-preopen", daemon=True)
+        th.start()
+        self._preopened = (pth, ex, th)
+
+    def _take_preopened(self, pth):
+        """Explorer that opened given book in background.
+
+        Notes: wait for background work to finish.
+
+        Args:
+            pth (Path): path to book, None to take whatever was preopened
+
+        Returns:
+            (Explorer|None): None if given book has not been preopened,
+                             caller is responsible to close it otherwise
+        """
+        if self._preopened is None:
+            return None
+
+        pre_pth, ex, th = self._preopened
+        self._preopened = None
+        th.join()
+
+        if pth is not None and (pre_pth != pth or ex.current_book() != pth):
+            ex.close()
+            return None
+
+        return ex
+
+    def _archive(self):
+        """Archive handle of current book, opened on first use.
+
+        Returns:
+            (ZipFile)
+        """
+        with self._cbz_lock:
+            if self._cbz is None:
+                self._cbz = ZipFile(self._pth, 'r')
+
+            return self._cbz
 
     def current_book(self):
         """Path to currently open book.
@@ -99,6 +416,15 @@ class Explorer:
         """
         return self._pth
 
+    def prefetch_siblings(self):
+        """List directory of current book in background, so that next_book
+        and prev_book answer immediately once needed.
+
+        Returns:
+            (None)
+        """
+        self._listing.refresh_async(self._pth.parent)
+
     def next_book(self):
         """Path to next book in current directory.
 
@@ -107,12 +433,11 @@ class Explorer:
         Returns:
             (Path): path to next book
         """
-        books = sorted(self._pth.parent.glob("*.cbz"))
-        ind = books.index(self._pth)
-        if ind == len(books) - 1:
+        _, next_book = self._listing.neighbours(self._pth)
+        if next_book is None:
             raise IndexError("Current book is last book in dir")
 
-        return books[ind + 1]
+        return next_book
 
     def prev_book(self):
         """Path to previous book in current directory.
@@ -122,81 +447,110 @@ class Explorer:
         Returns:
             (Path): path to previous book
         """
-        books = sorted(self._pth.parent.glob("*.cbz"))
-        ind = books.index(self._pth)
-        if ind == 0:
+        prev_book, _ = self._listing.neighbours(self._pth)
+        if prev_book is None:
             raise IndexError("Current book is first book in dir")
 
-        return books[ind - 1]
+        return prev_book
+
+    def page_data(self, page):
+        """Encoded image of page, read straight from the archive.
+
+        Raises: AssertionError if no current book.
 
-    def _buffer_name(self, page):
-        """Construct a valid buffer name
+        Notes: safe to call from several threads.
 
         Args:
-            page (int): index of page
-            ext (str): file extension to use
+            page (int): index of page in current book
 
         Returns:
-            (Path)
+            (bytes)
         """
-        return self._buf_dir / self._pages[page]  # assert flat pages no sub directories
+        assert self._pth is not None
+        assert 0 <= page < self.page_number()
 
-    def _already_bufferized(self, page):
-        """Check if page already in buffer.
+        info = self._infos[self._pages[page]]
+        with self._cbz_lock:
+            if self._cbz_map is not None:
+                view = stored_member_view(self._cbz_map, info)
+                if view is not None:
+                    with view:
+                        return view.tobytes()
 
-        Args:
-            page (int): index of page to look for
+                data = inflate_member(self._cbz_map, info)
+                if data is not None:
+                    return data
+
+            return self._archive().read(info.filename)
+
+    def page_number(self):
+        """Number of pages in current book.
 
         Returns:
-            (Path|None): None if nothing is found
+            (int)
         """
-        page_pth = self._buffer_name(page)
-        if page_pth.exists():
-            return page_pth
+        return len(self._pages)
 
-    def buffer(self, page=0):
-        """Extract and write given page into associated buffer.
+    def page_name(self, page):
+        """Name of page in archive.
 
-        Raises: AssertionError if no current book.
+        Args:
+            page (int): index of page in current book
 
-        Notes: only perform write operation if page not already buffered.
+        Returns:
+            (str)
+        """
+        return self._pages[page]
+
+    def _cache_key(self, page):
+        """Key of page in cache of decoded images.
 
         Args:
-            page (int): index of page to write
+            page (int): index of page in current book
 
         Returns:
-            (Path): path to image in buffer
+            (Path, str)
         """
-        assert self._pth is not None
+        return self._pth, self._pages[page]
 
-        if self._buf_dir is None:
-            self._create_buffer_dir()
+    def _page_file(self, page):
+        """File object on encoded image of page.
 
-        page_pth = self._already_bufferized(page)
-        if page_pth is not None:
-            return page_pth
+        Notes: pages stored without compression are served directly from
+               the memory map of the archive, without any copy.
 
-        assert 0 <= page < self.page_number()
+        Args:
+            page (int): index of page in current book
 
-        with ZipFile(self._pth, 'r') as cbz:
-            data = cbz.read(self._pages[page])
+        Returns:
+            (MemoryFile|BytesIO)
+        """
+        with self._cbz_lock:
+            if self._cbz_map is not None:
+                view = stored_member_view(self._cbz_map, self._infos[self._pages[page]])
+                if view is not None:
+                    fhr = MemoryFile(view)
+                    self._views.add(fhr)
+                    return fhr
 
-        page_pth = self._buffer_name(page)
-        with page_pth.open('wb') as fhw:
-            fhw.write(data)
+        return BytesIO(self.page_data(page))
 
-        return page_pth
+    def _draft_key(self, page):
+        """Key of reduced scale version of page in cache of decoded images.
 
-    def page_number(self):
-        """Number of pages in current book.
+        Args:
+            page (int): index of page in current book
 
         Returns:
-            (int)
+            (Path, str, str)
         """
-        return len(self._pages)
+        return self._pth, self._pages[page], "draft"
 
-    def open_page(self, page):
-        """Read page and return image.
+    def page_size(self, page):
+        """Size of page at full resolution.
+
+        Notes: only the header of the image is read if page has not been
+               decoded yet.
 
         Raises: UserWarning if bad image format.
 
@@ -204,52 +558,380 @@ class Explorer:
             page (int): index of page in current book
 
         Returns:
-            (Image)
+            (int, int): width, height
         """
-        pth = self.buffer(page)
+        name = self._pages[page]
+        img = self._overlay.get(name)
+        if img is not None:
+            return img.size
+
         try:
-            img = Image.open(str(pth))
+            return self._page_sizes[name]
+        except KeyError:
+            pass
+
+        try:
+            with Image.open(self._page_file(page)) as img:
+                self._page_sizes[name] = img.size
+                self._page_formats[name] = img.format
         except IOError:
-            raise UserWarning(f"Bad image format '{pth}'")
+            raise UserWarning(f"Bad image format '{name}'")
+
+        return self._page_sizes[name]
+
+    def page_key(self, page):
+        """Identifier of the content of a page, shared by identical pages
+        of different books.
 
-        if img.mode == "RGB":
-            img.load()
+        Notes: relies on checksum and size recorded in archive, nothing
+               is read.
+
+        Args:
+            page (int): index of page in current book
+
+        Returns:
+            (str|None): None if page has been edited
+        """
+        name = self._pages[page]
+        if name in self._overlay.names():
+            return None
+
+        info = self._infos[name]
+        return f"{info.CRC:08x}-{info.file_size:d}"
+
+    def thumbnail(self, page, size):
+        """Small version of page.
+
+        Notes: JPEG pages are decoded at reduced resolution, image is
+               neither read from nor stored in the cache of pages.
+
+        Raises: UserWarning if bad image format.
+
+        Args:
+            page (int): index of page in current book
+            size (int, int): bounding box of thumbnail
+
+        Returns:
+            (Image): in L or RGB mode
+        """
+        name = self._pages[page]
+        img = self._overlay.get(name)
+        if img is None:
+            try:
+                img = Image.open(self._page_file(page))
+            except IOError:
+                raise UserWarning(f"Bad image format '{name}'")
+
+            if img.format == "JPEG":
+                img.draft(img.mode, fit_size(img.size, size))
         else:
+            img = img.copy()
+
+        if img.mode not in ("L", "RGB"):  # palettes are only resized with nearest neighbour
             img = img.convert("RGB")
-            img.save(str(pth))  # overwrite buffer to avoid doing it each time
 
+        img.thumbnail(size)
         return img
 
-    def save_book(self, pth):
-        """Save current book on disk.
+    def cached_page(self, page, size=None, count=True):
+        """Decoded page if already available.
+
+        Notes: a lookup is counted once in the statistics of the cache,
+               whichever version of the page is found.
+
+        Args:
+            page (int): index of page in current book
+            size (int, int): size of display area, see open_page
+            count (bool): whether to count lookup as a hit or a miss,
+                          False if page is looked up again right after
+
+        Returns:
+            (Image|None): None if page needs to be decoded
+        """
+        key = self._cache_key(page)
+        img = self._cache.peek(key)
+        if img is None and size is not None:
+            draft_key = self._draft_key(page)
+            draft = self._cache.peek(draft_key)
+            full_size = self._page_sizes.get(self._pages[page])
+            if draft is not None and full_size is not None and draft_fits(draft.size, full_size, size):
+                key, img = draft_key, draft
+
+        if not count:
+            return img
+
+        return self._cache.get(key)
+
+    def open_page(self, page, size=None):
+        """Read page and return image.
+
+        Raises: UserWarning if bad image format.
+
+        Notes: decoded images are shared through the cache, do not modify
+               them in place.
+
+        Args:
+            page (int): index of page in current book
+            size (int, int): size of display area, if provided JPEG pages
+                             might be decoded at 1/2, 1/4 or 1/8 of their
+                             resolution as long as they still fill it.
+                             Full resolution if None.
+
+        Returns:
+            (Image)
+        """
+        img = self.cached_page(page, size)
+        if img is not None:
+            return img
+
+        name = self._pages[page]
+        img = self._overlay.get(name)
+        if img is None:
+            img, full_size = self._decode_page(page, size)
+            if img.size != full_size:
+                self._cache.put(self._draft_key(page), img)
+                return img
+
+        self._cache.put(self._cache_key(page), img)
+        return img
+
+    def original_page(self, page):
+        """Page with its pixels as stored, e.g. to be edited.
+
+        Notes: contrary to open_page, effectively gray color pages are
+               not reduced to a single channel, which only relies on a
+               sample of pixels. Neither cache is used.
+
+        Raises: UserWarning if bad image format.
+
+        Args:
+            page (int): index of page in current book
+
+        Returns:
+            (Image): in one of `display_modes`
+        """
+        name = self._pages[page]
+        img = self._overlay.get(name)
+        if img is not None:
+            return img
+
+        try:
+            img = Image.open(self._page_file(page))
+        except IOError:
+            raise UserWarning(f"Bad image format '{name}'")
+
+        return display_image(img)
+
+    def _decode_page(self, page, size):
+        """Decode page, unless already stored in disk cache.
+
+        Raises: UserWarning if bad image format.
+
+        Args:
+            page (int): index of page in current book
+            size (int, int): size of display area, see open_page
+
+        Returns:
+            (Image, (int, int)): image in one of `display_modes` and size
+                                 of page at full resolution
+        """
+        name = self._pages[page]
+        key = None if self._disk_cache is None else self.page_key(page)
+        if key is not None:
+            stored = self._disk_cache.get(key, size)
+            if stored is not None:
+                self._page_sizes[name] = stored[1]
+                return stored
+
+        try:
+            img = Image.open(self._page_file(page))
+        except IOError:
+            raise UserWarning(f"Bad image format '{name}'")
+
+        full_size = img.size
+        self._page_sizes[name] = full_size
+        self._page_formats[name] = img.format
+        if size is not None and img.format == "JPEG":
+            img.draft(img.mode, fit_size(full_size, size))
+
+        img = display_image(img)
+        if img.mode == "RGB" and is_grayscale(img):
+            img = img.convert("L")  # a third of the memory in caches
+
+        if key is not None:
+            self._disk_cache.put(key, img, full_size)
+
+        return img, full_size
+
+    def _raw_data(self, info):
+        """Data of page as stored in archive, still compressed.
+
+        Args:
+            info (ZipInfo): description of page in current book
+
+        Returns:
+            (bytes|memoryview)
+        """
+        with self._cbz_lock:
+            if self._cbz_map is not None:
+                view = member_data_view(self._cbz_map, info)
+                if view is not None:
+                    return view
+
+            return read_raw_member(self._archive().fp, info)
+
+    def snapshot(self):
+        """Current content of book, frozen so that it can be written while
+        edition goes on.
+
+        Notes: edited pages are loaded in memory.
+
+        Raises: OSError if an untouched page is encrypted, it can neither
+                be copied as is nor decoded without password.
+
+        Returns:
+            (list of (str, ZipInfo, Image|None)): for each page its name,
+            description in archive and edited image if any
+        """
+        snap = []
+        for name in self._pages:
+            info = self._infos[name]
+            img = self._overlay.get(name)
+            if img is None and info.flag_bits & 0x1:
+                raise OSError(f"Encrypted page '{name}' can not be saved")
+
+            snap.append((name, info, img))
+
+        return snap
+
+    def write_book(self, pth, snapshot=None, progress=None, nb_workers=None):
+        """Write content of book in a new archive.
+
+        Notes: untouched pages are copied as is, without being decoded nor
+               compressed again. Only edited pages are encoded, in parallel
+               worker processes if there are enough of them. Safe to call
+               from another thread as long as current book stays open.
 
         Args:
             pth (Path): path to archive to create
+            snapshot (list): content to write, see `snapshot`, current
+                             content if None
+            progress (callable): called with number of pages written and
+                                 total number of pages after each page
+            nb_workers (int): number of worker processes used to encode
+                              pages, number of cores if None
 
         Returns:
             (None)
         """
-        tmp_pth = Path('toto_tugudu.cbz')
-        with ZipFile(tmp_pth, 'w') as fw:
-            for i in range(self.page_number()):
-                img = self.open_page(i)
-                data = BytesIO()
-                img.save(data, 'jpeg')
+        if snapshot is None:
+            snapshot = self.snapshot()
+
+        to_encode = [i for i, (name, info, img) in enumerate(snapshot) if img is not None]
+
+        if nb_workers is None:
+            nb_workers = os.cpu_count() or 1
 
-                info = ZipInfo(f"page{i:04d}.jpg", datetime.now().timetuple()[:6])
-                info.compress_type = ZIP_DEFLATED
-                fw.writestr(info, data.getvalue())
+        pool = None
+        if nb_workers > 1 and len(to_encode) >= parallel_min_pages:
+            # imported on demand, multiprocessing alone costs more than PIL to import
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import get_context
 
-        if pth == self._pth:
-            self.close_book()
+            pool = ProcessPoolExecutor(nb_workers, mp_context=get_context("spawn"))
 
-        if pth.exists():
-            pth.unlink()
+        try:
+            jobs = {}  # page: future, limited to a few pages ahead to bound memory
+            queue = iter(to_encode)
+
+            def submit_next():
+                for page in queue:
+                    name, info, img = snapshot[page]
+                    jobs[page] = pool.submit(encode_image, img, page_format(name))
+                    return
+
+            if pool is not None:
+                for _ in range(2 * nb_workers):
+                    submit_next()
+
+            with open(pth, 'wb') as fhb:
+                with ZipFile(fhb, 'w') as fw:
+                    nb = len(snapshot)
+                    for i, (name, info, img) in enumerate(snapshot):
+                        page_name = f"page{i:04d}.{name.split('.')[-1].lower()}"
+                        if i in jobs:
+                            fw.writestr(new_page_info(page_name), jobs.pop(i).result())
+                            submit_next()
+                        elif img is not None:  # not worth using workers
+                            with fw.open(new_page_info(page_name), 'w') as fhw:
+                                encode_image(img, page_format(page_name), fhw)
+                        else:
+                            data = self._raw_data(info)
+                            write_raw_member(fw, info, page_name, data)
+                            if isinstance(data, memoryview):
+                                data.release()
+
+                        if progress is not None:
+                            progress(i + 1, nb)
+
+                sync_file(fhb)  # durable before being moved into place
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def install_book(self, tmp_pth, pth):
+        """Move a newly written archive into place and open it.
+
+        Notes: existing archive is replaced atomically, see
+               atomic_save.replace_book. If it can not be replaced, the
+               current book stays open with its edits.
+
+        Raises: OSError if archive can not be moved into place.
 
-        tmp_pth.rename(pth)
+        Args:
+            tmp_pth (Path): archive written by `write_book`
+            pth (Path): final path of archive, replaced if it exists
+
+        Returns:
+            (None)
+        """
+        same_book = pth == self._pth
+        if same_book:
+            self._release_archive()  # open files can not be replaced on some platforms
+
+        try:
+            replace_book(tmp_pth, pth)
+        except OSError:
+            if same_book:
+                with self._cbz_lock:
+                    self._cbz_map = self._map_archive(pth)
+            raise
+
+        self._cache.discard_book(pth)
 
         self.set_book(pth)
 
+    def save_book(self, pth, progress=None, nb_workers=None):
+        """Save current book on disk.
+
+        Args:
+            pth (Path): path to archive to create
+            progress (callable): called with number of pages written and
+                                 total number of pages after each page
+            nb_workers (int): number of worker processes used to encode
+                              pages, number of cores if None
+
+        Returns:
+            (None)
+        """
+        tmp_pth = temp_book_path(pth)
+        try:
+            self.write_book(tmp_pth, progress=progress, nb_workers=nb_workers)
+            self.install_book(tmp_pth, pth)
+        except BaseException:
+            tmp_pth.unlink(missing_ok=True)  # already moved if only reopening failed
+            raise
+
     def delete_page(self, page):
         """Delete given page from book.
 
@@ -272,11 +954,12 @@ class Explorer:
         Returns:
             (None)
         """
-        pth = self.buffer(page)
-        img = self.open_page(page)
+        img = self.original_page(page)  # color kept even if display copy is gray
 
         img = img.transpose(Image.ROTATE_180)
-        img.save(str(pth))  # overwrite buffer
+        self._overlay.put(self._pages[page], img)
+        self._cache.put(self._cache_key(page), img)
+        self._cache.discard(self._draft_key(page))
 
     def swap(self, page_src, page_dst):
         """Swap pages between source and destination.
@@ -1,5680 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created: Tue 20. Nov 18:41:37 2012
-#      by: The Resource Compiler for PyQt (Qt v4.8.3)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x3a\xb2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\
-\x8e\x7c\xfb\x51\x93\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\
-\x25\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\
-\x30\x00\x00\xea\x60\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\
-\x46\x00\x00\x3a\x28\x49\x44\x41\x54\x78\xda\x62\xfc\xff\xff\x3f\
-\xc3\x28\x18\xb9\x00\x20\x80\x98\x46\x83\x60\x64\x03\x80\x00\x1a\
-\x4d\x00\x23\x1c\x00\x04\xd0\x68\x02\x18\xe1\x00\x20\x80\x46\x13\
-\xc0\x08\x07\x00\x01\x34\x9a\x00\x46\x38\x00\x08\xa0\xd1\x04\x30\
-\xc2\x01\x40\x00\x8d\x26\x80\x11\x0e\x00\x02\x68\x34\x01\x8c\x70\
-\x00\x10\x40\xa3\x09\x60\x84\x03\x80\x00\x1a\x4d\x00\x23\x1c\x00\
-\x04\x10\xcb\x48\xf1\x68\x43\x43\x83\xd6\xef\xdf\xbf\x39\xbf\x7f\
-\xff\x2e\xfe\xe3\xc7\x0f\xe1\x5f\xbf\x7e\xf1\xfd\xfb\xf7\x0f\xec\
-\x7f\x46\x46\xc6\x3f\x20\x36\x33\x33\xf3\x1f\x16\x16\x96\x6f\x6c\
-\x6c\x6c\x9f\x38\x39\x39\x5f\xf2\xf0\xf0\x3c\xe1\xe5\xe5\x7d\x5a\
-\x50\x50\xf0\x7b\xb8\x86\x0b\x40\x00\x31\x0e\xb7\xb9\x80\xd6\xd6\
-\x56\x99\xb7\x6f\xdf\xea\xbd\x7a\xf5\xca\x18\x84\xbf\x7e\xfd\x2a\
-\x0e\xf4\x23\x2b\x34\xc2\x55\xc1\xc5\x1e\x13\x13\x18\x03\x23\x9e\
-\x01\x28\x06\xc6\xc0\x88\x67\x00\x85\x05\x88\x0d\xa2\xff\xfe\xfd\
-\x0b\x96\x07\x26\x86\x4b\xec\xec\xec\x9f\xb8\xb8\xb8\x5e\x0a\x09\
-\x09\x5d\x13\x13\x13\x3b\x2b\x2c\x2c\x7c\xb1\xb6\xb6\xf6\xc1\x70\
-\x08\x2f\x80\x00\x1a\xf2\x09\xa0\xbd\xbd\x5d\xfc\xde\xbd\x7b\xfe\
-\xcf\x9e\x3d\xb3\xf9\xf4\xe9\x93\x22\x30\xc2\x65\x80\x11\xa7\xc0\
-\xca\xca\x0a\x8e\xc8\x9f\x3f\x7f\x32\x00\x23\x1f\x1c\xb1\xa0\x08\
-\x85\x61\x18\x80\xf9\x1f\x58\x3a\x80\x13\x05\x48\x1f\x08\x83\xd4\
-\x80\xe4\x40\x18\xc4\x06\x89\x81\xcc\x02\xf1\x81\x09\xe2\x1a\xb0\
-\x84\x78\xc7\xc7\xc7\x77\x5f\x46\x46\x66\xbf\xb4\xb4\xf4\xfe\xa1\
-\x9a\x20\x00\x02\x68\x48\x26\x80\xee\xee\x6e\xbe\x3b\x77\xee\x04\
-\x03\x71\x08\x30\xd2\x15\x80\x45\xb7\x16\x28\xc7\x82\xfc\xf2\xe7\
-\xcf\x1f\x30\x06\xf1\x41\x91\xc6\xcd\xcd\xcd\x00\x8c\x2c\x06\x60\
-\x71\x0e\xce\xe5\x20\x31\x50\x44\x23\x47\x3e\x08\x80\xc4\x81\x55\
-\x03\xc3\xb7\x6f\xdf\xc0\x18\xc4\x06\x25\x1c\x90\x59\xb0\x12\x01\
-\x64\x0e\x28\x31\x20\x25\x04\x30\x1f\xa8\xee\x89\x88\x88\xc8\x25\
-\x09\x09\x89\x13\x2a\x2a\x2a\x6b\x1b\x1b\x1b\xaf\x0d\x95\xb0\x04\
-\x08\xa0\x21\x95\x00\x8a\x8b\x8b\xdd\xae\x5d\xbb\x96\xf8\xe2\xc5\
-\x0b\x0b\xa0\xbb\x15\x40\x11\x0a\x8a\x24\x60\xbd\x0e\x2a\xaa\xc1\
-\x91\x2d\x20\x20\xc0\x00\x8c\x0c\x06\x60\x31\xcd\x00\xcc\xa1\xe0\
-\x88\x45\x8f\x6c\x58\x84\xc2\x4a\x05\x10\x00\x99\x03\x4c\x48\xe0\
-\x44\x02\xa2\x41\x72\xb0\x04\x01\x8a\xf0\xe7\xcf\x9f\x33\x00\x13\
-\x1b\xc3\xe7\xcf\x9f\xe1\x55\x06\xac\x0a\x01\x99\x07\xb3\x07\x28\
-\x76\x0d\x68\xef\x03\x55\x55\xd5\x35\x33\x66\xcc\x98\x3f\xd8\xc3\
-\x14\x20\x00\xb3\x65\x6c\x03\x30\x08\x03\x41\x97\x54\xa1\xa6\xa3\
-\x49\xc7\x80\xd4\x8c\x91\xe9\xd2\x46\x54\x44\x0c\x90\x3f\x2b\x64\
-\x86\x54\x20\x21\x0c\xf2\xfd\xdb\xfe\xbd\x00\x5a\x6b\x3b\x4e\xc7\
-\xf1\x02\xb1\x09\xdc\x4e\xe2\x29\xd9\xfc\x1d\xd0\x29\x25\xcb\x39\
-\x9b\xfa\xb4\xbb\x12\xd7\xce\x39\x1d\x98\x5a\x82\x03\x64\x05\xfa\
-\x72\x35\xfb\x17\xd8\x57\xe2\x57\xb9\x07\x6e\x08\xc1\x34\x00\x7a\
-\xe5\x20\x66\x8c\xd1\xdf\x44\x14\x63\x0c\xd3\x7c\x61\xbd\x77\x17\
-\xdf\x12\x11\xe7\xdc\x45\x8c\x8a\x7f\x2a\xe6\x8d\x10\x4a\x29\x47\
-\xad\xf5\xfa\x63\x7e\x1f\x01\x34\x68\x13\x00\xb0\x18\x55\x3d\x77\
-\xee\x5c\xc9\xd3\xa7\x4f\x1d\x81\x6e\x54\x05\xe5\x34\x50\xc4\x81\
-\x68\x50\x4e\x07\xd6\xbd\xe0\x48\x07\xe5\x78\x50\x04\xbc\x79\xf3\
-\x06\x1c\xc9\xa0\x48\x07\xe5\x5a\x90\x3a\x8c\x2e\x0f\x34\x72\x40\
-\x11\x8a\x5c\x15\x80\x00\xac\x31\x08\x4a\x20\xa0\x04\x03\x8a\x4c\
-\x58\x29\x01\xa2\x41\x6a\x41\x89\x01\x84\x41\x55\x01\xc8\x0d\x30\
-\x7b\x81\x25\x12\xc3\xfb\xf7\xef\xe1\xe6\xc0\xdc\x09\xd2\x03\x2d\
-\x51\x2e\x01\xdd\xba\x55\x5f\x5f\x7f\x5a\x55\x55\xd5\x93\xc1\x14\
-\xce\x00\x01\x98\x2d\x77\x1b\x80\x41\x18\x88\xb2\x82\x0b\xba\x34\
-\xcc\x90\x8a\xbd\xd2\x44\xec\x95\x35\x18\x20\x3b\x58\xee\xd2\xc6\
-\xcf\x92\x25\x46\x00\xe9\x2a\x30\xa0\xbb\xf3\x67\x3b\x03\x8c\x31\
-\xce\x39\xe7\xc5\x50\xe7\xc4\x1d\x90\x98\xa2\xd4\x5a\x8b\x67\x54\
-\x69\xad\x05\xb1\x64\x21\xe4\x23\x3c\xa2\x20\x54\xce\x02\x2c\x84\
-\xc6\x20\x40\x44\xe2\xcc\x9a\xd5\xab\x01\x72\x50\xcc\x6a\x81\x91\
-\xcc\xac\xa8\x6a\x94\x7d\xc0\x1e\xa2\x13\x4b\x9b\x00\x54\x06\xee\
-\x26\xde\xcd\x1a\xa0\x2a\x64\xab\xe1\x8d\x6c\x29\xbe\x5e\xff\xfb\
-\xd3\x7b\xbf\xbd\x9d\x7d\x3b\xf0\xfd\x0b\xc0\x7c\xb9\x9c\x00\x0c\
-\xc3\x30\xb4\xa3\xf4\x1c\x43\x17\xe9\x1e\x1d\xc3\x83\xe4\xd2\x75\
-\x7a\xf7\x02\x81\x2c\x52\x3d\x83\x21\x1b\xb4\xb9\x05\x4c\x3e\x92\
-\x6c\xd9\xbf\x11\x80\xbb\x1f\x11\x71\x8d\x31\x4e\x81\xb6\x03\x1c\
-\x99\x0c\xe0\x78\xb9\x99\x6d\xea\xb6\x13\x4c\xc5\x24\xf1\x10\x0a\
-\xf8\x6b\x03\x47\x3c\x3d\x00\xb1\x1a\xd9\x92\x20\xca\x39\xf6\x50\
-\xfe\x5e\x99\xca\xdf\x8b\xc8\x6a\xf6\xd6\x51\x10\x52\xb1\x12\x04\
-\x41\x86\x53\xf2\x25\xcc\xdc\x73\x26\xd5\x04\xb2\x11\x0a\x67\x73\
-\x2f\xf7\x20\x9a\x39\x67\x5a\xc5\x3a\x7d\x10\xc3\x5e\xef\x7e\x5a\
-\x6b\x77\xd7\xfa\x1a\xf7\x57\x00\xe6\xeb\xd8\x86\x62\x10\x06\x02\
-\x68\xe6\x60\x01\xe8\xd9\x85\x85\x28\x52\x64\xb1\xd4\x99\x20\x05\
-\x83\xfc\x3c\x14\x4b\x6c\xf0\x43\x09\x06\x59\x77\xe6\xce\xfe\x44\
-\x01\xb4\xd6\x0e\xa3\x1c\xa9\x07\x54\x78\x35\x99\x2d\xa5\x6c\x39\
-\xe7\x49\xd0\x18\x63\x02\x6b\xa5\x94\xa6\xff\x93\x6a\x04\xb8\x87\
-\x74\xb6\x80\x08\xbf\x14\xe0\xeb\x4f\x5c\x9b\x36\xa4\xc7\xb8\x17\
-\xfd\x40\x9c\x85\xa7\x87\x05\x44\x31\xc8\x01\xf9\x94\x47\x53\x88\
-\x60\xef\x2a\x06\xa4\xcb\x43\x2c\xa5\x92\xbb\x3d\x8a\x20\x6e\x9d\
-\x36\x5e\xbb\xb9\x9f\xde\xe5\xac\xb5\xee\xbd\xf7\xeb\x5f\xd8\xff\
-\x04\x20\xc6\xde\x6d\x00\x06\x61\x28\x00\x66\x0b\x66\xa0\xa0\xca\
-\x3c\x19\x80\x4d\xb3\x06\x25\x33\xa4\x09\x67\xc9\x12\x1b\x50\x20\
-\x51\x80\x2d\xfc\x3e\xb6\x38\x4a\x80\xde\xfb\xc3\xee\x57\xc1\xbf\
-\xa5\xa4\x9b\x7a\x58\xaf\x62\xd7\x5a\xaf\xd6\x5a\x80\x40\xed\x73\
-\xce\x28\x5e\x29\x25\x16\xe0\x29\x12\x90\x0a\x8e\x24\xa9\x4a\x77\
-\x80\x05\xc8\xb4\x79\xfb\x54\xbb\x38\xce\xe5\x1c\x90\x7d\xde\x1d\
-\x71\xad\x04\x7e\xff\x0b\xd8\xe7\x04\x44\x00\x30\x70\xb9\x80\x58\
-\x62\x23\x01\x97\xc8\x01\x15\x09\xbd\x69\x8c\x11\x67\xec\xe5\x41\
-\x10\x79\x56\x3b\x7a\x97\xbb\x1d\x73\x83\x5f\x00\xe2\xeb\xd8\x86\
-\x81\x10\x08\x02\xe0\x77\x42\x0b\x48\x9f\xb8\x1e\x37\xf0\xc5\xd1\
-\xc2\x17\x40\xee\x8c\x9c\x1e\xcc\x20\xad\xe4\x0a\xfc\x44\x87\x80\
-\x13\xda\x3b\x76\x97\x47\x1a\x80\xb3\xef\xbd\x5f\xeb\x15\xbd\x16\
-\x98\x27\x40\xe3\xec\x51\x76\xad\xf5\x28\xa5\xec\xd7\x33\xc6\xd8\
-\xc0\xd2\x71\x52\x20\x46\xf5\x86\x46\x60\x06\xad\xe5\x6f\x0e\x5c\
-\xf9\xc4\xc0\x0f\x0b\xa4\xf8\x98\x81\x74\xc4\x03\xa4\xc0\x62\x67\
-\x23\x25\xe2\xb0\x42\x9a\x23\xc6\x2e\xec\xf2\x2b\x11\x73\xce\x3d\
-\x0f\xd3\x30\x87\x58\xc2\x3e\xf7\x34\xcc\x35\x72\xbe\x8d\xf6\xcb\
-\xbd\xf2\x7d\x16\x1b\xdc\xad\xb5\xf7\xbf\x6b\xf1\x15\x80\x17\x7b\
-\xb7\x01\x10\x06\x62\x00\xba\x16\x4d\x16\x60\x1a\x32\x00\x65\x96\
-\x8b\xc4\x02\x61\x02\xb6\x80\x87\xb0\x44\x41\x4d\x1d\xe9\x72\xf2\
-\xd9\xbe\xcf\xef\x04\xa8\xb5\xce\xbd\xf7\xf5\x52\xeb\x44\xc1\x00\
-\xca\xa0\xc7\xd6\xa9\x1e\x38\x63\x8c\x1b\x58\xea\xa6\x6c\xa0\xe7\
-\x8c\xab\x80\x6c\x5e\xff\x07\x36\x05\x22\xcf\x7b\xdf\xcf\x55\x2f\
-\x45\x16\x23\x76\x4d\x7d\x1c\x20\xc5\xcd\x86\x90\xcb\xa1\x7f\x13\
-\x2f\x84\xfa\x9a\xee\xdf\x17\x45\xca\x96\x07\x47\x40\x22\x39\xfa\
-\x5f\xbb\xa0\x7e\xc4\x36\x7c\x7a\x43\x02\xc4\x89\x3b\x3d\x31\xf7\
-\x2b\xaf\xa3\x94\xb2\xb4\xd6\xb6\xbf\xea\x71\x0a\xc0\x9b\x19\xdb\
-\x00\x0c\xc2\x40\x70\x07\x16\x72\xcf\x20\xa9\x33\x0a\x5b\xa4\xce\
-\x32\xae\x33\x4a\x38\x4b\x27\x79\x02\x0a\x24\x28\x10\x36\xff\xb6\
-\xfe\xe1\x28\x01\xe6\x9c\x0f\x1f\x2d\x1b\xf8\x8b\x0b\x20\x71\x80\
-\xe0\xd2\xb7\x45\xaa\x36\x4e\x25\x65\x66\x89\x29\x44\x1c\xc0\x33\
-\x07\x14\x2a\x18\xf0\x00\x5e\xbf\x6f\xb5\xb3\xee\x02\x4e\x02\xb0\
-\xa7\x93\xa1\x13\xc0\xdc\xbb\x0e\xf0\x61\xc9\x77\x06\xce\x20\x3e\
-\xc9\xa2\xcb\xd0\x66\xaa\xf2\x19\xec\x21\x4e\x1c\x83\x5d\x4d\x80\
-\xe9\x66\xe4\x3c\xc6\xa8\x58\xe9\x6c\x90\xc5\xfc\x9b\x18\xfd\x22\
-\xe2\x5e\x6b\xbd\x27\x30\xf9\x05\xe0\xc5\x0c\x6e\x00\x84\x41\x28\
-\x7a\x76\x22\x56\x71\x15\x2f\xae\xe2\x91\xa9\xb8\x39\x88\xbc\x26\
-\x2f\x61\x01\x6b\x62\x5a\x89\x0d\xfa\xe9\x87\x5f\xb6\x6c\x00\xce\
-\xf4\xcd\xe8\xb3\x7f\xee\x68\x21\x77\xc1\x96\x29\x8a\x22\x62\x01\
-\x53\x55\xab\x86\xc2\x6e\x6e\x00\xb4\x2d\xcb\xf1\x0d\x1b\x2c\x02\
-\x68\x40\x33\xdd\x5a\xef\x27\x23\x67\xad\x37\xcb\x60\xe3\x59\xad\
-\xe0\x7a\x46\x05\x9f\x1b\x40\xb6\x63\xb7\x01\xa4\x6d\xfa\x12\x3f\
-\x5b\xcf\x5c\x7c\x33\xc1\x66\x9d\xef\xe2\x83\x80\xc3\x7e\xe6\xe8\
-\x03\x70\x40\x2f\x98\x55\xf0\x4b\x99\xeb\xf1\x6d\x0d\xf4\x64\xe6\
-\xfd\x77\x6c\x3e\x01\x68\xb3\x93\x1b\x80\x41\x18\x88\xa2\x5d\x51\
-\x4b\x4e\xe9\x92\x5e\x28\x20\x85\x84\x1f\xe9\x49\x51\xee\x39\x81\
-\xc0\x08\xe1\x19\x1b\x2f\xbf\x13\x40\xf9\x76\x03\x77\xf4\xf8\x02\
-\x27\x6c\x0f\x84\x31\xc6\xa3\xb8\xb5\xd6\x33\x06\x74\x16\xcf\x2a\
-\x29\x2f\x82\x7c\x15\xcf\x0a\x35\x6e\xc8\x92\x53\xda\xd5\x03\x30\
-\x7f\xaf\x91\x67\xed\x82\x40\x85\x20\xa0\xf3\x36\x3c\x83\x33\x3c\
-\x8e\x2f\xc5\xdd\x11\x06\x09\xc4\x0d\xc9\x04\x7a\x99\x4c\xeb\x11\
-\x5a\x76\x13\xa1\xa5\xb3\x11\x74\xef\x5f\x35\x9a\xe6\x9c\xe7\x9f\
-\xf8\xdc\x02\xd0\x66\xc6\x46\x00\x83\x30\x0c\x5c\x2c\x8b\x64\x81\
-\xac\xe8\x05\xd8\xc1\x0b\x64\x90\xf8\x39\x9e\xe3\x48\x4d\x45\x61\
-\x28\xb0\x6c\x49\x86\xa3\x05\x80\xcb\x2f\xe3\x73\x95\x8e\x3f\x65\
-\xfa\x66\x12\xd5\x47\xc0\x27\x59\x99\xd9\x41\x07\x64\x56\xb5\x98\
-\x4e\x62\x1f\x3e\x00\xc0\xa4\x60\x41\x9f\x97\x18\x60\x58\x18\xeb\
-\xdc\x2d\x03\xc8\x08\x4a\xc2\x1a\xdb\x3f\x91\xec\x7c\x01\xf7\x81\
-\xc8\xd8\x2f\x89\x1b\x1b\x38\x31\x70\x1e\x40\x2d\x02\xe2\x78\x01\
-\x62\xf8\x02\x18\x41\x39\xa2\x39\xd8\xa7\xf9\x1c\xbf\x8f\x6f\xf9\
-\xa2\x16\x11\xf7\x29\x8c\x3e\x01\x68\x35\x77\x1b\x80\x41\x18\x0a\
-\x0e\xc6\x12\x99\x81\x05\xb2\x4c\xa6\x61\x03\x06\x70\x95\x55\x52\
-\x84\x43\x3a\xc9\x42\x49\x09\x15\x20\x90\x65\xde\x03\xff\xd8\x46\
-\x80\x5a\xeb\x39\x94\x7e\x06\xd8\x57\xef\x7d\x1e\x84\x8d\x5b\x5e\
-\x4a\x99\xb6\x32\x22\xa6\xf3\x87\x5d\xd7\xe9\x32\x15\x0b\x38\x56\
-\xf3\x04\xfe\x57\x91\x04\x82\x3a\xf9\xca\x68\x02\x72\xe8\xc7\x9c\
-\xb7\x92\xb1\x31\xbc\xa1\x9e\x84\x90\x14\x39\xbb\xb7\x96\x92\xbf\
-\x88\x88\x6c\xfa\xec\xe3\x25\x10\x54\x89\x87\x4c\x22\x05\x7c\x1e\
-\x1a\x73\xd6\x19\xd0\x9d\xb5\xc8\x1d\xeb\x6f\xfe\x21\xb4\xd6\x8e\
-\x1d\x38\xbd\x02\xd0\x6a\xee\x36\x00\x83\x30\x10\x9d\xcd\x55\x36\
-\x61\xbe\x6c\xe0\xc6\x33\x30\x41\x06\x89\x0f\xe9\x49\xa7\x34\x69\
-\x80\x0e\x21\xc0\x9f\x93\x8d\xcf\x1c\x01\xc0\xe8\xa1\x1f\x35\xed\
-\xbc\xbb\xaa\x96\x92\x72\xa2\x14\x53\x78\x8b\x88\x15\xf6\xf4\x30\
-\x52\xb9\x07\xbd\x4a\x63\x85\x3c\x0c\x8d\xab\x48\xe0\xb4\xed\x1f\
-\x10\xbc\xb4\xf3\xda\x9f\xd0\x4f\xaa\x60\x8d\x74\x83\xf3\x9d\x13\
-\x00\x00\x00\xf0\x6b\x2f\x9f\x3b\x00\x90\x17\x5d\xd8\x8f\x2c\xb4\
-\x92\x95\x12\x64\x1f\x40\xa7\x3b\xa1\xbe\x01\x4d\x9f\x35\xdb\x96\
-\x4f\x66\x5e\xbb\x7d\xf5\x0a\xc0\x9a\xb9\xdd\x00\x0c\x82\x50\x74\
-\x1f\x7e\x1d\xa3\x4b\x30\x44\xb7\xe8\x30\x4c\xc0\x24\x2e\x53\x4f\
-\x93\xdb\x10\xa3\x7f\xfa\xeb\x23\x02\x57\x38\xea\x71\x01\xb8\xfb\
-\xcd\x9a\x66\xf6\x44\xc4\x4f\xba\x38\x00\x80\x6b\xad\x7d\x01\x45\
-\x00\x0a\x30\xfd\x82\x3d\x39\x40\xa0\x84\x70\x70\x92\x00\x6b\xd7\
-\x6a\xea\x9f\xd3\xb1\xca\x81\x98\xa0\x82\xd9\xea\x43\x48\x01\xaf\
-\x25\xa1\x96\x9c\x95\x10\x66\xf1\x55\xb8\xc4\x26\xdd\x7a\xea\x47\
-\x94\x58\x87\xec\xc3\x53\xb3\xc0\x96\x71\xd8\xcc\x5c\xf6\x8c\x3f\
-\xc6\xc1\xe9\xa3\x7c\xf4\xcc\xbc\x4e\xc6\xeb\x15\x40\x54\x4d\x00\
-\xe9\xe9\xe9\x89\xc0\x88\x94\x70\x70\x70\x68\x5b\xb6\x6c\x19\x78\
-\x04\x0f\xd6\x00\x02\x01\x50\x57\x0f\xe4\xf9\xcb\x97\x2f\x83\xbb\
-\x78\x20\x0c\x0b\x20\x58\x71\x0b\x0a\x08\x90\x9b\x40\x72\xa0\xd2\
-\x02\x79\x70\x85\x98\x04\x80\xcc\x47\x16\x43\xce\xf5\xc8\x0d\x45\
-\x58\x02\x40\xee\xde\x21\x8f\x02\x22\x77\x2b\xf1\xd9\x8d\x5c\x0d\
-\xa1\xf7\x14\x60\x11\x0a\x4a\xe0\x20\xfb\x41\x11\x0f\xab\x86\x40\
-\x09\x1c\x44\x83\x1a\xc7\x20\xbf\xc3\xd6\x25\x80\xd4\x82\x30\xcc\
-\x2c\xa8\x5f\x1e\x00\xab\xca\x5b\xfb\xf6\xed\xa3\x5a\x49\x00\x10\
-\x40\x54\x4b\x00\xf1\xf1\xf1\x25\xa0\xd5\x39\x21\x21\x21\xd9\xdb\
-\xb6\x6d\x63\x38\x7b\xf6\x2c\xca\x84\x89\xa1\xa1\x21\x98\x7d\xff\
-\xfe\x7d\x70\xeb\x17\xd4\x0e\x80\x45\x3e\xac\xcf\x0c\xeb\x43\x83\
-\x4a\x0a\x58\xe2\x00\x05\x02\x28\xc0\x60\x8d\x23\x62\x01\x7a\xa4\
-\x60\x6b\x2f\xe0\x6b\x3f\x10\x6a\xe8\xe1\x2b\x81\xd0\x13\x1f\x2c\
-\x81\x81\x22\x18\xe4\x3f\x50\xa4\x83\x1a\xbc\xb0\xd2\x08\xc4\x87\
-\xb5\x43\x40\xed\x02\xd8\xb8\x00\x88\x86\xf5\x0e\x60\x19\x04\xc8\
-\x7e\x00\x6c\x33\x1d\xde\xb2\x65\x0b\x55\x7a\x07\x00\x01\x44\x95\
-\x55\xc1\xa0\xae\x1e\x68\x95\x0e\xb0\xf8\x0f\x06\x45\xfc\xd1\xa3\
-\x47\xc1\x91\x0c\xeb\x3b\xab\xa8\xa8\x80\x4b\x01\xd0\xe8\x1e\xa8\
-\x9f\x0b\x6b\xf0\xc1\x26\x59\x40\x9e\x07\x15\x91\xa0\x91\x41\x50\
-\x22\x01\x45\x38\x4c\x2f\x2c\x37\x90\x9b\x50\xd1\x23\x17\x3d\x62\
-\xd0\x13\x04\xbe\x84\x43\x6c\x15\x84\xdc\x23\x81\x01\x58\x49\x08\
-\x5b\x55\x04\x62\xc3\xd6\x14\x80\xfc\x07\x0a\x17\x50\x95\x07\xf2\
-\x33\x68\xf4\x10\x56\xfc\x83\x30\xac\x1a\x02\x65\x0c\x50\x26\x03\
-\x26\xa4\x17\xb1\xb1\xb1\x95\x8b\x17\x2f\x6e\xa7\x34\xee\x00\x02\
-\xb0\x6a\xc6\x36\x00\x83\x30\x10\x1c\x2a\x4d\x66\x88\xe4\x2a\xeb\
-\x50\x7a\x4b\x2f\x13\x0e\xe9\x24\x94\x0a\x91\xd0\x52\xf9\xff\xb1\
-\xfd\x36\xbf\x08\xa0\x5b\x9a\x2b\x22\x6e\x5e\x7a\xaf\x51\x83\x60\
-\x02\x41\xe1\x28\x9d\x2e\xbf\xaa\x86\xd2\x7d\xd9\x8e\x70\x21\xdc\
-\xbd\xbb\x1b\x40\x41\x11\x54\x45\xb2\x43\xfc\x7c\x4c\xa7\xb3\xf7\
-\x97\x1c\x53\xfd\x4a\x79\x59\xcd\x38\x6f\xc7\xc0\x1d\xe2\x46\x00\
-\xc4\x0b\x46\x90\x2a\x16\xc4\x8e\xe5\xb5\x14\x8a\xa1\x73\x09\x07\
-\x5e\xbd\x69\x3c\xf9\x83\xd8\x5a\x3b\x32\xf3\xd3\xd8\xf8\x11\x80\
-\x74\xb3\xb9\x01\x18\x04\xc1\xe8\x34\xac\xd6\x4b\x17\xeb\xd1\x55\
-\x5c\x81\x49\xcc\x4b\xfa\x1a\x4a\xe2\xc9\x03\x37\x45\x14\xf9\xf1\
-\x03\x8f\x3f\x86\x00\xef\x46\xc4\x43\xbd\x7e\x8c\xf1\xeb\xc6\x41\
-\x78\x9a\x37\x00\x3e\x10\x1e\xe5\xdb\x55\x23\x48\xa2\x5b\xc4\x32\
-\x38\x9c\x17\x04\xf9\xac\x49\xa8\xd7\xd8\xbc\x23\x13\x37\x15\xd9\
-\x33\xfa\x6e\x95\x8e\x31\x0c\xd5\x79\xd5\x5b\x74\xfe\x3b\xaa\xfc\
-\xaa\x1c\x35\xac\xb0\x8e\x56\x2d\x5a\xa8\x6b\xe7\x02\xb0\x57\xc3\
-\x9f\x89\xb3\x4f\x59\xab\x87\x16\xa2\x32\xf3\x9a\x73\xde\xf4\x51\
-\x9c\xe8\x6f\x09\x40\xaa\x19\xdb\x00\x08\xc3\x40\x70\x34\xcf\x12\
-\xb9\xa4\x61\xcb\x94\x5e\x89\x1c\xca\x21\x1a\x84\x02\x55\x1a\x82\
-\x1c\x43\xde\xf6\xff\xff\x42\x80\xcc\xdc\x70\xc2\x46\x44\xaf\xaa\
-\x73\xa6\xd7\x2d\x43\x02\xa8\xf3\xdc\x6e\x0e\x3a\x9e\xbb\x7a\x02\
-\xe8\x4f\x9b\x1d\x6f\xbe\xda\x3c\xfb\x14\x62\x9e\x6a\xef\x2a\x3c\
-\xdf\xb5\x7e\x56\x9a\x53\x50\x8a\x64\x13\x8f\x2a\xa0\xb5\x56\x72\
-\x88\x38\x48\x3c\xbd\x89\x7a\x82\xf5\xdc\x91\xce\xf1\xed\x0d\xa1\
-\x44\x19\x7f\x02\xf2\xc4\x7b\xf5\x0f\x48\x15\xeb\x45\x04\x35\x21\
-\x8b\xb4\xa3\x79\x6e\xe3\x9b\xfa\x44\x1b\x39\x87\x57\xdf\xbf\x7e\
-\xc3\x43\x00\x4e\xcd\xe0\x04\x60\x10\x86\xa2\x1d\xab\xd7\x8e\x95\
-\x2d\x3a\x4e\x96\xea\x0e\xcd\x93\x3e\x08\x1e\x2a\x78\x10\x14\x54\
-\xc4\x98\x6f\x7e\xf2\xb7\x11\x20\x22\xce\xa2\x72\x57\x19\xff\xc6\
-\x73\xa1\x7c\xbe\x54\x05\x17\x56\xbe\x94\x60\x71\xe9\x04\x39\x26\
-\x79\xf8\xeb\xf4\xf6\x0e\xcb\xdd\x9b\x7a\x32\xa6\x67\xe9\xe6\xb6\
-\x42\x08\x4b\xb0\xaa\x7d\x8b\x53\x1f\x99\x39\x1e\x2d\x08\x64\xb5\
-\x90\x33\x30\x36\x4a\xa7\xaf\xe1\xf1\x52\x39\xbd\xc2\x53\xf6\xd2\
-\xb8\x7f\x4d\x08\x9f\x59\x05\xeb\x41\x41\x51\x53\x6d\x21\xdf\x25\
-\x31\x81\xf3\x19\x4b\x63\xbf\x04\xd1\x28\x2f\xd7\xb9\x1f\xd8\xd7\
-\xae\x1d\x5f\x01\x44\x76\x02\xb8\x74\xe9\x52\x96\xb9\xb9\x79\x30\
-\x68\x06\x6f\xe7\xce\x9d\xe0\x06\x1e\xc8\x91\xb0\xc8\x83\x8d\xc0\
-\x81\x00\xa8\xaf\x0f\x4a\x24\xa0\x40\x00\x05\x28\x6c\x64\x0d\xe4\
-\x59\x58\x6e\x42\x9e\x1a\x25\x35\x72\xd1\x8b\x5b\x6c\x18\xa4\x06\
-\x14\x61\xa0\xc4\xd8\xdd\xdd\xcd\xb0\x79\xf3\x66\x86\x94\x94\x14\
-\x70\xd5\x73\xe8\xd0\x21\xb0\x1f\x40\x4b\xcd\x40\xee\x02\xe5\x3e\
-\x90\x38\x48\x0f\xf2\x86\x10\xd8\x40\x12\xac\x34\x42\x5e\x80\x42\
-\x8c\xfb\x90\x4b\x32\x58\x64\xc2\xdc\x05\x0a\x17\xd8\xa4\x13\xa8\
-\x7a\x00\x99\x0d\xca\x30\x20\x1a\x7d\xb5\x32\xac\x34\x02\x95\x18\
-\x40\xb7\x35\x01\x69\x55\xd0\xd6\x37\x72\xe2\x11\x20\x00\xe7\x66\
-\x74\x02\x30\x08\x03\xd1\x7e\x77\x0c\xc7\x10\x37\x70\x07\xb7\xc8\
-\x87\x63\x39\x8b\x2b\x74\x90\xf6\x05\xaf\x48\xa1\x20\xfa\x13\x14\
-\x8a\x9a\x5c\x4f\x3d\xcd\xd6\x12\x50\x4a\xa9\x0f\x4d\x5d\x29\x25\
-\xa7\x31\x9c\x09\x8d\x49\xf9\xd2\x63\x0b\x9c\xc3\xee\x56\x75\xa8\
-\x1f\x8b\x43\x61\x82\x39\x41\x43\xf4\xff\x95\x7c\x57\x04\x98\x99\
-\x96\xff\x8a\x8e\x55\x04\x98\x67\xe4\x68\x12\x39\xe7\xc3\xcc\x9c\
-\x0d\x00\x40\x6b\xcd\xfb\x03\x24\x21\x04\xb7\xfa\x76\x4e\x08\x91\
-\x94\xab\xfb\x01\x5d\x3c\xad\x28\x94\x9a\xa3\x02\x2a\x80\xa2\x06\
-\xd2\x46\xd0\x01\x1f\x56\x9b\x68\xfe\x74\xc6\x4d\xf0\x47\xba\xda\
-\x9b\x9b\x00\x68\x63\x8c\xb5\xf7\x7e\xee\x2c\x05\xb7\x00\x22\xb9\
-\x04\xe8\xed\xed\xe5\x04\x36\x40\x5c\x2d\x2c\x2c\x2a\x41\x91\xbe\
-\x6f\xdf\x3e\xb0\x83\x61\x83\x36\xb0\x61\x4e\x98\x47\x41\xf5\x19\
-\xc8\x83\xb0\x94\x0d\x12\x87\xad\xb2\x85\x05\x1a\xf2\x80\x09\xb6\
-\x86\x1c\x29\x8d\x40\x5c\x18\x14\x59\x20\x77\xc1\x1a\x7d\xb0\xc4\
-\x07\x5a\x47\x18\x1d\x1d\xcd\xb0\x74\xe9\x52\x06\xd0\x9c\x45\x63\
-\x63\x23\x83\xb2\xb2\x32\x78\x82\x0a\x94\xb0\xaf\x5c\xb9\x02\x1f\
-\xa5\x83\x4d\x2f\x83\xfc\x09\x5b\x80\x0a\xf2\x37\x2c\x97\xa2\x37\
-\x1c\x91\x31\x72\x35\x86\xbe\x7a\x19\x96\xb8\x40\x25\x01\x6c\x1e\
-\x04\x94\xb1\x60\xf3\x26\xb0\x71\x10\xd8\xa4\x15\x2c\x01\x80\x68\
-\x50\x7b\x06\xa4\x0f\x98\x60\x6e\x03\x4b\xb4\x6c\x52\xe3\x13\x20\
-\x00\xe5\xe6\x6e\x03\x30\x08\x43\xc1\x4c\x43\xc9\x0e\x19\x2c\x5b\
-\x64\x0a\x16\xa0\xa6\xf6\x52\xc9\x21\x1d\x72\x13\x29\xd0\x21\x4b\
-\xc8\xe0\xc7\xc3\x3f\xb6\x01\x10\x11\x57\xad\xf5\xe4\x06\x31\x7a\
-\xef\x2b\x54\x31\xdd\xea\xbb\x6e\x96\x0b\xc5\x51\x92\x83\x82\xb6\
-\x6c\xa6\xcc\xf4\x9f\x41\xb0\x6b\xdc\x3f\x14\xcc\xfa\x16\x65\x74\
-\xfc\xf4\x0b\x98\x23\x27\x92\x81\x11\xc6\x18\x47\x6b\x6d\x82\x01\
-\x39\x0e\xee\xbb\xef\x19\xca\x02\x76\x33\x8a\x1a\xca\x34\x6f\x06\
-\xf0\x57\x84\xe2\x7e\x73\x3b\x9a\x3a\x71\xcb\x61\x46\x7d\x03\x65\
-\xb6\xc2\xf9\xcf\x31\x97\xba\x39\x53\xf4\x2b\xa5\xdc\xb4\xd2\xef\
-\xda\xf3\x11\x80\x72\x73\x37\x02\x18\x84\x61\x68\x76\xc8\x02\xd9\
-\x86\x95\xe8\xd9\x22\x13\x30\x09\x25\x33\x85\xe7\x8b\x72\x0a\x47\
-\x43\xe1\xda\x5f\x84\xb0\xf1\x56\x01\x94\x52\xae\x61\xe4\x39\x94\
-\x05\xe4\xb7\xd6\x82\xc8\xf9\x7c\xdf\x09\x17\xa3\x4f\x4f\x12\x01\
-\x23\xf9\x6f\x47\xeb\x97\x7c\x67\xd1\xab\x25\xce\x15\xa4\xee\x08\
-\xfa\x09\x96\x6c\xd1\xab\x83\x40\x8b\x69\x0b\x91\xf0\x23\xa5\x74\
-\xe4\x9c\x83\x1f\xd4\x5a\xe3\xba\xc0\x37\x7c\xee\xbd\x7f\x5f\xbe\
-\xd5\xda\x9d\xbb\x88\xf3\x13\xd0\x7d\x91\x2e\x6f\x53\x6b\x7a\x48\
-\x41\xcd\x5b\x4c\x1c\x24\xc4\xf7\x14\x15\x33\x10\x82\xa1\x1a\x48\
-\x30\x0a\xf8\xe6\x7a\xde\xc9\xe9\x23\x00\xe5\xe6\x72\x02\x30\x08\
-\x04\x51\x6b\xc8\xdd\x32\x6c\xc3\x32\xd2\x95\x37\xeb\x48\x6d\xf1\
-\x09\x0f\x96\xbd\x98\x1c\x84\x04\x84\x2c\xd9\xd9\xdf\x8c\xfe\x02\
-\xc0\xea\x98\xef\x5a\xeb\x4d\xe3\x87\x01\x90\x3e\x38\xd5\x08\x32\
-\xad\x31\x09\xa8\x7a\xc9\x69\x2b\x7f\x2a\x75\x46\x79\x34\x46\x45\
-\x56\xea\xe2\x73\x5c\xee\xcf\xef\xa7\xc5\x37\xf9\x99\xd9\x19\x52\
-\xcd\x02\x55\x20\x30\x93\xf7\xde\xcb\x9c\x73\xf7\x0a\x63\x8c\xd2\
-\x5a\xdb\x25\x02\xc6\x93\xac\x00\x83\x79\x02\x60\xcc\x6e\x19\x1c\
-\x66\x43\x6d\x01\x5c\x96\x4d\x41\xa6\x9e\x82\xfd\xf1\xe4\xb2\x23\
-\x28\x0c\xec\xea\x5b\x9e\x15\xa0\x17\x97\x67\xbf\xfa\xf4\x15\x80\
-\x51\x73\xb9\x01\x10\x04\x82\x28\x5d\x78\xe6\x6a\x59\xd4\x60\x11\
-\xd4\x43\x1d\x5c\x38\xdb\x8c\x3e\x92\x67\x36\x5c\xc4\xc4\x78\x5b\
-\xf9\x0c\xcb\xcc\xee\x6c\x93\xc0\x5a\xeb\xf1\x6a\xf6\x13\xe2\x47\
-\x0b\x17\xdf\xde\x18\xe3\xab\xdc\x39\x09\x4e\x19\x29\x11\xb7\xae\
-\x03\x64\x21\xd5\xfb\x4a\x20\xa5\x53\x34\x50\x00\x10\x37\x34\x36\
-\x41\xfe\x9a\x31\x3b\xb5\x01\xed\x65\x90\xab\x18\x4b\x6f\xe0\xea\
-\x1e\x5e\x33\x0d\x0f\xe4\xb1\x94\x32\xdf\xde\x7b\x6a\xad\x4d\xf2\
-\x88\xd9\x85\x98\xf0\x09\xb2\x9e\xa6\x0f\xe7\xc5\xa6\x79\x05\x2a\
-\x6b\x01\xa1\xeb\xe3\xff\xbc\xe3\xf9\x02\x02\xc6\x6a\x37\x90\x2c\
-\x43\x0c\xeb\x27\x91\x34\x03\x0e\x3d\x87\x39\xe7\xeb\x06\x95\x29\
-\x6d\xd9\xcc\x1f\x01\x18\x37\x97\x1c\x80\x41\x10\x0a\xf6\x4c\x84\
-\x7b\xb8\xe8\x21\xb9\x66\x1d\x93\x49\x48\x37\xe2\xda\xe0\xe7\x81\
-\xe0\x03\xc6\x0a\x40\xd7\xce\xfe\x1e\x2d\x1a\x2f\xb8\x2c\xc0\x97\
-\xa2\x35\xf0\xe9\x96\xad\xa6\xea\x2b\xb9\x7c\x99\xad\x9e\x92\x75\
-\xe0\xff\x6c\xc9\xf2\x80\x02\x73\x8b\xf0\x27\xc3\x72\x2c\xe4\x59\
-\x56\xae\xc5\xdf\x22\x78\xad\x17\x19\x32\x7a\x11\xf1\x64\x26\x55\
-\xce\x27\x78\x44\x19\x88\x87\x78\x19\x90\xb7\x5f\xca\xf3\xfd\x05\
-\x68\xce\xc5\xba\xbd\x7f\x80\x3d\x58\xe4\x2a\xa8\xdd\x35\x31\x17\
-\xd0\x25\xa7\x3a\x07\xf0\xcf\x52\xea\x3a\x48\xb4\x91\x74\xab\xaa\
-\x77\xaa\x00\x9f\x00\xa4\x9b\x31\x0e\x80\x20\x0c\x45\x3d\x1b\x03\
-\xe1\x22\x78\x29\x16\xce\xe0\xca\xc2\xd1\xf4\x91\xbc\xa4\x83\x89\
-\x24\x32\x4b\x6c\xe3\xef\x6f\xfb\x6d\xb7\x00\x00\xa5\x30\xda\x95\
-\x52\x5a\x9b\x37\xbc\x8c\x08\x88\xf4\xaf\xf8\x63\x9b\xa4\x5a\xa5\
-\xe3\x56\xde\xd2\xb5\xd1\xaf\x33\xa0\xb8\xf7\xbe\x76\x02\x78\x3e\
-\x16\x49\x0e\x4d\xfe\x39\xda\x8a\x4d\xd4\x30\x52\xe7\xce\xc7\x8f\
-\x4a\x9e\x69\xc4\xfb\x44\x69\xce\xf9\x28\xa5\xac\x76\x0d\x10\x8c\
-\x31\x8e\x39\xe7\x02\x03\x29\xc4\x55\x75\x7d\xf2\xc7\x90\x82\x92\
-\x9b\xc9\x0a\x3c\xb1\x6b\x72\x66\x20\x0e\xaf\xbc\x31\x1f\xb6\x11\
-\xf8\x4f\x4b\x08\x0b\x5c\xb5\xd6\xb3\xb5\xf6\x09\x82\x5b\x00\xca\
-\xcd\xdd\x06\x60\x10\x06\xa2\x19\x86\x59\x32\x61\x6a\x67\x18\x0a\
-\x96\x60\x98\xf0\x90\x9e\x64\x45\x29\x1c\x77\x48\x88\x8f\x6c\xf0\
-\x71\xe6\x4a\x01\x80\x6c\x6b\x81\xbe\x13\xe7\xf3\x36\x86\x3d\x53\
-\xa2\xa5\xd3\xbf\x0a\x22\x46\x35\x57\x93\x9b\xc8\x4a\x9c\xcc\xfe\
-\x41\x15\xa3\x09\x40\x44\x41\x80\x71\x32\xaa\x85\x98\x8a\x49\xa1\
-\xe6\x3a\xc5\x1f\x13\xc5\x1b\x88\x8e\x95\x3f\x95\x98\x22\x16\x10\
-\xdb\xc4\x58\xef\xfd\x88\x88\xed\x18\xda\xec\x11\xf0\x2c\xab\xe7\
-\xba\xcc\xf3\xef\x7f\x8e\x96\x83\x05\x99\xe2\x2c\xe7\xcc\xea\x27\
-\xfa\xcc\x39\x77\xbf\xd6\xda\x35\xc6\xb8\x2b\xb7\xc0\x23\x00\x23\
-\x67\x70\x03\x20\x10\x02\xc1\x1e\xac\xc0\x32\xae\x01\x2b\xa0\x1d\
-\x9e\x14\x6a\x29\x3a\x26\x93\xf0\x30\x4a\x03\x86\x45\x0e\x96\x85\
-\xbb\x91\x17\xee\x9f\x7d\x70\x55\x0b\x85\x0c\x03\x48\x35\xf4\xc6\
-\xd6\x4f\x01\x18\xc1\x3a\x97\x28\x67\x16\x40\x34\xbf\x6d\xf3\xf6\
-\xb5\x6e\x4e\x01\x4c\x56\xa0\x48\xc8\x80\x87\xe5\x4e\xa6\x81\x7f\
-\x41\x42\xfd\xb5\x8d\x72\x2f\x4f\xbd\xdf\x3b\x05\xd3\x29\xa3\xf5\
-\x5d\xae\xc2\x77\xcd\x7a\xda\xc1\x61\x81\x2b\x45\xc4\xd3\x56\x92\
-\x15\x20\x91\xf0\x05\x6c\xf1\x5d\x03\xf0\x11\xf0\xdd\x87\x8a\x3d\
-\x6e\x12\x91\x3d\xcc\xac\x9d\x13\x75\xe1\x4c\x1c\x70\xb3\xb5\x16\
-\xfa\xcc\x56\x55\x7b\x66\x9e\x5f\x78\x2e\x01\x38\xb9\x77\x1b\x86\
-\x61\x18\x8a\xa2\x99\x4f\x4d\xa6\xcb\x32\xca\x72\xd1\x09\x70\x01\
-\x16\x81\x03\xb8\x73\x21\xc8\x14\xfd\x48\x3e\x8b\x9f\xbf\x00\x30\
-\x74\xc9\x80\x25\x37\x52\x35\x63\x4a\x52\x10\xba\x96\xac\x62\x54\
-\x16\x81\x04\xe5\x19\xfa\x9f\x9d\x09\x8d\x5c\x61\x88\xb6\xa7\x43\
-\xb2\x7e\x7b\xfa\x48\x29\xb4\x74\xf1\x64\xee\x77\x00\x20\xac\x44\
-\xaa\x3c\x17\xd3\xaf\xd2\xc0\xbf\xbc\xc0\xbc\xc1\x2b\xac\x90\x9d\
-\x0e\x70\x0c\x1e\xd2\xba\x2a\x9a\xad\x5d\x6b\x7d\x81\xa0\x0c\x0e\
-\x5f\xd8\x7b\x3f\xd4\x4a\x22\x6e\x74\x4a\xb7\x93\x07\x34\xb0\x82\
-\x9c\x4d\x28\x01\x1a\xef\xa9\xe9\x64\x72\xaf\xf4\x4b\xd7\x75\x4d\
-\x1f\xf0\x3d\x8f\xa1\xbe\x8f\xd8\xaf\xab\x33\x7d\x04\xa0\xe4\x8e\
-\x52\x00\x84\x61\x18\x80\xfe\x78\x2c\xef\x20\xec\xc8\x3b\x99\xbe\
-\x41\x20\xf8\x33\xfd\x12\xd1\x31\xd7\xa6\x69\x56\xcb\x8e\x2f\xd1\
-\xff\x18\xee\xa2\x70\x7d\x84\x49\x50\x4d\x1c\xda\xe5\xdc\xd0\x1a\
-\x47\x7a\x4f\x79\xd3\x22\xd2\x95\xdb\x4d\x13\xef\x3a\x39\x43\x02\
-\x0e\xea\x37\x4f\x6f\xcd\x30\xcf\xce\x49\x3b\x00\x00\x56\xab\xe6\
-\x77\xed\xe1\x4f\xe3\x47\x98\xae\xf5\x45\x4e\x11\xe9\xbf\x89\xcd\
-\x16\xc6\xb0\xcb\x18\x63\x81\x41\x4a\x78\x72\xf4\xd2\x0a\x71\x7a\
-\xa7\xbb\x04\x93\x6b\xfa\x2a\x01\x05\xc8\xec\x96\x3a\xa8\x62\x3f\
-\xcf\xe8\x10\xf7\xaa\x99\x73\xce\x73\x07\x80\x5b\x00\x42\xce\x20\
-\x05\x40\x18\x06\x82\x4f\xf2\xbb\x79\xae\x8e\x30\x30\x14\x89\x87\
-\x9c\x3c\xa4\x26\xdb\x74\x59\xb7\xfe\x56\xe0\x49\x76\x81\x52\x58\
-\xad\xc2\x09\xd7\x9a\x68\x54\x59\x6b\x17\x4c\xb1\x69\xa0\x68\x75\
-\x3a\x9c\xd2\xae\x2f\xc1\xe2\x71\x10\x09\x20\x45\x10\x39\x83\x9a\
-\xfb\x16\xb5\x71\x7f\x45\x25\x66\xa7\x93\xcf\xbc\x04\xb2\x45\xff\
-\x18\x52\x20\x54\x01\x65\xb7\xca\x0d\x6a\x6e\xad\x1b\x98\x1d\xca\
-\x97\xd3\x99\x79\xc7\x35\xc0\x51\x77\x10\x08\x1e\x8b\x92\x54\x7d\
-\x03\xd4\x9c\xb3\xde\xfc\x15\x94\x34\xdd\xc2\xcd\xc8\x0b\xd8\x98\
-\xdc\x98\x46\xb6\xfe\xde\x02\xf0\x71\x46\x27\x00\xc3\x20\x10\xfd\
-\xea\x72\x9d\xce\x41\x3a\x88\x63\xd5\x57\x78\x70\x14\xcc\x5f\xa1\
-\x90\xd6\xa8\x67\x2e\xb9\x78\x44\x80\xaa\xba\xe8\xb5\x87\xf3\xc9\
-\x4a\x8c\xf3\x62\x63\xd6\x71\x55\xae\x52\x2a\x22\x95\x32\xe1\xfe\
-\xb9\xd4\x25\x7f\xd6\x49\x51\xab\x8f\x71\x04\x0c\xa8\x91\x8b\x9c\
-\x7f\x47\xaf\x2d\xd3\x4f\x4a\x9c\x3c\xbb\x67\x3c\x19\x09\xdf\xa6\
-\x94\x59\x0a\xb6\x71\xf2\xa4\x32\x69\xa1\xf6\x18\x04\x8a\x3f\x2d\
-\x0f\x36\xa5\xf0\x7a\x38\x5b\xb6\xdd\xfd\x39\x49\xd9\xb7\xf3\x97\
-\x94\x4e\x24\x48\xbd\x01\x48\xca\x02\x12\xe4\x30\xd1\x64\x35\xc9\
-\x54\x40\x0b\x36\xa6\x60\x1f\xe3\xb7\x7b\x9e\x9f\x79\xb5\xaa\x86\
-\x5e\x01\xf8\x38\xb7\x14\x00\x42\x10\x8a\x6e\x64\xd6\xe0\xcf\xfc\
-\xce\xfe\xd7\x95\x77\xe0\xc0\x41\xaa\xbe\x24\xa2\x20\xf5\xfa\x40\
-\xbd\x0a\x40\x33\xfb\x6d\xe8\xff\x18\xc0\x94\x95\xcb\xd1\x4e\x3b\
-\x75\x6e\xc7\xb2\x86\xf0\x49\x46\x01\x3a\x7c\x67\xf8\x43\xea\x98\
-\xfe\x80\xdd\x84\xaf\x53\x29\xd6\x69\x6f\x46\x28\x86\x7d\xf2\x14\
-\x8e\x66\xd0\x78\x4c\x04\x4e\x1e\xb4\x23\x19\x84\x9a\xee\x66\x98\
-\x88\x79\x88\xcd\x0f\xd3\x93\x3e\x0e\x8d\x49\x63\x4c\x0d\xa3\xe8\
-\x78\x6f\x0a\xa0\xfd\x93\x9c\x9b\xc9\x29\x97\xb8\x21\xd8\x94\x99\
-\x57\xd5\x8f\xc4\x8d\xe0\xcf\x8d\xc7\x4b\x00\x42\xce\xe4\x04\x60\
-\x18\x06\x82\xfd\x43\xd4\x9c\x2b\x32\x13\x18\x18\x4c\x8e\x3c\x9d\
-\x0b\xa3\x6b\xb5\x78\xf5\xe9\x00\x68\xfa\x88\x4c\x4a\x80\xc6\x20\
-\x85\xb1\x91\xaa\x71\x4f\x9e\xdb\x48\xa9\x03\x9c\xb2\x6d\x32\x8a\
-\x64\x11\xcf\x91\x35\x7c\x57\xa0\xd5\x54\xd7\xe8\x7b\x3a\x74\xf9\
-\xe7\x08\x25\xaa\x8c\x34\x09\x22\x25\x60\x95\x8e\xb5\x4b\x11\xcc\
-\x69\xc0\xd2\xde\x5e\x00\x34\x5b\xde\xb5\xd6\x0d\xf6\x14\xbb\xb2\
-\xc6\x7f\xec\xe5\x8b\x1f\xcc\x20\x7e\xaf\xb5\xbd\x13\x4b\x2a\x2f\
-\xd3\xe8\x3a\x45\xa9\x6e\xee\x83\x11\x2c\x4b\x4c\x58\x9b\x99\xeb\
-\x6d\x26\xd1\x16\x80\x90\x33\xc6\x01\x00\x04\x81\xd8\xff\x1f\xeb\
-\x1f\xb4\x43\x93\x86\x41\x46\x1d\x24\x82\x22\x1c\x27\x6b\x10\xc8\
-\xa2\xe6\xe4\x32\x64\x26\xef\xde\xdb\xe3\x41\x30\xad\x2b\xda\xe7\
-\x5c\x5b\xb7\xf4\x6f\x3e\xae\x8b\xc2\x8b\xef\x68\x15\x5e\x83\x6d\
-\xbc\x80\x2d\x8a\x47\x3e\x55\x3f\xd3\x2c\xd1\xc6\x92\x59\xca\x3c\
-\xd2\x60\x42\xb4\xf5\x68\xee\x11\x43\xe0\xe2\x01\xc7\xc0\xe4\xe1\
-\x3d\xa8\x27\xd6\xf5\x70\xf4\xbf\xa1\xdd\xca\x84\x7a\x65\x1a\x55\
-\xaf\xb3\x58\xe4\xad\xaf\xa7\x68\xcc\x60\xd3\x09\x64\x33\xe6\xc9\
-\x78\x32\xce\xaf\x21\xd5\x15\x80\x93\x33\x48\x01\x00\x84\x61\xd8\
-\xd7\xf7\x74\x89\x10\x08\x82\x1e\xfc\x81\x6c\x75\xb6\x75\xdb\x13\
-\x00\x34\x7d\xe8\x44\x29\xcb\x3a\x23\x77\x1a\x17\xed\x7b\x93\xc9\
-\xb7\x4c\xf9\xf5\x5a\x0d\xeb\x6d\x47\x1a\xc1\x88\x01\x00\x80\x73\
-\xb8\x52\xfb\xf3\xd7\x07\x68\xe5\xe1\xec\x98\x31\x33\xb3\x83\x63\
-\x52\x48\x90\x44\x53\x46\xed\xd9\x05\x29\x71\xe8\x2e\x02\x87\x39\
-\x48\x38\x89\x47\x19\xf9\xdf\x41\x79\x57\xda\x95\x28\x3a\x8f\xd8\
-\x7d\xc4\x5e\x00\xc9\x60\xa7\x8f\xab\x08\x6c\xb5\x13\x88\x35\xa0\
-\xfa\x0c\x28\x47\x89\x35\xea\x89\x3d\x44\xf4\x70\xdc\x40\xb0\x04\
-\x60\xe4\xdc\x51\x00\x08\x61\x20\x7a\x3b\x4f\x94\x66\x4f\x98\x6b\
-\xb9\xaf\x78\x30\x04\x14\x8b\x45\xd6\x22\xa8\x18\x67\xf2\x3d\x5e\
-\x80\xaa\x5a\xf4\xde\x45\x08\x58\xe2\x01\xf2\x9c\xb1\xf0\x79\x48\
-\x69\x1f\x5b\x01\xac\x29\xc7\x28\xe6\x4f\xf3\x31\x1d\x35\x06\x8e\
-\xc4\xe7\xec\xac\xf5\x52\xe0\x71\xbb\x18\xca\x60\x6d\x60\xb0\xda\
-\x67\x9e\x5f\x32\x6a\x35\x2a\xe1\x88\x7f\xcd\x3c\x3c\xa1\x78\xf9\
-\x60\xf1\x70\x22\x88\x24\xf2\xf8\xd8\x87\x98\x2d\xdf\x51\xcb\x67\
-\xa3\x2a\xf9\x42\xd6\x2b\xfa\x5a\x26\x29\x34\xc1\x76\x66\x2f\x27\
-\x24\x48\xb6\x0d\x3c\x19\x42\xfe\xe7\xbe\xee\x3e\x66\x0b\x6d\x01\
-\x48\xb9\x77\x1b\x00\x61\x18\x08\xc3\xab\xb0\x1a\xfb\x2f\x01\x7f\
-\xf1\x49\x27\x04\x15\xae\x92\x02\xe5\x41\xce\x39\x5d\x6c\x7f\x1e\
-\x80\x12\x10\xee\x01\xcf\x16\x1d\x07\x88\x9d\x87\x4e\x4f\x95\x4f\
-\x29\x15\x4a\x15\x6f\x80\x74\xb1\x01\xc2\x99\xd6\x7b\xec\x02\x45\
-\xd8\x90\x40\xb9\x3a\xe8\xf9\x6b\x88\xe7\x16\x86\xa8\xaf\xfa\x88\
-\xf9\x21\xaa\xfb\x04\x9b\xc5\xbe\xf3\x50\xb1\xf8\xda\xee\x75\x5e\
-\xcd\x37\xbb\x17\x5b\x81\x1c\xf2\x21\xde\x58\x0e\xda\x26\x8c\x6e\
-\x32\x29\x93\x2c\xf3\xa6\x2f\xac\x54\x4d\x40\x22\xa6\x65\xf7\x3f\
-\x3b\xbe\xf6\xe5\x12\x80\x91\x7b\x49\x01\x10\x06\x62\x30\x7c\x8c\
-\xde\xff\xa6\xf2\x2f\x3e\x08\xa2\xa8\xd0\x8d\x8b\xd2\xc7\x90\x49\
-\xa7\x49\x5f\x57\x36\xe3\x41\x84\xaf\x7c\x42\x93\x46\xac\x60\x72\
-\x20\x71\x2b\x58\x60\x8a\xff\x4d\xfa\xd8\x0d\xd7\x96\xfd\xfa\x27\
-\xfa\x95\x6e\x6b\x21\xd0\x17\xf1\xfb\x83\x06\x02\x8b\xe5\x9c\x84\
-\xad\x14\xf0\xd4\x47\x73\xcf\xc7\xd8\xcd\x67\xda\x07\xe8\x87\x33\
-\xf8\xf6\x99\xd9\x25\x71\x2b\x26\x5d\x6f\x02\xa2\xb9\x4f\xd9\x28\
-\x20\x29\x9a\xad\x5a\xca\x7a\xaf\x5f\xe2\x1e\x08\xc6\x51\x90\x34\
-\xee\x3d\x6a\x9e\x73\x5e\x8f\x81\x97\x00\x74\x9c\xc1\x0d\xc0\x20\
-\x0c\x03\x57\xca\xfe\x13\x75\x8c\x72\x8f\x93\x4e\x28\x54\xe2\x51\
-\x5e\x88\x18\xcb\x49\x0c\x4f\x00\x9c\x00\x7e\x6c\x0c\xa6\x07\xd2\
-\x40\x86\xe8\x65\xe8\xa3\xd7\xaa\xd4\x3a\xb8\xad\x4c\x51\xdf\xe7\
-\xd7\x37\xfa\xf7\x7a\xb8\x34\xd9\x94\x4b\x9a\x56\xa4\x35\x50\xb7\
-\xa9\x74\x03\xc9\x9d\xa1\x34\x40\x8a\xa6\xd6\xd8\xf9\x00\x3c\x82\
-\x94\xda\x3d\xe2\xce\x4a\x5f\x85\xdf\x76\xeb\xc7\xf9\x3e\xf4\x50\
-\xb1\xeb\x61\x31\xc8\x32\x42\x8b\x68\xb2\x65\x1b\x45\xfe\x7b\xb2\
-\x05\xa1\x1a\xc9\x6c\x40\xf6\x72\x8d\x18\x46\x49\x3f\x67\xe6\xd9\
-\x0f\xf8\x05\x60\xec\x4c\x4e\x00\x00\x61\x20\xd8\x8f\xfd\x37\x93\
-\x6e\x74\x1f\x23\x43\x50\xf4\x2b\x08\x12\x37\x89\x9b\xcb\x2b\x00\
-\x96\xc9\x1f\xb9\x58\x0f\x30\xe0\x30\xa6\x4a\x0e\x01\xf3\x36\x88\
-\x39\x4f\x64\xcf\x53\x38\x7e\x7c\xb5\xa9\x9f\xd9\x85\x85\xe4\xf4\
-\xad\x01\xf5\xea\xf9\x43\x30\xb8\x00\x34\x8e\xb2\xee\xec\x0f\xd8\
-\x73\xe9\x55\xb5\x6b\xf5\x99\x29\xd4\x3b\x7e\x4f\x40\xeb\x11\x4e\
-\xaf\x39\xa5\xcb\x5b\xc3\x8a\x60\x10\xe1\x7e\xa0\x7f\x28\x1a\x15\
-\x42\x27\x9a\xe8\xe2\x13\xac\x2f\x53\xca\xf2\x81\xc6\x4d\xee\x53\
-\x00\xc6\xce\x18\x07\x60\x10\x86\x81\x4b\x1f\xc5\xd7\xf2\xfb\xea\
-\x86\x93\x2c\x53\x2a\x06\xf6\xc8\x01\x87\x38\x09\x3c\x3f\x22\xd0\
-\xc2\x91\xe4\xb1\x9e\x66\x80\x32\x2b\x48\x03\xdc\xbd\xca\x95\x52\
-\xa5\x34\x29\x45\xde\xc4\xe9\x2e\x73\x26\xa8\x5d\x52\xfe\x52\x07\
-\x4f\x53\xbc\xde\x4f\x0c\x47\xda\x8f\x50\xc3\xa2\xcf\x0f\x95\x93\
-\x3b\x0e\xf6\xf6\xd4\x90\xf1\xf4\xa6\x35\x3d\x5b\xdb\xb2\xf4\xad\
-\x9e\xd0\xef\x18\x34\x33\x9a\x22\xea\x54\xdb\xea\x33\x04\xe5\xc8\
-\x9b\xb8\x88\x9b\x6c\x05\xfe\x64\x26\x1c\x66\x3e\xd6\x98\x99\xed\
-\xc5\xf2\x57\x00\xbe\xce\xe0\x06\x60\x10\x86\x81\xd3\x74\x99\xee\
-\x3f\x43\xe6\x80\x93\x7a\x92\xe5\xd2\x3e\x78\xf2\x40\x24\x21\xb1\
-\x9d\xf0\x69\x00\xdb\x03\x2e\x36\x73\x78\x47\xa9\xd8\x2a\x95\x9d\
-\x3c\x9d\x84\xe4\x84\x0f\x9b\x41\xb2\x99\xe2\x17\x95\x7a\xc0\x8b\
-\x44\xd5\x1a\x82\x6d\xc4\xb1\x65\x5b\xa7\x67\x40\x6a\x5a\xb5\x11\
-\x5c\x06\x4c\x1c\x97\xce\xc2\xdb\xad\x5a\x1c\xea\xc8\xb9\x55\xf0\
-\x58\x96\x9e\x74\xfe\x8d\x86\xe6\xe5\x27\x47\x62\xb4\x31\xaa\x65\
-\xc4\x6a\x2f\xd6\x58\xe4\x13\x4c\x46\x55\x35\xab\xb2\x4a\x30\x2a\
-\xab\x06\x93\x5b\x45\x39\x33\x73\x6f\x47\xe6\xbb\x9c\x97\x01\x2c\
-\x01\x18\x39\x83\x14\x00\x61\x18\x08\x5e\xfa\x07\x9f\x9e\xef\x96\
-\x29\x0c\x2c\x4b\x15\x0f\x22\x78\x90\xda\x14\x77\xd2\xa4\xbb\x3e\
-\xca\xa7\x0f\x1b\x1a\xd9\x20\xa9\x93\x67\x07\xc1\x85\xe0\xaa\x64\
-\x20\x4c\x76\x9a\x3b\xfe\x25\xf5\xdc\x5f\x6f\x70\x6c\x8e\xc8\x76\
-\xf2\x37\xfd\xcf\xd4\x8a\xdc\x9f\xf7\xce\xcc\x49\xdf\x78\xc6\xef\
-\x9d\x4a\x67\x16\x7a\x94\x3a\xbf\xb1\x89\xbc\x5d\x45\x12\x68\x5b\
-\xee\x92\x37\x52\xfb\x0d\x74\x57\x01\xbd\xeb\x62\xa6\x04\x79\x16\
-\xa1\x0d\x2d\x72\x1c\x82\x22\xec\x66\x5f\x22\x17\x1c\x40\x3c\x6f\
-\x73\xbe\x05\x20\xec\x8c\x51\x00\x00\x61\x18\xb8\xf8\xff\x0f\xbb\
-\x48\x86\x83\x23\xd0\x2a\x38\x29\x28\x6d\xd5\x36\xd6\x78\x16\x65\
-\x5c\xc8\x19\xa9\x99\x08\xfc\xfc\xfd\xf4\x0a\x21\x73\x77\x1d\x4f\
-\xd4\xd4\x6e\x3f\x23\x68\x70\xa3\x93\x46\x5b\xb9\x86\x3f\x1d\xe7\
-\x7b\x47\xb0\x91\x70\x0c\xf1\x14\x2b\x42\x22\xf4\xb4\x1f\x43\xd4\
-\xe2\xfb\x02\x67\x32\xf7\xca\xf5\x0e\xd5\x06\xd9\x3c\x45\x6e\x9f\
-\xfe\x2f\x32\x16\x01\x40\x94\xb1\x23\x4f\x1c\x6f\xd2\xc5\x27\x44\
-\x30\xca\x87\x48\x93\xfe\x53\x79\x02\x30\x76\xee\x38\x00\x84\x20\
-\x10\x6d\xf6\xfe\x97\xb5\xb0\x5d\x49\x7c\x9b\x97\x91\x98\x2d\x6d\
-\x34\x21\x30\x7c\x06\xf0\xb9\xc0\xf1\xc4\xfa\xac\x8d\x15\xdc\x01\
-\x4f\xa6\x46\x11\x16\x8f\x95\x70\xcb\x8f\xba\x85\xea\x0f\xd7\x0e\
-\x5c\x93\x1a\x75\x6b\xd9\x12\x8a\xb3\x88\x93\x41\x96\xa1\x95\x8a\
-\x5b\x9d\x09\x96\x4c\xbd\xa2\x08\x20\x1f\x93\x3f\x2e\x0f\x77\x4d\
-\x24\xfa\x32\xe6\x60\x21\x33\x73\x30\x61\x96\xc5\x2a\x5c\x84\x5d\
-\xc1\xce\xe5\x3f\x86\xd1\x5b\x55\x6c\x3c\xc4\x1a\x4c\x62\x5b\xf6\
-\xeb\x9e\xd1\xc9\xef\x15\x80\x90\x3b\x4a\x01\x20\x04\x81\x00\xfa\
-\xb3\xe7\xf0\xfe\x27\xdc\xef\x70\xd9\x07\x83\x14\xfd\x47\x85\x8d\
-\xa2\xa3\xd3\x73\x0b\xc9\x1d\x05\x84\xca\xbe\x0c\xc1\x62\x8e\x6d\
-\x63\x04\x25\x59\xa7\x7e\xf8\x4d\xbb\x27\xa9\xc9\x11\x6d\xd4\xe8\
-\xee\x0b\x96\x04\xc1\xd4\x0a\x4c\x4f\xd4\x3a\x45\xb8\x9c\x0c\x88\
-\xff\xf7\x68\x1e\x86\x47\xcd\xc4\xcd\xf9\x94\xc7\x33\x9c\x73\x9e\
-\x4c\x12\xb3\x2d\x3e\xd7\xdb\x47\x0d\x0f\xbc\xc4\x22\x00\x9b\x43\
-\x29\x59\x6d\x34\x40\xaa\xea\x63\x0e\x91\x42\x3f\x90\xde\x9d\xdd\
-\x97\x00\x7c\x9d\x41\x0e\xc0\x20\x08\x04\x2f\xfd\xff\x07\xfb\x99\
-\x66\x92\x4e\x32\x12\xe2\x51\x2f\x46\x41\x44\x60\x97\xe7\x52\x41\
-\xf3\x9a\xae\xd4\x29\x63\x51\x2c\x80\x5c\xf8\x72\xdb\xf4\xfd\x13\
-\x08\x82\x19\x22\x2b\x65\xcc\xfd\x6f\x94\x70\xe0\xf2\x2a\x18\x05\
-\x5f\x21\x3b\x6e\x75\xf0\xcc\xcf\x17\x8d\x7c\x53\x00\x71\x7c\xce\
-\x95\x75\x4c\x5f\xa5\x91\xbf\x79\x11\x1a\xba\x6d\xa8\x78\xfb\x0e\
-\x6f\x84\x54\x8e\x67\xa7\xb2\x2a\x93\x4a\xe6\x8f\xc5\x98\x81\x04\
-\xd4\x9c\x29\x02\xb5\x73\x49\xcf\x44\x67\x9b\x0b\x8a\x05\xe0\x99\
-\x6b\xd9\x1d\x88\xae\x6d\x6f\x9f\x00\x84\x9c\x41\x0a\x00\x21\x08\
-\x00\xff\xff\xca\xbe\xb2\xcd\x61\x60\x10\x63\x3b\x47\x50\xa6\xe9\
-\xa4\x3e\x2f\x00\x2d\xc9\xdc\x34\x30\x84\x94\x70\xdf\x77\xd0\xb0\
-\x69\x49\xf2\xe7\x42\x08\x6e\x2b\xe6\x5f\x88\xe3\x47\x0a\x42\x6a\
-\x21\x86\xdd\x40\xe5\xdc\x5b\x42\x46\x71\xea\xd4\xb0\x22\xe5\x76\
-\xfe\xda\x9c\xc0\xbf\x28\xa4\xf3\xea\x50\xf6\x9d\x6f\xc8\x35\xcb\
-\xbf\x0a\xa7\x66\xcb\xda\x12\xbb\xad\xe4\xad\x54\x8f\xb3\x42\xe0\
-\x5a\x29\x06\xa1\xb8\x21\x69\xcf\xa9\x4e\xb2\x8a\x64\xe6\x31\x6b\
-\xf0\x49\xa5\x35\xbb\xf2\x3c\xdb\xbe\x3f\x01\x38\x3b\x93\x14\x00\
-\x40\x18\x06\xfe\xa7\xcf\xec\xcb\x65\x84\x81\x20\xd5\x83\x57\x71\
-\xb7\xa8\x69\x52\xbd\x1a\x00\xaf\x53\xfa\x78\x23\xfc\xb6\x17\x42\
-\x2e\x76\xa8\x4d\x48\xd3\x41\x91\x9d\x11\x06\x92\x1f\x8b\x55\xe2\
-\xed\xf9\x69\x20\x84\x70\x25\xb7\xf0\x17\x99\x93\x41\x97\x13\x72\
-\x78\x51\xc5\x3f\xfa\xbf\xa9\x8e\x5c\x3c\x49\xaa\xd3\x1f\x71\xa2\
-\x93\x3c\x62\x26\x83\xcc\x76\x98\x0f\xa3\xa6\x95\x78\x01\x59\xf5\
-\xaf\xa4\x20\x34\xc7\x9f\xca\xe0\xaa\xda\x6b\x44\x39\x48\x2b\xca\
-\xb2\x6b\x77\xf7\xf8\x2b\xc9\x12\x80\x91\x33\xb7\x01\x18\x86\x61\
-\x60\x93\xca\xfb\x0f\x1c\x5f\x71\x00\x41\x58\x4e\x5a\x17\xfe\x20\
-\x51\xa2\xbe\xe7\x92\x3b\x5f\xda\x1a\x42\xa3\x42\x37\x08\x80\x8d\
-\xb1\x0d\x2c\x63\xd4\x22\x01\x0f\x80\x06\x82\x14\x56\x06\x3b\x38\
-\x4a\x68\x93\xb6\x38\xfd\x7b\x72\x8c\x52\xb3\xfe\x7c\xf8\xd4\x90\
-\xf9\x95\x2b\x38\xf1\xfc\x3e\xbf\xf7\xe8\xee\xe3\xd6\xfc\xd3\xfc\
-\xe2\x66\x50\x29\x5c\xae\x81\x8a\xa2\x2c\x0a\x64\x35\x96\x61\xe0\
-\x74\x14\xf3\x2e\x08\x10\x95\x40\xd2\x71\x1b\x5f\xb7\x39\x1f\xeb\
-\x01\x5e\x01\x28\x3b\x93\x14\x00\x40\x18\x06\x5e\xfc\xff\x9b\x65\
-\x0e\x03\x21\x58\xd1\xbb\x14\x5c\xba\x98\xc4\xba\x6e\x1e\x20\xf7\
-\x9f\xba\x7e\x0c\xf2\x8f\x0f\x61\x46\x79\x75\xe6\xbf\x6c\x91\x2a\
-\xcb\xc6\x61\x20\x1a\x58\x23\xb0\xe9\x36\x83\xb2\xd2\x7d\x79\xdb\
-\xd7\xb5\x40\x7a\x64\xc3\xaa\xbf\xa2\x91\x13\x3f\x31\x01\x3f\xad\
-\x7e\xea\xfc\x3f\x8d\x3f\xf1\x15\x79\x70\x59\x4f\xec\x28\x17\x13\
-\x86\xc7\xfb\x09\xe9\x52\xcc\x89\x27\xa4\x3a\x08\xbe\x86\xa6\x5c\
-\xb6\xe6\x11\xc1\xe4\x4a\x3f\xcd\x7b\x0b\x40\xc8\x99\xa4\x00\x00\
-\xc2\x30\xf0\xff\x87\x7e\xc8\xd7\xc9\x1c\x06\x42\x40\x7b\x10\x14\
-\xb4\xe0\x42\xb4\xb6\xc9\x13\x17\x67\xe6\x00\x1d\x6c\x14\x51\x41\
-\x68\x4e\x3e\xf4\xc8\x11\x80\xfc\xa9\x3b\xd5\xc9\x91\x6e\x2c\x13\
-\xf0\xee\x02\x45\x38\xc9\xde\x55\x22\x46\xb3\x7e\x53\xce\xbd\x59\
-\xbf\x29\xf3\x9e\xc5\x05\x69\xc6\x70\xda\xd9\x4a\x4b\xc9\xff\x58\
-\xc7\xf6\xd7\x35\x36\x2c\xdc\xe3\xda\x76\x6b\x17\xa7\x7e\x71\x7e\
-\x0e\x81\x96\x44\xf3\x32\x39\x46\x69\x9d\x56\x3e\xb5\xce\x01\x10\
-\xfe\x69\x23\xbf\xcf\x9a\x6f\xdf\xf0\x57\x00\x4a\xce\xc4\x04\x60\
-\x18\x86\x81\x0b\x79\x80\xee\xdb\x65\x3a\x56\x7d\x85\x03\x61\x9a\
-\x3e\x0b\x24\x71\xf0\x23\x09\xdb\x8f\x34\xb0\xbd\xe9\xe8\x8b\x37\
-\x0e\xa2\xf3\x85\x3d\xbf\x7a\x68\x55\x5d\x4e\x91\xe9\x71\x36\x2a\
-\x38\xd4\x40\xf4\xe3\x0c\x80\x19\x8c\x73\x03\x28\xc6\x09\x06\xdf\
-\xea\x78\xa2\xf1\xe4\xd3\x77\xb4\x70\xb5\xc7\xf7\x6f\xdd\x9f\xc2\
-\xd3\x54\x21\x53\x06\xfe\x32\xb7\x30\xf7\x08\x9b\x51\xa5\x83\x06\
-\x04\x32\xb5\x38\x89\x4c\x4b\x3d\xcf\x3f\xca\xc8\x97\x3a\x23\xd0\
-\x31\xb0\x4a\xc0\xf2\xcf\xf4\x2c\x08\x1e\x3b\x63\xef\xab\x77\x9d\
-\x02\x70\x76\x06\x37\x00\x83\x20\x14\xdd\xcc\x9d\x3a\x1c\xeb\x70\
-\xeb\x1e\xed\x6b\xf2\x1a\x42\xa8\x87\x7a\x31\x9a\x18\xa3\x90\x0f\
-\x8a\x1f\xb7\x0a\x70\x0b\xe8\xd4\x79\x03\xce\xe5\x05\x20\x38\x98\
-\xb1\x11\xf1\x32\x5f\x45\x07\x9f\x83\xd9\x4f\x4d\xbe\x1d\x16\x90\
-\x99\x8f\x96\xe2\x44\xfa\x7c\xca\x0f\x99\x77\x1b\x38\x91\x26\x9c\
-\xaf\x0a\xa6\xdb\xd6\xe9\xd6\xee\x6f\xe9\x61\xe5\x89\xf3\x3f\x29\
-\x5a\xff\x43\xa0\xdb\x7c\xfd\x2c\x6a\xe2\x10\xec\x11\xf0\x8d\x39\
-\xa0\x5d\x33\xa5\x8a\x14\x1e\x15\xab\x5f\x04\xfc\x43\xdf\x33\x02\
-\x68\x9e\x66\xc6\xad\xb5\x8e\xaf\x75\x5d\x02\xf0\x75\xc6\x36\x00\
-\xc3\x20\x10\xdc\x21\xfb\x2f\x95\x8d\xe2\x2b\x4e\x3a\xbd\x92\xb8\
-\x8a\x8b\x14\x36\xd8\xbc\xe1\x81\x5f\x68\x7c\xb4\xef\xf6\xbd\x0a\
-\x29\xc2\xdc\x3d\xe6\xe4\xb5\x01\x38\x7c\xaa\x34\xfe\xad\x09\x40\
-\x51\xc8\x8f\xc3\xef\x0e\xa8\x61\xd1\x68\x33\xc2\x67\x2e\xcd\xac\
-\x2d\x5d\x15\xa0\xbc\x3b\x17\xbe\xa6\xa0\xa0\xf1\xad\x20\x74\x1b\
-\x41\xef\xf7\x16\x8c\xae\x32\xb5\x93\x48\x9b\x4c\xd4\x3c\x6c\x35\
-\x93\xe2\x9f\xbd\xfe\xeb\x4d\xed\x95\xad\x13\xc7\xb0\x34\x26\x15\
-\xc1\x9b\x76\x27\x75\x9c\xbd\x04\x74\xfb\x9f\x38\xa1\x1d\xd2\x19\
-\x1c\x48\x64\x42\x60\x0b\x1f\x00\x8c\x64\xb9\x05\xe7\xf0\x5d\x5f\
-\x32\x7e\x04\x20\xec\x4c\x6e\x00\x84\x61\x20\x58\x92\xdf\x6e\x8f\
-\x0e\x28\xc9\x9d\x50\x0a\x99\xc7\x20\xcb\x82\x90\x0f\x9f\x28\x22\
-\x87\xd6\xe7\xda\x5b\x04\x88\x88\xb3\xaa\x0e\xa0\x04\x86\x2b\x89\
-\x8f\x3a\x76\xf8\x41\xb8\xe8\x76\x02\x99\x5a\x70\x67\xb9\xb0\x31\
-\xe6\x60\xa3\x22\x0a\xd8\x24\x8f\x03\x7f\xbc\x75\xf1\x0c\xd3\xb2\
-\xae\xc5\x1c\xe4\xcf\x5b\x52\x76\x9a\x56\x53\xb3\xfe\x53\xf2\x84\
-\xda\xee\xd0\xe9\x10\x3e\xb3\x70\x7a\xdb\xd7\x2f\xf1\xe0\xf7\x6d\
-\xbd\xee\xca\x75\x2e\x97\xda\x7b\x13\x33\x10\x8b\x04\x6c\x24\x7d\
-\x80\x8a\x90\x71\x30\xe3\x38\x0f\x2e\x56\x65\x1c\x71\x6a\x4c\xc0\
-\xc4\x13\x90\x22\x33\x9f\x07\x45\x32\x8b\xdd\x4c\x17\x32\x5c\xbb\
-\xc6\xd5\xb7\x00\x84\xdd\xd1\x09\x80\x30\x0c\x84\xe1\x65\xba\x62\
-\xb7\x72\x3a\x27\x90\x4f\x3c\x38\x8a\x56\xa1\x0f\x82\xd4\xa2\x26\
-\xd4\x4b\xfe\x64\xfb\x01\xcc\x39\x4f\x08\xd3\x93\x23\x78\x03\x0e\
-\xda\xbc\x78\x19\x16\xe9\x6f\x80\xeb\xb1\xe1\x68\x95\xad\x77\xe7\
-\x41\xa6\x0c\xa5\x55\x92\x57\x88\x30\xc6\xe9\x37\xb3\x97\x0e\xdd\
-\x89\x68\x45\x12\x0d\x30\xf2\x26\x9e\xfc\xd5\x12\xea\xeb\xbb\x63\
-\x47\x2c\xbb\x21\x96\x80\xae\x2b\x1c\xf2\x75\x8f\x35\x1a\xb7\x26\
-\x7d\xf6\x61\x5e\x5e\x2f\x9d\x49\x22\x8c\xb1\x7c\x86\x25\x7b\x27\
-\xc5\x27\xd5\x48\x10\x89\x65\x1c\x89\xea\x75\xdd\x80\x46\xc7\xac\
-\x99\xf5\xf3\xb4\xce\x79\x5b\x1a\x4d\x3c\xeb\x18\xe3\xd8\x3d\x97\
-\x4b\x00\xc2\xee\xe8\x06\x40\x10\x06\x02\xe8\x44\xac\xe5\x3e\xfe\
-\x3a\x12\x61\x28\x7d\x26\x97\x34\x4d\x50\xbf\xd1\x40\xb9\x5e\x5b\
-\x68\xeb\xef\x0d\xcd\x18\xe3\x5a\x6b\x1d\x26\x3c\xe7\x7c\xed\x0b\
-\x4d\x06\x08\xe8\x04\x08\x76\xab\x9f\x8a\xd5\x3c\x41\xe0\xb0\xf1\
-\x5a\xae\x71\x54\x4c\x0e\x2b\x58\x98\x1c\xfd\xf4\xc6\x33\xa6\xfe\
-\x99\xbb\x2e\x7c\xb7\xc9\xbd\xf1\xf3\xd7\x23\x0a\xf1\xed\xaa\x95\
-\xd5\xa1\x4b\xf9\x78\x72\x01\x6a\xfd\xff\xee\x04\xaf\x57\x0e\xf7\
-\x2b\xe1\x8c\x09\x93\x05\x74\x64\x47\x2e\xd8\x90\x33\x4d\x29\xbc\
-\xc7\x8e\x8b\xff\x45\x01\x89\xff\x2b\x10\xd3\x4e\x3f\x21\x35\x46\
-\x06\x80\x80\x18\x6b\x00\x53\x4c\xf1\xc3\xd2\xe7\x97\x4c\x6e\x01\
-\x28\xbb\x83\x1c\x08\x81\x10\x88\xa2\xb7\x9d\xdb\xcd\x1d\xed\x67\
-\xf2\x93\x8a\x1b\x67\x58\x9b\xd0\x9a\x82\x46\x28\xe0\x15\x00\x07\
-\x41\xdf\x63\xf9\x9f\xea\xca\xc6\xa5\xd9\xf7\xd3\xd4\x4d\xca\xfd\
-\x21\x50\xbc\x5d\xbd\xeb\x0e\xbb\x0f\x1d\x18\x08\xc4\x0e\x28\xd5\
-\x62\x0a\x62\xe8\x14\x37\x97\x5b\xcc\x3a\xe2\x01\xee\x8a\xb8\x7f\
-\x7a\x02\x56\x02\x56\xd9\xc7\xa5\x7d\x07\x84\x26\x7f\x96\x97\x28\
-\xc1\xf5\x4b\x7b\x5a\x45\xb0\x27\x31\x24\x01\xee\x62\x23\x56\x0d\
-\x00\xbe\x81\x36\xf1\xf4\xb5\x24\x83\x05\xef\x95\xb5\x85\xa6\x1d\
-\xc5\xeb\x1d\x4e\x80\x77\x1b\xa4\xb8\xca\x33\x48\xac\x11\x5c\x78\
-\xd1\xb7\x75\xf5\x97\x00\x84\xdd\xc1\x0d\xc3\x20\x0c\x85\xe1\x7d\
-\xba\x03\xd3\xf5\xca\x44\x1d\xa4\xf3\x34\xdf\xe1\x97\x2c\xa4\x8a\
-\x9c\x23\x43\xc0\xb1\x5f\x9e\x1f\xce\xd5\x01\xf6\xde\x9f\x07\x07\
-\x7c\x1f\xf0\xf6\xf2\x00\xd4\xb1\x40\x89\x70\xd6\x9f\xbe\x4c\x02\
-\xe8\x48\xd7\x3f\x1b\x22\x9f\x87\x43\x4c\x8e\x87\xf2\x74\xda\x3b\
-\x98\xa0\xa6\x09\x35\x96\x4a\x7a\x5e\x25\x90\xa3\x15\xf2\xfe\x69\
-\xf2\x6e\x57\x44\xd4\x14\x9c\xf6\xa6\x9e\x52\xf0\xd9\x53\xf8\xa6\
-\x3e\x3e\x75\x89\x93\xd7\xef\xf4\x71\xb6\xc3\x3d\xee\xb1\x51\x52\
-\xa7\x8d\xe2\xe0\xbe\x94\x8c\x8b\xbf\x0f\xed\x47\xe4\x4c\x02\x2c\
-\x5e\xc5\x3a\x4a\xbf\x6a\x34\x6c\x48\x2d\xa2\x06\xbb\x55\x51\xd7\
-\x5a\xef\xdb\xba\xfc\x04\x60\xec\x0e\x52\x00\x84\x61\x20\x8a\xde\
-\xff\xd6\xfa\x84\x81\x8f\x08\xd6\x8d\xe0\x42\x63\x9b\x4e\x93\xe9\
-\xa4\x3d\x12\xdc\x93\x15\xdf\x73\xcb\x23\x12\x65\x34\x23\x7d\x78\
-\x4a\x15\x9c\x80\xf9\x1d\x3a\x6c\xf4\x57\xe2\x55\xb2\x42\x03\x70\
-\x00\x3f\x2b\x06\x10\x5c\x82\x46\xc8\xe0\xee\x5d\x9c\x6a\x4c\xd6\
-\x76\xc9\x6c\x50\x76\x72\x84\xcc\xd7\x72\x73\xb3\x89\xf2\x08\xd5\
-\xed\x2d\x98\x6b\xc5\xf0\x89\xee\xf0\x4d\xcb\x76\xdd\x62\x32\xf2\
-\x6d\xf0\xa0\xb6\x60\x81\x31\x64\x30\xa0\x38\x87\xce\x6b\x1d\x44\
-\xab\x86\xcb\xf8\x79\x06\x41\x1c\xbe\xc5\x71\x64\x0d\x3a\x9f\xbc\
-\x4d\x96\x35\x1b\xff\xe0\xdf\x75\x09\xc0\xd8\xb9\xe4\x00\x08\x83\
-\x50\xf0\xa4\x5e\x83\x85\xe7\x6b\xc2\x69\xbc\x83\x8c\xc9\x24\x84\
-\x0d\xee\x5c\x34\xb6\x95\xdf\xab\x50\xde\x2f\x05\x28\x84\x79\x97\
-\x80\x2e\xdd\x78\x66\x7e\x82\xe2\x4c\x2f\xf3\x15\x8b\x31\x96\x75\
-\x8a\x13\x2d\xc2\x84\x86\x75\x76\x08\xde\xee\x9c\x3c\x33\x8e\x10\
-\xc3\x07\x81\x61\x04\x50\xc3\x66\xf1\x10\x56\xe4\xf4\x82\x8f\x79\
-\x35\x6a\xf3\x06\x5a\xe1\xe4\x0c\xee\xf7\xfc\xe6\xff\x83\x9e\xec\
-\xda\x0a\x53\x7a\x1f\x01\x2b\x76\x58\x9f\xfc\x08\xbc\x13\x94\xcf\
-\x5e\x6d\x0b\x6b\xf2\x06\x43\x42\x29\x6c\x67\xdb\x99\x4c\x0d\x2f\
-\xce\x61\x8e\x9f\x66\x50\x30\xae\xea\x41\xc0\x12\x78\x52\x31\x53\
-\x29\xc6\x89\x88\x67\x93\xed\x2b\x00\x63\x77\x70\x03\x31\x0c\x02\
-\x51\xb4\x39\x77\xe5\x86\x52\xe6\xe6\x1d\xbe\x34\x7b\xcb\x39\x8a\
-\xa5\x00\x01\x0c\x33\xf0\xa9\x45\x76\xef\xb5\xca\xf4\x49\xf0\x14\
-\x45\xd9\x81\x14\x02\x21\x9c\x73\xfe\x06\x21\x2e\x12\x68\x11\xaf\
-\xc5\x35\xd6\xca\xa3\x10\x42\x24\x10\x0a\xe7\x0d\xfc\x0d\xce\x76\
-\x1d\x92\x1f\x14\x93\xeb\x87\x97\xad\xef\x3e\xc0\xe8\x59\x65\xfb\
-\x5b\xaa\xad\x6a\xb6\x4d\xad\x40\x2e\x3b\xd7\x68\xe7\x08\xf5\x3c\
-\xef\x11\xf5\x6b\x77\x11\x46\x67\x0f\x07\x11\x74\xdb\xed\x46\x5d\
-\xbe\x15\xb1\x20\xe7\x92\xe5\x88\x36\xce\x64\xfc\xbe\x8b\xe7\x5c\
-\x26\xf5\xe2\x08\x33\xee\xa5\x7d\x91\x07\x0f\xcc\xa3\x30\x2e\xb9\
-\x94\x3a\x4d\x03\xb8\xbd\xf3\x86\xe5\x4f\x83\xa3\x7f\x02\x30\x76\
-\x07\x37\x0c\xc4\x20\x10\x45\x8b\x48\x61\xee\x2f\xad\xa5\x99\xf8\
-\x45\xfa\xd2\x28\xa7\x3d\xed\xd1\x0b\x18\x1b\xf0\x30\x3c\xee\xb9\
-\xba\x1e\xff\x46\x12\x7d\x15\xf8\xa2\x24\xf8\x79\x77\x3f\x21\x7b\
-\x13\xb0\x01\x08\xa7\x85\x2a\x04\xec\x7a\xe8\xe2\xf7\x8b\x0d\x18\
-\x9c\x57\x50\x86\xd4\x27\x10\x8a\x23\x8d\xe2\x9c\x04\xde\x1e\x5c\
-\x17\x84\x8f\x74\xaa\xae\x9e\xf8\x78\xb6\x4d\x6b\x47\xc2\x2e\x59\
-\x73\xdf\xc5\x1f\xee\x64\x92\x85\x8d\xfd\x57\x16\x4b\xdd\x3a\x82\
-\xd7\x30\x5b\xbc\x12\x95\x57\xbf\x77\x4f\x4b\x77\x1b\xfc\xd0\x68\
-\x1c\x9b\x03\x85\x0b\xf9\x04\xcf\x31\x81\x87\xa6\x16\xd4\xc9\xb6\
-\x96\x57\xd0\x7f\x91\x53\x2c\x73\xce\xf9\xe5\xfe\x71\x01\x70\x46\
-\x0e\x63\x7d\xb6\xb9\x9b\xee\xf3\x74\x94\xcc\x57\x00\xc6\xce\xdd\
-\x06\x60\x10\x06\xa2\xd9\x21\x33\x51\xb0\x00\x4b\x31\x54\x06\x61\
-\x99\xf0\x90\x9e\x74\x72\x45\x41\x87\xf8\xd8\x67\x61\x1b\x73\x5c\
-\x03\x60\xce\xf9\xed\x68\x60\x6d\x05\xbf\xa2\x0e\x7a\xf5\xd6\xda\
-\x59\x30\xa8\x04\xe1\x70\xe6\xb1\x69\x5a\xbd\xaa\xcd\xc7\xa4\xa2\
-\x5c\xc2\x65\x9c\x48\xc6\x40\x41\xfe\x9c\xa5\x23\xc8\x79\x09\x08\
-\x98\xc7\xab\x68\x84\x2b\xbb\x96\xd6\xed\x8b\xe2\x5a\x91\x63\x6d\
-\x5f\xc6\xfc\x35\xaf\x90\xf5\x8d\x95\xf1\x3b\xab\x7e\x4d\x72\x69\
-\xe9\x8c\x8b\x3c\x7c\x40\x4b\x5f\xd6\x86\xd2\x31\x06\xbf\x8b\x43\
-\x5e\xec\x85\xe3\x0d\xe5\xa1\x60\x00\xef\x9c\x66\x54\xfd\x41\x34\
-\x69\x74\x13\xb4\x63\x8c\xa7\xf7\x7e\xfa\x31\x3e\x8e\x34\x91\x44\
-\xca\x16\xfa\xf8\x5b\xbd\xfe\x02\x50\x76\x2f\x37\x0c\xc2\x30\x00\
-\x86\x67\x64\x8c\xcc\xd1\x11\x72\xef\x06\xdd\x20\xc3\x95\x0f\xe9\
-\xaf\x22\xa4\x4a\x2d\x17\x38\x04\xe2\x60\xc7\xcf\xd8\xfe\x2b\xeb\
-\xf2\xb4\xf9\x1f\x6b\xad\xe7\x09\xdc\x75\xc4\x98\xcc\xa1\x8c\x28\
-\x7c\x54\x97\x30\x8b\x1c\x63\x88\x26\x5e\xd4\x59\xd5\xaf\x9d\xc5\
-\xed\x32\xbb\x86\xd1\x64\x19\x44\x7b\x76\x4c\xdb\x6e\x2f\x04\x5a\
-\xcf\x61\x84\x61\x1e\xe6\x12\x45\x31\xd3\xb1\x46\xcd\x7b\xf7\xcd\
-\xbd\x7a\x87\xab\x58\xc6\x37\xe7\xd1\x3d\x6f\xf1\xae\x00\x26\xd3\
-\x53\xe8\xb2\x82\x62\xd3\xe6\x87\x64\x48\x05\x27\xc4\xdb\xc1\xee\
-\xfe\x83\xf1\x71\x31\xfe\x14\xeb\xcc\xff\x11\xc7\x8a\xab\x25\xc7\
-\xbd\x47\xd3\x47\x64\xbe\x65\xb3\x1d\xc7\xf1\x21\x36\x88\x67\x32\
-\x22\xb6\x60\x94\xd3\x39\xe7\x7c\xfd\x8a\xd3\xb7\x00\x94\xdd\xc1\
-\x09\x80\x30\x0c\x05\xd0\x11\x5d\xa1\x1b\xf5\xdc\x45\x9c\xc1\x9d\
-\xbc\xd8\x27\x7c\x88\xc5\x83\x0a\x45\x10\x2c\xf1\x37\xf9\x89\xb1\
-\x89\xbf\x14\xa0\xf7\xbe\x4f\x0b\x3f\xa6\xe6\x6d\xa9\x49\x23\x80\
-\x36\x68\xe8\x87\x3b\x90\x89\xb2\x80\x1e\x6c\x8c\x71\x67\xb9\x58\
-\x48\xfa\xdf\xd7\x5c\x7e\x2d\x00\x71\x06\x1e\xcb\x40\xfb\xb2\x61\
-\x00\x72\xcd\x9c\x09\x9c\x0c\x16\xc6\xff\x19\xc0\x00\x26\x76\x88\
-\x25\xd7\x3f\x80\x27\x5d\xfa\xb6\x2b\x79\xa5\xf8\xb5\xb0\x23\xb2\
-\xd6\x96\x36\xb5\x7c\x8d\x4c\xe2\x21\x0b\x6e\xa4\x31\x43\x58\x0b\
-\xdd\x53\x58\x5f\x51\xdd\xeb\xbd\x3f\x51\x3a\xd9\xd7\x7d\x7d\x49\
-\xef\x72\x21\x51\x0c\xf3\xc1\x50\xd0\xd7\x5a\x7b\x30\x16\x6c\x18\
-\x61\x29\xd0\x3d\xbf\xfa\xfe\x1c\x97\x00\x94\xdd\xb1\x0d\xc3\x30\
-\x0c\x44\xd1\x0d\xbc\x85\xb6\xf5\x08\x1a\x36\x7a\x06\x7e\x40\x04\
-\x69\x5c\xb8\x71\x23\xf9\x28\xd2\x14\x09\xde\xbd\x9e\xbb\x3e\x57\
-\x8b\x9b\x56\xd0\x09\x41\x17\xaf\x66\x30\x27\x7a\xad\xf5\x80\xc3\
-\x18\x3e\x5e\x3e\xc0\xe8\x7b\xef\xef\x68\x59\xdd\xc2\xc9\xcf\x1b\
-\x00\x79\x18\xa0\xb5\x43\x01\x2a\x5c\x36\x94\x0a\xe8\x0a\x2a\x80\
-\xe7\xf5\xe9\xee\x46\xd1\xc6\x53\x52\x1e\x4b\x95\x7b\xce\x2d\xce\
-\x3a\xfd\x6f\x56\x3f\x67\xf4\xff\x29\x90\x16\xf2\x1d\x3e\x4f\x95\
-\xcb\xf8\x05\xec\xc9\xfb\x3a\x79\x0c\x8f\xb0\xd1\xfa\x0e\xb0\xc4\
-\x36\xbe\xe4\x42\x3e\xac\x66\x47\xaf\x04\x39\x0e\xa6\x5a\xc1\x6a\
-\x26\x8c\xaf\x4e\xd2\xfc\xa5\xa4\xcf\x75\x3a\x4d\x23\xeb\x93\x9b\
-\xf7\xab\x7e\x63\xcf\x8f\x00\x94\xdd\xcd\x0d\x80\x20\x0c\x05\xe0\
-\x69\xdc\x82\x1b\x33\x39\x04\xe3\xb8\x83\xcb\xb8\x85\x7c\x87\x67\
-\x1a\xe2\x05\x2f\x4d\x3c\x40\x69\x9b\x47\x1b\xfa\xb3\x6d\x00\x63\
-\x8c\x7b\x1e\xe6\x32\x28\x72\x0a\xed\xc0\x8c\x2e\x98\xee\xe8\xde\
-\xfb\x57\x9b\x46\x40\xae\x06\x56\xea\x71\x22\xca\x49\x9a\xf9\xda\
-\xc2\x3d\x19\xb1\x79\x68\x72\x20\x35\x7b\x8c\x41\xac\x0b\x3e\x09\
-\xd6\xb5\xc0\xe8\xfc\xb7\x1e\x68\x85\x14\x84\x6f\x0f\x06\x94\x52\
-\xb6\x44\x05\x35\xcd\xfb\xaf\xcd\x7c\x5e\xd9\xd6\x31\x71\x35\xa4\
-\x0b\xa4\xa7\xef\x31\xfe\x08\x1f\x3f\x14\x9b\x41\x53\x90\x48\xe4\
-\xe2\xa3\x3c\x7e\x51\xbc\xf3\x38\xa9\x35\xab\x37\xa5\xf0\x99\x9c\
-\x5a\x13\x52\xf0\x00\x0d\xcd\x36\x42\xa1\x1f\xca\xe1\xd3\x9c\x1a\
-\x8d\x43\x3d\xd7\x7c\x5a\x6b\xe7\xae\x3e\x5f\x01\x38\x3b\x83\x1b\
-\x00\x41\x18\x8a\x4e\xe3\x02\x2c\x00\x93\x78\xe3\xc4\x50\x4c\xc1\
-\xd5\x31\x9c\x47\x1e\xc9\x4b\x48\x13\x3d\xe8\xd1\xc4\x08\xb4\xe1\
-\xf7\x97\x4f\xfb\xab\xf2\xc2\x18\xe3\xcc\x39\x5f\x73\x71\x0e\x0f\
-\x7b\x08\x08\x31\x48\x29\x65\x79\x2e\x86\x07\xc3\x6a\xad\x6b\xd2\
-\x68\x07\x6c\xad\x12\xb7\xe3\xbd\xfa\x96\x59\x2c\xde\x29\x1e\x81\
-\x23\x13\xe9\x32\x79\x60\x86\x18\x40\x67\x00\x77\x59\x68\x60\x86\
-\xff\x9b\x63\x8f\x0e\xb0\xd7\xf6\x89\x02\x96\x78\xc1\x35\x3a\x80\
-\xbb\x16\x06\xc0\x48\xde\xc1\xb7\xb9\x93\x94\x4f\xf5\x33\x7c\x1f\
-\xc3\x9b\xfb\x97\x92\x7a\xaa\xe9\x58\xa4\xac\x2a\xa7\x84\x42\xab\
-\x8d\x02\x13\xad\xb5\x05\xa9\x8c\x8b\xb8\x07\x76\x44\xb7\x33\xe8\
-\xb3\x9a\xca\xf9\xfd\x9d\x52\xea\x6f\xc2\xcf\xaf\xe7\x11\x80\xb3\
-\x33\x38\x02\x10\x06\x81\xe0\xcb\xae\x6c\x24\xd4\x64\x13\x94\x60\
-\x87\x66\x33\xae\x73\x0f\x5f\xf9\xc7\x31\x81\x03\x8e\x88\xb0\xdd\
-\x7a\x63\x5a\xe5\x3d\x63\xd3\x31\x37\x76\x72\x10\xdc\x1c\x1b\xc3\
-\x22\x71\xdd\x80\x00\xe5\x20\xac\x31\xc6\x3a\x28\xa1\x22\x27\x86\
-\xe4\xcf\x1a\x59\xdb\x9e\xf7\xf3\x5a\x08\x02\x21\x5d\x74\xf6\x30\
-\x56\x06\x10\x20\x82\x32\x6f\x41\x91\x8d\x9d\xf5\x3c\xa9\x88\xfc\
-\x36\xff\x37\x20\x32\x47\xb8\x4b\x60\x93\x99\x5b\x0f\x61\xf7\x34\
-\xd6\xe3\x91\x48\xe9\x60\xe6\xae\xf5\x02\xc7\xcc\x01\x70\x4a\x94\
-\xb3\x02\xca\xb4\x53\xb9\xc0\x1d\x00\x7b\x55\x2d\xe5\xf3\x0c\xef\
-\x03\x80\x78\x53\xe2\xfe\x3b\x51\xfc\x2b\x13\xef\xee\x6b\x47\x8f\
-\x8f\x00\xa4\xdd\xc1\x0d\x80\x40\x08\x44\xd1\x92\xec\xca\x9e\xec\
-\xce\x52\xe4\x1d\x7e\x42\x3c\xea\xd9\x68\x84\x1d\x58\x06\x08\xfc\
-\x5a\x1e\x3d\x7c\xf4\x1a\x25\x9d\x09\x41\xa9\x62\x01\x3f\x8e\xe7\
-\xb2\x12\x5e\xa0\xa1\x49\xc6\xc1\xdb\x2a\xde\xbd\xc5\x9a\xa0\xbc\
-\x1e\x43\x01\x25\x61\xab\x74\x45\x17\xbd\x5f\x79\x33\xa0\xd4\x95\
-\xdc\x15\x00\x70\x35\x9b\xd6\x61\xd3\xb0\xe5\xdc\x73\x74\x6e\xef\
-\xef\xdb\xbd\xf5\xbb\xf2\x96\x07\x29\xaf\x20\xc6\xc8\x7a\xa3\xae\
-\x0e\x4a\x6c\x02\xe8\xef\xb9\x7d\x3b\x25\xbc\x59\x4f\x5e\x90\xbc\
-\x80\x0c\xd4\xbc\x65\x46\xc0\xab\xc8\xaa\xb2\x7c\xcf\x7d\x9f\x2e\
-\xe9\x83\x81\x59\xd2\x15\x45\xa6\x93\x01\xdc\x3d\xfa\x3e\x94\xee\
-\xbf\x9c\xe1\x23\x00\x69\x77\x6c\x03\x20\x0c\x03\x01\x70\x36\x06\
-\xc9\x34\xcc\x92\x9e\x22\x62\xbe\xe4\x10\x2f\xa1\x80\x28\xa0\xa0\
-\x82\x10\x84\xdf\xf6\xc7\x92\xfd\xbf\x00\x40\x47\xa0\xb5\xb6\x8d\
-\x8f\x5f\x22\xc5\xc2\xdb\xa0\x97\xcc\x8a\xe2\x4e\xba\x84\xd3\xe8\
-\xa0\x80\x84\x18\x62\xb6\x11\x50\x16\x31\xfc\x5c\x61\x33\xe7\xe1\
-\xa4\x8a\x90\xaf\x79\xb0\xf3\x2c\xc3\x16\x63\x01\x41\x54\x3b\xbc\
-\x3b\x64\xf0\x4d\x46\x66\x9e\x5d\x1c\x90\x5c\xc5\x9e\x18\x99\x71\
-\x44\x9a\x53\xaf\xef\xd6\x50\xf2\xd4\x3f\x90\x3d\xd2\xe6\xed\x02\
-\x4a\x8e\x22\x75\xf0\xe6\x90\x49\xf7\x14\x79\x4a\x29\x87\x53\x78\
-\xce\x5a\x00\x36\x71\x5c\x2a\xb4\x77\x8e\xbc\x63\xcd\x4e\xb9\xb5\
-\xd6\xba\x7e\xb5\x61\x17\x80\xb4\x33\xb8\x01\x10\x06\xa1\xe8\x88\
-\xae\x63\x1c\xc5\x19\x18\x85\x55\xdc\xa1\x3c\x93\x97\x10\xa2\xa7\
-\x7a\xf5\x62\x91\xc2\xa7\x9f\x4f\xb7\xa6\x2f\xe1\x75\xb5\x0b\xae\
-\xcc\x3c\xcb\xe0\x87\x68\x98\x7c\x2d\xed\x0a\x67\x60\x9d\x8c\x73\
-\x50\x1d\x10\xba\x23\xe2\x05\x8f\x1a\x93\x77\x9d\x7f\x67\xd1\xe6\
-\x6c\xa7\x78\x7c\x89\x41\x7a\x57\xb2\xd7\xcf\x03\x12\x7b\x13\x48\
-\xbf\x75\xd3\x6e\xdc\x59\xf7\x77\xd4\x2f\x25\x6d\xb5\xe1\xa4\xb3\
-\x29\xf8\x9c\xa2\x91\x3f\xd6\x50\x6d\xa1\x8c\x20\x9b\x42\x85\xb2\
-\xca\x1f\x52\x1a\x60\x8f\x83\x34\x6d\x81\x33\x53\x55\x70\x8c\x4c\
-\xe8\x67\x5d\x4e\xff\xaa\x6f\xbb\x2b\xea\x3d\x3b\x3f\x9f\x67\x09\
-\x40\xda\x99\x9c\x00\x0c\x03\x31\xb0\xc8\xb8\x87\xe0\x4a\xb6\x9a\
-\x80\xcb\x70\x51\x79\xc4\x13\x18\xd0\x23\xe4\xe3\x12\xd6\x87\xa4\
-\xbd\xb7\xc7\x6f\x55\xd5\xec\xbd\x5f\x8b\x9b\xef\xf5\xa2\x0f\xe7\
-\xe9\xc0\x87\x16\x57\x50\x04\x02\x4c\xa3\x13\x80\x40\x90\x01\x94\
-\xe0\x17\xb0\x91\x2b\x47\xb1\x29\xd8\x4c\x82\x70\xd0\x0e\x8f\xcc\
-\x36\x2b\x6b\x10\x55\xcd\x72\xa2\x51\x41\x2f\xca\x75\x2a\x5f\xed\
-\x5c\x7f\x2d\x64\x99\x78\xca\x72\xaf\xa4\x8c\x6c\xee\x4c\x21\x9b\
-\x09\x25\xed\xd1\xb5\xe3\x81\xba\x29\x5c\xba\xc3\x7b\x6a\xad\xbd\
-\x6e\xa3\x21\x5f\x6c\x01\x6d\x08\xf6\x90\x82\x57\x50\x6a\x13\xbd\
-\x7e\x63\x8c\x73\xf7\xfe\x1e\x01\x48\xbb\x83\x13\x00\x61\x18\x0a\
-\xa0\xb8\x61\x97\xea\x10\x4e\xe3\x04\xee\x64\x9f\xf0\x21\x48\x3c\
-\xb5\x17\x0b\xa5\x07\x6d\x92\xdf\x98\xfc\xe4\xd8\xcd\x96\xcd\x18\
-\x63\x9c\x9e\x0b\xb7\xde\xe4\x91\x90\x47\x61\x1d\xcf\x40\x9f\x41\
-\x73\xd2\x9f\xbc\x01\x2f\xe5\x56\x0b\xd7\x60\x61\x62\xe1\x34\x20\
-\x9d\x34\x6b\xeb\xd4\xae\xca\x56\xa2\x8e\x55\xab\xbb\xc2\xcf\x1d\
-\x71\xa4\xba\x85\x5f\xe6\xd1\x5f\xca\x59\xc7\xfb\xeb\x78\x85\x15\
-\x5a\x08\x8a\x83\xb7\x06\x9a\x28\x82\xff\x1b\x82\x60\x2c\x24\xcc\
-\x67\xf2\x73\x41\x24\x1c\x7c\x7c\x16\xd2\x37\x49\xed\x64\x7b\x09\
-\xd2\x82\xcf\x8b\xcb\x37\xe7\xbc\x77\xcf\xed\x11\x80\x95\x33\xb6\
-\x01\x18\x06\x81\xe0\x6e\xae\xd9\x23\x33\x64\x9d\xec\x93\x2d\x32\
-\x88\xb9\xe2\x24\x84\x90\x92\x22\xd4\x96\x0b\xdb\xbc\x9e\x07\xff\
-\x6f\x0f\x80\x88\x88\x2b\x61\xeb\xc9\xec\x3e\x29\xcd\xfc\xc2\x0c\
-\xfb\x05\xfa\x51\xb3\x2c\xe1\xea\xa1\xb3\x0e\x61\x03\x82\x88\x60\
-\x22\x13\x97\xec\x55\x9b\xb9\x6e\xbc\x24\x02\xa8\xf8\x55\x7f\xbf\
-\xee\x6e\xd2\x47\xbb\x3a\x12\x4c\xf3\x06\x93\x4a\x38\xa9\x89\x7d\
-\x20\x44\x69\x96\x8b\xd7\xb8\xd1\xb2\x8d\x35\x64\xbc\x4d\x1d\xab\
-\x0c\x27\x7e\x48\x06\x2e\x5f\xb6\xef\xbe\x20\x67\x12\xc1\x7b\xad\
-\x75\x7c\x6d\xf6\xbc\xc5\x16\x40\x54\x4d\x00\x20\x00\xac\xc3\x36\
-\x98\x99\x99\xf9\x83\xba\x45\xa0\xdc\x0e\x9b\x57\x07\x79\x0c\x54\
-\xc4\xc1\x52\x3b\xfa\x6d\x63\xa0\xc0\x01\x0d\x98\x80\x96\x97\x81\
-\xee\xe8\x03\x1d\xb6\x0c\x1b\x20\x82\x4d\x74\x60\xdb\x0f\x88\x9e\
-\x18\x60\xa5\x02\xf2\xe8\x1e\xf2\x82\x4d\xf4\x06\x1a\xbe\x1c\x8d\
-\x1e\xc1\xe8\x43\xb7\xc8\x6b\x05\x60\x66\xc2\x6e\x48\x83\x9d\x49\
-\x08\x33\x13\xb6\xc7\x0f\xd4\x43\x02\x5d\x30\x05\x5a\x50\x8b\x7c\
-\xb0\x06\x6c\xbc\x1f\xd4\xbf\x07\xdd\x5a\x0a\xbb\x6c\x03\x96\x09\
-\x40\xb9\x1f\xa8\x3f\x12\x48\x3f\x68\x6b\x6b\x3b\x41\xad\xf8\x02\
-\x08\x20\xaa\x27\x80\xfe\xfe\x7e\xd6\x73\xe7\xce\x95\x00\x1d\xde\
-\x86\x5c\x3f\xc2\x96\x3f\x83\x1a\x3b\xa0\x69\x64\xd0\x0a\x22\xd8\
-\x06\x12\xe4\x31\x77\x10\x06\xf5\xa5\x41\x5d\x9e\x75\xeb\xd6\x81\
-\x07\x55\x60\x8d\x27\xe4\xad\xda\xb0\x81\x14\x58\xee\x87\x4d\x0d\
-\x23\x47\x36\xfa\xda\x7d\x6c\x0b\x3c\xd1\x23\x1e\xdf\x06\x4e\xf4\
-\xe5\x5f\xc8\xeb\x0a\x61\xf7\x22\xc3\x72\x32\x6c\x78\x16\x36\xc1\
-\x03\xf2\x33\x68\x22\x07\x34\xa1\x03\xeb\xee\xc1\x4a\x27\xd8\x20\
-\x13\xa8\xbe\x07\x15\xf9\xa0\xd2\x13\x56\xec\x83\xcc\x00\x35\x16\
-\x81\x0d\xc0\xb5\xc0\xcc\x93\x5e\x5e\x5e\xfe\x96\x9a\xf1\x05\x10\
-\x80\xb5\x33\xb8\x01\x18\x04\xa1\xe8\xb9\xfb\x30\x63\x7b\xed\x22\
-\x9d\x82\x45\x7a\x62\x8e\xfa\x92\xbe\x84\x70\xd6\x01\x34\x28\x7e\
-\x40\xe1\xb3\x5d\x01\xfe\xba\xc2\x23\x33\xef\x05\xfd\xef\x12\xf4\
-\x74\xf3\x80\x3f\x53\xa3\x40\x03\x9a\x50\x12\x0a\xc9\x2d\x68\x95\
-\x90\x87\x88\xad\xa4\x81\x33\x1d\x36\x50\x04\x69\xea\xfd\x6f\xf7\
-\xe1\x48\x94\xe8\xe8\xd0\x6f\xee\xa4\x59\x9f\x45\x24\x93\x76\x6e\
-\xfa\x0f\xce\xd5\x99\x50\x7c\xad\x34\x91\x65\x12\x45\x72\x80\xc8\
-\x4b\xe2\x06\x50\x8f\x02\x98\x40\xa2\xc3\x2a\x32\x10\xeb\x13\x1e\
-\xf3\x59\xc4\x3e\xd8\x32\x8e\xf5\x30\x9f\x55\xf5\x44\xc4\xb5\x0b\
-\xf6\xfb\xf8\x04\xa0\xed\x8c\x6d\x00\x86\x41\x20\x38\x0c\x0b\x30\
-\x27\x5d\x16\xc8\x0c\xf1\x04\x5e\x2d\x5c\x94\x8f\x5e\x56\x5a\xbb\
-\x73\x61\x51\x80\xf9\x07\xe1\xf7\x96\x00\xd0\xea\x68\xbf\x22\x62\
-\x34\x0e\x9e\x3e\xe0\x89\xd3\xd9\x03\x05\xcd\x1b\x9e\x36\x2a\x4e\
-\x55\xf3\x46\x3a\xbe\xea\xa0\x81\xa3\x30\x61\x4a\x21\xde\x26\x40\
-\x30\x57\x11\x4a\x9f\xe9\xf3\xdb\xae\xd2\xef\xef\xcf\x3d\xcf\x00\
-\x4e\x02\xd7\x92\xf0\xad\xb9\x3f\x3b\xfe\xa8\xc3\x25\x6e\x95\x69\
-\x20\xbb\x38\x1c\x76\x0f\xd1\xd3\x0f\xea\x3a\x2f\xbb\xb0\x7c\x20\
-\x8f\x59\x3e\x9a\x41\x12\xb0\x72\x29\x98\x86\xc5\x91\x99\x47\x55\
-\xcd\x1d\x3e\xba\x05\xa0\xed\x8c\x4e\x00\x08\x61\x18\x3a\x61\x57\
-\xec\x0d\x73\x8b\xe9\x03\x1f\x84\x43\xfc\xf2\xdc\x40\x8c\x36\xad\
-\x69\xf3\x2b\x00\x58\x55\xd5\xf3\xa0\xdf\xb9\x99\x76\x86\xb0\x33\
-\x87\xb4\x85\x43\x66\xce\x6b\xa0\x61\x54\xfa\xf7\x7a\xab\x00\x84\
-\x0a\x1b\x4a\xca\x00\x01\xb2\xe4\x17\xac\x6d\x65\x79\xab\x33\x5e\
-\x9f\x26\x76\xed\x48\x5d\x16\x84\xec\xbd\xcf\x1e\x3d\x89\x9b\xe1\
-\x09\x50\x93\xd6\xa2\xd3\xb3\x51\x43\xf2\x99\x86\x90\xa6\xbb\xec\
-\x03\x9e\x03\xe9\xf5\x2f\x80\x97\x51\x83\xed\xa5\xa0\x7e\x50\x62\
-\xdd\x8c\xf9\xdf\x35\x04\xa0\xed\x8e\x6d\x00\x84\x61\x20\x8a\xce\
-\xc3\x48\x14\x0c\x90\x39\x58\x1c\x9e\xc4\x97\x22\x84\xa8\x20\x0d\
-\x22\x05\x82\xc3\x1c\xf6\x25\xb6\x7f\x37\x00\x63\x8c\xb1\x9d\x0f\
-\xb3\x88\x0e\xca\x1a\x76\x24\x6c\xa4\xd4\x61\x03\xe0\xf1\x0d\x80\
-\x39\x77\x1b\xad\x58\x55\x2f\xcf\x3c\x07\xd3\x57\x03\x40\x9a\x03\
-\x40\x5b\x9d\xab\x8a\x46\x6c\xf0\x96\xd9\x33\x87\x7d\x4f\x75\x07\
-\xe7\x76\x2c\x6d\x13\x77\xcf\x0c\x97\xfc\x8c\xbd\x84\x74\x72\x1d\
-\xe8\xf5\xe6\xf2\x05\xea\x2c\x9e\x68\xe4\x1c\xdd\xdb\x54\x2b\xea\
-\x61\xd0\x89\x4d\x98\xd1\x35\xaf\x74\xb9\xd5\x6a\xeb\x89\xc5\xfe\
-\xf5\x3f\xff\x3e\x0e\x01\x78\xbb\x73\x1b\x80\x61\x10\x0a\xa0\xf3\
-\xb0\x41\x32\x1a\x7b\x78\xdb\x34\xf1\x2b\xbe\x44\x91\x22\x45\x14\
-\x4b\x2e\x5c\x58\x3e\x38\x04\xf8\x1b\x7e\x61\x00\xad\xbb\x0f\x05\
-\xa8\xaa\x6a\xb9\x50\xd2\x2b\x06\x40\xb2\xe6\x33\x2e\xf5\x09\x0c\
-\x12\x78\x78\x0a\x26\xcd\x94\x71\x13\xd2\x95\xcb\x16\x31\xd3\x19\
-\x50\x18\x83\x54\x25\x6c\x3b\xe7\xcf\x04\x8b\xd3\xe8\x7b\x4a\xfe\
-\x18\x97\x32\x25\xed\x82\x42\xe2\xca\xea\x5c\x38\x04\x47\xb4\x20\
-\xa6\x43\xf4\xbc\x1b\x44\x13\x39\x2b\xa2\x63\xd8\xfc\xf5\xa7\xee\
-\xf3\xed\x9b\x71\x6c\x8d\x3d\x3e\xf7\x7e\xae\x2f\x7c\xfc\x37\xed\
-\x16\x80\xb7\x73\xb7\x01\x18\x84\x81\xe8\x18\x99\x80\x21\xb2\x9e\
-\xa7\x4d\x9d\x22\x75\xee\x15\x4f\xba\x8e\x26\x0a\x12\x0d\x05\xc2\
-\x5f\x09\x73\x67\x7e\x73\x00\xc6\xcc\xac\x44\xff\x41\x07\xb2\x08\
-\x7d\x79\xcf\x6d\xdc\x9e\x0c\x1e\x14\xcc\x1b\x01\xac\x21\xb2\x03\
-\x0a\x45\x61\x64\x8f\x6e\x94\x28\x80\xc2\x5b\x40\x03\x2e\xc8\x12\
-\x62\x07\x55\xb6\x3c\xc5\x46\x16\x77\x81\x49\xe4\xaf\x24\x0e\xa6\
-\x51\x4c\x94\xb2\xae\x61\x9b\xf7\x60\x23\x4d\x4b\xe0\xca\x44\xc4\
-\x63\x74\x1c\xde\xf3\x8b\x27\xb0\x6a\xca\xbe\x71\xa4\x33\xfb\x3d\
-\x91\xf3\xde\xfd\xf6\xf9\xe5\x78\x05\x10\x5d\x13\x00\x0c\x80\x6e\
-\x23\x01\xe6\x16\x21\x60\x4a\x5f\x0e\xe2\xc3\xb6\x9d\x23\x8f\xdd\
-\x83\x02\x06\x44\x83\x72\x18\x2c\x31\xc0\x72\x1d\xec\xee\x22\x50\
-\x80\x22\x2f\xd2\x40\x6f\x03\xa0\xf7\x0a\x60\x6d\x0b\xe4\xb3\xfb\
-\x71\x1d\xe9\x82\x3c\x0c\x8c\xed\x30\x07\xf4\x48\x47\xde\xb2\x05\
-\x72\x17\x68\xb2\x0b\x14\xe9\xa0\x2e\x2d\xa8\xd1\x0a\xab\x46\x60\
-\x09\x00\xd6\x9b\x81\x56\x89\xed\xa0\x1e\x13\x31\x97\x3d\x53\x1b\
-\x00\x04\x20\xee\xdc\x6d\x00\x00\x41\x20\xba\x0d\xc3\x39\x86\xab\
-\xd8\xb8\x0f\x0b\xc9\x2b\x5e\x42\x8c\xbd\x96\x56\x26\x7c\x82\xdc\
-\x71\x7c\x71\x00\x0e\x2b\x69\x33\x73\xa0\x48\x5a\x86\x9d\x44\xaa\
-\x74\xef\x4e\x98\xb0\x30\x24\x12\x81\x7e\x81\x48\xc1\xc8\x71\x04\
-\xa3\x55\x51\x2a\xab\x75\xe1\x52\xdb\xc4\xaf\xb6\xf0\xad\x2c\xd2\
-\xbf\x82\xaf\xf1\xb3\x2e\x4f\x23\xb6\xcf\x9b\x1c\x22\x25\xcb\x40\
-\xce\xa4\x99\x05\xc3\x99\x7b\x17\x47\x09\x1f\x2b\x88\x61\x36\xc1\
-\x51\xca\x39\x56\x44\x6c\xf8\x96\x3f\xec\x70\x04\xd0\x80\x25\x00\
-\x18\x28\x2e\x2e\x76\x03\xf6\xf1\x23\x80\x8d\xa9\xad\xc0\x00\x5a\
-\x03\x0a\x28\x58\x1f\x18\xf9\xbe\x21\xd8\xba\x3f\xd8\xd0\x32\xa8\
-\x58\x06\x35\x16\x41\xa5\x02\x68\x80\x09\x14\xa0\xa0\x08\x41\xbe\
-\xc9\x03\xd6\x67\x87\x4d\x1e\xa1\xdf\x06\x8a\x3c\xd8\x83\xbc\x64\
-\x0c\xdb\x21\x12\xb0\x1c\x0f\xb2\x1b\xe4\x3e\x50\x44\x83\x66\xf1\
-\x60\x39\x1c\x54\x8a\x81\x22\x14\x36\xc1\x03\x6b\xb4\x82\xd4\xc0\
-\x8e\xc7\x83\x6d\x18\x81\x46\xfc\x7c\x60\x82\xbe\x08\xea\x26\xd3\
-\xb3\xc8\x47\x07\x00\x01\x34\xe0\x09\x00\x06\x22\x23\x23\x9b\x80\
-\x01\xc4\x02\x6c\x68\x81\xd7\xb4\xc3\xd6\xdc\xc1\x46\xd4\x60\x73\
-\xfd\xb0\x0b\x94\x60\xf5\x34\x2c\xa2\x60\x89\x00\xd6\x68\x03\xf1\
-\x41\x18\x36\x2f\x00\xdb\x6a\x8e\x7e\xb0\x14\xac\x24\x80\xad\x09\
-\x44\x3e\xf5\x1c\x79\x70\x08\x34\x28\x05\x5b\x9d\x0c\x8a\x54\x10\
-\x1b\x66\x2e\x6c\x10\x0b\x36\x4f\x0f\xa2\x41\x25\x12\xac\xa8\x87\
-\xad\x71\x04\xa9\x01\x26\x18\xd0\xb5\xee\xe0\xb5\xfb\xd8\xce\xef\
-\xa7\x37\x00\x08\xa0\x41\x93\x00\x40\x00\xd8\xdf\x95\x01\xd6\x9d\
-\xc1\xa0\x1b\x4b\x81\xbd\x81\x58\xe4\xe5\x59\xb0\x0d\x9b\x30\x36\
-\x6c\x43\x06\x28\x70\x61\x0b\x3e\x90\xef\xee\x81\x15\xb5\x30\xfd\
-\xa0\xb6\x04\xec\xc8\x14\xe4\xab\xde\x91\xc7\x0a\x60\x67\xeb\x81\
-\x72\x2f\x72\xbb\x02\x36\xba\x07\xdb\x81\x04\x1b\xbe\x85\xf5\x40\
-\x60\x9b\x3f\x40\xa5\x02\x6c\xd0\x09\x94\x38\x61\xa5\x0f\x74\x35\
-\xf1\x7c\xd0\x1d\x7e\xa0\x1c\xdf\xd1\xd1\x71\x64\xb0\x84\x39\x40\
-\x00\x0d\xaa\x04\x00\x03\xa0\x7b\xef\x81\xf5\xa9\x1b\xa8\xdb\x08\
-\x2c\x26\xd3\x60\x83\x28\xb0\x79\x75\xd8\xe4\x09\x28\xd2\x61\x87\
-\x28\xc0\x4a\x05\x58\x09\x80\x7c\x49\x05\x2c\xb2\xd1\x4f\x15\x43\
-\x3f\x72\x16\x96\x08\x90\x1b\x94\xc8\x63\x03\xb0\x7d\x80\xb0\xe1\
-\x5f\x58\x23\x14\x79\x04\x11\x76\xbe\x3f\x68\x8c\x03\xda\xc7\x9f\
-\x05\x4c\x0c\x2f\x81\xdd\xbc\x5d\xa0\x15\xd5\x83\x2d\xac\x01\x02\
-\x68\x50\x26\x00\x18\xe8\xe9\xe9\xe1\xbb\x77\xef\x9e\x3f\xb0\xb8\
-\xd5\x03\x35\x16\x81\x91\x5c\x8b\xdc\xf5\x82\x8d\x00\x22\x1f\xea\
-\x00\xdb\xdb\x07\x3b\xc5\x14\xd6\x90\x04\xf5\xe1\x91\x73\x3e\xfa\
-\x39\x41\xc8\x63\x0a\xb0\xf1\x78\xe4\x55\xc1\xb0\xdb\x3a\x40\xb9\
-\x1d\xb6\xaf\x01\xb6\x60\x14\x79\x16\x10\x04\x3e\x7e\xfc\xd8\x0c\
-\xba\xb9\x1b\x74\xf1\x26\xb0\x1b\xbb\x78\x30\x14\xf5\xb8\x00\x40\
-\x00\x0d\xea\x04\x80\x0c\xaa\xaa\xaa\x2c\x40\xd7\x9e\x3c\x78\xf0\
-\xc0\x0b\x74\x90\x35\xb0\xc1\x77\x1f\xd8\x00\x9c\x87\xbc\x8c\x0c\
-\xd6\x1e\x80\x9d\x2e\x82\xdc\x47\x07\x35\x10\x61\x5d\x36\xe4\x43\
-\x1b\x91\x2f\xb9\x86\xe5\x70\xd8\x58\x03\xf2\xd2\x30\xe4\xfb\x0d\
-\x61\x7a\x60\xcb\xc5\x60\x9b\x56\xdf\xbe\x7d\xbb\x56\x52\x52\xf2\
-\x30\xb0\x54\x7a\x39\x75\xea\xd4\x15\x43\x21\x5c\x01\x02\x68\xc8\
-\x24\x00\x74\x90\x9a\x9a\x9a\x06\xcc\x75\x7c\xc0\xfa\x5a\x1c\xd8\
-\x35\x2c\x01\xb5\xae\x61\x8d\x40\xe4\x3e\x3c\xac\xe1\x87\xbc\x5f\
-\x00\xb9\x04\x40\x9e\x29\x84\xe5\x74\x50\x1b\x00\x36\x17\x01\xdb\
-\x97\x08\xeb\x45\xc0\x96\xb9\x41\x5b\xfd\x55\xa0\x81\x1b\xd0\x25\
-\x9b\x16\x16\x16\x75\xd0\x5e\xcd\xf7\xa1\x14\x8e\x00\x01\x34\x64\
-\x13\x00\x0c\x80\x6e\xc3\x02\x56\x11\xc6\xc0\x16\xff\x35\x60\x77\
-\x32\x12\xd8\x73\x50\x00\xd5\xb7\xa0\x53\x4d\x80\x7e\xbb\x0f\xdb\
-\xb2\x0d\x3b\x20\x0a\x36\x75\x8c\xdc\x4e\x40\x9f\xc6\x05\xf5\x3e\
-\x60\xdd\x51\x68\x75\x20\x0b\x2a\x7d\x40\xe3\xf3\xc0\x86\x9e\x1e\
-\x68\x82\x06\x68\xce\x27\x60\xc9\xc0\x47\xea\x56\xac\xc1\x06\x00\
-\x02\x68\xc8\x27\x00\x7c\x03\x4d\xa0\xf6\x03\xa8\x2e\x06\x26\x8e\
-\x5b\x52\x52\x52\x47\x40\xed\x08\x60\x24\x73\x82\x2e\x50\x02\xfa\
-\xfb\x22\xf2\x3c\x00\x30\x87\xeb\x83\x72\x33\xb0\x8a\x78\x07\x1a\
-\x8b\x07\xf6\xd3\xb5\x40\x8d\x50\x60\xb1\xcf\x0a\x4c\x38\x2f\x26\
-\x4d\x9a\xb4\x76\x38\x86\x13\x40\x00\x0d\xdb\x04\x40\x28\x71\x80\
-\xe6\x24\x40\x55\x08\xb0\x58\x67\x05\x25\x02\x50\x9b\xa2\xae\xae\
-\xee\xf6\x48\x0b\x0b\x80\x00\x1a\x91\x09\x60\x14\x20\x00\x40\x00\
-\x31\x8d\x06\xc1\xc8\x06\x00\x01\x34\x9a\x00\x46\x38\x00\x08\xa0\
-\xd1\x04\x30\xc2\x01\x40\x00\x8d\x26\x80\x11\x0e\x00\x02\x68\x34\
-\x01\x8c\x70\x00\x10\x40\xa3\x09\x60\x84\x03\x80\x00\x1a\x4d\x00\
-\x23\x1c\x00\x04\xd0\x68\x02\x18\xe1\x00\x20\xc0\x00\x40\xaa\xfb\
-\x94\x4f\x3f\x62\xc7\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x3f\x09\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
-\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xd9\x01\x1a\
-\x0a\x0f\x3b\xc0\x25\x09\x31\x00\x00\x20\x00\x49\x44\x41\x54\x78\
-\xda\xed\x7d\x79\x70\x5c\xe5\x95\xef\xaf\xf7\xbe\xbd\x2f\x6a\x75\
-\x6b\x97\x6c\x49\x36\xb2\x2d\x5b\xb6\xc7\x36\x60\x0c\xc6\x6c\x31\
-\x21\x0c\x84\xca\x90\x64\x92\x40\xc6\x78\x26\x93\x57\xf3\x48\x05\
-\x32\x6c\x21\x09\x24\x21\x29\x42\x85\xcc\x14\x2f\x03\x99\x0a\x33\
-\x2f\x33\xc0\x4c\x91\x4a\x0c\x13\x08\x50\xb6\x81\x18\x6c\xbc\x21\
-\xd9\x92\x65\x4b\xb2\xd5\xb2\xd6\xee\x96\xd4\x7b\xdf\xde\xfb\xfd\
-\x11\x9f\xef\x9d\xbe\xb4\x6c\x19\x03\x21\x89\x6e\x55\x17\x46\x5b\
-\xf7\xbd\xdf\xf9\xce\xf9\x9d\xdf\xf9\x9d\xf3\xa9\x4a\xa5\x12\x16\
-\xae\x3f\xdf\x4b\xbd\xf0\x08\x16\x0c\x60\xe1\x5a\x30\x80\x85\x6b\
-\xc1\x00\x16\xae\x05\x03\x58\xb8\x16\x0c\x60\xe1\x5a\x30\x80\x85\
-\x6b\xc1\x00\x16\xae\x05\x03\x58\xb8\x16\x0c\x60\xe1\xfa\x33\xb8\
-\xb4\x7f\xca\x37\xf7\xf8\xe3\x8f\xeb\xe2\xf1\x78\x5d\x22\x91\xa8\
-\x97\x65\xd9\x9b\xcd\x66\x6d\xf9\x7c\xde\x54\x28\x14\xb4\x6a\xb5\
-\x3a\x5f\x2a\x95\xb4\x00\xa0\x56\xab\xf3\x7a\xbd\x3e\x66\x34\x1a\
-\x67\x24\x49\x0a\xe8\x74\x3a\xf9\xdb\xdf\xfe\xf6\xb1\x3f\x07\x03\
-\x50\xfd\xa9\xd4\x02\x1e\x7e\xf8\xe1\xe6\x99\x99\x99\x95\xc1\x60\
-\x70\xcd\xec\xec\x6c\x47\x2a\x95\xf2\x66\x32\x19\x5b\x36\x9b\xed\
-\x2c\x95\x4a\xd0\x68\x34\x50\xa9\x54\x50\xab\xd5\x50\xa9\x54\xc8\
-\xe7\xf3\x50\xab\xd5\x50\xab\xd5\x28\x95\x4a\x28\x16\x8b\x28\x16\
-\x8b\x38\x63\x10\x83\x7a\xbd\x3e\xa6\x52\xa9\x72\x66\xb3\x39\x50\
-\x5d\x5d\x7d\xa8\xba\xba\xfa\x90\xdb\xed\x3e\x72\xff\xfd\xf7\x8f\
-\x2d\x18\xc0\xc7\x64\xc1\xc7\xc7\xc7\x37\x8f\x8d\x8d\x6d\x8e\xc5\
-\x62\x2d\xb2\x2c\xbb\x32\x99\x4c\x87\x4a\xa5\x82\xc1\x60\x40\x2e\
-\x97\x43\xa9\x54\x82\x4a\xa5\x82\x4a\xa5\x42\xa9\x54\x42\x2e\x97\
-\x43\x2e\x97\x43\xb1\x58\x84\x4e\xa7\xfb\xfd\x03\x50\xa9\xc4\xdf\
-\x2c\x95\x4a\xe2\xa5\x56\xab\xa1\xd7\xeb\x61\x30\x18\xa0\x52\xa9\
-\xe8\xef\xf9\xcd\x66\xf3\x98\xcd\x66\x1b\xae\xad\xad\xdd\xb3\x68\
-\xd1\xa2\x1d\xf7\xde\x7b\x6f\x60\xc1\x00\x3e\xa2\xeb\x5b\xdf\xfa\
-\x56\xc7\xd0\xd0\xd0\xa7\xa7\xa6\xa6\x36\x4c\x4f\x4f\x77\xea\xf5\
-\xfa\xfa\x52\xa9\x84\x4c\x26\x03\x5a\xf8\x52\xa9\x04\x59\x96\xc5\
-\x8e\xd7\x6a\xb5\xd0\xeb\xf5\x30\x1a\x8d\x30\x99\x4c\x30\x99\x4c\
-\x30\x1a\x8d\xc8\xe5\x72\xff\xff\x21\x9c\x31\x82\x62\xb1\x88\x5c\
-\x2e\x87\x7c\x3e\x8f\x44\x22\x01\x59\x96\x91\x4c\x26\x91\xcb\xe5\
-\xa0\xd1\x68\xa0\xd5\x6a\xa1\xd5\x6a\xa1\x52\xa9\xa0\xd1\x68\x50\
-\x28\x14\x8e\xd9\x6c\x36\x7f\x6b\x6b\xeb\xf3\xad\xad\xad\xbf\xbc\
-\xfb\xee\xbb\x63\x0b\x06\xf0\x21\x5c\x7f\xf7\x77\x7f\x77\xfb\xe0\
-\xe0\xe0\x2d\xb1\x58\xac\xb9\x54\x2a\x75\x00\x40\x2e\x97\x13\x2e\
-\xbd\x54\x2a\x09\x97\x6e\xb5\x5a\x61\xb3\xd9\x50\x53\x53\x03\x83\
-\xc1\x20\x16\x5c\xad\x56\xa3\x50\x28\x20\x9f\xcf\xa3\x50\x28\x40\
-\xaf\xd7\x8b\x5d\xaf\x56\xab\x85\xc1\x28\x8d\x22\x97\xcb\x21\x16\
-\x8b\x61\x66\x66\x06\xd3\xd3\xd3\x88\x44\x22\x48\x26\x93\xc8\x66\
-\xb3\x90\x24\x09\x7a\xbd\x1e\xf9\x7c\x1e\x2a\x95\xca\xef\xf3\xf9\
-\xf6\x75\x74\x74\x3c\xfd\xd8\x63\x8f\xbd\xba\x60\x00\x17\x78\xfd\
-\xe0\x07\x3f\xf0\xf6\xf6\xf6\x6e\x1f\x1c\x1c\xbc\x25\x97\xcb\xd9\
-\x34\x1a\x4d\x73\x36\x9b\x45\x3e\x9f\x17\xee\xbb\x54\x2a\x41\x92\
-\x24\x78\x3c\x1e\x54\x57\x57\xc3\x6e\xb7\xc3\x68\x34\x42\xa7\xd3\
-\x21\x1a\x8d\x22\x93\xc9\x20\x91\x48\x20\x1e\x8f\x23\x9d\x4e\x23\
-\x9f\xcf\x8b\xb0\x40\x21\x82\xee\x9f\x76\xb8\x5e\xaf\x87\x46\xa3\
-\x81\xd9\x6c\x86\xc1\x60\x80\xd9\x6c\x86\xcd\x66\x83\xc5\x62\x81\
-\x56\xab\x45\x26\x93\x41\x2a\x95\x82\xdf\xef\xc7\xe4\xe4\x24\x66\
-\x66\x66\xa0\x52\xa9\xa0\xd3\xe9\x70\x06\x6b\x0c\x1a\x0c\x86\x58\
-\x6b\x6b\xeb\x2f\x5b\x5b\x5b\x9f\x7f\xf0\xc1\x07\x07\x17\x0c\xe0\
-\x3c\xae\xef\x7f\xff\xfb\xf5\x3d\x3d\x3d\x7f\xef\xf7\xfb\xaf\x2f\
-\x14\x0a\x9d\xf9\x7c\x1e\xc5\x62\x11\x6a\xb5\x1a\x5a\xad\x16\x6a\
-\xf5\xef\x33\x57\xa7\xd3\x09\x9f\xcf\x87\xaa\xaa\x2a\x94\x4a\x25\
-\x24\x93\x49\xc8\xb2\x8c\x44\x22\x81\x44\x22\x81\x62\xb1\x08\x8d\
-\x46\x23\x76\xb7\x4e\xa7\x83\xc1\x60\x80\x5e\xaf\x17\xe0\x8f\x2e\
-\x72\xfd\x99\x4c\x06\x64\x64\xef\xc9\x97\xd5\x6a\x98\x4c\x26\xd8\
-\x6c\x36\x98\xcd\x66\xf1\xbe\x91\x48\x04\x7e\xbf\x1f\x63\x63\x63\
-\x48\x26\x93\x65\x9f\x53\xa5\x52\x0d\xd6\xd5\xd5\xed\x5e\xbd\x7a\
-\xf5\x8f\xbe\xf5\xad\x6f\x0d\x2e\x18\xc0\x59\xae\xc7\x1e\x7b\x4c\
-\xda\xbb\x77\xef\x23\xc3\xc3\xc3\x5b\x01\xb4\x91\xcb\x2e\x16\x8b\
-\xc2\x1d\x4b\x92\x84\xba\xba\x3a\xd4\xd5\xd5\x41\xaf\xd7\x23\x1c\
-\x0e\x23\x1a\x8d\xa2\x50\x28\xa0\x50\x28\x20\x93\xc9\xa0\x54\x2a\
-\xc1\x60\x30\xc0\x6a\xb5\xc2\x6a\xb5\xc2\xe5\x72\xc1\xe1\x70\x88\
-\x85\x33\x18\x0c\x02\xe0\x71\x03\xe0\xde\x42\x96\x65\x84\xc3\x61\
-\x44\x22\x11\x44\x22\x11\x64\x32\x19\x11\x16\x34\x1a\x0d\x34\x1a\
-\x0d\x64\x59\x86\xd9\x6c\x86\xcf\xe7\x43\x75\x75\x35\xf2\xf9\x3c\
-\x86\x87\x87\x31\x38\x38\x88\x50\x28\x24\x8c\xad\x58\x2c\xa2\x50\
-\x28\x8c\xd5\xd6\xd6\xee\xe9\xea\xea\xfa\xd1\xf7\xbe\xf7\xbd\x43\
-\x0b\x06\xa0\xb8\xb6\x6f\xdf\xbe\xfd\xd8\xb1\x63\xb7\xcb\xb2\xbc\
-\x41\xad\x56\x0b\x57\x4d\xf1\xd9\x6e\xb7\xa3\xa1\xa1\x01\x2e\x97\
-\x0b\xa9\x54\x0a\xd3\xd3\xd3\xc8\xe7\xf3\x70\x38\x1c\x90\x24\x09\
-\xd9\x6c\x16\xe9\x74\x1a\x66\xb3\x19\xb5\xb5\xb5\xf0\x78\x3c\x70\
-\x3a\x9d\x30\x9b\xcd\xb0\x58\x2c\xd0\xeb\xf5\x65\x29\x20\x81\x43\
-\x32\x1c\xfa\x1e\x00\x81\x13\x52\xa9\x14\xd2\xe9\x34\xa2\xd1\x28\
-\x82\xc1\x20\xc6\xc7\xc7\x31\x3d\x3d\x8d\x52\xa9\x54\x06\x24\xc3\
-\xe1\x30\x64\x59\x86\xcf\xe7\x43\x73\x73\x33\x0a\x85\x02\xc6\xc7\
-\xc7\xd1\xd7\xd7\x87\x58\x2c\x26\x7e\xfe\x4c\x9a\xe9\x6f\x6e\x6e\
-\xfe\xcd\x8a\x15\x2b\x9e\x7a\xe8\xa1\x87\x8e\xfc\xd9\x1b\xc0\x37\
-\xbf\xf9\xcd\xce\x43\x87\x0e\xdd\x3b\x39\x39\xb9\x41\xad\x56\x37\
-\xab\xd5\xea\x32\x74\x6e\xb7\xdb\x51\x57\x57\x07\x97\xcb\x85\x64\
-\x32\x89\x50\x28\x04\x95\x4a\x05\x87\xc3\x01\x97\xcb\x85\x74\x3a\
-\x8d\x62\xb1\x08\xbb\xdd\x8e\x9a\x9a\x1a\x54\x57\x57\xc3\x6c\x36\
-\x8b\x58\x4e\x0b\xab\xd1\x68\x04\x66\xe0\x8b\xad\xd1\x68\x44\x7a\
-\xc8\x0d\x81\x78\x01\xf2\x3c\xf9\x7c\x1e\x99\x4c\x06\xd3\xd3\xd3\
-\xf0\xfb\xfd\x18\x1f\x1f\x47\xa9\x54\x82\xc3\xe1\x80\x4e\xa7\xc3\
-\xcc\xcc\x0c\x26\x26\x26\x00\x00\x0d\x0d\x0d\xa8\xaf\xaf\x87\x56\
-\xab\xc5\x89\x13\x27\x70\xfc\xf8\x71\x24\x93\x49\x81\x2d\xce\x7c\
-\x86\xc1\x45\x8b\x16\xed\xf8\xef\xff\xfe\xef\xbb\xff\x6c\x0d\x60\
-\xfb\xf6\xed\xdb\xfb\xfa\xfa\x6e\x4f\x24\x12\x1b\x74\x3a\x1d\x92\
-\xc9\x24\xb4\x5a\x2d\x6c\x36\x1b\x72\xb9\x1c\x9a\x9a\x9a\x60\xb3\
-\xd9\x90\xcf\xe7\x05\xd0\xaa\xad\xad\x85\xc3\xe1\x40\xa1\x50\x40\
-\x2e\x97\x83\x24\x49\xb0\xdb\xed\x70\xb9\x5c\x30\x9b\xcd\x65\xf1\
-\x9d\x73\x00\xb4\xb0\x3a\x9d\x0e\x3a\x9d\x0e\x5a\xad\x56\xe0\x03\
-\x8a\xff\xd9\x6c\x56\x18\x42\xa1\x50\x10\xe0\xb0\x58\x2c\xa2\x54\
-\x2a\x89\xdf\x21\x6f\x73\xe2\xc4\x09\x84\x42\x21\x14\x0a\x05\x78\
-\x3c\x1e\xe8\x74\x3a\x04\x02\x01\x04\x02\x01\xe4\x72\x39\x78\xbd\
-\x5e\xf8\x7c\x3e\x68\x34\x1a\x1c\x3d\x7a\x14\xfd\xfd\xfd\xd0\xeb\
-\xf5\xb0\xd9\x6c\x48\xa5\x52\x90\x24\xe9\x50\xa9\x54\xd2\x75\x75\
-\x75\xfd\xe8\xa7\x3f\xfd\xe9\x2f\xfe\xac\x0c\xe0\x86\x1b\x6e\xf8\
-\xf9\xe4\xe4\xe4\xc6\x4c\x26\xd3\xa6\xd1\x68\xa0\xd7\xeb\x45\x5a\
-\xe7\xf5\x7a\x51\x53\x53\x03\x00\x08\x04\x02\xc8\xe7\xf3\xa8\xa9\
-\xa9\x11\xa0\xab\x58\x2c\x42\xaf\xd7\xc3\xed\x76\x97\xb9\x78\xda\
-\xa5\x1c\x30\xd2\x22\x03\x80\x56\xab\x15\xae\x5b\xab\xd5\x8a\x1d\
-\xae\x52\xa9\x04\x06\x90\x65\x19\x99\x4c\x46\x18\x01\xed\xfe\x33\
-\x69\x1e\xf4\x7a\xbd\xe0\x01\x0c\x06\x03\x22\x91\x08\xc6\xc6\xc6\
-\x10\x08\xfc\x9e\x0b\x32\x99\x4c\x28\x14\x0a\x88\xc5\x62\x88\x44\
-\x22\x28\x14\x0a\x68\x6c\x6c\x44\x5d\x5d\x1d\x46\x46\x46\xd0\xdd\
-\xdd\x8d\x68\x34\x2a\x32\x06\xbd\x5e\x0f\xbd\x5e\x7f\xa8\xa6\xa6\
-\x66\xdf\xaa\x55\xab\x7e\xf2\x87\xc8\x18\x3e\x52\x03\xb8\xff\xfe\
-\xfb\xd7\xfc\xee\x77\xbf\x7b\x3c\x99\x4c\x7a\x8b\xc5\x62\x1b\x2d\
-\x4e\xb1\x58\x84\xc5\x62\x81\xd7\xeb\x85\xd1\x68\x44\x22\x91\x40\
-\x34\x1a\x45\x53\x53\x13\xaa\xab\xab\x91\xcb\xe5\x20\xcb\x32\x8c\
-\x46\x23\xec\x76\x3b\x24\x49\x82\xcd\x66\x2b\x63\xf0\x2a\x65\x0b\
-\xb4\x60\x00\xa0\xd3\xe9\x04\x08\x24\x2a\x98\xc2\x80\x5a\xad\x46\
-\x36\x9b\x45\x32\x99\x14\x61\x25\x9d\x4e\x0b\xe3\x20\xf6\x90\xf3\
-\x03\x3a\x9d\x0e\x92\x24\xa1\x54\x2a\x21\x1c\x0e\x63\x7a\x7a\x1a\
-\xb2\x2c\x8b\x9f\xcb\x64\x32\x48\xa7\xd3\x08\x85\x42\x30\x9b\xcd\
-\x68\x6f\x6f\x47\x2e\x97\xc3\xd1\xa3\x47\x31\x31\x31\x21\x00\x62\
-\x3e\x9f\x87\xc7\xe3\x41\x3a\x9d\xde\xb7\x6e\xdd\xba\x87\x7f\xfc\
-\xe3\x1f\xbf\xf4\x27\x69\x00\x77\xde\x79\xe7\x8d\x6f\xbc\xf1\xc6\
-\xe3\x5a\xad\xb6\x99\x76\x98\xc1\x60\x40\x36\x9b\x85\xdd\x6e\x47\
-\x63\x63\x23\x32\x99\x0c\x66\x67\x67\x61\xb1\x58\x50\x57\x57\x27\
-\x76\x2f\xed\x16\xab\xd5\x0a\xb3\xd9\x0c\x9d\x4e\x27\x76\x29\xe3\
-\xef\xcb\x50\xba\x5a\xad\x86\xc1\x60\x10\x3b\x96\x16\x8c\xd0\x3f\
-\xc5\x63\x5a\x54\xa5\x01\xd0\xa2\x53\xb8\x21\x8f\x41\xef\x43\xec\
-\x23\x19\x59\x26\x93\x41\x38\x1c\x46\x32\x99\x44\xa1\x50\x80\xd9\
-\x6c\x46\x2a\x95\x42\x26\x93\x41\x30\x18\x44\x2a\x95\x42\x47\x47\
-\x07\xdc\x6e\x37\x4e\x9c\x38\x81\x9e\x9e\x1e\x71\xff\x6a\xb5\x1a\
-\x16\x8b\x05\x1e\x8f\xe7\xa9\x6c\x36\x6b\x7b\xe9\xa5\x97\x3e\xfb\
-\x27\x65\x00\x9f\xfd\xec\x67\x1f\xea\xef\xef\xbf\x5d\x92\xa4\xfa\
-\x58\x2c\x06\x49\x92\xc4\x6e\xad\xad\xad\x85\xcd\x66\xc3\xcc\xcc\
-\x0c\x8a\xc5\x22\xbc\x5e\x2f\xec\x76\xbb\x88\xbd\xa5\x52\x09\x3a\
-\x9d\x0e\x16\x8b\x05\x26\x93\x49\xb0\x73\x04\xec\x68\x47\xf2\xac\
-\x41\xab\xd5\x0a\x42\x88\x8c\x41\xab\xd5\x0a\x03\x20\x60\x48\xef\
-\x51\x2c\x16\x45\x6c\xcf\x66\xb3\xc2\xb0\xf2\xf9\x7c\x19\x36\x50\
-\xd6\x0c\xb4\x5a\xad\xf8\x7d\x83\xc1\x00\x9d\x4e\x87\x44\x22\x81\
-\xe9\xe9\x69\xc4\xe3\x71\x41\x3f\x97\x4a\x25\x4c\x4f\x4f\x63\x7a\
-\x7a\x1a\x0e\x87\x03\x8b\x17\x2f\xc6\xec\xec\x2c\xde\x79\xe7\x9d\
-\x32\xd0\x6b\xb3\xd9\x50\x5f\x5f\xff\x88\x56\xab\x95\xdb\xdb\xdb\
-\x9f\xfb\x28\xb8\x83\x0f\xdd\x00\xae\xbf\xfe\xfa\xff\x3b\x36\x36\
-\xb6\x59\xa7\xd3\xd5\xa7\xd3\x69\x91\x3e\x19\x0c\x06\x81\x96\xa7\
-\xa7\xa7\xa1\xd3\xe9\xd0\xd0\xd0\x00\x9b\xcd\x86\x6c\x36\x2b\xe2\
-\x39\x2d\xbe\xd1\x68\x2c\x5b\xe4\x6c\x36\x5b\xb6\x23\x09\xf4\xe9\
-\x74\x3a\xb1\x2b\x39\x16\x20\x00\x48\x20\x90\x7e\x87\xf3\xff\xfc\
-\xc5\xbf\x46\xa0\x90\x7e\x9e\xde\x8b\x9e\x1d\x7d\x06\x6e\x1c\xb3\
-\xb3\xb3\xe2\x67\xc9\xdb\xa4\x52\x29\xc4\xe3\x71\xe4\x72\x39\x2c\
-\x5d\xba\x14\xb9\x5c\x0e\xfb\xf7\xef\x17\x46\x57\x28\x14\xe0\x72\
-\xb9\xe0\xf5\x7a\x91\x48\x24\x9e\xfb\x28\x68\xe5\x0f\xd5\x00\x3e\
-\xf1\x89\x4f\x3c\x3b\x31\x31\xb1\xd1\x60\x30\xd4\x93\xa5\x6b\xb5\
-\x5a\xe8\x74\x3a\x78\xbd\x5e\xe1\x76\xed\x76\x3b\x9a\x9a\x9a\xa0\
-\x56\xab\x11\x8d\x46\x45\xec\xd5\xe9\x74\x30\x1a\x8d\x62\xd7\x72\
-\x97\x4d\x0f\xbb\x12\x63\xa7\xd1\x68\x04\xe1\x43\x06\xc1\x59\x41\
-\x5e\xd4\xa1\x5d\x4e\x18\x82\x5c\x3e\xf1\x01\xf4\x3d\x5a\x58\x7a\
-\x6f\x6e\x00\xfc\xb3\x50\x08\xca\xe7\xf3\x08\x85\x42\xc8\xe5\x72\
-\x30\x99\x4c\x02\x7b\xa4\x52\x29\xcc\xce\xce\x22\x95\x4a\xe1\xa2\
-\x8b\x2e\x42\xa9\x54\xc2\xfe\xfd\xfb\x05\xce\x21\xe3\x5d\xb5\x6a\
-\x15\x42\xa1\xd0\x53\x35\x35\x35\x7b\x3e\xcc\x2c\xe1\x43\x33\x80\
-\x6b\xae\xb9\xe6\xd7\xb3\xb3\xb3\x1d\xf9\x7c\xbe\x4d\xa3\xd1\x20\
-\x97\xcb\x41\xa7\xd3\x09\xbe\x3e\x9b\xcd\x02\x00\xdc\x6e\x37\xaa\
-\xaa\xaa\x84\x1b\xa6\xdd\x07\x00\x16\x8b\x05\x92\x24\x41\xa5\x52\
-\x09\x17\xac\x7c\xf0\xca\x92\x2e\x67\x0d\xf9\x62\x93\x47\xa0\xdd\
-\xea\x70\x38\xc4\x7b\x66\x32\x19\x61\x00\x94\x12\xf2\x10\xc0\xdf\
-\xfb\x6c\xc6\xc7\x2f\x62\x0b\x93\xc9\xa4\xa8\x5f\x10\x26\x01\x80\
-\x70\x38\x8c\x89\x89\x09\x2c\x5b\xb6\x0c\x56\xab\x15\x6f\xbd\xf5\
-\x16\xe2\xf1\xb8\xf8\x7d\xa3\xd1\x88\xf5\xeb\xd7\x43\x96\xe5\xff\
-\x55\x2c\x16\xb5\x3f\xff\xf9\xcf\x7f\xf2\x47\x63\x00\x9b\x37\x6f\
-\x7e\x25\x99\x4c\xd6\x17\x8b\xc5\x0e\x5a\x4c\xa2\x46\xc9\x05\xab\
-\xd5\x6a\xb8\xdd\x6e\xd8\x6c\x36\x50\x49\x97\xc7\x5a\x8d\x46\x53\
-\x06\xda\x38\x0a\xe7\x9f\x99\x2f\x3e\xff\x7f\xda\x89\xe4\x71\x78\
-\x5a\x48\x9e\xa0\x54\x2a\x95\x81\x49\xca\x26\xc8\x08\xf9\xf7\xb8\
-\xae\x60\x3e\x57\xb1\x58\x84\xc9\x64\x12\x74\x32\xdd\x0b\x15\xb0\
-\x88\xb6\x1e\x19\x19\x41\x5d\x5d\x1d\xea\xeb\xeb\xb1\x7b\xf7\x6e\
-\xa4\xd3\x69\xe8\x74\x3a\xc8\xb2\x0c\xb7\xdb\x8d\x8d\x1b\x37\x22\
-\x99\x4c\xfe\xa5\x2c\xcb\xde\xa7\x9e\x7a\xea\xa9\x8f\xbd\x01\x6c\
-\xd9\xb2\xe5\x37\xd1\x68\xb4\x2d\x9d\x4e\xb7\xe9\xf5\x7a\x14\x0a\
-\x05\x68\x34\x1a\xd8\x6c\x36\x41\xbc\x18\x0c\x06\x38\x9d\x4e\x38\
-\x1c\x0e\x11\x1b\x79\x41\x86\x50\x31\x81\x38\x1e\x77\xe7\x5a\x04\
-\xa5\x21\xf0\x32\x2f\x2d\x3e\x37\x00\xbe\x50\x1c\x70\x52\xcc\xe7\
-\x6e\xbf\x12\xd8\x54\xbe\x9f\xf2\xca\xe5\x72\xb0\xd9\x6c\x90\x65\
-\x59\x00\x5c\xda\x00\x04\x0e\xb3\xd9\xac\x30\x90\xfa\xfa\x7a\x98\
-\x4c\x26\x1c\x3a\x74\x08\x89\x44\x42\x90\x4e\x76\xbb\x1d\x37\xdd\
-\x74\x13\x8e\x1d\x3b\x76\xb7\x4a\xa5\xc2\xbf\xfd\xdb\xbf\xfd\xe8\
-\x63\x6b\x00\x57\x5e\x79\xe5\x2b\xe1\x70\xb8\xbd\x54\x2a\x35\xd3\
-\x42\xa9\xd5\x6a\x18\x8d\x46\x18\x8d\x46\x51\x87\x77\x3a\x9d\x70\
-\xb9\x5c\xc8\xe7\xf3\x90\x65\x59\xb8\xdf\x54\x2a\x85\x42\xa1\x00\
-\xa3\xd1\x28\x0c\x46\x89\xf0\xb9\xfb\x3d\xdb\x22\x28\xd3\x36\xfa\
-\x37\x4f\x17\x39\xd3\x47\x00\x8f\x7b\x03\x4e\x1f\x2b\x95\x43\xe7\
-\x32\x00\x4e\x5a\xa5\xd3\x69\x04\x83\x41\xa8\x54\x2a\x38\x9d\x4e\
-\x11\x92\xc8\xc0\x83\xc1\x20\x82\xc1\x20\x56\xac\x58\x81\x5c\x2e\
-\x87\x9e\x9e\x1e\xc1\x25\x14\x8b\x45\xf8\x7c\x3e\x7c\xee\x73\x9f\
-\xc3\xeb\xaf\xbf\x7e\x9f\xc9\x64\x9a\x7a\xf2\xc9\x27\x9f\xfe\xd8\
-\x19\xc0\x27\x3f\xf9\xc9\xff\x3b\x31\x31\x71\x59\x2e\x97\x6b\xa6\
-\x1b\x24\xb4\x6f\x30\x18\x44\xde\x5f\x55\x55\x25\xe2\xaf\x2c\xcb\
-\x62\xd7\xcd\xce\xce\x42\x96\x65\x58\xad\x56\x38\x9d\x4e\xb1\x40\
-\xca\x45\x38\xd7\x0e\x3c\x57\x8c\x3e\x5b\x1c\xaf\xf4\x3b\xf3\x31\
-\xb6\x4a\x97\x56\xab\x45\x2a\x95\x82\xd1\x68\x14\x8b\x9c\x48\x24\
-\x04\x97\x41\xdc\x06\x19\x41\x3c\x1e\xc7\xf4\xf4\x34\x5a\x5a\x5a\
-\x90\xcd\x66\xf1\xee\xbb\xef\x96\x15\xba\xd6\xac\x59\x83\xad\x5b\
-\xb7\xe2\xf9\xe7\x9f\x7f\xc2\x66\xb3\xf9\xff\xfd\xdf\xff\xfd\x03\
-\xf1\x04\x9a\x6f\x7f\xfb\xdb\x17\xfc\x47\xbe\xf0\x85\x2f\xdc\x3b\
-\x39\x39\x79\x49\x32\x99\x5c\x6e\xb5\x5a\x05\xc0\x23\x14\x4e\x0b\
-\xe6\x76\xbb\xe1\xf1\x78\xa0\xd1\x68\x04\x38\x2a\x16\x8b\x48\x26\
-\x93\x88\x44\x22\x50\xa9\x54\xb0\xd9\x6c\xd0\x6a\xb5\xc2\x15\x53\
-\x0a\x46\xae\x9a\xc7\xe5\x4a\xaf\xb9\xbe\xcf\xbf\x4e\xff\xe6\xef\
-\x41\xff\xcf\x43\xc2\x5c\xef\x31\x9f\x17\x15\x97\x08\x50\xd2\x22\
-\xc7\xe3\x71\x01\x08\xf3\xf9\xbc\xe0\x2b\x24\x49\x42\x3a\x9d\xc6\
-\xe4\xe4\x24\xbc\x5e\x2f\x0c\x06\x03\x02\x81\x80\xc0\x12\x27\x4e\
-\x9c\x80\xcb\xe5\xc2\xd5\x57\x5f\xbd\x6e\xcf\x9e\x3d\xf1\xee\xee\
-\xee\xc8\xb5\xd7\x5e\x7b\xf2\x42\xd7\xee\x82\x65\xe1\x0f\x3c\xf0\
-\xc0\x9a\x58\x2c\xd6\x3c\x33\x33\xb3\x81\x16\x8e\x6b\xe8\x28\x0f\
-\x76\x3a\x9d\xef\x59\x7c\xd2\xde\xc5\x62\x31\xc1\xa5\x73\x96\xad\
-\x52\x7c\x9f\xef\x8e\x3c\x97\x97\x20\x3c\xc2\x81\x25\x2d\x3c\xc7\
-\x08\x67\xf3\x0e\xe7\x02\x81\x54\xe3\xa0\x2c\x80\x88\xa2\xd9\xd9\
-\x59\x00\x80\xc3\xe1\x10\xfa\xc5\x52\xa9\x24\x68\x6f\xbf\xdf\x8f\
-\xb6\xb6\x36\xc4\x62\x31\xcc\xce\xce\x22\x9f\xcf\xc3\xe9\x74\x62\
-\xe7\xce\x9d\xe8\xe8\xe8\xc0\x0d\x37\xdc\xf0\xe9\xd7\x5f\x7f\x7d\
-\x0c\xc0\x05\x73\x04\x17\xd4\x18\xf2\xe0\x83\x0f\x76\xf6\xf4\xf4\
-\x7c\xf5\xf4\xe9\xd3\xdb\xb5\x5a\xad\x50\xe3\x52\x65\xee\x8c\x70\
-\x12\x7a\xbd\x1e\xd5\xd5\xd5\xb0\x58\x2c\xc8\x66\xb3\x22\xee\x93\
-\x01\xa4\x52\x29\x01\xd2\x28\x6b\xe0\x0a\x5d\xe5\x0e\xe6\xe8\x7d\
-\xae\x97\x12\xdc\xf1\x05\x26\xc0\x59\x29\xde\xf3\xda\x82\xf2\xef\
-\xcc\xc7\x03\xf1\x9f\x27\xb2\x8a\x24\x68\x04\xfe\x62\xb1\x18\xe2\
-\xf1\x38\xc2\xe1\x30\x72\xb9\x1c\x12\x89\x04\x2c\x16\x0b\x2c\x16\
-\x8b\x10\x97\x8c\x8e\x8e\xa2\xa5\xa5\x45\xa4\x8d\x84\x91\x7e\xfd\
-\xeb\x5f\x63\xd9\xb2\x65\x68\x6b\x6b\x7b\x6e\xeb\xd6\xad\xcf\xfe\
-\x41\x0d\xa0\xaf\xaf\xef\xcb\xc5\x62\xf1\xf6\x4c\x26\x23\x76\x3b\
-\x27\x5d\x54\x2a\x15\x8c\x46\x23\x6a\x6b\x6b\x61\xb5\x5a\x91\xcb\
-\xe5\x10\x8d\x46\xc5\x02\x84\x42\x21\x24\x93\x49\x18\x0c\x06\xb1\
-\xf8\x9c\x8c\xe1\x2f\x25\x4b\x47\xae\x95\x44\x1c\x9c\xaa\xa5\x6c\
-\x82\x72\x71\x5a\x4c\xca\xe9\xd3\xe9\xb4\x88\xd3\x85\x42\x01\xe1\
-\x70\x18\xa7\x4e\x9d\x12\xa9\x28\xff\x1c\xfc\x7d\xf9\xc2\x57\x32\
-\x3a\xfe\xb3\xfc\x3e\x88\x4e\x26\x60\xca\x3d\x01\xb1\x9a\xc1\x60\
-\x50\xa8\x97\x7d\x3e\x1f\x12\x89\x04\x22\x91\x08\xac\x56\x6b\x59\
-\x5a\xdb\xd7\xd7\x87\x77\xdf\x7d\x17\x97\x5f\x7e\xf9\x5e\x9f\xcf\
-\xb7\xef\x6f\xfe\xe6\x6f\xbe\xfa\x07\xc1\x00\x7f\xfb\xb7\x7f\x7b\
-\x7b\xb1\x58\xd4\x0d\x0f\x0f\x6f\x26\x0b\xa5\x85\x94\x24\x49\xa4\
-\x51\x24\xd6\xd4\xeb\xf5\x98\x9d\x9d\x15\x0f\x71\x66\x66\x06\xa9\
-\x54\x4a\x70\xfd\x1c\xad\x2b\x39\xf7\x4a\x2f\xb5\x5a\x8d\x4c\x26\
-\x23\xc2\x05\xed\x38\x52\x07\x13\x08\xe3\x20\x8b\x58\x36\x9d\x4e\
-\x87\x78\x3c\x8e\x53\xa7\x4e\xe1\xc0\x81\x03\x38\x79\xf2\xa4\x90\
-\x8d\x11\x60\x3d\xdb\x7b\x73\x6f\x32\xd7\xd7\xb9\x27\xe0\x61\x81\
-\x97\x97\xe9\xff\x6d\x36\x9b\x30\xa0\xaa\xaa\x2a\xa4\xd3\x69\x14\
-\x0a\x05\x4c\x4f\x4f\x97\x89\x57\x29\x93\x3a\x7d\xfa\x34\xae\xbb\
-\xee\x3a\xd8\xed\xf6\xeb\xde\x7a\xeb\x2d\xf9\xd8\xb1\x63\xa7\xaf\
-\xba\xea\xaa\xb1\x8f\x0c\x03\x7c\xfb\xdb\xdf\xee\x88\x46\xa3\x6d\
-\xf9\x7c\xfe\xde\x68\x34\x0a\x87\xc3\x21\x00\x0d\xe7\xc9\x25\x49\
-\x82\xd3\xe9\x84\xd1\x68\x14\x12\xab\x42\xa1\x80\x64\x32\x29\x84\
-\x9b\x94\xa3\x2b\x5d\xf0\xb9\x62\x2e\x79\x1b\xf2\x00\x54\x9c\xa1\
-\xef\x65\x32\x19\xe8\x74\x3a\x01\x32\x6b\x6b\x6b\x31\x39\x39\x89\
-\xf1\xf1\x71\x0c\x0c\x0c\x20\x97\xcb\xa1\xba\xba\x1a\xdb\xb6\x6d\
-\xc3\xd6\xad\x5b\x01\x00\x4f\x3f\xfd\xb4\xa8\xd7\xcf\x27\xc6\xcf\
-\xf5\xb9\x2a\xe1\x15\x5a\x70\x02\xc7\x14\xc6\xc2\xe1\xb0\x00\xbe\
-\xf1\x78\x1c\x4e\xa7\x53\xe8\x0a\xc2\xe1\xb0\xb8\x27\xda\x2c\x92\
-\x24\x61\x60\x60\x00\xaf\xbc\xf2\x0a\x6e\xb8\xe1\x06\xac\x5f\xbf\
-\xfe\xd3\x87\x0e\x1d\x4a\x01\xd8\xf7\x91\x85\x80\xa3\x47\x8f\x6e\
-\xaf\xae\xae\xbe\xd7\xef\xf7\x8b\x0f\x48\xbb\x4b\xab\xd5\x42\x96\
-\x65\xa8\xd5\x6a\xb8\x5c\x2e\x81\xe8\x63\xb1\x98\xd8\x95\x33\x33\
-\x33\xc2\xad\x51\xe8\xe0\xf1\x78\x3e\x08\x3c\x9b\xcd\x8a\x72\x2b\
-\x81\xb6\x74\x3a\x2d\x3c\x02\xe7\xfe\x53\xa9\x14\x5e\x7d\xf5\x55\
-\xec\xdd\xbb\x17\xc7\x8f\x1f\xc7\x0d\x37\xdc\x80\x27\x9f\x7c\x12\
-\x7b\xf6\xec\xc1\x13\x4f\x3c\x81\xeb\xae\xbb\x0e\x35\x35\x35\x42\
-\x10\xc2\xc3\xca\x5c\xaf\xb9\x3c\xc3\x5c\x7c\x80\xb2\x7c\xcd\xe5\
-\x69\xa4\x71\x54\xab\xd5\x98\x98\x98\x10\xa5\x6c\x8f\xc7\x23\xea\
-\x20\x7a\xbd\x5e\x64\x57\x1e\x8f\x07\x2f\xbe\xf8\x22\x92\xc9\x24\
-\x36\x6e\xdc\x08\xab\xd5\x3a\xf6\xc5\x2f\x7e\xf1\xde\x8f\xc4\x03\
-\x6c\xdb\xb6\xed\xab\x4e\xa7\x73\x30\x91\x48\x60\x6a\x6a\x0a\x4e\
-\xa7\x13\xc5\x62\x11\x46\xa3\x51\xdc\x44\x3e\x9f\x87\xdd\x6e\x17\
-\xf1\x8b\xba\x6b\x8a\xc5\x22\x12\x89\x04\x32\x99\x4c\x59\x63\x06\
-\x3d\x50\xe2\xfc\xe7\x42\xf0\xfc\x6b\xe4\x6d\x48\xc0\xc9\x95\xbe\
-\x99\x4c\x06\xc9\x64\x12\x81\x40\x00\xc3\xc3\xc3\xb0\xd9\x6c\xe8\
-\xe8\xe8\xc0\xcd\x37\xdf\x8c\x6b\xaf\xbd\x16\xcb\x96\x2d\x13\x69\
-\x1a\xed\x48\x02\x85\x06\x83\xe1\x3d\x59\xc8\xd9\xf8\x86\xb3\x7d\
-\x5f\x59\x39\xe4\x06\x40\x5f\xa3\xf0\x44\xe5\xe4\x74\x3a\x8d\x74\
-\x3a\x8d\x52\xa9\x04\xab\xd5\x8a\x70\x38\x2c\xc2\x2b\x29\x97\x8c\
-\x46\x23\xa6\xa7\xa7\xb1\x6b\xd7\x2e\xdc\x72\xcb\x2d\xd8\xb0\x61\
-\xc3\xbd\xbf\xfe\xf5\xaf\x77\x3f\xf6\xd8\x63\x8f\x7f\xfd\xeb\x5f\
-\x97\x3f\x54\x03\x98\x98\x98\xd8\x78\xc5\x15\x57\xdc\xfa\xec\xb3\
-\xcf\x0a\x79\x15\x75\xd5\x10\xea\x25\xea\x97\x16\x98\x40\x17\xa9\
-\x66\xf8\xe2\xf3\x72\x29\x67\xe6\x94\x78\x40\xf9\xe0\x13\x89\x44\
-\x59\xf5\x4f\xa5\x52\x21\x16\x8b\x21\x10\x08\x20\x14\x0a\x21\x93\
-\xc9\xa0\xa9\xa9\x09\xdf\xf9\xce\x77\xb0\x7e\xfd\x7a\x6c\xde\xbc\
-\x19\x44\x4d\x93\x90\x83\x23\x7e\xfa\xff\x44\x22\x01\xb3\xd9\x3c\
-\xa7\x8b\x9f\x37\xc3\xa6\x20\xad\xc8\x13\x28\x43\x42\xa1\x50\x10\
-\x55\x50\x4a\x97\x13\x89\x04\x4c\x26\x93\xd0\x30\x10\x88\x24\x8f\
-\x99\xcb\xe5\xa0\xd5\x6a\xf1\xf2\xcb\x2f\xe3\x96\x5b\x6e\xc1\xca\
-\x95\x2b\x71\xea\xd4\xa9\xcd\x07\x0e\x1c\xf8\x26\x80\xfb\x3e\xb4\
-\x10\xf0\xc5\x2f\x7e\xf1\xde\x65\xcb\x96\x3d\x35\x35\x35\x85\xf1\
-\xf1\x71\x58\xad\x56\x01\xde\x68\xe7\xe6\xf3\x79\x48\x92\x24\x80\
-\x20\x21\xef\x64\x32\x89\x64\x32\x09\xde\xa9\x4b\x0f\x83\x6b\xf7\
-\x2a\xf1\xee\xca\xb8\x4a\x52\x6b\xaa\x13\x44\xa3\x51\x1c\x3e\x7c\
-\x18\x6f\xbf\xfd\x36\x8a\xc5\x22\xae\xbf\xfe\x7a\x3c\xf7\xdc\x73\
-\x78\xf3\xcd\x37\x71\xcf\x3d\xf7\xe0\xda\x6b\xaf\x2d\x53\x02\x51\
-\xcf\x01\xc9\xbe\xb8\xc2\x88\x80\x16\x17\x94\xce\xe7\x75\x36\x43\
-\x50\xfe\x0c\x3d\x33\xba\x67\x9d\x4e\x87\x7c\x3e\x8f\x68\x34\x5a\
-\x56\x84\x2a\x14\x0a\xb0\xdb\xed\x82\x4c\x23\x6e\x81\x32\x82\x60\
-\x30\x88\xb7\xdf\x7e\x1b\x1e\x8f\x07\xed\xed\xed\x90\x65\xd9\xfd\
-\xf0\xc3\x0f\x37\x7f\x28\x1e\xe0\xd1\x47\x1f\xb5\xc9\xb2\xec\x5a\
-\xb4\x68\xd1\xae\xe7\x9e\x7b\x4e\xb8\x7a\x4a\xa5\x08\xa5\x66\x32\
-\x19\x91\x0d\x50\xca\x56\x2a\x95\x84\x85\x93\xd5\xf3\x22\x8f\x12\
-\x45\x73\x81\xc5\x5c\x2e\x37\x14\x0a\x21\x10\x08\x60\x72\x72\x12\
-\x46\xa3\x11\x1b\x37\x6e\xc4\x67\x3e\xf3\x19\x6c\xd9\xb2\x05\x0d\
-\x0d\x0d\xef\xa1\x7d\x73\xb9\x9c\xf0\x16\xfc\x73\xd3\x25\x49\x92\
-\x00\x8d\xb4\x48\xf3\x09\x01\x67\xa3\x9c\x95\xc2\x53\x2e\x3b\x2f\
-\x14\x0a\x65\x8a\x22\x9d\x4e\x87\x5c\x2e\x87\xe9\xe9\x69\xd4\xd6\
-\xd6\x0a\xaf\xc9\x5b\xd5\x62\xb1\x58\x99\x07\x8b\x44\x22\xd8\xb9\
-\x73\x27\xae\xb8\xe2\x0a\x2c\x59\xb2\x04\xc7\x8f\x1f\xdf\xde\xd7\
-\xd7\x37\x73\x3e\x5e\x60\xde\x06\x30\x38\x38\x78\x6b\x4b\x4b\xcb\
-\x5d\x89\x44\x02\xe3\xe3\xe3\x22\x5d\xe2\x52\xec\x6c\x36\x2b\x1a\
-\x32\x49\xeb\x46\x3b\x94\x2c\x9b\x83\xb3\x7c\x3e\x2f\xac\x39\x9b\
-\xcd\x8a\x70\x22\xcb\x32\x2c\x16\x8b\x58\x34\x4a\xfb\xa2\xd1\x28\
-\xa2\xd1\x28\xc6\xc7\xc7\x51\x2c\x16\xb1\x6a\xd5\x2a\xdc\x7e\xfb\
-\xed\xf8\xd4\xa7\x3e\x85\xb5\x6b\xd7\x02\x80\x78\x5f\xe5\xc5\x91\
-\x3d\xe7\x2c\xf8\xae\x9c\x9a\x9a\x42\x38\x1c\x16\x32\xae\x73\x65\
-\x21\xe7\xca\x12\x78\xfd\x82\xbc\x4e\xa1\x50\x40\x55\x55\x55\x59\
-\x88\xa0\xcd\x40\x1e\x33\x12\x89\xc0\xe5\x72\x89\x67\x62\xb7\xdb\
-\x31\x36\x36\x06\x83\xc1\x80\x74\x3a\x2d\x3c\xa8\xd9\x6c\x46\x4f\
-\x4f\x0f\x06\x07\x07\xd1\xd1\xd1\x81\xa5\x4b\x97\xe2\x85\x17\x5e\
-\xe8\xf8\xc1\x0f\x7e\xe0\xbd\xe7\x9e\x7b\x02\x1f\xa8\x01\x0c\x0d\
-\x0d\x7d\xfa\xb3\x9f\xfd\x2c\xde\x7d\xf7\x5d\x24\x93\x49\x91\xbb\
-\x93\x05\x73\xed\x1d\x2d\xae\x5e\xaf\x17\x72\x6b\xfa\x3e\xbf\x61\
-\xb3\xd9\x2c\xd0\xbc\xd1\x68\x04\x00\xc8\xb2\x0c\xea\x13\x30\x99\
-\x4c\x90\x65\x19\x91\x48\x04\xa3\xa3\xa3\x28\x14\x0a\xf0\x7a\xbd\
-\x62\xd1\xd7\xaf\x5f\x2f\x40\x28\x09\x4e\x48\x6d\x3b\x9f\x1d\x4c\
-\x06\x49\x69\x56\x3c\x1e\xc7\xc4\xc4\x84\x90\xa5\x5d\x70\xa1\xe5\
-\xcc\x73\xe0\x20\x90\x1a\x4d\x49\xe8\x42\xc6\xc7\x0d\x24\x95\x4a\
-\xc1\x6a\xb5\x82\x0b\x69\xc8\x80\x29\x5c\x70\x50\xd9\xd3\xd3\x83\
-\xce\xce\x4e\x34\x37\x37\xa3\xb6\xb6\xf6\xc6\xa3\x47\x8f\x1e\x02\
-\xf0\xf0\x07\x66\x00\x77\xdc\x71\xc7\xf6\x96\x96\x96\x17\x24\x49\
-\xba\x66\x70\x70\xf0\x3d\x12\x69\xee\x6e\x69\x47\xd3\x87\xa3\xfc\
-\x9f\x0f\x5a\xe0\x1e\x80\x34\xf6\xe4\x26\x29\xb4\xc4\x62\x31\x9c\
-\x3a\x75\x0a\xc1\x60\x10\x3e\x9f\x0f\x9f\xfc\xe4\x27\x71\xf5\xd5\
-\x57\xe3\x13\x9f\xf8\x04\x6a\x6a\x6a\xca\x16\x99\x0f\x7c\x98\xcf\
-\xe2\xf3\x05\xa2\xb4\x72\xcd\x9a\x35\xf8\xcd\x6f\x7e\x23\x94\xba\
-\xf3\xe1\x02\xce\xe5\x01\x38\xb9\x55\x2c\x16\x21\x49\x12\xba\xbb\
-\xbb\xf1\xe0\x83\x0f\x0a\xf0\xc7\x3d\x04\x81\x54\x92\x87\x59\x2c\
-\x16\xe4\xf3\x79\x91\x21\x64\xb3\x59\x61\x14\x7c\xe8\xc5\xc1\x83\
-\x07\x71\xf3\xcd\x37\xa3\xb9\xb9\x19\xad\xad\xad\xd8\xb5\x6b\xd7\
-\xc6\x47\x1f\x7d\xd4\x36\x9f\x79\x05\xf3\x32\x80\x40\x20\xb0\xe1\
-\xe2\x8b\x2f\xbe\xbd\x54\x2a\x61\x68\x68\x48\xb8\x48\x9e\xca\x50\
-\xee\xcc\xdb\xb1\x28\x4f\x57\x1a\x0a\x81\x45\x72\xc7\x64\xfd\xb2\
-\x2c\x23\x14\x0a\x61\x6a\x6a\x0a\x36\x9b\x0d\x6d\x6d\x6d\x78\xe8\
-\xa1\x87\x70\xd9\x65\x97\xa1\xbd\xbd\x5d\x70\x0e\x3c\x46\x13\x99\
-\x44\x17\xe1\x11\x5e\x4e\x3e\x2b\x0a\x66\x02\x91\xd6\xd6\xd6\x32\
-\x6c\x73\xa1\x17\x4f\x67\x93\xc9\x24\xcc\x66\x33\x56\xac\x58\x01\
-\xaf\xd7\x8b\xc9\xc9\x49\xf1\x3d\xc2\x22\xdc\x70\x13\x89\x84\x90\
-\xb5\x55\xc2\x1c\xfc\x1e\x47\x47\x47\x71\xfa\xf4\x69\x2c\x5b\xb6\
-\x0c\xcd\xcd\xcd\xf0\x78\x3c\xd7\x9c\x3a\x75\xea\x46\x00\xbf\xb8\
-\x60\x03\xf8\xee\x77\xbf\xdb\x2c\xcb\xb2\xab\xa3\xa3\x03\xfb\xf6\
-\xed\x13\x14\x2c\x81\x28\x0e\x6c\x28\xae\x92\xe0\x32\x91\x48\x20\
-\x97\xcb\x09\x29\x14\x85\x0a\xf2\x20\x66\xb3\x19\xf1\x78\x5c\xf4\
-\xd9\xa7\xd3\x69\xb4\xb7\xb7\x63\xdb\xb6\x6d\xb8\xfa\xea\xab\x71\
-\xf9\xe5\x97\x0b\x57\x19\x0e\x87\xcb\xd2\x36\xc2\x1b\x64\x3c\xb4\
-\x8b\xe6\x5b\xb5\xa3\xaa\xa3\x4e\xa7\x13\x29\x2c\x85\x2d\x8a\xb5\
-\x17\x8a\x01\xf4\x7a\xbd\xc8\xf1\x8d\x46\x23\x22\x91\x08\x02\x81\
-\x80\xf0\x2e\x94\xfe\x92\x17\xe2\x9f\x9f\x48\x2d\x6a\x85\xd3\x6a\
-\xb5\xe2\x33\x6a\x34\x1a\x21\x29\xa3\x2e\xe9\xe1\xe1\x61\x2c\x5d\
-\xba\x14\xb5\xb5\xb5\x68\x6c\x6c\x44\x7f\x7f\xff\xd5\x1f\x88\x01\
-\x0c\x0f\x0f\x5f\xdf\xd4\xd4\x74\xa3\x24\x49\x98\x9a\x9a\x12\x20\
-\x44\x59\x3e\x25\xb2\x82\x94\x3c\xe9\x74\x5a\x48\xbd\xc8\xad\xf2\
-\x9c\xdf\x60\x30\x20\x14\x0a\x61\x66\x66\x06\x4e\xa7\x13\xd7\x5f\
-\x7f\x3d\xae\xb9\xe6\x1a\xac\x5f\xbf\x1e\xf5\xf5\xf5\x82\x95\xa3\
-\x4c\x82\xc2\x4b\x22\x91\x80\xcd\x66\x83\xdd\x6e\x17\xd4\x32\x19\
-\x09\xc5\xc6\xf9\xee\x7e\x9a\x1c\x42\xc6\x24\x49\x12\x0a\x85\x02\
-\x12\x89\x04\xec\x76\xfb\x05\x19\x80\x2c\xcb\x70\x38\x1c\xc2\x8d\
-\x53\x0b\x1c\x00\xd1\xff\xc8\x75\x8a\xca\x74\x91\xba\x93\xe8\x7e\
-\xe8\x7e\x39\xb6\x20\xe2\x2a\x12\x89\x60\x64\x64\x04\xb9\x5c\x0e\
-\x6e\xb7\x9b\x00\xa4\xed\x7b\xdf\xfb\x5e\xfd\xb9\x86\x5a\x9d\xd3\
-\x00\x26\x26\x26\x36\x6e\xda\xb4\x09\xa5\x52\x09\x93\x93\x93\xa2\
-\x29\x93\x8b\x3e\x68\xf7\x53\x3f\x3e\xb5\x76\x91\x55\x2b\xd9\x2f\
-\x02\x60\x46\xa3\x11\x9f\xff\xfc\xe7\x71\xc7\x1d\x77\xa0\xbd\xbd\
-\xbd\xac\x0c\x6b\x34\x1a\xc5\x0e\xa7\xdf\xa1\xba\x38\x2d\xb4\xd9\
-\x6c\x16\x9f\x93\x1e\xf2\xf9\x2a\x77\x38\xf9\x44\x8c\x26\x31\x98\
-\x17\x62\x00\xf4\x39\xc9\x23\x12\xe0\xa4\x5d\xcb\x3b\x90\x39\x27\
-\xc0\x8d\x41\x96\x65\xc4\xe3\x71\xb8\xdd\x6e\x78\xbd\x5e\x04\x02\
-\x81\x32\x0f\xca\x7f\x67\x68\x68\x48\xb0\x84\x75\x75\x75\x70\x3a\
-\x9d\x37\x8e\x8e\x8e\xee\x00\xf0\xf4\xfb\x36\x80\x07\x1e\x78\x60\
-\x4d\x36\x9b\xb5\x91\x86\x7f\x74\x74\x14\x16\x8b\x45\xb8\x7e\x8e\
-\xec\x49\xd0\x61\x36\x9b\x11\x89\x44\x84\xb0\x91\xd2\x1b\x1e\xef\
-\x08\x0c\x1a\x0c\x06\x1c\x3b\x76\x0c\xff\xf2\x2f\xff\x82\xcb\x2e\
-\xbb\x0c\x1b\x36\x6c\x10\x8d\xa1\xbc\x01\x84\xb0\x02\xd5\x12\x24\
-\x49\x2a\xcb\xed\x39\x1e\x98\x2f\x10\xe4\xed\xdf\x6c\xe8\x53\x19\
-\x37\x71\x21\x57\xa1\x50\x28\x0b\x2f\xbc\xa4\x5b\x55\x55\x55\xd6\
-\xeb\xc0\xf1\x14\xfd\x9b\xdc\x7c\x3c\x1e\x47\x75\x75\xb5\x90\xd1\
-\x11\x46\xe1\x04\x96\xd9\x6c\xc6\xe9\xd3\xa7\x91\x4e\xa7\x21\x49\
-\x12\x1a\x1a\x1a\xe0\x76\xbb\x11\x0c\x06\x57\x5e\x50\x08\x08\x85\
-\x42\x9d\x0d\x0d\x0d\x5b\xab\xab\xab\x11\x0c\x06\x11\x8d\x46\x05\
-\x53\xc6\x2b\x72\xf4\xc1\x72\xb9\x1c\x3c\x1e\x0f\x86\x86\x86\x04\
-\x75\x49\x0f\x96\x5b\x37\x95\x80\xa9\x79\x22\x14\x0a\xe1\xc0\x81\
-\x03\x68\x68\x68\xc0\x86\x0d\x1b\xd0\xd5\xd5\x55\xd6\x1e\x4e\x65\
-\x5d\x9e\x45\x90\xca\x86\xd2\x21\xbe\xe0\x4a\x83\xa8\xa4\x28\x22\
-\xe3\xa2\x54\x94\x32\x09\xba\x17\xde\x0b\x70\x36\x65\xd2\xb9\x34\
-\x84\x04\x52\x29\xce\xeb\xf5\x7a\x98\xcd\x66\xb8\x5c\x2e\xa1\x15\
-\xe0\xa1\x8b\x8b\x5d\x74\x3a\x9d\x98\x49\xe4\x72\xb9\x84\xe7\x24\
-\xa9\x1d\x6f\x5a\x4d\x24\x12\x08\x04\x02\xf0\x78\x3c\xc2\x7b\x06\
-\x83\xc1\x35\x8f\x3f\xfe\xb8\xee\xce\x3b\xef\xcc\xbd\x2f\x03\x48\
-\x26\x93\xf5\x55\x55\x55\xf0\xf9\x7c\x18\x18\x18\x10\x0b\x40\x08\
-\x59\xc9\x76\xd1\x45\x16\xaf\x1c\xb4\xc0\xad\x9c\x00\xa1\x24\x49\
-\x30\x1a\x8d\x50\xa9\x54\x08\x85\x42\x78\xf1\xc5\x17\xf1\xf2\xcb\
-\x2f\xa3\xbe\xbe\x1e\x97\x5c\x72\x09\xba\xba\xba\xe0\x72\xb9\xc4\
-\xa2\x13\x1e\xa0\x87\xaa\xec\xe5\xa7\x07\x44\x0f\x9e\x83\x44\x32\
-\x48\x9e\xbd\xf0\xde\x3c\x1e\xae\xf8\x3d\x9e\xad\x00\x74\x2e\x1a\
-\x98\xdf\x37\x6f\x56\xa1\x05\x26\xd9\x18\xb5\xa5\xf3\x7b\xe3\x59\
-\x0d\x4f\x5b\x79\xd8\x22\xbc\x93\xcd\x66\x11\x0a\x85\x84\x27\x6e\
-\x6e\x6e\xc6\xd4\xd4\xd4\xc6\x40\x20\xb0\xe6\x6c\xa5\xe2\x39\x0d\
-\xe0\xb1\xc7\x1e\x93\x86\x86\x86\x6e\xf1\x7a\xbd\xa2\x7f\x8f\x4b\
-\xab\xb9\xab\xa3\x69\x1c\xe4\xb6\x79\x9e\x5a\x69\x47\xd2\x03\xe6\
-\x83\x9b\x38\x39\x53\x2c\x16\x31\x34\x34\x84\xa9\xa9\x29\xec\xda\
-\xb5\x0b\x8b\x17\x2f\xc6\xfa\xf5\xeb\xb1\x64\xc9\x12\x58\x2c\x16\
-\x91\x62\x72\xaf\xc2\x0b\x4a\x54\x82\xe6\x44\x15\xff\xfb\x9c\x34\
-\xa2\xdd\x47\xa9\x2b\x3d\xe4\x4a\xb5\x89\xb9\x16\x9e\x2f\xb4\xd2\
-\x98\xf8\x94\x11\x7a\x7e\x2e\x97\xab\xec\x19\xd0\x7b\x72\xf1\x07\
-\x27\x8f\x2a\x85\x35\xfe\xbc\x29\xa3\x99\x9a\x9a\x12\x64\x91\xdb\
-\xed\x86\x4a\xa5\xc2\xb1\x63\xc7\x6e\x7f\x5f\x06\xf0\xf5\xaf\x7f\
-\x5d\x7e\xe1\x85\x17\x66\x3c\x1e\x0f\xf2\xf9\x3c\xe2\xf1\xb8\x00\
-\x67\xe4\xde\x95\x37\x4e\x37\xcc\xb1\x41\xa5\x86\x0a\xde\xf5\x43\
-\x8b\x45\x59\x02\xc5\x7a\x6a\x1f\x1b\x1d\x1d\xc5\xe8\xe8\x28\x0e\
-\x1d\x3a\x84\xda\xda\x5a\xac\x59\xb3\x06\x6b\xd7\xae\x45\x7d\x7d\
-\xbd\x00\x53\xfc\xc1\x91\xb2\x86\xcf\x00\xe2\x55\x43\x52\xe0\xf2\
-\x49\xa2\xb4\x0b\x0f\x1f\x3e\x2c\xa4\x64\xef\xa7\xfa\x57\xa9\x16\
-\xc0\x0d\x32\x9f\xcf\xc3\x64\x32\x21\x1a\x8d\x0a\x0f\x43\x9f\x8f\
-\xea\x27\x24\x4b\xa3\x54\x9a\x62\x3d\x9f\x5c\xc6\x0b\x6a\x3c\x14\
-\xc5\xe3\x71\xf1\x77\xcd\x66\xf3\xbc\x08\xb1\xb3\x7a\x80\x9a\x9a\
-\x9a\x7d\xb5\xb5\xb5\x9b\x75\x3a\x1d\x62\xb1\x58\xd9\x7c\x5d\x4e\
-\x63\x72\x79\x13\xa1\xf3\x48\x24\xf2\x9e\xae\x59\xba\x19\x6a\xd5\
-\xe2\xa0\x90\x52\x32\x32\x24\xde\x1f\x48\x94\xf2\xf1\xe3\xc7\x71\
-\xea\xd4\x29\xec\xdc\xb9\x13\xad\xad\xad\x58\xbb\x76\x2d\xd6\xac\
-\x59\x23\x9a\x4c\x28\xaf\x27\xf1\x04\xa5\x5e\x14\x06\x68\xd1\xb5\
-\x5a\x2d\x2c\x16\x0b\x62\xb1\x98\x70\xc9\xe1\x70\x18\x4f\x3f\xfd\
-\x34\xa6\xa6\xa6\x44\xfb\xfa\xd9\x5c\xfc\x7c\x78\x00\x4e\x89\xab\
-\xd5\x6a\x41\x6f\x13\xd3\xc8\x77\x38\x85\x2b\x1e\xd6\x68\xa1\x69\
-\xd3\x29\xb9\x02\x25\x39\x24\xcb\x72\xd9\x7c\xa4\x33\xed\xf4\x63\
-\xef\xab\x1c\xbc\x77\xef\xde\x47\x0a\x85\xc2\xbd\x54\xda\x4d\x24\
-\x12\x02\x75\x12\x20\xe3\x1c\x00\x57\xdb\x5a\xad\xd6\x8a\xa9\x1f\
-\xb9\x7c\x3e\xaf\x4f\x29\x00\xcd\x66\xb3\xa2\x08\x42\x7f\x9b\x0a\
-\x3c\xa4\xd9\x8b\xc7\xe3\xd8\xb7\x6f\x1f\x9e\x7e\xfa\x69\x7c\xe7\
-\x3b\xdf\xc1\x93\x4f\x3e\x89\x81\x81\x01\x58\x2c\x16\xd8\xed\xf6\
-\x32\x26\x8f\x6b\xf0\xc8\xdd\xf2\x87\x45\x9d\xbb\xd4\xcf\xc0\x29\
-\x69\x65\x7e\xae\x9c\x39\x74\xae\x9f\xa1\x5d\x4c\xc6\x4c\x80\x99\
-\xea\x1e\xca\x90\x4a\x74\x30\x65\x39\x1c\x27\xf1\x6c\x88\x42\x19\
-\x79\x53\xfa\x7f\x1a\x6f\xab\x56\xab\xe1\x70\x38\xe0\x70\x38\x10\
-\x8b\xc5\x5a\xee\xba\xeb\xae\x6b\xce\xdb\x03\x44\xa3\xd1\x66\x87\
-\xc3\x21\x76\x13\x15\x69\x94\xf1\x94\x3f\x30\x12\x7f\xd0\x20\x07\
-\x25\xef\x4e\xad\xde\xc4\x74\xf1\x71\x2e\x3c\x56\x93\xa1\x71\xef\
-\x42\x79\x34\xfd\x3f\xb9\xff\xf1\xf1\x71\x0c\x0f\x0f\xe3\x8d\x37\
-\xde\x40\x7b\x7b\x3b\x36\x6c\xd8\x80\xce\xce\x4e\xb4\xb7\xb7\x8b\
-\xf7\x26\x80\xc5\x07\x48\xd1\x58\x39\x3e\x66\x96\x1e\xfe\x7c\x5a\
-\xbf\xce\x05\x04\x09\x0b\xf1\x91\x31\xe4\xf1\xb2\xd9\xac\xd8\x00\
-\x4a\xe5\x10\x91\x43\x14\xca\xe8\x73\xf1\x79\x09\xbc\x8c\x4d\xbf\
-\x43\x25\xf7\xb1\xb1\x31\x98\x4c\x26\xb8\xdd\x6e\xd8\xed\x76\xe4\
-\x72\xb9\xdb\x63\xb1\xd8\xf9\x63\x00\xaf\xd7\x7b\x28\x93\xc9\xdc\
-\x98\xc9\x64\x30\x3a\x3a\x8a\x78\x3c\x2e\xd2\x37\x8a\xf5\x4a\x7d\
-\x1b\xcf\x12\x94\x60\x91\x2f\x36\x15\x38\x94\x1a\x7b\x9e\x7a\x29\
-\xf3\x5d\xfa\x5b\xf4\xff\x1c\xc9\x53\x4c\xef\xe9\xe9\x41\x6f\x6f\
-\x2f\x2c\x16\x0b\xb6\x6c\xd9\x82\x95\x2b\x57\x62\xc5\x8a\x15\xef\
-\x21\x76\x28\x7d\xa5\x1c\x9d\x18\x40\x92\x5c\xf1\x32\xf1\x7c\x88\
-\xa0\xb9\x00\x61\x2c\x16\x13\xfa\x3e\x12\x9f\xf0\x1a\x03\x37\x7a\
-\xa5\x52\x88\x7a\x0a\xb9\xc2\x99\x93\x68\x9c\x8d\xe5\x21\x66\x7c\
-\x7c\x1c\x66\xb3\x19\x92\x24\x89\x2e\xa4\xaa\xaa\xaa\x23\xe7\x6d\
-\x00\x56\xab\xd5\x7f\xf2\xe4\x49\xf8\xfd\x7e\x74\x76\x76\x8a\x85\
-\xe7\x44\x09\xa1\x68\xaa\x62\x91\xa7\x20\x9a\x95\x04\x9b\xd4\x11\
-\xcb\x77\x36\xf7\x24\xdc\x03\x70\xad\x1e\x67\xf9\x78\x6c\x53\xe6\
-\xf3\x5c\x60\x4a\x15\xc8\xe7\x9f\x7f\x1e\x3b\x76\xec\x40\x53\x53\
-\x13\x36\x6f\xde\x8c\x4d\x9b\x36\x09\x92\x89\xde\x97\x57\xfd\xb8\
-\xee\x60\xae\xfe\x41\x65\x5a\x57\xa9\x40\x43\xdf\x27\x8f\xc9\xab\
-\x95\xb4\x71\x68\xc1\x2a\x79\x0f\xe5\xa4\x13\x83\xc1\x20\x42\x16\
-\xff\x79\xc2\x3b\xe4\x4d\x09\x3c\xd3\x20\xac\x53\xa7\x4e\xe1\xad\
-\xb7\xde\x42\x53\x53\x13\x4c\x26\xd3\xd4\x79\x1b\xc0\xcc\xcc\x4c\
-\x67\x30\x18\x14\xbb\xcf\x64\x32\x09\xe0\xc2\x19\x2c\x4e\x4b\x72\
-\xd1\x22\x11\x15\x7c\x42\x07\x17\x48\xf0\x87\x4c\xb1\x8c\xe2\x1b\
-\xaf\x31\x28\xb9\x03\xee\xc6\x2b\xed\x40\xfa\x1e\x19\xe7\xf0\xf0\
-\x30\x46\x46\x46\xb0\x63\xc7\x0e\x2c\x59\xb2\x04\x9b\x37\x6f\xc6\
-\xa5\x97\x5e\x5a\xa6\x0b\xe4\xae\x96\xee\x97\x7b\xaf\xb9\x26\x91\
-\x28\x8d\x90\x16\x5b\x39\xb8\x8a\x23\x77\xae\xa1\x3c\x57\x95\x92\
-\x17\xd6\x52\xa9\x94\xd8\x68\xf4\x7d\x65\xf5\x95\x9e\x3b\xdd\xd7\
-\xcc\xcc\x0c\x7c\x3e\x1f\x66\x66\x66\x3a\x00\xf8\xe7\x6d\x00\x8f\
-\x3c\xf2\x88\x77\x66\x66\xa6\x63\x76\x76\x56\x90\x17\xbc\x66\x4f\
-\x3b\x59\x59\xd6\x25\x20\x42\xc0\x8a\xe4\x61\x54\x3e\xa6\x07\xab\
-\x14\x47\xf2\x07\x44\x64\x0f\x17\x99\xf0\x06\x0b\xde\xda\x7d\xb6\
-\x58\x9c\xcd\x66\xc5\x70\x67\x52\xd9\xec\xd9\xb3\x07\x47\x8f\x1e\
-\xc5\x7f\xfd\xd7\x7f\x61\xf5\xea\xd5\xe8\xea\xea\x42\x57\x57\x97\
-\xf8\x5d\xf2\x30\xf4\xd0\xcf\x25\x01\xe3\x9f\x89\x7f\x4e\x7e\xaf\
-\x9c\x2c\xe3\x79\xff\x7c\x70\x85\xb2\x40\xa5\xd7\xeb\x91\x4c\x26\
-\xcb\x40\x37\xdf\x44\xb4\x49\xe9\x99\x47\x22\x11\xa4\x52\x29\x04\
-\x02\x81\x0d\x00\x5e\x9a\xb7\x01\x44\x22\x91\xb6\x89\x89\x89\xad\
-\x54\xf6\x35\x99\x4c\x02\x99\x72\xcb\xe7\xaa\x14\x42\xb8\x89\x44\
-\x02\xd5\xd5\xd5\x22\xaf\x25\xf7\xaf\x9c\xef\xaf\x74\xa1\x1c\x39\
-\x53\xfc\x57\x1e\xe9\xa2\x44\xe1\x73\xcd\xeb\xa1\x3c\x98\x34\x06\
-\x9c\x7c\xc9\xe5\x72\x08\x06\x83\xf8\xd5\xaf\x7e\x85\xd7\x5f\x7f\
-\x1d\xab\x57\xaf\xc6\xea\xd5\xab\x51\x57\x57\x27\x0c\xce\x6c\x36\
-\x0b\xd0\x36\x17\xd9\x53\xa9\x5e\xc0\x7f\x86\xe3\x16\xee\xfa\xe7\
-\xab\x33\xa0\x67\x41\xaa\x28\x9e\xa1\x70\x10\xc8\x9f\x27\x8d\xd0\
-\xe3\x25\xed\xe9\xe9\x69\x14\x8b\xc5\xb6\xf3\x0a\x01\xb2\x2c\x7b\
-\xc7\xc6\xc6\x84\x3b\xb3\xdb\xed\x42\xe6\xcd\x69\x4a\x6e\x04\xf4\
-\x61\x52\xa9\x14\xb2\xd9\xac\x40\xfc\x94\xf3\x2b\xdd\xa5\x52\x2e\
-\xad\x4c\xab\x94\x24\x06\x17\x46\xf0\xf0\xa0\x74\xbf\xfc\xe7\xcf\
-\x4c\xe2\x14\xb9\x3f\xb9\x55\x32\x88\x5c\x2e\x87\x03\x07\x0e\xe0\
-\xdd\x77\xdf\x85\xc7\xe3\x11\xb5\x0c\x9a\xed\xcb\x29\xd7\xb3\x19\
-\x02\xc7\x46\xca\xb4\x90\xf7\x03\xd2\x7b\x9f\x8f\xe4\xdc\x60\x30\
-\x88\xa1\xd3\xbc\x9d\x5d\xa9\xbe\x52\xa9\x54\xa2\x05\x8f\x3e\x7b\
-\x2e\x97\xc3\xc4\xc4\x04\x24\x49\xf2\x9e\x37\x06\xa0\x54\x85\x10\
-\x3b\xe5\xd7\xbc\x8a\xc5\x69\x4e\xfa\x5e\x3a\x9d\x2e\xeb\x81\x27\
-\x77\xca\x8d\xa0\xd2\xb4\x8d\x4a\xd3\x3c\x94\xf3\x79\x94\x8c\xe2\
-\x5c\xa4\x14\x7d\x26\x6a\xb6\xac\xa4\x16\xa2\xbf\x41\x1d\xbb\x89\
-\x44\x42\x7c\x4e\x87\xc3\x21\x48\x23\x25\xf0\xe5\x95\x4a\x65\x05\
-\x92\xe7\xe5\xfc\xe7\x08\xc9\xf3\xdd\x7f\x2e\x0c\xc0\xef\x3b\x1e\
-\x8f\x0b\x21\x0e\x1f\x5d\xc3\x5f\x34\xf8\x8a\x06\x52\xd0\xeb\xcc\
-\x19\x06\xe7\x57\x0c\xd2\xe9\x74\x71\xfa\xb0\x34\xe2\xc5\xe7\xf3\
-\x09\xeb\xe5\x56\x47\x68\x9a\x72\xe8\x4c\x26\x83\x68\x34\x2a\xf4\
-\xec\x7c\x56\x2f\xaf\x66\x55\xaa\x9c\x71\x2e\x9f\x4f\xf1\x3e\x9b\
-\x0c\x5b\x19\x16\xb8\xea\x98\x53\xad\xc4\x40\xf2\x2c\xc4\x68\x32\
-\xd4\xc6\xfc\x00\x00\x1e\x7d\x49\x44\x41\x54\x34\x96\xb5\x9b\x71\
-\x9c\x43\x9e\x83\x7b\x01\xce\xd0\x55\xf2\x38\x95\x62\xbb\x92\xeb\
-\xe0\xde\xec\x6c\x17\x91\x5f\x24\x9a\xa5\x7f\x2b\x4f\x3a\xa1\xcf\
-\x76\x26\xdd\x83\xc5\x62\x11\x1e\x8f\x9e\x89\x56\xab\x95\xcf\xd7\
-\x00\x52\xfc\x74\x2d\xab\xd5\x8a\xc6\xc6\xc6\x32\xb9\x37\x7f\xf0\
-\xe4\x01\x68\xd7\x26\x93\x49\x58\xad\xd6\xb2\x45\xe3\xa7\x7d\x28\
-\xc3\x00\x2f\x83\x2a\xdd\x3d\x59\x3c\xff\x79\xc2\x08\x4a\x43\x20\
-\xcc\x41\x80\x94\x4f\x03\xe3\x1e\x40\x59\xee\x55\xa9\x54\x42\xb9\
-\x43\x3a\x05\x4e\x44\x29\xf1\x8e\x32\x0e\x2b\x07\x56\x72\xaf\xc6\
-\x69\x6f\xe2\x35\x94\x3d\x09\x67\xcb\x04\x68\xd1\xc9\x78\xb9\x3a\
-\x8a\x6f\x42\xa3\xd1\x08\xa7\xd3\x29\xe4\xf4\xf9\x7c\x1e\xe9\x74\
-\xfa\x9c\xe2\x96\xb9\x30\x80\x9b\x1e\x40\xa9\x54\x42\x22\x91\x80\
-\xcf\xe7\x83\xd3\xe9\x14\x2d\xcb\x84\x05\x78\x35\x4a\x96\x65\x21\
-\x5d\x8a\x46\xa3\xc2\x1a\x49\x45\x44\x0d\x18\xb4\x78\xca\xb4\x50\
-\xa9\xa2\xe5\x6a\x1a\x65\x2c\x56\x6a\xfa\x2b\x4d\x07\xaf\xc4\x46\
-\xf2\xd8\xca\xbf\xce\xcb\xc5\xf4\xb5\x4a\x7c\x00\x27\xbc\xe8\x77\
-\x94\xe1\x80\xdf\x07\x97\x7c\x71\xc0\x46\x04\x11\x81\x3b\xce\x17\
-\xc8\xb2\x2c\xe4\x5e\xa1\x50\x08\x16\x8b\x05\xd1\x68\x54\xe4\xfb\
-\x84\x03\x38\xab\xe9\xf1\x78\x50\x55\x55\x25\x8c\x9c\x28\xf5\x74\
-\x3a\x0d\x87\xc3\x31\x78\x5e\x06\x60\xb7\xdb\x87\xa9\x19\xf1\xe0\
-\xc1\x83\xb8\xf4\xd2\x4b\xe1\xf1\x78\xe0\xf3\xf9\x30\x39\x39\x29\
-\x8e\x67\x53\xea\xd8\x78\xde\x1f\x89\x44\x04\xd5\x4a\x93\x43\xc8\
-\x38\xc8\xc5\x57\x22\x41\x94\xcd\x1b\xe4\x3d\x78\xea\xa3\xc4\x0e\
-\x3c\xf6\x72\xad\x81\x32\xd5\x54\x6a\xee\xe6\xdb\xf9\xa3\x5c\x7c\
-\x5a\x3c\x4e\xe1\x2a\x3d\x54\x25\x9d\x1f\xbf\x47\x9a\x51\xc0\xe7\
-\x05\xf1\xca\x28\xb1\x7f\xb4\xd3\xe9\x3c\x05\xaa\x2b\x90\x96\x41\
-\xad\x56\x43\x92\x24\xb8\xdd\x6e\x11\xd2\x8c\x46\x23\x46\x46\x46\
-\x84\x81\xd8\xed\xf6\xc1\xf3\x2a\x06\x3d\xf4\xd0\x43\x47\x48\x8d\
-\xd3\xd7\xd7\x87\x4c\x26\x03\x97\xcb\x85\x8e\x8e\x8e\xf7\x08\x28\
-\xb8\xb4\x9a\xdc\x15\x81\xc7\x99\x99\x19\xe1\x05\xa8\x86\x4f\x65\
-\x4a\x1e\xab\xf9\x40\x47\xbe\x63\xf8\xd7\x29\xa3\x20\x97\x4a\xff\
-\xa6\x94\x87\x0f\xa0\x3c\x9b\x61\x29\xe5\xe0\x73\xbd\x94\xbd\x89\
-\x3c\x8b\xa1\x0c\x83\x0f\xa0\xe4\x9f\x95\x7f\x5e\x3e\x9b\x90\xdf\
-\x2f\x9f\x60\xce\x3d\x02\xef\x8e\x4e\x26\x93\x90\x24\x49\x1c\x53\
-\xa7\xf4\x92\xe4\xb9\x32\x99\x0c\xaa\xab\xab\xe1\x72\xb9\xc4\x01\
-\x5a\x47\x8e\x1c\x11\x9b\xcf\xe5\x72\x1d\x3b\xef\x2c\xc0\xe1\x70\
-\xc8\x81\x40\x40\xa2\xe3\xd6\x0a\x85\x02\x3a\x3b\x3b\x45\xa9\x94\
-\xc7\x3b\xba\x31\xa2\x83\x49\x95\x42\x83\x20\xaa\xaa\xaa\x30\x33\
-\x33\x23\x3c\x02\x31\x8a\xca\x9d\xc5\xff\x66\xa5\xb9\xbc\xca\xc9\
-\x1c\xca\x05\x9b\x4f\xa9\xb6\x12\x7b\x37\x1f\x69\x97\x72\x37\x2b\
-\x2b\xa1\xca\xea\xde\xd9\x68\x62\xf2\x40\x16\x8b\xa5\x8c\xdb\x27\
-\xd0\x6b\x36\x9b\x11\x0e\x87\x85\xf7\xa3\x9a\x02\x97\x89\xd1\xbf\
-\x29\xd6\x37\x36\x36\x0a\xbe\x25\x97\xcb\x61\x72\x72\x92\x4f\x42\
-\x33\x9d\xb7\x01\xa8\xd5\xea\x9c\x5e\xaf\x97\xd2\xe9\x34\x02\x81\
-\x00\xbc\x5e\x2f\x5a\x5a\x5a\xd0\xd8\xd8\x08\xbf\xdf\xff\x1e\x15\
-\x10\xdd\x08\xd5\x03\xec\x76\xbb\x98\x92\x49\x03\x90\x48\x2e\xce\
-\xdb\xa2\x2a\x3d\xe8\x4a\x48\x5f\xf9\x20\x39\x0d\x5a\x89\xb5\x9b\
-\xcf\x0c\xc0\x73\x01\xb0\xb3\x29\x7e\x28\xcc\x28\xbd\xc3\x7c\x47\
-\xca\x92\x81\xd3\x18\x38\x42\xfb\x14\xee\x62\xb1\x18\x8c\x46\xa3\
-\xd8\xfd\x4a\x10\x4d\x73\x88\x54\x2a\x15\x3c\x1e\x0f\x96\x2e\x5d\
-\x5a\x06\x6c\x49\x42\x4e\xb3\x18\xcf\xdb\x00\x68\xa7\x4e\x4e\x4e\
-\xe2\xf8\xf1\xe3\x58\xb9\x72\xa5\x08\x03\x03\x03\x03\x02\x44\x29\
-\x19\xb9\x42\xa1\x80\x78\x3c\x2e\x06\x22\x26\x93\x49\x8c\x8e\x8e\
-\x62\xe5\xca\x95\x88\xc7\xe3\x65\x29\xd7\xb9\xaa\x6b\x67\xeb\xbc\
-\xad\x04\xd2\xb8\x31\x9d\x6b\x9c\xdc\x7c\x0c\xe2\x6c\xb9\xba\x12\
-\xf5\x2b\x41\xad\xf2\x6b\xca\xf7\xe5\x19\x10\x81\x68\x02\xbd\x83\
-\x83\x83\xc8\xe7\xf3\xb0\x5a\xad\x18\x1b\x1b\x13\xa5\x65\xa3\xd1\
-\x08\x59\x96\xc5\xef\x91\x08\xa7\xad\xad\x0d\xb5\xb5\xb5\x02\x23\
-\xf4\xf7\xf7\x63\x6a\x6a\x0a\x46\xa3\x11\x2e\x97\x0b\x67\x1b\x39\
-\x3f\xa7\x01\x2c\x5d\xba\xf4\x17\x23\x23\x23\x5f\x8d\x44\x22\x18\
-\x18\x18\x40\x22\x91\x80\xc3\xe1\xc0\xea\xd5\xab\xf1\xfa\xeb\xaf\
-\x8b\x98\xc4\x0b\x38\x64\xa1\x99\x4c\x06\x91\x48\x04\x8d\x8d\x8d\
-\x48\x24\x12\xc8\x66\xb3\x18\x1f\x1f\x2f\x43\xa9\x4a\xd4\x3d\x9f\
-\x79\xc0\x65\x1f\x5c\x11\xef\x79\x11\x86\x97\xaa\xe7\x92\x6b\xbd\
-\x1f\xdd\x7f\xa5\x5e\x48\x9e\xbe\x2a\x67\x01\x9d\xed\x3d\x09\xe5\
-\xe7\xf3\x79\x24\x93\x49\xf1\x2c\xc2\xe1\x30\x12\x89\x04\xdc\x6e\
-\xb7\x50\x04\x57\xaa\xa1\xf0\x62\xd0\xf2\xe5\xcb\x85\x56\xb2\x58\
-\x2c\xe2\xd0\xa1\x43\x02\xac\xb7\xb4\xb4\xec\x7b\x5f\x92\xb0\x4d\
-\x9b\x36\x7d\xed\xb7\xbf\xfd\xed\x57\xa9\x6d\x3a\x18\x0c\xc2\xe3\
-\xf1\xe0\xa2\x8b\x2e\x42\x73\x73\x33\xfa\xfb\xfb\xdf\x53\xf0\x20\
-\xc0\x43\x71\x49\xa3\xd1\xc0\xe3\xf1\x88\xd3\xb4\x74\x3a\x1d\x16\
-\x2d\x5a\x84\x40\x20\xf0\x9e\xf1\xed\xca\xea\xda\x5c\x3b\xb8\x52\
-\xbc\xad\x54\x5b\xbf\x50\x5d\xbf\x12\xd9\x57\xc2\x01\x4a\x29\x5c\
-\x25\x9a\x7b\xae\x8b\x00\x64\x2a\x95\x42\x2e\x97\x83\xcb\xe5\x42\
-\x30\x18\xc4\xa9\x53\xa7\x44\x83\xcd\xa9\x53\xa7\xc4\xf3\x34\x9b\
-\xcd\x65\x19\x14\xf1\x0a\x66\xb3\x19\x6b\xd7\xae\x2d\xfb\x3e\x1d\
-\x5b\x73\xa6\x03\x7b\xfc\x7d\x49\xc2\x32\x99\x8c\x8b\xca\x8b\x27\
-\x4f\x9e\x44\x22\x91\x40\x38\x1c\x46\x4d\x4d\x8d\xe8\xc5\x27\x72\
-\x82\xba\x72\xc8\x3d\x01\x40\x63\x63\x23\x72\xb9\x1c\x2c\x16\x0b\
-\xac\x56\x2b\x92\xc9\x24\x46\x46\x46\x10\x08\x04\xc4\x49\x21\xbc\
-\x92\xc8\xe9\x5c\xba\x49\x8e\x9a\x79\xe6\xc0\xf3\x74\x25\x17\x40\
-\x2f\x22\x85\xe8\x77\x78\x96\xc0\x05\x97\x9c\x41\xe4\x68\xbe\xd2\
-\xbf\xe7\x2a\x40\xd1\xcf\x71\x50\x4a\xf7\x40\x03\x34\xc9\xeb\x91\
-\x1c\x8e\x0f\xd3\x72\xbb\xdd\x98\x9d\x9d\xc5\xe9\xd3\xa7\xc5\x48\
-\xdd\x50\x28\x84\xa6\xa6\x26\x91\x35\xf1\xec\x8b\x9e\x5b\x36\x9b\
-\x45\x67\x67\x27\x6a\x6a\x6a\x04\xb0\x9e\x9a\x9a\x42\x4f\x4f\x8f\
-\xd0\x0a\x78\x3c\x9e\x9e\xf7\x65\x00\xf7\xdc\x73\x4f\xa0\xb9\xb9\
-\xd9\xaf\xd5\x6a\x11\x89\x44\xf0\xe6\x9b\x6f\x8a\x37\xbe\xf8\xe2\
-\x8b\xe1\xf5\x7a\xc5\xff\xd3\x9b\xf3\xfe\x35\x93\xc9\x84\x50\x28\
-\x84\xa1\xa1\x21\x34\x34\x34\x40\x92\x24\xa8\xd5\x6a\x0c\x0c\x0c\
-\x60\x7c\x7c\x1c\x4e\xa7\x53\xb8\x42\x6a\xf2\xb0\xd9\x6c\xe2\x61\
-\x52\x49\x99\x16\x9a\xbe\x4e\x8d\x96\x7c\xb1\x2b\xbd\xb8\xf6\x50\
-\x79\x76\x10\xa5\x5f\x74\xec\x1c\x95\x51\xf9\x01\xd2\xe7\xfa\xfb\
-\xca\x17\x3f\x92\x86\xd0\x39\x2d\x1e\xcd\x02\xb4\x5a\xad\x82\x35\
-\x95\x65\x59\x30\x75\xe9\x74\x1a\x23\x23\x23\xc8\x66\xb3\x54\xbf\
-\x47\x20\x10\x10\x06\xaa\x04\xbc\xf4\x35\xbb\xdd\x8e\xae\xae\x2e\
-\x58\xad\x56\x41\x0c\x0d\x0d\x0d\x61\x70\x70\x10\x5a\xad\x16\x4e\
-\xa7\x13\x2b\x57\xae\xfc\xc9\xfb\xee\x0c\x6a\x6d\x6d\x7d\xfe\xf4\
-\xe9\xd3\x77\xc9\xb2\x8c\x23\x47\x8e\x20\x14\x0a\xc1\x66\xb3\xa1\
-\xa9\xa9\x09\x6b\xd7\xae\xc5\x8e\x1d\x3b\x44\xce\xaf\xd1\x68\x84\
-\x84\x89\x63\x82\x70\x38\x8c\x40\x20\x80\xc5\x8b\x17\xa3\xbb\xbb\
-\x1b\x16\x8b\x05\x7e\xbf\x1f\x06\x83\x01\xad\xad\xad\x98\x9a\x9a\
-\x12\x28\x37\x9b\xcd\xc2\xed\x76\x97\xc9\xa6\x39\xa1\xc3\x4b\xc3\
-\xe7\xd2\xed\x2b\x05\x25\x7c\x47\x73\xc3\x22\x23\xe4\x5d\x3a\xca\
-\x96\xf3\xb3\xe1\x84\xb9\xa6\x97\xd3\xf0\x67\x32\x7c\x22\x7d\xcc\
-\x66\x33\xa2\xd1\xa8\x28\x54\xc9\xb2\x8c\xe1\xe1\x61\x51\x3f\xb1\
-\x58\x2c\xe8\xef\xef\x7f\xcf\xbd\x73\xc6\x94\x9e\x75\x6b\x6b\x2b\
-\x96\x2e\x5d\x0a\x49\x92\xc4\xf3\x7b\xfb\xed\xb7\xc5\xec\x65\xbd\
-\x5e\x8f\x73\xcd\x08\x38\xeb\x5d\x76\x75\x75\xfd\xe4\x95\x57\x5e\
-\xb9\x4b\xa7\xd3\xc1\xef\xf7\xa3\xaf\xaf\x0f\xcd\xcd\xcd\x28\x95\
-\x4a\x58\xbb\x76\x2d\xde\x7e\xfb\x6d\x71\x3a\xd6\x99\x4e\x22\x58\
-\xad\xd6\xb2\x07\x62\x32\x99\x30\x3a\x3a\x0a\xbd\x5e\x8f\x8b\x2e\
-\xba\x08\x23\x23\x23\x08\x87\xc3\xe8\xef\xef\x87\x4e\xa7\x43\x75\
-\x75\x75\x59\x17\x2c\xa5\x90\xe4\xf2\x2a\x4d\x0e\xe5\xc5\x9e\xb9\
-\x70\x82\xb2\xca\x48\x1d\x48\x5c\x66\xc5\x81\x23\x31\x99\xc9\x64\
-\x52\x34\x9d\x9c\x0b\x23\x28\x71\x87\xf2\xfb\xd4\xbc\x4a\x2a\x5d\
-\x02\x75\x34\x45\x2d\x1c\x0e\xe3\xf8\xf1\xe3\x08\x85\x42\xd0\xeb\
-\xf5\xa8\xaf\xaf\xc7\xe1\xc3\x87\x45\x6a\xc8\x39\x02\x25\x47\xa2\
-\xd7\xeb\xb1\x6e\xdd\x3a\x58\xad\x56\xc4\x62\x31\xd8\x6c\x36\x04\
-\x83\x41\xec\xdf\xbf\x5f\x94\x84\x57\xac\x58\x71\xce\x13\x46\xce\
-\xca\x86\xdc\x77\xdf\x7d\x63\x6e\xb7\x1b\x92\x24\x21\x1c\x0e\xe3\
-\xe8\xd1\xa3\x18\x1b\x1b\xc3\xec\xec\x2c\x7c\x3e\x1f\x36\x6d\xda\
-\x54\xd6\x81\x63\x36\x9b\xc5\x0e\x52\xf6\xed\x0d\x0f\x0f\xc3\x68\
-\x34\xa2\xba\xba\x5a\x48\x9c\x7e\xf7\xbb\xdf\x21\x10\x08\xa0\xae\
-\xae\x0e\x76\xbb\x5d\x70\xec\x34\x51\x44\xe9\xc2\x89\x81\x23\x8b\
-\xe7\xcc\xa0\xd2\x1d\xd3\xef\x92\x3a\xc6\x6a\xb5\x8a\xd3\xc7\xb8\
-\x1e\x8f\x1f\x33\x67\xb5\x5a\x85\xf6\x41\xe9\xd2\x95\x2f\x7a\x2f\
-\x7a\xd8\xfc\x45\x55\x50\xa3\xd1\x28\x98\x3e\x6a\x7c\xa1\xbe\xc0\
-\x50\x28\x84\xbe\xbe\x3e\x4c\x4d\x4d\x41\xad\x56\x63\xc9\x92\x25\
-\xe8\xed\xed\x15\xe0\x59\x79\x52\x0a\x79\x59\x62\xfe\xda\xda\xda\
-\xb0\x76\xed\x5a\x31\x77\x60\x76\x76\x16\x07\x0e\x1c\x00\xe9\x38\
-\xb2\xd9\x2c\x5a\x5b\x5b\x7f\x79\x41\xcd\xa1\x00\xb0\x61\xc3\x86\
-\x87\x77\xed\xda\xf5\x4d\x9d\x4e\x87\xa3\x47\x8f\xa2\xaf\xaf\x4f\
-\x1c\xef\x76\xe5\x95\x57\xe2\xf0\xe1\xc3\xf0\xfb\xfd\x62\xdc\x29\
-\x85\x01\xb2\x52\xaa\x0f\xa8\xd5\x6a\x1c\x3c\x78\x10\x5d\x5d\x5d\
-\x90\x24\x09\xc3\xc3\xc3\x90\x24\x09\x7d\x7d\x7d\x28\x14\x0a\x58\
-\xb6\x6c\x99\x68\xd6\xe0\xbd\x00\xb4\xa0\xca\xf3\x80\xe7\x6a\xdc\
-\xa8\xc4\x27\x18\x8d\x46\x58\x2c\x16\x91\x27\x73\x89\xb8\x92\x1d\
-\x24\x7c\x31\x9f\x6a\xdd\x5c\x4d\xa3\x14\x42\x52\xa9\x54\x19\x58\
-\x74\x3a\x9d\x50\xab\xd5\x18\x1b\x1b\x43\x77\x77\x37\x52\xa9\x14\
-\x0c\x06\x03\x96\x2c\x59\x02\xbf\xdf\x8f\x70\x38\x2c\x94\x55\x94\
-\x55\x19\x0c\x06\x31\xf0\x9a\xc2\xad\xd1\x68\xc4\xa6\x4d\x9b\xe0\
-\x72\xb9\x60\x32\x99\x90\x4a\xa5\x30\x3a\x3a\x8a\x9d\x3b\x77\x8a\
-\xae\xad\xc6\xc6\xc6\x63\x3f\xfa\xd1\x8f\x5e\xbd\x20\x0f\x40\x61\
-\x80\x6e\xf0\xf4\xe9\xd3\x38\x7c\xf8\xb0\xe8\x12\x5e\xb4\x68\x11\
-\x36\x6f\xde\x2c\x40\x08\x2f\x15\xd3\x82\x71\x4f\x90\xcb\xe5\x70\
-\xe2\xc4\x09\x98\xcd\x66\xd4\xd5\xd5\x21\x95\x4a\x21\x9f\xcf\x63\
-\x68\x68\x08\xfb\xf6\xed\x43\xa9\x54\x12\x07\x49\xf2\x31\xe9\x5c\
-\xe1\x43\xbb\x8f\x8e\xa1\x21\x50\x58\xe9\xdf\xca\x5d\xc9\x6b\x07\
-\xfc\xe7\x38\xa7\x4f\xff\xa5\xef\xcf\xe7\xc5\x91\x3d\x19\x16\x15\
-\x77\x48\xbd\xdb\xd2\xd2\x02\x49\x92\x30\x38\x38\x88\xde\xde\x5e\
-\x31\x38\xab\xbd\xbd\x1d\x13\x13\x13\x62\x13\xf1\xea\x20\x7d\x1e\
-\x5e\x1a\xd7\x6a\xb5\xf8\x8b\xbf\xf8\x0b\x2c\x5f\xbe\x5c\xe0\x08\
-\x9a\x13\x74\xfc\xf8\x71\x11\xee\xbc\x5e\xef\xa1\x79\x31\x9e\xe7\
-\xfa\x81\x6f\x7c\xe3\x1b\x33\xed\xed\xed\x7b\xe8\xc3\x74\x77\x77\
-\x63\x64\x64\x44\x4c\xb1\x5c\xbf\x7e\x3d\x56\xaf\x5e\x2d\x16\x9f\
-\x76\x0e\x1f\x82\x40\x69\x98\xc1\x60\x40\x34\x1a\xc5\x81\x03\x07\
-\x50\x55\x55\x85\x8e\x8e\x0e\xc8\xb2\x8c\x44\x22\x81\x78\x3c\x8e\
-\x37\xdf\x7c\x13\x03\x03\x03\xb0\xd9\x6c\xf0\xf9\x7c\x62\xda\x08\
-\x1d\xed\xc6\x5b\xa3\xe7\x5a\x5c\x7a\x51\xcc\xe7\x3d\x04\x54\x80\
-\x21\xd5\x0c\x7f\xd0\x64\x18\xe4\x7a\x2b\xb9\x76\xfe\xe2\x06\xc6\
-\x95\xbe\xbc\x43\x0a\xf8\xfd\x71\xf2\x75\x75\x75\x18\x1f\x1f\xc7\
-\xfe\xfd\xfb\x31\x36\x36\x26\x66\x2a\x2e\x5b\xb6\x0c\x53\x53\x53\
-\x18\x1c\x1c\x14\x65\x60\x0a\xa3\x7c\x96\x12\xdf\x48\x16\x8b\x05\
-\x9b\x37\x6f\x16\x2a\x2d\x49\x92\x10\x0c\x06\xb1\x77\xef\x5e\x11\
-\x3e\xce\x64\x6a\xf7\x7d\x20\x06\x70\x86\x14\xba\x93\x0f\x36\xee\
-\xe9\xe9\xc1\xd4\xd4\x14\x2c\x16\x8b\x08\x05\x35\x35\x35\x65\xed\
-\x63\xfc\x81\x2b\xbb\x78\x0b\x85\x02\x0e\x1c\x38\x00\x95\x4a\x85\
-\x65\xcb\x96\x41\xa3\xd1\x60\x72\x72\x52\x8c\x70\x7f\xeb\xad\xb7\
-\x10\x8b\xc5\xe0\x76\xbb\xd1\xd2\xd2\x22\x86\x23\xd0\x1c\xdd\x74\
-\x3a\x2d\x6a\xe6\x14\x26\x68\x37\x90\x0c\x8d\x0b\x52\x09\x21\x93\
-\xd0\x93\x63\x05\xda\xc5\x94\x6b\x73\x89\x38\xf7\x38\xbc\xad\x8d\
-\xeb\xfb\x28\x8d\x25\x3d\x04\x09\x36\x6a\x6a\x6a\xd0\xd0\xd0\x80\
-\x42\xa1\x80\xa3\x47\x8f\xa2\xb7\xb7\x17\x33\x33\x33\x62\xc4\x7d\
-\x47\x47\x07\x8e\x1f\x3f\x8e\xd3\xa7\x4f\x97\x9d\x26\xce\xeb\x10\
-\x7c\xfa\x39\x19\xd6\x55\x57\x5d\x25\xc4\x39\x54\x26\xee\xef\xef\
-\x17\x94\xb1\x46\xa3\xc1\x45\x17\x5d\xf4\xdc\xb9\x46\xc3\x9c\x97\
-\x01\x7c\xf7\xbb\xdf\x3d\xe4\x76\xbb\x07\x49\x48\x71\xf4\xe8\x51\
-\xf4\xf7\xf7\x8b\x73\x7e\xbc\x5e\x2f\x6e\xbc\xf1\x46\xd8\xed\x76\
-\x41\x5d\xd2\x02\xd0\xa0\x68\x8b\xc5\x22\x9a\x1b\xc8\xda\xfb\xfa\
-\xfa\x90\xcf\xe7\xb1\x62\xc5\x0a\x38\x1c\x0e\xcc\xce\xce\x22\x12\
-\x89\x20\x99\x4c\x62\xff\xfe\xfd\xe8\xed\xed\x45\x34\x1a\x85\xc7\
-\xe3\x11\x7c\x37\x27\x55\x78\xfa\x26\xcb\xb2\x38\x75\x4c\xb9\x53\
-\xf9\xb8\x19\x0a\x55\xfc\xf7\x33\x99\x4c\x59\x0a\x48\x9f\x91\x00\
-\x24\x71\x12\xe4\xda\x49\xf6\x46\x95\x52\x1a\x30\x61\xb1\x58\xd0\
-\xd0\xd0\x80\xf6\xf6\x76\xa8\x54\x2a\xf8\xfd\x7e\x1c\x3e\x7c\x18\
-\xa3\xa3\xa3\xa2\x54\x2e\x49\x12\x96\x2d\x5b\x86\xc1\xc1\x41\x71\
-\x9c\x1c\xaf\x6b\x28\xf5\x96\x7c\x8e\xe1\xc6\x8d\x1b\x71\xd5\x55\
-\x57\x09\x0f\x43\xef\xb1\x7b\xf7\x6e\x31\xb8\xcb\x62\xb1\xcc\x2c\
-\x5f\xbe\x7c\xde\xe7\x0b\xce\xfb\xc0\x88\xde\xde\xde\x89\x81\x81\
-\x81\xcf\xd0\x8e\x48\x24\x12\x68\x6c\x6c\x84\x5e\xaf\x47\x53\x53\
-\x13\x16\x2d\x5a\x04\xad\x56\x8b\x9e\x9e\x1e\xa8\xd5\x6a\xd4\xd5\
-\xd5\x89\xd3\xb8\x79\x4f\x1f\x97\x56\x11\x17\xae\xd7\xeb\xd1\xd2\
-\xd2\x02\xbd\x5e\x8f\xf1\xf1\x71\x31\x59\x2b\x1e\x8f\x8b\x83\x25\
-\xe8\xe8\x78\x9b\xcd\x06\x9b\xcd\x26\x1e\x02\xe1\x08\x8e\x9c\x69\
-\x3e\x31\x57\xd1\x72\xed\x1f\x3f\x1b\x50\xa9\x36\xa2\xbf\x43\x02\
-\x4c\x3a\x06\x9e\x0e\x96\xa6\xdf\xe1\x5c\x87\xcd\x66\x43\x6d\x6d\
-\xad\x18\xf4\xec\xf7\xfb\x31\x38\x38\x88\xa9\xa9\x29\x71\x50\x54\
-\x36\x9b\x45\x55\x55\x15\x4c\x26\x13\x4e\x9f\x3e\x8d\x68\x34\x8a\
-\x78\x3c\x5e\x26\x62\xa5\xd0\x44\xfd\x14\xf5\xf5\xf5\x98\x9e\x9e\
-\xc6\xcc\xcc\x0c\x9a\x9b\x9b\xf1\x57\x7f\xf5\x57\x50\xa9\x54\x68\
-\x6c\x6c\x44\x36\x9b\xc5\xf0\xf0\x30\x5e\x7a\xe9\x25\x74\x77\x77\
-\x0b\x3d\xa6\xc7\xe3\x39\xf2\xdc\x73\xcf\x3d\x30\x5f\x03\x98\xf7\
-\x30\xbc\x7f\xfe\xe7\x7f\xfe\xe5\xfe\xfd\xfb\x8f\xc4\x62\xb1\x4e\
-\xbd\x5e\x8f\x91\x91\x11\xec\xda\xb5\x0b\x9d\x9d\x9d\x58\xb2\x64\
-\x09\x8a\xc5\x22\x6e\xba\xe9\x26\xf8\xfd\x7e\xbc\xf6\xda\x6b\xe2\
-\x66\x22\x91\x08\x1c\x0e\xc7\x7b\x26\x88\x92\xeb\x76\x3a\x9d\x98\
-\x99\x99\x81\xdf\xef\x47\x47\x47\x07\x2e\xbd\xf4\x52\xc1\x16\x92\
-\x3a\x37\x95\x4a\x21\x14\x0a\xa1\xaa\xaa\x0a\xb5\xb5\xb5\xa8\xae\
-\xae\x46\x7d\x7d\xbd\x90\x9b\xa5\x52\x29\x21\x47\xe7\x44\x0e\xcf\
-\x08\x2a\xc9\xb5\xe7\x22\x75\xf8\xe1\x13\xbc\x5d\x8d\xd3\xc9\x94\
-\x52\xd2\x88\xf7\xd9\xd9\x59\x04\x83\x41\x4c\x4f\x4f\x23\x91\x48\
-\x20\x99\x4c\x22\x1e\x8f\x43\x96\x65\x31\x1d\x94\x0c\x5a\x92\x24\
-\x58\xad\x56\x44\x22\x91\xb2\x70\xc9\x07\x59\x67\xb3\x59\x38\x1c\
-\x0e\x44\x22\x11\x78\xbd\x5e\x7c\xe5\x2b\x5f\x41\x53\x53\x93\x10\
-\x7f\x52\x87\x74\x77\x77\xb7\x08\x55\x66\xb3\x39\xb0\x6e\xdd\xba\
-\x87\x71\x1e\xd7\x79\x4d\x43\xdc\xb4\x69\xd3\x9d\x3b\x76\xec\x78\
-\x45\xa3\xd1\xe8\x4a\xa5\x12\xba\xbb\xbb\xc5\xb9\xbf\x74\xdd\x76\
-\xdb\x6d\x48\x26\x93\x18\x1a\x1a\x12\xb1\x93\x1a\x35\x22\x91\xc8\
-\x7b\x7a\x0c\x69\x41\x66\x67\x67\xb1\x67\xcf\x1e\x34\x36\x36\x8a\
-\x82\xd3\xf0\xf0\x30\xfc\x7e\x3f\x5c\x2e\x97\x98\x27\x1c\x0c\x06\
-\x61\xb5\x5a\x51\x55\x55\x85\xaa\xaa\x2a\x78\x3c\x1e\xd8\xed\x76\
-\x38\x1c\x0e\xb1\x93\x68\xd2\x26\xed\xf6\x4a\x07\x48\x9d\x6b\xda\
-\x37\xef\xe4\xe1\x2f\x65\xc5\x33\x12\x89\x20\x16\x8b\x21\x16\x8b\
-\x21\x1a\x8d\x8a\xea\x27\x1d\x90\xd1\xd4\xd4\x04\x00\x02\x3c\x57\
-\x57\x57\xa3\xb9\xb9\x59\x84\x13\xde\xa8\xca\xb5\x85\x16\x8b\x05\
-\x43\x43\x43\xd0\xeb\xf5\xb8\xe3\x8e\x3b\x70\xc9\x25\x97\x20\x95\
-\x4a\xc1\xe3\xf1\x08\x5d\xc5\x91\x23\x47\x04\x8b\x9a\xcb\xe5\x50\
-\x53\x53\xb3\xef\xc7\x3f\xfe\xf1\x4b\x1f\x9a\x01\x3c\xfa\xe8\xa3\
-\xbb\x0f\x1d\x3a\xb4\x3b\x16\x8b\x5d\x43\x2e\xda\xef\xf7\xa3\xbf\
-\xbf\x1f\x2b\x57\xae\x84\xd1\x68\x44\x7d\x7d\x3d\x6e\xbb\xed\x36\
-\xfc\xec\x67\x3f\x43\x7f\x7f\x3f\x3c\x1e\x8f\x88\xb1\xf4\xe0\x09\
-\x21\x13\x56\x20\x80\xa6\x52\xa9\x30\x3c\x3c\x8c\x40\x20\x80\xe5\
-\xcb\x97\x63\xc9\x92\x25\x68\x6d\x6d\xc5\xf0\xf0\x30\xfa\xfb\xfb\
-\x29\xbd\x11\x64\xc8\xec\xec\x2c\x46\x47\x47\x45\x0b\x98\xd3\xe9\
-\x14\xdd\x31\xa4\x4a\xae\x94\xa3\xf3\x96\x36\xa5\x87\x50\x9e\x2c\
-\x4a\xbb\x31\x9b\xcd\x22\x1e\x8f\x8b\xd1\xb7\xd1\x68\x54\x00\xbf\
-\x74\x3a\x2d\x0c\x80\x6a\x21\x8d\x8d\x8d\x00\x00\xbf\xdf\x2f\x46\
-\xb8\x11\x2d\x4c\x46\xc9\x3d\x14\x79\x02\xae\x11\xec\xef\xef\xc7\
-\xb6\x6d\xdb\x70\xd5\x55\x57\x61\x7a\x7a\x1a\x5e\xaf\x57\x00\xd5\
-\xfd\xfb\xf7\x23\x18\x0c\xf2\xa1\x56\xb1\xae\xae\xae\xf3\x3e\x4c\
-\xf2\xbc\xe7\xa1\x6e\xdc\xb8\xf1\xee\x5f\xfd\xea\x57\x2b\x4d\x26\
-\x93\xb7\x54\x2a\xe1\xe8\xd1\xa3\x30\x9b\xcd\x30\x99\x4c\x58\xb1\
-\x62\x05\x46\x46\x46\xd0\xd4\xd4\x84\x6d\xdb\xb6\xe1\x9f\xfe\xe9\
-\x9f\x10\x0c\x06\xcb\x1a\x3f\x79\x5f\xbe\x72\x6c\x0c\x09\x2d\x93\
-\xc9\x24\xf6\xee\xdd\x8b\xaa\xaa\x2a\x2c\x5a\xb4\x08\x1d\x1d\x1d\
-\x00\x7e\x3f\x12\x75\x6a\x6a\x0a\x93\x93\x93\xb0\x5a\xad\x30\x99\
-\x4c\xe2\x64\x92\x99\x99\x19\x8c\x8d\x8d\x89\xb3\x0a\x88\x4b\xa8\
-\xa4\xcd\xa3\xbe\xbb\xb9\x8e\x82\xe3\x3d\x09\x84\xda\xc9\x48\x69\
-\xc1\x8b\xc5\x22\xc2\xe1\xb0\xc0\x28\x64\x74\x1e\x8f\x07\x92\x24\
-\xe1\xe4\xc9\x93\x62\xd6\x31\xaf\x88\x52\xa3\x0d\x57\x56\x53\x81\
-\x88\x8a\x60\x67\x9a\x39\xb0\x75\xeb\x56\xdc\x7c\xf3\xcd\x08\x87\
-\xc3\x65\x3d\x0b\xbb\x77\xef\x16\x61\xf6\x0c\xde\x19\x6c\x69\x69\
-\xd9\xf7\xc3\x1f\xfe\x70\xcf\x79\x97\xbd\xdf\x4f\xdd\xfc\x4b\x5f\
-\xfa\xd2\x5d\xfd\xfd\xfd\xb7\xbb\xdd\xee\x8e\x74\x3a\x0d\x8b\xc5\
-\x82\x0d\x1b\x36\xe0\xd6\x5b\x6f\x15\x68\x5e\xa5\x52\x61\x7c\x7c\
-\x1c\x4f\x3c\xf1\x04\x62\xb1\x18\xec\x76\x3b\x06\x06\x06\x04\xe7\
-\x4f\x95\xaf\xd6\xd6\x56\x04\x02\x01\x8c\x8e\x8e\x96\xf5\xeb\x93\
-\xe2\x95\x26\x81\x2e\x5a\xb4\x48\x00\xc5\x54\x2a\x85\x60\x30\x88\
-\x48\x24\x22\x06\x52\x58\xad\x56\x18\x8d\x46\x51\xe1\xa3\x2c\xa4\
-\x52\x35\x90\x0f\x70\xe2\x05\x23\x3e\x9e\x85\x8c\x82\x1b\x00\x75\
-\x3d\xa5\x52\x29\xd1\xac\x69\x36\x9b\x45\x3e\x9e\x4a\xa5\x44\x37\
-\x72\x34\x1a\x85\xdb\xed\x16\x1d\xd3\xc4\x2e\x5a\xad\x56\xb4\xb7\
-\xb7\x8b\xf1\xae\xbc\xb3\x88\xaa\xa6\xa7\x4f\x9f\xc6\xf5\xd7\x5f\
-\x8f\x2f\x7d\xe9\x4b\x42\xd2\x55\x5b\x5b\x0b\x8d\x46\x83\xd7\x5f\
-\x7f\x1d\xcf\x3e\xfb\xac\x38\x5b\xe8\x4c\xd7\xf0\xee\x37\xde\x78\
-\xe3\xca\xf7\xa5\x7b\x78\xbf\xc2\x89\x75\xeb\xd6\xf5\xd9\x6c\xb6\
-\x0e\x8a\xe9\x36\x9b\x0d\x5b\xb7\x6e\xc5\x95\x57\x5e\x09\x8b\xc5\
-\x22\x0e\x72\x38\x7d\xfa\x34\x9e\x79\xe6\x19\x8c\x8c\x8c\x88\x9e\
-\x02\x2a\x1e\x39\x9d\x4e\xb4\xb6\xb6\x62\x7a\x7a\x5a\x90\x21\x34\
-\x57\x80\xc7\x44\x12\x3a\x1a\x8d\x46\xd4\xd4\xd4\xc0\xe7\xf3\xa1\
-\xae\xae\x4e\xb4\xa0\xcf\xcc\xcc\x88\x33\x09\x08\x03\x10\x08\xe5\
-\xa4\x4d\x25\x4f\xc0\x15\x45\xf4\xbb\x84\xf4\xc9\xdd\x93\x9b\x25\
-\x86\x90\x4e\x43\x23\x83\x0d\x06\x83\x18\x1d\x1d\x15\x87\x3f\x11\
-\xd8\xa5\x82\x0e\x1d\x93\x43\xe0\x72\xd9\xb2\x65\x48\x24\x12\x38\
-\x76\xec\x98\xe8\x0d\x20\x51\x48\x55\x55\x15\xd6\xad\x5b\x87\x5b\
-\x6e\xb9\x45\x64\x3a\x3e\x9f\x0f\x34\xa8\xfb\x3f\xff\xf3\x3f\x31\
-\x30\x30\x20\x70\x48\xb1\x58\xdc\xd3\xda\xda\xfa\xfc\xd3\x4f\x3f\
-\xfd\x93\x8f\xd4\x00\x1e\x7d\xf4\x51\xdb\x33\xcf\x3c\xd3\x53\x53\
-\x53\xd3\x4c\x22\x4f\x83\xc1\x80\x2b\xaf\xbc\x12\xd7\x5d\x77\x1d\
-\x8c\x46\x23\x4e\x9e\x3c\x29\x52\x99\x27\x9e\x78\x02\xbb\x77\xef\
-\x16\xe3\x63\x72\xb9\x1c\x6a\x6b\x6b\xd1\xd6\xd6\x86\xe9\xe9\x69\
-\x8c\x8d\x8d\x95\x89\x19\xb9\xe0\x94\x83\x23\x3e\x9f\xc0\xe7\xf3\
-\xa1\xbe\xbe\x1e\x2e\x97\x4b\xc4\x7e\x8a\xd9\x64\x10\xe4\xba\x29\
-\x57\xe7\x8a\x22\x0e\x44\x79\x73\x09\x7d\x8f\x0a\x48\x9c\x2a\x4e\
-\xa7\xd3\x48\x24\x12\x08\x85\x42\x22\x04\x50\xaa\x4b\x80\x97\x8e\
-\xcd\xa1\xa3\xf1\xc8\x70\x28\xd5\xeb\xec\xec\xc4\xd8\xd8\x18\x26\
-\x26\x26\x10\x8b\xc5\x60\x36\x9b\xc5\x6c\xa5\xcf\x7d\xee\x73\xb8\
-\xed\xb6\xdb\x30\x3b\x3b\x2b\x64\x78\x56\xab\x15\x27\x4f\x9e\xc4\
-\x33\xcf\x3c\x03\x1a\xd7\x4f\xa4\x96\xc1\x60\x78\x6a\xc7\x8e\x1d\
-\x7f\xfb\x7e\x95\x4f\xef\x7b\x26\xfa\xdd\x77\xdf\x1d\xeb\xee\xee\
-\xfe\xf9\xd4\xd4\xd4\x06\xb5\x5a\xbd\x95\xd8\xb3\x83\x07\x0f\x42\
-\xab\xd5\xe2\xf2\xcb\x2f\xc7\xe2\xc5\x8b\x51\x2c\x16\xd1\xd6\xd6\
-\x86\x6f\x7c\xe3\x1b\xa8\xa9\xa9\xc1\x8e\x1d\x3b\x04\x20\xa2\x07\
-\x47\xb1\x9f\x94\xc3\x24\x90\xe4\xe5\xda\x4a\x0d\x18\x74\x64\x0c\
-\x11\x54\x76\xbb\x5d\x9c\xbb\x47\xbd\x8c\x4a\x65\x0f\x57\xed\x9c\
-\xeb\x78\xba\x6c\x36\x8b\x64\x32\x89\x70\x38\x2c\x4e\x2b\x21\x94\
-\x4f\xe3\xe4\x48\xcf\xcf\x5b\xd8\x75\x3a\x9d\x50\xf8\xd2\xc2\x73\
-\x1d\x63\x2a\x95\x12\xf7\x4a\x0d\x22\xad\xad\xad\xd8\xb6\x6d\x1b\
-\x36\x6f\xde\x2c\xb2\x26\xad\x56\x0b\x9b\xcd\x86\xbe\xbe\x3e\xbc\
-\xf0\xc2\x0b\x98\x98\x98\x28\x9b\x6c\x9e\xcb\xe5\x76\x6f\xd9\xb2\
-\xe5\xee\x0b\x92\xbe\x5d\xa8\x76\xee\xd6\x5b\x6f\xfd\x7e\x3a\x9d\
-\x76\x1b\x0c\x86\xed\xa5\x52\x09\xb2\x2c\xa3\xba\xba\x1a\x57\x5e\
-\x79\x25\x2e\xbd\xf4\x52\x78\xbd\x5e\xb1\xd3\xe8\xfc\xbe\x7f\xfd\
-\xd7\x7f\xc5\xe8\xe8\x28\x6a\x6b\x6b\xd1\xd9\xd9\x89\x89\x89\x09\
-\x8c\x8f\x8f\xa3\xa6\xa6\x06\xd1\x68\xb4\xac\x05\x7a\xae\x2a\x5f\
-\xa5\xc3\xa4\xb8\x38\x93\x46\xac\xf3\x62\x8d\x52\x46\xa6\xe4\x05\
-\xf8\x31\xb5\x34\x5b\x80\x18\x37\x42\xea\x64\xe8\xbc\xa5\x9d\xbe\
-\xa7\x6c\x16\xa5\xbf\x43\x83\xb4\xe9\x77\x96\x2e\x5d\x8a\x70\x38\
-\x8c\xde\xde\x5e\xa8\xd5\x6a\x5c\x7d\xf5\xd5\xb8\xe5\x96\x5b\xd0\
-\xd9\xd9\x29\x1a\x68\xa8\xa1\xa6\xb7\xb7\x17\xaf\xbd\xf6\x1a\x0e\
-\x1f\x3e\x2c\xb0\x93\x24\x49\x98\x99\x99\xd9\xb1\x76\xed\xda\x1f\
-\x3c\xf2\xc8\x23\xfb\xfe\xa0\x06\x00\x00\xd7\x5e\x7b\xed\xf3\x4e\
-\xa7\xf3\xd3\x14\xef\x28\x4e\x6e\xd9\xb2\x05\x57\x5c\x71\x05\x6c\
-\x36\x9b\x00\x6b\xc5\x62\x11\xfb\xf6\xed\xc3\xf3\xcf\x3f\x8f\xc1\
-\xc1\x41\x2c\x5a\xb4\x08\x99\x4c\x06\x3d\x3d\x3d\xf0\x78\x3c\x22\
-\x4d\xa4\x71\x28\xca\x73\x04\x95\xe3\x60\xb9\xb4\x5a\x79\x4e\x5f\
-\xa5\xce\x1e\xfe\x77\x94\x46\xc5\x31\x01\x1f\x87\xc7\x67\xf9\x91\
-\x67\xa0\xcf\x47\xbb\x9b\x7b\x15\x4a\x33\x4d\x26\x93\xa0\x9a\x69\
-\x7a\x78\xa1\x50\xc0\xaa\x55\xab\x30\x3d\x3d\x8d\xc9\xc9\x49\xdc\
-\x7a\xeb\xad\xf8\xd4\xa7\x3e\x05\x8b\xc5\x02\x00\xa2\xcf\x2f\x9d\
-\x4e\xe3\xf0\xe1\xc3\xd8\xb9\x73\x27\x06\x07\x07\x85\x06\x50\xa7\
-\xd3\x21\x12\x89\xfc\xb2\xa5\xa5\x65\xc7\x4f\x7f\xfa\xd3\x5f\x5c\
-\xe8\xda\xbd\xef\xb3\x83\xf9\x75\xfc\xf8\xf1\x93\xc7\x8e\x1d\x6b\
-\xf3\x7a\xbd\x2d\x0e\x87\x43\xb8\xa8\xb1\xb1\x31\xc4\xe3\x71\x78\
-\xbd\x5e\xd4\xd4\xd4\x08\x34\xdc\xde\xde\x8e\xd5\xab\x57\xc3\xe1\
-\x70\x20\x91\x48\x60\x74\x74\x14\x91\x48\x44\x8c\x35\x21\x0d\x01\
-\x17\x76\xf2\x38\xad\x6c\xcb\x9a\xcf\x0c\x5f\x0a\x07\x95\x5a\xd0\
-\x2a\xcd\x27\x50\xf2\x06\x4a\x23\xa2\xea\x27\x7d\x16\xe5\xd1\xb0\
-\x64\x0c\x74\xb0\x83\xc9\x64\x12\x53\x40\x6b\x6a\x6a\xd0\xd9\xd9\
-\x89\xbf\xff\xfb\xbf\xc7\x25\x97\x5c\x22\xce\x0e\xd6\x6a\xb5\xa8\
-\xaa\xaa\xc2\xe4\xe4\x24\xf6\xef\xdf\x8f\x57\x5f\x7d\x15\x7e\xbf\
-\x5f\xb0\x89\x67\x4e\x1e\x7f\x4a\xab\xd5\xca\xff\xf1\x1f\xff\xf1\
-\x3d\x7c\x00\xd7\x07\x62\x00\x5b\xb6\x6c\x99\x3c\x79\xf2\x64\xef\
-\x81\x03\x07\xd6\x74\x75\x75\xd5\x06\x02\x01\x01\x86\xa6\xa6\xa6\
-\x44\x1a\xe8\xf5\x7a\xc5\xb8\x13\x9b\xcd\x86\xce\xce\x4e\x71\x8a\
-\xa7\xdf\xef\x17\x35\xef\x42\xa1\x80\x48\x24\x22\x88\x11\xe5\x58\
-\x5a\x0e\x10\x95\x6a\x5e\x5e\x93\x57\xaa\x86\xf8\x91\x6d\xca\x5e\
-\x3f\xe5\x10\x2b\x72\xf3\x7c\xb4\x0b\x6f\x83\xa7\x93\x4b\x29\x64\
-\x54\x3a\x21\x94\xc4\x31\x3c\x03\xe8\xea\xea\xc2\xe7\x3f\xff\x79\
-\x6c\xdd\xba\x15\x1e\x8f\xa7\xac\xd1\x96\x0e\xe5\xd8\xbb\x77\x2f\
-\x5e\x7e\xf9\x65\x4c\x4f\x4f\x8b\xe2\x56\x6d\x6d\x2d\x42\xa1\xd0\
-\x23\xe9\x74\xda\xfd\xc2\x0b\x2f\xfc\x0d\x3e\xa0\xeb\x03\x09\x01\
-\x4c\x42\xb6\x21\x1a\x8d\x36\xa7\x52\xa9\x67\xe9\x9c\x40\x52\xe0\
-\xba\xdd\x6e\x7c\xe6\x33\x9f\x11\x22\xc6\x74\x3a\x2d\x50\xb3\x4a\
-\xa5\xc2\xf1\xe3\xc7\xf1\xdb\xdf\xfe\x16\xcf\x3c\xf3\x8c\x68\x22\
-\x55\xb6\x52\x93\x7a\x97\x8b\x3e\x95\x23\x6a\x78\x4e\xaf\x64\x02\
-\x95\xbb\xb9\x52\xc7\xb1\x72\x22\x99\x72\x10\x16\x9f\x59\xa0\x7c\
-\x3f\x1e\x56\x88\xc3\xa0\x5d\xbf\x7e\xfd\x7a\xfc\xf5\x5f\xff\x35\
-\xd6\xac\x59\x83\xaa\xaa\x2a\x91\x72\x72\x11\xed\xc4\xc4\x04\x76\
-\xef\xde\x8d\x7d\xfb\xf6\x89\x2a\x6a\xa9\x54\x82\xcd\x66\x43\x5d\
-\x5d\x1d\xf6\xef\xdf\xbf\xe3\xd5\x57\x5f\xfd\x4b\x7c\x80\xd7\x07\
-\xe2\x01\x98\x27\x18\xeb\xed\xed\x9d\x3c\x7a\xf4\xe8\x62\xa7\xd3\
-\xd9\x41\xba\x77\x22\x53\xa6\xa6\xa6\x44\x27\x2b\xe5\xe9\x34\x88\
-\xa2\xbe\xbe\x1e\x97\x5e\x7a\x29\x16\x2f\x5e\x8c\x4c\x26\x83\x53\
-\xa7\x4e\x95\xcd\x19\x24\x16\x8e\xb7\x4f\xf3\xd8\xcc\x45\xa2\xca\
-\x51\x33\xbc\xa7\x80\x53\xbe\xdc\x53\x54\xd2\xfe\xf3\x36\x34\x8e\
-\x39\xa8\x7e\x4f\x1c\x08\x55\x1f\xb9\x97\x4a\x26\x93\xc8\x64\x32\
-\x68\x6d\x6d\xc5\x1d\x77\xdc\x81\xaf\x7c\xe5\x2b\x58\xb5\x6a\x95\
-\x38\x6f\x81\xe8\x60\x22\xbd\x0e\x1c\x38\x80\xdf\xfc\xe6\x37\xe8\
-\xef\xef\x47\x34\x1a\x2d\x9b\x3d\x70\x66\x58\xf7\x7d\x9b\x36\x6d\
-\xfa\xda\xc5\x17\x5f\x5c\xfc\x20\x0d\xe0\x03\xf5\x00\x74\x3d\xf0\
-\xc0\x03\x6b\x0e\x1e\x3c\x78\x6f\x6d\x6d\xed\xa7\x69\xca\xb8\xc9\
-\x64\x12\xf3\x78\x3a\x3a\x3a\xb0\x79\xf3\x66\xd4\xd7\xd7\x8b\x9d\
-\x9e\x4e\xa7\x05\x52\x2f\x16\x8b\x78\xf3\xcd\x37\xb1\x63\xc7\x0e\
-\xec\xda\xb5\x4b\x9c\xa0\xc5\xd5\x3d\xd4\x64\x41\x75\x7a\x5e\xac\
-\xe1\x93\x33\xe6\xca\x22\xf8\x60\x66\xbe\x73\x39\x90\xa4\x5d\xcd\
-\x33\x05\x5e\xd2\xa6\x92\x31\xbd\x2f\x2d\x3a\xe1\x9c\x9b\x6e\xba\
-\x09\x37\xdc\x70\x03\x3c\x1e\x4f\x99\x47\x91\x65\x59\x34\x84\xd2\
-\xf8\xba\x7d\xfb\xf6\x21\x16\x8b\x09\x85\x14\xdd\xa7\xc9\x64\xba\
-\x2f\x1e\x8f\x37\x5f\x76\xd9\x65\x77\x9e\xef\xc1\xd0\x7f\x30\x03\
-\x38\x23\x25\xdb\xdc\xdd\xdd\xfd\xbf\xab\xaa\xaa\x6e\x24\xf4\xac\
-\xd1\x68\x44\xfe\x5b\x5b\x5b\x8b\xd5\xab\x57\x63\xcd\x9a\x35\x70\
-\x3a\x9d\xef\x99\x9f\x43\xc3\x91\x8e\x1d\x3b\x86\x9d\x3b\x77\xe2\
-\xcd\x37\xdf\xc4\xd8\xd8\x98\x88\xdf\xbc\xbb\x87\x7e\x8f\xcf\xe0\
-\xa3\xc2\x4b\xa5\x0e\x22\xe5\x4c\xbf\x4a\x7a\x7f\x12\x8b\xf0\x6a\
-\x22\xdf\xb9\xf4\x3e\xe4\x91\xf2\xf9\x3c\x5c\x2e\x17\x2e\xb9\xe4\
-\x12\x6c\xda\xb4\x09\x5b\xb6\x6c\x11\x87\x3f\xd2\xa2\x93\xd7\xa0\
-\xf6\xad\xe1\xe1\x61\xfc\xcf\xff\xfc\x0f\x26\x26\x26\x08\xdd\x8b\
-\xc5\x3f\x53\x5b\xf8\xf2\xc9\x93\x27\x6f\x7c\xed\xb5\xd7\xfe\x12\
-\x1f\xd2\xf5\xa1\x19\x00\x61\x82\xde\xde\xde\xed\x4e\xa7\xf3\x76\
-\x1a\x37\x47\xa3\xe7\xa9\x09\x64\xf9\xf2\xe5\x58\xbf\x7e\x3d\x5a\
-\x5a\x5a\x04\xd0\xe2\x32\x68\x3a\x30\x71\x64\x64\x04\x07\x0f\x1e\
-\xc4\x3b\xef\xbc\x83\xc1\xc1\x41\xa1\x1c\xa2\x33\x0c\xf8\x41\x94\
-\xd4\x70\xa1\x1c\x1d\x33\x57\xe9\xb7\x52\x51\xa8\xd2\x38\x7c\xfe\
-\x3d\xda\xe9\x56\xab\x15\x6d\x6d\x6d\xb8\xe4\x92\x4b\xb0\x6e\xdd\
-\x3a\xb4\xb4\xb4\xc0\xe9\x74\x8a\x36\x39\x3e\x11\x84\x98\xc4\x64\
-\x32\x89\x3d\x7b\xf6\xe0\xad\xb7\xde\x12\xe2\x17\xea\xeb\x23\x02\
-\x49\xab\xd5\x7e\x79\x62\x62\xe2\xb2\x17\x5f\x7c\xf1\xcb\xf8\x10\
-\xaf\x0f\xd5\x00\x00\xe0\x87\x3f\xfc\xa1\xfb\xc0\x81\x03\xdf\xf4\
-\xf9\x7c\xfb\x9c\x4e\xe7\xb3\xb1\x58\x0c\xf1\x78\x1c\x89\x44\x42\
-\x90\x34\x67\x5a\x98\x70\xf1\xc5\x17\xa3\xbe\xbe\x5e\xc4\x76\x12\
-\x7b\xd0\x22\xab\xd5\x6a\x84\x42\x21\x4c\x4e\x4e\xe2\xc8\x91\x23\
-\xf0\xfb\xfd\x18\x1e\x1e\x46\x28\x14\x42\x3c\x1e\x47\x32\x99\x14\
-\x32\x70\xae\x3b\x50\x36\x7b\x2a\x4f\xeb\x9a\xcb\x28\xf8\x01\x14\
-\x24\x14\xa5\xea\x63\x4b\x4b\x0b\x96\x2d\x5b\x86\xe5\xcb\x97\x0b\
-\x25\x33\x3f\x85\x9c\x8e\xa0\xa7\x1e\x09\x49\x92\x10\x89\x44\x70\
-\xe0\xc0\x01\xbc\xf3\xce\x3b\x98\x98\x98\x10\x4c\x23\xf5\x4a\x50\
-\xed\x60\x64\x64\xe4\x11\xa7\xd3\xd9\xff\x41\xe4\xf9\x7f\x70\x03\
-\xa0\xeb\xfe\xfb\xef\x5f\x53\x2a\x95\x74\x06\x83\x61\x6f\x34\x1a\
-\x15\x67\x01\x1b\x0c\x06\x51\xbd\xb3\x5a\xad\x58\xbe\x7c\x39\x56\
-\xae\x5c\x89\x86\x86\x86\xb2\x9d\x47\x03\x14\xf8\x11\xef\xb1\x58\
-\x4c\x9c\x22\x1e\x0c\x06\x11\x0c\x06\x31\x39\x39\x89\xd9\xd9\x59\
-\x44\xa3\xd1\x32\x35\x71\xa5\xa1\x92\xca\x79\xc7\x1c\xf0\x91\xea\
-\x99\xe8\x65\xb7\xdb\x2d\x0e\x65\xf4\x7a\xbd\xf0\x7a\xbd\x65\x4d\
-\x26\xbc\xd5\x9d\xff\xbe\x56\xab\xc5\xec\xec\x2c\x7a\x7b\x7b\xd1\
-\xdd\xdd\x8d\xb1\xb1\xb1\xb2\xb2\xb2\x2c\xcb\x68\x68\x68\x40\x5b\
-\x5b\x1b\x8a\xc5\x22\xfa\xfb\xfb\xff\x57\x75\x75\xf5\xa1\x0b\x65\
-\xf8\x3e\x76\x06\x70\x46\x5c\xda\x9c\xcd\x66\x6d\xf9\x7c\xde\x14\
-\x0a\x85\xf6\x26\x12\x09\xa1\x9b\x27\xb5\xad\xc9\x64\x82\xc5\x62\
-\x41\x5b\x5b\x1b\x96\x2f\x5f\x8e\xfa\xfa\xfa\xb2\xfe\x00\x7a\x70\
-\xe4\x25\xf8\x0e\x25\x95\x2c\x9d\x58\x9a\x4a\xa5\x84\x5a\x87\xf4\
-\x89\x64\x10\x7c\xc1\xa9\x5f\x90\x0b\x40\x2d\x16\x0b\xcc\x66\x33\
-\x9c\x4e\x27\x6c\x36\x9b\x50\xed\xd0\x42\x13\x5b\x49\xde\x83\x08\
-\x2a\xfa\xfc\xd9\x6c\x16\x13\x13\x13\x38\x71\xe2\x04\x86\x86\x86\
-\x10\x0c\x06\x91\x4c\x26\xc5\xe7\xa7\x7b\xd2\xeb\xf5\x58\xb5\x6a\
-\x15\x0a\x85\x82\x2f\x12\x89\xb4\x99\x4c\xa6\xc0\x83\x0f\x3e\x38\
-\xf8\x51\xad\xc9\x47\x6a\x00\x74\xdd\x71\xc7\x1d\xdb\xe3\xf1\x78\
-\xb3\xc9\x64\xba\x97\xa7\x4c\x64\x00\xe4\xbe\x5d\x2e\x17\x6a\x6a\
-\x6a\xd0\xd6\xd6\x86\xd6\xd6\xd6\xb2\x33\x0b\xf9\xc3\x54\x2e\x28\
-\x1f\x3a\xc1\xf9\x78\x65\x2d\x81\x67\x07\xca\x61\xce\x4a\xd4\xaf\
-\xc4\x00\xe4\xd6\x25\x49\x12\x82\x8f\x7c\x3e\x2f\xbc\x11\x2d\x7a\
-\x28\x14\x12\xa7\xa0\xf2\xda\x82\x4a\xa5\x82\xcf\xe7\xa3\xcf\xf0\
-\x59\xa3\xd1\x38\x3b\x9f\x4e\x9e\x3f\x09\x03\x00\x80\xaf\x7d\xed\
-\x6b\x5b\x07\x06\x06\x6e\x75\xb9\x5c\x5f\xb0\x58\x2c\x62\xd7\x52\
-\xed\x9c\xca\xbb\x00\x60\xb5\x5a\x21\x49\x12\x16\x2f\x5e\x8c\xaa\
-\xaa\xaa\xb2\xbe\x79\x49\x92\x40\xb8\x82\x76\x26\x31\x76\x95\xda\
-\xb6\x78\x0a\xa8\x64\x16\x2b\x0d\x98\x20\x76\x91\x4f\xef\x26\x25\
-\x70\xa1\x50\x10\x5e\x25\x10\x08\x60\x7c\x7c\x5c\xa8\x78\x63\xb1\
-\x98\x00\x7c\x44\x07\x13\xab\x47\x43\x1d\x83\xc1\xe0\x83\xf9\x7c\
-\x5e\x5a\xb1\x62\xc5\xff\x99\xaf\x8e\xff\x4f\xc6\x00\x28\x24\x9c\
-\x3c\x79\xf2\xc6\x99\x99\x99\x95\x2e\x97\xeb\x76\x8b\xc5\x22\x0e\
-\x9b\xa2\xb1\x29\x74\x78\x32\x75\xcc\x50\x9f\x9f\xcf\xe7\x13\x1e\
-\xc2\xe1\x70\x08\xc9\x35\xf1\x0e\xca\x86\x0a\x8e\xf0\x89\xc2\x55\
-\xce\x19\x54\xd2\xca\xc4\x2f\x70\xec\x20\xcb\x32\x62\xb1\x98\x18\
-\x98\x41\xca\xa4\x54\x2a\x85\x78\x3c\x8e\x7c\x3e\x5f\xa6\x17\x24\
-\x8e\x9f\xb8\x10\xb3\xd9\x0c\xbd\x5e\x7f\xcb\xf0\xf0\xf0\xf5\xed\
-\xed\xed\xcf\x9d\x6d\x7e\xcf\x9f\xbc\x01\xd0\xf5\xc8\x23\x8f\x78\
-\xdf\x7e\xfb\xed\x47\x00\xa0\xa6\xa6\xe6\x76\x59\x96\x45\x5f\x00\
-\x85\x06\x92\x56\x93\x24\x9b\xc8\x14\x5a\x1c\x8f\xc7\x03\x87\xc3\
-\x01\x83\xc1\x00\x8f\xc7\x03\x8f\xc7\x53\x46\xfa\x70\xb6\x8f\x78\
-\x77\xbe\xf3\x89\x9a\xe5\xdd\x41\xa4\xba\x09\x87\xc3\x08\x87\xc3\
-\x02\x54\xd2\xe2\x73\xdc\x41\x72\x31\xb5\x5a\x2d\x34\x03\xa4\xfd\
-\xb3\x5a\xad\xa2\x25\x7d\x76\x76\xf6\x11\xb5\x5a\x9d\x7f\xf6\xd9\
-\x67\x1f\xc4\xc7\xe0\xfa\x58\x18\x00\x5d\xf7\xdc\x73\xcf\xc6\x93\
-\x27\x4f\xde\x98\xc9\x64\xdc\x4e\xa7\xf3\x76\x22\x6d\xa8\xc3\x88\
-\xc8\x99\xaa\xaa\x2a\x18\x8d\x46\xd8\x6c\x36\x81\xc4\xa9\x56\x4e\
-\x07\x45\x10\x6b\xc8\xe3\xb5\xd9\x6c\x16\xad\x62\xca\xda\x01\x11\
-\x3a\xe9\x74\x1a\xb9\x5c\x4e\xf4\xec\x93\xec\x8c\x88\x1c\x2a\x57\
-\x13\x05\x4c\x29\x2d\xcd\x38\xa0\x43\xb6\xe8\xdf\x84\x29\xc6\xc6\
-\xc6\x7e\xe1\xf5\x7a\x0f\xb5\xb6\xb6\xfe\xf2\xbe\xfb\xee\x1b\xfb\
-\xb8\x3c\xf3\x8f\x95\x01\xd0\xf5\x8f\xff\xf8\x8f\x1b\x47\x47\x47\
-\xaf\x49\x26\x93\x5e\xa3\xd1\xb8\xdd\x60\x30\x88\x41\x12\xfc\xd4\
-\x72\xc2\x00\x16\x8b\x45\xd0\xc2\x74\xc2\x09\xcf\xf9\x39\x70\xe3\
-\xfd\x76\x95\x0e\xac\xe0\xd5\x42\x8e\x23\xc8\x40\xa8\x53\x28\x1e\
-\x8f\x03\xf8\x7d\xcb\x16\x55\xfe\x48\x84\x4a\x40\xf5\xcc\xb4\xd4\
-\xa7\xaa\xab\xab\x0f\x35\x35\x35\xbd\xfa\xc0\x03\x0f\xf8\x3f\x6e\
-\xcf\xfa\x63\x69\x00\x3c\x34\x9c\x38\x71\xe2\x0b\xf1\x78\xbc\x5e\
-\xaf\xd7\xc7\xec\x76\xfb\x37\x01\x94\x55\x05\x49\xf8\x49\x93\x34\
-\xe8\x60\x0b\xd2\xf2\xd1\x2e\xa4\x3a\x84\x72\x40\x04\x2d\x34\xef\
-\x17\xc8\x66\xb3\x98\x9d\x9d\x15\x00\x8e\xa6\x9e\xd1\xd1\x6d\x84\
-\x21\xc8\x20\xf8\x21\x98\x67\x0a\x37\x0f\xe7\xf3\x79\xc9\xe3\xf1\
-\x1c\x59\xb4\x68\xd1\x8e\xbb\xee\xba\x2b\xf6\x71\x7d\xc6\x1f\x6b\
-\x03\xe0\xd7\x57\xbf\xfa\xd5\x5b\x53\xa9\x94\x77\x72\x72\xf2\x32\
-\xb7\xdb\xfd\x69\x87\xc3\x21\x86\x3e\xf0\x76\x6f\xc2\x05\x84\xda\
-\xa9\xc0\x44\x39\x3a\x79\x08\x3e\x7a\x85\xc0\x21\x1f\xde\x14\x8b\
-\xc5\xca\xb8\x06\xd2\x31\xf0\x74\x90\x0a\x3c\xc1\x60\xf0\xcb\xb1\
-\x58\xac\x25\x1a\x8d\xb6\x35\x37\x37\xbf\xe4\x70\x38\x06\xbf\xff\
-\xfd\xef\xef\xfb\x63\x78\xae\x7f\x34\x06\x40\xd7\x63\x8f\x3d\x26\
-\x01\xc0\xbe\x7d\xfb\x1e\xb2\xd9\x6c\xfe\x6c\x36\x6b\xb3\x58\x2c\
-\xdf\xf7\xf9\x7c\x62\x06\x90\x72\xda\x17\x71\xf1\xd4\x33\x40\xe5\
-\x5c\x3e\xe7\x8f\x76\x36\xd7\xff\xf3\x94\x92\xc2\x02\x81\xc0\x48\
-\x24\x82\xe9\xe9\xe9\x1f\x99\xcd\xe6\x80\x4e\xa7\x8b\xfd\xec\x67\
-\x3f\x7b\x0a\x7f\x84\xd7\x1f\x9d\x01\x28\xaf\xbb\xef\xbe\x7b\xb3\
-\xc1\x60\x88\x65\x32\x19\x5b\x6f\x6f\xef\xf6\xaa\xaa\xaa\x23\x3e\
-\x9f\x6f\x9f\xc3\xe1\x18\x34\x1a\x8d\xa3\xc4\xee\x99\xcd\x66\xc1\
-\x27\x28\x87\x46\x90\xdb\xa7\x12\x2f\x0d\x8a\x0a\x85\x42\xd4\xa3\
-\xd0\x12\x08\x04\xd6\x8c\x8e\x8e\x5e\x63\xb5\x5a\xfd\xed\xed\xed\
-\xcf\x86\xc3\xe1\x0e\x8f\xc7\x73\xe8\xde\x7b\xef\x0d\xfc\x31\x3f\
-\xbf\x3f\x7a\x03\x98\xeb\xfa\x87\x7f\xf8\x87\x4f\x27\x93\x49\x9f\
-\x5a\xad\xce\x55\x57\x57\x1f\x72\xb9\x5c\xc7\x4a\xa5\x92\x4e\x96\
-\x65\x57\x36\x9b\xb5\x69\xb5\xda\x1e\x5e\x0f\x50\xa9\x54\x2b\x25\
-\x49\x0a\xe8\x74\x3a\x39\x9f\xcf\x4b\x13\x13\x13\x1b\xc3\xe1\x70\
-\xbb\x5e\xaf\x8f\x2d\x5a\xb4\x68\xc7\x1f\x8a\xa8\x59\x30\x80\x0f\
-\xe1\x7a\xe8\xa1\x87\xda\x62\xb1\x58\xcb\x19\xd5\x4d\x4e\xa7\xd3\
-\xc5\x4c\x26\x53\xe0\x4f\x75\x91\x17\x0c\x60\xe1\x9a\xf3\x52\x2f\
-\x3c\x82\x05\x03\x58\xb8\x16\x0c\x60\xe1\x5a\x30\x80\x85\x6b\xc1\
-\x00\x16\xae\x05\x03\x58\xb8\x16\x0c\x60\xe1\x5a\x30\x80\x85\xeb\
-\xcf\xe6\xfa\x7f\xf3\x91\xb7\xf8\x99\xad\xaa\xe1\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x1c\x86\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x1c\x18\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x28\x18\xb9\x00\x20\x80\x98\x46\x83\x60\x64\
-\x03\x80\x00\x1a\x4d\x00\x23\x1c\x00\x04\xd0\x68\x02\x18\xe1\x00\
-\x20\x80\x46\x13\xc0\x08\x07\x00\x01\x34\x9a\x00\x46\x38\x00\x08\
-\x20\x16\x62\x14\x31\x32\x32\xe2\x95\x5f\xba\x72\x95\x3f\x90\x32\
-\x40\xee\x51\x90\xca\x46\xe1\x03\xe9\xff\xd8\xc4\xa9\xc8\x46\xe6\
-\xe3\x74\x07\x35\xed\xfb\x0f\x42\xff\xf1\x8a\x93\x68\xee\x85\xca\
-\xd2\x92\x8d\xc4\xc4\x1f\xbe\x9e\x1e\x40\x00\x31\x12\xd3\x0d\xc4\
-\x95\x00\x96\xad\x5a\x1d\x0f\xd4\xdf\x00\x64\x2a\x50\x33\x42\x46\
-\x13\x00\xd1\xec\x07\xa0\xf0\xaf\x2a\x2b\x5d\x48\x6e\x02\x00\x08\
-\x20\xb2\x12\x00\x30\xe2\xf9\x81\xd4\x02\x20\x0e\xa0\x45\x84\x8c\
-\x26\x00\x92\xd9\x1b\x80\x38\x01\x98\x10\x3e\x92\x9a\x00\x00\x02\
-\x88\x85\xcc\xaa\x03\x1c\xf9\x20\x06\x33\x3b\x17\x03\xbf\xb4\x36\
-\x03\xa7\xa0\x14\x03\x13\x0b\xdb\x68\xa5\x4a\x07\xf0\xe7\xd7\x0f\
-\x86\xb7\xcf\xee\x30\x3c\xbe\x7a\x9c\xe1\xc7\x57\x70\x9c\x07\x40\
-\xe3\x24\x1c\x88\x7f\x91\x62\x16\x40\x00\x91\x5c\x02\x2c\x5f\xbd\
-\x06\x54\xec\x83\x2c\x63\x60\xe5\xe2\x67\x10\xd5\xb0\x1f\x8d\xf8\
-\x01\x4c\x08\x97\x0f\xac\x64\xf8\xfa\xe1\x35\x98\x7f\xef\xee\xdd\
-\x86\x39\x33\x67\x80\xe2\xe6\x39\x72\x42\xc0\x17\xc7\x00\x01\x44\
-\x4e\x09\xd0\x00\xce\xf9\x6c\x5c\x28\x91\x2f\xc6\xcd\xc0\xc0\xc1\
-\x32\xf2\x22\xe1\x3f\x0e\xc1\xff\xe4\xe8\xfd\x4f\x84\xd9\x40\xf0\
-\xf3\x0f\x03\xc3\xdb\xef\x0c\x0c\x2c\x6c\x1c\x0c\xba\x0e\xe1\x0c\
-\xe7\x77\x2d\x62\xf8\xf9\xed\x13\x83\xac\x9c\x5c\x1a\x50\x7a\x0b\
-\x10\x0b\x80\xda\x07\x40\xfc\x91\x90\x1b\x00\x02\x88\xa4\x12\x00\
-\x98\xfb\x41\xad\xfd\x0d\x20\x3d\x82\x8a\x26\x0c\xdc\xa2\xe0\xb6\
-\x1f\x83\x9a\x30\x03\x83\x38\xcf\x08\x88\x68\x02\x11\xf4\x1f\x4f\
-\xe4\xff\xc7\x93\x40\xc8\x31\xfb\xcd\x37\x06\x86\x87\x1f\x20\xec\
-\x97\xf7\xaf\x30\xdc\x3e\xbd\x03\x9c\xd3\xaf\x5f\xbb\x5a\xbc\x64\
-\xe1\xc2\x83\x50\x65\xd7\x80\xf8\x3b\xbe\x38\x06\x08\x20\x52\xc7\
-\x01\x0c\x60\x0c\x50\x9d\x0f\xcb\xf9\xa3\x91\x4f\xdf\xc8\x07\x01\
-\x11\x2e\x06\x06\x61\x4e\x08\x5b\x58\x5a\x05\x2e\x2e\x24\x2c\xa2\
-\x8e\xa4\x4c\x99\x90\xdf\x00\x02\x88\xd4\x04\x20\x00\xd7\x08\x2d\
-\xfa\x87\x7b\xb1\x3f\x18\x23\x1f\x06\xd8\xa0\x61\x0f\xaa\x0a\x70\
-\x00\x76\x50\xfa\xc0\xe7\x3f\x80\x00\x1a\x1d\x09\x1c\xa2\x91\x4f\
-\xc2\x24\xbe\x18\x3e\x49\x80\x00\x22\x35\x01\x7c\x20\x27\x20\xbf\
-\x7f\xfb\xcc\x70\xff\xe6\x79\x20\xfd\x65\x34\xf2\xe9\x1b\xf9\x20\
-\xc0\x85\x4f\x12\x20\x80\x68\x5e\x02\xbc\x7c\x7a\x8f\xe1\xce\xd5\
-\xd3\x0c\x5f\x3f\x7f\x60\x78\xf6\xe0\xfa\x68\xe4\xd3\x37\xf2\x09\
-\x02\x80\x00\xa2\x59\x02\xf8\xf5\xf3\x3b\xc3\xdd\xeb\x67\x81\x09\
-\xe0\x3e\xbc\x2f\x0a\x2a\x01\x5e\x3d\x7b\x30\x1a\xf9\xd4\x8a\x7c\
-\x2a\xa4\x06\x80\x00\xa2\x49\x13\xee\xdd\xeb\x67\x0c\x4f\x1f\xdc\
-\x64\xf8\xf7\xef\x2f\xa4\x95\xca\x7e\x89\xe1\xdf\x7f\x76\x86\x0f\
-\xbf\x35\x80\x09\xe0\x3e\x03\xaf\x80\x08\x03\x27\x17\xcf\x68\xe4\
-\x53\x18\xf9\xd4\x28\x0d\x00\x02\x88\xaa\x09\xe0\xcf\x9f\xdf\x0c\
-\x8f\xee\x5c\x61\xf8\xf8\xfe\x35\x78\xec\x80\x99\xf1\x17\x83\x2c\
-\xf7\x7e\x06\x7e\xae\xaf\x0c\x7f\xff\xfc\x62\xf8\xf1\x45\x84\xe1\
-\xe7\x3f\x51\x86\xc7\x77\x2f\x33\x28\x6b\x9a\x32\x30\xb3\xb0\x8c\
-\x46\xfe\x00\x46\x3e\x08\x00\x04\x10\xd5\xaa\x80\x0f\x6f\x5f\x32\
-\x5c\x39\x7b\x90\xe1\xc3\xbb\x57\xe0\xe2\x9e\x8f\xf5\x3e\x83\xa6\
-\xe0\x4a\x06\x7e\x01\x7e\x06\x06\x6e\x03\x06\x66\x1e\x4d\x06\x69\
-\xce\xbd\x60\xb9\x5f\x3f\x7f\x30\xbc\x7a\xfe\x60\x34\xf2\x07\x38\
-\xf2\x41\x00\x20\x80\x28\xce\x82\x7f\x41\xb9\xfe\xde\x6d\x60\xd1\
-\xfe\x10\x92\xeb\x99\x7e\x31\x48\xf2\x9e\x66\x10\xe3\x79\xc6\xc0\
-\xc0\x61\xc8\xc0\xc0\x08\x6d\x84\x32\xf3\x02\x8b\x7d\x7e\x06\xb1\
-\xdf\xa7\x19\x5e\xfd\x34\x65\x78\xfb\xf2\x31\x03\x37\xaf\x00\x03\
-\x1f\xb0\x3a\x18\x8d\x7c\xd2\x23\x9f\x5a\x89\x00\x20\x80\x28\x2a\
-\x01\x18\x7f\xbc\x65\x78\x7d\xeb\x30\xb0\xa1\xf7\x00\x9c\xb3\x79\
-\x38\x9e\x32\x68\x4a\xad\x66\x10\x13\xf9\xc9\xc0\xc0\x63\xcc\xc0\
-\xc0\xc4\x81\xea\x54\x0e\x65\x06\x31\xae\xeb\x0c\xdc\x2c\x4f\xc1\
-\xdc\xa7\xc0\x5e\xc1\xdf\x3f\x7f\x46\x23\x9f\x9c\xc8\xa7\x52\x0a\
-\x00\x08\x20\xb2\x13\x00\xd3\xfb\x9b\x0c\xac\x2f\x8e\x33\x30\xfe\
-\xf9\x0e\x8e\x7c\x29\xc1\x2b\x0c\xea\xd2\x87\x19\xd8\x79\x35\x19\
-\x18\xd9\xe5\x80\xa9\xe3\x3f\x02\x23\xbb\x96\x4b\x87\x41\x9a\xeb\
-\x10\x03\x13\xc3\x0f\x70\xe4\x3f\x7d\x70\x63\x34\xf2\x07\x28\xf2\
-\x41\x00\x20\x80\x48\x4e\x00\xac\xcc\x0c\x0c\x52\x02\xac\x0c\xcc\
-\x1f\x6e\x81\x23\x9e\x93\xed\x33\x83\xb6\xcc\x51\x06\x29\xb1\x1f\
-\xc0\x1c\x6e\x03\x4c\x19\x82\xe0\x48\x67\x84\x27\x00\x06\x08\x86\
-\xb9\x1a\x58\x15\xb0\x71\x8a\x32\x88\xb2\x9f\x06\xeb\xff\xf4\xe1\
-\x35\xc3\xfb\x37\x2f\x46\x23\x7f\x00\x22\x1f\x04\x00\x02\x88\xa4\
-\x04\x20\xc2\xc3\xa4\x20\xce\xc7\xc2\xc0\xc6\xc2\x08\x8e\x3c\x09\
-\xfe\xd7\x0c\x3a\xb2\xb7\x18\xb8\xf8\xd5\x18\x18\xd8\x94\x81\x6e\
-\x03\x35\x29\x98\x21\xc6\x82\x22\x1f\x64\x3a\x7a\x09\x00\x02\xec\
-\xf2\x0c\x22\x5c\x8f\x19\xf8\x58\x20\x63\x04\x2f\x1e\xdf\x06\x37\
-\x0c\x47\x23\x9f\xbe\x91\x0f\x02\x00\x01\x44\x54\x23\xf0\xf0\xee\
-\x75\xf2\x40\x6a\x01\xb0\x91\xe7\x00\x72\x05\x1b\xcb\x2f\x06\x15\
-\x71\x60\x04\xf2\x01\x1b\x78\x6c\xfa\xc0\x48\xfe\xc7\x00\x59\x7f\
-\x00\x72\xe1\x3f\x08\xcd\xf8\x1b\x98\xf1\xff\x33\xfc\x87\x97\x00\
-\x30\x0f\x40\x39\x5c\xda\x0c\xd2\x7f\x0f\x32\xdc\xfa\x24\xc5\xf0\
-\xf7\x2f\x07\xb8\x3d\xa0\xa8\x6e\x38\x1a\xf9\x44\x46\xfe\x7f\x2a\
-\xa5\x07\x80\x00\x22\xaa\x04\x00\xe6\xf6\x0b\x40\xca\x01\x94\xeb\
-\x85\x78\x3e\x31\xe8\xc9\xdf\x63\xe0\x13\x14\x07\xe6\x64\x59\x60\
-\x7c\xb2\x40\xd2\xd1\x7f\x08\x0d\x29\x05\xa0\x25\x01\xbe\xaa\x80\
-\x89\x93\x81\x99\x4b\x15\xd8\x35\xdc\x07\x2e\x4d\x40\x43\xc5\x6f\
-\x5f\x3e\x19\x8d\x7c\x22\x23\x9f\x5a\x00\x20\x80\x88\xad\x02\x26\
-\xc0\x16\x15\x48\x0a\xbe\x61\x60\xe1\x94\x01\xc6\xb1\x00\x72\x7f\
-\x00\x2d\x11\x30\x43\x13\x01\xd0\x78\x26\x60\x22\xc0\x55\x15\xb0\
-\x8a\x31\xf0\x71\x7e\x61\x10\x60\xbd\x01\x4e\x04\xcf\x81\x55\x01\
-\x2d\x26\x8c\x46\x23\x1f\x37\x00\x08\x20\xa2\x12\x80\x9d\x5b\x70\
-\x23\x90\xba\x00\x8a\xa4\xdb\xcf\xa5\x19\xfe\x7c\x7f\x0c\x74\xc9\
-\x1f\xb4\x04\xc0\x0c\xc5\x2c\x68\x98\x11\x52\x45\x80\xdb\x04\xd8\
-\x7a\x05\xda\x0c\x92\x5c\x67\x19\x58\x99\x3e\x83\xb9\xd4\x9e\x30\
-\x1a\x8d\x7c\xfc\x00\x20\x80\x48\x69\x04\x26\x80\x88\x1f\xbf\x58\
-\x19\xee\xbf\x14\x63\x60\xf8\xf9\x10\x7d\x54\x00\x4f\x55\x00\x44\
-\x4c\x38\xaa\x02\x46\x60\x8f\x82\x5b\x85\x41\x06\x3a\x4a\x08\x2a\
-\x01\x9e\x3f\xbe\x33\x1a\xf9\x74\x88\x7c\x10\x00\x08\x20\xa2\x13\
-\x00\xb0\x14\xb8\xf8\xeb\xcf\xff\x09\x20\xf6\xab\x8f\x82\x0c\x6f\
-\x3f\x00\x9d\xf4\xfb\x2d\x96\x44\xc0\x0c\x4d\x04\xcc\x78\xda\x03\
-\x68\xde\x61\x11\x62\xe0\xe6\x62\x61\x10\x83\x76\x0d\x41\xa3\x84\
-\xa0\x36\xc1\x68\xe4\xe3\x8e\x7c\x6a\xf5\x0a\x00\x02\x88\xa4\x6e\
-\xe0\xeb\xaf\x0c\x1f\x7e\xfe\xf9\xcf\x00\xaf\x0a\x7e\x3c\x03\x36\
-\xfa\x7f\x62\xa9\x0a\x58\x70\x54\x05\xff\x71\x0f\x10\x71\x28\x81\
-\x47\x09\x39\x98\xdf\x50\x3c\x4a\x38\x52\x22\x9f\x1a\xa5\x02\x40\
-\x00\x91\x3c\x10\xf4\xfe\x1b\x30\xce\x81\x09\xe0\xcf\x5f\x26\x86\
-\x1b\x4f\x64\x70\x54\x05\xcc\x58\xaa\x02\x16\xb4\xaa\xe0\x3f\x46\
-\x55\x00\x1e\x25\x44\x9a\x30\x7a\xf1\xe4\xce\x68\xe4\xd3\x30\xf2\
-\x41\x00\x20\x80\x48\x4e\x00\x7f\x81\x36\xbf\xfb\x06\xb1\xfe\xe3\
-\x37\x6e\x86\x67\x6f\xd8\x81\x55\xc1\x2b\x1c\xed\x01\x66\xb4\x5e\
-\x01\x81\xaa\x00\x3a\x61\x24\xc1\x71\x04\x9c\x08\xde\xbf\x79\xce\
-\xf0\xe9\xc3\x9b\xd1\xc8\xa7\x51\xe4\x83\x00\x40\x00\x91\x35\x17\
-\xf0\xe3\x37\x90\xe0\x96\x04\x47\xd2\xa3\x37\x62\x0c\x3f\xbe\xbe\
-\x04\xa6\x8c\x6f\x68\x09\x80\x09\x47\x55\x80\x36\x4a\x88\x51\x15\
-\x28\x33\x88\x70\xdc\x22\x79\xc2\x68\x34\xf2\xc9\x03\x00\x01\x44\
-\xfe\x6c\xa0\x04\x68\xb6\x8f\x15\x5a\x15\xc8\x33\x30\xfc\x22\xd4\
-\x2b\x60\x46\xed\x15\xe0\x6b\x0f\x30\x71\x82\x07\x88\x10\x13\x46\
-\xd7\x47\x23\xff\x3f\x6d\x7a\x02\x00\x01\x44\x7e\x02\x60\x66\x63\
-\xf8\x2f\x69\x0e\x66\x7e\xfd\xc9\xc1\xf0\xe8\x15\x2f\x30\x11\x3c\
-\x27\xa1\x3d\x80\x67\x94\x10\x08\xd8\x98\x3e\xc3\xab\x02\x50\x35\
-\x80\x6b\x94\x70\x34\xf2\x29\x03\x00\x01\x44\xd1\x7a\x80\xbf\xec\
-\x42\x0c\x7f\x78\xe4\xc0\x91\xf4\x18\x58\x15\x7c\xfd\xfc\x1e\x28\
-\xf8\x19\x8b\x15\x88\x88\xff\x8f\xab\x2a\x40\x29\x01\x20\x1b\x1d\
-\x04\xd9\x6e\x32\xf0\x42\x27\x8c\x40\x6b\x09\xd1\x27\x8c\x46\x6a\
-\xe4\x83\x06\x65\xff\xfe\x63\x60\xf8\xfc\x8b\x81\xe1\xe1\x47\x06\
-\x86\x3b\xef\xc8\x8f\x43\x80\x00\xa2\x78\x49\x18\xbb\x88\x12\x03\
-\x33\x2b\x07\xb4\x6b\x28\xc3\xf0\xe7\xdb\x13\xec\xa3\x84\xff\x59\
-\x90\xba\x88\x50\x9a\x91\x11\x51\x0a\x20\x8f\x12\x32\x71\xc2\x75\
-\xcb\x70\xed\x85\x54\x05\x7f\xff\x80\xd7\x12\x8e\xc4\xc8\x07\x45\
-\xf8\x1f\x60\x84\xff\xfc\xcb\xc0\xf0\x1d\xd8\xfe\xfa\x0a\xc4\xdf\
-\x81\x41\xfc\x09\xd8\x03\xff\x06\x64\xff\xfe\x47\x7e\xfc\x01\x04\
-\x10\xc5\x09\x80\x89\x99\x95\x41\x50\xde\x00\x5e\x15\x3c\x7e\x2d\
-\x80\xa3\x2a\x20\x30\x61\xc4\x80\x5c\x15\x20\xd5\x34\x8c\xbf\x18\
-\xe4\xb8\xb6\xa3\x2c\x2b\x1f\x09\x91\xff\x0f\x18\xa9\xbf\x81\x11\
-\xfe\x03\x18\xd1\xdf\xfe\x40\x76\x04\xff\xf9\x0b\xe9\x85\x51\x73\
-\x64\x10\x20\x80\xa8\xb2\x28\x94\x95\x93\x97\x81\x47\x4c\x09\x1c\
-\x49\xcf\xde\x0b\x33\x7c\xfc\x04\xec\x11\xfc\xf9\x40\x64\x22\x40\
-\x9b\x30\x02\x61\x16\xd4\x25\xe3\xdc\x2c\xcf\x18\x84\xd9\x2e\x82\
-\xcd\x07\x55\x05\x3f\xd0\x26\x8c\x86\x4b\xe4\x83\x72\x3a\x28\x37\
-\xff\x80\xe6\xf0\x5f\xff\xa0\x11\x8e\x16\xe9\xd4\x5c\x1b\x00\x10\
-\x40\x54\x5b\x15\xcc\x2b\xae\xcc\xc0\xc2\xc1\x03\xd9\xa2\xfc\x44\
-\x0e\xcf\x84\x11\x0b\x6a\x35\x80\x3e\x61\x04\xc6\x2c\x18\x3e\x14\
-\xe3\x38\x0d\x9f\x30\x42\xee\x1a\x0e\x87\xc8\xff\xf7\x1f\x92\xc3\
-\xc1\x91\xfe\x07\x2d\x97\xd3\x30\xf2\x41\x00\x20\x80\xa8\xba\x33\
-\x08\x54\x15\x30\x32\xb1\x80\xbb\x86\xb7\x9f\x49\x92\x3f\x4a\xc8\
-\x2a\x88\xd1\x30\x84\x54\x05\xdb\xc0\x09\x0c\x54\x02\xbc\x7e\xfe\
-\x60\xc8\x47\x3e\xa8\x21\x07\x2a\xe2\x41\xf8\xcf\x7f\x48\x09\x80\
-\x4d\x1f\x3e\x31\x4a\x01\x40\x00\x51\x35\x01\xb0\xb0\x71\x02\x4b\
-\x02\x25\x30\xfb\xdd\x17\x3e\x86\xb7\x1f\xfe\xe1\x19\x25\x44\x4e\
-\x04\xcc\x98\xa3\x84\xa0\x6a\x00\xad\x3d\xc0\xc9\xfc\x16\x31\x61\
-\xf4\x0a\x75\xc2\x68\x28\x45\x3e\x2c\xe2\x41\x8d\xba\x7f\xff\x31\
-\xcd\x27\x36\xf2\xa9\x91\x08\x00\x02\x88\xa2\x04\xc0\xcc\xcc\xcc\
-\xc0\x84\x76\x82\x18\xb7\x88\x3c\x03\x1b\xb7\x20\xbc\x57\xf0\xe3\
-\xeb\x1b\x2c\x13\x46\x4c\x58\xaa\x01\xb4\x09\x23\x56\x01\xac\x8b\
-\x48\x40\x55\x01\x6c\xc2\xe8\xd9\x43\x48\x55\x30\x54\x22\x1f\x56\
-\xd4\xc3\x22\x1e\x9b\xf9\x24\x45\x3e\x15\x52\x00\x40\x00\x51\xb6\
-\x2f\x00\x18\xf9\x7c\xdc\x1c\x58\xaa\x02\x7d\x78\x55\x70\xe7\x39\
-\x99\x55\x01\xa8\x1a\x60\xfa\x87\x35\x11\x80\x26\x8c\x98\x18\x7e\
-\x32\xfc\xfe\xf9\x03\x98\x08\x6e\x0c\xfa\xc8\x07\x15\xed\xbf\xa0\
-\x2d\xfa\xbf\xff\x71\x9b\x4f\xef\xc8\x07\x01\x80\x00\xa2\xb8\x0a\
-\xe0\x64\x63\x61\xe0\xe7\x62\xc5\xe8\x1a\x0a\xc8\x68\x83\xd9\xf0\
-\x09\x23\x82\x5d\x43\xb4\x09\x23\x16\x41\xc8\xd8\x00\xd3\x7f\xac\
-\x55\x81\x28\xfb\x29\x70\x29\xf3\xf9\xc3\x6b\x20\x7e\x33\x68\x23\
-\x1f\x5c\xdc\xff\x85\xf4\xe3\xff\x33\x50\x2f\xf2\xa9\xd5\x06\x00\
-\x08\x20\xaa\xb4\x01\x84\x78\xd8\x19\xd8\x58\x50\x8d\xe2\xe0\x17\
-\x63\x60\xe7\x13\x85\x4f\x18\x41\x46\x09\xb1\x4d\x18\x61\x5b\x3f\
-\x00\xea\x1a\x02\xc5\x59\x45\xa1\x09\xe0\x1f\x46\xb0\x8b\xb0\x5f\
-\x82\x4f\x18\x3d\x07\x56\x05\xbf\x91\x46\x09\x07\x43\xe4\x83\x72\
-\x3d\xa8\xa8\xff\xf9\x0f\xb5\x71\x37\x98\x22\x1f\x04\x00\x02\x88\
-\x2a\x09\x80\x99\x89\x91\x41\x9c\x1f\xb3\x2a\x00\x95\x02\xa0\x51\
-\x42\x70\xaf\x00\xd8\x1e\x20\x3c\x61\x84\x3c\x40\xc4\xc8\xc0\xc8\
-\x26\x01\xa9\x06\x60\x25\x01\x9a\xd7\x41\x03\x44\xb0\x51\xc2\xe7\
-\x8f\xae\x0f\x9a\xc8\xff\x07\x8d\x7c\x58\x1f\x9e\x16\x91\x4f\xad\
-\x65\xe1\x00\x01\x44\xb5\x5e\x00\x3b\x2b\x33\xb0\x24\x60\xc3\xa8\
-\x0a\xf8\xa1\x55\x01\x7c\xc2\xe8\xe7\x63\x3c\xed\x01\xb4\x65\x64\
-\xac\xc2\x0c\x8c\xcc\x6c\x88\x61\x62\x2c\x5d\x43\xd8\xb2\xf2\x6f\
-\xc0\x1e\xc1\xbb\x57\x4f\x06\x3c\xf2\x61\x43\xb6\xff\x18\x68\x1b\
-\xf9\xd4\x2a\x06\x00\x02\x88\xaa\xdd\x40\x50\x55\xc0\xc9\xc6\x8c\
-\x9a\x30\x78\x84\x18\xb8\x84\x11\x13\x46\xe0\x51\x42\x5c\x13\x46\
-\x18\x25\x01\xc8\x00\x19\x68\x29\xf0\x0f\x73\x01\x09\x10\x80\xb6\
-\xa1\xc3\x26\x8c\xde\x3e\x87\x8e\x12\x0e\x50\xe4\x83\x1a\x7a\xbf\
-\xff\x61\x37\x6b\x30\x46\x3e\x08\x00\x04\x10\xd5\x8f\x88\x11\x03\
-\x56\x05\x4c\x68\x8d\x36\x7e\x29\x75\xf8\x28\x21\x78\x2d\x21\xae\
-\x09\x23\x94\x76\x00\x74\x6c\x80\x55\x04\x58\x0a\xb0\x22\xaa\x01\
-\x2c\x55\x01\x68\xc2\x88\x95\xf1\x13\xb8\x2a\x78\x09\xac\x0a\x06\
-\x2a\xf2\xff\xfe\xa7\x5f\xe4\x53\x2b\x0d\x00\x04\x10\xd5\x13\x00\
-\x2b\x33\x13\xb8\x24\xc0\x6c\x0f\xe8\x80\xe9\x9f\xbf\xd9\x20\x13\
-\x46\x38\x97\x95\x23\x2f\x23\x83\x62\x76\x71\x60\xd7\xf0\x1f\x81\
-\xaa\x60\x2f\x7c\x94\xf0\xed\x8b\x07\x74\x8b\x7c\x50\x03\x0f\xd6\
-\xbd\xa3\x77\xe4\x53\x23\x11\x00\x04\x10\x4d\x0e\x89\x12\xe0\x66\
-\x63\xe0\x66\x47\xdd\x76\x88\x3e\x61\x04\x5e\x56\x8e\x77\xc2\x88\
-\x19\x91\x08\x58\x84\x81\x14\x0b\x34\x11\xfc\xc3\xda\x35\x44\x9e\
-\x30\x02\x57\x05\xdf\xbf\xd0\x25\xf2\x41\xf5\xfd\x7f\x86\x01\x8a\
-\x7c\x2a\xa4\x00\x80\x00\xa2\xd9\x29\x61\xd8\xaa\x02\xd0\x84\x11\
-\x62\x94\x50\x9a\xc0\x84\x11\x33\xb4\x34\x80\x95\x02\x48\x3d\x02\
-\x6c\xcb\xc8\xd0\x46\x09\x9f\xdf\xbb\x0c\xae\x12\x68\x15\xf9\xa0\
-\x96\xfe\x8f\x21\x1e\xf9\x20\x00\x10\x40\x34\x4b\x00\xa0\xae\xa1\
-\x18\x96\xae\x21\xa8\x57\x80\x32\x61\xf4\xe3\x1e\x8e\x5e\x01\x24\
-\xe2\xff\x43\x1b\x86\x0c\xcc\x3c\xa0\x62\x04\xa9\x14\xf8\x87\xb7\
-\x2a\xf8\xfd\xeb\x07\xc3\x3b\xe4\xaa\x80\x8a\x91\xff\x17\x9a\xf3\
-\x19\x86\x78\xe4\x83\x00\x40\x00\xd1\xf4\xa0\x48\x1e\x0e\x56\x06\
-\x5e\x4e\xd4\xaa\x00\x7d\xc2\xe8\xd5\x7b\x16\x1c\x13\x46\x88\xdc\
-\xff\x1f\xda\x2e\x60\x60\x15\x82\x0c\x11\x30\x21\xaf\x22\xc2\x1c\
-\x25\x84\x4d\x18\x7d\x78\xfd\x98\xe1\xcb\xc7\x37\x54\x8d\x7c\x50\
-\x37\xef\xd7\x20\x88\x7c\x6a\xa5\x01\x80\x00\xa2\xf9\x49\xa1\x22\
-\xbc\x1c\x0c\x2c\xcc\x8c\x28\x21\xc4\x2d\x2c\xcf\xc0\xce\x0b\x19\
-\x25\xbc\xf7\x52\x12\x32\x61\x84\x32\x4a\xc8\x80\x7d\x94\x90\x11\
-\xd8\xb8\x64\xe3\x45\x1d\x1c\xc2\x51\x15\xc0\x46\x09\x5f\x01\x7b\
-\x05\xb0\xaa\x80\xd2\xc8\xff\xfd\x17\xb1\xfc\x6a\x30\x44\x3e\x35\
-\x12\x01\x40\x00\xd1\x3c\x01\xa0\x8c\x12\xfe\x47\x1d\x25\x44\x99\
-\x30\x42\x19\x25\x84\x45\x2a\x62\xc7\x31\xa2\x2a\xe0\x03\x52\xc0\
-\x06\x21\x33\xee\xaa\x00\x04\xe0\xcb\xca\x81\x91\xff\xea\xd1\x0d\
-\x8a\x22\x1f\x36\x99\xf3\xe7\xff\x20\x8a\x7c\x2a\x15\x01\x00\x01\
-\x44\x97\xd3\xc2\x39\xd8\x58\x18\x04\xb9\x51\x47\x09\x19\x91\x46\
-\x09\x41\x13\x46\x98\xcb\xca\xff\x43\xaa\x82\xff\xc8\x03\x44\xa0\
-\x49\x27\xa0\x39\x6c\x42\xd0\x65\x64\xff\xd1\x26\x8c\x50\x97\x95\
-\xc3\xce\x21\xfa\xfa\xf1\x35\xc3\xe7\x77\x2f\xc8\x8f\x7c\x2c\xab\
-\x74\x86\x43\xe4\x83\x00\x40\x00\xd1\x3c\x01\xc0\x3c\x80\x3c\x61\
-\x04\x73\x3f\x07\x9f\x18\xca\x28\x21\x62\xc2\x08\x96\xa3\xff\x21\
-\xba\x86\x60\xcc\x0a\x3a\xa0\x06\x28\xc4\x09\x64\xf2\x22\x4a\x00\
-\xf8\x84\x11\x5a\xf5\xc3\x7e\x09\x7e\x0e\xd1\x9b\xa7\xb7\xc1\x77\
-\xec\x90\x12\xf9\xb0\xf9\xfb\x7f\x0c\x83\x2f\xf2\xa9\x95\x06\x00\
-\x02\x88\x89\x1e\x91\x8f\xdc\x35\x44\x77\x38\x68\x6c\x80\x09\x69\
-\x59\x39\xc3\xcf\x7b\xd0\xae\x21\xb2\x4a\xd8\x5c\x01\x2b\x14\xb3\
-\x41\x4e\x28\x01\x96\x22\x90\x52\x00\xf7\x84\x91\x34\x74\x59\xf9\
-\x3f\x60\x55\xf0\xfa\xf1\x75\xa2\x23\x1f\x34\x8d\x0b\x8a\xfc\xff\
-\xc3\x38\xf2\x41\x00\x20\x80\x98\xe8\x15\xf9\xe0\x62\x99\x95\x99\
-\x41\x98\x97\x1d\xb5\x90\x47\x9b\x30\xba\xff\x42\x18\x58\xe6\xbe\
-\x60\x40\x39\x70\x0a\x32\x94\x04\x64\xb2\x81\x23\x1f\x5c\x0a\xa0\
-\x54\x05\xff\x88\x9a\x30\xfa\xfe\xe5\x03\xc3\xc7\xd7\x4f\x08\x46\
-\x3e\xa8\xb1\x07\x6b\xe9\x0f\xd6\xc8\xa7\xd6\x6c\x20\x40\x00\x31\
-\xd1\x2b\xf2\xff\x23\x8d\x12\x72\xb0\x31\xa3\x48\xb3\x71\x0b\x31\
-\x70\xa3\x2c\x2b\x07\x16\xd5\x7f\xbf\x42\x7d\xfd\x1f\xd1\x1e\x00\
-\x45\x3a\x3c\x11\xb0\x22\x55\x05\xff\x11\xe3\x03\x38\x26\x8c\x60\
-\xe7\x10\xbd\x7d\x76\x9b\xe1\xd7\xf7\x2f\x58\x23\x1f\x56\xe4\xff\
-\xf9\x37\xf8\x23\x9f\x5a\x29\x00\x20\x80\x98\xe8\x19\xf9\xf8\x46\
-\x09\x79\xc4\x94\xd1\x26\x8c\x5e\x82\x0a\x62\x34\x9f\xa2\x55\x03\
-\x20\xcc\xcc\x0f\xba\xc0\x08\xb5\x1a\xc0\x52\x15\x48\x72\x1e\x81\
-\x2f\x2b\x87\x57\x05\xff\x51\x57\xe8\x22\xaf\xd5\x1b\xf4\x91\x4f\
-\x25\x00\x10\x40\x4c\xf4\x8e\x7c\x10\x9f\x85\x89\x09\x58\x15\x60\
-\x8e\x12\xf2\x49\x43\x26\x8c\x10\xe7\x10\xbd\x41\x4a\x00\xd8\x4a\
-\x01\x36\xc8\xd8\x00\x78\xfd\x20\x03\xc1\xaa\x00\x76\x0e\x11\xa8\
-\x04\x78\xf7\xf4\x0e\x5c\xf6\x37\x74\x70\xe7\xff\x10\x8a\x7c\x6a\
-\xa5\x01\x80\x00\x62\xa2\x77\xe4\xc3\x02\x82\x97\x93\x95\x81\x0b\
-\x69\xc2\x08\x9c\x30\x40\x13\x46\x12\x6a\x90\x01\x1c\xf0\x39\x44\
-\xc0\x9c\xfe\xe7\x2b\x9a\x49\xb0\x44\xc0\x8a\xe8\x15\x80\x86\x89\
-\x99\x39\x51\xab\x02\x1c\x13\x46\xb0\x51\xc2\x8f\x6f\x1e\x83\xdb\
-\x04\xb0\x2d\x57\xff\x19\x86\x5e\xe4\x53\x23\x11\x00\x04\x10\xd3\
-\x40\x44\x3e\x0c\x88\xf2\x41\xaa\x02\x64\x31\x2e\x61\x79\x06\x56\
-\x2e\xa4\x09\xa3\x1f\xa0\x33\x69\xfe\x62\x19\x26\x66\x43\xc2\xac\
-\xe0\xd5\x43\xe0\xfd\x65\x24\x4c\x18\xbd\x79\x72\x1d\x18\xf9\x7f\
-\x46\x6c\xe4\x83\x00\x40\x00\x31\x51\x2f\xfb\x93\x16\xf9\xf0\x09\
-\x23\x01\x4e\x8c\x06\x19\xaf\x34\x62\x94\xf0\xc6\x13\x59\x60\xf9\
-\xfc\x05\xcb\x5c\x01\xac\x57\x00\x1b\x1b\xe0\x00\x1f\x31\x83\xa8\
-\x0a\xfe\xe1\x5d\x56\x0e\x4a\x60\x7f\x7f\xfd\x60\xf8\xf2\xf2\xce\
-\xd0\x8c\x7c\x2a\xa5\x00\x80\x00\xa2\x4d\x23\x90\x84\xc9\x17\xd0\
-\xb2\x72\x3e\xd0\xb2\x72\x24\x35\xcc\xa0\x09\x23\x69\xe4\x65\xe5\
-\xc0\x3e\xff\xef\x9f\x58\x9c\x8e\xd6\x35\x04\x9f\x5e\xca\x8a\x63\
-\x94\x10\x75\xc2\x08\x76\xf8\xc4\xf7\x0f\xcf\x19\x7e\x7e\x7e\x33\
-\x22\x23\x1f\x04\x00\x02\x88\x69\x20\x23\x1f\x06\x04\xb9\xd9\x51\
-\x27\x8c\x80\x80\x9d\x57\x8c\x81\x8d\x17\xb1\xac\xfc\xc7\xb7\x7f\
-\x68\x55\x01\x03\x52\x55\x00\xed\x15\x80\x0e\x96\x00\xcd\x15\x80\
-\xaa\x02\xd0\x5c\x01\xe3\x3f\xa2\x96\x95\x7f\x7e\x7e\x1d\x3c\x50\
-\x34\x94\x22\x9f\x5a\x69\x00\x20\x80\x98\x06\x3a\xf2\xc1\xe7\x41\
-\x30\x82\xd6\x0e\x70\x62\x28\xe0\x95\x42\xae\x0a\xe4\x81\xbd\x82\
-\xef\x58\xaa\x02\x16\xd4\xaa\x80\x85\x8f\x01\x7c\x63\x2a\x68\x59\
-\x39\x33\x81\x51\x42\xe8\x84\x11\x28\xf2\xbf\x3c\xbf\x3e\xa4\x22\
-\x9f\x5a\x03\x41\x00\x01\xc4\x34\xd0\x91\x0f\xe3\x83\x96\x95\x83\
-\x06\x89\x50\x4e\x8a\x61\x66\x65\xe0\x93\xd5\x87\x8f\x12\x3e\x7a\
-\x2d\x82\xa3\x2a\x40\xea\x1a\x82\x4e\x17\x01\xb5\x07\xd0\xab\x02\
-\x2c\x8d\x42\xe4\x73\x88\x40\xd5\xc0\xf7\x77\x4f\x86\x4c\xe4\x53\
-\x2b\x05\x00\x04\x10\xd3\x60\x88\x7c\x98\x1c\xa8\x2a\x40\xde\x61\
-\x04\x12\x63\xe5\x16\x62\xe0\x10\x42\x9e\x30\x62\x04\xdd\x54\x85\
-\x3d\x11\x40\xab\x82\xff\x4c\x3c\x50\x3e\x33\xd2\x84\x11\xf6\x51\
-\x42\xe4\x73\x88\xbe\xbd\xbd\x0f\x6e\x18\x0e\x89\xc8\xa7\x12\x00\
-\x08\x20\x9a\x0c\x04\x51\xb2\x51\x53\x04\x5b\xd7\x50\x14\x75\xc2\
-\xe8\xcf\xf7\x5f\x68\x73\xa2\xa8\x55\x01\x03\x13\x17\xa4\x1a\x00\
-\xf7\x0e\x18\x51\x1b\x84\x38\x96\x95\x83\xaa\x82\xff\xa0\xaa\xe0\
-\xd9\xe5\x21\x11\xf9\xd4\x4a\x03\x00\x01\xc4\x34\x98\x22\x1f\x51\
-\x15\xa0\x2e\x2b\x87\x54\x05\xc8\xe7\x10\x89\x62\xa9\x0a\x90\xba\
-\x86\xc0\x6a\xe0\x3f\x38\x31\x40\x13\x01\x11\x13\x46\xb0\x73\x88\
-\xfe\xfc\xf8\xc2\xf0\xfd\xed\x83\x11\x11\xf9\x20\x00\x10\x40\x4c\
-\x83\x29\xf2\x61\x5c\x3e\xd0\x84\x11\x2b\xea\x0e\x23\x66\x0e\x5e\
-\x06\x4e\x51\xe4\x09\x23\xd0\x28\xe1\x6f\xec\x55\x01\x68\x92\x08\
-\x18\xf9\xff\xff\xc3\x06\x8a\x58\x30\x47\x09\x19\x30\x47\x09\x61\
-\xcb\xca\xbf\xbf\x01\x56\x05\x3f\xbf\x0c\xea\xc8\xa7\x56\x23\x10\
-\x20\x80\xa8\x36\x10\x44\xed\xfd\xf9\xa0\x01\x22\xd8\x84\xd1\x7f\
-\x78\x55\xa0\xcc\xc0\xcc\x8e\x74\x0e\xd1\x0f\x1c\x55\x01\x7c\x84\
-\x90\x1d\xc1\x06\x1d\x64\x81\x5c\x0a\x30\x61\x1f\x25\x84\x4d\x18\
-\x7d\x7d\x71\x1d\x5c\x25\x0c\xd6\xc8\xa7\x56\x31\x00\x10\x40\x4c\
-\x83\x31\xf2\xc1\x0e\x03\xc6\x3e\xa8\x3d\x80\xa2\x0f\xc8\xe1\x92\
-\x41\x3e\x87\x48\x9a\x81\xe1\xd7\x77\x3c\xa3\x84\xc0\x06\xe1\x7f\
-\x76\xa4\xaa\x80\x01\x75\xda\x18\xcf\x39\x44\xa0\x12\xe0\xc7\xbb\
-\x07\xc3\x3a\xf2\x41\x00\x20\x80\xa8\xde\x0b\xa0\x46\xe4\xc3\xd4\
-\x70\xb2\xb3\x32\x70\xb1\xb1\xc0\x4f\xc6\x04\xcd\xd3\x33\xb2\x70\
-\x32\xb0\x09\x23\x9f\x43\xc4\x89\xa3\x6b\xc8\x8e\x94\x08\x60\xa5\
-\x01\x72\xd7\xf0\x1f\xc1\x65\xe5\x3f\xdf\x3f\x06\x36\x38\x3f\x0c\
-\xca\xc8\xa7\x56\x1a\x00\x08\x20\xda\x0e\x05\x53\xb2\x4b\x17\x1a\
-\xe9\x7c\x3c\x1c\xe0\xe2\x1b\x79\x9e\x9e\x5d\x48\x9e\x81\x99\x13\
-\xe9\x1c\x22\xd0\xf1\xf5\xff\xd0\xd7\x04\xb2\x40\x23\x9d\x1d\x75\
-\xe2\x08\x79\xc2\x88\x89\xf0\x84\xd1\xf7\x97\xa8\x55\xc1\x60\x8a\
-\x7c\x6a\x24\x02\x80\x00\x62\x1a\x54\x91\x0f\x8d\x74\xf0\xfc\x3c\
-\xf4\x90\x44\xd0\x39\x44\x42\x68\x6b\x07\xc0\x73\x08\xd2\xfa\xe0\
-\x85\x20\x90\x65\xe5\x84\xaa\x02\xe4\x06\x21\x52\x55\xc0\xf8\x8f\
-\xe0\x39\x44\xff\x7e\xff\x60\xf8\xfe\xea\xc6\xe0\x8c\x7c\x2a\xa4\
-\x00\x80\x00\x62\x1a\xe8\xc8\x87\x47\x3a\x74\x1d\x1e\xa8\x98\x47\
-\x3f\x41\x8b\x9d\x95\x85\x81\x87\x93\x15\xd5\x2c\x26\x56\x06\x0e\
-\x09\x1c\x13\x46\xf0\x81\x22\xe4\x51\x42\x76\xa4\xf6\x00\xd0\x2c\
-\xe6\xff\xd0\xa1\x62\xc2\xe7\x10\xfd\xf9\xf2\x9a\xe1\xcf\xd7\x37\
-\xc3\x2e\xf2\x41\x00\x20\x80\x98\xe8\x1d\xf9\xff\xa1\x7b\xeb\xfe\
-\xfc\x43\xec\xb4\xf9\xf3\x1f\xe9\xbc\x3c\x1c\xf5\x2d\x3f\x17\x68\
-\xc2\x88\x09\x45\x8c\x85\x47\x8c\x81\x99\x1b\xf9\x1c\x22\x46\xc8\
-\x84\x11\xbc\x67\xc0\x88\x54\x15\xb0\xa1\xf5\x0e\x98\xb1\x2c\x2b\
-\xc7\x3d\x61\xf4\xe3\xd5\x75\x70\x69\x30\x9c\x22\x1f\x04\x00\x02\
-\x88\xec\x04\xf0\x15\x7a\x6a\x35\x7a\x11\xfe\x0f\x76\xe2\x25\x34\
-\xa2\xff\x41\x1b\x6f\xbf\x61\x18\x9a\xe3\x61\x11\x4e\xcc\x34\x2c\
-\x38\x2a\x99\x20\x55\x01\xba\xdf\x41\xa5\x00\x23\x0b\xd2\x39\x44\
-\xa0\x09\xa3\xff\xff\xb0\x54\x05\xec\x98\x55\x01\x7c\x94\x10\xf7\
-\x84\x91\x30\xdb\x25\x70\x02\x03\xb5\x03\x7e\xbe\xba\x3e\x68\x22\
-\x9f\x5a\x69\x00\x20\x80\xc8\x4e\x00\x8f\x3e\x42\xf0\xab\xaf\x90\
-\x08\xfe\x03\x2d\xbe\xff\xc2\x72\x38\x34\xf2\xff\xfe\x27\xdc\x85\
-\x22\x76\x45\x0e\x2b\x0b\x33\x03\x1f\x17\x1b\xaa\x38\x33\x2b\x03\
-\xbb\x84\x36\x09\x13\x46\xc8\x89\x80\x15\xef\x28\xe1\xcb\xef\x26\
-\x0c\x0f\xbf\x7a\x40\x23\xf6\x3f\x03\x13\x1b\xcf\xa0\x89\x7c\x6a\
-\x0d\x04\x01\x04\x10\x75\xba\x81\xff\xc9\x5f\x53\x47\xaa\x3e\x3e\
-\x6e\x76\xf0\x29\x24\x28\xdb\x46\xb8\x84\x18\x58\x04\x90\xce\x21\
-\x02\xb6\x09\x30\x01\x33\x8e\xf6\x00\x33\x34\xf7\x23\x1a\x84\xbf\
-\xfe\xf1\x32\xdc\xfd\xe4\xcb\xf0\xf2\x87\x09\x24\xf7\x43\x63\x96\
-\x99\x5b\x64\xd0\x44\x3e\xb5\x8a\x00\x80\x00\xa2\x7a\x1b\x80\x96\
-\x91\x0f\xe3\x0b\xf3\x71\x32\xa0\x9c\x50\x0b\x14\x63\x13\x55\x67\
-\x60\x64\x43\x5a\x56\xfe\x97\x09\x7b\xaf\x00\x5b\x7b\x00\x69\xc2\
-\xe8\xd5\x0f\x5d\x86\x9b\x1f\x82\x19\xbe\xfc\x91\x82\x47\x3c\xac\
-\x04\xf8\xfb\xfb\xc7\xb0\x8a\x7c\x10\x00\x08\x20\x9a\xcf\x06\x52\
-\x3b\xf2\xc1\x7b\x86\x81\x25\x00\x1f\x17\x3b\x46\xa3\x93\x5d\x02\
-\xe9\x1c\xa2\x37\xe2\x38\xbc\xcb\x06\x6d\x0f\xb0\xa1\xb4\x07\xfe\
-\x00\xf1\xbd\xb7\x1e\x0c\x4f\x3f\x59\x03\xab\x32\x36\x44\xe4\x23\
-\x95\x00\xff\xff\xfc\x18\x34\x91\x4f\xad\x34\x00\x10\x40\x2c\x43\
-\x2d\xf2\x61\x80\x87\x93\x8d\xe1\x27\xb0\xdf\xf8\xfd\x17\x62\x6d\
-\x00\x23\x3b\x2f\x03\x8b\x90\x12\xc3\x9f\x77\xf7\xc0\x13\x46\x7c\
-\x5c\x5f\x19\x84\x79\x3f\xe1\x48\x04\x7f\xc1\x2d\xff\xff\x40\xfa\
-\xc3\x37\x69\x86\x07\xaf\xad\x80\x0d\x53\x0e\xb0\x45\x8c\xd0\xe2\
-\x05\x1c\xf1\xa0\xd2\x01\xca\x86\x27\x84\x61\x12\xf9\x20\x00\x10\
-\x40\x4c\x43\x31\xf2\x61\x62\x02\x3c\x1c\xf0\xaa\x00\xbe\x83\x50\
-\x58\x99\x81\x89\x53\x90\x88\xaa\x00\x98\xeb\xff\x72\x31\xdc\x7f\
-\x65\xce\x70\xe7\x85\x03\x90\x8d\xc8\xf5\xc8\x91\x0d\x4f\x08\x0c\
-\xa0\x43\xcf\x3f\x0f\x9a\xc8\xa7\x56\x23\x10\x20\x80\x98\x86\x6a\
-\xe4\xff\x87\x4e\x18\x09\xf2\x60\x76\x0d\x59\xc5\xb5\xe1\xa3\x84\
-\xe0\xae\x21\x06\x60\x64\xf8\xf4\x5d\x98\xe1\xea\x63\x73\x86\x37\
-\x9f\x65\xb1\x46\x36\x7a\x42\x80\x75\x05\x07\x4b\xe4\x53\x2b\x05\
-\x00\x04\x10\xd5\x67\x03\xe9\x15\xf9\xf0\x71\x00\x76\xcc\x1d\x46\
-\xa0\x09\x23\x50\x55\x00\x9b\x30\x7a\xf5\x51\x00\xc5\xc9\x4f\xde\
-\x8a\x33\x5c\x7f\xaa\xc6\xf0\xe3\x37\x3b\xde\xc8\x47\x67\xff\x1f\
-\x4c\x91\x4f\x25\x00\x10\x40\x34\x6d\x04\xd2\xab\x8b\xc8\xc7\xc5\
-\x01\xde\x64\x82\x1c\x38\xcc\x02\xf2\x0c\x4c\xdc\x48\xe7\x10\xfd\
-\x66\x65\xf8\xfa\x83\x83\xe1\xd2\x43\x55\x86\x27\xef\x24\xf0\xe7\
-\x74\x24\xf6\xaf\x5f\xbf\x19\x1e\x3f\x7d\x09\x19\x61\xfe\xf6\x6e\
-\xd0\x44\x3e\xb5\xd2\x00\x40\x00\xb1\x0c\xf5\xc8\x87\x55\x05\xa0\
-\xf6\xc0\x9b\x8f\xdf\x51\x02\x87\x45\x4c\x9b\xe1\xd7\xc3\x23\xe0\
-\xed\x5f\x57\x1e\x29\x32\xfc\xfa\x03\xe9\x39\x30\x32\x42\x1b\x7a\
-\xa0\xc8\x66\x60\x40\x69\xf4\x21\xb3\x5f\xbf\xfd\xc0\x70\xf4\xd4\
-\x65\x70\x29\x23\x2b\x2d\x0e\x96\x1b\x4c\x91\x4f\x8d\x44\x00\x10\
-\x40\x2c\x43\x3d\xf2\x61\x7c\x36\x16\x16\x06\x6e\x0e\x56\x86\x2f\
-\x3f\x7e\x23\x0d\x1f\xb3\x82\x13\xc1\x9f\x17\x17\xc1\x5d\x43\x7c\
-\x2d\x7c\x06\x68\x42\x80\xb1\xcf\x5f\xbe\xcd\x70\xe5\xc6\x5d\x86\
-\x9f\x3f\x7f\x32\xf0\xf1\x72\xc1\xf5\xfc\xfb\xfd\x9d\x81\x91\x95\
-\x73\x58\x44\x3e\x08\x00\x04\x10\xcb\x70\x88\x7c\x18\x07\x74\x7d\
-\xcd\x8f\xdf\x7f\x81\x39\x1e\x71\x3d\x07\x13\xb7\x18\x03\x13\xbf\
-\x1c\xc3\xbf\x8f\x8f\x70\xe6\x74\x64\xf6\xc7\x4f\x5f\x19\x4e\x9c\
-\xbb\xca\xf0\xf2\xd5\x5b\x70\xe4\x83\xf0\xfb\xf7\xef\xe1\xea\xfe\
-\x83\x12\x00\x0b\xe7\xb0\x88\x7c\x10\x00\x08\x20\xea\x95\x00\x03\
-\x1c\xf9\xf0\x13\x48\x40\x55\xc1\x87\x6f\x28\x62\xcc\x82\x4a\x0c\
-\x8c\xc0\xae\x21\xa8\x44\xf8\xf7\xe5\x19\x03\xc3\x97\x17\x58\x73\
-\xfd\xb5\x5b\x0f\x19\x2e\x5e\xbd\x0d\x8f\x78\x64\x0c\x6f\x1f\x30\
-\x0c\x92\x9c\x4f\xa5\x54\x00\x10\x40\x34\x5d\x16\x4e\xef\xc8\x07\
-\x6f\x24\x61\x66\x06\x8f\x12\xfe\x47\x9b\x30\x02\x95\x04\xa0\x44\
-\xc0\x24\xaa\xcd\xc0\x28\x63\xc5\xc0\xc8\x23\x89\xd2\xc2\xff\xf5\
-\xfb\x0f\xf8\x4c\xc1\x3f\x7f\x7e\x33\x7c\xfb\xf6\x0d\x03\xbf\x7d\
-\xf7\x1e\x32\x16\xf0\xe3\xf3\xa0\x88\x7c\x6a\x95\x02\x00\x01\xc4\
-\x34\x9c\x22\x1f\xc6\xe1\xe2\x64\x03\xb6\x09\x98\x71\x2e\x37\x03\
-\x15\xe1\x8c\x22\x5a\x0c\x0c\xd2\x96\x0c\x0c\xdc\x12\x90\xb1\x03\
-\xa0\x7a\x5d\x4d\x65\x86\x70\x7f\x17\x06\x43\x5d\x75\x70\x62\x00\
-\x45\xfc\xd7\xaf\x5f\xc1\xf8\xf5\x9b\x77\x90\x12\xe0\xdf\xef\x41\
-\x11\xf9\xd4\x1a\x08\x02\x08\x20\xa6\xe1\x16\xf9\xf0\x05\x24\x48\
-\xa3\x84\x38\xfb\xcf\xa0\xba\x5c\x58\x8b\xe1\xbf\xa4\x05\xc3\x7f\
-\x2e\x48\xd7\x90\x8d\x8d\x95\xc1\xca\x4c\x9f\x21\x37\x2d\x8a\xc1\
-\xd6\xd2\x18\xbc\xb6\x00\x94\x10\xfe\xfe\xfd\x87\xd5\xac\x81\x8a\
-\x7c\x6a\x01\x80\x00\x62\xa1\x46\xf6\x1f\x6c\x91\x0f\x9e\x30\x62\
-\x62\x02\x8f\x0f\x7c\xff\xf9\x1b\xcc\xff\xf5\xfb\x2f\xd6\x84\x0b\
-\xa6\xc0\x09\x41\x93\xe1\xbf\xa0\x2a\x03\xe3\x97\x27\x0c\x4c\x40\
-\xcc\xc1\xce\xce\xe0\xee\x6c\x03\xc6\x87\x8f\x9d\x66\xf8\xf4\xf9\
-\x33\x64\x79\xd8\xb7\x77\x0c\x2c\x42\x83\x20\xf2\xa9\x94\x12\x00\
-\x02\x88\x85\x8a\x89\x69\xd0\x44\x3e\x4c\x1f\x68\x59\x39\xa8\x0f\
-\x0f\xe2\x80\xea\xf8\xcf\xdf\x7f\x31\xfc\xfe\xf3\x17\xf7\x80\x0a\
-\x13\x0b\xc3\x3f\x3e\x05\x86\x7f\x3c\x32\xe0\x44\xc0\xfc\xf5\x29\
-\x03\xe3\xff\xbf\x0c\x76\xd6\x66\x18\x2d\xde\x81\x8e\x7c\x6a\x95\
-\x02\x00\x01\xc4\x32\x5c\x23\x1f\x5d\x0d\x2b\x2b\x0b\x83\x10\x10\
-\xff\x04\x26\x04\x50\xa9\xf0\xe3\xe7\x1f\xec\x6d\x04\x10\x0d\x4c\
-\x08\x7f\x79\x15\x18\xfe\x72\xcb\x80\x13\x01\xcb\x37\x48\x42\x80\
-\xcc\x07\xfc\x1e\x36\x91\x0f\x02\x00\x01\xc4\x32\x12\x22\x1f\x7d\
-\xc0\x08\x32\x68\xf4\x8f\xe1\xcb\xf7\x9f\x0c\x3f\x7e\xfd\xc1\x3d\
-\xd6\x0e\x4e\x08\xf2\xc0\x84\x20\xcd\xc0\xf1\xfb\x0d\xb8\x7a\xf8\
-\xf7\xf3\xd3\xa0\x88\x7c\x6a\xb5\x05\x00\x02\x88\x65\x24\x45\x3e\
-\xb2\x18\x78\x51\x09\x37\x27\x03\x37\xe7\x3f\x86\xaf\xc0\x84\x00\
-\x5a\x57\x80\x73\xf9\x3a\x23\x0b\x03\x23\x9f\x1c\x03\x97\xb8\x2a\
-\xc3\x9f\x8f\x4f\x06\x45\xe4\x53\x0b\x00\x04\x10\xcd\x97\x84\x0d\
-\xc6\xc8\x87\xf4\xff\xa1\x01\x00\x6c\x2c\xf2\x02\x13\x82\x30\x1f\
-\x37\xf8\x58\x7b\x5c\x0d\xc5\xbf\xff\xfe\x41\x12\x0e\x9f\xcc\xe0\
-\x88\x7c\x2a\xa5\x02\x80\x00\xa2\x69\x23\x70\xb0\x47\x3e\xb2\x1a\
-\x26\x70\xaf\x81\x93\x81\x87\xe3\x3f\xc3\xb7\x9f\xbf\xc0\x98\x01\
-\xe9\x76\x90\xbf\x48\x1b\x17\x06\x43\xe4\x53\xab\x14\x00\x08\x20\
-\x96\xd1\xc8\x47\x55\x03\xda\x7f\xc0\xc5\xc9\x0e\xec\x3d\xb0\x31\
-\x7c\xff\x01\x4d\x08\xff\x71\x0f\x7b\x0f\x64\xe4\x53\x23\x11\x00\
-\x04\x10\xcb\x68\xe4\x63\x17\x03\x9d\x5c\x06\x4f\x08\xc0\x44\xf0\
-\xe3\xd7\xef\x61\x17\xf9\x20\x00\x10\x40\x2c\xa3\x91\x8f\x3f\x12\
-\x41\x93\x45\x5c\x1c\xec\x0c\x9c\x1c\xec\x83\x2f\xf2\xa9\x90\x0a\
-\x00\x02\x88\xaa\x4b\xc2\x86\x5b\xe4\x0f\xc6\x3a\x9f\xda\xf7\x06\
-\x01\x04\xd0\xa0\x99\x0d\x1c\x8d\x7c\xfa\x47\x3e\x08\x00\x04\x10\
-\xd3\x68\xe4\x0f\xcd\xc8\xa7\xd6\x40\x10\x40\x00\x91\x9f\x00\xfe\
-\xfe\x02\x53\xe0\x1d\xc2\xa3\x91\x4f\xf7\xc8\x07\x01\xd8\xfc\x16\
-\x78\xdb\x3a\x99\x00\x20\x80\x48\x4d\x00\x17\xe0\xad\xc7\x6f\xcf\
-\xc0\x34\x68\x87\xf0\xc3\x8f\xa3\x91\x4f\xef\xc8\xff\x00\x8c\xf3\
-\x8f\xd0\x4d\xd0\xbf\xde\x20\x8e\xbc\x7f\xf7\xf6\xcd\x4d\x52\x22\
-\x14\x20\x80\x18\xff\x13\x51\xa1\x30\x22\x4d\xac\x2f\x5f\xbd\xe6\
-\x3e\x50\x8f\xc2\x3f\x16\x2e\x86\xaf\xd2\x2e\xa0\xb3\xdd\xc1\xe2\
-\x72\xfc\x0c\x0c\xe0\x53\xdf\x09\x1c\x03\x83\x31\xde\x4e\xa4\x1a\
-\x6c\xea\x88\x51\x33\xa8\xed\x23\xa0\x0e\x97\x1a\x50\xce\x87\x45\
-\x3e\x28\xf7\x7f\x3c\xbd\x88\xe1\xdf\x8f\x4f\x0c\xbf\x7f\xff\x7e\
-\x56\x5f\x5d\xe5\x87\x61\xd7\xff\xff\x67\x71\xc5\x2d\x40\x00\x91\
-\xd3\x0d\x6c\x00\xe2\x05\x4c\x7f\xbe\x31\x70\x3d\x3f\xc8\xf0\x4d\
-\xd2\x1e\x9c\x08\x1e\x7d\x64\x18\x05\x74\x06\xa0\xc8\xff\x74\x7e\
-\x25\x38\xf2\x41\xe0\xf1\xa3\x47\xb3\x48\x35\x03\x20\x80\x48\x6e\
-\x03\x44\x86\x86\x2c\x04\x52\x1b\x40\x6c\xe6\x5f\x1f\x19\xb8\x9e\
-\xec\x66\x60\xf9\xf4\x00\xde\x26\x18\x05\xf4\x89\xf8\x9f\xcf\xaf\
-\x30\x7c\x3a\xb3\x98\xe1\xef\x97\xd7\x60\xb1\x2f\x5f\xbe\x1c\x98\
-\x33\x73\xc6\x16\x2c\xca\xbf\xe1\x33\x0b\x20\x80\xc8\x1d\x08\x4a\
-\x00\x95\x02\x40\x1c\x00\x2a\x09\x38\x5e\x9f\x66\x60\x78\xcd\x40\
-\xd2\x36\x2b\x74\x36\x0a\x1f\x69\xf5\x2d\x39\x66\x91\x6a\x1f\x4e\
-\x77\x50\xd3\x3e\x70\xbd\xfe\x1f\xaf\x38\xb9\xfe\x00\x45\xfe\xf2\
-\x25\x8b\x1b\x70\xc4\xd5\x2b\x7c\x11\x09\x10\x40\x24\xb7\x01\x90\
-\xc1\xb2\x55\xab\xe3\x81\xfa\x41\x16\x2b\x50\x33\x42\x46\x13\x00\
-\x71\xec\x3f\x7f\xfe\x3c\x7b\xf8\xe0\xc1\x2c\x1c\x39\x1f\x04\x40\
-\x2d\x85\x2b\xf8\xe2\x18\x20\x80\x28\x4a\x00\x30\xb0\x74\xe5\x2a\
-\xff\x27\x8f\x1f\x7b\xa1\xec\x9e\x47\xee\x09\x20\x3b\x9e\x01\x79\
-\x56\xed\x3f\xda\x09\x62\x68\xea\xb0\x0d\x7c\xe0\x0a\x14\x06\xb4\
-\xd9\x3a\x6c\x66\xa1\xcf\xa2\xc1\x37\x7d\xe2\x71\x07\x8a\x39\x44\
-\xf8\x0f\x87\x9b\x70\xfa\x0f\x87\x9b\x08\xb9\xe3\xed\x9b\x37\x37\
-\x17\x2f\x98\x7f\x90\x40\xd4\x5d\x03\xe2\xef\xf8\xe2\x18\x20\x80\
-\xa8\x92\x00\xa0\x80\x1f\x5a\x12\x50\x75\x8a\x79\x14\x90\x05\x40\
-\xcb\x9c\x80\x0d\x33\x86\x8f\xd8\x4a\x38\x64\x00\x10\x40\xd4\x4c\
-\x00\x20\x00\xea\x13\x82\x76\x5c\x88\x8c\xc6\xc1\x80\x01\xd0\x89\
-\x96\xcf\x41\xc3\x03\xb8\xaa\x3e\x64\x00\x10\x40\xd4\x4e\x00\xc8\
-\x09\x01\xb4\x29\x9f\x79\x34\x3e\xe8\x06\x40\xe3\x82\x1f\x90\x23\
-\x9e\x98\x04\x00\x10\x40\x44\x25\x80\x51\x30\x7c\x01\x40\x80\x01\
-\x00\x7c\x2f\x2b\xed\x65\xed\x48\x99\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x0c\x68\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x0c\x2f\x49\x44\x41\x54\x78\xda\xcd\x5a\x09\x70\x14\x55\
-\x1a\xfe\xbb\xe7\xca\x64\x72\x1f\xe4\x24\x21\x51\x48\x84\x24\x90\
-\x8b\x08\xa8\x28\xac\x22\xb5\xb2\x1e\x50\x88\x28\x28\xba\x5a\x2a\
-\x2e\x78\xc3\xee\x5a\x16\x2e\x56\xb9\x96\x6b\xb9\x16\xee\x7a\xa0\
-\x2c\xbb\xa0\x41\x05\x94\x3b\xae\x21\x1a\x82\x09\x10\x72\x11\x72\
-\xcc\x4c\x32\x99\xdc\x93\x39\x92\xb9\xef\x99\xde\xff\x4d\xf7\x4c\
-\x26\x80\xc8\x91\x5a\xe7\x85\x37\xdd\x3d\xef\x4d\xf7\xf7\xfd\xef\
-\xff\xbf\xf7\xbf\xd7\x50\xf0\x7f\x28\xb9\x2b\xf6\xdd\xc1\x78\x5c\
-\x34\x00\x43\x79\xbd\xae\x1e\xf9\x81\xb5\x3d\xf8\x35\xc3\xd5\xeb\
-\x2a\xd4\xa4\x83\x5d\xbe\xef\x7e\xc4\x75\x07\xde\x79\x0e\x45\xf1\
-\x6f\xa5\x69\x1a\x04\x02\x81\xef\x51\x3e\xc4\xf8\xe1\x72\x3b\xf1\
-\xc4\xdb\xcf\x78\xdd\x35\x48\xec\x84\x55\xd3\xf6\x6d\xff\xc9\x37\
-\x35\xd8\xec\xbd\x6a\x02\xd3\x7f\xbb\x2b\x46\x7e\x64\x8d\xe1\x7a\
-\xac\x91\x73\xff\x57\x59\x14\xcd\xdb\x02\x14\x75\x6f\x64\x44\x78\
-\x74\x78\x78\x24\x08\xc3\xc2\x21\x2c\x4c\x02\x5e\x86\x02\x2f\x25\
-\xc0\x23\xa2\x43\x78\x1e\x0f\x03\x6e\x8f\x1b\xdc\x4e\x07\x78\xdc\
-\x76\x70\xda\x8d\xe0\x74\xda\xc0\xe3\xb2\xed\xb1\x8f\x75\x6f\x55\
-\x1e\xdf\x24\xc3\x5b\x7a\xae\x14\x0f\x12\xf8\x4f\xb3\x59\x55\x7f\
-\xf7\x70\xc3\x36\x1d\x5e\xbb\xae\x0e\xf8\x97\x08\x9c\xbf\x45\x28\
-\x14\xae\x8d\x8f\x8f\x81\x98\x98\x04\xa0\xf8\x61\x60\xb1\x7b\xc0\
-\x46\xaa\xd3\x0d\x1e\x44\xed\x25\xe8\x71\xac\x69\xac\x14\x45\x01\
-\x9f\xc7\x07\xdf\xc8\xf0\x79\x20\x14\xf2\x81\x41\x22\x76\xab\x11\
-\x8c\xc6\x51\x70\xda\xf4\xdb\x8d\x7d\x35\x6f\x0c\xd7\xff\x43\xc5\
-\x11\xf9\x05\x02\xf7\xec\x66\xf0\x0e\xed\x9a\xf6\x3d\xf7\xe9\x7b\
-\x2a\x94\x57\x42\x22\x77\xc5\xfe\x18\xf4\x85\x2d\x3c\x3e\x7f\x63\
-\x5a\x72\x22\xc4\xc4\x27\x82\xd3\xcd\x03\x9d\xd1\x09\x46\xb3\x13\
-\xad\xcd\x02\xa6\xd8\x0f\x04\xcd\x02\xa7\xb8\x73\x9a\x9c\x23\x1b\
-\x42\x88\xc6\x0f\x91\x50\x00\x92\x30\x21\x7a\x95\x13\xf4\xa3\x6a\
-\xd0\x8f\xe9\x06\xad\xea\xb6\x35\xca\xaa\x3f\xd6\xe2\xe3\x9c\x97\
-\x1b\x0d\xaa\xec\x91\xfd\x4c\xb8\x58\x04\xfd\x43\x1a\xa9\xb6\x63\
-\xcf\x32\xbd\xe2\xf2\x24\x72\x1e\xf8\xba\x10\xdd\xe5\x9b\xc4\xf8\
-\xe8\xcc\xe4\x94\x54\x34\x91\x08\xd4\xa3\x0e\xd0\x23\x70\xa0\xd0\
-\x16\x2c\x6c\xee\xee\x17\x80\xf6\x13\xa1\xd9\x6b\x02\xde\xd7\xc6\
-\x5d\x87\x8b\x85\x10\x29\x16\x80\xd9\x30\x0a\x43\xaa\x11\xb0\xe9\
-\xfb\x5e\xea\x3a\xf4\xe4\x47\x78\x27\x3b\xfc\x4c\x7c\xf8\x08\xdc\
-\xba\x60\x36\x9c\x6d\x94\xc2\xc0\xb0\x46\xaa\x43\x12\x63\xdd\xc7\
-\x2e\x49\x22\x77\xf9\xde\x75\x3c\xbe\x60\x47\xe6\xd4\x24\x88\x8e\
-\x4d\x06\xf5\x98\x03\xb4\x06\x87\xcf\x4d\x18\x26\x48\x0f\x28\x08\
-\x8c\xc0\x04\xeb\x07\x00\x53\x01\x42\xbe\x73\x1a\x02\xa3\x21\x44\
-\xb7\x8a\x8d\x0a\x03\x07\xba\xd4\xc0\xa0\x0a\x0c\x23\xf2\x57\xbb\
-\x8f\x3c\xfd\x21\xde\xd1\x7a\x29\x12\x54\xd9\x9a\x6f\x98\x85\xb7\
-\x14\x63\x70\xb9\xa0\xa1\x59\x06\x83\xc3\x5a\xa9\xb6\xbd\x1c\x49\
-\x1c\x9d\x40\x02\xd5\xe5\x0d\xb1\x58\xf4\xfa\x8d\xd9\x99\x00\xfc\
-\x08\xe8\x55\x59\xc0\xe6\xf0\x8c\x6b\x21\x43\x44\xd2\x8f\x9f\x0a\
-\xe8\x9b\x0f\x34\xb0\x56\x26\x88\x59\xcb\x07\xb9\x51\x60\x34\xfc\
-\xc4\xf0\xf6\x3c\x1a\x12\x63\xc5\xe0\xb2\x5b\x40\xd6\xd5\x07\xc6\
-\x81\x33\xab\x95\xc7\xff\x7c\x90\x23\xc1\x5c\x40\xe0\x5b\xe6\xb6\
-\x5b\x8a\x40\xde\x6f\x85\x69\xc9\x42\x68\x3a\x27\xc3\xe1\x43\x12\
-\x6d\x5f\x04\x48\xe4\x2e\xdf\xbf\x13\xdd\xec\xd1\x9c\x19\x37\x80\
-\x93\x11\x42\xcf\x90\x19\x5c\x1e\x86\x05\x0d\xc1\x82\x3e\x51\x95\
-\x89\x85\x79\x3c\x1e\xf0\xf9\x7c\xe0\x21\x32\x01\x9f\xf6\xb9\x0f\
-\x45\xb1\x8c\xbd\x5e\x8f\x4f\x9d\x08\x78\x5e\x50\x4c\x90\x6b\x42\
-\x22\x29\x4e\x0c\x56\x93\x01\x3a\x64\x7d\xe6\xc1\xda\xbf\xcd\xd3\
-\x2b\x2a\xbb\x38\x77\x9a\x48\xe0\x96\x05\xc5\x50\x77\x7e\x0c\x12\
-\x63\x44\x90\x99\x24\x84\xe6\x56\x19\xa8\x46\x74\x52\x4d\xdb\xe7\
-\xcb\xa6\xe4\xaf\xbd\x57\x22\x89\x78\x27\x37\xe7\x06\x30\xda\xf9\
-\x30\xa0\xb1\xa2\xbb\x30\x3e\x97\x61\x7c\x7f\xac\xb6\xb3\x3a\xcf\
-\xb0\xf6\x47\x84\x42\xd4\x7e\x01\x5f\x08\x3c\x0a\x47\x9d\x21\xba\
-\x8f\x8a\xe4\xb6\x21\x50\x1a\x25\x56\x8c\x12\x2b\x42\x05\xc2\xc0\
-\xc5\xbe\x0e\x54\x2b\xbb\xcb\x3d\xc1\x95\x58\x77\xa2\x21\x35\x21\
-\x0c\x7a\x7a\x06\x60\xa0\x4f\x59\xdd\xf9\xd5\xca\x07\xf1\x01\x44\
-\x2d\xdd\x41\x04\x0e\x30\x0b\xe6\x17\xc1\xe9\xb6\x31\xdf\x83\xe3\
-\xa3\x85\x90\x96\x20\x84\xd6\x76\x39\xa8\xb5\x63\x43\x08\x3e\x35\
-\x17\x2d\x6f\x72\xf8\xc1\xb3\x80\x19\xbf\x43\xfa\x47\x81\xc5\x8e\
-\xa0\x05\x10\x26\x14\xa1\x00\x3a\x51\xe3\x47\xc1\xed\xb2\xa2\xc6\
-\x5b\xd5\x2e\xab\xf6\x9c\xd7\x69\x56\x91\x48\x17\x44\xa6\x14\xd0\
-\xfc\xb0\x64\x91\x38\x22\x29\x2a\x32\x02\x62\xe3\x62\x41\x28\x0a\
-\x03\x83\xd5\x81\x93\x9c\x27\xe0\x4a\xe4\x18\x13\x21\x80\xe8\x70\
-\x0a\xea\x1b\xbb\x41\x23\xaf\x5a\xd7\x5f\xfd\x97\xfd\xf8\x24\x93\
-\x7f\xd0\xa9\xb2\xb5\x07\x98\xf9\xf3\x8a\xa0\xbe\x5d\xcf\x0d\x3b\
-\xfe\x28\x52\x00\xc9\x71\x42\x90\xc9\x15\x90\x90\x90\x00\x3c\x51\
-\x14\x74\x0f\x9a\x59\x8b\x93\x09\x29\x08\x74\xc0\x75\xf0\x5f\x38\
-\x5a\x96\x8f\x47\xbb\x45\x07\x4e\x87\x11\x1c\xc6\xfe\x4a\x75\xcb\
-\xae\x7f\x1b\x94\x3f\xf4\x62\x27\x1b\x37\xfc\x6e\xce\xd7\x84\x49\
-\x45\x8f\xe7\x47\x67\x2d\x5e\x2d\x8e\x4a\x5d\x9a\x92\x1c\x0f\x53\
-\x92\x12\x40\x6f\x71\x61\x6c\xb9\x27\xc4\x46\x5a\x82\x18\x0c\xa3\
-\x63\xd0\x7a\x5e\xd6\xd4\x5e\x7e\xdf\x7d\xf8\x5b\x15\x27\xaf\x40\
-\xcd\x5d\x7b\x90\x99\x7f\x73\x21\x9c\xed\xd0\xfb\xc0\x93\x5b\x13\
-\x80\xd1\xc8\x3c\x29\x56\x84\xbe\x4e\x81\x7c\xc0\x84\xb3\x27\x13\
-\x00\x7c\xe1\x91\x42\xc7\x8e\x10\x8b\x81\xf1\x38\xd0\x67\x55\xe0\
-\xb0\xa8\x5b\x87\xeb\x3f\x7c\xc7\xa0\xfc\x51\x81\xcd\x7a\xae\xda\
-\x38\x51\xf0\x70\x04\x78\x58\x49\x8e\x21\x4e\x2d\xdb\x50\x16\x7b\
-\xe3\x5d\x6f\x25\x24\x4e\x99\x9e\x9d\x9d\x06\x06\x9b\x07\xac\x76\
-\x77\x60\x24\x24\x61\x3c\xc4\xc2\x87\x9f\x4e\xcb\x61\xa8\xe9\xcb\
-\x07\x87\xeb\xff\xf9\x1d\xfe\xce\x48\x20\x20\x81\x43\xcc\xcd\x65\
-\x73\xa0\x49\x6a\x08\x4c\x3a\x5e\xce\xca\x91\xe1\x42\x04\xee\x05\
-\xa3\xd5\xcd\xf9\xbd\x1f\x38\x97\xd7\xe0\x1f\x4d\xf3\x7c\xe0\x5d\
-\x76\x13\x98\x8d\x23\x60\x1e\x6e\xf8\x44\x59\xb9\xb9\x1c\x9b\xc7\
-\xb0\x6a\xb9\x07\xd9\xe0\xd2\xe9\x01\x21\xc2\x27\x24\x62\x6f\x5c\
-\x32\x35\xb9\xf4\x99\x0f\x12\x93\x52\x6f\xcf\x99\x91\x0e\x63\x16\
-\x37\xce\xe4\x5e\x8c\x21\x56\xc9\x32\xa6\x84\x41\xaf\x72\x18\xa4\
-\x1d\x9d\xc7\xa4\x5f\xaf\x7a\x0a\x7f\x33\x42\x0c\xe2\x23\x50\x36\
-\xb7\x10\x9a\xe5\xdc\x08\x00\xe7\x22\x88\xd6\xef\x2a\x5e\xbf\xdf\
-\x33\xac\xdf\x8f\xcb\x26\x85\xfe\x29\x01\x87\xcd\x08\x26\xfd\xa0\
-\x45\xd7\xb1\x6f\xab\xaa\xf1\xd3\x93\xd8\xaa\xe6\xc0\x9b\x39\x97\
-\xf9\xa5\xbc\x86\x3c\x58\x90\x30\x73\x79\x66\x72\xc9\x53\x87\x32\
-\x32\x92\x73\xb2\xa6\x25\xc1\x80\xd6\x11\x50\xb3\xd8\x08\x3e\x48\
-\x04\x1e\xa8\xae\xed\x32\xb7\xee\x5c\x54\x86\x5f\x13\xb7\xb4\x20\
-\x81\xc3\x4c\x69\xe9\x1c\x68\xed\xd6\x07\x7c\x79\x02\x58\x1f\x11\
-\x8a\x1d\x81\x20\xeb\x93\x8e\x12\x62\x79\x9b\x09\x4c\x86\x41\x8b\
-\xaa\xf1\xb3\x57\xb5\xed\x7b\x1b\xb1\x61\x98\x03\x6f\x83\xab\xcf\
-\x2e\x05\x09\x79\x2b\x33\x53\xe6\x3e\xdb\x58\x32\x3b\x33\x92\x8f\
-\x31\xa5\x35\x38\x7d\x04\x04\x38\x14\xd3\x50\x21\xab\x6b\xbb\x41\
-\x79\xfa\x5f\x6b\x54\x67\xb7\x1f\xc3\xfe\xa3\x54\x29\x21\x50\x32\
-\x1b\xce\x2b\x8c\x01\x17\x22\x20\xbd\x5c\xc0\x4e\x24\xe3\xd7\x7c\
-\x8a\x53\x1a\x37\x06\x57\x1f\x8c\xca\x2b\xb6\x0e\xd6\xbd\x7b\x14\
-\x9b\x06\x39\xf0\xf6\x2b\xb0\xfa\xcf\x92\xc8\x5d\x59\xbe\x3e\x2e\
-\x39\xfb\xbd\xfc\xbc\x0c\xe8\xd3\xa0\x9a\xb9\xbd\x3e\x49\x9d\x91\
-\x2e\x06\x99\x6c\x10\x64\x2d\xb5\xdb\xba\x0f\xaf\x7f\x9b\xb8\x11\
-\x12\x38\xc2\x14\x17\xcf\x86\xf6\x1e\x03\x37\xc9\x50\x13\x01\x5f\
-\x10\xb0\xc4\x9d\x48\x36\x29\xe0\x09\x40\xaf\xed\x05\xc3\xc0\x69\
-\xf4\xf9\x4d\xbb\x38\xf0\xaa\xeb\x04\xef\x2f\xe2\x82\x27\xaa\x65\
-\x79\x37\xa5\xa7\x3b\x69\xf4\xfd\x11\xbb\xef\xf9\xd9\x29\x22\xf0\
-\x60\x8a\xd1\xd6\x72\xee\xbb\xce\xaf\x56\x3d\x87\xfd\x06\xa8\x12\
-\x24\x50\x54\x58\x00\xd2\x3e\xe3\x38\x01\xa0\x02\x41\xeb\x0d\x0a\
-\x58\x86\x5b\x94\x88\x85\x12\xb0\x1a\x75\x60\x36\xa9\x2c\x8a\x63\
-\x1b\x57\xdb\x74\x32\x29\x47\xe0\x92\xf9\xca\x35\x14\x7a\xe6\xc3\
-\xdf\x3c\x9b\x92\x9e\xb9\xed\x86\xe9\x69\xd0\xd2\x6d\xf1\x3d\x37\
-\x2d\x5e\x08\x12\xda\x01\x4d\x4d\x1d\x2d\x6d\xbb\xee\x79\x18\xbf\
-\xea\x45\x02\x47\x99\x39\x73\xf2\x51\x2a\x8d\x41\x29\x2f\x75\x91\
-\xd6\xb3\x93\x16\xc5\x29\x8f\x00\xf5\x9e\x07\xc6\xb1\x21\xcc\xe3\
-\x75\x5d\x43\x75\x7f\x5f\xae\xef\xa9\x22\x24\x1c\x93\x00\xde\x57\
-\xb2\x96\xbc\x9d\x14\x9b\xbd\x50\x55\x56\x9c\x01\x3d\x1a\x0f\x66\
-\xbb\x6e\x5f\x20\x4f\x4b\xa0\xe0\x64\x9d\x6c\xa4\x75\xc7\xa2\xbb\
-\xb1\x9b\x82\x2a\x46\x02\xb3\x67\xe7\x83\x62\xc8\x14\x00\x0f\xc1\
-\x6a\x04\x41\x33\x2d\xb0\xfe\xef\x74\x93\x55\x15\x0d\xe1\x98\xc7\
-\xbb\x6c\x38\x12\x46\xb5\x54\xd5\xf0\xe9\x32\x5d\xc7\x7e\x25\x5c\
-\xe5\xa2\xe8\x72\xa3\x50\xf0\xe4\x89\x9a\x82\x99\xe9\xf3\x5d\x7c\
-\x31\xf4\x63\x2c\x44\x8a\x69\xc8\x4d\x15\xc0\x8f\xb5\x0a\x68\xf9\
-\x78\xfe\x5c\xec\xd3\xe5\x23\x90\x9f\x9f\x0f\xca\x11\xd3\x78\xfa\
-\x4b\x53\x1c\xd8\x89\xba\x4f\x12\x38\x93\xd5\x83\x47\x96\xa3\x58\
-\x24\x84\x68\x89\x08\x9c\x38\xf3\xea\xc7\x54\x2c\x89\xf6\x7d\x93\
-\x46\xa2\xe0\x89\x1f\xde\x9a\x36\x2d\x79\x73\x62\x4a\x3c\x74\x0e\
-\xd8\x21\xca\x47\x80\x0f\x55\x27\x7b\x90\xc0\xbc\x79\xd8\x45\x8e\
-\x04\x8e\x31\xb3\xf2\xf2\xa0\x5f\x6d\x0a\x58\xdf\x1f\x0b\xc0\x59\
-\x9e\x24\x9e\x46\x8b\x07\xcc\xb8\x4c\xf4\xa7\xc1\x14\x97\xd3\x8b\
-\xc3\x04\x38\xb4\x22\xb0\x9b\x74\x30\xaa\x1b\x41\x12\xdb\x97\x69\
-\xdb\xf6\x4e\x0a\x89\x59\x8f\x1e\x5d\x92\x94\x92\x5a\x31\x67\xce\
-\x54\xa8\x97\x5b\x59\x02\x29\x7c\x38\x5e\xa3\x84\xe6\x8f\xca\x16\
-\x60\x17\x29\x55\x84\x04\x6e\x9a\x99\x07\x43\x5a\x73\xd0\xa2\x63\
-\x3c\x16\xec\x2e\x2f\xe8\x0c\x6e\x9f\xf5\x29\xda\xbf\x8a\xa2\xc6\
-\xcf\xb1\x4a\x90\x44\x5c\xa4\x10\xac\xb8\x92\xd2\x68\x70\x24\xce\
-\x7e\x32\x29\x24\x66\x3d\x56\x51\x9a\x30\x25\xf9\x4c\x29\xc6\x41\
-\x7d\x17\x4b\x60\x46\x32\x0f\x2a\xab\xbb\x2c\x2d\x1f\x2f\xb8\x13\
-\xbb\xc8\xa8\xa2\x35\x15\x4c\xce\xcc\x59\xec\x8e\x01\xd1\x7f\xef\
-\x78\x2a\x61\xb1\x7b\xc1\x60\xf6\x70\x79\x3d\xc5\x55\x74\x4e\x72\
-\xa4\xb9\x6b\x9a\xbb\xe6\xb1\x89\x97\x59\xaf\xc3\x54\x7c\x44\x6a\
-\x1d\x6e\x59\xaf\xa8\x78\xa9\x86\x23\x71\xad\xb2\xca\x2b\x5c\x7f\
-\xd6\xbd\xf8\xd6\x4c\xe8\x18\x76\x23\x01\x1e\x48\x50\xa5\x4f\x9d\
-\xea\x68\x3d\xbf\x73\xc9\xef\x81\xc4\xc0\xac\x55\x87\x18\x92\x97\
-\xb3\xf9\x3c\xe7\x36\x14\x15\x74\xcd\xba\x0a\xd0\xe3\x01\x4e\xfb\
-\x03\x9d\x9a\x38\x5a\xfe\x6b\x3b\x66\x93\x38\x7f\x9b\x8c\xbd\x3f\
-\xad\x50\xfe\x77\xf3\x09\x60\xd5\xe9\x5a\x48\x50\x85\xcf\x35\x78\
-\xef\xbc\x2d\x13\x64\x23\x1e\x88\x0a\xa7\x41\x84\xe9\xf9\xa9\x33\
-\xd2\x73\xad\x3b\xee\x5a\x87\xed\xdd\x04\x61\x14\xd6\xa9\x58\xa3\
-\xaf\xd7\x67\x83\x0a\x01\x4b\xd2\x5d\x92\x9f\x90\x0d\x2b\x92\x13\
-\x5d\xd3\xfc\x50\xf8\x87\x46\x66\xc9\xc2\x4c\x90\xab\x3d\x90\x16\
-\x27\x80\xc1\x3e\x2d\xb4\xd6\xd7\xee\x96\x7d\xfd\xe8\x3b\xd8\xdc\
-\xe3\x4b\xa2\xb0\x8a\xb9\xe3\x64\x17\x92\xc8\xf9\xd3\xe8\x6b\x72\
-\xa3\xa2\x0d\x4d\xcc\x92\xdb\x91\x80\xc6\x8b\xfe\x2f\x80\xe6\xe6\
-\x41\x68\xab\xd9\xbb\xa5\xb7\xf2\xf5\x3d\xd8\xdc\x3f\xe9\x5b\x8b\
-\x93\x5d\x8a\x36\x34\x33\x4b\x17\x65\xc0\x20\xa6\x6a\xe9\xd1\x14\
-\x54\xd5\xf4\x41\xe7\xe1\x3f\x3d\x34\xda\x79\xa4\x0e\x9b\x87\x43\
-\x9e\xc0\xfc\x57\x5a\x99\xdf\x2c\xcc\x00\x95\x91\x81\x08\xca\x01\
-\x55\x27\x14\xea\xe6\x0f\xe7\x3d\x80\x4d\xdd\x58\x35\x21\x4d\x00\
-\xdd\xe7\x8e\xd8\xa8\xb0\xaa\x85\xb7\x65\x80\x15\x17\x37\xbd\x5d\
-\x5a\x68\x3e\x53\x7f\xa0\xe3\x8b\x95\x6f\x72\x04\xf4\x21\x4d\xa0\
-\xf0\xb9\xfa\xc5\x69\x29\x31\x95\x37\x97\xa5\x61\xe6\xee\x81\xaa\
-\xea\x3e\x90\x7e\xff\xee\xd3\xaa\xb3\x3b\xaa\xb1\xb9\x1f\xc8\x82\
-\xe6\xd7\x06\x79\xb9\x52\xb4\xb1\x79\xeb\xf4\xec\xd8\xd7\x0a\xf2\
-\x13\x41\x3d\x6c\x82\x13\x75\xbd\xea\xa6\x0f\xe6\xae\xc0\x26\xf2\
-\x7e\x81\x5d\x52\xfe\xda\x20\x2f\x57\x8a\x5f\x68\x3d\x38\xaf\x78\
-\xca\xb2\xd4\xd4\x48\xa8\x3d\x35\x04\xed\xb5\x87\xde\x53\x1c\x7e\
-\x61\x37\x47\x80\x48\x34\x13\xd2\x04\x4a\x5e\x6c\xeb\x5d\xba\x28\
-\x3d\xc3\x81\x13\xe3\xf1\x93\x83\x96\xce\xf2\xd5\x0f\x59\x54\xe7\
-\xdb\x81\x5d\x7b\xf8\x76\xe8\x42\x96\x40\xd1\x0b\x2d\x59\xe1\x62\
-\xb1\x62\xe9\xe2\x34\x38\x55\x3f\x02\xf2\x96\xd3\x5f\x74\x96\x3f\
-\xf4\x3e\xb0\xd6\x27\xbb\x73\xde\x90\x26\x50\xf2\x52\xdb\xe3\x99\
-\xe9\x91\x9f\x4d\xcf\x8a\x84\xef\x6b\xd0\xfa\x9f\xaf\x7a\x18\xad\
-\xdf\x09\x6c\xf0\x5a\xfd\xfd\x42\x97\xc0\xcb\x1d\x07\x8b\xf3\xe2\
-\x96\x29\xfa\xcc\xd0\xd3\x70\xe4\xbd\xae\x03\x1b\xc8\x5e\x13\xd9\
-\x4a\x21\xd6\x0f\xbc\xb9\x09\x59\x02\xa5\x9b\x64\xfa\xbc\x2c\x49\
-\x74\xf3\xf9\x81\x96\xa6\x0f\xca\x36\xe2\x57\x03\x58\x87\x80\x4d\
-\x4d\x02\x25\x24\x09\x94\xbc\x2a\xbd\x1f\x17\x4a\xfb\xc9\x76\xa6\
-\xb2\xf2\xaf\xcf\x0c\x9f\xde\x4e\xd2\x86\x3e\xac\xe4\x65\xe4\x84\
-\xa4\x30\x24\x09\x94\x6e\x92\x1e\xa0\x28\xfe\xef\xcc\x03\x0d\xdb\
-\xda\x77\xaf\x2c\xe7\xc0\x93\xdd\xbe\x8b\x16\x48\x21\x47\xa0\x74\
-\x53\x57\x0c\x2e\x29\xc6\xdc\x36\x43\x55\xe3\xfb\xc5\xaf\x01\xbb\
-\x51\x46\x5c\xe7\xa2\xb7\x33\x21\x49\xa0\xe4\x95\xce\x17\x71\x55\
-\xf4\xbc\xec\xcb\xc7\x1e\x31\xf6\xd6\x91\x80\x25\x9a\x4f\x36\x88\
-\x2f\xfd\x92\xef\xd7\x06\x7c\x61\x29\x7d\xa5\xb3\x65\x54\x5a\xb1\
-\xb9\xfb\xe0\xf3\x4a\x60\x15\x67\x14\x82\xde\xc8\x84\x34\x81\x92\
-\x97\xdb\xd7\xd9\xb4\x72\x59\xdb\xce\x7b\x89\xd6\x93\x65\xa8\x1e\
-\x7e\x61\xb3\x2c\xa4\x08\x00\xf7\xae\x00\xd8\x97\x1f\x76\xb8\x82\
-\xb5\x74\xa8\x11\xa0\x39\xf0\x04\xf4\x15\xfd\x7f\x89\x50\x23\x70\
-\xd5\xe5\x7f\xc8\xf0\xd0\x2f\x10\x04\x65\x64\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x45\xff\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\
-\xda\xec\x9b\x7d\x6c\xdb\x75\x7e\xc7\xdf\xf4\x29\x69\x9b\x92\x23\
-\x34\x25\x18\x52\xd7\x75\x4c\x2e\xf5\xe2\xf9\x6c\x5c\x7b\xc9\x25\
-\x67\x7b\xf1\xe2\xd4\x76\xb0\x93\x8b\x63\x67\x71\x9e\x7c\x79\x70\
-\x9a\xc4\x71\xd2\x38\xcd\x43\x9d\xa4\x29\x43\xec\x28\x03\xd6\x4e\
-\x07\x45\x07\x9c\xd8\x56\x5a\x75\x54\x9a\x26\x34\xed\x2a\x18\xdc\
-\xd0\xed\x34\x24\x40\x37\xdd\xad\x9d\x8e\x55\xab\x36\x4e\xe3\x36\
-\x90\x60\x57\xb6\x6b\xdf\xfb\xe7\xfb\xfb\xe9\x5b\xe3\x94\x26\x4d\
-\x41\x61\xad\xf4\x51\x5b\x45\x76\xfc\xfd\x7d\x5e\x9f\xa7\xf7\xe7\
-\x6b\x90\xc4\x17\x6d\x00\xee\x90\x6c\x9d\x64\x77\x00\xb8\xe3\xcb\
-\xf8\x4c\xff\x5f\xed\xcb\x72\xfc\x06\x00\x09\x00\x3f\x00\xb0\x09\
-\xc0\x46\x61\x1b\x00\xac\xbf\x0d\xc3\x57\x10\x00\x29\xda\xf7\x00\
-\xf8\x31\x00\x02\x78\x1b\xc0\x16\x00\x9b\x01\xe4\x03\xc8\x93\x40\
-\xb8\x0d\xc1\x57\x05\x00\xc9\xf9\xfd\x00\x3e\x11\xce\x27\x80\x7f\
-\x04\x70\x37\x80\x22\x00\x5f\x03\xb0\x4d\x00\x91\x27\x65\x83\xdb\
-\x10\xac\x65\x00\x84\x03\xf3\x01\x3c\x2f\x39\x5e\xb1\xb7\x00\x94\
-\x02\xb8\x0f\x40\x89\x80\xe1\xce\x2c\x08\xd6\xdd\x06\x60\x0d\x02\
-\x20\xd5\xfb\xbb\x01\xfc\x48\x71\x7a\x41\x41\x01\x8b\x8a\x8a\x14\
-\x00\x7e\x08\xa0\x02\x80\x01\x80\x0e\x80\x46\x82\x60\xb3\x28\x07\
-\xeb\x6f\x03\xb0\xc6\x00\x90\x9c\x7f\x9f\x48\xf3\x04\xc0\xc2\xc2\
-\x42\x1a\x0c\x06\x16\x16\x16\x2a\x00\xfc\x19\x80\xbd\x00\xcc\x00\
-\x8c\x02\x82\x12\x00\x77\x01\xd8\x2a\xb2\xc0\xfa\xdb\x59\x60\xed\
-\x01\xb0\x4e\x38\xff\xbc\xe2\xfc\xa2\xa2\x22\xea\x74\x3a\x9a\x4c\
-\x26\x16\x14\x14\x28\x00\x7c\x17\x80\x0b\xc0\xef\x00\xf8\x06\x80\
-\x07\xc4\xeb\xee\xfe\x2a\x00\x90\x35\xee\xde\x90\xad\x79\x00\xc4\
-\x41\xb6\x03\xf8\xa9\xe2\xfc\xe2\xe2\x62\xea\xf5\x7a\x7a\xbd\x5e\
-\x96\x97\x97\x33\x2f\x2f\x4f\x01\x60\x04\x40\x00\xc0\xef\x02\x70\
-\x88\x2c\x50\x2a\x5e\x5f\xb0\x96\x01\x58\x42\xe7\x58\x9f\xc3\xbe\
-\x54\x1d\xe4\x56\x1c\x3a\x0f\xc0\xeb\xd9\xce\x77\xbb\xdd\xf4\xf9\
-\x7c\xd4\x6a\xb5\x8a\xf3\x7f\x0d\x20\x0c\xa0\x05\x80\x17\xc0\x37\
-\x01\xfc\x96\x04\xc0\x56\xa1\x11\xac\xa9\x1e\x20\xcb\xf1\x1b\xc4\
-\x74\x63\x00\x70\x8f\x68\x86\x37\x4b\x63\xaf\x32\xfa\xe6\x7d\x59\
-\x3a\xc8\xad\x18\xf5\xbe\x9f\xed\xfc\xaa\xaa\x2a\x0e\x0d\x0d\xd1\
-\xe9\x74\xb2\xa4\xa4\x44\x01\xe0\x5d\x00\x9d\x00\x62\x00\x1a\x01\
-\x38\x01\x98\x04\x00\x77\x8b\x49\x60\xd3\x5a\x8b\x7e\xf1\x99\x23\
-\x00\xce\x00\xf8\x65\xd6\xd4\xf3\x11\x80\x73\x00\x0e\x00\xd8\x29\
-\x9a\xdd\x02\x01\xfb\x66\x09\x84\x2f\x0c\x82\xd5\x76\xfe\x77\xb2\
-\x9d\xef\x70\x38\x38\x31\x31\xc1\xee\xee\x6e\x5a\xad\x56\xb9\x01\
-\xfc\x73\x00\x71\x01\xc1\x43\x00\xbe\x05\xa0\x52\xf4\x00\x45\x22\
-\x3a\x36\xae\x25\x00\x44\x46\xbb\x98\x63\xdc\xcd\x65\x9f\x00\xf8\
-\x13\x91\x1d\x76\x88\x33\x17\x4a\xbd\xcf\xc6\x2f\xa2\xfc\xad\x26\
-\x00\x5f\x07\xf0\xb1\xdc\xf0\x59\xad\x56\xf6\xf4\xf4\x70\x7e\x7e\
-\x9e\x2d\x2d\x2d\x72\xfd\xbf\x0a\xe0\x90\x10\x86\xba\x05\x00\xb5\
-\xa2\x07\xb8\x57\xa4\x4d\x45\x07\x58\x13\x42\x90\xf8\x9c\x25\x00\
-\x7a\x00\xfc\x35\x80\xdf\xdc\x20\x08\xbf\x04\xd0\x05\xe0\x7e\x51\
-\x26\xee\x12\x59\x21\xff\x8b\x80\x60\xb5\x0e\xbe\x01\xc0\x9b\xca\
-\x9c\xaf\xd5\x6a\x69\x32\x99\xd8\xda\xda\xca\x13\x27\x4e\x70\x7c\
-\x7c\x9c\xf5\xf5\xf5\xd4\x68\x34\xca\xa1\xdf\x13\x0d\x60\x9f\xc8\
-\x00\x7e\x00\xd5\x42\x13\xb8\x47\xa4\xc6\x35\x55\xff\xa5\x2c\xb8\
-\x51\x38\xcf\x28\x22\x5c\x56\x3e\xe5\x06\x58\xb6\x2b\x00\x9e\x00\
-\xb0\x5b\x64\xc0\xed\x22\x1b\xdc\x72\x41\x6c\xb5\x0e\x3d\xa8\x1c\
-\x46\xa3\xd1\xb0\xa2\xa2\x82\x5e\xaf\x97\x47\x8f\x1e\xe5\xd1\xa3\
-\x47\x19\x8f\xc7\x69\xb7\xdb\xe5\xf4\x7f\x06\x40\x52\x00\xd0\x0e\
-\x60\x9f\x98\x02\x1e\x00\x50\x2c\x22\x60\x03\x80\x75\x6b\xac\xf9\
-\x5b\x2f\xc0\xdd\x22\x22\xf9\x5e\x00\x76\x00\x7f\x29\xb2\x9e\x3a\
-\x12\x17\x17\x17\xe7\x02\xe1\x4f\x45\x49\x28\x15\x65\xa1\x50\x6a\
-\x86\x6f\x09\x04\xab\x31\xef\xdf\x0d\xe0\x57\xca\xc1\x94\xa6\x2f\
-\x95\x4a\xf1\xa5\x97\x5e\xe2\xfc\xfc\x3c\x9b\x9a\x9a\x68\x30\x18\
-\x94\x43\xfe\x2f\x80\x29\x00\x43\x22\xfd\xb7\x02\xf0\x00\xb0\x02\
-\xd0\x8b\x5a\xb8\x75\x8d\x02\x20\x67\x80\x42\xe1\x44\xad\x28\x8f\
-\x63\x4a\x89\x54\x02\x45\x9a\x88\x64\xfb\xbe\xc8\x1e\xbb\x25\x65\
-\x54\x29\x09\xab\x0e\xc1\x6a\x10\xff\x58\xae\xd4\xff\xe2\x8b\x2f\
-\xf2\xf8\xf1\xe3\x1c\x19\x19\xa1\xd3\xe9\x94\x89\x7f\x4b\x44\x7f\
-\x42\x4c\x00\x21\x31\x01\xfc\xb6\x78\x58\x5f\x13\x11\xb4\x7e\x8d\
-\x02\xb0\x41\xa4\xed\x6d\x22\x95\xdf\x2f\xa2\xda\x24\xce\xfb\x91\
-\xe2\xec\x8a\x8a\x0a\xea\xf5\xfa\x6c\x00\xae\x02\x38\x2c\x9e\x47\
-\x99\x28\x09\x77\x49\xba\xc8\xaa\x42\x70\xb3\x07\xd6\x28\x35\xae\
-\xa4\xa4\x84\xe5\xe5\xe5\x74\x3a\x9d\xcc\x64\x32\x3c\x75\xea\x14\
-\x1f\x7e\xf8\x61\xb6\xb5\xb5\xb1\xb2\xb2\x52\xae\x7d\x7f\x2c\xa2\
-\xff\x3b\x22\xfa\xf7\x09\x25\xb0\x42\x1c\xf6\x4e\x41\xfb\xfa\x35\
-\x2a\xfe\xac\x17\x59\x60\x8b\x38\x4b\xb1\x48\xe9\x0a\x04\x09\x51\
-\xf3\x59\x5a\x5a\x4a\x87\xc3\x21\xef\x46\x14\xbb\x0c\xe0\xf7\x85\
-\x3a\x6a\x10\xcf\xb9\x28\x5b\x1d\xfd\xd2\x00\x90\x68\x7f\x44\x8e\
-\x7e\xb3\xd9\xcc\x48\x24\xa2\x46\x7f\x2a\x95\xa2\xc7\xe3\x91\x9b\
-\xbf\x7f\x11\x33\xf0\xa0\xe8\x7c\x43\x42\x05\xb4\x0a\xda\x4b\x24\
-\xd2\xd7\xaa\xfa\xb7\x4e\xea\x05\x36\x8b\x52\xa0\x40\xf0\x80\x70\
-\xea\x19\xe5\xb9\x59\xad\x56\xba\xdd\xee\x5c\xa5\xe0\x9f\xc4\x68\
-\x6c\x16\xe5\xe0\x5e\x29\x3b\xae\xda\x92\xec\x66\x0e\xba\x05\xc0\
-\x07\x72\xf4\xd7\xd6\xd6\x72\x72\x72\x92\x2f\xbc\xf0\x02\x0f\x1f\
-\x3e\xcc\x68\x34\x9a\xad\xfd\xff\x40\xd4\xc2\x3e\x00\x6d\x22\xfa\
-\xab\xc5\xfc\xaf\x15\x29\x73\xcb\x5a\x9b\xff\xaf\x53\x0a\x94\x86\
-\x50\xe9\x07\x76\x02\x28\x17\xe7\xbe\x02\x80\x26\x93\x89\x5e\xaf\
-\x57\xee\x91\x64\xfb\x9e\x78\x3e\x26\x01\xc1\x3d\xe2\xbd\x56\x4d\
-\x23\xb9\x99\xe6\xaf\x43\x19\x6b\x94\xda\x1f\x0a\x85\x78\xec\xd8\
-\x31\x3e\xfe\xf8\xe3\x4c\x26\x93\xac\xab\xab\x93\xa3\xff\x3f\x00\
-\xa4\x01\x8c\x8a\x59\xf9\xdb\x00\xea\x44\xf4\x3f\x20\x11\x9e\xbf\
-\x96\xe6\xff\x15\x64\x82\x9d\xa2\x29\xfc\x67\x00\x34\x1a\x8d\xf4\
-\x7a\xbd\x0c\x04\x02\xb9\x00\xf8\x58\x3c\xa7\x2a\x21\x93\x6b\xc5\
-\x7b\xc8\xa5\xe0\x8b\x05\x40\xaa\x73\x7f\xa3\x28\x7e\x06\x83\x81\
-\x0e\x87\x83\xf1\x78\x9c\xcf\x3c\xf3\x0c\x67\x67\x67\x19\x8d\x46\
-\x69\x36\x9b\xe5\xe8\x7f\x05\xc0\x38\x80\x61\x49\xfe\xad\x11\x07\
-\xdb\x25\xa2\x7f\xdb\x5a\xd4\xff\x6f\x00\x82\x8d\x59\x99\x40\x2b\
-\x24\x61\x75\x64\x6e\x6f\x6f\x5f\x4a\x23\x38\x2b\xa6\xa4\xbd\x02\
-\x9c\xfb\x24\x8d\xe0\xa6\x1b\xc2\x95\x2e\x3a\x4a\xc4\x38\x47\x8d\
-\x46\x43\xa3\xd1\x48\xb7\xdb\xcd\xf1\xf1\x71\x1e\x39\x72\x84\x83\
-\x83\x83\xf4\x78\x3c\xd4\xe9\x74\xf2\x41\x8e\x02\x48\x89\xfa\x1f\
-\x15\x0b\xa0\xbd\x52\x93\x53\x28\x22\xe5\x2b\x73\x0b\x28\x6b\x31\
-\x94\x3d\x1e\x9e\x03\xc0\xca\xca\x4a\xfa\x7c\x3e\x76\x74\x74\xd0\
-\x6e\xb7\xe7\x82\xe0\xb2\x08\x18\xa7\xe8\x1f\x76\x67\x05\xcb\x4d\
-\x65\xcb\x95\x52\xdd\xab\x34\x31\x3a\x9d\x8e\x66\xb3\x99\x81\x40\
-\x80\x73\x73\x73\x1c\x1d\x1d\x65\x38\x1c\xa6\xdd\x6e\x97\x47\xbf\
-\xff\x01\x30\x29\xa9\x7f\xdf\x16\xcd\xdf\x37\x44\xf4\xef\xf8\xbc\
-\xf5\xef\x32\xf7\xea\xeb\x96\x61\xb7\x74\x2f\x2f\xbd\xa7\x52\x0e\
-\xb6\x8a\x8e\xfe\x17\x00\x68\xb1\x58\xd8\xd8\xd8\xc8\x9e\x9e\x1e\
-\x46\x22\x11\x39\x63\xca\x76\x1a\x40\x83\x98\x96\xf6\x48\xfb\x92\
-\x9b\x5e\x98\xad\xb4\xb9\xf9\x0b\x39\xfd\xdb\x6c\x36\xb6\xb6\xb6\
-\x72\x71\x71\x91\xb1\x58\x8c\x1e\x8f\x87\x06\x83\x41\x3e\xcc\x27\
-\x00\x26\x00\xec\x17\xf5\x3f\x98\x63\xf9\xb3\x59\x3e\xcc\x0a\x9c\
-\x9c\xbd\x67\xdf\x70\x03\x96\x6b\x27\x7f\x4b\xb6\x70\xd2\x67\xcc\
-\x07\xf0\x20\x80\xab\x79\x79\x79\xac\xaa\xaa\x62\x73\x73\x33\xf7\
-\xef\xdf\xcf\x74\x3a\xcd\xe2\xe2\xe2\x5c\x10\xfc\x17\x80\x66\x00\
-\x6e\x11\x34\x3a\x49\x32\xbf\xa9\xac\xb9\x52\xa9\xf3\x3f\x65\xd9\
-\xb7\xba\xba\x9a\x9d\x9d\x9d\xcc\x64\x32\x0c\x04\x02\xb4\xd9\x6c\
-\xd4\x68\x34\x72\x3a\xbb\x0a\x60\x41\xcc\xc0\x5d\xa2\xfe\x7f\x53\
-\x28\x5e\x1a\x21\x74\x6c\x96\xea\xff\x52\xce\x55\x1c\xa7\x7c\x8f\
-\x60\x93\x48\xa9\x75\xa2\xc1\x7c\x1e\xc0\xdf\x02\xf8\xb9\x18\x39\
-\x2f\x8a\xbf\xff\x01\xc0\xcb\x00\x1e\x16\xa3\xa7\xd2\x48\x6d\x11\
-\xa6\xec\xe5\x37\xe5\xda\xcb\xaf\xb2\x46\x90\xaf\xac\xcc\xb5\x5a\
-\x2d\xeb\xea\xea\xd8\xde\xde\xce\x99\x99\x19\x3e\xfb\xec\xb3\x2c\
-\x2d\x2d\x65\x51\x51\x51\xae\x52\xf0\x5d\x29\x0b\x54\x88\xb1\xb2\
-\x48\x64\xce\x15\x8f\x85\x2b\xf9\x42\x87\x45\xee\xfe\x2b\x2b\x2b\
-\xe9\x72\xb9\xd8\xdb\xdb\xcb\x74\x3a\xcd\xfa\xfa\x7a\x9a\xcd\x66\
-\x59\xf7\x57\xec\xc7\x00\x06\xc4\xf4\xe0\x17\x9d\x6d\x45\x56\xf7\
-\xbf\x29\x2b\x32\x73\x39\xbc\x48\x8c\x51\x7f\x00\xe0\xef\x44\x8d\
-\xe4\x32\xed\x53\xb1\xb1\xeb\x12\x30\x14\x8a\x9a\xba\xe4\x5e\x7e\
-\x15\x9b\x42\x9b\xd2\x3f\x59\x2c\x16\x06\x02\x01\x26\x12\x09\x1e\
-\x3f\x7e\x9c\xaf\xbd\xf6\x1a\xf5\x7a\x3d\x4b\x4a\x4a\x72\x65\x81\
-\x9f\x48\xaa\xa9\x59\xe8\x26\xca\x58\xb8\xe2\xcd\xe9\x4a\x00\x18\
-\x50\x2e\x78\x2a\xf5\xdf\xe3\xf1\xb0\xbf\xbf\x9f\xc9\x64\x92\x16\
-\x8b\x25\x3b\xfd\xcb\xf6\xf7\xa2\x11\x6c\x14\xeb\xdf\x4a\x41\x72\
-\xb1\xf4\x9d\x80\x7c\xc9\xee\x12\xa0\x0c\x02\x78\x16\xc0\x3b\xca\
-\xc3\x5b\x45\xfb\x77\x00\x19\xd1\x99\x2b\x7b\xf9\x3b\x05\x0c\xab\
-\xb6\x92\x15\xaf\xdf\xa6\x5c\x95\x2b\x2d\x2d\xa5\xcb\xe5\x62\x5b\
-\x5b\x1b\x17\x17\x17\x79\xee\xdc\x39\x5e\xbc\x78\x91\x56\xab\x95\
-\x5a\xad\x36\x57\x16\xf8\x54\x04\x4f\xbd\x58\x9c\xed\x91\x2e\xcf\
-\x6c\x5e\xa9\x2e\xb0\x92\x45\xc7\xf7\x94\xc5\x8f\xc1\x60\xa0\xd5\
-\x6a\xa5\xd7\xeb\xe5\xc0\xc0\x00\xf7\xef\xdf\x4f\x9b\xcd\x46\xad\
-\x56\xbb\xd4\x48\xa3\xac\x3e\x7f\x2e\xfa\x88\x27\x00\xcc\x88\xfe\
-\x60\x0a\xc0\xa3\x22\x3d\xfe\x50\xac\x8c\x6f\x68\xa7\x5e\x54\x54\
-\xa4\x2e\x57\xf4\x7a\x3d\xf5\x7a\x3d\x75\x3a\x1d\x35\x1a\x4d\x2e\
-\x99\x75\x29\xfb\x57\xd1\xdc\xde\x2f\x40\x58\xb5\xbd\xbc\x14\x3c\
-\x67\x94\xdf\x67\xb3\xd9\x18\x0c\x06\x99\x4a\xa5\x78\xe6\xcc\x19\
-\xbe\xff\xfe\xfb\xfc\xf0\xc3\x0f\xe9\x72\xb9\x68\x30\x18\x96\xca\
-\x02\x7f\x24\xee\x4e\xc8\x13\xc1\x3d\x92\x2e\x70\xcb\x01\xd8\x04\
-\xe0\x35\x59\xfd\xb3\xd9\x6c\xf4\xf9\x7c\xec\xeb\xeb\x63\x22\x91\
-\xa0\xd5\x6a\x65\x69\x69\xe9\xf5\x00\xb8\x69\x2b\x2a\x2a\xa2\x56\
-\xab\x65\x45\x45\x05\x2d\x16\x0b\xab\xaa\xaa\x58\x5b\x5b\x4b\xa7\
-\xd3\x49\x97\xcb\x45\x97\xcb\x45\xa7\xd3\xc9\xea\xea\x6a\xda\xed\
-\x76\x9a\x4c\x26\x1a\x0c\x86\xa5\x56\xb0\xd9\xf6\x57\x22\xc5\xde\
-\x2f\x95\x87\x15\xdd\xd2\xc9\x6a\x58\x4f\x28\xbf\xc3\x68\x34\xd2\
-\xe3\xf1\x30\x1e\x8f\xf3\xe9\xa7\x9f\xe6\xc5\x8b\x17\x49\x92\x97\
-\x2e\x5d\xa2\xdf\xef\xa7\xd1\x68\x54\xb3\x40\xd6\x67\x7b\x55\xdc\
-\xa1\xac\x17\x6b\xe6\x72\xd1\x43\x6d\x13\xa0\xde\x72\x00\xf2\x94\
-\x2b\x4f\x4a\x03\x68\xb7\xdb\xd9\xd0\xd0\xc0\xae\xae\x2e\x26\x12\
-\x09\xda\x6c\x36\x96\x97\x97\xdf\xe8\xc3\xfe\x5c\xcb\xcb\xcb\x63\
-\x71\x71\xb1\xea\x70\xb3\xd9\x4c\x87\xc3\x41\xa7\xd3\x49\x8f\xc7\
-\x43\xbf\xdf\xcf\xa6\xa6\x26\xb6\xb4\xb4\xb0\xb5\xb5\x95\xe1\x70\
-\x98\xe1\x70\x98\x2d\x2d\x2d\x0c\x85\x42\x0c\x04\x02\xf4\x7a\xbd\
-\x74\x3a\x9d\xb4\xd9\x6c\xac\xa8\xa8\x90\xef\x25\x2e\x65\xff\x26\
-\xea\xed\xce\x95\xde\xd2\x91\x9c\xbf\x09\xc0\x0b\xca\x7b\xeb\xf5\
-\x7a\x3a\x9d\x4e\xb6\xb5\xb5\xf1\xd1\x47\x1f\xe5\xbb\xef\xbe\x4b\
-\xe5\xcf\x1b\x6f\xbc\xc1\x96\x96\x16\x3a\x1c\x0e\x35\x0b\x64\x05\
-\xd2\xfb\x62\x49\xf4\x90\x54\x42\x77\x4a\x1a\xca\xfa\x5b\x0d\x40\
-\xbe\xa8\x45\xaa\x00\xa4\x00\xd0\xde\xde\xce\x9e\x9e\x1e\x56\x57\
-\x57\xab\x11\xa7\xd1\x68\x96\x1a\x6b\x72\x3a\xba\xb0\xb0\x90\x25\
-\x25\x25\x2c\x2d\x2d\xa5\x5e\xaf\xa7\xd1\x68\xa4\xd9\x6c\xa6\xdd\
-\x6e\x67\x4d\x4d\x0d\xeb\xea\xea\xd8\xd0\xd0\xc0\x60\x30\xc8\x70\
-\x38\xac\xfe\xce\x44\x22\xc1\xc1\xc1\x41\x0e\x0e\x0e\x32\x91\x48\
-\xb0\xaf\xaf\x8f\xf1\x78\x9c\x5d\x5d\x5d\x8c\xc5\x62\x8c\x44\x22\
-\x6c\x6a\x6a\x62\x43\x43\x03\x5d\x2e\x17\x6d\x36\x5b\xf6\x17\x54\
-\x72\xd9\x65\xb1\xb8\x7a\x40\x3c\xe4\x12\xa9\xeb\xde\x9c\xd5\xb0\
-\xca\xe3\xa3\x3c\xb9\x6c\x17\xe5\x8c\x4a\xd7\x5f\x5d\x5d\xcd\xe6\
-\xe6\x66\x1e\x3a\x74\x88\xaf\xbf\xfe\xba\xea\xfc\xcb\x97\x2f\xf3\
-\xc4\x89\x13\x8c\xc5\x62\x74\xbb\xdd\x34\x1a\x8d\x2c\x2d\x2d\xcd\
-\x7e\x76\x57\x85\x92\xda\x22\xe9\x28\x3a\x01\xe8\x8a\x56\xe8\xcb\
-\x1d\x61\x76\x28\x1f\xa6\xb4\xb4\x94\x46\xa3\x91\x0e\x87\x83\xf5\
-\xf5\xf5\x0c\x87\xc3\x8c\xc5\x62\x74\x3a\x9d\x74\x38\x1c\x34\x9b\
-\xcd\x34\x1a\x8d\x2c\x2f\x2f\x57\x6b\xb2\x56\xab\x55\x4d\xa7\xd3\
-\x51\xaf\xd7\xd3\x60\x30\xb0\xbc\xbc\x5c\x75\xb6\xd5\x6a\xa5\xc3\
-\xe1\x60\x6d\x6d\x2d\xdd\x6e\xb7\xaa\x93\x37\x35\x35\x31\x12\x89\
-\xb0\xa3\xa3\x83\xf1\x78\x9c\x83\x83\x83\x1c\x1d\x1d\x65\x3a\x9d\
-\xe6\xcc\xcc\x0c\x67\x67\x67\x39\x35\x35\xc5\x89\x89\x09\x8e\x8d\
-\x8d\x31\x99\x4c\x72\x68\x68\x88\x03\x03\x03\x8c\xc7\xe3\xec\xec\
-\xec\x64\x24\x12\x61\x28\x14\xa2\xd7\xeb\x65\x4d\x4d\x0d\x4d\x26\
-\xd3\xe7\x65\x83\x2b\x62\xfc\xaa\x14\x97\x55\x94\xeb\x5a\x77\x4a\
-\xd3\x82\x0c\x82\xac\x31\xd8\x14\xbd\x5f\x71\xbe\xc3\xe1\x60\x30\
-\x18\x64\x3a\x9d\xe6\x2b\xaf\xbc\xc2\x2b\x57\xae\xa8\x00\xbc\xf3\
-\xce\x3b\x5c\x58\x58\x60\x3c\x1e\xa7\xdf\xef\xa7\xd9\x6c\xa6\x4e\
-\xa7\xcb\x55\x06\x9e\x12\x59\x40\x51\x52\xcb\xa4\x4b\x23\x1b\x6e\
-\x35\x00\xbb\xb3\x01\xb0\xdb\xed\xf4\x78\x3c\xaa\x83\x9a\x9b\x9b\
-\x59\x5b\x5b\xcb\xaa\xaa\x2a\xda\x6c\x36\x5a\xad\x56\x5a\x2c\x16\
-\x9a\xcd\x66\x9a\xcd\x66\x5a\x2c\x16\x5a\xad\x56\xda\x6c\x36\xda\
-\xed\x76\x56\x55\x55\xb1\xba\xba\x9a\x4e\xa7\x93\x6e\xb7\x9b\xf5\
-\xf5\xf5\xf4\xfb\xfd\x0c\x06\x83\x6c\x69\x69\x61\x34\x1a\x65\x67\
-\x67\x27\x7b\x7b\x7b\x55\xa7\x4f\x4c\x4c\x70\x7a\x7a\x9a\x99\x4c\
-\x86\x0b\x0b\x0b\x5c\x5c\x5c\xe4\xe2\xe2\x22\x33\x99\x0c\x67\x66\
-\x66\x78\xf0\xe0\x41\xa6\xd3\x69\x1e\x38\x70\x80\xa9\x54\x8a\x23\
-\x23\x23\x4c\x24\x12\xec\xed\xed\x65\x47\x47\x07\xc3\xe1\x30\x03\
-\x81\x00\x5d\x2e\x17\x2d\x16\xcb\x52\x37\x73\x64\xfb\xa9\xb8\xd6\
-\x75\x16\xc0\x8b\x00\xfe\x50\xdc\x66\xaa\x14\x30\x6c\x93\xae\x77\
-\x17\x08\xd5\xf3\xd7\xca\xeb\x77\xed\xda\xc5\xbd\x7b\xf7\x32\x10\
-\x08\x30\x95\x4a\xf1\xe5\x97\x5f\xe6\xc7\x1f\x7f\xac\x3a\xff\xc2\
-\x85\x0b\x3c\x7d\xfa\x34\x27\x26\x26\x38\x30\x30\xc0\xe6\xe6\xe6\
-\x6b\x4a\x69\x56\x19\x38\x2b\xdd\xa3\xac\x12\x7d\xc0\x0e\xf1\x19\
-\x36\x02\x58\x7f\x2b\x01\x30\xe4\x02\xc0\xed\x76\x33\x10\x08\xb0\
-\xb9\xb9\x99\x4d\x4d\x4d\xf4\x7a\xbd\x74\xb9\x5c\xac\xad\xad\x65\
-\x4d\x4d\xcd\x35\x56\x5b\x5b\x4b\x97\xcb\x45\xb7\xdb\x4d\x8f\xc7\
-\x43\xaf\xd7\x4b\x9f\xcf\xc7\xc6\xc6\x46\x36\x35\x35\x31\x1c\x0e\
-\xb3\xad\xad\x8d\x9d\x9d\x9d\x8c\xc7\xe3\x4c\x24\x12\x1c\x1e\x1e\
-\xe6\xd8\xd8\x18\xd3\xe9\x34\xa7\xa6\xa6\x38\x3b\x3b\xcb\x4c\x26\
-\xc3\xf9\xf9\x79\x2e\x2c\x2c\x70\x61\x61\x81\xf3\xf3\xf3\xcc\x64\
-\x32\x9c\x9d\x9d\xe5\xcc\xcc\x0c\xa7\xa7\xa7\x39\x35\x35\xc5\xc9\
-\xc9\x49\x15\x84\xe1\xe1\x61\x0e\x0c\x0c\xb0\xbb\xbb\x9b\xd1\x68\
-\x94\xc1\x60\x90\x75\x75\x75\xb4\xd9\x6c\xd9\x7b\x8b\xe5\xd8\xcf\
-\x84\xc8\xf5\x75\x11\x91\x3f\x92\x7f\xbe\x7b\xf7\x6e\xda\xed\x76\
-\xfa\xfd\x7e\xa6\x52\x29\x9e\x3e\x7d\x9a\x1f\x7c\xf0\x81\xea\xfc\
-\xf7\xde\x7b\x8f\x67\xcf\x9e\xe5\x53\x4f\x3d\xc5\xc9\xc9\x49\x0e\
-\x0f\x0f\x33\x1a\x8d\xd2\xe1\x70\xd0\x68\x34\x52\xa3\xd1\x64\x97\
-\x81\x9f\x88\xcb\x34\x21\xe9\x26\x75\x89\xe8\x03\x96\xbd\x48\x5b\
-\x2e\x00\xba\x6c\x00\x6c\x36\x1b\x9d\x4e\x27\x7d\x3e\x1f\x83\xc1\
-\x20\x43\xa1\x10\x83\xc1\x20\xbd\x5e\x2f\x3d\x1e\xcf\x35\x56\x5f\
-\x5f\xaf\x3a\x5c\x89\x72\xc5\xe9\xd1\x68\x94\xb1\x58\x8c\xdd\xdd\
-\xdd\xec\xed\xed\x55\x1d\x3f\x3a\x3a\xca\xf1\xf1\x71\xa6\xd3\x69\
-\x1e\x3c\x78\x90\xd3\xd3\xd3\x6a\xca\x3f\x74\xe8\x90\x6a\x99\x4c\
-\x86\x99\x4c\x46\xfd\xff\xec\xec\xac\x0a\x83\x0c\x42\x32\x99\xe4\
-\xe0\xe0\x20\xe3\xf1\x38\xdb\xdb\xdb\x19\x0a\x85\xe8\xf1\x78\x68\
-\xb7\xdb\x73\x5d\xcf\x5a\x8e\xfd\x46\xd9\xf1\x03\xe0\xb6\x6d\xdb\
-\x58\x56\x56\x46\x9b\xcd\xc6\x7d\xfb\xf6\x31\x99\x4c\xf2\xe4\xc9\
-\x93\xbc\x74\xe9\x12\xaf\x5c\xb9\xc2\xab\x57\xaf\xf2\xfc\xf9\xf3\
-\x3c\x7b\xf6\x2c\x8f\x1d\x3b\xc6\x23\x47\x8e\x70\x6a\x6a\x8a\xc9\
-\x64\x92\xb1\x58\x8c\x2e\x97\x8b\x26\x93\x89\x5a\xad\x36\x1b\x80\
-\x5f\x88\x7d\x4a\xb3\xf8\x5e\x65\xa5\x74\x6d\x6c\xd9\xab\xf4\xe5\
-\xea\xd8\xc5\xd9\xb7\x7f\x6d\x36\x1b\x6b\x6b\x6b\xaf\x49\xdd\xa1\
-\x50\x88\x7e\xbf\x9f\x7e\xbf\x9f\x3e\x9f\x4f\x75\x78\x20\x10\x50\
-\x7f\xde\xdc\xdc\xcc\xd6\xd6\x56\xd5\xf1\x5d\x5d\x5d\x8c\xc7\xe3\
-\xec\xef\xef\xe7\xe0\xe0\x20\x87\x87\x87\x99\x4c\x26\x99\x4a\xa5\
-\x38\x3e\x3e\xce\x89\x89\x09\x15\x82\xa9\xa9\x29\x15\x04\x19\x06\
-\x05\x02\xd9\x14\x20\x14\x10\xd2\xe9\x34\x53\xa9\x14\x87\x86\x86\
-\xd8\xdb\xdb\xcb\x58\x2c\xc6\xa6\xa6\x26\x15\x82\xeb\x65\x82\x75\
-\xeb\xd6\xdd\x10\x0c\xeb\xd6\xad\xe3\xf6\xed\xdb\x69\xb1\x58\xe8\
-\xf3\xf9\x38\x3e\x3e\xce\x93\x27\x4f\xf2\xfc\xf9\xf3\xbc\x7c\xf9\
-\x32\x3f\xfa\xe8\x23\xbe\xfd\xf6\xdb\x3c\x75\xea\x14\x9f\x78\xe2\
-\x09\x3e\xf2\xc8\x23\x9c\x9b\x9b\xe3\xf4\xf4\x34\xc7\xc6\xc6\xd8\
-\xdd\xdd\xcd\xfa\xfa\x7a\x5a\xad\x56\xea\x74\xba\xec\x66\xf5\x57\
-\x42\x52\x0f\x0b\x09\xdc\x7c\x33\xdf\xa6\x5a\x6e\x06\xd8\x02\xe0\
-\xbf\x65\x1d\xc0\x6a\xb5\xaa\x1d\xba\xcf\xe7\xbb\xc6\xc9\xc1\x60\
-\x50\xfd\x77\x28\x14\x52\xc7\xb5\x70\x38\xcc\x48\x24\xc2\xb6\xb6\
-\x36\x76\x74\x74\xa8\xce\xef\xeb\xeb\x53\x05\x25\x19\x80\xb1\xb1\
-\x31\x1e\x38\x70\x80\x13\x13\x13\x9c\x9c\x9c\xfc\x0c\x04\xd7\x03\
-\x40\xb6\xd9\xd9\x59\x4e\x4f\x4f\x73\x72\x72\x92\x63\x63\x63\x1c\
-\x1e\x1e\x66\x5f\x5f\xdf\x35\x10\x28\x7b\x8c\x5c\x8e\xcd\xcf\xcf\
-\xe7\x7d\xf7\xdd\xb7\x94\x48\x93\x73\xb2\x69\x68\x68\xe0\xf3\xcf\
-\x3f\xcf\xb7\xde\x7a\x8b\x17\x2f\x5e\xe4\x85\x0b\x17\x78\xee\xdc\
-\x39\x3e\xf7\xdc\x73\x7c\xec\xb1\xc7\xb8\xb8\xb8\xc8\xc3\x87\x0f\
-\x73\x6e\x6e\x8e\x33\x33\x33\x3c\x70\xe0\x00\x7b\x7b\x7b\xe9\xf3\
-\xf9\x68\xb7\xdb\x69\x30\x18\xb2\x1b\xc1\x4f\xc5\x52\x2d\x02\xe0\
-\xf7\xc4\x85\x1a\x65\xa3\xba\xec\x8b\x22\x2b\x01\xe0\x67\xf2\x26\
-\x50\x11\x62\x5c\x2e\x17\xbd\x5e\x2f\xfd\x7e\x3f\x1b\x1b\x1b\xd5\
-\x28\x6f\x6e\x6e\x56\x9d\xde\xda\xda\xca\x48\x24\xc2\x68\x34\xca\
-\xf6\xf6\x76\xd5\xf9\x3d\x3d\x3d\xec\xed\xed\x65\x7f\x7f\x3f\x13\
-\x89\xc4\x8a\x00\xc8\x2e\x09\x4b\x99\x0c\xc1\xf8\xf8\x38\x93\xc9\
-\x24\x13\x89\x04\xbb\xbb\xbb\x19\x89\x44\xe8\x72\xb9\x68\x34\x1a\
-\xa9\xd3\xe9\x3e\xe3\xe4\xfc\xfc\x7c\x56\x54\x54\x70\xcf\x9e\x3d\
-\x2c\x2b\x2b\x63\x49\x49\x09\x37\x6d\xda\xf4\xb9\x20\x84\xc3\x61\
-\xbe\xf9\xe6\x9b\x7c\xf5\xd5\x57\x79\xf2\xe4\x49\x3e\xf9\xe4\x93\
-\x5c\x5c\x5c\xe4\xdc\xdc\x1c\xe7\xe6\xe6\xd4\x4c\x35\x3b\x3b\xab\
-\x36\x82\x8d\x8d\x8d\xac\xaa\xaa\xca\xd5\x08\x2a\xa3\x60\x9b\x58\
-\x0e\xed\x15\x13\x4a\x89\x24\x08\xdd\xf0\x38\xb8\x5c\x00\x36\x8b\
-\xad\x9a\xfa\x1d\x00\x93\xc9\x74\x8d\x30\xd3\xd0\xd0\xa0\x66\x01\
-\xa5\xbe\x67\x3b\x3e\x16\x8b\xe5\x74\xfe\xc0\xc0\x00\x07\x07\x07\
-\x39\x34\x34\xc4\x91\x91\x11\x8e\x8e\x8e\x7e\xa6\x04\xc8\x00\x28\
-\x10\x64\x97\x83\xeb\x99\xdc\x13\x4c\x4c\x4c\x70\x7c\x7c\x9c\x23\
-\x23\x23\x1c\x18\x18\x60\x47\x47\x07\x1b\x1b\x1b\x59\x53\x53\xa3\
-\x8e\x61\x72\xfa\x2d\x28\x28\xa0\xc9\x64\x52\x27\x98\x07\x1f\x7c\
-\x90\x95\x95\x95\xdc\xb5\x6b\x17\xb7\x6f\xdf\x7e\x5d\x08\x1e\x7a\
-\xe8\x21\xf5\x1c\xca\x59\xa6\xa6\xa6\x38\x33\x33\x73\x4d\x99\x4a\
-\xa7\xd3\x4c\x24\x12\x0c\x85\x42\xac\xa9\xa9\xa1\xd1\x68\xcc\x25\
-\x08\x8d\x8a\x51\x70\x9f\x50\x04\x73\x5e\xaa\xb9\x15\x3d\xc0\x66\
-\xb1\x38\x51\x6f\x02\x2b\x8d\x60\x4d\x4d\x8d\x3a\xc6\x29\x5d\x7d\
-\x28\x14\x52\x15\xba\x68\x34\xca\xb6\xb6\x36\xc6\x62\x31\x76\x76\
-\x76\xb2\xbb\xbb\x5b\x75\xbe\x92\xfa\x15\xe7\x2b\xd1\xaf\x00\x30\
-\x36\x36\x76\x0d\x04\xd7\x03\x41\x86\x41\x36\x65\x2a\x38\x78\xf0\
-\xa0\xea\xfc\xb1\xb1\x31\x8e\x8c\x8c\xb0\xbf\xbf\x9f\x1d\x1d\x1d\
-\x0c\x06\x83\xac\xae\xae\xa6\xd5\x6a\x65\x45\x45\xc5\x67\x3a\xf0\
-\xad\x5b\xb7\x72\xc7\x8e\x1d\xd4\x68\x34\xdc\xb9\x73\x27\x75\x3a\
-\x1d\xcb\xca\xca\x58\x56\x56\x46\xbd\x5e\xcf\x5d\xff\x47\xdc\xb9\
-\x07\x45\x59\xb7\x7d\x9c\xd4\xd0\x90\x64\x32\x7d\xa1\x7a\x1d\x1e\
-\x24\x43\x32\xb0\x56\x0d\x7b\x09\x52\xd4\x47\x39\x84\x90\x29\x84\
-\x08\x42\x48\xb2\x9c\xc1\xd4\x97\x54\xac\xc9\x0d\x01\x39\x08\xc8\
-\x61\x6b\x51\x58\x58\x30\x14\x54\x36\xc8\x91\x50\x34\x0f\x98\xa6\
-\x82\x9c\x56\xe5\x50\xe1\xa9\xa9\xa6\xc7\xca\xa7\xa9\x3e\xef\x1f\
-\xef\x7d\xff\x66\x41\xb4\x23\x3d\x3b\x73\xfd\xc1\xce\xc0\xde\xb3\
-\xf7\xf7\xfe\x5e\xd7\xef\x7b\x7d\xaf\x8b\x7f\xfc\x03\x4b\x4b\x4b\
-\xc6\x8d\x1b\x77\x87\x14\x3e\x65\xca\x14\xfc\xfd\xfd\x09\x0d\x0d\
-\x25\x32\x32\x92\xf8\xf8\x78\xd6\xae\x5d\x3b\x80\xc5\x92\x92\x92\
-\x04\x03\xc8\xd7\x62\x6f\x6f\x3f\xd4\x51\x30\x5e\x72\x09\x79\x49\
-\xed\x61\x3b\xa9\x10\x1c\xe0\x1a\x1e\x2e\x06\x98\x63\x5c\x08\xda\
-\xd9\xd9\x89\x34\x30\x67\xce\x1c\xa1\xd6\xc9\x05\xe1\x92\x25\x4b\
-\x44\xce\x1f\x4c\xfd\x21\x21\x21\x22\xf7\xcb\xf4\x6f\x0c\x02\x63\
-\x16\x90\x41\x20\xa7\x82\xc1\x40\x30\x06\xc3\x50\x61\x7c\xe3\x13\
-\x13\x13\x89\x8b\x8b\x23\x2a\x2a\x8a\xf0\xf0\x70\x02\x03\x03\xf1\
-\xf6\xf6\xc6\xd9\xd9\x19\x85\x42\x81\xbd\xbd\x3d\x93\x26\x4d\xc2\
-\xc2\xc2\x62\xc0\x17\x3f\x72\xe4\x48\x46\x8d\x1a\xc5\x98\x31\x63\
-\x18\x33\x66\x0c\x0f\x3c\xf0\x00\x66\x66\x66\x8c\x1d\x3b\xf6\x8e\
-\xb0\xb0\xb0\x18\xc0\x1e\xd6\xd6\xd6\xf8\xf8\xf8\xb0\x7c\xf9\x72\
-\x56\xad\x5a\x45\x4c\x4c\x0c\x6b\xd6\xac\x19\x90\xce\xd6\xaf\x5f\
-\x4f\x62\x62\x22\xe1\xe1\xe1\xbc\xf8\xe2\x8b\xcc\x9e\x3d\xfb\x6e\
-\x5a\x40\xa2\x04\x80\x17\x25\x2d\x60\xaa\xd4\xbb\x90\x57\xeb\x0c\
-\x2b\x00\x2c\xa4\x16\xaa\x98\x02\x76\x70\x70\x18\xc0\x02\xc6\xa9\
-\xc0\x98\x05\xe4\xc2\x6f\x70\x0a\xf8\x35\x10\xc8\x6c\x90\x90\x90\
-\x70\x4f\x20\xc8\x21\x03\x42\xfe\x79\xed\xda\xb5\xbc\xfe\xfa\xeb\
-\xac\x59\xb3\x46\x3c\xf5\x11\x11\x11\xc2\x86\x25\x17\x5c\x4f\x3f\
-\xfd\x34\x76\x76\x76\xf7\x32\x65\xfc\xe1\xb0\xb7\xb7\xc7\xdd\xdd\
-\x9d\x97\x5f\x7e\x99\xe0\xe0\x60\x94\x4a\x25\xf1\xf1\xf1\x77\x5c\
-\x6f\x7c\x7c\xbc\x50\x03\x9d\x9c\x9c\xee\x06\x80\xd7\xa5\xd6\xb0\
-\x6c\xac\x79\x52\x92\xab\xc7\x0f\x27\x00\xe4\x5e\xc0\x83\xd2\xd4\
-\x2b\xa3\x47\x8f\x16\x2c\x20\x37\x69\x5c\x5d\x5d\x99\x3f\x7f\xfe\
-\x80\x54\x20\xd7\x02\x32\x00\xe4\x3a\x20\x38\x38\xf8\x9e\x20\x90\
-\x8b\x41\x63\x10\x18\xb3\x81\x31\x10\x8c\xc1\x20\x87\xfc\xbe\x7c\
-\xe3\x63\x63\x63\x89\x8c\x8c\x24\x3c\x3c\x9c\xa0\xa0\x20\x96\x2c\
-\x59\xc2\xfc\xf9\xf3\x99\x31\x63\x06\x0e\x0e\x0e\xa2\x7f\x31\xf8\
-\xc9\xff\x33\x71\xdf\x7d\xf7\x31\x71\xe2\x44\x9c\x9c\x9c\x98\x37\
-\x6f\x1e\x3e\x3e\x3e\x04\x06\x06\x0a\xff\x84\x7c\xb4\x95\xd9\x29\
-\x36\x36\x96\xd0\xd0\x50\x3c\x3d\x3d\x45\xcf\x62\x08\x00\xac\xbb\
-\x07\x00\xcc\x87\x13\x00\xa3\xa5\x0f\x70\x92\x7b\xf5\x32\x0b\x4c\
-\x9b\x36\x0d\x85\x42\x31\x40\xc7\x97\x41\x20\xa7\x02\xb9\x16\x90\
-\xd3\x80\x0c\x00\x39\x15\xc8\xf5\xc0\x60\x10\x0c\xc5\x06\x43\x01\
-\x61\x70\x24\x26\x26\x92\x90\x90\x20\xe8\x7e\xf5\xea\xd5\xac\x5c\
-\xb9\x12\x7f\x7f\x7f\xbc\xbc\xbc\x44\xb1\x67\x6f\x6f\x8f\xb5\xb5\
-\xb5\x38\xde\x19\x7f\xd9\xf7\xdf\x7f\x3f\x16\x16\x16\x98\x9b\x9b\
-\x63\x66\x66\x86\xa9\xa9\x29\xa6\xa6\xa6\x22\x1d\x8c\x1a\x35\x8a\
-\x91\x23\x47\x62\x6a\x6a\x2a\xa7\x84\x1f\xe5\x49\x60\x53\x53\x53\
-\x2c\x2d\x2d\x79\xe2\x89\x27\x50\x28\x14\xbc\xf0\xc2\x0b\x78\x79\
-\x79\xe1\xef\xef\x4f\x58\x58\x18\x51\x51\x51\x24\x26\x26\xb2\x7e\
-\xfd\x7a\x91\x9a\xa2\xa3\xa3\x59\xb9\x72\x25\x8b\x16\x2d\x62\xc6\
-\x8c\x19\xd8\xda\xda\x0e\xc5\x46\xeb\x8c\x16\x6b\xb8\x48\x6a\xa0\
-\xb5\x51\x4f\xe0\x37\x2b\x82\x7f\xc4\x0f\x60\x26\x09\x42\x35\xf2\
-\x05\x59\x59\x59\x61\x6b\x6b\x8b\x83\x83\x03\x33\x66\xcc\x10\xfd\
-\x79\x39\x1d\xdc\x0b\x04\x7f\x04\x00\xc6\x20\x90\x43\x4e\x0f\xf2\
-\xcf\x71\x71\x71\xc4\xc6\xc6\x12\x1d\x1d\x2d\xe8\x3e\x20\x20\x00\
-\x1f\x1f\x1f\xdc\xdc\xdc\xc4\x53\x6f\x6b\x6b\x2b\x28\x7f\xf0\xb1\
-\xcf\xda\xda\x1a\x3f\x3f\x3f\x02\x02\x02\x84\x3c\x1d\x12\x12\xc2\
-\xea\xd5\xab\x89\x8a\x8a\x12\xd7\x12\x15\x15\x45\x58\x58\x18\xfe\
-\xfe\xfe\x2c\x5e\xbc\x98\xa9\x53\xa7\x32\xd4\x76\xb4\xe7\x9f\x7f\
-\x1e\x77\x77\x77\x96\x2d\x5b\x46\x48\x48\x08\x4a\xa5\x52\x48\xdc\
-\x6b\xd7\xae\x25\x21\x21\x81\xa8\xa8\x28\x82\x82\x82\x58\xb8\x70\
-\x21\x0a\x85\x42\x00\x60\x10\xb3\xfc\xc7\x00\x70\xbf\x54\x07\x8c\
-\x97\x6c\x49\x3f\x18\xa7\x02\x19\x04\x0a\x85\x02\x27\x27\x27\xd1\
-\xe4\x91\x0b\x43\xb9\xab\x67\x9c\x0e\x06\x9f\x0a\x8c\x53\xc1\xea\
-\xd5\xab\xef\x00\x82\x0c\x06\x19\x10\xc6\x11\x1d\x1d\x4d\x54\x54\
-\x14\x91\x91\x91\x28\x95\x4a\xd1\x09\x5c\xb1\x62\x05\x4b\x96\x2c\
-\x61\xe1\xc2\x85\xcc\x9e\x3d\x1b\x47\x47\x47\xec\xec\xec\xb0\xb6\
-\xb6\x66\xe2\xc4\x89\x43\x52\xfe\x33\xcf\x3c\x43\x68\x68\xa8\x48\
-\x51\x61\x61\x61\x28\x95\x4a\x62\x62\x62\x58\xb7\x6e\x1d\x9b\x37\
-\x6f\xe6\x9d\x77\xde\x11\x3b\x10\x54\x2a\x15\x1b\x36\x6c\x40\xa9\
-\x54\xe2\xe7\xe7\xc7\x83\x0f\x3e\x28\xfe\xd6\x23\x8f\x3c\x22\xbc\
-\x13\x72\xe3\x2c\x28\x28\x48\xa4\x01\x59\xdf\x88\x8b\x8b\x43\xa9\
-\x54\x12\x18\x18\xc8\xfc\xf9\xf3\xef\xd5\x11\x5c\xfb\xb7\x02\x60\
-\x90\xad\x69\xb4\x54\x08\x5a\x4a\x2e\x5b\x71\x46\xb6\xb2\xb2\xc2\
-\xc6\xc6\x06\x7b\x7b\x7b\x1c\x1d\x1d\x45\x6b\xd7\xd9\xd9\x99\xb9\
-\x73\xe7\xde\xb5\x38\x1c\x9c\x16\x8c\xc1\x60\xcc\x0a\x32\x28\x86\
-\x8a\xd7\x5e\x7b\x4d\xf8\x00\x42\x42\x42\x08\x0e\x0e\x26\x20\x20\
-\x80\xa5\x4b\x97\xe2\xee\xee\x8e\xb3\xb3\xb3\xa0\x7b\x1b\x1b\x1b\
-\xac\xac\xac\x86\x2c\xf4\xcc\xcc\xcc\xf0\xf5\xf5\x25\x2e\x2e\x8e\
-\xb8\xb8\x38\x62\x62\x62\x84\x16\x91\x94\x94\x44\x72\x72\x32\x2a\
-\x95\x8a\x6d\xdb\xb6\x91\x9b\x9b\x4b\x61\x61\x21\x45\x45\x45\xbc\
-\xfb\xee\xbb\xe4\xe6\xe6\x92\x96\x96\xc6\x9a\x35\x6b\xf0\xf0\xf0\
-\xc0\x78\x41\xa6\xad\xad\x2d\x33\x67\xce\x64\xee\xdc\xb9\x2c\x5e\
-\xbc\x98\xc0\xc0\x40\x56\xad\x5a\x45\x74\x74\x34\x89\x89\x89\xac\
-\x5b\xb7\x4e\xe8\x11\xaf\xbc\xf2\x0a\x6e\x6e\x6e\x38\x3a\x3a\xde\
-\x0d\x00\x09\xff\x29\x00\xc8\x63\x4e\xe6\x12\x0b\x4c\x92\x6c\x4a\
-\x18\x2f\x87\x92\x0d\x1d\x32\x10\x86\x62\x04\xe3\x2e\xa0\xac\x1a\
-\xca\xa2\x91\xac\x19\x18\x8b\x46\x32\x38\x8c\x43\x7e\x7f\xc5\x8a\
-\x15\x04\x04\x04\xe0\xef\xef\xcf\xb2\x65\xcb\x78\xe9\xa5\x97\x84\
-\x13\xc8\xd5\xd5\x15\x85\x42\xc1\xb4\x69\xd3\xb0\xb5\xb5\x15\x3e\
-\xc1\xa1\xa4\xdc\xc9\x93\x27\x13\x1a\x1a\x4a\x54\x54\x94\x38\x89\
-\xc4\xc6\xc6\x8a\x3c\x9d\x9c\x9c\xcc\x96\x2d\x5b\x48\x4d\x4d\x25\
-\x3b\x3b\x9b\xbc\xbc\x3c\x8a\x8a\x8a\x28\x2a\x2a\xa2\xb0\xb0\x90\
-\x82\x82\x02\x72\x72\x72\x48\x4e\x4e\x26\x26\x26\x86\x27\x9f\x7c\
-\x72\x00\x0b\x3c\xf5\xd4\x53\xb8\xb8\xb8\xe0\xe1\xe1\x81\x9f\x9f\
-\x1f\x21\x21\x21\x44\x44\x44\x08\x16\x88\x8b\x8b\x23\x3c\x3c\x1c\
-\x3f\x3f\x3f\xe6\xcc\x99\x83\x83\x83\x03\xd6\xd6\xd6\x83\x7b\x01\
-\x3f\x4b\xfb\x15\xfe\x5e\x00\x18\x09\x42\xa3\xa4\x34\x30\x4e\x62\
-\x81\x69\x26\x26\x26\x6d\xc6\x5f\xa4\xb9\xb9\xb9\x00\x82\x8d\x8d\
-\x0d\x53\xa6\x4c\xb9\x03\x0c\x72\x9d\x30\x77\xee\x5c\x71\x6a\x70\
-\x77\x77\x17\xfd\x04\x6f\x6f\xef\x3b\xfa\x08\x72\xc8\xef\xf9\xf8\
-\xf8\xe0\xed\xed\x8d\x97\x97\x17\xee\xee\xee\x2c\x5c\xb8\x10\x37\
-\x37\x37\x5c\x5c\x5c\x98\x35\x6b\x16\x0e\x0e\x0e\xd8\xd9\xd9\x31\
-\x65\xca\x14\x26\x4d\x9a\x24\xdc\x49\x83\x9f\x7a\x73\x73\x73\x96\
-\x2c\x59\xc2\x86\x0d\x1b\x48\x4e\x4e\xe6\xad\xb7\xde\x42\xa5\x52\
-\x91\x96\x96\x46\x56\x56\x16\x05\x05\x05\x14\x17\x17\x53\x5e\x5e\
-\x4e\x75\x75\x35\xb5\xb5\xb5\x1c\x3a\x74\x88\x43\x87\x0e\xd1\xd0\
-\xd0\xc0\x87\x1f\x7e\x48\x6d\x6d\x2d\x55\x55\x55\x94\x95\x95\x91\
-\x97\x97\xc7\x1b\x6f\xbc\x41\x64\x64\x24\xe3\xc6\x8d\x13\x9f\x63\
-\x63\x63\xc3\xcc\x99\x33\x99\x3f\x7f\x3e\xbe\xbe\xbe\x82\x05\x64\
-\x61\x28\x3e\x3e\x9e\xd0\xd0\x50\x96\x2e\x5d\x8a\x8b\x8b\xcb\xdd\
-\x00\xf0\x9d\x04\x80\xa0\x41\xf3\x15\xc6\x00\xf8\x6b\x4f\x01\x77\
-\x29\x06\x1f\x90\x84\x87\x47\xa5\x53\x41\xcb\x50\xcd\x10\x79\x1f\
-\x8e\xb1\x6b\x57\x76\x00\x39\x3a\x3a\x0a\x17\x90\x93\x93\x93\x48\
-\x17\xb2\x6f\x40\x36\x7a\x0e\x0e\xd9\x67\xe0\xec\xec\xcc\xec\xd9\
-\xb3\x99\x35\x6b\x16\x0a\x85\x42\x1c\xe5\x26\x4d\x9a\xc4\xa3\x8f\
-\x3e\x8a\x95\x95\x15\x56\x56\x56\x77\xcd\xf3\x23\x46\x8c\x60\xf6\
-\xec\xd9\x6c\xdc\xb8\x11\x95\x4a\xc5\xd6\xad\x5b\x49\x4f\x4f\x17\
-\x4f\xb7\x46\xa3\xa1\xac\xac\x8c\xbd\x7b\xf7\x52\x57\x57\x47\x53\
-\x53\x13\xa7\x4e\x9d\xe2\xec\xd9\xb3\xb4\xb4\xb4\xd0\xd6\xd6\x46\
-\x67\x67\x27\x9d\x9d\x9d\xb4\xb7\xb7\xd3\xde\xde\xce\xb9\x73\xe7\
-\x38\x70\xe0\x00\xb9\xb9\xb9\xbc\xf9\xe6\x9b\x2c\x5f\xbe\x9c\xfb\
-\xee\xbb\x4f\x28\x89\x53\xa7\x4e\xc5\xd9\xd9\x19\x0f\x0f\x0f\x96\
-\x2e\x5d\x4a\x50\x50\x10\xe1\xe1\xe1\x44\x46\x46\x12\x17\x17\xc7\
-\xca\x95\x2b\xf1\xf5\xf5\x15\x7e\x00\x59\x90\x32\xba\xee\x9b\x77\
-\x01\xc0\xf0\x1d\x03\xef\x32\x1f\x60\xbc\x06\xc5\x46\x6a\x4a\xe8\
-\x7f\xad\x3b\x66\x6e\x6e\x8e\x85\x85\x05\x13\x27\x4e\x14\xfe\xbf\
-\xa1\x2c\x62\x76\x76\x76\xd8\xdb\xdb\xdf\x11\xf2\x13\x6d\x6b\x6b\
-\x8b\xb5\xb5\xb5\xf0\x1d\x8e\x1f\x3f\x9e\xf1\xe3\xc7\x0b\x05\x4e\
-\x3e\xba\x8d\x1e\x3d\x7a\xc8\x33\xfd\x94\x29\x53\x48\x48\x48\x20\
-\x25\x25\x45\xdc\xf4\x1d\x3b\x76\xa0\x56\xab\xd9\xb5\x6b\x17\x3a\
-\x9d\x8e\xea\xea\x6a\xea\xea\xea\x38\x72\xe4\x08\x27\x4f\x9e\xe4\
-\xfc\xf9\xf3\xb4\xb7\xb7\x63\x30\x18\xb8\x72\xe5\x0a\xbd\xbd\xbd\
-\xf4\xf5\xf5\xd1\xd7\xd7\x47\x6f\x6f\x2f\x3d\x3d\x3d\x18\x0c\x06\
-\x4e\x9f\x3e\x4d\x55\x55\x15\xd9\xd9\xd9\x24\x27\x27\xf3\xfc\xf3\
-\xcf\x8b\xcf\x9d\x30\x61\x02\x0e\x0e\x0e\xb8\xba\xba\xe2\xe9\xe9\
-\x39\x00\x04\x4a\xa5\x92\x55\xab\x56\xe1\xed\xed\x7d\x57\x39\x5a\
-\xb2\x99\xc5\x48\x00\x78\xd1\x68\xbb\xda\xa4\x61\x13\x82\xee\x31\
-\x23\x28\x2b\x83\x8f\x4a\x0d\x89\x19\x26\x26\x26\x1b\x86\xd8\x90\
-\xf9\x9b\x1d\xc0\x83\xc3\xdc\xdc\xfc\x9e\x31\xd4\xef\xdc\xeb\x33\
-\xac\xac\xac\x08\x0a\x0a\x42\xa5\x52\x91\x9a\x9a\x4a\x46\x46\x06\
-\xb9\xb9\xb9\xe2\xc6\x57\x54\x54\x50\x53\x53\x43\x5d\x5d\x1d\x0d\
-\x0d\x0d\x9c\x38\x71\x82\xb3\x67\xcf\x72\xf1\xe2\x45\xba\xba\xba\
-\xe8\xe9\xe9\xe1\xb3\xcf\x3e\xa3\xbf\xbf\x9f\x6b\xd7\xae\x71\xfd\
-\xfa\x75\x6e\xdc\xb8\xc1\x8d\x1b\x37\xb8\x76\xed\x1a\xfd\xfd\xfd\
-\xf4\xf6\xf6\xd2\xd4\xd4\x84\x56\xab\x25\x3d\x3d\x9d\x8d\x1b\x37\
-\x0e\xb0\x9d\x59\x5a\x5a\x32\x7d\xfa\x74\x5c\x5c\x5c\xf0\xf2\xf2\
-\x62\xe9\xd2\xa5\xc2\xe0\x1a\x1e\x1e\x8e\xbb\xbb\x3b\x0a\x85\x02\
-\x3b\x3b\xbb\xa1\x5a\xcf\x27\x25\x00\x0c\x96\x82\x27\x0d\x9b\x14\
-\xfc\x1b\x56\xa2\x3d\x2c\x69\xd1\x53\x25\x10\x2c\x90\x06\x48\xae\
-\x0e\xd7\x6c\xc0\xef\x8d\x87\x1f\x7e\x18\x1f\x1f\x1f\x51\xc1\x67\
-\x65\x65\x89\x22\xae\xa4\xa4\x04\x9d\x4e\x47\x4d\x4d\x0d\x7a\xbd\
-\x9e\x43\x87\x0e\x71\xf4\xe8\xd1\x01\x74\xdf\xd1\xd1\xc1\xe5\xcb\
-\x97\xe9\xe9\xe9\xe1\xf3\xcf\x3f\x17\x00\xb8\x79\xf3\xa6\x88\x1b\
-\x37\x6e\x70\xfd\xfa\x75\xfa\xfb\xfb\x69\x69\x69\x41\xaf\xd7\x53\
-\x58\x58\x88\x4a\xa5\x22\x3a\x3a\x7a\x40\x3d\x60\x69\x69\x89\xa3\
-\xa3\x23\xae\xae\xae\xb8\xbb\xbb\xe3\xeb\xeb\x2b\xec\x70\x9e\x9e\
-\x9e\x62\xc2\xea\x2e\x9e\xc0\x68\x69\xbd\x9e\xa7\xd4\x0c\x7a\x62\
-\x50\x33\xe8\xaf\xed\x06\xfe\x4a\x2a\x30\x95\x52\xc1\xc3\x12\x0a\
-\xed\x24\x10\xcc\x91\x2e\x30\xd9\xc4\xc4\xe4\xa0\xa9\xa9\xe9\xad\
-\xbf\xfb\xa6\x5b\x58\x58\xf0\xec\xb3\xcf\x12\x1c\x1c\xcc\xe6\xcd\
-\x9b\xd9\xb6\x6d\x9b\x78\xe2\xf3\xf3\xf3\xd1\x68\x34\x82\xee\x75\
-\x3a\x1d\x65\x65\x65\x94\x95\x95\x51\x5a\x5a\x4a\x71\x71\x31\x1a\
-\x8d\x06\xb5\x5a\x8d\x5a\xad\x46\xa3\xd1\xb0\x73\xe7\x4e\xca\xcb\
-\xcb\xd9\xbf\x7f\x3f\x47\x8e\x1c\xa1\xbd\xbd\x5d\xb0\xc1\xd5\xab\
-\x57\x05\x23\x5c\xbb\x76\x8d\x9e\x9e\x1e\x4e\x9c\x38\x81\x4e\xa7\
-\x23\x3b\x3b\x9b\x4d\x9b\x36\x11\x18\x18\xc8\x98\x31\x63\x06\x9c\
-\x98\x64\x5f\xa5\xec\xa7\xf0\xf4\xf4\x64\xd1\xa2\x45\x03\x34\x80\
-\x41\x00\xc8\x92\x00\x30\xb8\x1d\xfc\xc8\xe0\x69\xe1\xbf\x63\x4b\
-\xd8\xe0\x53\xc1\x44\x23\x10\x28\xa4\x23\xca\xc2\xc7\x1f\x7f\x3c\
-\xfa\xd5\x57\x5f\xfd\x77\x52\x52\x12\x4a\xa5\x92\x45\x8b\x16\xe1\
-\xe0\xe0\xc0\x84\x09\x13\x18\x39\x72\xe4\x9f\xbe\xd1\xb2\x05\xcb\
-\xde\xde\x9e\x39\x73\xe6\x88\x69\xdb\xec\xec\x6c\x52\x52\x52\xd8\
-\xb6\x6d\x1b\x05\x05\x05\x14\x15\x15\xa1\xd1\x68\x28\x29\x29\x41\
-\xab\xd5\xa2\xd5\x6a\xd9\xb5\x6b\x17\xd5\xd5\xd5\xe2\xa9\x3f\x73\
-\xe6\x0c\xad\xad\xad\x74\x76\x76\xd2\xd5\xd5\x45\x67\x67\x27\x2d\
-\x2d\x2d\x34\x37\x37\xd3\xd8\xd8\xc8\xbe\x7d\xfb\x28\x2d\x2d\xa5\
-\xa8\xa8\x88\xdc\xdc\x5c\xb4\x5a\x2d\xcd\xcd\xcd\xf4\xf6\xf6\x0a\
-\x66\xe8\xef\xef\xe7\x8b\x2f\xbe\xe0\xfc\xf9\xf3\xe8\xf5\x7a\x8a\
-\x8a\x8a\x50\xa9\x54\xac\x59\xb3\x06\x6f\x6f\xef\x01\x37\x74\xec\
-\xd8\xb1\x4c\x9e\x3c\x99\xe9\xd3\xa7\xe3\xe4\xe4\xc4\x73\xcf\x3d\
-\xc7\xcc\x99\x33\xef\x56\x00\xfe\x4b\x9a\x55\x88\x94\x96\x6c\x2c\
-\x94\x46\xcd\xe5\x11\xb1\xe1\x31\x84\xfc\x8e\xe5\x88\x32\x13\x3c\
-\x26\xf9\xd5\xa7\x8f\x18\x31\xe2\xb9\x88\x88\x88\x8b\x2a\x95\x8a\
-\x03\x07\x0e\xb0\x67\xcf\x1e\x2a\x2a\x2a\x28\x2d\x2d\x25\x3f\x3f\
-\x1f\xb5\x5a\x4d\x6a\x6a\x2a\xeb\xd7\xaf\x47\xa9\x54\x12\x1c\x1c\
-\x8c\x9f\x9f\x1f\x3e\x3e\x3e\x78\x7a\x7a\xb2\x60\xc1\x02\x61\x37\
-\xf3\xf0\xf0\x10\x76\x71\x6f\x6f\x6f\x16\x2d\x5a\x44\x4c\x4c\x0c\
-\x99\x99\x99\x64\x65\x65\xb1\x7d\xfb\x76\x72\x72\x72\xc8\xcb\xcb\
-\x23\x27\x27\x87\x8c\x8c\x0c\x0a\x0a\x0a\xd8\xb9\x73\x27\xa5\xa5\
-\xa5\x94\x97\x97\xa3\xd3\xe9\x28\x2d\x2d\xa5\xa2\xa2\x82\x96\x96\
-\x16\x7e\xef\xeb\xf6\xed\xdb\xf4\xf6\xf6\x72\xe2\xc4\x09\xf6\xee\
-\xdd\x8b\x5a\xad\x26\x33\x33\x13\xad\x56\x2b\x6a\x85\x4b\x97\x2e\
-\xd1\xd7\xd7\x47\x67\x67\x27\x8d\x8d\x8d\x68\xb5\x5a\x32\x33\x33\
-\xd9\xb4\x69\x13\x11\x11\x11\x2c\x5f\xbe\x5c\x4c\x3c\x3d\xfb\xec\
-\xb3\xc2\x95\xfc\xd8\x63\x8f\x61\x6d\x6d\x8d\xa5\xa5\x25\xa6\xa6\
-\xa6\x3c\xf4\xd0\x43\x83\x1d\x47\x47\x25\x11\x48\x69\xb4\x60\x53\
-\xf1\x67\x76\x07\xfd\x95\xdb\x2f\x64\x99\x58\x16\x89\x1e\x35\x31\
-\x31\xb1\x8d\x88\x88\xc8\x50\xa9\x54\x34\x35\x35\x71\xec\xd8\x31\
-\x1a\x1a\x1a\xa8\xaf\xaf\xa7\xa2\xa2\x82\xaa\xaa\x2a\x76\xef\xde\
-\x8d\x4e\xa7\x43\xab\xd5\x52\x52\x52\x42\x71\x71\x31\x6a\xb5\x9a\
-\xc2\xc2\x42\x76\xec\xd8\x41\x6e\x6e\x2e\xdb\xb7\x6f\x27\x2b\x2b\
-\x8b\xf4\xf4\x74\x54\x2a\x15\x11\x11\x11\xbc\xf6\xda\x6b\xe4\xe4\
-\xe4\x0c\x50\xe2\x34\x1a\x0d\xc5\xc5\xc5\x14\x16\x16\x52\x58\x58\
-\x88\x4e\xa7\x63\xf7\xee\xdd\xec\xdd\xbb\x97\xfd\xfb\xf7\xb3\x67\
-\xcf\x1e\x34\x1a\x0d\xcd\xcd\xcd\xfc\xd9\xd7\xed\xdb\xb7\xe9\xea\
-\xea\xa2\xa1\xa1\x81\x9d\x3b\x77\x92\x91\x91\x41\x51\x51\x11\xc7\
-\x8e\x1d\xe3\xc2\x85\x0b\x5c\xb9\x72\x85\x2b\x57\xae\x70\xea\xd4\
-\x29\xaa\xab\xab\xc9\xcf\xcf\x47\xa5\x52\x09\x7b\x5b\x76\x76\x36\
-\x65\x65\x65\x54\x57\x57\xa3\xd5\x6a\x29\x2a\x2a\x22\x3a\x3a\x1a\
-\x4b\x4b\xcb\x7b\x8d\xb4\x6f\x95\xdc\x40\xab\x4c\x4c\x4c\x5e\x32\
-\x5a\xb1\xff\xdf\x46\x4b\x36\xee\xff\xcb\x4d\xa1\xbf\xf3\x1f\x24\
-\xc8\x6b\x50\x2c\xc2\xc2\xc2\xdc\xd2\xd2\xd2\xfe\x7d\xe4\xc8\x11\
-\x0c\x06\x03\xad\xad\xad\x9c\x39\x73\x86\xc3\x87\x0f\x53\x5f\x5f\
-\x2f\xc0\xa0\xd7\xeb\xd9\xb7\x6f\x1f\x55\x55\x55\x54\x56\x56\x8a\
-\xa7\x74\xd7\xae\x5d\x22\x0f\x17\x16\x16\xb2\x75\xeb\x56\xc2\xc3\
-\xc3\xd9\xb0\x61\x03\x25\x25\x25\x94\x96\x96\xa2\xd5\x6a\x29\x2b\
-\x2b\x43\xa7\xd3\x51\x59\x59\x89\x46\xa3\xa1\xbc\xbc\x9c\x7d\xfb\
-\xf6\x51\x5b\x5b\x4b\x5d\x5d\x1d\x07\x0f\x1e\xa4\xba\xba\x1a\x8d\
-\x46\xc3\xd5\xab\x57\xf9\x2b\x5e\x3f\xfd\xf4\x13\xdf\x7e\xfb\x2d\
-\x1d\x1d\x1d\x34\x36\x36\xb2\x6b\xd7\x2e\xb6\x6c\xd9\x42\x79\x79\
-\x39\x1f\x7f\xfc\x31\x6d\x6d\x6d\x5c\xba\x74\x89\x4f\x3f\xfd\x94\
-\xfa\xfa\x7a\x01\x92\x2d\x5b\xb6\xa0\x56\xab\x69\x6b\x6b\x13\x7f\
-\xeb\xfa\xf5\xeb\x34\x35\x35\x51\x51\x51\x41\x7a\x7a\x3a\x8f\x3f\
-\xfe\xf8\x50\x00\x38\x20\x6d\x58\x8f\x91\xb6\xac\x18\xb7\x82\xad\
-\xfe\xe8\x86\xf5\xe1\xfa\x2f\x19\x63\x5c\x5d\x5d\xff\x2b\x2d\x2d\
-\xad\xb3\xb6\xb6\x96\x9b\x37\x6f\xf2\xc5\x17\x5f\xd0\xd3\xd3\x43\
-\x57\x57\x17\xc7\x8f\x1f\xe7\xd3\x4f\x3f\xe5\x93\x4f\x3e\xe1\xcb\
-\xdc\xe1\x61\x00\x00\x20\x00\x49\x44\x41\x54\xc4\x89\x13\x1c\x3b\
-\x76\x8c\xc3\x87\x0f\x73\xe8\xd0\x21\x0e\x1e\x3c\xc8\x07\x1f\x7c\
-\xc0\x81\x03\x07\xa8\xa9\xa9\x61\xcf\x9e\x3d\xe8\x74\x3a\x52\x53\
-\x53\x49\x48\x48\x40\xa3\xd1\xa0\xd7\xeb\xd1\xeb\xf5\x7c\xf0\xc1\
-\x07\xd4\xd5\xd5\x51\x5f\x5f\x2f\xd2\xcb\x87\x1f\x7e\xc8\xe1\xc3\
-\x87\x05\xe3\x1c\x3f\x7e\x1c\xbd\x5e\x4f\x49\x49\x09\x5f\x7f\xfd\
-\x35\xb7\x6e\xdd\xa2\xaf\xaf\x0f\x83\xc1\xc0\x85\x0b\x17\x38\x7d\
-\xfa\x34\x47\x8f\x1e\xa5\xa1\xa1\x81\xba\xba\x3a\xf6\xed\xdb\xc7\
-\xde\xbd\x7b\xa9\xaa\xaa\x62\xcf\x9e\x3d\xd4\xd4\xd4\x08\xe5\xaf\
-\xb9\xb9\x19\x83\xc1\xc0\xf5\xeb\xd7\xf9\xfe\xfb\xef\x01\xf8\xf9\
-\xe7\x9f\x69\x6d\x6d\xa5\xb6\xb6\x96\x8c\x8c\x0c\x52\x52\x52\xa8\
-\xaf\xaf\xe7\x93\x4f\x3e\xe1\xe2\xc5\x8b\xb4\xb5\xb5\xd1\xd8\xd8\
-\x48\x65\x65\x25\x79\x79\x79\x14\x17\x17\x0f\x18\x0c\x31\x7e\x5d\
-\xbe\x7c\x99\xfd\xfb\xf7\x93\x9c\x9c\x8c\x99\x99\x99\x70\x21\x8d\
-\x1d\x3b\xf6\x9c\x34\xa2\xb6\x49\xa2\xff\xe5\x92\x23\x78\x96\x94\
-\x6a\x27\xfe\xd1\x0d\x6b\xc3\xb5\x15\xcb\x74\xfb\xf6\xed\xa5\x3a\
-\x9d\x8e\x1f\x7e\xf8\x81\x5b\xb7\x6e\xf1\xcd\x37\xdf\xf0\xe5\x97\
-\x5f\xd2\xd6\xd6\x46\x57\x57\x17\x97\x2e\x5d\xa2\xa3\xa3\x83\xd6\
-\xd6\x56\x2e\x5c\xb8\x20\x00\x71\xea\xd4\xa9\x01\xa0\xd8\xbf\x7f\
-\x3f\xe9\xe9\xe9\xa4\xa6\xa6\x72\xfc\xf8\x71\x4e\x9e\x3c\x29\xe2\
-\xd4\xa9\x53\xa2\x38\x6b\x6c\x6c\xe4\xf4\xe9\xd3\x9c\x3d\x7b\x96\
-\xf3\xe7\xcf\xd3\xd2\xd2\x42\x6b\x6b\x2b\xc7\x8e\x1d\xe3\xdd\x77\
-\xdf\xe5\xcc\x99\x33\x68\xb5\x5a\xd4\x6a\x35\x79\x79\x79\x64\x66\
-\x66\xb2\x6d\xdb\x36\xd2\xd2\xd2\x48\x4b\x4b\xe3\x9d\xad\xa9\x24\
-\x6e\x4e\x63\xc5\xeb\x29\xf8\xc4\xa5\xe0\x13\xfb\x0e\x7e\x71\x6f\
-\x13\xf9\xbf\x6f\xf3\xd6\xdb\x2a\x52\x52\x52\x48\x4b\x4b\x63\xfb\
-\xf6\xed\x14\x17\x17\x53\x53\x53\xc3\x91\x23\x47\x38\x7f\xfe\x3c\
-\x97\x2f\x5f\xa6\xae\xae\x8e\xdc\xdc\x5c\x92\x93\x93\xa9\xaa\xaa\
-\xe2\xa3\x8f\x3e\xe2\xf4\xe9\xd3\xb4\xb7\xb7\x73\xfc\xf8\x71\x76\
-\xef\xde\x2d\x46\xc1\xbf\xff\xfe\xfb\x01\x73\x81\xc6\x2f\x83\xc1\
-\x40\x41\x41\x01\x01\x01\x01\xb8\xb9\xb9\xe1\xeb\xeb\xcb\xbc\x79\
-\xf3\xfe\x65\x6a\x6a\x9a\x6f\x62\x62\xb2\x59\xfa\x1f\x0b\xcb\xa4\
-\x1d\x4b\xf2\x7e\xe5\x87\xfe\xe8\x82\xed\x61\xd9\x95\x9b\x95\x95\
-\x15\xa3\xd1\x68\xf8\xea\xab\xaf\xf8\xf1\xc7\x1f\xb9\x7d\xfb\x36\
-\xdf\x7d\xf7\x1d\xfd\xfd\xfd\x74\x77\x77\x73\xf5\xea\x55\x3e\xff\
-\xfc\x73\xfa\xfa\xfa\xe8\xee\xee\xe6\xf2\xe5\xcb\x18\x0c\x06\x3a\
-\x3a\x3a\x68\x6f\x6f\x17\x80\xa8\xac\xac\x24\x35\x35\x95\xf7\xdf\
-\x7f\x9f\xae\xae\xae\x3b\xc2\x60\x30\xd0\xdc\xdc\xcc\xb9\x73\xe7\
-\x30\x18\x0c\x5c\xba\x74\x89\xee\xee\x6e\x7a\x7a\x7a\xe8\xeb\xeb\
-\xa3\xab\xab\x8b\xc2\xc2\x42\x52\x52\x52\xc8\xcc\xcc\x64\xc7\x8e\
-\x1d\x14\x14\x14\xb0\x63\xc7\x0e\x32\x32\x32\x48\x4f\x4f\x67\xeb\
-\xd6\xad\x84\x25\xa5\xf1\xc0\xcb\x19\x8c\x79\x39\x87\x89\xaf\xe4\
-\x61\x15\x90\xcf\x43\x7e\xf9\x98\xf8\x64\x62\xe2\xb1\x05\xd3\x79\
-\x89\x04\x44\xff\xff\x6c\x41\x52\x52\x12\x1b\x37\x6e\x14\x4d\xa1\
-\xfc\xfc\x7c\x2a\x2a\x2a\xd0\xeb\xf5\x42\xf9\x93\x01\xd2\xd4\xd4\
-\x44\x4b\x4b\x0b\x27\x4f\x9e\x14\x9f\x9d\x93\x93\xc3\x7b\xef\xbd\
-\x47\x65\x65\xa5\x90\x97\xcf\x9e\x3d\x4b\x47\x47\x07\xdd\xdd\xdd\
-\xf4\xf7\xf7\xa3\xd5\x6a\x79\xe3\x8d\x37\x84\x3f\xc0\xcf\xcf\x8f\
-\x05\x0b\x16\x74\x4b\x00\x90\xf3\xff\xff\x18\x6d\x0c\xb3\xf8\xbd\
-\xd5\xff\x70\x01\x60\x44\x6e\x6e\xee\x3f\xd5\x6a\xf5\x8f\xbd\xbd\
-\xbd\xfc\xf2\xcb\x2f\xfc\xfc\x7f\xed\x5d\x77\x54\xd4\x67\xba\xfe\
-\xd9\x8d\x29\x57\xb3\x89\x57\xd7\x98\xd5\x8d\x9a\xe6\x66\x3d\x29\
-\xab\x51\xe3\x26\x9b\x8d\xbb\x1a\x63\xe2\xe6\x9a\xc4\x6b\x59\x7b\
-\x36\x2b\xd8\x45\x90\x5e\x87\xa1\x0c\x04\x19\x18\xca\xc0\x00\xc2\
-\x48\x1f\xba\x0c\x0e\x0c\x20\x55\x50\xaa\x14\x41\x40\x40\xea\x80\
-\x54\xe9\xcf\xfd\xe3\x7e\xdf\x77\x7e\x20\x1a\x35\x9a\xe4\xde\xc0\
-\x39\xdf\x91\x83\x94\x81\xf7\xf9\xbd\xdf\x5b\x9e\xf7\x79\x87\x87\
-\x31\x34\x34\x84\x9e\x9e\x1e\xd4\xd6\xd6\xa2\xbd\xbd\x1d\x1a\x8d\
-\x06\xad\xad\xad\xac\x70\xd2\xd8\xd8\xc8\x40\x51\x53\x53\x83\xb2\
-\xb2\x32\x04\x04\x04\x20\x20\x20\x00\xad\xad\xad\xec\xf3\xf9\xa7\
-\xae\xae\x0e\xe5\xe5\xe5\x68\x68\x68\x40\x73\x73\x33\xfb\xbc\xb6\
-\xb6\x36\xb4\xb7\xb7\xe3\xf6\xed\xdb\xac\x34\x4b\xdd\x7d\x5a\x5a\
-\x1a\x2e\x5e\xbc\x88\x98\x98\x18\x28\x14\x0a\x28\x14\x0a\x38\xc8\
-\xc2\x31\x7d\x7f\x04\x16\x1d\x8d\xc2\x87\x16\xd1\xf8\xdc\x31\x16\
-\x1f\x0a\x2e\x60\xb5\x59\x3c\xde\xd0\x51\x62\xe6\x3e\x05\xb8\x6f\
-\xbc\x31\xf9\x6f\x86\x30\x12\xfd\x6f\x1a\xf9\xfd\xf7\xdf\xc3\xc4\
-\xc4\x04\xfa\xfa\xfa\x30\x33\x33\x83\xb9\xb9\x39\x6c\x6d\x6d\x21\
-\x12\x89\x60\x62\x62\x02\x99\x4c\x86\xd0\xd0\x50\x24\x25\x25\xa1\
-\xa0\xa0\x00\x79\x79\x79\x48\x4a\x4a\x82\x44\x22\x61\xbc\x01\x5d\
-\x5d\x5d\xe8\x1a\x18\xc3\xd2\x4a\xc0\xbe\x56\x2c\x16\xb3\x8a\xa4\
-\x89\x89\x09\x4e\x9e\x3c\x09\x13\x13\x13\x1c\x3b\x76\x0c\xbb\x77\
-\xef\xc6\xfa\xf5\xeb\xb3\x08\x00\xbe\xe0\xed\x57\x98\xcb\xdb\x29\
-\xf0\x64\x04\x22\x1e\x34\x1d\x14\x0a\x85\x2b\x25\x12\x49\x27\x3f\
-\xc0\x19\x19\x19\xc1\xc8\xc8\x08\xea\xeb\xeb\xa1\xd1\x68\x70\xfb\
-\xf6\x6d\xb4\xb7\xb7\xa3\xad\xad\x0d\x1a\x8d\x86\x55\xd1\x68\x05\
-\xad\xa2\xa2\x02\x32\x99\x0c\x2a\x95\x0a\x3d\x3d\x3d\xe8\xee\xee\
-\xbe\xeb\x50\xef\x41\x0d\xdd\xd9\xd9\x89\xae\xae\x2e\xf4\xf4\xf4\
-\xa0\xa7\xa7\x07\xbd\xbd\xbd\xe8\xe9\xe9\x41\x57\x57\x17\xda\xdb\
-\xdb\x51\x5d\x5d\x8d\xa2\xa2\x22\xe4\xe7\xe7\xe3\xca\x95\x2b\xec\
-\xaa\xc9\xc9\xc9\xc1\x4a\x9b\xcb\x58\x6a\x5e\x80\xc3\xd1\x45\xc8\
-\xbe\x76\x0d\x47\x95\x25\xd8\x19\x56\x86\x6f\x82\xca\xb1\xc9\xbb\
-\x1c\xef\xd9\x95\x83\x3b\x92\x01\x6e\xfb\x39\xbc\xba\xf7\x7b\x64\
-\x65\x65\xe1\xc2\x85\x0b\x90\xcb\xe5\x10\x0a\x85\xd0\xd3\xd3\x83\
-\x40\x20\x80\x89\x89\x09\x4c\x4c\x4c\x60\x63\x63\xc3\x9e\x70\x95\
-\x4a\x85\xbc\xbc\x3c\x14\x17\x17\x23\x33\x33\x13\xe7\xce\x9d\x83\
-\x40\x20\xc0\xc9\x93\x27\xb1\x63\xc7\x0e\xac\xdf\xf8\x19\x26\xbd\
-\xbb\x13\xbf\x59\xb7\x1b\x7f\xf8\xdb\x76\xec\x3f\xf0\x2d\xb4\xb5\
-\xb5\x61\x66\x66\xc6\x08\x22\xb4\x41\x65\x64\x64\x04\x2d\x2d\x2d\
-\x6c\xd9\xb2\x25\x96\xcc\x05\xae\x25\x3d\x80\xb9\xbc\xf2\xef\xcf\
-\x06\x80\xc9\x4e\x4e\x4e\x2b\x5c\x5d\x5d\x5b\xf3\xf2\xf2\xee\xba\
-\xd7\xa8\x71\xa9\xc1\xda\xdb\xdb\xd9\x69\x6b\x6b\x43\x5b\x5b\x1b\
-\x5a\x5a\x5a\x50\x57\x57\x87\x80\x80\x00\xa8\xd5\x6a\x0c\x0d\x0d\
-\x8d\x3a\x83\x83\x83\x18\x1a\x1a\x42\x63\x63\x23\xda\xda\xda\xd0\
-\xd3\xd3\x83\xbe\xbe\x3e\xf4\xf5\xf5\x61\x60\x60\x80\xfd\x3f\xff\
-\xf3\xfb\xfb\xfb\xd1\xd3\xd3\x83\xba\xba\x3a\x56\xc6\xa5\x1e\xa1\
-\xa2\xa2\x02\x05\xa5\x37\x30\xc9\xe0\x06\x3e\xf4\xb8\x85\xe4\xc6\
-\x46\x84\x34\x35\xe1\x48\x6a\x33\xb4\x53\x5b\x70\xe4\x52\x2b\xb4\
-\x92\x5a\xb1\x4b\xd1\x8a\xb7\x85\x75\x78\xf6\xbb\x78\x70\x5b\x9c\
-\x90\x55\x78\x1d\xc5\xc5\xc5\x50\xab\xd5\xf0\xf3\xf3\x83\x81\x81\
-\x01\xcc\xcc\xcc\xe0\xe8\xe8\x08\x1b\x1b\x1b\x88\xc5\x62\x56\x2d\
-\x4c\x4d\x4d\x45\x61\x61\x21\xca\xca\xca\x90\x9f\x9f\x8f\xc8\xc8\
-\x48\xb8\xba\xba\xc2\xc2\xc2\x02\x47\x8f\x1e\xc5\xae\x5d\xbb\xf0\
-\x87\x4d\x87\xc0\xad\x3b\x06\xee\x4f\x7b\xf0\xc6\x27\xdb\xb0\x7b\
-\xf7\x6e\x7c\xf5\xd5\x57\xd8\xbc\x79\x33\x4e\x9f\x3e\x0d\xb1\x58\
-\x0c\x7f\x7f\x7f\x56\x4b\x30\x30\x30\xc0\xee\xdd\xbb\x23\x89\x66\
-\xe0\x72\x9e\xc8\xe6\xb4\x47\x91\x90\x7f\x2c\x4f\xbe\x83\x83\xc3\
-\x6a\x89\x44\xd2\x9a\x9f\x9f\x7f\x97\xf1\x35\x1a\x0d\x6a\x6b\x6b\
-\xef\xe9\xca\xf9\x57\x41\x44\x44\x04\xc2\xc3\xc3\xd9\xd5\xc1\x3f\
-\x1a\x8d\x06\x0d\x0d\x0d\xe8\xee\xee\x46\x6f\x6f\x2f\xee\xdc\xb9\
-\x83\xfe\xfe\x7e\xf4\xf7\xf7\x33\xe3\x53\x6f\x43\xbf\x9e\x02\xe0\
-\xe6\xcd\x9b\x68\x68\x68\x40\x53\x53\x13\x1a\x1a\x1a\xd0\xd2\xd2\
-\x82\xf6\xf6\x76\x5c\xad\xb9\x8d\xe9\x96\x6d\xd8\x10\xd0\x0f\x87\
-\xb2\x41\xe8\x15\x0e\xe1\x74\xc1\x30\x0c\x8a\x87\x61\x54\x32\x0c\
-\xe3\x92\x61\x98\x17\x0c\xe3\x50\xcc\x30\x5e\x3b\x73\x19\xdc\x7f\
-\xfb\x22\xa5\xa8\x0e\x9d\x9d\x9d\xc8\xcf\xcf\x47\x44\x44\x04\x2b\
-\xf0\x38\x3a\x3a\xc2\xd3\xd3\x93\xe5\xf6\x4a\xa5\x12\x59\x59\x59\
-\x28\x2e\x2e\x66\xa0\x4b\x4e\x4e\x86\x5c\x2e\x87\xb3\xb3\x33\xab\
-\x09\x6c\xdf\x7f\x08\x2f\x6e\xb6\xc2\x94\x8f\x4e\xe2\xd9\x0f\xbf\
-\x63\x1d\xc1\x9d\x3b\x77\xe2\xc8\x91\x23\x10\x8b\xc5\x88\x88\x88\
-\x80\x4a\xa5\x42\x6c\x6c\x2c\xbc\xbc\xbc\x20\x10\x08\x70\xf8\xf0\
-\x61\xe5\xd4\xa9\x53\xd7\xf0\x76\x12\x52\x2f\xf0\xd3\x78\x00\x1a\
-\xf0\xb9\xba\xba\x6e\x71\x77\x77\xef\x2e\x2d\x2d\xbd\xcb\xf8\x1d\
-\x1d\x1d\xa8\xaa\xaa\x62\x35\x72\x7a\x68\xf7\x8c\x1a\xbe\xa1\xa1\
-\x01\x79\x79\x79\xf0\xf0\xf0\x40\x53\x53\xd3\x5d\xdf\x87\x3e\xf5\
-\xbd\xbd\xbd\xe8\xed\xed\x45\x5f\x5f\x1f\x33\xfc\xe0\xe0\xe0\x3d\
-\x23\xea\xc1\xc1\x41\xf4\xf6\xf6\xb2\x58\xa1\xab\xab\x0b\x1d\x1d\
-\x1d\x0c\x44\xad\x9d\xbd\x98\x62\x74\x03\x1f\xca\x86\xf0\xcf\x84\
-\x61\x1c\xce\x1e\x81\x4e\xfe\x08\x0c\x8b\x47\x60\x56\x3a\x02\x61\
-\xf9\x08\xc4\x15\x23\xd0\xbb\x38\x82\xf7\x4d\x72\xc0\x6d\xf7\x45\
-\x75\x53\x07\x06\x06\x06\x50\x55\x55\x85\xd8\xd8\x58\x88\xc5\x62\
-\x58\x59\x59\xc1\xc1\xc1\x01\xbe\xbe\xbe\x88\x8a\x8a\x82\x5a\xad\
-\xc6\xe5\xcb\x97\x51\x58\x58\x88\x8a\x8a\x0a\xdc\xb8\x71\x03\x37\
-\x6f\xde\x44\x4e\x4e\x0e\x4b\x49\x5d\x5c\x5c\x60\x6e\x6e\x8e\x93\
-\x27\x4f\xe2\x93\x03\x42\x3c\xbf\xc1\x10\x53\x3e\xd6\x61\xec\x65\
-\x3a\x29\xe5\xe0\xe0\x00\x85\x42\x81\xcc\xcc\x4c\x14\x16\x16\x22\
-\x35\x35\x15\x72\xb9\x1c\x22\x91\x08\x06\x06\x06\xd9\x2f\xbd\xf4\
-\xd2\x3a\xde\xaa\x9d\xa7\x1e\xf6\x1a\x78\xe4\x7c\xff\xbd\xf7\xde\
-\x9b\x2e\x91\x48\xac\xfc\xfc\xfc\x86\xc7\x2b\xae\x74\x75\x75\xa1\
-\xb2\xb2\x12\x75\x75\x75\xa8\xaf\xaf\x67\x87\xd6\xca\xf9\xa7\xa6\
-\xa6\x06\x72\xb9\x1c\x11\x11\x11\xa3\xbe\xc7\xc0\xc0\x00\x6e\xdd\
-\xba\xc5\x8c\x46\xef\x77\x3e\x00\x86\x86\x86\xee\x09\x80\xa1\xa1\
-\x21\xdc\xb9\x73\x07\x05\x05\x05\x28\x2b\x2b\x43\x4f\x4f\xcf\xa8\
-\xaf\x19\x1e\x1e\xc6\x46\x59\x1d\x96\xd8\x6a\xf0\xf7\x00\x60\x47\
-\x1c\xf0\x5d\x0a\x70\x32\x0b\x30\xbc\x02\x58\x5c\x05\x2c\xd2\x81\
-\x3d\x3e\x1a\x2c\x3e\xac\xc4\x9f\x0c\xa2\x59\x5c\x53\x5e\x5e\x8e\
-\xf8\xf8\x78\x48\x24\x12\xc6\x1a\x0a\x0f\x0f\x47\x46\x46\x06\xf2\
-\xf3\xf3\x99\xe1\x29\x67\xa0\xb6\xb6\x16\xe5\xe5\xe5\x48\x4d\x4d\
-\x85\x42\xa1\xc0\xb9\x73\xe7\x18\x08\x0e\xeb\x18\x61\xfe\x66\x33\
-\x3c\xb7\x41\x8f\x11\x5f\x8f\x1f\x3f\x8e\x43\x87\x0e\xc1\xc6\xc6\
-\x06\x81\x81\x81\x48\x4b\x4b\x43\x59\x59\x19\x4a\x4b\x4b\x91\x91\
-\x91\x81\xa0\xa0\x20\x9c\x3d\x7b\x16\xe6\xe6\xe6\x35\x9f\x7c\xf2\
-\xc9\x56\xc2\xc9\x98\xfb\xb0\xfb\x85\x1e\xc9\xf8\x8e\x8e\x8e\xaf\
-\x79\x79\x79\xa5\x45\x45\x45\x8d\xfb\x87\xef\xea\xea\xc2\xf5\xeb\
-\xd7\x51\x5d\x5d\x8d\x9a\x9a\x1a\x76\x28\x79\xa2\xb6\xb6\x16\xb5\
-\xb5\xb5\x8c\x48\x51\x58\x58\x08\x67\x67\x67\xe4\xe4\xe4\x8c\x7a\
-\x7a\xeb\xeb\xeb\xd1\xd6\xd6\x86\xce\xce\xce\x7b\x02\x80\x1a\x72\
-\xec\xdb\xc8\xc8\x08\x06\x07\x07\x71\xe7\xce\x1d\x54\x54\x54\x20\
-\x23\x23\x03\xe5\xe5\xe5\x68\x69\x69\x41\x7f\x7f\x3f\xbb\x2a\xae\
-\x35\xf4\xe0\x59\xdd\x1c\xfc\xd6\xbc\x16\xab\xdd\x06\xf0\x17\x6f\
-\xe0\x8b\x00\xe0\xcb\xf3\xc0\x3f\x64\xbd\xf8\xcc\xf9\x26\x96\x9e\
-\x4c\xc1\x8c\xdd\x01\xc8\xba\xde\x8c\x9e\x9e\x1e\x5c\xbf\x7e\x1d\
-\x97\x2e\x5d\xc2\xf9\xf3\xe7\x21\x16\x8b\x61\x67\x67\x87\xb3\x67\
-\xcf\x22\x2c\x2c\x0c\x99\x99\x99\x28\x2e\x2e\x66\xa9\x28\xff\x77\
-\xad\xae\xae\x46\x6e\x6e\x2e\xe2\xe3\xe3\x11\x18\x18\x08\x6f\x6f\
-\x6f\x88\x44\x22\x18\x19\x19\xe1\xad\x2f\x4f\xe0\xb5\x4f\x0f\x62\
-\xfb\xf6\xed\xd8\xbf\x7f\x3f\xb4\xb5\xb5\xb1\x7f\xff\x7e\x08\x04\
-\x02\xf8\xf9\xf9\x41\xa9\x54\x32\x8f\x52\x56\x56\x86\x8c\x8c\x0c\
-\x84\x84\x84\xc0\xd5\xd5\x15\xb6\xb6\xb6\x7d\x47\x8f\x1e\x15\x4e\
-\x99\x32\x65\xe9\xc3\x2e\x95\x78\xa8\xed\x17\x3b\x76\xec\x78\xd1\
-\xdd\xdd\x5d\xe8\xe5\xe5\xd5\x37\xde\x7d\x0f\x00\xb7\x6f\xdf\x46\
-\x59\x59\x19\x0b\xb4\x2a\x2b\x2b\x51\x59\x59\xc9\x6a\xe3\x55\x55\
-\x55\xec\xdc\xb8\x71\x03\x15\x15\x15\x50\xa9\x54\x70\x73\x73\x43\
-\x5a\x5a\x1a\x06\x07\x07\x31\x30\x30\xc0\xda\xac\x1d\x1d\x1d\xf7\
-\x05\xc0\xfd\x3c\xc0\xe0\xe0\x20\xfa\xfa\xfa\xa0\xd1\x68\x90\x9e\
-\x9e\x8e\xd4\xd4\x54\xe4\xe7\xe7\xa3\xaa\xaa\x0a\x2d\x2d\x2d\xe8\
-\xe9\xe9\x01\x00\xa4\xdd\xe8\xc0\x7c\x1d\x35\xb8\xe3\xb9\xe0\x4e\
-\xe5\x63\xc6\x89\x5c\x3c\x73\x22\x17\x2f\x1e\xbb\x84\x19\xdf\xc6\
-\xe1\xf9\x6f\x83\x10\x9a\x5e\x8e\xca\xca\x4a\xe4\xe6\xe6\x22\x31\
-\x31\x11\x21\x21\x21\x70\x77\x77\x87\x83\x83\x03\xce\x9e\x3d\x0b\
-\x2f\x2f\x2f\xc4\xc5\xc5\x21\x2f\x2f\x0f\x15\x15\x15\x68\x68\x68\
-\x60\x5d\x41\x0a\x80\xaa\xaa\x2a\x5c\xbb\x76\x0d\xc9\xc9\xc9\x50\
-\x28\x14\xf0\xf7\xf7\x87\x9b\x9b\x1b\x04\x02\x01\xb4\x4e\xe8\x62\
-\xfd\x86\x4f\xb1\x65\xcb\x16\x46\x80\xd5\xd6\xd6\x86\x48\x24\x82\
-\x5c\x2e\x47\x4c\x4c\x0c\xd2\xd3\xd3\x59\xcd\xa0\xa8\xa8\x08\xe9\
-\xe9\xe9\x50\x28\x14\xf0\xf0\xf0\xa0\x42\x13\xe5\x7b\xf6\xec\x39\
-\xbe\x6c\xd9\xb2\xd7\x1f\x74\x52\xf8\x81\x58\xc0\x06\x06\x06\x2f\
-\x7b\x78\x78\x58\x48\xa5\xd2\x56\x95\x4a\x75\xcf\xfa\x78\x4b\x4b\
-\x0b\x8a\x8b\x8b\x51\x52\x52\x82\xd2\xd2\x52\xc6\x97\xa3\x41\xd0\
-\xd8\x43\xb9\x74\xb4\x59\xa2\x54\x2a\x51\x59\x59\x89\x9a\x9a\x1a\
-\x54\x55\x55\xa1\xad\xad\xed\x47\x01\x60\x68\x68\x08\x7d\x7d\x7d\
-\x68\x6f\x6f\x47\x5d\x5d\x1d\x12\x12\x12\x10\x17\x17\x87\x4b\x97\
-\x2e\x21\x37\x37\x17\xc5\xc5\xc5\xa8\xac\xac\x44\x6d\x6d\x2d\x2a\
-\x6f\x36\xc0\x28\x24\x1f\xef\x99\xaa\xf0\xbc\x56\x0c\xe6\x68\x45\
-\xe3\x8f\x67\xe2\x70\xd8\x53\x8d\x94\xcc\x2b\xc8\xcc\xcc\x84\x5a\
-\xad\x46\x74\x74\x34\xe4\x72\x39\x5c\x5d\x5d\x21\x12\x89\x60\x63\
-\x63\x03\x37\x37\x37\x04\x04\x04\x40\xa5\x52\xa1\xb0\xb0\x10\x37\
-\x6e\xdc\x60\xec\xa0\xfa\xfa\x7a\x56\xdf\xa0\x45\xaf\xec\xec\x6c\
-\xc4\xc5\xc5\x21\x30\x30\x10\x32\x99\x0c\xdf\x7f\xff\x3d\x4c\x4d\
-\x4d\xb1\x73\xe7\x4e\x6c\xd8\xb0\x01\x9b\x37\x6f\xc6\xbe\x7d\xfb\
-\xa0\xab\xab\x0b\x77\x77\x77\xd6\xae\x4e\x4f\x4f\x47\x4a\x4a\x0a\
-\x92\x92\x92\x58\x0f\x25\x2c\x2c\x0c\xbe\xbe\xbe\x2c\xb0\x34\x34\
-\x34\x6c\xf8\xfc\xf3\xcf\xff\x31\x76\x01\xe7\x43\x01\xc0\xd6\xd6\
-\x76\x8e\xa7\xa7\xe7\xbb\xde\xde\xde\x47\x65\x32\x59\x82\x9f\x9f\
-\xdf\xa0\x5a\xad\x66\xf5\x6f\xfa\x36\x3c\x3c\x8c\xce\xce\x4e\x34\
-\x36\x36\xb2\x3c\x3b\x3f\x3f\x1f\x05\x05\x05\xac\x14\x5b\x54\x54\
-\x84\x6b\xd7\xae\x8d\x3a\x14\x20\x25\x25\x25\x28\x2e\x2e\x46\x70\
-\x70\x30\xc4\x62\x31\x82\x83\x83\x91\x96\x96\x86\x92\x92\x12\x54\
-\x57\x57\xa3\xad\xad\x0d\xb7\x6f\xdf\x7e\xe4\x18\x60\x78\x78\x18\
-\x83\x83\x83\xe8\xee\xee\x86\x46\xa3\x41\x49\x49\x09\x94\x4a\x25\
-\x02\x03\x03\x59\xa4\xae\x56\xab\x91\x9a\x9a\x8a\xb4\xb4\x34\x64\
-\x64\x64\x20\x3d\x3d\x1d\x69\x69\x69\x48\x49\x49\x81\x5a\xad\x66\
-\x0d\xab\x88\x88\x08\xe6\xb6\x9d\x9c\x9c\x18\x63\xd8\xdd\xdd\x1d\
-\x41\x41\x41\x88\x8f\x8f\xc7\xe5\xcb\x97\x59\x2b\x98\x52\xc4\xa8\
-\x07\xe0\x03\xa0\xa8\xa8\x08\x6a\xb5\x9a\x79\x01\x0f\x0f\x0f\xd8\
-\xda\xda\x42\x5f\x5f\x1f\xeb\xd7\xaf\xc7\x96\x2d\x5b\xa0\xad\xad\
-\x0d\x73\x73\x73\x78\x79\x79\x21\x2c\x2c\x0c\xd1\xd1\xd1\x88\x8f\
-\x8f\x47\x64\x64\x24\x42\x42\x42\xe0\xeb\xeb\x4b\xdd\x3f\x4c\x4d\
-\x4d\xa1\xaf\xaf\x3f\x72\xe0\xc0\x81\x84\x17\x5f\x7c\x71\x0b\xd1\
-\x0f\x5c\xc8\xdb\xc1\x3c\xf5\xa1\x00\xe0\xed\xed\xfd\xfa\xf9\xf3\
-\xe7\x9d\x85\x42\xe1\x6d\x0f\x0f\x0f\x84\x85\x85\xb1\xca\x59\x68\
-\x68\x28\x02\x03\x03\x11\x19\x19\x09\xa5\x52\x89\xe4\xe4\x64\x64\
-\x64\x64\xe0\xf2\xe5\xcb\xb8\x7a\xf5\x2a\x0a\x0a\x0a\x46\x19\x9e\
-\xef\x0d\x68\xf9\x96\x5e\x0d\x15\x15\x15\x28\x2f\x2f\x47\x78\x78\
-\x38\x9c\x9c\x9c\x98\x1b\x2d\x28\x28\x40\x4d\x4d\xcd\x28\x00\x74\
-\x75\x75\xb1\xe8\xfd\x41\x01\x40\xef\xf9\x81\x81\x01\xf4\xf6\xf6\
-\xa2\xae\xae\x0e\x05\x05\x05\x48\x4e\x4e\x46\x68\x68\x28\xfc\xfd\
-\xfd\x11\x10\x10\x80\x90\x90\x10\x28\x14\x0a\x44\x44\x44\x20\x32\
-\x32\x12\x91\x91\x91\xa3\x7e\x57\x4a\x00\xa1\x86\xa7\x24\x52\x4f\
-\x4f\x4f\xc8\xe5\x72\xc4\xc7\xc7\x23\x27\x27\x07\xa5\xa5\xa5\xec\
-\xea\x6a\x6e\x6e\x46\x43\x43\xc3\x28\x00\xdc\xb8\x71\x03\x95\x95\
-\x95\x28\x2f\x2f\x47\x56\x56\x16\xf3\x02\x3e\x3e\x3e\x10\x8b\xc5\
-\xb0\xb4\xb4\x84\xb6\xb6\x36\xbe\xf8\xe2\x0b\x68\x69\x69\xc1\xcc\
-\xcc\x0c\x2e\x2e\x2e\x90\xc9\x64\xf0\xf1\xf1\x81\x4c\x26\x83\x44\
-\x22\x81\x83\x83\x03\x2b\x3e\xe9\xeb\xeb\x0f\x1f\x38\x70\xa0\xe0\
-\xf5\xd7\x5f\x17\x10\xa2\xe8\xe7\x84\x26\xf6\x0a\x09\x0a\x67\x71\
-\x1c\x37\xed\xa1\x00\x40\x05\x21\xde\x79\xe7\x9d\xdf\x68\x69\x69\
-\xed\x3f\x75\xea\x94\x4a\x5f\x5f\x7f\xc0\xc8\xc8\x08\x96\x96\x96\
-\xb0\xb3\xb3\x83\x58\x2c\x86\x54\x2a\x45\x40\x40\x00\xc2\xc2\xc2\
-\x10\x1b\x1b\x0b\x95\x4a\x85\x94\x94\x14\x64\x66\x66\x22\x27\x27\
-\x87\x01\x82\x76\xc5\xc6\x5e\x09\xf4\x2e\x8b\x8e\x8e\x86\xa3\xa3\
-\x23\x5c\x5c\x5c\x10\x16\x16\x86\xdc\xdc\x5c\x54\x57\x57\xa3\xb9\
-\xb9\x19\xed\xed\xed\xf7\x05\xc0\xfd\xd2\x40\x0a\x82\xa1\xa1\x21\
-\xf4\xf7\xf7\x43\xa3\xd1\xa0\xa6\xa6\x86\x55\xe6\x2e\x5e\xbc\x08\
-\x85\x42\x81\xa0\xa0\x20\xc6\x47\xa0\x7f\x68\x2f\x2f\x2f\x78\x7a\
-\x7a\xc2\xc3\xc3\x83\x71\x0d\x7c\x7c\x7c\x18\x99\x84\x52\xc5\x93\
-\x92\x92\x90\x93\x93\x83\xb2\xb2\x32\x54\x57\x57\x33\x7a\xd8\x58\
-\x00\x54\x57\x57\xb3\x98\x87\xb2\x8c\xf8\x5e\x40\x2a\x95\xc2\xc1\
-\xc1\x01\xe6\xe6\xe6\xd8\xbf\x7f\x3f\xf6\xec\xd9\x83\x63\xc7\x8e\
-\xc1\xc8\xc8\x08\x66\x66\x66\xb0\xb4\xb4\x84\x99\x99\x19\x4c\x4c\
-\x4c\x60\x60\x60\x80\x63\xc7\x8e\xb5\x7c\xf5\xd5\x57\xf1\x2f\xbf\
-\xfc\xb2\x09\x6f\x07\xf3\x3f\xc6\x90\x44\x5e\xa0\x1c\x81\x47\x01\
-\xc0\x34\xde\xf0\xc7\x2b\x8b\x16\x2d\x5a\xfb\xf5\xd7\x5f\x5b\x1e\
-\x3a\x74\x28\x5d\x4f\x4f\xaf\x97\xbe\x30\x81\x40\xc0\xea\xd8\x9e\
-\x9e\x9e\x38\x77\xee\x1c\x82\x83\x83\x11\x11\x11\x81\xb8\xb8\x38\
-\x24\x24\x24\x20\x29\x29\x69\x54\x7b\x96\xba\xda\x94\x94\x14\x24\
-\x26\x26\x22\x34\x34\x14\x22\x91\x08\x4e\x4e\x4e\x90\xcb\xe5\xc8\
-\xcc\xcc\x44\x55\x55\x15\x9a\x9a\x9a\x18\x00\x68\x1c\x40\x8b\x40\
-\xfc\x0a\x20\x95\x5d\xbb\x1f\x08\x86\x87\x87\x71\xe7\xce\x1d\xdc\
-\xbe\x7d\x1b\x4d\x4d\x4d\xa8\xa9\xa9\x41\x69\x69\x29\xae\x5c\xb9\
-\x82\x8c\x8c\x0c\x24\x25\x25\x41\xa9\x54\x22\x26\x26\x06\x91\x91\
-\x91\x08\x0f\x0f\x67\x27\x32\x32\x12\xd1\xd1\xd1\x50\x2a\x95\x50\
-\xa9\x54\x48\x4d\x4d\x45\x76\x76\x36\x4b\x2f\x69\x13\xa7\xb1\xb1\
-\x91\xd5\x36\x68\x7d\x83\xde\xff\xd5\xd5\xd5\xac\xe9\x55\x56\x56\
-\x86\x6b\xd7\xae\xb1\x58\x20\x28\x28\x08\x7e\x7e\x7e\x70\x73\x73\
-\x83\xad\xad\x2d\x4c\x4c\x4c\x58\x20\xf8\xdd\x77\xdf\xe1\xe8\xd1\
-\xa3\x23\x87\x0f\x1f\x6e\xd9\xb3\x67\x4f\xde\xa6\x4d\x9b\x42\x97\
-\x2e\x5d\x6a\x4e\x94\xc2\xf6\x93\x9d\x07\xdf\x10\xdd\xc0\xf5\xa4\
-\x49\xf4\x26\x8f\x24\xf2\xf0\x57\x00\x2f\xf2\x7f\x86\xf4\x9a\x7f\
-\x47\x3a\x4f\x7f\xe2\x38\xee\xe3\x69\xd3\xa6\x6d\x59\xbd\x7a\xb5\
-\xe9\xb6\x6d\xdb\x14\x5a\x5a\x5a\xa5\x67\xce\x9c\xe9\xa3\xc2\x8d\
-\x96\x96\x96\x10\x0a\x85\xcc\xa0\x2e\x2e\x2e\x70\x77\x77\x87\x54\
-\x2a\x65\xae\xcc\xd7\xd7\x17\x32\x99\x0c\x52\xa9\x14\x12\x89\x04\
-\x22\x91\x08\x42\xa1\x10\x0e\x0e\x0e\x90\xc9\x64\x48\x4e\x4e\x46\
-\x65\x65\x25\x9a\x9a\x9a\x58\xff\xe0\x7e\x00\xa0\x55\xc0\xfb\x01\
-\x80\x9f\x16\x76\x75\x75\xa1\xad\xad\x0d\x8d\x8d\x8d\xa8\xa9\xa9\
-\x41\x79\x79\x39\x0a\x0b\x0b\x71\xe5\xca\x15\x64\x65\x65\xb1\x8c\
-\xe1\xd2\xa5\x4b\x48\x4d\x4d\x45\x7a\x7a\x3a\xb2\xb2\xb2\x90\x9b\
-\x9b\xcb\x66\x03\x2a\x2a\x2a\x50\x53\x53\x83\x5b\xb7\x6e\xa1\xa9\
-\xa9\x09\x2d\x2d\x2d\x68\x6d\x6d\xbd\x8b\x1d\x3c\x36\x00\x2c\x2f\
-\x2f\x47\x69\x69\x29\xae\x5d\xbb\x86\xc2\xc2\x42\x96\x11\xc8\xe5\
-\x72\xc8\x64\x32\x88\xc5\x62\x08\x85\x42\x18\x19\x19\x0d\xbe\xff\
-\xfe\xfb\x49\x0b\x16\x2c\x70\x9f\x3e\x7d\xba\x3e\x6f\xdb\xea\x4e\
-\x62\xf0\x7f\x10\xd2\xed\x5f\x49\x5f\xe0\x5d\xde\xce\xe1\xb1\x4b\
-\x26\x27\x3f\x2a\x00\x9e\xe6\x51\xbe\x97\x92\xfe\xf3\xfb\x44\xa0\
-\x70\x23\xe9\x4a\x7d\x3d\x79\xf2\xe4\x1d\xcb\x97\x2f\xd7\xdf\xb8\
-\x71\xa3\xe7\x8e\x1d\x3b\xe2\xbf\xfb\xee\xbb\xfc\x13\x27\x4e\xdc\
-\x3a\x73\xe6\x4c\xbf\xa1\xa1\x21\x53\xc3\xa2\x0d\x13\x7a\xa8\x74\
-\xdb\xa9\x53\xa7\x06\x74\x75\x75\x3b\xed\xec\xec\x20\x91\x48\x10\
-\x17\x17\x87\x6b\xd7\xae\xb1\x92\x6d\x7b\x7b\x3b\x6b\xf8\x3c\x6c\
-\x1c\x70\x2f\x6f\x40\x53\xc4\xee\xee\x6e\xb4\xb5\xb5\xa1\xa1\xa1\
-\x01\x37\x6f\xde\x1c\x65\x24\x1a\xa8\x96\x97\x97\xb3\xec\xa4\xbe\
-\xbe\x1e\xcd\xcd\xcd\x2c\x3e\xa1\xd5\x45\xda\xe3\xd0\x68\x34\xcc\
-\xfd\xdf\xba\x75\x8b\xdd\xff\xe5\xe5\xe5\xc8\xc8\xc8\x40\x46\x46\
-\x06\x8a\x8b\x8b\x51\x5c\x5c\xcc\x08\x29\x2a\x95\x0a\x51\x51\x51\
-\x08\x0e\x0e\x86\xaf\xaf\x2f\xc4\x62\x31\xac\xad\xad\x61\x6c\x6c\
-\xdc\xbb\x62\xc5\x0a\x19\xe1\x01\xee\x25\x3c\xc0\xcf\x78\x46\x7f\
-\x9b\x34\x84\xa8\x4c\xdc\xec\x31\x2b\xe7\xa7\xfc\x10\x3b\xe8\x41\
-\x46\xc0\x9e\x26\xdf\xf8\x45\xd2\x7b\x5e\x4c\xda\x90\xcb\x49\xb4\
-\xb9\x92\xbc\x98\xbf\x10\x96\xea\x67\xc4\x1d\x6d\xe5\x38\xee\x9b\
-\x39\x73\xe6\x1c\x58\xba\x74\xe9\xa9\x15\x2b\x56\x18\xaf\x5a\xb5\
-\xca\x66\xd5\xaa\x55\xb6\xab\x56\xad\xb2\x7d\xfb\xed\xb7\xad\x96\
-\x2d\x5b\x66\xf4\xc2\x0b\x2f\x1c\xe3\x38\xee\x5f\xb3\x66\xcd\x3a\
-\x6a\x6a\x6a\xda\x41\xf3\xde\x9c\x9c\x1c\x56\xfb\xef\xee\xee\x1e\
-\xf7\x1a\xe8\xef\xef\x7f\xe0\x6b\xe0\x5e\x20\xa0\xfd\x82\x8e\x8e\
-\x0e\xd6\x94\xe2\xbb\x71\xea\xd6\xe9\x13\xce\x37\x3c\x05\x65\x47\
-\x47\x07\xfb\xfa\xd6\xd6\x56\xe6\xfe\xd3\xd3\xd3\x71\xea\xd4\x29\
-\xac\x5e\xbd\x9a\x8d\xaa\x3d\xf3\xcc\x33\x08\x08\x08\x40\x7e\x7e\
-\x3e\x9c\x9c\x9c\xb0\x6b\xd7\x2e\x36\xef\xe8\xeb\xeb\x8b\x88\x88\
-\x08\xc6\x22\x36\x34\x34\xec\xd9\xbc\x79\x73\x08\xb9\xdf\x37\x12\
-\x0e\xe0\x7b\x84\x07\xf8\x1a\xb1\xc5\x6f\x79\x6b\xe4\x9e\xe2\xed\
-\x3c\x7a\xa0\xe5\x57\x0f\xba\xf8\x90\x72\xfd\x66\x90\x1f\xf2\x34\
-\xf9\x81\xcf\x93\x18\xe1\x65\x02\x8a\x3f\x10\x57\xb4\x9a\xbc\xd8\
-\x4f\xc8\x0b\xdf\x4c\x40\xf1\x25\x61\xb3\x7c\x4d\xdc\xd8\xd7\xbc\
-\xf7\xb7\x6d\xd8\xb0\xc1\x5d\x20\x10\x40\x2c\x16\xe3\xc2\x85\x0b\
-\x28\x2b\x2b\x43\x67\x67\xe7\xa8\xa7\x95\xb6\x7d\xc7\xab\x08\x3e\
-\x28\x00\xc6\x5e\x0d\x94\xb3\x40\x8b\x50\x03\x03\x03\xac\xd1\x44\
-\x41\x46\x3f\x76\xe7\xce\x1d\x76\x68\xbb\xba\xb3\xb3\x13\xb7\x6f\
-\xdf\x66\xed\xed\xfa\xfa\x7a\x9c\x3e\x7d\x9a\x2d\xd4\x58\xbd\x7a\
-\x35\x13\x7d\xe4\x38\x0e\x52\xa9\x14\x9b\x37\x6f\xc6\x8a\x15\x2b\
-\xf0\xd6\x5b\x6f\xe1\x95\x57\x5e\xc1\x8c\x19\x33\xe0\xec\xec\x0c\
-\x17\x17\x17\x58\x5a\x5a\x42\x47\x47\xa7\x75\xc1\x82\x05\x56\x64\
-\x45\xcf\x66\x62\x78\x2a\x05\x33\x9f\x18\x7d\xf6\x8f\x5d\x2d\xff\
-\x30\x5c\xbf\x29\xbc\x05\x4e\x14\x0c\xb3\x78\x54\xf0\x79\x24\xf7\
-\xfc\x3d\x01\xc3\x1b\x04\xa9\x6f\x13\x50\xac\x24\x24\x86\xd5\x64\
-\x9e\x6d\x2d\xf9\x77\x35\x79\xff\x03\x8e\xe3\x36\x1d\x3a\x74\x28\
-\x51\x20\x10\x40\x2a\x95\x22\x25\x25\x05\x37\x6f\xde\xc4\xc0\xc0\
-\xc0\x28\x36\xee\xe3\xf0\x02\xe3\x81\x80\x02\x61\xbc\x43\xc1\xd1\
-\xdf\xdf\x8f\xbe\xbe\xbe\x51\x9c\x83\x8e\x8e\x0e\xe6\xfe\x1b\x1a\
-\x1a\xb0\x63\xc7\x0e\xb6\x0e\x6e\xcf\x9e\x3d\xd8\xb1\x63\x07\x3e\
-\xfa\xe8\x23\x46\xf0\xa4\x1a\x80\x7b\xf6\xec\xc1\x27\x9f\x7c\x02\
-\x8e\xe3\xf0\xd4\x53\x4f\xc1\xcd\xcd\x0d\x96\x96\x96\xd0\xd7\xd7\
-\xef\x7d\xe9\xa5\x97\x6c\x08\xff\x7f\x3b\xb9\x72\x5f\xe5\x49\xc2\
-\x3e\xc7\xdb\xaf\x34\xfd\x27\x59\x1b\xf7\x03\x65\x62\x3e\x18\x66\
-\x93\x17\xf9\x22\xf1\x0e\xbf\x25\x57\xc7\x42\x72\x5e\x26\x41\xe5\
-\x22\xf2\xef\xef\x88\x2b\xfb\x3d\xc7\x71\x7f\x9c\x39\x73\xe6\x3a\
-\x1d\x1d\x9d\x1c\x81\x40\x00\x99\x4c\x86\xb4\xb4\x34\xd4\xd7\xd7\
-\xdf\x75\xc7\xd3\xdc\xfe\x41\xfa\x02\x8f\xe3\x8d\x7f\x65\x50\x00\
-\xf0\x9f\xfe\xf6\xf6\x76\xb4\xb6\xb6\xc2\xcc\xcc\x0c\xab\x56\xad\
-\xc2\xde\xbd\x7b\x61\x6c\x6c\x0c\x6b\x6b\x6b\x68\x69\x69\x8d\x62\
-\xf8\x2e\x5c\xb8\x10\xdb\xb6\x6d\x83\xae\xae\x2e\xf8\x6b\x64\x6c\
-\x6d\x6d\x61\x66\x66\x86\xbf\xfd\xed\x6f\x41\x84\xfe\x4d\x07\x40\
-\xdf\x21\x7f\xc7\xbb\x98\xbf\x3f\xcb\xf2\xe8\x7b\x80\x60\x1a\x79\
-\x71\x33\x09\x18\xa8\x76\xfe\xb3\x04\xb1\xff\x41\xce\xec\x71\xce\
-\x1c\xde\x40\xc9\xd2\xd9\xb3\x67\xbf\x7f\xfa\xf4\xe9\x34\x2b\x2b\
-\x2b\x48\xa5\x52\x24\x27\x27\xa3\xa6\xa6\x06\x83\x83\x83\xe3\x1a\
-\x86\x7a\x01\x1a\x0c\x3e\xac\x17\x78\x10\x2f\xc1\x27\x99\x8c\x05\
-\x00\x7d\xfa\xf3\xf2\xf2\xf0\xea\xab\xaf\x62\xeb\xd6\xad\x8c\x1a\
-\x16\x14\x14\x74\x17\xc5\x7b\xfd\xfa\xf5\x38\x71\xe2\x04\xfe\xfd\
-\xef\x7f\xb3\x8f\x6d\xd8\xb0\x01\x16\x16\x16\x38\x79\xf2\x64\xf3\
-\xa4\x49\x93\x8e\x90\x7d\x04\x54\x00\xe2\xb5\x31\xb3\xff\x93\xf1\
-\xb8\x68\x7c\x4f\x70\x5f\xee\xc3\xae\x7a\xa5\x4b\x15\x9f\xe3\x38\
-\xee\xa5\x69\xd3\xa6\x2d\xd7\xd6\xd6\x96\x5b\x5a\x5a\x8e\xb8\xb8\
-\xb8\x20\x36\x36\x16\x25\x25\x25\xa3\x16\x2d\x8c\x7d\x7b\x12\x20\
-\xe0\x07\x8c\x94\xe0\xca\x37\x3e\x75\xff\xad\xad\xad\x38\x72\xe4\
-\x08\xd6\xac\x59\x83\x6f\xbf\xfd\x16\x36\x36\x36\x88\x8a\x8a\xba\
-\xcb\xf8\x4f\x3f\xfd\x34\x76\xed\xda\x05\x4b\x4b\xcb\x51\x1f\x3f\
-\x78\xf0\x20\x4c\x4d\x4d\xf1\xd9\x67\x9f\x45\xf2\x88\x9f\x7f\x26\
-\xc1\xf6\x4b\xbc\xd5\xba\x8f\x75\xaf\xf2\x4f\xb9\x40\xf9\x41\x40\
-\x40\x47\xcc\xa8\xfc\xcc\x8a\xcf\x3f\xff\x5c\xcf\xc4\xc4\x44\x63\
-\x6f\x6f\x8f\x80\x80\x00\xa4\xa7\xa7\xa3\xbe\xbe\xfe\x07\xdd\xf5\
-\xe3\x00\xc1\x78\xc6\xe7\x07\x7f\xfc\xbb\xbf\xba\xba\x1a\xcb\x96\
-\x2d\xc3\xa6\x4d\x9b\x18\x95\x6b\xbc\x09\x9f\x25\x4b\x96\x40\x5b\
-\x5b\x1b\x7a\x7a\x7a\xa3\xb4\x04\xc9\x12\x8c\x91\xb9\x73\xe7\x9a\
-\x11\xd7\xcf\x57\x02\xff\xcd\x8f\x59\x0e\xf9\xb3\x02\xe0\x11\xc1\
-\x42\xd5\x47\x16\x71\x1c\xb7\x62\xde\xbc\x79\x9f\x6a\x69\x69\xc5\
-\x5a\x5a\x5a\x0e\x89\xc5\x62\x28\x14\x0a\x5c\xbd\x7a\x15\x2d\x2d\
-\x2d\x0f\x14\xe0\xfd\x18\xe3\x0f\x0d\x0d\xdd\x15\xfc\xf1\x9f\x7e\
-\x4a\x6e\x0d\x0c\x0c\xc4\x9b\x6f\xbe\x89\x2f\xbf\xfc\x12\xba\xba\
-\xba\xf8\xe0\x83\x0f\xc6\x1d\x62\x5d\xb1\x62\xc5\xb8\x2a\xa2\x96\
-\x96\x96\x38\x76\xec\x58\x03\x91\x81\xfd\x8a\xb7\x0e\xe6\x37\xe4\
-\x3a\x9d\xc2\x3d\x81\x8d\xea\xbf\xd4\x95\xeb\xd3\x78\xba\x03\x0b\
-\x49\x85\xeb\xfd\x55\xab\x56\x1d\xd0\xd1\xd1\xc9\xb1\xb6\xb6\x86\
-\x9b\x9b\x1b\xa2\xa3\xa3\x51\x50\x50\x00\x8d\x46\xf3\xa3\x81\xd0\
-\xd2\xd2\x82\xda\xda\x5a\xf4\xf4\xf4\x8c\xca\x08\xc6\x33\xfe\xd8\
-\xc8\xbf\xa5\xa5\x05\x22\x91\x88\x4d\x27\x8f\xb7\x8d\x6c\xca\x94\
-\x29\xe3\xce\xfd\x4d\x9b\x36\x0d\x3a\x3a\x3a\x30\x37\x37\xc7\xae\
-\x5d\xbb\xb2\x88\xfc\xcb\x17\xbc\x7a\x3e\x15\x7d\x9a\xf4\xab\x00\
-\xc0\x3d\x04\x28\xe6\x92\x4c\x61\x05\xc7\x71\x7f\xfe\xf0\xc3\x0f\
-\x75\x4e\x9d\x3a\x55\x28\x14\x0a\x47\xdc\xdc\xdc\x10\x15\x15\x85\
-\xbc\xbc\xbc\x1f\xf4\x08\xf4\x5a\x18\x0b\x86\x88\x88\x08\xd6\x0c\
-\xf2\xf4\xf4\xc4\x85\x0b\x17\xa0\xd1\x68\xee\x9b\xf6\xd1\xbc\x9f\
-\x16\x7e\x42\x42\x42\xee\x39\xbe\xfe\xc2\x0b\x2f\xc0\xc5\xc5\x05\
-\xa1\xa1\xa1\x58\xb9\x72\x25\x1b\x89\x5f\xb8\x70\x21\x0c\x0d\x0d\
-\xe1\xe0\xe0\x00\x53\x53\x53\x6c\xde\xbc\x39\x82\xa4\x7e\x9f\x92\
-\x34\xfa\x3f\x1f\x77\xd0\xf7\x7f\x09\x00\x7c\x10\x3c\x3b\xa6\x27\
-\xb1\x92\xe3\xb8\x4f\x3e\xf8\xe0\x83\xe3\x27\x4f\x9e\xcc\xb6\xb2\
-\xb2\x1a\x71\x71\x71\x81\x42\xa1\xc0\x95\x2b\x57\xd0\xdc\xdc\xfc\
-\x83\xae\x9d\x7f\xba\xbb\xbb\xe1\xe6\xe6\x06\x7b\x7b\x7b\x28\x95\
-\x4a\x84\x84\x84\x40\x2a\x95\x22\x37\x37\xf7\xae\x39\x03\x7e\xda\
-\x47\xcb\xbe\x94\xfc\x61\x65\x65\x85\x77\xdf\x7d\x17\x4b\x96\x2c\
-\xc1\x3b\xef\xbc\x83\xaf\xbf\xfe\x1a\x76\x76\x76\xc8\xcd\xcd\x45\
-\x41\x41\x01\x9b\x4b\xc8\xca\xca\x42\x72\x72\x32\x12\x13\x13\xe1\
-\xef\xef\xcf\x06\x4a\xd6\xad\x5b\xe7\x41\x3a\x7b\xeb\x49\x2d\xe5\
-\xc5\x27\xe5\xfa\x7f\xd1\x00\x18\x07\x08\xd3\x78\x7a\x44\x14\x08\
-\xaf\x91\x02\xd3\x87\xef\xbc\xf3\xce\xb7\x47\x8e\x1c\x49\x12\x08\
-\x04\x83\x62\xb1\x98\xb5\x94\xc7\x63\x18\x8f\x4d\xeb\xe8\xe9\xe9\
-\xe9\x41\x44\x44\x04\xac\xad\xad\x71\xfe\xfc\x79\xa8\xd5\x6a\x26\
-\x22\x71\xe5\xca\x15\xc6\x4d\xe4\x1b\x9f\x0e\xb4\xd0\xb6\xef\xd8\
-\x51\x37\xda\xf5\xe3\xcf\x3f\xe6\xe6\xe6\xe2\xf2\xe5\xcb\xc8\xca\
-\xca\xc2\xc5\x8b\x17\xe1\xe7\xe7\x07\x3b\x3b\x3b\x18\x1b\x1b\x63\
-\xf9\xf2\xe5\xd6\xa4\xbb\xf7\x11\x8f\xe9\x3b\xf9\x57\x0b\x80\x71\
-\x04\x2a\x67\x92\x80\x68\x0e\x71\x8f\xbf\x27\x69\xd2\x2a\x8e\xe3\
-\xfe\xba\x6c\xd9\xb2\xbd\x87\x0e\x1d\x52\x5a\x59\x59\x0d\x38\x3b\
-\x3b\x23\x3c\x3c\x1c\x57\xaf\x5e\x1d\x37\x46\x18\x1e\x1e\x66\x25\
-\x5e\x7e\xe9\x37\x3f\x3f\x9f\x89\x4d\xa4\xa6\xa6\x22\x21\x21\x01\
-\xfe\xfe\xfe\xf0\xf5\xf5\x45\x62\x62\x22\x2a\x2a\x2a\xc6\x35\x3e\
-\xed\xf9\x57\x55\x55\xb1\x9e\x7f\x49\x49\x09\x33\x7e\x5e\x5e\x1e\
-\x33\x7e\x76\x76\x36\x32\x33\x33\xa1\x54\x2a\x21\x93\xc9\x60\x63\
-\x63\x03\x63\x63\x63\xcc\x9f\x3f\xff\x34\xd1\xfe\x59\xc7\xdb\x08\
-\x3a\xe9\x57\x0d\x80\x1f\xa8\x3e\xce\x26\x75\xf1\x25\x24\x3e\x58\
-\xcb\x71\xdc\xdf\x97\x2c\x59\xb2\xff\xf0\xe1\xc3\x6a\x81\x40\x30\
-\x2c\x91\x48\xee\x59\x43\xa0\x46\xa7\x13\x46\xb4\xc6\xdf\xda\xda\
-\x8a\xd0\xd0\x50\x08\x85\x42\x48\xa5\x52\xe4\xe5\xe5\xe1\xd2\xa5\
-\x4b\x08\x0b\x0b\x63\x9a\x42\x49\x49\x49\x28\x2a\x2a\x62\xac\x5f\
-\xda\xf2\xad\xa8\xa8\x60\x64\x97\xe2\xe2\xe2\xbb\x46\xd2\xb2\xb3\
-\xb3\x59\xcb\x39\x2e\x2e\x0e\xde\xde\xde\x10\x0a\x85\xb0\xb0\xb0\
-\x18\x99\x3a\x75\xea\xbf\x48\x5f\x64\x2d\xf1\x72\xb3\x27\x00\xf0\
-\xe0\xda\x44\x2f\x11\x20\x2c\x27\xbc\x85\x8f\xd6\xac\x59\x73\x58\
-\x5f\x5f\xbf\xc2\xd6\xd6\x16\x7e\x7e\x7e\x48\x4f\x4f\x47\x6d\x6d\
-\x2d\xfa\xfb\xfb\x99\x17\xa0\xc3\x26\xf4\xd0\xee\x63\x57\x57\x17\
-\x8a\x8b\x8b\x59\x6c\x70\xee\xdc\x39\x14\x17\x17\xa3\xac\xac\x8c\
-\xb1\x82\x29\x83\x28\x3c\x3c\x9c\x8d\xa7\xd3\xcf\x19\xcf\xf5\x67\
-\x67\x67\x23\x3d\x3d\x1d\x6a\xb5\x1a\xb1\xb1\xb1\x90\xcb\xe5\xf0\
-\xf4\xf4\x84\xbb\xbb\x3b\xfc\xfc\xfc\x46\x48\xbf\x7f\x2b\x69\xb9\
-\xd3\xa5\xd0\x13\x00\x78\x80\x6e\x25\xbd\x1e\x9e\x21\x4f\xcd\x02\
-\x12\x44\xbd\x3b\x65\xca\x94\xbf\x1e\x3c\x78\x30\xc8\xca\xca\x6a\
-\x44\x22\x91\x40\xa9\x54\xa2\xac\xac\x0c\x1d\x1d\x1d\xa3\x52\x3b\
-\x6a\x74\x1a\xe8\xf1\x5b\xbc\x19\x19\x19\x10\x8b\xc5\x10\x89\x44\
-\xf0\xf5\xf5\x45\x72\x72\x32\x1a\x1b\x1b\x51\x59\x59\x89\x8c\x8c\
-\x0c\xc4\xc4\xc4\x30\x6e\x1f\x5f\x79\x2c\x34\x34\x14\xa1\xa1\xa1\
-\x08\x0e\x0e\x86\x5c\x2e\x87\x8f\x8f\x0f\xa4\x52\x29\x7c\x7c\x7c\
-\x10\x12\x12\x82\x8b\x17\x2f\xa2\xa8\xa8\x08\x59\x59\x59\x30\x30\
-\x30\xc0\xcc\x99\x33\x0f\x90\xae\xe9\x4a\x92\xfe\x4e\x00\xe0\x21\
-\x40\x30\x95\x27\x61\x3b\x9b\x74\x27\x5f\x21\x2d\xea\x35\x5b\xb7\
-\x6e\xb5\xb2\xb0\xb0\x18\x12\x8b\xc5\x88\x8d\x8d\x45\x51\x51\x11\
-\x9a\x9b\x9b\x59\x60\xd7\xd9\xd9\xc9\x0c\x3f\x76\x82\xb9\xb5\xb5\
-\x15\x8d\x8d\x8d\xc8\xc8\xc8\x80\x54\x2a\x85\x8d\x8d\x0d\x5c\x5c\
-\x5c\x10\x1c\x1c\x0c\xb5\x5a\xcd\xe8\x6b\x35\x35\x35\x28\x28\x28\
-\x60\x4f\x39\xd5\x12\x4e\x4b\x4b\xc3\xd5\xab\x57\x71\xfd\xfa\x75\
-\x36\x98\xa2\xd1\x68\x50\x5e\x5e\x8e\x90\x90\x10\x48\x24\x12\x18\
-\x1a\x1a\x62\xd1\xa2\x45\xc7\x79\xad\xdf\x05\xc4\xbb\x4d\x00\xe0\
-\x11\xb5\x8c\x69\xb0\x48\x81\xf0\xd6\xf6\xed\xdb\xad\x04\x02\xc1\
-\x88\x44\x22\x41\x4c\x4c\x0c\x8a\x8a\x8a\xd0\xd0\xd0\xc0\x88\x1e\
-\xfc\x89\x65\x6a\x78\x1a\xec\x51\x79\x99\xba\xba\x3a\x14\x16\x16\
-\x22\x22\x22\x82\x31\x77\x1c\x1c\x1c\x98\x1a\x99\xbf\xbf\x3f\x02\
-\x03\x03\x11\x12\x12\xc2\xce\xf9\xf3\xe7\xe1\xef\xef\x0f\x99\x4c\
-\xc6\x14\x4a\x44\x22\x11\x04\x02\x01\x5b\x1a\x79\xe6\xcc\x99\xbe\
-\x25\x4b\x96\x1c\x27\x9b\xc0\x68\xf7\x6f\x02\x00\x3f\xb2\x7e\xf0\
-\x14\xaf\x86\xb0\x90\xe3\xb8\x3f\x1e\x3f\x7e\x3c\xd2\xd6\xd6\x16\
-\x52\xa9\x14\x09\x09\x09\xb8\x76\xed\x1a\xea\xeb\xeb\x19\xff\x70\
-\xac\xe1\x9b\x9a\x9a\x58\xf0\xd8\xd4\xd4\xc4\xc6\xdd\x68\xba\x57\
-\x58\x58\x88\xc4\xc4\x44\x16\x20\xba\xbb\xbb\xe3\xec\xd9\xb3\xb0\
-\xb7\xb7\x87\x9d\x9d\x1d\x04\x02\x01\x84\x42\x21\x6c\x6c\x6c\x60\
-\x67\x67\xc7\xd8\xcf\x9e\x9e\x9e\x70\x73\x73\x63\x4c\xe0\xbd\x7b\
-\xf7\xa6\x93\xde\xff\x06\xc2\xb4\x9a\x4f\x5e\xfb\x04\x00\x1e\xc3\
-\xf5\x40\x77\x1d\x2d\x7c\xf9\xe5\x97\x57\x9b\x9b\x9b\x6b\x44\x22\
-\x11\x02\x02\x02\x90\x92\x92\x82\xb2\xb2\x32\xd4\xd6\xd6\x32\x72\
-\x27\x35\x3c\x75\xd7\xf4\xad\xa4\xa4\x04\x95\x95\x95\x77\xe5\xfa\
-\x7c\x92\xe7\xd8\x7c\x3f\x33\x33\x93\x69\x1e\xd1\x61\x93\x94\x94\
-\x14\xa8\x54\x2a\x04\x05\x05\xc1\xc9\xc9\x09\xa6\xa6\xa6\xd8\xb6\
-\x6d\x5b\x1c\xd9\x06\xba\x9e\x70\x2f\xe7\x91\xd7\x3c\x01\x80\xc7\
-\xe0\x11\x68\xda\xf8\x3c\xc7\x71\x2f\x1f\x3e\x7c\xd8\xc6\xce\xce\
-\x0e\xae\xae\xae\x50\x28\x14\xc8\xc9\xc9\x61\x23\x62\x54\xae\xa6\
-\xbd\xbd\x7d\x14\xb9\xa4\xb9\xb9\x19\x39\x39\x39\x4c\x2d\x9c\x6f\
-\x7c\x9a\xee\xdd\xcb\xf8\xfc\x49\xa3\xa4\xa4\x24\xa8\xd5\x6a\x28\
-\x95\x4a\xc8\xe5\x72\x38\x3a\x3a\xc2\xc4\xc4\x04\x9f\x7e\xfa\x69\
-\x00\xa1\xc7\x7d\xcc\x13\x7e\x78\xfa\x49\x1a\xff\xff\x3d\x00\xee\
-\xb1\xf5\xec\xd9\x25\x4b\x96\xbc\x2e\x10\x08\xba\xe9\x4c\x7f\x62\
-\x62\x22\x8a\x8a\x8a\x50\x59\x59\x89\x5b\xb7\x6e\x8d\xaa\x17\x0c\
-\x0c\x0c\x40\xa3\xd1\x30\xc3\x15\x14\x14\xb0\x21\x17\x3a\xda\x76\
-\xaf\x4a\xdf\x78\xc6\x57\xa9\x54\x6c\xb6\xcf\xcf\xcf\x0f\xf6\xf6\
-\xf6\x30\x32\x32\xc2\x9a\x35\x6b\xce\x72\x1c\xf7\x5f\x84\x03\xf0\
-\x06\x4f\xf9\x73\x02\x00\x8f\xd9\x13\xcc\xe4\x38\x6e\x9e\xb1\xb1\
-\x71\x38\x95\x92\x8d\x88\x88\x40\x76\x76\x36\x4a\x4b\x4b\xd1\xdb\
-\xdb\xcb\xfa\x05\x54\x53\x30\x3b\x3b\x1b\xde\xde\xde\x88\x8a\x8a\
-\x62\x03\x21\xd4\xf0\x85\x85\x85\xc8\xcf\xcf\x1f\x95\xeb\xdf\xcf\
-\xf8\x2a\x95\x0a\x89\x89\x89\x88\x89\x89\x81\xb7\xb7\x37\x6c\x6c\
-\x6c\x60\x64\x64\x84\xc5\x8b\x17\x1b\x90\x14\x70\x0d\xaf\x0d\x3c\
-\x6b\x02\x00\x8f\x59\xc5\x8c\xc4\x04\x73\x8e\x1c\x39\x72\x50\x24\
-\x12\xe1\xec\xd9\xb3\x90\xcb\xe5\x48\x49\x49\x41\x55\x55\x15\x1b\
-\x1e\x69\x69\x69\x41\x49\x49\x09\x93\x82\x75\x72\x72\x62\x3d\x02\
-\x3a\x20\x42\x4b\xbc\xf7\x33\x7e\x72\x72\x32\x33\x7e\x42\x42\x02\
-\x4b\x0d\xe9\x58\xb7\x95\x95\x15\xf4\xf5\xf5\x07\x26\x4d\x9a\xf4\
-\x2f\x42\x01\x5b\x49\x0a\x5a\x73\x48\x10\x3b\x01\x80\x27\x70\x15\
-\x3c\xbb\x76\xed\xda\xd7\xed\xed\xed\x47\x1c\x1d\x1d\xe1\xe3\xe3\
-\x83\x8b\x17\x2f\xb2\x54\xb0\xa6\xa6\x06\xd9\xd9\xd9\x50\x28\x14\
-\x70\x71\x71\x81\xb5\xb5\x35\x44\x22\x11\xa4\x52\x29\xa2\xa3\xa3\
-\x91\x96\x96\x86\xdc\xdc\xdc\x71\x8d\xcf\x9f\x2e\x1e\x6b\x7c\xa5\
-\x52\xc9\xfe\x0d\x09\x09\x61\x0a\x21\xc7\x8e\x1d\xbb\x49\x68\x60\
-\x9f\x12\x1e\xc0\x22\x9e\xc8\xc3\x04\x00\x9e\xc0\x55\x30\x8b\xe3\
-\xb8\x17\x84\x42\x61\xad\xa3\xa3\x23\xa4\x52\x29\x54\x2a\x15\x1a\
-\x1a\x1a\x50\x5c\x5c\x0c\x95\x4a\x85\x73\xe7\xce\x51\xf5\x8e\xdb\
-\x47\x8f\x1e\x2d\xb3\xb3\xb3\x83\xb3\xb3\x33\xce\x9f\x3f\x0f\x95\
-\x4a\x85\xcc\xcc\x4c\x64\x67\x67\xb3\xfa\x7e\x66\x66\xe6\x0f\x1a\
-\x9f\xce\x4a\xc6\xc5\xc5\xb1\x00\xd0\xd4\xd4\x14\xff\xfc\xe7\x3f\
-\x2f\x71\x1c\xb7\x8f\xe3\xb8\xbf\x93\xc2\xd5\x42\x92\x02\xce\x98\
-\x00\xc0\x93\x01\xc1\x4c\x8e\xe3\x66\x5b\x5a\x5a\xaa\x1d\x1d\x1d\
-\xe1\xe1\xe1\xc1\xb4\x03\x23\x23\x23\x21\x91\x48\x28\x9d\x3b\x7f\
-\xf6\xec\xd9\x06\xaf\xbe\xfa\xaa\xb5\x50\x28\x1c\x11\x89\x44\xf0\
-\xf2\xf2\x42\x54\x54\x14\x52\x52\x52\x90\x91\x91\x81\xac\xac\x2c\
-\x64\x66\x66\x22\x2d\x2d\x8d\xa5\x7a\xf7\x32\x3e\x15\xae\x8e\x8a\
-\x8a\x82\x4c\x26\x83\xad\xad\x2d\x8c\x8c\x8c\xb0\x7e\xfd\x7a\x5f\
-\x32\xfd\xf3\x31\x29\x61\xcf\xa3\xaa\x5f\x4f\xfc\xef\xf1\x2b\x05\
-\xc0\x0c\x8e\xe3\x9e\x35\x37\x37\x3f\x47\x01\x40\x9f\x7a\xc2\xce\
-\xe9\xdb\xb8\x71\x63\x10\xc7\x71\xc7\x08\x43\xe7\x5f\x7a\x7a\x7a\
-\x95\x74\x2c\x3e\x30\x30\x10\x09\x09\x09\x48\x49\x49\x61\x4f\x3d\
-\x3f\xcf\x4f\x4c\x4c\x84\x4a\xa5\x82\x52\xa9\x44\x7c\x7c\x3c\xe2\
-\xe2\xe2\x98\xb0\x75\x7c\x7c\x3c\x42\x43\x43\xd9\x10\x88\x91\x91\
-\xd1\xc8\xfc\xf9\xf3\xf5\x79\x6d\xe0\x45\x64\xea\xe7\xbe\x53\xbd\
-\x13\x00\xf8\x71\x20\x98\xce\x71\xdc\xd3\xa6\xa6\xa6\x8e\x8e\x8e\
-\x8e\x90\xcb\xe5\x70\x77\x77\x87\xb5\xb5\x35\x4e\x9e\x3c\x59\xbd\
-\x78\xf1\x62\x3a\x7e\xbd\x93\xd0\xb3\x3f\xdf\xb9\x73\xa7\xb3\x8d\
-\x8d\x0d\x9b\x60\x8e\x8a\x8a\x42\x62\x62\x22\x80\x4c\xab\xad\x00\
-\x00\x05\x87\x49\x44\x41\x54\x92\x93\x93\x91\x9a\x9a\x8a\xe4\xe4\
-\xe4\x7b\x1a\x3f\x26\x26\x06\x51\x51\x51\xec\x7d\x7f\x7f\x7f\x26\
-\x0b\x73\xe4\xc8\x91\x7a\xf2\xb3\xbe\x21\x5d\xc0\xdf\x92\xfb\xff\
-\x81\x17\x3f\x4d\x00\xe0\xe1\x01\x30\x8d\xe3\xb8\xa7\x4c\x4c\x4c\
-\x2c\x1d\x1d\x1d\xe1\xe8\xe8\x08\x0b\x0b\x8b\xa1\x9d\x3b\x77\x46\
-\x4e\x9e\x3c\xf9\x38\x09\xc8\xfe\x9b\x94\x65\xdf\xe7\x38\x6e\xe5\
-\xef\x7e\xf7\xbb\x0f\xad\xac\xac\xfa\xe9\x04\x73\x70\x70\x30\xe2\
-\xe3\xe3\xa1\x52\xa9\xa0\x56\xab\x99\x9c\x0c\x95\xbc\x1f\x6b\x7c\
-\x0a\x00\x85\x42\x01\xa9\x54\x4a\x47\xc0\xf1\xc5\x17\x5f\x5c\x20\
-\x34\xb0\x2f\x49\x0f\xe0\x89\xb2\x80\x27\x00\xf0\xbf\x00\x98\xca\
-\x71\xdc\x4c\x33\x33\x33\x33\x7b\x7b\x7b\x98\x98\x98\xd4\xad\x5b\
-\xb7\x4e\x97\xec\xe1\xd9\x43\x0a\x32\xeb\x49\x4a\xf6\x2a\x19\x8d\
-\x5f\x62\x60\x60\x90\x48\x25\xe3\xa9\x28\x24\x15\x8d\xe0\x1b\xff\
-\xc2\x85\x0b\xa3\x8c\x1f\x19\x19\xc9\xde\x97\xcb\xe5\x10\x8b\xc5\
-\x30\x37\x37\x87\x81\x81\xc1\xf0\xfc\xf9\xf3\x4d\xc8\xfd\xbf\x89\
-\x04\x80\x2c\xfa\x9f\x00\xc0\x93\x03\xc0\x14\x8e\xe3\x66\x98\x9b\
-\x9b\x5b\x5b\x5b\x5b\x9f\x5f\xb0\x60\xc1\x6a\x32\xda\xbe\x89\x14\
-\x63\xfe\x42\x9e\x46\xba\x8c\xe1\x05\x8e\xe3\x7e\xa3\xa5\xa5\xa5\
-\x4d\xc5\x2f\x3c\x3c\x3c\x10\x12\x12\x82\xd8\xd8\x58\xc4\xc7\xc7\
-\x23\x21\x21\x01\xf1\xf1\xf1\xcc\xf8\xd1\xd1\xd1\x88\x8a\x8a\x62\
-\xba\x43\xd1\xd1\xd1\x08\x0d\x0d\x65\xed\x64\x23\x23\x23\x1c\x38\
-\x70\x20\x9f\x08\x3f\x7c\x43\x66\xfe\x5f\xa3\xca\xdf\x3f\xd9\xdf\
-\xe2\x57\x0c\x80\xe9\xdb\xb7\x6f\x7f\x85\x18\x78\x09\x21\x98\xfe\
-\x89\xf0\x0b\xdf\xe4\x2d\x62\x7a\x86\xce\x38\xbe\xf1\xc6\x1b\xaf\
-\x58\x59\x59\xf5\xd9\xda\xda\x32\x51\xe8\x88\x88\x08\xc4\xc4\xc4\
-\x30\xc3\xc7\xc6\xc6\x8e\x32\xbe\x42\xa1\x40\x54\x54\x14\xc2\xc3\
-\xc3\xe1\xe7\xe7\x47\xd5\x3d\x61\x68\x68\x38\xb2\x7c\xf9\x72\x1b\
-\xe2\x71\x3e\x23\x57\xcd\xe2\x1f\xd2\xf4\x99\x00\xc0\xe3\xab\x08\
-\xd2\xe1\x13\x4a\x1e\x59\xcc\x9b\x58\x1e\xbb\x81\x8b\x8e\xc4\xcf\
-\x31\x33\x33\x4b\xa4\x12\x71\x32\x99\x8c\x2d\xa4\xa2\xc6\xa7\xf7\
-\x3d\x55\x55\xa3\x8a\x63\xfe\xfe\xfe\x90\x48\x24\x10\x08\x04\x30\
-\x32\x32\xc2\xbe\x7d\xfb\xf2\xc8\xec\xff\xd7\xc4\xe3\xbc\x45\x48\
-\x20\x33\x7e\x8a\xe8\xff\xd7\x0e\x80\x49\xbc\x36\x31\x05\xc1\x5c\
-\x9e\xbb\x7f\x76\xcc\xdc\x3d\x65\x1c\x3d\x73\xe6\xcc\x19\x3d\xba\
-\x72\xd6\xc3\xc3\x03\x81\x81\x81\xec\x29\xa7\xf7\xbd\x42\xa1\x40\
-\x78\x78\x38\x03\x81\x5c\x2e\x87\x87\x87\x07\xec\xec\xec\x60\x62\
-\x62\x02\x5d\x5d\xdd\x3b\xf3\xe7\xcf\xa7\x33\x80\x1b\x08\x03\xe8\
-\xf7\x24\x00\xfc\x49\xa2\xff\x09\x00\xdc\xcd\x27\x9c\x45\xdc\x2f\
-\xd5\xd8\x65\x41\x18\xef\xf3\x67\x1e\x3a\x74\xe8\x7d\xa1\x50\x08\
-\x7b\x7b\x7b\xb8\xba\xba\x32\xee\x5f\x78\x78\x38\x73\xf9\x54\x57\
-\x31\x2c\x2c\x8c\x19\x5f\x24\x12\xc1\xcc\xcc\x0c\x86\x86\x86\xf8\
-\xf8\xe3\x8f\xe5\x64\x04\x6c\x2b\x69\xfe\xbc\xc6\xbb\x6e\xa6\x3c\
-\xc9\x49\xa0\x09\x00\xdc\x9b\x4f\x38\x6d\xac\xbe\xce\x38\x9f\x3f\
-\x7d\xd6\xac\x59\xcf\x0a\x04\x82\x5e\x3b\x3b\x3b\xb8\xb8\xb8\x30\
-\xa1\x49\x0a\x82\xb0\xb0\x30\xb6\x75\x8c\x2e\xa9\xa2\xac\x1f\x43\
-\x43\x43\xec\xd8\xb1\x23\x9d\x04\x7e\x7b\x49\xe9\xf7\x8f\x84\x01\
-\xfc\x1c\x01\xdf\xe4\x9f\x22\xfa\xff\xd5\x03\xe0\x47\xd4\x0f\x66\
-\x09\x04\x82\x1a\x7e\x26\xa0\x50\x28\x18\x08\xe8\x66\x54\x1f\x1f\
-\x1f\xb8\xb9\xb9\x41\x24\x12\xc1\xc2\xc2\x02\x86\x86\x86\x38\x70\
-\xe0\x40\xd1\xa4\x49\x93\x4e\x90\xba\xff\x56\xc2\xff\xa7\x81\x28\
-\x1b\xff\xfe\x49\x7f\xa7\x09\xc3\x3e\x74\xfd\xe0\x29\x3b\x3b\xbb\
-\x76\x57\x57\x57\x84\x86\x86\xe2\xe2\xc5\x8b\x88\x8d\x8d\x65\x4b\
-\x2f\xcf\x9d\x3b\x07\x2f\x2f\x2f\x26\x23\x4f\x9f\xfc\xbd\x7b\xf7\
-\xe6\x4f\x9d\x3a\xf5\xd8\x18\xf1\x87\x37\x49\x00\xfa\xdc\xa3\xac\
-\x7c\x9b\x00\xc0\xcf\x00\x80\x33\x67\xce\xbc\xfd\xfd\xf7\xdf\x23\
-\x38\x38\x98\x89\x47\xd2\xf5\xaf\x32\x99\x0c\xee\xee\xee\x6c\x69\
-\x35\x91\x75\x1d\xf9\xea\xab\xaf\x12\xc9\xd2\xe7\x83\x24\xe7\xff\
-\x88\xb7\xf2\x8d\x75\xfd\x7e\xea\xa7\x7f\x02\x00\x8f\x70\x05\x38\
-\x38\x38\x38\x49\xa5\x52\xe4\xe4\xe4\xe0\xd6\xad\x5b\x50\xa9\x54\
-\x6c\xdf\xb1\xb3\xb3\x33\xec\xed\xed\x69\x93\x07\x3a\x3a\x3a\x3d\
-\x6b\xd7\xae\x95\x91\x6d\x9f\xbb\xc9\xdc\xff\x47\x63\xf6\xfd\xce\
-\xfc\x39\x5c\xff\x04\x00\x1e\x21\x68\x34\x36\x36\x5e\x2c\x16\x8b\
-\x7b\x12\x13\x13\xd1\xdd\xdd\x8d\x9c\x9c\x1c\xb8\xb9\xb9\x31\xc3\
-\x5b\x59\x59\xc1\xd8\xd8\x18\x06\x06\x06\xd8\xbf\x7f\x7f\xd1\xdc\
-\xb9\x73\x4d\x39\x8e\xd3\x26\x9d\xbe\x4f\x49\xc4\x4f\x75\x7c\x9f\
-\x23\x59\xc7\x94\x9f\xc3\xf5\x4f\x00\xe0\xe1\x0b\x47\x53\x9d\x9d\
-\x9d\x2f\x84\x84\x84\xa0\xb3\xb3\x13\x71\x71\x71\x70\x70\x70\x80\
-\x8d\x8d\x0d\x2c\x2d\x2d\x61\x6c\x6c\x0c\x7d\x7d\x7d\x1c\x3e\x7c\
-\xb8\x76\xe5\xca\x95\x2e\x24\xd2\xdf\xc7\x6b\x2a\xad\x22\x6e\x9f\
-\xff\xe4\x4f\xfb\xa9\xa3\xfe\x09\x00\x3c\xe2\xdd\x7f\xf6\xec\xd9\
-\xd3\xbe\xbe\xbe\xc8\xcf\xcf\x87\x40\x20\x80\xb9\xb9\x39\x7b\xda\
-\xf5\xf4\xf4\x86\x0f\x1e\x3c\x58\xb2\x6a\xd5\x2a\x09\x31\xfc\x01\
-\x52\xe4\xf9\x07\xe9\x31\xfc\x89\x34\x94\xe8\xb0\xc7\xcc\x9f\xdb\
-\xf0\x13\x00\x78\x88\x23\x12\x89\xfe\xcb\xd5\xd5\x75\x48\x2c\x16\
-\x43\x5f\x5f\x1f\x7a\x7a\x7a\xd0\xd1\xd1\xe9\xfd\xf6\xdb\x6f\x0b\
-\x36\x6d\xda\x14\x3c\x6f\xde\xbc\x33\xa4\xac\x4b\xa5\xdb\x37\x93\
-\xe6\xce\x2a\xc2\xf1\x5f\x4c\x52\xbd\xe7\x9e\x94\xda\xd7\x04\x00\
-\x9e\xd0\xb1\xb6\xb6\x9e\xe9\xec\xec\x6c\x98\x9b\x9b\x6b\x79\xe0\
-\xc0\x01\xa3\x2d\x5b\xb6\x9c\x78\xeb\xad\xb7\xf6\x11\xb2\xc8\x3e\
-\x12\xe0\xed\x23\xf7\xfc\x17\xc4\xf0\x2b\x79\xba\xbe\x73\x78\x42\
-\x4f\x53\x7f\x29\x4f\xfe\x04\x00\x1e\x9e\x42\xf6\x1c\xb9\xbf\xd9\
-\xde\x04\xc2\x19\xd8\x48\x8c\xfe\x67\xf2\xf1\x3f\x90\xee\xe2\x02\
-\x1e\xb7\x7f\x3a\x0d\xf6\x7e\x49\xc6\x9f\x00\xc0\x83\x03\x80\x4e\
-\x1b\x53\x7d\xa2\x25\x04\x08\xf4\x2c\x23\xcd\x9c\x97\x88\x74\xcd\
-\xf3\xbc\xbb\x7e\xca\x2f\xcd\xe8\x13\x00\x78\xb4\x0a\xe0\x0c\x9e\
-\x1a\xc9\x7f\x92\x80\x6e\x1e\x79\xff\x05\x62\xf4\xff\x20\xee\xfe\
-\xa9\x5f\xda\x5d\x3f\x01\x80\xc7\x90\x06\xf2\x44\xaa\x66\xf1\x8c\
-\x3c\x8d\xef\xde\x1f\x97\x8a\xf7\x04\x00\x7e\xb9\xba\x44\xd3\xc7\
-\xe9\x1c\x4e\xfe\xbf\x66\x78\x7a\xfe\x07\x3d\x1c\x44\xca\x08\x38\
-\xeb\x4d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0b\x67\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x0b\x2e\x49\x44\x41\x54\x78\xda\xd5\x59\x79\x74\x54\xd5\
-\x19\xff\xbd\x37\x6f\xf6\x25\x93\xcc\x0c\x61\x92\x0c\x24\x21\x6c\
-\x26\x04\x22\xa2\x05\x04\x4b\x37\x11\xb5\x80\x4a\xc1\x2a\x69\x69\
-\xfb\x87\x6d\x8f\xc7\x1e\x97\x63\xf1\xd8\x56\xdb\x73\x2c\x9e\xba\
-\x14\x85\x4a\xd5\x7a\x8e\x2d\x2a\x84\x25\x68\x17\x6d\x59\x04\x01\
-\xa1\x62\xb5\x07\xc8\x36\xd9\x26\x1b\x49\x86\x4c\x26\x99\xc9\x64\
-\x96\xcc\x9b\xe9\x77\xe7\xcd\x24\x33\x49\x64\x4b\x28\xf1\x9e\xb9\
-\xe7\x2d\xf7\xce\x9b\xdf\xef\xbb\xdf\xf7\xfb\xbe\xfb\x86\xc3\x38\
-\xb4\x99\xab\x76\xe6\x41\xc6\xe7\x46\xc5\x30\xcf\x21\xc2\xd5\xec\
-\xbb\xef\x30\xdd\x16\xa9\x47\xc7\xe3\xf9\x17\x6a\xdc\xe5\x7e\x61\
-\xd6\x5d\xbb\x8d\x88\x46\x56\x13\xb2\x65\x1c\xc7\xdf\x02\x8e\x9f\
-\xa2\xd7\xa9\x52\x1e\xe9\x0f\x0c\x40\x8c\x44\x10\x8d\x86\x8f\x47\
-\x23\xe2\xe9\x88\x18\xfc\xa8\xf6\xdd\xd2\xbd\x34\x18\xa6\x1e\xb9\
-\x26\x04\x66\xac\x7c\x27\x8f\xe7\x65\x4f\x09\x82\x50\x9a\x91\xae\
-\x83\xc9\x94\x0e\xad\x46\x0d\xa5\x52\x85\x28\x27\x90\xa9\xc9\xf6\
-\x11\x8e\x40\x13\xca\x70\x88\xce\xa3\xf0\xf4\xf9\xd0\xdf\xdf\x8f\
-\x3e\x1f\x1d\x7d\x7e\x4f\x24\x12\xfc\x47\xc0\xdd\xf0\x1b\xc7\xc1\
-\xc7\xed\x18\xc3\x0a\x15\x7e\xf7\x7d\x63\xc5\xdb\xb7\xf5\xb2\xef\
-\x5f\x94\xc0\xcc\xd5\xbb\x8c\x34\x6f\xb3\x4a\xa9\x28\x9d\x6a\xb3\
-\xc0\x62\x36\x81\x13\xd4\xe8\xf1\x86\xe0\xed\x0f\x23\x34\x10\x41\
-\x9f\x5f\x4c\x32\x09\x07\xb9\xc0\x43\x90\x71\x50\x29\x05\x28\xe4\
-\x42\xec\x3a\x14\x0c\xa0\xa7\xa7\x1b\x1e\x8f\x07\x03\x41\x4f\x99\
-\xbf\xbb\xfe\xd7\x4d\x87\x36\xd6\x5c\x2e\x91\xc2\xfb\x3e\x60\x78\
-\x0e\x57\xbc\x75\xdb\x42\xb6\xa2\x17\x24\x30\x63\xe5\x8e\x12\x8e\
-\xe7\xcb\x73\x73\xcc\x53\x6d\xb6\x6c\x44\x79\x25\xda\x9c\x7e\xb8\
-\x7a\x43\x49\x6b\xc7\x25\x1d\xb8\x94\x5b\x89\x23\xcf\xf3\xd0\x28\
-\xe5\x44\x48\x8e\x88\x28\xc2\xd3\xeb\x82\xd7\xd3\x8d\x70\xd0\xf3\
-\x5a\x6f\xd3\xd1\xa7\xdb\x4f\x6d\xe9\x88\x13\xb9\x30\xf8\xfb\xff\
-\x49\xe0\x23\x87\xe9\xc1\x73\x2b\xb6\x2f\x9f\x4a\xb7\xdc\x5f\x48\
-\x80\x02\x73\x83\x20\x17\xde\x28\x9a\x65\x43\x5a\xba\x05\xe7\xba\
-\x82\xe8\x74\x05\x53\x01\x0e\x02\x1e\x1d\x38\xc7\x4e\xa4\xcf\xa0\
-\x89\x95\x0a\x39\x14\x82\x02\xe1\x81\x10\x3c\x3d\x4e\x04\x03\xbd\
-\x6d\xfd\xce\xb3\xeb\x1d\x07\x7f\xfe\x31\x0d\x87\xbe\x68\x35\x8a\
-\xd6\xff\xcb\x18\x8d\x46\x0e\xeb\x75\xda\xb9\x03\x03\x61\xfc\xe7\
-\x4f\xcb\xe6\xd3\x6d\xc7\xa8\x04\x18\x78\x9d\x56\xf5\xc6\xec\x99\
-\x53\x20\xa8\x8c\x68\x3c\x47\x3e\xcc\xdc\xe4\x92\xad\xce\x0d\x72\
-\x42\xd2\x57\xb8\xf8\x24\x8e\x06\x05\x41\x0e\x19\x27\x87\xdf\xe7\
-\xa2\xf8\x70\x21\xd0\xdb\xfc\x48\xdd\x7b\x3f\xda\x46\xc3\x01\x0c\
-\x0b\x74\x06\x9e\xb9\x8d\x4e\xab\x9d\x9b\x9d\x93\x83\x26\x87\x03\
-\x9f\xbe\xfe\xd5\x45\x34\x64\x1f\x41\x60\xc6\xaa\x1d\xcb\xe4\x72\
-\xf9\xa1\x05\x25\xd3\x01\x41\x8f\x6a\x87\x17\xa2\x18\x1d\x32\x23\
-\xf7\x05\xe0\x87\x59\x7d\x34\xe0\x29\xe4\xa8\xf3\x9c\x0c\x4a\xb9\
-\x0a\xe2\x80\x0f\xbd\xee\x0e\x04\x3c\xe7\x5e\xaa\xd9\x7b\xff\x93\
-\x34\xea\x4b\x90\x28\x2a\xdd\x3f\x04\x3e\x3b\x07\xbc\x20\x83\xa3\
-\xa1\x1e\xa7\x5e\xbd\x65\x31\x0d\xd7\xa4\x10\x88\x07\xac\xe3\x86\
-\x79\x05\x69\x72\x75\x7a\x2a\xf8\x61\x2e\xc3\x02\x53\xad\x92\x51\
-\xb0\xf2\x92\x45\xe9\x18\xa4\x80\x66\xea\x13\x18\x10\x31\x10\x16\
-\x63\xf7\x47\x03\x9e\xec\x54\x6c\x8e\x46\xa5\x06\x27\x0e\xa0\xeb\
-\x7c\x2b\x02\xbe\xae\xf2\xea\xb2\x35\x3f\xa0\x21\x6f\x51\xe9\x01\
-\xfd\x90\xe5\xb3\xd1\x4b\xa2\x61\x4a\x53\xa1\xa1\x8e\x11\x58\x3a\
-\x1a\x81\xb2\x7d\x14\xb0\x2b\xa7\xe6\xe5\xa1\xb2\xb1\x0f\xc1\x50\
-\x64\x04\x78\xa3\x5e\x81\x74\xbd\x92\x08\x80\xf4\x3e\x80\x60\x70\
-\x20\x26\x95\x22\x01\x57\xa9\x35\x90\x91\x7f\x0b\x82\x12\xe1\x28\
-\x8f\xfe\x60\x88\x48\xc5\x45\x66\x84\x4b\x0d\x3a\x54\xec\xa3\x51\
-\x2a\x21\x70\x22\x9c\x1d\xad\xe8\x73\xd5\xff\xd6\xd3\x7a\x72\x9b\
-\xa5\x68\xed\x7b\x3a\xad\x26\xe6\x36\x0c\x7c\x3f\xe5\x97\xa9\x93\
-\x75\xa8\xaf\x6d\xc0\x27\x7f\x5c\x92\x4a\x60\xc6\xea\x9d\xcb\xd4\
-\x4a\xe5\xa1\x85\x37\x16\xa1\xb5\x2b\x2c\x05\x6c\x12\x78\xad\x5a\
-\x40\x96\x45\x83\x48\x38\x88\xf3\x5d\x2e\xb8\x7b\x3c\x04\xbc\xcf\
-\x19\x09\x07\x3a\x07\x7c\x9d\xa7\x29\xa1\x45\xe4\x1a\x73\xbe\x4c\
-\xa1\x2b\x90\x2b\xb5\x99\x1a\x8d\x0e\x5a\x83\x19\x9c\x4c\x09\x7f\
-\x28\x48\x04\xc3\x83\x60\x93\x81\x27\xbb\xa2\x5e\xcd\x48\x84\xd1\
-\xd1\xde\xc6\x64\xb7\x4d\xaf\x37\x64\x67\x91\xe5\x3d\xfe\x30\x7c\
-\x64\x28\xd6\xf2\x26\xeb\x51\x67\x6f\xc0\xbf\xb7\xdd\x9c\x4a\x60\
-\xd6\xea\xb2\x23\xc5\x85\xb9\x4b\x15\x1a\x33\x6a\x9a\xbc\x29\x3e\
-\xcf\xac\x9e\x65\x56\xe3\xfc\xf9\x4e\x34\xb7\x39\x29\xe0\x5a\x0f\
-\xb8\x1b\xf7\xef\x71\x55\xed\xa9\xa0\x19\xc1\x78\x4f\x28\x88\x22\
-\x63\xfa\x1d\xb9\xe6\xc2\x35\x0f\x28\xf4\xd6\xdb\x34\x1a\x23\xd4\
-\x7a\x73\xcc\xa1\xc3\x62\x68\x58\xcc\x24\x13\x92\x2e\x33\xf4\x6a\
-\x84\x03\x3e\x78\xbd\x1e\x58\xb3\xac\xe8\x25\xf1\xe8\x27\xf0\x89\
-\x39\x8c\x80\x9d\x11\x78\x65\xf1\x10\x01\x52\x9d\x12\x95\x4a\xf9\
-\xd9\xc2\x1b\x8b\x61\x6f\xf1\xc7\x12\x54\xe2\x07\x18\x78\xab\x49\
-\x81\xc6\xa6\x66\x74\x76\xb6\x37\xb8\x2a\xca\x9e\x77\xd5\x94\x9f\
-\xa6\x41\x37\x75\x96\x0d\xfd\xd4\x99\x79\x12\x3a\xce\x53\x97\x53\
-\x57\x9b\xaf\x5b\x53\x48\x6e\xb0\x89\x8c\x52\x62\x48\xb7\x42\x50\
-\xa8\x10\x12\x83\x88\x50\xba\xe6\x86\x4b\x2e\xc7\xc5\x03\x9b\xc3\
-\x24\xa3\x86\x1e\x12\x25\xb7\x21\xf7\x0c\x86\x53\x3c\x2f\x3f\x4b\
-\x87\x9a\x1a\x22\xf0\x87\x24\x02\x64\xfd\x37\xf3\x73\x27\x97\x9a\
-\x33\x6d\xa8\x6a\xf4\x0c\x82\xd7\x6b\xe5\xc8\xb1\x28\x51\xdf\xe0\
-\x40\xe7\xb9\x86\x93\xad\xc7\x37\x3d\x1b\x70\xd7\x35\xd3\xe0\xf9\
-\x24\xf0\x61\x8c\xd4\x6e\xf6\x04\x19\x23\x41\xdd\x50\x70\xc7\xb6\
-\x87\xd4\xa6\xe9\x8f\x19\xd3\x33\xa1\xd6\xa5\x91\x4b\x05\x20\x46\
-\x23\x43\x0a\x95\xec\x56\xd4\x54\x0a\x81\x6a\x43\x6e\x08\x7c\xd2\
-\x2a\x31\x02\xd5\xd5\x0d\x38\xb9\x75\x51\x12\x81\xbb\x77\xf7\x2c\
-\x5c\x50\x94\xe6\xec\x01\x9c\x3d\x52\xb2\x92\x51\xf6\x2c\xb0\xe9\
-\xd1\xd1\x71\x0e\xcd\x2d\x4d\x0d\xcd\x1f\xfe\xe2\x11\x02\xdf\x40\
-\x43\x2c\x6b\xf6\xc4\xad\x7e\xb1\x12\x80\x3d\x9f\xc2\x1d\xba\xbc\
-\xe5\x2f\xdc\xab\x9b\x54\xfc\xac\xc9\x62\xd5\xa9\x75\x06\x78\x03\
-\x81\x84\x8f\x26\xc5\x75\x22\x4f\x60\x64\xd0\xc7\x7d\x7a\x5a\x36\
-\x11\xa8\x6a\xc4\x89\x2d\x0b\x25\x02\xa4\x3c\x25\x5a\xad\xfa\xb3\
-\xf9\xf3\x8a\x50\xe9\xe8\x43\x28\x1c\x89\x4d\x66\x01\x2b\xe7\x82\
-\x38\x5b\x65\xf7\x39\x0e\x3c\x5a\x1a\x70\xd7\x37\xd2\x40\x6b\x12\
-\xf8\xcb\x69\xcc\xad\x34\xb6\x25\x1b\x6f\x31\xe6\x7f\x7d\x87\xc9\
-\x6c\xd5\x41\xae\x43\x77\x9f\x7f\xd0\x02\x12\xe8\x24\x02\xcc\x88\
-\x32\x2e\x46\x8a\x5d\xb3\x15\x21\x9b\x62\x96\x8d\xad\x80\x03\x27\
-\x5e\xfe\x4a\x9c\xc0\x5d\x65\x0f\x5b\x33\xcd\xcf\xe7\xd8\x72\xe3\
-\xc1\x2b\x69\x3c\x63\x5a\x65\xaf\x41\x87\xfd\xf0\x8b\xad\xc7\x7f\
-\xbb\x93\x26\x33\xd7\xe9\xba\x02\xf0\xc9\x24\x94\x05\x77\xbe\x72\
-\xbf\xd6\x72\xdd\xab\x93\x26\x67\x23\x18\x11\xd0\xe3\x0b\x48\x92\
-\x1a\x27\x90\x14\xdb\x23\x08\xb1\x56\x38\x55\x87\x3a\xf2\xe2\x13\
-\x2f\xdd\x94\x58\x81\x5d\x7f\x2e\xc8\xcf\x59\xaf\xd4\x9a\xd1\xe2\
-\xf4\xc7\x26\x59\xcd\x14\x44\x91\x7e\x54\xd7\xd4\x38\xab\xf7\xac\
-\x59\x17\x07\x7f\x2e\xee\xf3\x63\x69\x0c\x8a\x6a\xc6\x3d\xdb\x9f\
-\x48\x33\xe7\x3f\x39\xc9\x9a\x03\x97\x6f\x00\x81\x90\x98\x02\x7a\
-\x28\xc0\xb9\x64\x95\x8d\x1d\x18\x81\xda\xda\x26\x7c\xbc\x39\x41\
-\xe0\xee\x5d\x1f\x15\xce\x2a\x58\x12\x8c\x68\xe0\x74\x4b\xda\x5f\
-\x90\x93\x46\xf5\x46\x3d\x9a\x2b\xf7\x33\xeb\xbf\x45\x13\x1d\x90\
-\x54\x67\x3c\x36\x23\x7c\xf6\xe2\x87\xad\xa6\x99\x77\x56\x5a\x2c\
-\x16\x83\xc6\x90\x8e\x56\x57\x7f\x2a\xe8\x61\x2b\x90\x7c\x5a\x44\
-\x04\xec\x35\x4d\x38\xbe\xf9\x46\x89\xc0\xac\xbb\xf7\x34\xcd\x9f\
-\x57\x38\xa5\xbd\x27\x0a\x2f\x59\x43\xa7\x51\x60\x52\xba\x0c\x95\
-\x55\x76\xd4\x7d\xf0\xb3\x95\xfe\xee\xda\x4a\x48\xbe\x1f\x18\x07\
-\xf0\x28\xfe\xe1\x47\xf1\xda\x46\x33\xd7\x92\x39\x19\xdd\xfd\x2c\
-\x49\x89\x18\x0c\x81\x94\x40\x4e\xd2\xa6\x38\x81\x39\xb9\x5a\x0a\
-\xe2\x66\x1c\xff\xfd\x82\x38\x81\x7b\xca\xa3\x0b\xae\x9f\x83\x66\
-\x67\x88\x64\x4b\x84\xd9\xa8\xa2\xba\xc4\x47\xd9\xee\xcc\x19\xfb\
-\xbe\xf5\x0f\xd0\xa4\x7a\x48\xb2\x39\x66\xeb\x27\xc0\xa7\x1b\x8d\
-\x73\x8d\xa6\x0c\xb8\x7d\x22\x81\x0f\x0f\xf9\xff\xf0\x38\x18\x25\
-\xd9\x31\x02\x95\x95\x44\xe0\xc5\x1b\x24\x02\xb3\xd7\x94\x47\xe7\
-\xcf\x2b\x46\xcb\xf9\x60\x8c\x00\x53\x1f\xb7\xab\x03\x2d\xf6\x13\
-\x6f\x35\xee\x7f\xf4\x39\x9a\xc4\xd4\xa7\x77\xbc\xc0\x9b\x32\xd2\
-\xe7\xa6\x65\x98\xd0\xed\x8b\x27\xa9\x64\xe0\x1c\x86\x91\x48\x8d\
-\x81\xd8\x73\x88\x40\x45\x45\x33\x8e\xbd\x30\x3f\x41\x60\x5f\xb4\
-\x64\x2e\xab\x7f\x06\xe0\xa7\x94\x9d\x97\x95\x86\xc6\xc6\x5a\xb4\
-\x7c\xbe\xf3\x91\x8e\xcf\x5f\xfb\x3b\x4d\x6a\xa1\xde\x3f\x2e\xe0\
-\x4d\x04\x3e\x3d\x0e\x3e\x24\x0e\x03\x3e\xda\x0a\x8c\x54\x21\x46\
-\xe0\xec\xd9\x66\x1c\x7d\xfe\xfa\xc1\x15\xe8\x29\x9e\x53\x94\xd6\
-\xde\x1d\xa6\x0c\x19\xc6\x94\x4c\x7d\x8c\x40\xfd\x91\x4d\xeb\x7a\
-\x1b\x0f\x9e\xa0\x49\xed\xb8\x72\xe9\x94\xc0\x73\x20\xcb\x1b\x63\
-\xe0\xdd\x54\x1e\xc4\x7c\x9e\x01\xe4\xb9\x54\xe0\xc3\x41\x0f\x57\
-\x21\xba\x2e\x9e\xaa\xc1\xe9\x33\x4d\x38\xfa\xdc\xf5\x89\x18\xd8\
-\x7d\x2c\x3f\xbf\x60\x71\x30\xaa\xa6\x15\x10\xa9\x0e\x51\xc0\x5e\
-\x5b\x83\xca\x77\x6e\x5f\x42\x13\xea\xa8\x3b\x71\x85\xfe\x3f\xe7\
-\xfb\x07\xf2\x38\x41\x51\x9e\x00\xcf\xd3\x9e\x81\x25\x23\x3e\x9e\
-\x94\x62\x47\x06\x72\xf0\x1c\xd2\x39\x27\x8d\x27\x5c\x2a\x76\x0e\
-\x69\x1e\xe3\xf2\xdf\xd3\xb4\x02\xbf\x2b\x49\x10\xd8\x7b\x34\x37\
-\x37\xef\x66\x91\xd7\xd2\x0a\x88\xc8\xd0\x29\x50\x57\x5f\xcd\x08\
-\xb0\x09\xb5\x90\x92\xd7\x65\xbf\xfe\x98\xb3\xe1\x50\x09\x27\x13\
-\x3e\xa4\x9f\x4c\x53\x29\x15\x49\x16\x4d\x94\xd1\x5c\xfc\x30\xb4\
-\xcd\xc4\x28\xfa\xcf\x61\xa4\x94\xf6\x07\x44\x7c\xfa\xf2\xfc\xc1\
-\x4c\xfc\x8c\x25\x33\x6b\xa3\x21\x23\x0b\xbd\x7d\x41\xa8\xe4\x32\
-\xb4\xb7\xd5\x26\x08\xb0\xd7\x1e\xae\x2b\xf4\x1e\x96\x79\xb5\xd4\
-\x27\x51\xa7\x18\x80\x02\x18\x59\xe1\x8c\xa1\x31\x61\x69\xe1\x66\
-\xac\xfa\xcb\x5a\xa3\x29\x6b\x47\x66\xd6\x34\xda\xbc\x7b\xa9\x1e\
-\x57\xa0\xcb\x59\x8f\xca\xb7\x57\x8c\x95\x00\x03\x1b\x2b\xab\x21\
-\x15\x74\xe3\xdd\x58\x5c\xfa\xb9\x82\xdb\x5f\x9d\xae\x31\xe6\xd8\
-\x2d\xd6\xe9\xe8\xa0\x5d\x58\xba\x41\x0e\xf7\xf9\x7a\x54\x8c\x9d\
-\xc0\xff\xa5\xc5\xea\xf6\xeb\xd6\xbe\xdb\x98\x61\xc9\xb7\xf5\xf8\
-\x79\x18\x34\x72\x78\xdd\x8d\x38\xb3\xfd\xd6\x2f\x0d\x01\xa6\x44\
-\x5b\x69\xc7\xf4\x63\x51\xb0\x50\x09\x2b\x43\xd0\xeb\x80\xb3\xaa\
-\xfc\xc1\xf6\x4f\xb6\x94\x41\xca\xc2\x57\xfd\x2d\xf3\x58\x08\x60\
-\xda\x8a\x6d\x0b\xb5\x19\x79\x1f\xab\xd3\xf2\x69\xa7\xc4\x23\xdc\
-\xdf\x8a\xce\x8a\xb2\x87\xda\x4f\x6d\xdd\x43\xc3\x9d\x90\x76\x5d\
-\x13\xb2\x25\x54\x41\x3e\x7b\xdd\x7b\x0d\x5a\xc3\x94\x9c\x08\xaf\
-\x87\x18\x74\xc2\xdb\xf1\xe9\x9b\x0d\xef\x3f\xf8\x2b\x48\x89\x2c\
-\x74\xad\x81\x5e\x8c\x00\x53\xa3\x9f\xa8\xd3\x6c\x5b\x78\x75\x0e\
-\xb8\x48\x1f\xfa\xba\x2a\x8e\xdb\xf7\xde\xc7\x5e\x30\xb1\x52\x62\
-\xac\xfb\x80\xab\x4e\x00\xb6\xa5\xbf\xcc\x34\x64\xdf\x64\x57\x1b\
-\xa6\x18\x78\x99\x00\x6f\x77\x6d\x67\xd5\x8e\x6f\x7f\x0b\x52\x31\
-\xe7\xbd\xd6\x40\x2f\x4a\x80\x1a\x3f\xeb\x9e\xb2\x4d\x6a\x7d\xe6\
-\x63\x4a\x9d\x15\xbe\xde\x66\xb4\x9d\xdc\xbc\xb2\xdb\xfe\xd7\x63\
-\x90\x36\x33\x13\x32\x90\x53\x32\x63\xf6\xa2\xc7\xac\xc6\xdc\xaf\
-\x55\x1b\x32\x6c\x86\x50\xb0\x17\xae\x86\x23\xcf\x38\x0e\x3e\xb1\
-\x05\x52\x3d\x74\xd1\xf7\xf7\xd7\x9c\x00\x35\xd9\x8c\x55\x6f\xfe\
-\x54\x93\x6e\xdb\xac\xd6\xa4\xc1\xdd\x69\x3f\x56\xbd\xfb\xde\xef\
-\x41\xda\x0f\x8f\xcb\x8e\xec\x6a\x13\x60\x4d\x3d\x7b\xdd\xbb\x1f\
-\x9a\xcc\xd6\x9b\xdc\x3d\xdd\x7d\x15\xdb\x97\xb3\xf7\xf0\x0e\x4c\
-\xd0\x38\x18\x8d\x00\x9f\x77\xeb\x8b\x37\xeb\x32\x8b\x8e\xf0\xbc\
-\x0c\x6e\xc7\x91\xc7\x9b\x0f\x3f\xfd\x06\xdd\xef\xc6\x38\xff\xc3\
-\x78\xb5\x08\xb0\x26\x9f\x79\xd7\xf6\x27\xe4\xba\xcc\xa7\xc2\x7e\
-\xf7\xd1\xea\x5d\xdf\x29\x85\xe4\x46\x13\x2e\x1f\x70\x17\xb8\xaf\
-\x99\xbd\xae\x7c\x9f\x4c\xa1\xff\x86\xe3\xe0\xc6\x45\x7d\x6d\xa7\
-\xd8\x9b\x68\xcf\xb5\x06\x7c\xa9\x04\x58\xe3\x33\x4b\x36\xd8\xcc\
-\x45\x6b\x8f\x07\xdc\x8e\x77\xea\xff\xf6\x00\xdb\xe0\xb3\xcd\xcd\
-\x84\x52\xa3\x8b\x6d\x30\x84\xdc\x6f\x6e\x5a\xaa\xc9\x2c\xde\x5a\
-\xb9\x7d\xc5\x72\x48\x75\xd1\x84\x52\xa3\x4b\xd9\x21\x29\xa7\xad\
-\x78\xf9\x76\x99\x42\x97\x67\xdf\xb7\xe1\x75\x48\x6a\x34\x61\x82\
-\xf9\x52\x08\xb0\x39\x4a\x48\x3b\x2b\xe6\x3e\xec\x15\xcb\x84\xa9\
-\x4e\x2f\x75\x8f\x9a\xf8\xc3\x82\x8b\x93\xf8\x52\xad\xc0\x84\x6e\
-\xff\x03\x7d\xb3\x7a\x20\x3e\xc6\xff\x9f\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x2d\x7f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\xbd\x79\x98\x5d\x45\
-\xb5\xf7\xff\xa9\xaa\xbd\xcf\xdc\x73\x27\x9d\xce\x3c\x41\x42\x40\
-\x22\x12\x22\xa8\x80\x0a\x0e\x17\x87\xab\x57\xf8\xc9\x78\xbd\x57\
-\xd1\xd7\xe1\xaa\xe8\x0b\x88\x0a\xe2\xfc\x2a\x20\x08\x5e\x1c\x10\
-\x44\x06\x05\x54\x66\x04\x09\x61\x4a\xc2\x90\x84\x84\x84\xcc\x03\
-\x21\x09\x99\x87\x1e\xcf\xbc\x77\x55\xfd\xfe\xa8\x73\xba\x4f\x37\
-\xdd\x21\x01\x92\x74\xb4\xbf\xcf\x73\x9e\xee\x73\xce\x9e\xd7\xb7\
-\xd6\xfa\xd6\xaa\x55\x75\x60\x10\x83\x18\xc4\x20\x06\x31\x88\x41\
-\x0c\x62\x10\x83\x18\xc4\x20\x06\x31\x88\x41\x0c\x62\x10\x83\x18\
-\xc4\x20\x06\x31\x88\x41\x0c\x62\x10\x83\x18\xc4\x20\x06\x31\x88\
-\x41\x0c\x62\x10\x83\x18\xc4\x20\x06\x31\x88\x41\x0c\x62\x10\x87\
-\x3c\xd4\xc1\xbe\x80\x37\x89\x89\xc0\xe3\xc0\x29\xc0\x10\xa0\x08\
-\xb4\x03\xe1\xc1\xbc\xa8\x41\x1c\x18\x44\x70\xc6\xb7\x15\xaf\x02\
-\xb0\x02\xb8\x09\xf8\x1c\x70\x14\x10\x3d\x58\x17\x38\x88\xfd\x8b\
-\xff\x47\x4f\xe3\xf7\xf5\xca\x03\x8b\x81\xdf\x02\x9f\x01\x0e\x03\
-\xfc\x83\x71\xb1\x03\x15\xe2\x60\x5f\xc0\x1b\xc4\x7f\x00\x7f\x05\
-\x24\xc0\xa9\x1f\x3b\x23\x94\x12\x5e\x9c\x3b\x47\xed\xda\xbe\x4d\
-\x58\x6b\xfb\xdb\x2f\x0b\xac\x04\x9e\x2d\xbd\xe6\x02\x1b\x00\xbd\
-\xff\x2f\x79\x60\xe2\x50\x24\xc0\x78\xe0\x19\x60\x18\xc0\xf4\x13\
-\x4f\xd1\xbf\xfd\xcb\x3f\x72\x52\x7a\xec\xda\xb9\x43\xac\x59\xbe\
-\x58\x2e\x9e\xff\x9c\x5a\xf0\xdc\xd3\x6a\xe5\x4b\x0b\x54\x67\x47\
-\xfb\x9e\x8e\x95\x01\x96\x00\x17\x96\x8e\xf9\x2f\x87\x43\x8d\x00\
-\x3e\xf0\x00\xf0\x61\x80\xc6\xa1\xcd\xf6\xc6\x7b\x9f\xcc\x8e\x3f\
-\x7c\x92\x0d\x0a\xa1\x90\x4a\x22\x3d\x69\x95\xc2\x66\xd2\x45\xb1\
-\x6d\xcb\x26\xb9\x74\xe1\x3c\xb9\xf4\xc5\xb9\x6a\xc9\x82\xe7\xd4\
-\xcb\xab\x96\xc9\x5c\x26\xdd\xd7\x71\x2f\x03\x7e\x7c\x00\xef\x63\
-\xc0\xe0\x50\x23\xc0\xf7\x81\xcb\x01\xa4\x94\x5c\x71\xc3\x5f\xf2\
-\x1f\x39\xfd\x53\x41\xba\xa3\x28\x36\xb7\xeb\xa2\xb1\x96\x9a\xb8\
-\x54\x71\x4f\x28\xdf\x93\x28\xe5\xa1\x22\x02\x6b\xa1\xb3\x23\xc7\
-\xd6\xcd\x1b\xe5\x8a\x45\xf3\xe5\xd2\x17\x9f\x57\xcf\x3d\xf5\xa8\
-\xda\xf4\xca\x5a\x59\x3a\xee\x8d\xc0\xe7\x0f\xd6\x4d\x1d\x4c\x1c\
-\x4a\x04\xf8\x37\xe0\x7e\x4a\x22\xee\xbf\xbe\x72\x51\x70\xf1\x8f\
-\xae\xc8\x17\x72\x81\xdc\xd2\x1e\x06\xcb\xb6\x85\x59\x6b\x2d\x4a\
-\x22\xa2\x9e\x90\x55\x31\xa9\xaa\xa3\x42\x55\xc5\xa4\x8a\xfb\x42\
-\x7a\x4a\x09\xcf\xf3\xac\xf2\xc0\x8b\x62\x1f\xb8\xe3\x6f\xfe\x77\
-\xbf\x78\x46\xac\x74\xec\x99\xc0\x07\x71\xc2\xf1\x5f\x0a\xde\xc1\
-\xbe\x80\xbd\xc4\x68\x9c\x92\xf7\x01\x8e\x7b\xf7\xfb\xf4\xff\x5c\
-\xf2\xfd\x42\x58\x34\xb2\x23\x6f\xf4\xba\xdd\x61\x5e\x0a\x04\x02\
-\x0c\x90\x2e\x58\xd3\x9e\xd7\x5a\x80\x90\x02\xe2\x3e\xaa\x2a\x2a\
-\x55\x75\x5c\xca\x86\xb8\xf4\x92\xc9\x98\x18\x35\x6e\xa2\xf1\xfc\
-\x08\x61\x50\x04\x98\x00\xc4\x80\xdc\x41\xbb\xc3\x83\x04\xf9\xfa\
-\x9b\x1c\x74\x48\xe0\x37\x38\x12\x50\xdf\x38\xd4\x5e\x76\xe5\x6f\
-\xf2\xf1\x78\x82\x7c\x21\xb4\x6b\x77\x06\xf9\x42\x88\x11\x25\x5f\
-\x26\x00\x29\xc0\x93\xce\xf8\xda\x40\x47\xc1\xea\x0d\xad\xba\xb0\
-\x68\x53\x31\xb7\xa9\x43\x07\x18\x43\xe3\xd0\xe1\x36\x59\x55\x5d\
-\x6e\xf1\x4d\xb8\x44\xd2\xbf\x1c\x0e\x05\x02\xfc\x5f\xe0\xb4\xf2\
-\x9b\x0b\xbf\x7f\x55\x61\xd2\x91\x93\x4c\x21\x1f\x88\x8d\x6d\x61\
-\xa1\x2d\x67\x43\x25\xfb\x0f\x65\x42\x74\x13\x42\x48\x41\xae\x68\
-\x8d\x36\x86\x58\x22\x69\x87\x8d\x18\x5d\x26\x40\x0c\x47\x82\x7f\
-\x39\x0c\x74\x02\x9c\x0c\xfc\xb0\xfc\xe6\xcc\xff\xfe\x4a\xf0\x89\
-\xb3\xce\x0b\xf2\x99\x50\xee\x4a\xeb\x60\x73\x9b\x2e\xee\xc9\xf8\
-\xbd\x21\x40\xe4\x02\x6b\xb4\x36\xc4\xe2\x71\x9a\x47\x8d\x33\xa5\
-\xaf\x24\x70\x3e\x30\x95\x7f\xb1\xcc\xe1\x40\x26\x40\x13\x4e\x9d\
-\xc7\x00\xa6\x1e\x7b\xbc\xf9\xe6\xf7\x7e\x5a\x30\xa1\x11\xe9\x82\
-\x36\xeb\x5a\xc2\xbc\xc5\xb5\xf0\xbd\x85\x14\x90\x0f\xac\x0d\x8d\
-\xb5\xd1\x98\x64\xd8\x88\x31\x95\xa2\xef\x0b\xc0\xbc\xd2\xeb\x3a\
-\xe0\x74\x4a\xb9\x86\x7f\x66\x0c\x54\x11\x28\x71\xa2\x6f\x22\x40\
-\x6d\x7d\x83\xbd\xfc\xea\x1b\xf2\xd5\x35\xd5\xa4\x33\x45\x5e\xde\
-\x1d\xe6\xf2\x81\x35\x52\x20\xf6\x45\xb6\x0b\xa0\xa8\xad\x2d\x6a\
-\x6b\x01\x31\x7e\xd2\x91\xc6\xf3\x7c\xc2\x30\x28\x6f\x12\x01\x8e\
-\x2e\xbd\xbe\x0a\xec\xc6\x11\xe2\x29\x60\x16\xb0\x08\x97\x5e\xfe\
-\xa7\xc1\x40\x1d\x0d\xfc\x3a\x70\x41\xf9\xcd\xb7\x7f\xf2\xab\xc2\
-\x07\x3e\xf2\xe1\x30\x97\x09\xe4\xab\xad\xba\xb0\xad\x53\x07\x95\
-\xae\xbf\x9c\xf8\xef\x7a\x5f\xf1\xc6\x56\x7c\x66\x05\x18\x0b\x8d\
-\x29\xe5\x47\x31\x6a\xec\xe1\x47\xea\x13\xde\xff\x6f\x61\xd3\xf0\
-\x51\x56\x48\x49\x67\x5b\x8b\x28\x16\x0b\x95\x3e\x25\x81\x1b\x3f\
-\xf8\x00\xf0\xdf\xb8\x14\xf4\x44\x1c\x51\x5a\x71\xa9\xe5\x43\x1a\
-\x03\x31\x0f\xf0\x2e\x60\x06\x90\x04\xf8\x8f\x73\xce\x0f\x7e\x72\
-\xdd\x0d\x79\x1d\x68\xb9\xb3\x33\x0c\x56\x6c\x0f\x73\xc6\x5a\x67\
-\x74\xeb\x0c\x6c\xac\x7b\xd9\xd2\xe7\xc6\xd0\xf5\xbd\xb1\x60\xb1\
-\x18\xe3\xba\x88\xda\xc0\xe4\xa1\x7e\x6c\x4c\x9d\x8a\x08\x21\xf0\
-\x23\x11\x2b\x14\x64\x32\x45\x76\x6c\x79\x55\x2c\x59\xf0\xac\x5a\
-\x34\x77\x96\x5a\x3c\x6f\x8e\xda\xbc\x7e\xad\xd4\xba\xdf\x91\xe5\
-\xed\xc0\x73\xc0\xd3\xa5\xd7\x72\xdc\x68\xe4\x21\x85\x81\x46\x80\
-\x46\x9c\xab\x3d\x02\x60\xca\xd1\xef\x30\x37\xdf\x3b\x33\x57\x5d\
-\x5d\x6b\x3b\xb2\x45\xbb\x74\x5b\x90\xc9\x15\xb1\x42\xd8\x92\xc1\
-\xf7\x9d\x00\xd6\x3a\xdd\x50\x13\x93\xaa\x36\x26\xbc\xba\x84\x54\
-\xa9\xa8\x94\x11\x4f\x0a\xdf\xf3\x90\xbe\x44\x6b\x68\x6b\x6b\x67\
-\xdd\xca\xa5\xf2\xa5\xf9\xb3\xbd\xc5\xf3\x66\xa9\x95\x8b\xe6\xcb\
-\xf6\xd6\x5d\xfd\x3d\xaf\x22\x6e\x90\x69\x16\x8e\x0c\xcf\x02\x5b\
-\xf6\xf7\xc3\x7a\x2b\x30\xd0\x08\xf0\x67\xe0\x2c\x80\xaa\x9a\x5a\
-\xfe\x70\xf7\xcc\xec\xd4\x69\xc7\x9a\x4c\xba\xc8\xca\x1d\x61\xae\
-\x25\x6b\x02\x01\xc2\xf2\xe6\x08\x60\x80\x50\x63\x8d\xb5\x28\x10\
-\x31\x5f\xc8\xda\x84\x54\x75\x71\xf7\x4a\x44\xa4\xf4\x3c\x25\x94\
-\xe7\x59\xe1\x61\x73\xd9\x50\xec\xda\xb6\x45\x2c\x7f\xf1\x79\xf5\
-\xd2\xbc\xd9\x6a\xf1\xbc\x59\xea\xd5\x75\xab\x64\x50\xec\xb7\xc1\
-\xb7\xe0\xb4\x43\xd9\x3b\x2c\x66\x80\x86\x8b\x81\x44\x80\xaf\xe2\
-\xd4\x37\x00\x3f\xbc\xfa\xc6\xc2\x39\x9f\xff\x5c\x31\xdb\x19\xc8\
-\x8d\xad\x61\x61\x43\x9b\xce\x4b\x81\x70\xc6\x7d\x73\x04\x28\xef\
-\x63\xad\xfb\x5c\x5b\xd0\x06\x8b\x40\x78\xc2\x8a\xaa\x98\x94\xf5\
-\x09\xe5\xd5\xc5\xa5\xaa\x89\x4b\x19\xf3\xa5\x50\x4a\x21\x7d\x85\
-\x31\xd0\xd9\xde\xc9\xc6\x75\xab\xe4\x92\xf9\xb3\xd5\x92\x79\xb3\
-\xd5\xf2\x17\x9f\x53\x2d\x3b\xb7\xf5\xf7\x2c\x35\xb0\x16\x98\x8d\
-\x13\x93\xcf\x00\xeb\xf7\xdf\x63\xdc\x37\x0c\x14\x02\xbc\x03\xd7\
-\x52\x52\x00\x1f\x3f\xe3\xbc\xf0\xca\xdf\xdd\x9a\x0b\x8b\x5a\xee\
-\xce\x04\xc1\xca\x1d\x61\xce\x94\xd4\xdc\xeb\x11\xc0\xfd\x6f\x85\
-\xb5\xbd\x08\x60\xc1\xe2\x4a\x05\x2a\x09\x60\x7b\x79\x06\xa3\x2d\
-\xa1\x05\x63\xb0\x42\x22\xe2\xbe\x90\x8d\x09\xa9\x1a\x92\x52\xd5\
-\x25\xa4\x17\xf7\xa5\x88\x78\x4a\x08\xcf\xb3\xd2\x13\xb6\x90\xd7\
-\xa2\x65\xe7\x36\xb1\x64\xfe\x33\xea\xc5\x67\x67\xaa\xa5\x2f\xcc\
-\x51\x9b\xd7\xaf\x91\x3a\xec\x57\x3b\x74\xe0\x42\xc4\x63\xa5\x7b\
-\x5e\xca\x41\xd4\x0e\x03\x81\x00\x35\xc0\x93\xc0\x31\x00\x13\x27\
-\x4d\xb1\xb7\x3e\xf0\x54\xb6\xa1\x71\x88\xed\xcc\x14\xed\xf2\x1d\
-\x41\x26\x57\x74\xba\xbe\xbb\x75\xf7\x4d\x00\x63\x8c\x30\xd6\x0a\
-\x63\x8c\x34\x06\x61\x2d\xd6\x58\x2b\x4a\xbd\x04\x6b\x85\x34\x38\
-\x6e\x60\xac\xeb\x2c\xf4\x26\x80\x35\xb6\xeb\xbd\x2e\x1d\x37\x0c\
-\xad\x45\x22\x22\x12\x51\x13\x97\xb2\x21\xa1\xbc\x86\x94\x54\x35\
-\xd1\x92\x77\xf0\x14\xc2\xf3\x30\x06\x3a\xda\xda\x59\xbf\x7a\xa9\
-\x5c\xfa\xc2\x1c\xb5\x64\xfe\x2c\x6f\xf5\x4b\xf3\x65\x7b\xcb\xce\
-\xfe\x9e\x73\x00\xac\xc2\x69\x87\xa7\x70\xde\xe1\x80\x6a\x87\x81\
-\x40\x80\x1b\x71\xf5\x7b\x24\x12\x49\x6e\xfc\xdb\x8c\xdc\x3b\xdf\
-\xf3\xae\x30\x93\x0e\xc4\x9a\x9d\x61\x6e\x57\x46\x07\x52\x20\x8c\
-\xdd\x33\x01\xb4\xb1\xc2\x18\x2d\xb5\x31\x4a\x87\x5a\x1a\xad\x95\
-\x36\x46\x82\x30\x56\x08\x6b\x91\xc6\x0a\x61\x04\xca\x5a\x81\xb5\
-\xee\x90\x58\xe3\x08\x61\x11\xb6\x37\x01\xca\xe7\x74\x24\x71\xe1\
-\x22\x30\x25\xed\x20\x85\x48\xf8\x42\x36\x24\xa4\x6a\x4c\x4a\x55\
-\x9f\x94\x2a\x15\x55\xd2\x57\x4a\x48\xdf\xb7\x52\x61\x73\xd9\x40\
-\xec\xda\xb1\x55\xac\x5a\x34\x57\x2d\x5b\x30\x47\x2d\x9d\x3f\x4b\
-\xbd\xfa\xf2\x8a\x3d\x69\x87\x56\x5e\xab\x1d\x32\xfb\xf3\xe1\x1f\
-\x6c\x02\x9c\x0f\xfc\xbe\xfc\xe6\xbb\x3f\xbd\xae\x70\xfe\xd7\xbe\
-\x1a\x64\xd3\xa1\xd8\xd4\x1e\x16\x36\xb6\x84\x79\x21\x10\x95\xc6\
-\xe8\x4d\x80\xb2\xcb\xd7\xc6\x48\xa3\x43\x15\x6a\xed\x85\xc5\xc0\
-\x0b\x8a\x85\x98\x31\x5a\x19\x84\x15\x42\x6a\x2b\x94\x16\xca\x0b\
-\x84\x50\xda\x0a\x47\x06\x10\x94\xa3\x05\x42\x1a\x17\x22\x2c\xa6\
-\x14\x2a\x7a\x13\xa0\xf2\x33\xed\xc2\x04\xa1\x36\x16\x21\x84\x5f\
-\xf2\x0e\x8d\x49\xe5\x0d\x49\x4a\x55\x17\x57\x32\x16\x91\xc2\xf3\
-\x3c\x21\x3d\x65\xb5\x85\x74\x7b\x07\x9b\xd7\xaf\x96\x8e\x0c\xb3\
-\xd5\xca\x17\x9f\x53\xad\x3b\xb7\xee\x49\x3b\xac\xc3\x69\x87\xa7\
-\x4b\x7f\xd7\xf3\x16\x0f\x59\x1f\x4c\x02\xbc\x1d\x77\x63\xd5\x00\
-\xa7\x7d\xe2\xd3\xe1\x2f\x6f\xbe\x23\xa7\x03\x23\x5b\x33\x61\xb8\
-\x72\x67\x98\xb5\xc6\xf6\x12\x73\x3d\x09\x60\x8c\xed\x72\xf9\xa1\
-\xd6\x4a\x6b\x2d\x83\x42\x3e\x16\x16\x0b\x51\x63\x5d\x96\xd0\xed\
-\x67\x30\x46\x60\x00\x21\x94\x16\x52\x69\xa4\x17\x20\xa4\xb6\x08\
-\x17\x1a\x90\x06\x21\xad\xc5\x76\x85\x8a\x4a\xdd\xd0\x9b\x00\x5d\
-\x1e\xc8\x3a\x8f\xa1\x75\x59\x4c\x5a\x2b\x45\x49\x3b\x24\x95\x1a\
-\x9a\x52\xaa\xa9\x4a\xaa\x64\x54\x49\x5f\x49\x21\x3d\xcf\x4a\x4f\
-\xda\x7c\x3e\x14\x6d\xbb\x77\x88\x35\x4b\x5f\x90\xcb\xe6\xcf\x52\
-\x2f\xce\x99\xe1\x6d\x5a\xb7\x52\xea\xee\xac\x64\x6f\x74\x02\x0b\
-\x71\xe1\x72\x06\xf0\x22\x6f\x41\x56\xf2\x60\x11\x20\x85\x2b\xe9\
-\x9e\x0e\x30\x66\xdc\x44\x7b\xfb\x43\x4f\x67\x9b\x87\x0f\xb7\x9d\
-\x99\xa2\x5d\xb5\x33\xcc\xa6\x0b\x56\xbb\xd6\x6f\xfb\x24\x80\x73\
-\xf9\x46\x6a\x6d\xa4\xd1\x5a\x85\x61\xe8\x15\x8b\xf9\x58\x10\x04\
-\x3e\x65\x81\x27\x44\xc9\x43\x18\xd7\x8a\x85\x80\xf2\xf1\xdc\xc0\
-\xb1\x41\x48\x4d\xc9\x3b\x58\x29\x0d\x56\x18\x84\x34\x56\x48\xa7\
-\x25\x85\xb0\xd6\x0a\x2c\xb6\x44\x84\x2e\x0d\xd1\x83\x00\x95\x3d\
-\x0f\x5d\xea\x5d\x84\xc6\x5a\x6b\x05\x51\x0f\x59\x9f\x50\xb2\x31\
-\x25\xbd\xa6\x94\x52\x75\x09\x29\x63\x9e\x14\x9e\xa7\x84\xf0\x7c\
-\x6b\x04\xb6\xb3\xb5\x5d\x6c\x58\xbb\x4c\x2e\x7f\x61\x8e\x5a\xfe\
-\xc2\x2c\x6f\xcd\x92\x79\xb2\xa3\x7f\xed\xa0\x71\x79\x87\xa7\x71\
-\xfa\x61\x0e\xb0\xf9\x8d\x18\xe2\x60\x11\xe0\x7a\xe0\xcb\x00\xd1\
-\x58\x9c\x1b\xef\x7a\x38\x77\xe2\xfb\xdf\x1b\xa6\x33\x81\x7c\x65\
-\x57\x98\xdb\x99\x31\x45\x01\xc2\xc5\xe2\x6e\x02\x94\x54\xba\xb0\
-\x58\xa1\xb5\x96\xee\x65\x54\x10\x14\x23\x41\xb1\x10\xd3\x3a\x94\
-\x16\x81\xd5\x16\xa4\x42\xc6\xab\x01\x81\x0e\x0b\x84\xc5\x22\xa1\
-\x0e\x9d\xbc\xa7\xa2\x4b\xa8\x1d\x31\x2c\xc2\x0a\x29\xb5\x15\x52\
-\x0b\xe9\x85\x48\xa5\x41\xea\xae\xd0\x00\xd6\x5a\x61\x8d\x10\x16\
-\xca\xde\x01\xdb\xd5\x7b\xe8\xd1\xf5\xb4\xdd\xfa\xc4\xb8\x6b\x0f\
-\x0c\xd6\x18\x83\x52\x42\x24\x23\x52\x0e\x49\x4a\x35\x34\xa5\xd4\
-\xd0\x2a\x97\x88\x8a\x7a\x9e\x90\xbe\x6f\x85\x12\x36\x9f\x2d\x8a\
-\xdd\xbb\xb6\x89\x35\x8b\xe7\xaa\x15\x0b\xe6\xa8\xe5\x2f\xcc\x52\
-\x9b\xd7\xbd\xae\x76\x98\x4f\x4f\xed\x90\x63\x2f\xaa\x9d\x0f\x06\
-\x01\xce\x03\x6e\x2d\xbf\xb9\xf8\x07\x57\x16\xbf\x72\xe1\x85\xc5\
-\x6c\x3a\x14\x5b\x3b\xc2\xe2\xc6\x56\x9d\x43\x38\x45\xf6\x1a\x02\
-\x58\x2b\xb4\x36\xd2\x18\x2d\x75\xa8\x55\xa8\x43\x2f\x28\x16\xa3\
-\x41\x50\x8c\xb8\x16\x69\x30\x16\xa4\x17\x43\x25\xaa\x41\x28\x4c\
-\xa9\xff\x60\xb4\x45\xeb\x10\x1d\x16\xd1\x41\x80\x0e\x8b\x18\x63\
-\x30\xda\xf6\x9a\x4c\x60\x31\x56\x80\x90\x06\xa1\x42\xa4\x17\x22\
-\x54\x88\xc0\x5a\xe7\x31\x0c\x94\x3a\x19\x82\x92\x77\xa0\x67\xb8\
-\xe8\x45\x80\xca\x6e\xa7\xa6\xac\x1d\xac\xb5\x08\x22\x1e\xb2\x36\
-\x2e\x65\x53\x4a\x79\xc3\xaa\x95\x6a\x4c\x48\x19\x8f\x28\xa1\x3c\
-\x4f\x48\xcf\xb3\xda\x42\xa6\xa3\x83\xad\x1b\xd6\xc8\x15\x0b\xe6\
-\xa8\x15\x0b\x66\xab\xd5\x8b\x9e\x53\xad\x3b\xb7\xf4\x67\x3b\x03\
-\x6c\x04\xce\x65\x2f\x2a\x9d\x0f\x34\x01\x8e\xc2\x31\xb4\x1e\xe0\
-\xc3\x1f\x3f\x3d\xbc\xee\x8f\x77\xe6\xd1\x42\xb4\x66\xc3\x70\xf5\
-\xae\x20\xdb\xd5\x92\x2a\x08\x50\x8e\xf5\xda\x58\xa9\x75\x28\x8d\
-\xd6\x2a\x28\x06\x7e\x50\x2c\xc4\x42\xad\x95\x7b\xd0\x16\x84\x40\
-\xc6\x52\xc8\x48\xb2\x74\x0c\xdb\x4d\x00\x53\x76\xfb\xce\x40\x46\
-\x9b\x12\x19\x8a\x84\x61\x80\x09\xc3\x52\x22\xc9\x62\x10\x5d\x49\
-\x22\x2b\x04\xd6\x0a\x23\xa4\x34\x25\xef\x10\x58\xa1\x0c\x42\xea\
-\x92\x90\xb4\xb6\xec\x11\xba\xb4\x83\xc5\x96\x43\x45\x2f\x02\x74\
-\x79\x9e\x2e\x52\x43\xa0\x2d\xda\x5a\xab\x84\x10\x89\x88\x10\x43\
-\x52\xca\x1b\x56\xa5\xd4\xb0\x2a\x57\xc6\x16\xf3\x15\x52\xf9\xe0\
-\x29\x5b\xcc\x87\xa2\x6d\xf7\x76\xb1\x6e\xd9\x02\xb9\x62\xe1\x1c\
-\xb5\x6a\xe1\x6c\xb5\x69\xed\x72\x99\xcb\x74\x54\xda\xf2\x19\x5c\
-\x0d\x65\xe7\xeb\x19\xe4\x40\x12\x20\x8e\x13\x30\xef\x04\x18\x3d\
-\x76\x82\xbd\xf3\xe1\x59\xd9\xa6\xe1\xc3\x6d\x26\xeb\xe2\x7e\xb6\
-\x68\x75\x97\xeb\xef\xea\x7a\x59\x61\x8c\x95\x5a\x6b\x19\xea\x50\
-\xe9\xd0\xa8\x20\x28\x44\xc3\xa0\x10\xed\x7a\xb8\xc6\x82\x8a\xa0\
-\xe2\x55\x08\xcf\xef\x6e\xd5\xa5\x07\xdc\x4d\x00\x7a\xb6\x4c\x51\
-\x26\x9b\x41\x87\x1a\x1d\x14\x08\x83\x22\x5a\x07\x58\xed\xbc\x89\
-\x15\x60\x8d\xc0\x62\xb0\xd6\x69\x0a\x84\xd2\x48\x15\x22\x55\xe8\
-\x34\x84\xb4\xc6\x0a\x83\x74\x1e\xc2\xe5\x18\x64\x99\x00\x16\x4a\
-\xda\xa1\x0f\x02\x94\xaf\xbf\xb2\x67\x11\x18\xa7\x37\x22\x0a\x51\
-\x1b\x97\x6a\x58\xb5\xa7\x46\xd4\x28\x6f\x68\x4a\xc9\x84\x2f\x85\
-\x50\x0a\x64\xc4\x22\x5d\xee\xe3\xa6\x1f\x7c\x29\xfa\xf8\xdf\x6e\
-\x28\xcf\x78\x4a\x03\x27\xe0\x12\x4c\xaf\x8b\x03\x59\x0f\xf0\x03\
-\x4a\xc6\xf7\x7d\x9f\xcb\xaf\xfc\xdf\xfc\xc8\x31\xc3\x4d\x3a\x1d\
-\xc8\x2d\xed\x26\x9f\x2b\x5a\x2d\x4b\x5d\xbe\x32\xac\xb5\xc2\x5a\
-\x5b\x72\xf9\xa1\x67\x74\xe8\x05\x85\x42\x34\xd0\x4e\xe8\x81\xc5\
-\x5a\x81\x17\x4d\x22\x63\xa9\x52\x6b\xdd\x87\x5e\x52\xd7\xb6\x02\
-\xe9\xf9\xe0\xf9\xc8\x88\x45\x9b\xd0\x85\x89\xa0\x88\x0e\x8b\x58\
-\x74\x77\x80\x47\x60\x6d\xa8\x4c\x10\x2a\x8b\x88\x5a\x29\x8c\xeb\
-\x66\x7a\x21\xd2\x0b\x05\xc2\x18\x21\x35\x74\x09\x48\x0b\xc2\x82\
-\x34\x15\xe7\xeb\xf3\x22\xcb\xf5\x8c\xbe\x12\xc2\x3a\x11\xc9\xb6\
-\x4e\xa3\x37\xb7\x15\xc2\x45\x52\x14\xab\x62\x52\x0e\x49\x4a\x39\
-\x69\xa8\xe7\x8f\xae\x0d\x7c\x15\x4b\xd8\x75\x4b\x17\xc8\xe7\x67\
-\xfc\xb5\xd2\x8e\x57\xb1\x97\xc6\x87\x03\x47\x80\x4f\xe1\x6a\xfb\
-\x00\xf8\xd2\x37\xbf\x5b\xfc\xe0\x47\x3e\xac\xb3\xe9\x50\xee\xca\
-\x98\xe2\xae\xac\x2e\x4a\x59\x61\x7c\xeb\x22\xae\x35\x2e\xa1\x63\
-\x42\xa3\xc2\xa0\x18\x2d\x06\x85\xa8\xd1\x46\x0a\x4a\xea\x4b\x7a\
-\xf8\xb1\x2a\xa4\x1f\xc3\x1a\xbb\x6f\xc6\xef\x8d\x8a\x7d\x85\xf4\
-\x51\x51\x1f\xe9\x27\xf0\xac\x26\x0c\x02\x74\x58\x40\x07\x45\x08\
-\x75\x8f\x6d\xad\xd1\xd2\xa2\xa5\x31\xa1\x6f\x85\xb0\x02\xa5\x8d\
-\x14\xa1\x70\xda\x41\x97\x7b\x12\x94\x12\x51\x2e\x34\x48\x63\xcb\
-\xa2\xa3\x7c\xc7\x7d\x40\xb8\x5a\x46\x94\x10\x42\x5b\x68\xcd\x1a\
-\xb3\x33\xad\xf5\x84\x46\xcf\xf7\x3c\x8f\x7c\x2e\xc3\xad\x57\x7c\
-\x23\x9a\xe9\x68\x2d\x7b\xf2\x79\xc0\x15\xfb\x72\xdb\x07\x82\x00\
-\x13\x71\xaa\x5f\x02\xbc\xf7\x03\xa7\xe9\xff\xb9\xe8\x3b\xc5\x42\
-\xde\x88\x74\xc1\xe8\xad\xed\xba\x20\x4a\xa1\xc8\x35\x32\x2b\x5c\
-\x9c\xb7\xd2\x58\xa3\xc2\x20\xe8\x12\x7a\xe5\x84\xb0\xc5\x22\x23\
-\x71\x54\xac\x0a\xa4\x72\x0a\xec\x2d\x85\xed\x36\x89\x90\x28\x3f\
-\x86\xf0\xa3\xa8\x68\xa5\x90\x2c\x12\x06\x41\xa9\x5b\x69\xcb\xa4\
-\x10\xc6\x06\x9e\xd1\xd6\xb3\xb6\x88\x75\xe1\x41\x23\x3d\x8d\xf0\
-\x42\x2b\x30\x08\xe5\x72\x0f\x95\x2f\x2b\x4c\xf9\xb4\x7b\xf2\x0e\
-\xda\x5a\x7b\xdc\xa8\x48\xf4\xb0\x21\xbe\xaf\xa2\x51\x3b\xe3\x96\
-\x6b\x22\xab\x5f\x7c\xa6\x5c\xd4\x53\x00\xbe\xc6\x3e\x96\xb6\xef\
-\x6f\x02\xc4\x70\xa9\xde\x26\x80\x11\xa3\xc6\xd8\x1f\x5d\xfd\xeb\
-\x7c\x24\xe2\x93\xc9\x16\xcd\xa6\x36\x9d\x0b\x0d\x46\x80\x28\x0f\
-\xe0\x20\x90\x6d\xbb\xb6\xf9\x2d\xdb\xb7\x78\xa3\x27\xbd\x5d\x16\
-\xf3\xd9\x98\xd6\xa6\x74\x93\x16\x21\x25\x7e\x34\x85\xf2\xe3\x18\
-\x2b\x30\x6f\xa6\xd5\xef\x2d\x2a\x9a\xab\x50\x3e\xca\xf3\x51\x91\
-\x04\xca\x18\x74\x50\x40\x87\x01\x61\x50\xc4\xea\xb0\xbb\x3b\x01\
-\x58\xab\x95\xd5\x5a\x41\x48\x29\xe1\x14\x5a\x97\x84\x0a\x11\x52\
-\xbb\x6e\x25\xb6\x94\x8f\x28\x3d\x02\x69\x2a\xcf\x5c\xfe\x27\xd4\
-\xd6\x0e\xab\x52\x6a\xda\xa8\x48\xc4\x8b\xc6\xec\xda\x97\x16\xc8\
-\xfb\x6e\xfc\x59\xa4\x62\xdb\x5f\xe0\x26\xbb\xee\x13\xf6\x37\x01\
-\x2e\xc3\x55\xf6\x22\xa5\xe4\x7b\x3f\xbb\xae\x30\x7e\xe2\x18\x93\
-\xee\x0c\xe4\xd6\x0e\x93\xcf\x94\xe2\xbe\x29\xe5\xdf\x8c\xd6\xca\
-\x58\x94\x52\xca\x5b\x34\xe7\x91\x78\x43\xf3\x68\x05\x52\x94\x5d\
-\xbe\x54\x11\x54\xbc\x1a\xa1\x3c\x27\xfc\x0e\xca\x44\x1e\xdb\xe5\
-\x20\x84\x90\xa8\x48\x1c\x11\x89\x23\xb5\x41\x87\x21\x3a\x28\x40\
-\x50\x40\xeb\xb0\x5b\xe5\x09\x8b\xeb\x2a\x04\xbe\xd1\xa1\x6f\x29\
-\x58\x2b\x4a\x79\x06\xa9\xb4\x15\x2a\x14\x42\x1a\x4b\x29\xe7\xd0\
-\x95\x7b\x10\xa6\x24\x16\xad\x14\x88\xe9\x63\xa2\xd1\x54\xcc\x93\
-\x41\x31\xb0\x77\x5c\xfb\xed\x68\x2e\xdd\x35\xf1\x75\x29\x6e\xba\
-\xfc\x3e\x63\x7f\x56\x05\x7f\x14\xb8\xb8\xfc\xe6\xfc\xff\xb9\x28\
-\xf8\xc8\x27\x3f\x1e\xe4\x32\xa1\x6c\xc9\x9a\xe2\xee\x8c\x29\x4a\
-\x89\xc4\x5a\x61\x8d\x51\x5a\x87\x9e\x0e\x43\x2f\x28\xe4\xfd\x44\
-\xaa\x36\xae\x83\xc0\x9b\xfd\xe0\xad\x22\x9a\x48\x02\xe0\xc5\x52\
-\x44\x53\x75\xae\x3b\xd4\x4f\xab\x97\xca\x43\xc8\x03\x5c\xe8\xdc\
-\xe5\xfe\x05\xd2\x8f\xe0\xc5\xab\x88\xa4\xea\x89\xa6\xea\xf1\x13\
-\x35\xa8\x48\x1c\x44\x97\x03\xeb\x0a\x15\xd6\x84\x9e\xd1\xc5\xa8\
-\x0e\xf2\x09\x53\xcc\xa6\xc2\x62\x36\x69\x82\x7c\xcc\xe8\x20\x62\
-\x75\xe0\xdb\x30\xf0\xd0\xa1\x8f\xd1\x5e\x10\x84\xea\x88\x26\x15\
-\x9d\xd0\xa0\x22\x2a\x1a\x33\x4f\xdc\x7d\x93\xbf\xe4\xb9\xc7\xca\
-\xae\x5f\xe3\xf4\x55\x9f\xb3\x5e\x5f\x0f\xfb\xab\x28\x74\x2c\x70\
-\x37\x50\x0b\xf0\xee\x93\x4f\xd5\x57\x5c\xff\xfb\x3c\x28\x99\xce\
-\x6b\xbd\xb1\xd5\xe4\xb5\xeb\x7f\x49\xad\xb5\x17\x6a\xed\x14\x7e\
-\x50\x8c\x14\x0b\xf9\xb8\x90\x4a\x45\xe3\x49\xee\xba\xf6\xdb\x8c\
-\x3a\xfc\x68\x46\x4d\x99\x8e\x15\xce\x59\x95\x6d\xdf\xad\x17\x1d\
-\xfc\x58\x82\x8e\x5d\x5b\x28\xe4\x32\x44\xe2\xa9\x2e\x41\xd8\xb5\
-\x9d\xed\xe9\x2f\xfa\xe2\x50\x49\x62\xbc\xd6\xaf\xd8\xd7\x9e\xaf\
-\xf7\x7e\xb6\xf7\x06\x42\xa1\x94\x8f\xf0\xa3\xc8\x68\x1c\xa9\x22\
-\x50\x22\xa7\xed\xd2\x0d\x80\x10\x58\x63\x84\xb5\x46\x19\xad\x7d\
-\xa3\x83\x88\xd1\xda\xb3\x46\x7b\xd6\x5a\x19\x6a\x23\x6a\xe2\xc2\
-\x3b\xe5\xb0\x64\x2c\x19\x8f\xb3\x71\xed\x72\xf5\xeb\xef\xfe\x77\
-\xb4\x90\xcf\x96\x85\xdf\x0d\xb8\x42\x9a\xb2\x2d\x05\xfb\xd0\xbd\
-\xdf\x1f\xcd\xc5\x2f\x5d\xd4\x48\x80\x61\xcd\x23\xec\x4f\xaf\xfd\
-\x5d\x3e\x1e\x8f\x92\x2f\x68\xbb\xb9\x4d\xe7\x03\x6d\xad\xc0\xe5\
-\xf0\x75\x18\x7a\x3a\x0c\xfc\x62\x21\x17\x0f\x0a\xf9\xb8\x94\x4a\
-\xe6\xd2\x1d\x3c\x72\xeb\x35\xa4\xdb\x5a\xf8\xd3\x15\xff\x97\x8d\
-\xab\x97\x10\x4f\xa4\xfa\x3d\x61\x34\x9e\x64\xd5\xdc\x47\x79\xe4\
-\xf7\xdf\x43\xf9\x51\x84\xe8\x79\x5b\x52\x1d\x8c\xea\xf7\xee\x5e\
-\x89\x10\x12\x11\x89\xe1\x25\xaa\x89\x54\x95\xbc\x43\xbc\x1a\xe9\
-\xc7\x10\xa2\x64\xaf\x2e\xf6\x59\x61\x75\xe0\x9b\xa0\x10\xd3\x85\
-\x4c\xca\x14\x33\xa9\xe3\x46\xa8\x64\x55\x14\xbf\x10\x14\xd5\x9f\
-\xae\xf9\x76\xb4\xa3\xb5\x6b\x8c\xe0\x15\x9c\xc6\x1a\x8e\x6b\x6c\
-\x09\x5c\xc5\xb2\xa4\x9b\x08\x7b\x24\xc4\xfe\x20\xc0\xf7\x70\x65\
-\xd4\x28\xe5\xf1\x83\xab\xae\x2f\x1c\x3e\x79\xbc\xc9\xe7\x42\xb1\
-\xad\x43\x17\xd2\x05\x6d\xb0\x65\xc3\x87\x5e\x18\x14\x23\x41\x3e\
-\x97\x08\xc3\xc0\x07\xf0\xfc\x08\x8f\xdc\x76\x2d\x4b\x9e\x9f\x09\
-\x40\xcb\xf6\x8d\xfc\xee\xe2\xd3\x59\xbd\x70\x16\xf1\x54\x55\xe9\
-\x81\x75\xc3\x8f\xc4\x59\xbf\x6c\x1e\xb7\x5e\x76\x16\x47\x9c\x70\
-\x1a\xd5\x8d\xcd\x98\x8a\x4a\x5e\xcf\xf7\x69\xdb\xbe\x81\x7c\xa6\
-\xfd\x35\xc4\x38\xa0\xa8\x08\x15\x42\xf9\xf8\xb1\x24\x91\x64\x1d\
-\x91\x54\x03\x7e\xb2\x16\x15\x4d\x20\xa4\xcb\xe5\x94\xb9\x10\x84\
-\x86\xc3\x87\x44\xd4\x84\x46\xcf\x33\xd2\xf7\x9e\xbc\xe7\x0f\x91\
-\x85\x4f\x3f\x54\xbe\x09\x0d\xfc\x1d\x67\xfc\x77\x00\x87\xe3\x3c\
-\xef\x30\xba\xc9\x10\xc5\x35\xc8\xde\x84\xe8\xc2\x5b\x1d\x02\x4e\
-\xc5\x4d\xe8\x90\x00\x9f\xfb\xd2\x05\xc1\x17\x2f\xf8\x5a\x31\x97\
-\x35\xb2\x35\xa3\x83\x2d\x1d\x61\x80\xd5\x9e\x0e\x43\x15\x86\xa1\
-\x17\x04\x85\x58\xb1\x90\x8f\x5b\x6b\x84\x4b\xc6\x78\xec\xda\xb6\
-\x89\x3f\x5d\x7d\x11\x61\x50\x24\x95\x4a\x71\xf2\xc9\x27\xb1\x7c\
-\xf1\x42\x16\xcf\x7e\x88\x86\xe1\xe3\x19\x79\xf8\xdb\x5d\xce\xdf\
-\x98\x2e\x97\xfa\xa7\x1f\x7e\x06\xe5\xf9\x7c\xfc\x6b\x57\xa1\x83\
-\xa0\xbb\xe5\x29\x8f\x4c\xeb\x4e\x56\xcf\x9b\xc1\x88\x49\xd3\x9c\
-\xbb\xed\x52\xe8\xaf\xbd\xf8\xb7\x24\x04\xf4\x75\xcc\x3e\xf6\xeb\
-\x0a\x49\x42\x81\xf4\x90\x7e\x0c\xe5\xc7\x90\x5e\x14\x21\x15\xda\
-\x18\x52\x51\xc9\xfb\x26\xd7\x90\x4c\xc4\xd9\xbe\x79\x03\x37\x7c\
-\xff\x0b\x22\x9f\xed\x11\xea\xab\x70\xf3\x16\xea\x70\x06\xaf\x2a\
-\xbd\xe2\xa5\xf7\x29\x5c\x4f\xac\x5f\x4f\xf0\x56\x36\x89\xe1\xc0\
-\xef\x28\xf5\x2c\xa6\x1d\xff\x1e\x73\xe1\x65\x3f\x2c\x04\x45\x2b\
-\x72\xc5\xd0\x6c\x69\x0f\x02\x13\x86\x4a\xeb\xd0\x0b\xc3\x20\x52\
-\x2c\xe4\x92\x41\xb1\x10\xab\x3c\x40\xa2\x66\x08\xab\x5f\x9a\x4f\
-\x2e\xd3\x89\x52\x8a\x4b\x2f\xbd\x94\x7c\xbe\x80\x15\x82\x74\xdb\
-\x2e\x6e\xfa\xce\x59\xdc\x73\xdd\xc5\xe4\x33\x1d\xc4\x92\x55\xf8\
-\x7e\x94\xad\x2f\x2f\xe5\xe5\x45\xb3\x39\xfa\xfd\xa7\x13\x8d\xa7\
-\xb0\xb6\xbb\x17\xe5\xf9\x11\x16\xcd\xf8\x13\xb5\xc3\xc6\x12\x89\
-\x27\xdf\x5c\xa2\x68\xbf\xc1\x76\x7b\x07\xe1\x84\xa4\x1f\xab\xc2\
-\x4b\x35\x70\xfc\xe4\x66\x1a\x6b\x53\xa0\xa2\xdc\x73\xc3\x4f\x68\
-\xdd\xb9\xb5\x72\x47\x09\x4c\xc1\xe5\xfc\xbf\x82\x13\xdc\x5f\xc2\
-\x4d\x69\x3b\x09\x98\x86\x9b\xeb\x78\x14\x8e\x24\xa3\x71\xdd\xf1\
-\x6a\x9c\x67\xf0\xca\x07\x79\x2b\x20\x81\x5f\xe3\xd6\xef\xa1\xa1\
-\x71\xa8\xfd\xd9\xb5\xbf\xcb\x57\xd5\x24\xc9\x17\x02\xb1\xa9\xa5\
-\x18\xe4\x8a\x45\x65\x74\xe0\x07\x85\x42\xb4\x90\xcb\x26\xb4\x0e\
-\xbb\x54\x9d\x50\x1e\x7e\xb2\x1e\x2f\x9e\x60\xdb\xc6\x35\x00\x4c\
-\x9f\x3e\x9d\x69\xd3\xa6\x31\x67\xce\x9c\x2e\xc3\x69\x1d\xf2\xd8\
-\x6d\x57\x72\xcd\x17\x4f\x61\xc1\x8c\x3b\x89\x44\x7d\x76\xbe\xea\
-\xb6\x1f\x32\x72\x22\xc6\x74\x8f\x7e\x2a\xcf\x67\xd7\xab\x6b\xd8\
-\xb4\xea\x05\x46\x4d\x39\x8e\xb0\xff\xa1\xd4\x81\x05\x6b\x09\xb4\
-\x61\x42\xbd\xcf\xa4\x61\x31\xbc\x54\x35\xf3\x9e\x78\x80\x67\x1f\
-\xb9\xcb\x7d\x2f\x04\xc9\xa1\xe3\x90\x5e\x65\x0a\x00\x89\x6b\x80\
-\xef\x01\x3e\x8b\xeb\x7e\x7f\x13\xf8\x4f\x5c\x38\x3e\x1e\x57\x80\
-\x73\x24\xce\x46\x4d\x38\xcf\xf0\x96\xa9\xa3\x6f\x01\xff\x0e\x20\
-\xa4\xe4\xf2\x9f\x5d\x5b\x38\xfa\x98\x29\xa6\xa3\x3d\x10\xdb\xda\
-\x8a\x61\x7b\xb6\x88\xd5\xa1\x5f\x28\x14\x62\x61\x18\xf8\xdd\x25\
-\x9e\x02\x15\x4d\x22\x63\x49\x10\x12\x2c\xc8\x52\x9c\x9e\x3c\x79\
-\x32\x43\x87\x0e\xed\xf3\x64\xdb\x5e\x59\xc6\xcd\x97\x9e\xcd\xbc\
-\x7f\xfc\x99\x44\x55\x2d\x00\xb9\x74\x1b\x52\x75\x47\x34\x2f\x12\
-\x63\xd9\xac\x7b\x49\xd5\x35\x91\xac\x69\x24\x97\x7e\xdd\x81\xb1\
-\x01\x01\x6d\x21\x19\x91\x1c\x3b\xca\x27\xe2\x47\xd8\xb1\x69\x23\
-\x77\xfc\xf2\x92\xae\x46\x30\x62\xfa\x27\x39\xe6\xfc\xeb\xe9\xdc\
-\xb4\x82\x5d\x2b\xe7\xb0\x6b\xf9\x2c\x5a\xd7\x2d\xa0\x98\x69\xad\
-\x3c\x4c\x15\xdd\x73\x1c\x43\x5c\xa1\xe9\xcb\xb8\xf2\xf4\xc5\xc0\
-\x32\xdc\xd8\x58\xf0\x56\x68\x80\x93\x71\x0b\x33\x2a\x80\xcf\x9c\
-\xff\x95\xe0\xeb\xdf\xba\x38\xc8\xa5\x43\xd5\x92\x2e\x9a\x4d\x2d\
-\x79\xab\x75\x10\x2d\xe6\xf3\x09\xad\xb5\x07\x2e\x99\x2b\x84\xc2\
-\x8b\x57\xa3\x62\x29\x9c\x0a\xb6\x28\xdf\xa7\x6d\xd7\x76\x16\x3e\
-\x79\x3f\x11\xdf\xe7\xbb\x97\x5e\xca\xf2\xe5\xcb\x59\xb6\x6c\x59\
-\xd7\xc9\x26\x4f\x9e\xcc\xad\xb7\xde\x4a\x36\x9b\x61\xd6\x8c\x07\
-\xd8\xb2\xf6\x25\x00\x3a\x77\x6f\x63\xea\xfb\x4f\xc7\x8f\x27\xd1\
-\xda\x79\x82\x39\x77\xfd\x92\xa1\xe3\xa6\x30\x6e\xea\x49\x04\xc5\
-\xc2\x81\xe9\x06\xf6\x75\xcc\x3d\xec\x57\x79\x2d\x16\xd0\xc6\x72\
-\xdc\xe8\x08\x63\xeb\x23\x08\x3f\xc2\xed\x57\x5d\xc4\xb2\xb9\x4f\
-\x00\x10\xad\x6a\x64\xda\x97\x6f\x22\x56\x3b\x8c\x78\x6d\x33\x43\
-\x8e\x38\x89\xe1\xc7\x7d\x82\x11\x27\x7c\x8a\xfa\xf1\xc7\xe2\xc5\
-\xab\x28\xa6\x5b\x09\x73\x1d\x95\xa7\x91\xb8\xca\xeb\x71\xb8\xca\
-\xeb\xad\xb8\x7a\x81\x56\xa0\xe3\xcd\x12\x60\x28\xae\xbf\xdf\x04\
-\xf0\xb6\xa9\xc7\xea\x6b\x6e\xb8\xa5\xe0\xa9\x88\x4c\xe7\x0a\x62\
-\xc3\xae\xac\xc9\xe5\x8b\xd1\xb0\x58\x88\x97\x86\xc5\x00\x8b\xf4\
-\xa3\xf8\x89\x5a\xa4\x17\xed\x11\x97\x8d\xb6\x34\x34\x8f\x66\xe1\
-\x53\x0f\xb2\x6a\xf9\x4b\x8c\x19\x33\x86\xcb\x2f\xbf\x1c\x6b\x2d\
-\xa9\x54\x8a\xf7\xbd\xef\x7d\x5c\x7d\xf5\xd5\xbc\xeb\x5d\xef\xe2\
-\xd3\x9f\x3e\x93\x53\x4f\x39\x05\x19\xaf\x61\x67\x3a\x64\xd3\xaa\
-\x85\x6c\x7b\x65\x19\xe3\xa7\x9e\x48\xaa\xbe\x09\x6b\x0d\x0b\x1e\
-\xbe\x05\x2f\x12\x63\xd2\x09\xa7\x11\x14\xf2\x03\x9e\x00\x81\xb6\
-\x8c\xaa\xf5\x98\x3e\x3a\x4a\x24\x9e\x60\xc1\xd3\x0f\x73\xc7\xd5\
-\x97\x74\xe9\x9a\x23\x3f\xfd\x03\x86\x1d\xf3\x6f\xe8\x7c\x06\x6b\
-\x42\x4c\x58\x40\x00\x91\x44\x2d\xb5\xe3\x8f\xa1\xf9\x1d\x1f\x61\
-\xd4\x09\x67\xd0\x74\xf4\x07\x08\x73\x1d\xa4\xb7\xae\xa9\x3c\x9d\
-\x01\xfe\x81\x9b\x93\xb0\x15\xe7\x15\x32\x6f\x86\x00\x02\xb8\x99\
-\x52\xaa\xb7\xa6\xa6\xd6\xfe\xee\xb6\xbf\x15\xc6\x8e\x1f\x47\x36\
-\x5b\x90\xeb\x77\x66\x68\xed\xcc\x46\x4d\x18\x46\xdc\x4d\x3a\x91\
-\xa3\x62\x29\xbc\x78\x35\x48\xe5\x06\x52\x2a\x1f\x88\x31\xc4\x92\
-\x55\x4c\x78\xdb\x3b\x59\xf9\xc2\xd3\xdc\x71\xdb\xcd\x4c\x9a\x3c\
-\x89\x0b\x2e\xb8\x80\x73\xce\x39\x87\x8f\x7d\xec\x63\x3d\xc2\xc2\
-\xe8\x31\x63\x18\x77\xfc\x87\x49\xbd\xfd\x4c\x1a\x9b\xc7\xb2\xf8\
-\xc9\xbb\x59\x34\xf3\x2e\xc2\x20\x4f\xd3\x98\xc3\xe8\xd8\xbd\x83\
-\x05\x7f\xbf\x99\xa3\x4f\x3d\x93\x68\xaa\x96\xca\x89\x9e\x03\x8d\
-\x00\xda\x42\xd4\x13\x9c\x34\x21\x46\x4d\x32\x4a\x7b\x6b\x0b\xd7\
-\x5d\x7c\x0e\xed\x2d\xdb\x01\x18\x7a\xf4\xa9\xbc\xed\xec\x9f\x62\
-\x82\xa0\xd7\xd1\xac\xeb\x15\x85\x6e\x2c\x22\x56\xd7\x84\x09\x0b\
-\xac\x7f\xfa\x16\x0a\xed\xdb\xcb\x1b\x95\x8d\x3f\x13\x57\x69\xbc\
-\x16\x37\xf5\xbd\xf0\x66\x08\xf0\x4d\xe0\x1b\xe5\x37\x3f\xbd\xfa\
-\xd7\xc1\x87\x3e\x7a\x9a\xcd\x74\xe6\xd5\xa6\xdd\x19\xb5\x6d\x77\
-\x67\x04\x6b\x95\xbb\x41\x8b\xf4\x7c\xbc\x64\x2d\x2a\x1a\x07\xd3\
-\xff\x83\xd1\x61\x48\xe3\x88\xf1\x1c\x7d\xe2\x47\xd8\xb5\x7d\x13\
-\xbf\xfe\xc5\x4f\xe9\x68\xdb\xcd\xf4\x77\x1e\x4f\x3c\x1e\xef\xb1\
-\x6d\x47\xc1\xf2\xf0\x92\x0c\x81\x91\x8c\x3d\x6a\x3a\xc7\x7c\xf0\
-\x4c\x9a\xc7\x1f\x85\x52\x11\xbc\x68\x92\x91\x47\x4c\x67\xee\x7d\
-\xbf\x63\xf3\xea\x05\x4c\x3a\xe1\x23\xc4\x92\xb5\xe8\x30\x74\xe3\
-\x89\x03\x8c\x00\xa1\xb1\x1c\x3b\x32\xca\x84\xc6\x08\xd2\x8f\x72\
-\xc7\xb5\x97\xb2\xf0\xe9\x07\x01\xf0\x13\xb5\x1c\xf7\x25\xe7\xfa\
-\x8d\x2e\xf6\x7d\x22\xc0\x8b\x57\xd1\xba\xee\x05\x9e\xbf\xfa\xd3\
-\x74\x6e\x59\x55\xfe\xb8\xd2\xf8\x6b\x81\xd5\xc0\x36\x4a\x35\x83\
-\x6f\x94\x00\x27\xe2\x5a\xbf\x0f\x70\xce\x7f\xff\x9f\xf0\x1b\xdf\
-\xbe\x4c\x67\x33\x05\xb5\xb3\x2d\xe3\x6f\xd8\xd1\xe9\xb9\x35\xbb\
-\x9c\xd0\xf3\x62\x49\xbc\x44\x0d\x42\x79\x5d\x1d\xe0\x3d\x3d\x98\
-\x20\x28\x92\xaa\xa9\xe7\xd8\x53\x3f\xc5\x88\x89\x47\xf3\xf0\x43\
-\x0f\x72\xe7\x6d\x7f\xa4\x75\xf7\x0e\x84\x35\x68\xad\xd9\xb4\x6d\
-\x37\x4f\xac\x97\xec\xc8\x08\x94\xb0\xe8\x20\xc0\x8b\xc6\x19\x32\
-\xfa\x70\x86\x8e\x3d\x8a\x58\xaa\x86\x44\x4d\x23\xf5\x23\x26\xf0\
-\xf4\xed\x3f\xe7\xe5\x05\x8f\x53\x3f\x62\x3c\x75\xcd\x63\xf1\x63\
-\x49\x6c\xb9\x54\x87\x5e\xe9\xe5\xbd\x20\x80\x10\x12\x84\x44\x48\
-\x55\xfa\xae\x6f\x42\x55\xde\xdf\x9e\x08\x10\x68\x4b\x73\x8d\xe2\
-\xf8\x31\x51\xa2\xf1\x04\x2f\xce\x79\x94\x5b\x7f\xfe\x0d\x97\xeb\
-\x00\x8e\x3c\xe3\x7b\x0c\x9f\xfe\x49\x74\xa1\xff\x39\x22\x5e\x3c\
-\x45\xdb\x2b\x2f\x32\xef\xda\x73\xc9\xec\x5c\x5f\xfe\x38\x04\x1e\
-\xc1\x55\x60\x97\x8d\xbf\x15\x37\x51\x55\xc3\x1b\x2b\x09\x1b\x82\
-\x9b\xa4\x30\x09\xe0\xa8\xa9\xc7\x98\xbb\x1e\x7c\x3c\x48\x24\x93\
-\xb2\xad\x3d\xe3\xad\xd9\xda\x21\x0a\x61\x69\x5e\x96\x54\xa8\x58\
-\x35\x32\x12\x2b\x55\xc7\x5a\xa0\xd7\x7c\x3c\x5b\x6e\x41\xf6\x35\
-\xa5\x52\x56\x48\xfc\x68\x9c\x62\x3e\xc7\xc6\x35\x4b\x59\xbf\x72\
-\x11\x9e\xb0\xd4\x37\x35\x33\x74\xec\x91\x44\xaa\x86\xb8\x3b\x28\
-\xef\x47\xef\xc9\xa1\x02\x3f\x9e\x64\xf1\xcc\x3b\xb8\xe7\x67\x9f\
-\x27\x28\xe6\x99\x78\xdc\x07\x99\x72\xf2\xe9\x8c\x9e\x7a\x32\xf1\
-\xea\x06\x54\xc4\x25\x60\xac\x10\x68\x63\xb0\xda\xa2\x4b\x65\xe4\
-\xb6\x64\x24\x6b\x24\x56\x00\x42\xa1\x8d\x26\x28\xe6\xc8\x77\xb4\
-\x90\x4f\xb7\xe3\xc5\x92\x44\xaa\x1a\xd0\xda\x74\x79\x82\x1e\xf7\
-\x52\x3a\x46\xe5\xe4\xd5\xca\xfb\x74\xf3\x4a\xe0\x43\x93\x63\x34\
-\xd7\xc4\xc8\x64\xb3\x5c\xfe\x99\x93\xd9\xb0\xca\x89\xdb\xc6\x23\
-\x4e\xe4\x5d\x17\xdd\xeb\x08\x63\xfa\x2e\xf2\xf5\xe2\x55\xb4\x6f\
-\x78\x89\xb9\xd7\x9c\x59\x69\xfc\x72\xa6\xf0\x29\x5c\x0f\x60\x55\
-\x2f\xe3\x5b\xd8\xf7\xe1\x60\x09\x5c\x5d\x36\x7e\x2a\x55\x65\x7f\
-\x7c\xd5\xff\x86\xd5\xd5\x35\x5e\x47\x47\x87\xda\xdc\x92\xa1\x18\
-\x1a\x97\x77\xf4\xa3\x78\xf1\x6a\xac\xf4\xde\x70\x02\xc6\x5a\x43\
-\x21\x97\x06\x24\x63\x26\x4d\x65\xec\x91\xd3\xdc\x04\x0c\x1d\x12\
-\x04\x45\xac\x31\x98\x3d\x1f\x81\x42\x36\xcd\xd1\xa7\x9c\x45\xed\
-\xb0\x71\x3c\x79\xeb\x4f\x58\xfd\xfc\x23\xac\x9d\x3f\x83\x58\xaa\
-\x96\xba\xe1\xe3\xa9\x69\x1a\x4b\xf5\x90\x91\x24\xea\x9a\x88\x55\
-\xd5\xa3\x22\x71\x54\x34\x81\x45\x60\xb4\xc1\x58\x43\x3e\xdd\x49\
-\xa6\xb3\x0d\x82\x2c\xf9\xce\x5d\xe4\xda\x76\x52\x3d\x6c\x3c\xc3\
-\x8e\x3a\x89\x86\x71\x53\xe9\xbb\x7d\xef\x1d\xb4\x85\xa9\xcd\x3e\
-\x4d\x55\x1e\x2a\x12\xe1\xa1\xdf\xfe\xa4\xcb\xf8\x2a\x9a\x60\xca\
-\x19\x97\x23\xfd\x58\xbf\xad\xdf\x8b\xa5\x68\xdf\xb0\x84\xf9\xff\
-\xfb\x99\x4a\xe3\x1b\xdc\xe4\x91\x59\xb8\xf1\x82\x35\x38\xb7\xdf\
-\xc3\xf8\xb0\xef\x1e\xe0\x02\xe0\x9a\xf2\x9b\x1f\xfe\xfc\x5a\xf3\
-\xd9\x2f\x7d\x8d\xce\x8e\x76\xb9\xbd\x2d\xc7\xe6\x96\x2c\x42\x28\
-\x54\x34\xe5\x1e\xa2\x2d\x95\x48\xd3\x5d\x01\xbb\x2f\x1e\xc0\xf4\
-\xfa\xbc\xbb\x75\x57\x4c\x0d\x73\x87\xec\xc7\x03\x74\x9f\x53\xf9\
-\x71\x42\x1d\xf2\xea\xf2\x79\xbc\x3c\xf3\x46\x66\x3f\xf4\xe7\xd7\
-\x35\x9b\xef\x7b\xc4\x62\x31\x46\x0c\x6f\x66\x58\x53\x13\x4f\xcd\
-\x9a\xd3\xf5\xdd\x71\x67\x7f\x8f\xe9\xe7\xfd\x80\x6c\x7b\x8b\xab\
-\x32\xae\x38\xe7\xde\x7a\x80\xa2\x86\x86\xa4\xe0\x83\x93\x62\x24\
-\x93\x49\x56\x2c\x78\x96\x1f\x7f\xfe\x43\xe4\x73\xce\xd8\x93\x3f\
-\x79\x09\x47\x9c\xfe\x3d\xc2\x5c\x9a\xbe\x48\xe6\xc5\xab\x68\x5b\
-\xb7\x90\x79\xbf\x3a\x8f\xcc\x8e\x57\xca\x1f\x1b\xe0\x51\x9c\xdb\
-\x2f\xb7\xfc\x2d\xb8\xe1\x62\xd3\xfb\x40\x7b\xe3\x01\x14\x8e\x35\
-\xef\xa3\x62\x41\xe5\x4f\x9c\x71\x36\xe7\x7e\xf6\x8b\x22\x9b\x4e\
-\x8b\x8e\x6c\x91\xed\x6d\x39\x3c\xaf\x5c\xb0\x11\xc1\x1a\xf3\x66\
-\x1a\xc6\x5b\x8e\xa0\x90\x43\x23\x99\xfa\xee\xf7\x71\xfc\x90\x34\
-\xb3\x1f\xfa\x73\xbf\xdb\x5e\x76\xd9\xa5\x9c\x74\xe2\x49\xd4\xd5\
-\xd7\x31\xbc\x79\x38\x75\x75\x75\x44\xa2\x51\xce\x3d\xe7\x1c\xee\
-\xb8\xf3\x4e\x00\x76\xac\x59\x40\x3e\xdd\xd1\x15\x82\xf6\x15\xc6\
-\xba\x7a\xbf\x69\x23\xa3\x24\xa2\x3e\xb9\x6c\x86\xdb\xae\xba\xb8\
-\xcb\xf8\x75\x13\xa6\x31\xf1\xb4\xaf\xa3\x8b\xf9\x3e\x4f\xe0\xc5\
-\xab\x68\x7b\x65\x21\xf3\xae\x3b\xb7\x77\xcb\xdf\x6b\xe3\xc3\xeb\
-\x13\xc0\xc3\x11\xe0\x30\xdc\x6a\x9d\x49\x80\x49\x47\x1c\xc9\xa5\
-\x3f\xba\x02\x6b\x8d\xc8\x15\x8b\x6c\x69\xcd\x21\x23\x49\xbc\x58\
-\x0a\x8b\x1c\xa0\x39\x77\x17\x52\x6c\x51\x33\xac\xc6\xeb\xd7\x66\
-\x52\x4a\xce\x3e\xfb\x1c\x26\x4f\x9e\xfc\x9a\xef\x3e\xfb\xb9\xcf\
-\x71\xd7\x5f\xfe\x82\x31\x86\x5c\xfb\x4e\x74\x50\x70\x05\x2a\x6f\
-\xe0\xe7\x06\x42\x63\x79\x5b\x73\x84\xe1\x35\x0a\x15\x89\xf2\xd0\
-\xef\xaf\x64\xd5\xa2\x67\x01\x50\x7e\x8c\xa3\xce\xfc\x11\x5e\xac\
-\xaa\x4f\xd7\xef\xc5\x52\xce\xf8\xd7\xf6\x69\xfc\x27\xd8\x4b\xe3\
-\x43\xff\x63\x01\x12\xa7\xf0\x93\x40\x33\xf0\x73\x4a\x71\x3f\x16\
-\x8b\xf3\x83\x9f\xfd\x92\xa6\xa6\x61\x14\xf3\x79\xb6\xb7\x17\x31\
-\x7e\x15\x91\x44\xb5\x2b\x63\x1d\xa0\xc6\x2f\x23\x93\xcf\x33\xed\
-\xf8\xf7\x70\xf8\xc4\x09\x7d\x7e\x3f\x6d\xda\x34\xc6\x8f\x1f\xdf\
-\xe7\x77\x47\x1d\x75\x14\x89\x44\xe2\x4d\x5f\x83\x36\xd0\x90\x90\
-\x1c\xd5\xec\xe3\x45\xe3\xbc\xbc\x6c\x11\xf7\xff\xe1\xca\xae\xef\
-\xc7\x9d\xfa\x05\x1a\xa7\x9c\x8c\x2e\xbc\x76\x55\x19\x2f\x96\xa2\
-\x73\xf3\x0a\xe6\xf5\x8c\xf9\xe0\x5a\xfd\x53\xb8\x7e\xfe\x1a\x9c\
-\xe0\xcb\xb0\x07\xe3\xc3\x6b\x09\x20\x70\x2d\x3e\x8e\x53\xfb\xcd\
-\xb8\xb8\xff\xf1\xf2\x06\x5f\xbf\xf8\x52\xde\xfd\xde\xf7\x93\xcd\
-\xa4\x69\x2d\x08\x72\x22\x85\x1f\x8b\x63\x07\x92\xbf\xef\x07\x52\
-\x08\x3a\x3a\xb3\xb4\x66\x72\xdc\x72\xcb\xcd\x8c\x18\x31\xa2\xc7\
-\xf7\x13\x27\x4e\xe4\x37\xbf\xf9\x0d\x91\x48\xa4\xcf\xfd\x95\x52\
-\x5d\xf5\x08\x89\xda\xa1\x78\x91\xd8\x3e\xdf\x77\x29\x1f\xc6\x31\
-\x23\xa3\x24\xa3\x1e\xc5\xa0\xc8\xed\x57\x5f\x42\x2e\xed\xd2\xb7\
-\x55\x23\x26\x73\xf8\xc7\xbe\x89\xe9\xc3\xf5\x3b\xe3\xaf\x64\xee\
-\x75\xe7\x92\xd9\xf6\x72\xe5\x57\x8f\xd3\xdd\xcf\x5f\x89\x9b\x28\
-\x9a\xa6\x97\xe0\xeb\x0b\x95\x21\xa0\x6c\xfc\x24\xae\xa8\x60\x18\
-\xae\xbf\xff\xc5\xf2\x06\x1f\xfe\xe8\x27\xf9\xc2\x57\x2e\xa0\x90\
-\xcb\x91\x33\x3e\xad\xa1\x42\xaa\x37\x59\x8f\x7f\x40\x61\x51\x7e\
-\x8c\x9b\x1e\x5d\xc4\x79\xd3\xaa\x99\xf7\xfc\x73\xdc\xf5\xd7\xbf\
-\xb1\x79\xf3\x66\x46\x8d\x1a\xc5\x19\x67\x9c\xc1\xf0\xe1\xc3\xfb\
-\xdd\x7b\xf1\xe2\xc5\x64\xb3\xae\x55\x0e\x99\xf8\x0e\xbc\x68\x1c\
-\x9d\xde\xe3\x2f\x92\xbc\x06\xa1\xb1\x4c\x1e\x12\x61\x74\x9d\x42\
-\x45\xa3\xfc\xfd\x8f\xd7\xb1\x68\xce\xa3\x00\x08\xe9\x71\xd4\x99\
-\x3f\x26\x5a\x3d\x84\x30\xdf\xb3\xc4\xaf\xdb\xf8\x67\xd3\xb9\xb9\
-\x47\x92\xe7\x09\xdc\x72\x33\x65\xe3\x97\xdd\xfe\xeb\x1a\x1f\x7a\
-\x12\xa0\x6c\xfc\x11\xb8\x98\x7f\x24\xf0\x3f\x94\xd6\xce\x9d\x74\
-\xc4\x91\xfc\xf0\xe7\xd7\xa0\x3c\x9f\x42\x68\x69\x29\x5a\x42\x6d\
-\x91\x07\x7b\x89\x89\x7d\x84\x14\x06\x7f\xe4\x31\x5c\xf9\xe0\xc3\
-\x4c\x8d\xbf\xca\x97\x3f\xff\x5f\x54\xd5\x36\xec\xd5\xbe\xd7\x5f\
-\x7f\x3d\x5a\x6b\xbc\x58\x82\x31\xd3\x3f\xba\xcf\x43\xcc\xda\x40\
-\x6d\x5c\xf2\xb6\xe1\x3e\x7e\x24\xc6\xfa\x55\xcb\xf8\xeb\xf5\x5d\
-\x4b\x21\x33\xee\x94\xcf\x32\xec\x98\x7f\x23\xcc\xf7\x8c\xfb\x7b\
-\x30\xfe\x63\x74\xc7\xfc\x7d\x36\x3e\x74\x87\x00\x89\x73\xfb\x4d\
-\xb8\xd2\xa2\xc9\xb8\xd9\xa5\x4d\x00\x9e\xe7\xf1\x8d\x4b\x2e\x63\
-\xf2\x94\x31\x08\xdf\x47\x29\x45\x53\x52\x32\x24\x25\xf1\x64\xf7\
-\x5c\xf9\x43\x01\xd6\x5a\x3c\x34\x63\xdf\xf9\x31\xe6\xe6\x0f\xe3\
-\x03\x67\x7c\x9e\x6f\x7e\xfd\xab\x3c\xf6\xe8\x23\xb4\xb6\xb4\xf4\
-\xb9\x4f\x4b\x4b\x0b\x17\x5c\x70\x01\xf7\xdd\x77\x1f\x00\x53\x3e\
-\x74\x3e\x8d\xe3\x8e\xc6\x04\x7b\x4f\x00\xe7\xfa\x2d\xc7\x8c\x88\
-\x52\x15\xf3\x08\xc2\x90\xdb\x7f\x71\x09\x9d\xed\xbb\x01\x48\x0d\
-\x9b\xc8\xa4\x7f\xff\x16\x26\x2c\x52\x69\x3b\x2f\x96\xa4\x63\xd3\
-\xf2\xbe\x8c\x3f\x83\xee\x0c\xdf\x0a\xf6\xc1\xed\x57\xc2\xa3\x34\
-\x25\x0d\x57\x20\xd0\x80\x2b\x2f\x3a\x91\xd2\x62\x8d\x00\x5a\x6b\
-\x7e\xfe\xc3\xcb\x58\xf7\xf2\xcb\xfc\xc7\x99\xe7\x31\x66\xfc\x28\
-\x62\xa1\x22\x16\x31\xd4\xc5\x34\xad\x79\x4b\x6b\xd6\x90\x0f\x6d\
-\x57\x8c\x1b\xc8\xb0\xd6\x62\x82\x02\x53\x8e\xff\x10\x23\x27\x1f\
-\xcb\x33\xf7\xfe\x96\xdb\xbf\x78\x21\x7e\xa1\x95\x09\x63\x47\x32\
-\x6e\xc2\x44\xea\xeb\x1b\xf1\x23\x11\xda\xda\xda\x78\xf2\xc9\x27\
-\x59\xfb\xf2\x3a\x00\x46\x1d\x73\x2a\xd3\x3e\xfd\x9d\x7d\x32\x3e\
-\x38\xd7\x3f\xa1\xc1\x67\x4c\x9d\xc2\x8f\x47\x79\xfc\xce\x3f\xf0\
-\xc2\x53\x0f\x95\xbe\x15\x4c\x39\xe3\x72\x62\x75\xcd\x84\xb9\xee\
-\xba\x05\x2f\x96\xa2\x63\xf3\x0a\xe6\x5e\x7b\x16\xe9\xad\x6b\x2b\
-\x0f\x57\x4e\xef\x6e\xa4\x5b\xed\x67\xd8\x47\xe3\xbb\x33\x77\xc7\
-\xfe\x5a\x5c\xd9\xd0\x78\xdc\xec\xd2\xf7\xe2\xca\x89\x7a\x28\xa2\
-\x21\x43\x9b\xf8\xf8\xe9\x67\x73\xc6\x39\x9f\x61\xca\xd4\xa9\x28\
-\x01\xb9\xbc\xa5\x10\x68\x3a\xf2\x6c\x3d\x8d\xcb\x00\x00\x0d\x3a\
-\x49\x44\x41\x54\x86\xd6\xac\x21\x5b\xb4\x18\x6b\x11\xf4\x4c\x84\
-\x1c\xcc\x44\x50\x9f\xb3\x83\xb1\x08\xa5\x50\x7e\x9c\xce\xd6\x9d\
-\x6c\x58\xf2\x0c\x6b\xe6\xcf\x60\xf3\x8a\xf9\x74\x6c\x5c\x09\xb6\
-\xdb\xc8\x55\x43\x46\x33\xe9\xbd\x67\x31\xf5\x93\x17\xe0\xc5\x52\
-\x6e\x26\x50\x29\xb9\xd3\x7b\x81\x88\xde\x89\xa0\xd0\x40\xdc\x17\
-\x9c\x7a\x58\x8c\xfa\xea\x18\xdb\x36\x6f\xe4\x3b\xe7\x9c\xc8\xee\
-\xed\x6e\x51\x8f\x51\xef\x39\x9b\x63\xbf\xf0\x5b\x74\x90\xef\x72\
-\xa5\xdd\x6e\xff\x1c\x3a\x37\xaf\xac\x34\xc1\x3d\xc0\x83\x38\x95\
-\xff\x6a\x85\xf1\xc3\x7d\x35\x7e\x99\x00\xe0\x3c\x40\x14\x57\x38\
-\x30\x14\xe7\xfa\x9b\x81\xb7\xe1\x66\xf4\xbe\x1d\x57\x65\xd2\x85\
-\x78\x22\xc9\x07\x4e\xfb\x38\x67\xfe\xe7\xf9\x1c\xf7\xee\x93\x49\
-\x24\x14\xb9\x2c\x14\xc3\x90\x74\xde\xd0\x92\x35\x74\xe6\x0d\xa1\
-\xa5\x5c\xef\x31\x20\x09\x50\xde\x4e\x08\x85\x88\xc4\xc0\x4a\xf2\
-\xb9\x4e\x0a\xd9\x34\x99\xd6\xed\xe4\x3a\x76\xa3\xbc\x18\x55\xc3\
-\xc6\x11\xaf\x69\x22\x08\xdd\xac\x9f\xae\x6b\x7a\x1d\x02\x68\x0b\
-\xa1\xb5\x9c\x30\x26\xca\x61\x43\xa2\xe0\x79\x5c\x7d\xd1\x7f\x76\
-\x25\xa2\xe2\x0d\x23\x39\xf1\xbb\x8f\x92\x68\x18\xe1\x66\x15\xd1\
-\x6f\xcc\x07\xf8\x1b\x6e\x35\xd5\x8d\xb8\xb5\x8a\xdb\xe9\x5e\x09\
-\xe4\x0d\x05\xe1\xf2\x68\x60\xf9\x79\x17\x70\x8b\x0a\x74\xe2\x16\
-\x34\xdc\x81\x1b\x41\x5a\x8b\xcb\x23\xd7\x50\x4a\x06\x85\x41\xc0\
-\xaa\xe5\x4b\xb9\xe7\xce\xdb\x79\xe1\xf9\x39\x48\x19\x61\xe4\x98\
-\xb1\xd4\xd4\xc6\x88\x48\x45\x55\xd4\x92\x8c\x38\x89\x51\xd4\x96\
-\xb0\xf4\x80\xca\xb3\x40\x6d\xc5\x89\x7b\x63\x8f\xdf\xd9\xfe\xb7\
-\xb1\xbd\xb6\xe9\xfd\x59\x8f\x6d\x7b\x1d\xdc\x5a\x8b\x0e\xdd\x94\
-\x70\xa4\xc4\x8b\xc4\x49\xd4\x36\x51\xdd\x34\x8e\x54\xc3\x08\x64\
-\xe9\xf7\x85\x4c\x45\xd1\x69\xe5\x39\xfa\xd3\x40\x81\xb1\x8c\xa9\
-\xf7\x98\x3a\x3c\x42\x24\x1e\xe7\xa9\xfb\xef\xe0\xae\xeb\x7f\x50\
-\xfa\x56\x30\xf5\x33\x57\x33\x74\xca\x49\x84\xa5\x3e\xbf\x17\x4d\
-\xd2\xb9\x65\x55\x7f\xc6\xff\x13\xce\x16\xaf\xe2\x2a\x7a\x0a\xbc\
-\xc9\x1f\xbd\xac\x1c\x0e\xb6\xa5\x83\x85\x38\x56\xa5\x71\x0c\xeb\
-\x2c\x9d\xec\x15\x5c\xbc\xd9\x89\xf3\x06\x35\xe5\xdd\x5e\xdd\xf0\
-\x0a\xff\x78\xe0\x6e\x9e\x9a\xf1\x30\xc5\x82\x66\xcc\x84\xc3\xa8\
-\x6b\x48\xe2\x2b\x45\x55\x04\xaa\x63\x02\x29\x04\xf9\xd0\x12\x96\
-\xb9\x2a\xba\x4f\xda\x1b\x07\x83\x00\x5d\xdb\x96\x5b\xb0\x31\x18\
-\xad\x31\x3a\xc4\x84\x61\x97\xe1\xfb\xbb\xde\xbe\x8e\xa7\x2d\xc4\
-\x7c\xc9\xbb\xc6\x46\xa9\x4a\x44\xd9\xb5\x6d\x2b\xd7\x5c\x74\x0e\
-\x99\x4e\xd7\x75\x1c\x3e\xfd\x93\x4c\xf9\xd4\xa5\xe8\x62\x0e\xb0\
-\x78\xd1\x24\xe9\xed\x2f\x33\xf7\xda\xb3\x7a\x1b\xff\x6e\xba\x8d\
-\xbf\x19\x67\x93\xde\x95\x21\x6f\x08\x7d\xd5\x03\x94\xbd\x41\x80\
-\x63\x58\x1a\xe7\x0d\xd2\x40\x1b\xdd\x85\x85\xdb\x71\xb5\xe7\x8d\
-\xe5\x1d\x77\xed\xd8\xce\x53\x8f\x3d\xcc\xcc\x87\xef\xa3\xb3\x33\
-\x43\xf3\x88\xd1\x34\x0c\xad\x23\xea\x2b\x12\x11\x41\x4d\x54\xe0\
-\x49\x41\xd1\x40\xa0\xfb\x6f\x35\x07\x9d\x00\x7d\x7c\xf1\x7a\x1e\
-\xab\x4f\x02\x18\xcb\xdb\x47\x44\x18\x55\xe7\x23\xfc\x08\x37\x5f\
-\xf1\x2d\x5e\x7a\xfe\x71\x00\x22\x55\x8d\x1c\xfb\xc5\x1b\x88\xa6\
-\xea\x31\xba\x88\x17\x4d\x92\xd9\xb9\x91\xf9\xbf\x3a\x8f\x8e\x57\
-\x7b\xac\xef\xf0\x20\x70\x3b\xae\xab\x57\xa9\xf4\xdf\x12\xec\xa9\
-\x20\xa4\x92\x08\x39\x1c\xeb\xda\x70\x2b\x61\xef\xc2\x79\x84\xa5\
-\xc0\xa6\xd2\x71\x1a\xca\xc7\x6b\x6d\xd9\xcd\xb3\x4f\xcd\xe4\xa1\
-\xbb\xef\x60\xeb\xa6\xcd\x34\x36\x0d\x67\x68\x73\x33\x89\x98\x22\
-\xe1\x49\x6a\x62\x82\xa8\x12\x84\xc6\x52\x0c\xdd\x49\x44\xaf\x13\
-\x57\xfe\xed\x71\x51\x87\x08\x01\x02\x63\x19\x5e\xa3\x78\xc7\x08\
-\xe7\xfa\x9f\x7f\xfc\x41\x6e\xb9\xf2\xe2\xae\xa4\xd9\x51\x67\xff\
-\x84\xe6\x63\x4e\x23\x2c\x64\xba\x8c\x3f\xef\xba\x73\x68\x5b\xbf\
-\xa8\xf2\x30\x77\xe3\x8c\x5f\xd9\xf2\xdf\x90\xd8\xeb\x0f\x7b\x53\
-\x11\x54\x49\x84\x6c\xe9\x22\xda\x2b\xfe\x6e\xc1\xf5\x43\xd7\xe3\
-\x98\x59\x47\x29\x79\x94\xcd\x64\x58\xf4\xc2\xf3\xdc\x77\xd7\xed\
-\xac\x5e\xb1\x94\x54\x55\x1d\xcd\xa3\xc6\x90\xaa\xf2\x88\x29\x45\
-\x6d\x5c\x90\x88\x08\x8c\xb1\x14\x42\x8b\xee\xc5\x84\x43\x95\x00\
-\xc6\xba\xfa\xbe\xe3\xc7\x44\xa9\x4e\x46\x69\x6b\xd9\xc5\xd5\x17\
-\x9e\x4b\x7b\xcb\x0e\x00\x9a\xa6\x7e\x80\xa3\xce\xfa\x31\x26\x28\
-\xe0\x45\x13\x64\x76\xac\x67\xde\xaf\xce\xed\xcb\xf8\x7f\xc6\xb5\
-\xfc\x4d\x38\x2f\xfc\x96\x1a\x1f\xf6\x6d\x6a\x58\x99\x08\x9a\x6e\
-\xaf\x50\x0e\x0f\x1d\x38\x6d\xb0\x06\x77\xc1\xbd\x04\x63\x91\x35\
-\x2b\x96\x72\xff\x5f\x6e\xe7\xc5\x79\x73\x10\xc2\x67\xe4\x98\x71\
-\xd4\xd4\xc6\x89\x4a\x8f\x9a\x38\x54\xc5\x24\x42\x40\x21\x70\x82\
-\x11\xe8\xb3\x5a\xe1\x50\x20\x80\x36\x96\xa3\x9b\x23\x8c\xa9\x8f\
-\x20\x7d\x9f\x3f\x5e\xf5\x6d\x5e\x78\xfa\x61\x00\x22\xa9\x7a\xa6\
-\x7d\xf9\x0f\xc4\x6a\x9a\x90\x5e\x84\xce\x2d\x2b\x99\x7b\xed\x39\
-\xb4\x6f\x5c\x52\x79\xb8\x7b\x38\x00\xc6\x87\x37\x3e\x37\xb0\x77\
-\x78\x28\x0b\xc6\x34\x4e\x30\xae\xc7\x91\x61\x17\x6e\x7e\x5a\x97\
-\x60\xdc\xb4\xe1\x15\x66\x3c\x78\x37\xb3\x66\x3e\x4c\xb1\xa8\x19\
-\x3d\xee\x30\x6a\xeb\x93\x44\x3c\x8f\x9a\x28\xd4\xc4\x25\x4a\x0a\
-\x72\xa1\x25\x28\xad\xf6\xd5\x23\x3c\x0c\x70\x02\x84\xc6\xd2\x54\
-\xa5\x78\xc7\xc8\x08\xb1\x44\x82\x85\xb3\x67\x72\xd3\x4f\xbf\x41\
-\xb9\xb4\x7b\xca\x19\x97\x33\x62\xda\xbf\x03\x94\x04\xdf\xd9\x74\
-\x6e\x5e\x51\x79\xb8\x7b\x81\x3b\x38\x00\xc6\x87\x37\x3f\x39\xb4\
-\x92\x08\x79\x5e\x2b\x18\xd7\x01\x2f\xe1\xbc\x43\x39\xd3\x28\xc0\
-\x09\xc6\x59\x33\x1f\xe6\x89\x47\xee\x27\xdd\x99\x66\xd8\x88\x51\
-\x34\x0c\xa9\x27\xe6\x7b\xa4\xa2\x50\x17\x97\xf8\xca\x55\xcd\x14\
-\x4a\x82\xb1\x72\xb4\x79\x20\x12\xc0\x5a\x50\x52\x70\xfc\xe8\x28\
-\x35\xc9\x28\x99\x74\x9a\x5f\x7e\xeb\x33\xec\xda\xbe\x09\x80\x86\
-\xc3\x4f\xe0\x6d\xe7\x5e\x81\xf4\x23\x64\x76\xac\xef\x4b\xf0\x3d\
-\x44\x4f\xb5\xbf\x5f\x8d\x0f\x6f\xdd\xec\x60\x8b\x0b\x0d\x45\xfa\
-\x17\x8c\xcb\x71\x8c\xf6\xa8\x10\x8c\x6d\x2d\xbb\x78\x7e\xd6\xe3\
-\x3c\x72\xef\x9d\x6c\xdd\xb4\x99\x86\xa1\xcd\x34\x35\x0f\x27\x11\
-\xf3\xa8\x8a\x48\xea\xe3\x92\x98\x27\x08\xb5\x25\x1f\xba\xae\x55\
-\x7f\x3a\xe1\x60\x13\x20\x30\x30\x65\x98\xcf\x84\x06\x0f\x2f\x16\
-\xe5\x8e\x5f\xfd\x88\xd9\x0f\xbb\x39\x7d\x2a\x96\x62\xda\x97\x6e\
-\xa2\x7a\xe4\x11\xa4\xb7\xae\x61\xde\x75\xaf\x89\xf9\x0f\xe1\x56\
-\x50\x5d\x5b\x7a\x4e\xed\xec\x67\xe3\xc3\x5b\x3f\x3d\xbc\x92\x08\
-\x95\x82\xb1\xac\x13\xb6\xe2\x46\xad\xd6\xf3\x1a\xc1\x98\xe6\xa5\
-\x05\xcf\xf3\xe0\x5f\x6f\x67\xcd\xca\x65\xa4\xaa\x6a\x69\x1e\x39\
-\x86\x54\x95\x4f\x42\x29\x1a\x92\x82\x54\x44\x62\x2c\xe4\xfb\xd1\
-\x09\x07\x93\x00\xa1\x81\xc6\x84\x64\xda\xa8\x08\xb1\x78\x82\xa5\
-\x2f\x3c\xc3\xaf\xbf\xff\x65\xca\xbf\x1c\x32\xf9\xdf\x2f\x66\xdc\
-\x29\x9f\xa5\xf3\xd5\x15\xaf\x67\xfc\x57\x39\x40\xc6\x87\xfd\xb7\
-\x44\x4c\x99\x08\x21\x3d\xbd\x42\x47\xe9\x6f\xa5\x60\xec\xc4\x25\
-\x96\x52\xe0\x04\xe3\xda\x15\x4b\x78\xe8\xaf\xb7\xb3\x68\xde\x33\
-\x48\xe5\x33\x62\xf4\x04\xaa\x6b\xe2\xc4\x3c\x45\x43\x1c\x6a\xe2\
-\xee\xa7\xc2\x9d\x4e\xe8\xe6\xc0\xc1\x22\x80\xb1\x6e\x81\xc7\x77\
-\x8e\x89\x50\x97\x8a\x90\xcd\x66\xf9\xc5\x85\xe7\xb1\x63\xf3\x7a\
-\x00\xea\x27\x4c\xe3\xd8\x2f\xfc\x96\xec\xce\x8d\xcc\xbd\xf6\xac\
-\x01\x63\x7c\x38\x70\x3f\x1c\x59\x19\x1e\xd2\x38\xa3\x67\x70\x21\
-\x62\x35\x4e\x27\xb4\xe3\xc4\x62\xb5\xdb\xc5\xb2\x79\xe3\x2b\xcc\
-\x7c\xe8\x6e\x9e\x7b\xfa\x51\x84\xf4\x69\x1e\x35\x96\x9a\xba\x14\
-\x31\xcf\xa3\x2e\x06\x75\x09\x97\x6a\xce\x87\xa5\xc4\x12\xaf\xad\
-\x4a\x3b\x10\x04\x08\x0c\x1c\xd6\xe8\x33\xb1\xd1\xc7\x8f\x45\xb9\
-\xfb\xc6\xab\x79\xe2\xbe\x5b\x00\x90\x5e\x84\xe3\xbe\x7a\x2b\x7e\
-\xa2\x9a\xe7\xae\xfe\xff\x68\x7b\x65\x61\xe5\xae\x95\x31\x7f\xbf\
-\x0b\xbe\xbe\x70\xa0\x7f\x39\xb4\xdc\x85\x2c\x87\x87\x56\x1c\x09\
-\x76\xe2\x1e\xc2\x32\x9c\x66\x88\xe3\x16\x94\x16\x00\x3b\xb7\x6f\
-\xe5\xa9\x7f\xdc\xcf\x53\xff\xb8\x8f\x74\x67\x9a\xa6\xe1\xa3\x69\
-\x18\xd2\x40\x2c\xe2\x51\x17\x77\xf5\x75\xbe\x82\x42\x68\x29\x84\
-\xdd\x82\x11\xf6\x3f\x01\x42\x0b\x75\x31\xc1\xb4\x51\x11\xe2\xf1\
-\x38\x6b\x97\x2d\xe6\x57\x97\x7d\x9e\xa0\xe0\x7e\xcb\xe1\xf0\x8f\
-\x5f\xc8\xf0\x63\x3f\xc6\x73\x57\x9d\x4e\xcb\xda\x1e\xcb\xf8\xfd\
-\x1d\x67\xfc\x35\x74\xc7\xfc\xb7\x24\xbd\xbb\x2f\x38\x18\x3f\x1d\
-\x6b\x71\x2c\x2f\xe0\x88\xd0\x41\xcf\x31\x87\x57\x71\x82\x71\x73\
-\xe9\xfa\xea\xe9\x12\x8c\xbb\x99\x37\xfb\x71\x1e\xbd\xff\x4e\xb6\
-\x6d\xde\x44\xfd\xd0\x66\x86\x0c\x1b\x41\x22\xee\x51\x13\x95\x34\
-\x26\x25\x09\x5f\x50\xd4\x90\x0f\xdd\x08\x20\xa5\x65\x48\xf7\x07\
-\x01\xca\x59\xbd\x69\xa3\xa3\x34\x56\x45\x28\x86\x21\xd7\x7c\xeb\
-\xbf\x78\x75\xed\x72\xc0\x95\x76\x4f\xfa\xc4\x25\xcc\xbf\xfe\xbf\
-\xd8\xbd\xfa\xd9\xca\x23\xfe\x1d\x97\xe1\x5b\x53\xba\xdf\x36\x0e\
-\x82\xf1\xe1\xe0\xff\x76\x70\xd9\x23\x94\xc9\x50\xd6\x09\x1d\xb8\
-\x99\x2c\xab\x70\x82\x31\xc4\xd5\x2b\x44\x01\x72\x99\x34\x4b\x16\
-\xce\xe5\xe1\xbf\xdd\xc6\xcb\x2b\x97\x92\xaa\xaa\x65\xd8\xc8\xb1\
-\xa4\xaa\x22\xa4\x22\x92\x21\x09\x41\x75\x4c\xa2\x2d\xe4\xca\x82\
-\xb1\x77\xef\xe1\x2d\x20\x40\xa0\x61\x42\xa3\xc7\xe1\x43\x22\xf8\
-\xf1\x28\xf7\xdd\xfc\x2b\x1e\xbe\xe3\x37\x00\xf8\xf1\x1a\x8e\xf8\
-\xd4\x77\x59\x79\xef\xff\x63\xf7\xaa\x81\x69\x7c\x38\xf8\x04\xa8\
-\x44\xa5\x57\xa8\x14\x8c\xdb\x70\xa1\x61\x09\x4e\x37\xd4\xd0\x25\
-\x18\x03\x5e\x5e\xb9\x94\x87\xef\xbe\x8d\xc5\xf3\x9f\x41\x28\x9f\
-\xe1\xa3\xc7\x53\x5d\x93\x20\xe1\x49\x86\x24\x05\xf5\x25\x9d\x90\
-\x0b\x2c\xc5\xb2\x60\xec\xa7\x7a\x7d\x5f\x08\xa0\x0d\xd4\xc4\x9c\
-\xea\x8f\x27\x62\xac\x5b\xb9\x8c\x5f\x5e\xf2\x59\x8a\x85\x1c\x42\
-\x4a\x9a\x8f\xfd\x28\x3b\x57\xce\x66\xf7\xca\x1e\xbf\xd9\x30\xa0\
-\x8c\x0f\x03\x8b\x00\x65\x94\x7b\x0e\x95\x44\x68\xc5\x11\x61\x35\
-\x6e\xdc\x21\x4d\x0f\xc1\x08\x5b\x36\xbe\xc2\x93\x7f\xbf\x9b\xb9\
-\x4f\xcf\x40\x08\x8f\xe6\x51\xe3\xa8\xae\xab\x22\xe6\x7b\x34\x26\
-\xa0\x21\xa1\x90\x02\xb2\xa1\x4b\x2e\xf5\x55\xba\xb6\xb7\x04\xb0\
-\xa5\x0d\xdf\x3e\x22\xc2\x90\x94\x8f\x01\xae\xbb\xf4\xff\xb0\x6e\
-\x85\x53\xf7\x91\x54\x3d\x61\x3e\x4d\xdb\x2b\x2f\x56\x1e\xe5\x31\
-\xe0\x36\x0e\x72\xcc\xef\x8d\x81\x48\x00\xe8\xd6\x09\x65\x22\x94\
-\xc3\x42\x59\x27\xac\xc3\xe9\x84\x16\x5c\x86\xb1\x4b\x30\xee\xda\
-\xbe\x95\xd9\x33\x1e\x60\xd6\x8c\x07\xc8\x74\xa6\x19\x3a\x7c\x14\
-\x75\x8d\x8d\x24\x22\x3e\xf5\x09\x18\x9a\x94\x44\x3c\x41\x3e\x30\
-\xe4\x4b\xcb\xf9\xf6\x10\x8c\x7b\x41\x80\xd0\x58\xc6\xd4\x79\x4c\
-\x1e\xea\x13\x4d\xc4\xf8\xc7\x5f\x6f\xe1\xee\xdf\x77\xaf\xd2\x6e\
-\xc2\x22\x85\x8e\x9d\x95\x47\x78\x1c\xb8\x05\x47\xe0\x72\xcb\xef\
-\x59\xfd\x79\x90\x30\x50\x09\x50\x46\x39\x9f\x50\xd6\x09\x19\xba\
-\xd3\xcd\x6d\xb8\x87\xb9\x02\x37\x22\xe9\xe1\x74\x82\x07\xd0\xde\
-\xb2\x8b\xf9\x73\x1e\x67\xe6\xfd\x77\xb1\x7d\xcb\x66\xea\x86\x0c\
-\xa3\x71\xd8\x48\x92\x71\x9f\xda\x98\xa0\x29\x25\x49\x46\x24\x05\
-\x6d\xc9\x05\xdd\x82\xf1\xf5\x08\x10\x5a\xb7\x88\xd3\x71\x23\x23\
-\x24\x13\x31\x36\xaf\x7f\x85\xab\x2e\x3a\x8f\x5c\xa6\x62\x11\xaa\
-\x9e\xf1\x65\x26\xce\xf8\xab\x70\xa5\x5c\x03\xc6\xf8\x30\xf0\x09\
-\x50\x89\xca\xde\x43\x25\x11\x2a\x05\xe3\x06\x7a\x0b\xc6\x6c\x9a\
-\x65\x0b\x9f\xe7\xd1\x7b\x6e\x67\xdd\x2a\x27\x18\x87\x8e\x18\x43\
-\x32\x15\xa5\xda\x17\x34\x57\x49\xaa\xe3\x92\xd0\x40\x36\x28\x55\
-\x2c\xf5\x1e\x85\x2c\x11\xc0\xe2\xea\x0e\xa7\x0e\x8f\x30\xac\xda\
-\xc7\x08\xc1\xaf\x2e\xfb\x32\x2b\x17\x3d\xdf\xdf\x35\xff\x03\xe7\
-\xf6\x07\xa4\xf1\xe1\xd0\x22\x40\x19\xbd\xbb\x91\x9d\x15\xaf\x9d\
-\x38\x8f\xb0\x0c\x97\x74\x2a\xaf\xa0\x49\x18\x04\xac\x5b\xb5\x94\
-\x47\xef\xb9\x9d\x25\x2f\x3c\x43\x24\x9a\x60\xc4\xd8\xc3\x48\x56\
-\xc5\x48\x45\x24\xc3\x52\x82\x86\x84\xc2\x5a\xc8\x14\xdd\x48\xa4\
-\xe8\xea\x43\xba\x93\x06\xc6\x32\xb2\xd6\x63\xca\x30\xe7\xfa\x9f\
-\xb8\xff\x2e\xfe\xfc\xbf\x3f\x7c\xed\x15\x3a\x3c\x8a\xeb\xe7\xaf\
-\x66\x80\x1a\x1f\x0e\x4d\x02\x94\x51\x0e\x0f\xbd\xf3\x09\xbb\xe9\
-\x16\x8c\xab\x4a\xdf\x95\x97\x50\x05\x2c\x5b\x5f\x7d\x85\x27\xff\
-\xfe\x57\x5e\x7c\xee\x69\x8c\x81\xa6\x91\x63\xa9\xaa\xad\x26\xe1\
-\x2b\x86\xa6\x04\x8d\x09\x89\x94\x82\x6c\x60\x29\x94\x6a\x18\x0d\
-\x10\xf3\x04\xef\x18\xe5\xea\xfb\x76\x6e\xdb\xc6\x95\x17\xfe\x27\
-\xe9\xf6\xd6\xde\xd7\x05\x6e\xb6\x4e\x59\xed\x6f\x60\x00\xa8\xfd\
-\xfe\x70\x28\x13\x00\xba\x3d\x73\x65\x68\x68\xc7\x3d\xf0\x4e\x1c\
-\x19\x7a\x0b\xc6\x3a\x4a\x4e\x7e\xc7\x96\x8d\x3c\xf3\xd8\x03\x3c\
-\xf3\x98\x13\x8c\x43\x86\x8f\xa6\xb6\xb1\x81\x64\xd4\x67\x48\x52\
-\x30\x2c\x25\x89\x78\x90\x2d\x1a\x72\x81\xe5\xa8\xe6\x08\x23\x6a\
-\x7c\x84\xe7\xf3\xdb\x1f\x7f\x83\x45\xcf\x3e\xde\xd7\x35\x3d\x41\
-\xb7\xe0\x5b\x8f\x13\xad\x01\xbc\xce\x62\x26\x07\x09\x87\x3a\x01\
-\xca\xa8\x24\x42\xb9\x36\x21\x43\x77\xcf\xa1\x0d\xd7\xf5\x2a\xcf\
-\x9f\x93\x38\x22\x38\xc1\xd8\xba\x8b\x05\xcf\x3c\xce\x13\x0f\xde\
-\xc9\x8e\x2d\x9b\xa9\x6b\x1c\x46\xc3\xb0\x11\x24\xe3\x3e\x0d\x71\
-\x49\x73\xb5\xa4\x3e\x21\x19\x5e\xa3\x88\x27\xe3\x3c\xfb\xd8\x83\
-\xfc\xe1\x8a\xee\xd5\x3b\x2b\x70\x48\x19\x1f\xfe\x79\x08\x50\x89\
-\x4a\x32\x54\x12\xa1\x1c\x22\xb6\xe0\x92\x4a\x2b\x71\x86\xa9\xc3\
-\x79\x06\x72\xd9\x34\x2b\x5e\x7c\x9e\xc7\xee\xbb\x9d\xf5\xab\x97\
-\x91\xa8\xaa\x65\xc8\xf0\x31\xa4\x92\x51\x52\x3e\x28\xdf\xa3\x65\
-\xe7\x0e\x7e\x76\xc1\xd9\xb4\xb7\xee\xea\x7d\xde\x43\xce\xf8\xf0\
-\xcf\x49\x80\x32\xf6\x44\x84\xdd\x38\x8f\xb0\x02\xa7\x13\x8a\xf4\
-\x12\x8c\xaf\xac\x5a\xc2\xcc\x7b\x6f\x67\xf9\xc2\x67\x88\x44\x93\
-\x8c\x18\x7b\x18\xa9\xea\x08\x37\xfc\xf4\x3b\xcc\x7f\xfa\x91\xde\
-\xe7\x7a\x1a\x37\xa4\xbb\x1a\x17\xf3\x0f\x09\xe3\xc3\xc1\xfd\xf9\
-\xf8\x03\x89\xca\x39\x90\x3e\xce\xf5\x27\x70\x09\xa4\x21\xb8\xb5\
-\x10\x26\xe2\x56\xd5\x3e\x16\x37\x2d\xae\x07\x8e\x9e\x7e\x12\x6f\
-\x9b\x7e\x32\x77\xdf\xf4\x0b\xf2\xb9\x1e\x2b\x77\x3c\x03\xfc\x01\
-\x47\xa6\x0d\x38\xad\x51\xe4\x10\x30\x3e\xfc\xeb\x10\xa0\x0c\x51\
-\xf1\x57\xe1\x72\x05\x29\x1c\x11\x86\xe2\x88\x30\x1a\x47\x82\x63\
-\x71\x13\x65\xf7\xf4\x8c\x66\xe1\xdc\xfe\x21\x69\x7c\xf8\xe7\x0e\
-\x01\x7b\xc2\xeb\xe9\x84\x4d\x74\x2f\xac\x28\xa9\xc8\x30\x56\xe0\
-\x49\x9c\xdb\x2f\x27\xa0\x0e\x39\xe3\xc3\xbf\x2e\x01\xca\xd8\x13\
-\x11\x3a\x71\x82\x71\x29\x2e\xb6\x97\x05\x63\x14\xb7\x52\xea\x1f\
-\xe9\x16\x7c\x87\xa4\xf1\xe1\x5f\x2f\x04\xec\x09\x95\x3a\xa1\x1c\
-\x1a\x6a\x71\x23\x8e\xd5\xb8\x29\xf3\x13\x71\x6b\x26\x3c\x81\x2b\
-\x63\x5b\x8f\x13\x94\x87\xa4\xf1\x61\x90\x00\x7d\xa1\xb7\x60\x8c\
-\xe0\x04\x63\x03\xdd\xa1\xa0\x13\x17\x1e\x0e\x69\xe3\xc3\x20\x01\
-\xf6\x84\xbe\x04\x63\x02\x47\x8a\x1c\x2e\x5c\x1c\x12\x5d\xbd\x3d\
-\x61\x90\x00\x7b\x87\xb2\x57\x90\xa5\x57\x79\x8e\xe4\x80\xcb\xed\
-\x0f\x62\xff\x63\xb0\xd1\x0c\x62\x10\x83\x18\xc4\x20\x06\x31\x88\
-\x41\x0c\x62\x10\x83\x18\xc4\x20\x06\x31\x88\x41\x0c\x62\x10\x83\
-\x18\xc4\x20\x06\x31\x88\x43\x06\xff\x3f\x4a\x46\x9d\xf6\x30\x7b\
-\x8c\x12\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x3b\xa2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xd9\x0b\x18\x0b\x3b\x34\x0a\xcb\x5d\x4a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\xda\xed\xbd\x69\x8c\x25\x59\x76\xdf\xf7\xbb\xf7\x46\
-\xc4\xdb\xf2\xe5\x52\x99\x59\x59\x4b\x57\x57\x57\xf5\xde\x3d\xbd\
-\xcc\x0c\xc5\x19\x8e\xb8\x0d\x45\x52\x1c\xd2\xa2\x04\x58\x82\x64\
-\xc1\x04\x61\x81\xa6\x01\xc3\xb6\xc0\x0f\x82\x3e\xd8\xfa\x20\x1b\
-\x16\x20\x5b\x82\x05\x4b\xb6\x05\xf9\x83\x37\x89\x80\x20\x7a\xa3\
-\x29\x71\x48\x91\xd2\x4c\x93\x33\xd3\xd3\xdb\xf4\x74\x75\x77\xed\
-\x5d\x7b\x65\x65\x66\x55\x2e\x6f\x8b\xed\x2e\xfe\x70\x23\x22\xe3\
-\xbd\x5c\xba\x2b\xa7\xa7\xbb\x66\x58\x01\x14\x2a\xeb\x65\xe6\xab\
-\x17\x71\xcf\x3d\xe7\x7f\xfe\xe7\x7f\xce\x85\x87\xd7\xc3\xeb\xe1\
-\xf5\xf0\x7a\x78\xdd\xe7\x95\x65\x7a\x3e\xcb\xf4\xdf\xc8\x32\xfd\
-\x93\x0f\x9f\xc6\x9f\xb0\x2b\x4d\xf3\xbf\x33\x18\x8c\x7e\x6b\x34\
-\x4a\x5c\x1c\xa7\x6f\xa7\x69\xfe\xa7\x1f\x3e\x95\x3f\x19\x0b\xff\
-\x9f\x24\x49\xf6\x4a\x1c\xa7\xf1\x60\x30\x72\xbd\xde\xc0\x0d\x06\
-\x23\x37\x1a\x25\xe7\x47\xa3\xe4\x33\x3f\x88\xf7\x24\x1f\x2e\xeb\
-\xfe\x57\x9e\xe7\x22\xcb\xb2\x6e\x1c\xc7\x73\x5a\xe7\xcf\x5a\x6b\
-\x7f\x02\x68\x4a\x29\x91\x52\xa2\xb5\x26\x4d\xd3\xa7\x84\x70\xaf\
-\xc4\x71\x7c\xf2\x07\xed\xfe\x82\x87\x4b\xbc\xff\xe5\x9c\x3b\xe4\
-\x9c\xfb\x7d\xe7\xdc\xe7\xca\xd7\xac\xb5\x68\xad\xd1\x5a\x63\x8c\
-\xc1\x39\x87\xd6\xf9\x5c\xb3\xd9\x78\x03\x58\x7c\x68\x00\x3f\x34\
-\x40\x2f\xfb\x25\x6b\xf5\x13\xc6\xd8\xcf\x39\x1c\x4a\x84\x80\x20\
-\xc9\x12\x52\x9d\x62\x8d\x43\x38\x89\x70\x02\xad\x73\x80\xc6\xc6\
-\xd6\xe6\xaf\xb6\x5a\xad\x8b\xcd\xa8\xf1\xcd\x1f\x84\x7b\x14\x0f\
-\x97\x79\x2f\xd7\x6f\x7e\x4c\xeb\xec\x9f\x3a\x67\x4f\x5b\xab\x11\
-\x42\x20\x9c\x42\x6b\xcb\x28\x1d\x91\x39\x8d\x10\x0a\xe9\x02\x9c\
-\x06\xd0\x08\x09\x8d\x46\x48\xab\xdd\xfa\x6e\x10\x04\xff\x59\x23\
-\x8c\x5e\x79\x88\x01\x7e\x60\x0d\x20\xfd\xf7\xb2\x2c\x7b\xc4\x39\
-\x50\x2a\xc4\x18\x18\xe9\x98\x5e\xda\x03\x27\x88\x4c\x8b\xd0\x46\
-\x58\x67\xc8\xc3\x14\x23\x0c\xd6\x5a\xd2\x34\x23\x8e\xe3\x97\xd2\
-\x34\xfd\xe2\x43\x10\xf8\x83\xe9\xf6\xff\x6c\x92\x24\x67\x8c\x31\
-\xbf\x22\x84\x88\x94\x0a\x11\x22\xc0\x18\x4b\x66\x72\x84\x0a\x10\
-\x59\x40\xef\x46\x9f\x78\x2d\x41\xa1\xb0\x4a\xe3\x70\x38\x07\x79\
-\xae\x89\x47\x09\x79\x9e\xff\x46\x7f\x38\xf8\x99\x87\x21\xe0\x07\
-\xe4\x4a\x92\x44\x00\x5f\xb1\xd6\xfe\xb6\xd6\xb9\x52\x2a\x20\x08\
-\x42\xb2\x2c\x27\x1e\xa5\x68\x6d\x11\x4a\x10\xe8\x90\x2b\x6f\x5d\
-\xe3\xbd\x57\xdf\x67\x7a\xa1\xcb\xf3\x3f\xfe\x34\xed\x47\x9a\xe0\
-\x04\x58\x81\x73\x0e\x70\x28\x25\x68\xb5\x9b\x26\x0c\xa3\x5f\x50\
-\x4a\xfe\x41\xa7\xd5\x7e\x08\x02\x1f\xdc\xfc\x3e\xfd\x53\xd6\xda\
-\x63\xc0\xff\xe3\x17\x4f\x96\xde\x80\xe1\x20\xc5\x5a\x07\x48\xd2\
-\x35\xcd\xb5\x73\xb7\x79\xef\xd5\x73\x0c\x56\x46\x64\xf7\x32\xae\
-\x34\xaf\xf1\x5c\xf8\x0c\xc1\x7c\x80\x11\x16\x21\xa8\x3c\x01\xa3\
-\x54\xc9\x29\xf5\xaf\x1b\x61\xf8\xd3\xc0\xd7\x1f\x7a\x80\x07\xd3\
-\xe5\xff\xb4\xb5\xf6\x1f\x1b\x63\x9e\x06\x10\xc2\xe1\x9c\x25\xcb\
-\x34\x59\xa6\x71\x56\x61\xad\x60\xf9\xf6\x0a\x2b\xef\xdc\xe3\xee\
-\xbb\xeb\x0c\xd7\x86\xb4\x54\x93\xdc\x26\xa8\x19\x78\xe2\xa5\x53\
-\x1c\xfb\xb1\x63\x04\xdd\x00\x21\x7c\x9a\x08\x0e\x21\x40\x08\xc1\
-\xe2\xc2\xa1\x35\xa5\xd4\xaf\x35\x1a\x8d\xdf\x7e\x88\x01\x1e\xb0\
-\xcb\xe4\xe2\xdf\xb5\x19\x4f\x4b\xab\x50\x4e\x61\x35\xa4\xa9\x66\
-\x94\x25\x68\x69\x10\x4e\xb0\x75\x65\x93\xab\x5f\xbf\xc6\xcd\x37\
-\x6f\x90\xac\x0f\x89\x02\x85\x75\xda\x1b\x4a\x2f\xe7\xca\x77\xae\
-\x73\xe7\xdc\x2a\x2a\x09\x50\x2e\xf0\x78\x40\x78\x4c\x60\x72\x4b\
-\xaf\x37\x5c\xcc\x32\xfd\x1f\x3e\x04\x81\x0f\xd0\x35\xca\xcc\xe7\
-\xfb\xa3\xec\x0f\xb3\x3c\xff\x0b\x0e\x81\x0a\x14\xd6\x19\xb2\x2c\
-\x27\xcb\x0c\x52\x04\xd8\xd4\x71\xfb\xc2\x2d\xce\x7f\xf3\x02\xbd\
-\x0b\x7d\xe4\x00\xa4\x70\x58\x97\xa3\x49\x41\x3a\x84\x13\xc4\xbd\
-\x84\xf3\xaf\x5e\xe4\xf6\xd9\x3b\xb8\xd4\x87\x10\x2b\x1c\x42\x0a\
-\x94\x0c\x19\x0d\x63\x46\xc3\xe4\x8b\x83\x7e\xfc\xbf\xe5\xb9\xf9\
-\xdc\x43\x0c\xf0\x69\x2f\xfe\x28\x7b\xd2\x69\xfb\x55\x67\xcc\x82\
-\x0c\x04\x04\x8e\xc4\x26\x8c\xd2\x01\x3a\xb7\x44\xb2\x89\x1b\xc1\
-\xed\xf7\x6e\x72\xf6\x9b\x17\x19\x2d\x27\x44\x59\x03\x21\x25\xd6\
-\xd9\x22\x72\x3a\x9c\xf3\xbb\xdc\x39\xd8\xba\x31\xe0\xe2\xeb\x97\
-\xe9\xcc\xb6\x98\x7b\x7c\x16\x2b\x2d\x59\x9a\x11\x10\x62\xad\x65\
-\x30\x18\x2c\x20\xdc\x5f\xb5\xce\xbc\x1a\xc7\xe9\x77\x5b\xad\x86\
-\x79\x88\x01\x3e\xf1\xdc\x3e\x3f\x6c\x8c\x39\x66\x8d\x7d\xd5\xe9\
-\xa0\x21\x23\x81\x91\x9a\x24\x1b\x91\xa5\x19\xd6\x40\xe0\x14\xf9\
-\xa6\xe1\xda\x99\x9b\x5c\x7a\xed\x0a\xc3\xdb\x31\x4d\xd5\x42\xa1\
-\xd0\x4e\x63\x85\xad\x2d\xbe\x2b\x50\x3f\x44\xb6\x49\xdf\x6c\xf1\
-\xc8\xe7\x8e\xf2\xcc\x8f\x3f\xc9\xcc\x23\xd3\xa4\x3a\x41\xa9\x00\
-\x57\x50\xc7\x61\x18\x30\x33\x3b\x4d\xa3\x11\xfd\xba\x10\xfc\xaf\
-\xed\x76\x3b\x7f\x18\x02\x3e\xa1\x2b\x8e\xe3\x17\xb5\xd6\x7f\xdf\
-\x5a\xfb\x0d\x21\x44\xa3\x8c\xe3\xa3\x78\x40\x92\xa6\x04\x34\x88\
-\xf2\x26\xa3\xdb\x19\x17\x5e\xbd\xcc\xf9\x57\x2f\x12\xaf\x24\x4c\
-\xa9\x29\xb0\x90\xbb\x1c\x27\x1d\x20\x70\x6e\xe7\x1f\x10\x28\x1d\
-\x71\xfb\xdc\x0a\xe7\xbf\x75\x99\xd1\x72\x42\x53\xb6\xaa\x5a\x41\
-\x59\x38\xea\xf5\x7a\xa4\x69\xfa\x4f\xa4\x94\xbf\xfa\x30\x04\x7c\
-\x72\x48\xff\x45\x63\xcc\x3f\x34\xc6\xfc\x24\x40\xa0\x02\x74\x9e\
-\x31\xca\x07\x64\x26\x25\x54\x4d\x44\xa2\x58\x39\x7f\x97\x6b\xef\
-\xde\x60\xf9\xfc\x6d\x74\x6c\x50\x2e\x44\x0b\x8d\x16\x9a\x9c\x1c\
-\x69\x15\x8a\x60\x6c\xf7\x97\x1e\xa0\x9f\x6d\xd1\x88\x9a\xe8\xbe\
-\x63\xf5\xdd\x7b\xdc\x9a\x5e\xe1\xd4\x17\x4e\x20\xa6\x05\x26\xd7\
-\x48\x29\x71\xce\x91\xa6\x29\x83\x81\x20\x08\xd4\x3f\x4c\x92\x44\
-\x34\x9b\xcd\xff\xf9\x61\x08\xf8\x3e\x5e\xc3\xe1\xf0\x34\xf0\xcf\
-\x84\x10\x5f\x14\xc2\x13\x35\xce\x3a\xf2\x38\x23\xb6\x09\x56\x3a\
-\xc8\x02\x36\x3e\xe8\xf3\xfe\x2b\x17\x59\xbb\x74\x97\x66\x1e\x21\
-\x03\x89\xb6\x1a\x4d\x0e\xa1\xc3\xa0\x11\x5a\xa1\x4c\x58\x2d\x7a\
-\xdd\x08\x32\x95\xa2\xf2\x80\x28\x69\xe0\x00\x75\xd8\x72\xfa\xcb\
-\x27\x39\xf1\x23\xc7\x08\xa4\x2a\x3e\x8d\x43\x9b\x1c\x70\x4c\x4d\
-\x75\xe8\x76\xbb\xaf\xcd\xcc\xcc\x7c\xe1\xa1\x01\x7c\x9f\xae\xde\
-\xa0\xdf\x11\x88\x37\x03\x11\x3c\x2d\xa5\xc2\x58\x83\x71\x9a\x51\
-\x36\x64\x44\x4c\x98\x45\x34\x46\x6d\x6e\x9d\xb9\xc3\xbb\x7f\x7c\
-\x8e\x78\x25\x25\x94\x21\xce\x69\x3c\x9f\x67\xb1\xce\xfa\xb4\x0e\
-\x87\x33\x25\xe8\x73\xe0\xc4\x36\x08\xc4\x13\x81\xce\x82\xd3\x0e\
-\x6b\x2c\x46\x68\xa6\x17\xba\x7c\xfe\x8b\x9f\x67\xea\xa7\x25\x28\
-\x87\xb6\x39\x52\x00\x1a\x9a\xb2\x49\x23\x6a\x8c\x16\x8f\x1e\xfe\
-\x9a\x10\xe2\xef\x87\xa1\xfa\x37\x0f\x31\xc0\xc7\x47\xeb\xce\x65\
-\x59\xf6\x77\x9d\x75\x37\xc2\x20\x7a\xda\x58\x4b\xa6\x33\x72\x9b\
-\x33\x4c\x86\xe4\x46\x13\x66\x4d\xf4\x86\xe3\xe2\x5b\x1f\xf0\xd6\
-\x1f\xbd\x43\x7f\xb5\x8f\x92\x01\x59\x96\x62\x9c\xc1\x3a\x5f\xdc\
-\x71\xd6\x2f\x3c\x86\x62\xa5\x3d\xec\xaf\x67\x00\x38\xbf\xf0\x78\
-\xc2\x10\x19\x4a\x02\x15\xb2\xb5\xd2\xe7\xbb\xdf\x38\xc3\xfa\x07\
-\x1b\x74\xe8\x12\x10\xa0\x9d\x41\x04\x82\x34\x4f\x19\x0d\x46\xed\
-\x8d\x8d\x8d\xaf\x24\x49\xf2\xf3\x49\x92\x7d\x2a\x5c\xf1\x0f\x1d\
-\x06\xc8\xf3\x7c\xc1\x18\xf3\x3f\x66\x59\xf6\x97\x7c\xbc\x06\x27\
-\x1c\xb9\xce\xc8\x74\x8e\xce\x35\x92\x80\xfc\x16\x5c\xfc\xee\x15\
-\x6e\x5d\x58\x26\x5e\x8f\x09\x44\x84\x15\x1a\x2b\x2d\xc2\x89\xed\
-\x9d\x3e\x86\xf8\x29\xfe\x2d\xaa\xc5\x77\x85\x0b\x70\x16\xc0\x62\
-\xad\x67\x12\xa5\x54\xe0\x60\x6d\x65\x0d\xf9\x87\x9a\x19\x79\x88\
-\xd6\x89\x26\xb9\xcc\xc8\x44\x4e\xa8\x42\x8c\xb6\x6c\x6d\x6d\x09\
-\x29\xe5\xdf\x04\xde\x00\x7e\xeb\xa1\x07\xf8\x1e\xae\x34\x4d\x4f\
-\x5a\x6b\xff\x4b\x6b\xed\x97\x3d\xd8\x8b\x7c\xbc\xd7\x9a\x38\x49\
-\x91\x4e\xd1\x12\x1d\x36\xae\xf7\x38\xf7\xca\x05\xae\x7d\xe7\x26\
-\xc9\x6a\x4a\x53\xb4\xc1\x79\xa4\x2f\x02\x51\x3c\x16\x31\x86\xf8\
-\x41\x16\x0b\x5e\x73\xfd\xce\x79\xb7\xef\x8a\x68\xea\x04\x42\x48\
-\x70\x12\x6b\x2c\x4a\x06\x48\xa9\x58\x7b\x6f\x83\x0b\xdf\xba\xcc\
-\x68\x39\xa5\xe9\xda\x08\x2b\x31\xce\x40\x00\x5a\x6b\x36\x37\x37\
-\x19\x0c\x06\xbf\xb0\xbe\xbe\x39\xff\x10\x03\x1c\x1c\xe9\xff\xba\
-\xd6\xfa\x97\x9c\x73\xbf\x0c\xa0\x94\x22\xcf\x40\x9b\x9c\x54\xa7\
-\x28\x27\x21\x96\x2c\x5f\x5c\xe5\xd2\x77\x2e\xb1\x72\xf6\x1e\x01\
-\x21\xd2\x48\x8c\x36\x38\x09\x56\x19\xac\x75\x84\x36\xdc\x01\xf2\
-\xfc\x1f\x5b\x14\x86\xa0\xa0\xfb\x8b\xd7\x85\xa7\x86\xac\xff\x39\
-\x21\x04\xc6\x98\xe2\xe7\x2c\x32\x97\x88\x59\xc7\xe9\x1f\x7d\x8c\
-\xe7\x7e\xe2\x49\x9a\x87\x43\xb6\xe2\x0d\x54\x20\x11\x56\x60\xad\
-\xa5\xdd\x6e\xd3\xed\x76\x7f\x53\x29\xf5\xab\x87\x0e\xcd\xea\x87\
-\x21\xe0\xfe\xdc\xfe\xaf\x6b\xad\xff\x2b\x6b\xed\xe1\xf2\x35\xad\
-\x35\x69\x6e\x48\xf2\xc4\x2f\x4e\x0a\x37\xce\xdc\xe2\xec\x2b\x17\
-\x88\x97\x63\x44\xb8\xbd\xcb\xa5\x50\x9e\xbb\xc7\x20\xd8\x76\xff\
-\x93\xa9\x9e\xb5\xec\x02\x02\x45\xcd\x08\x04\x59\x96\xa3\x94\xf2\
-\x0a\x22\x21\x51\x4a\xe2\x2c\xf4\xef\xf5\xf9\xe0\xad\xab\xb4\xdb\
-\x2d\x9e\xf8\xe2\x63\x84\xed\x06\xb9\x28\x0c\xd3\x67\x2b\x08\x21\
-\xfe\xea\xdc\xdc\x9c\x05\x7e\xe5\xa1\x01\x7c\xf8\xa2\x4b\xe7\x5c\
-\x90\x66\xb1\xd0\x5a\xff\x47\xc6\x98\xc3\xa5\x52\x37\xcb\x32\x46\
-\xf1\x88\xdc\x38\x84\x12\xa4\x71\xc6\x07\xef\x5c\xe3\xca\x37\xaf\
-\x61\xef\x28\xba\x76\x8e\x9e\xdc\x20\xcf\x73\x42\x22\x94\x94\xa4\
-\x79\x82\x55\x96\x20\x08\xb1\xb9\xdf\xde\xd6\xba\xb1\x94\x8f\x5d\
-\x32\x80\xf2\x72\xda\xd0\x68\xb6\xc0\x7a\xa0\x68\xad\x05\x61\x8b\
-\x8c\xc0\xd2\x08\x9b\x24\xeb\x19\xef\x7d\xeb\x7d\xc2\x69\xc5\xf1\
-\xcf\x2f\x61\xac\x21\x94\x81\x07\x9b\xce\x31\x1a\x8d\x08\x82\xe0\
-\xaf\xf4\x7b\x43\xa6\x9a\xed\xff\x40\x44\x42\x3f\x34\x80\x3d\x2e\
-\xe7\xdc\xcf\x3a\xe7\xfe\x31\x70\x2a\xc9\x12\x1a\xe1\x14\x4a\x48\
-\x46\x71\x4c\x6a\x62\x72\x91\x21\x44\x40\x76\x47\x73\xfd\xf5\x65\
-\x6e\x7f\x67\x15\xd1\x8b\x68\x84\x8a\x81\xd8\x40\x25\x45\xf4\x13\
-\x1a\xed\x1c\x42\x38\xa4\x01\xa3\x33\x84\xf0\xdf\x2b\xfe\xda\x5e\
-\x68\x27\xbc\x06\x70\x1b\x01\x7a\x97\x5f\x04\xd3\x34\x19\x8d\x85\
-\x0e\x9c\x7f\x0f\xe5\x24\x3a\xb3\x34\x55\x8b\xf8\x4e\xcc\x7b\xaf\
-\x5c\x20\x6a\x37\x58\x78\x7c\x8e\x5c\x25\x08\x29\x71\xf8\x74\xb3\
-\xb7\xb9\x15\x04\x4e\xfd\xfb\xd1\xa1\x70\x1d\xf8\xeb\x0f\x0d\x60\
-\xf7\x78\x3f\x6f\xad\xfd\xf3\x5a\xeb\x53\x4a\x04\xc8\x48\x60\xd1\
-\x0c\xb2\x8c\x34\x8e\x51\x08\x9a\xa2\xc5\xfa\xcd\x1e\xe7\x5e\xbf\
-\xc8\xca\xd9\xbb\xa8\x38\x24\x08\x02\x72\x93\x81\x10\x94\xa4\x50\
-\xb9\xfb\x2a\x50\x24\x44\x51\xcf\x67\xcc\xbd\x53\xa6\x7c\x76\x67\
-\x68\x70\xce\x21\xdc\xb6\xb1\x38\x57\x37\x1c\x87\x76\x86\x46\xb3\
-\x89\xcd\x1c\x12\xc5\xbd\x9b\x1b\xbc\xfb\x8d\xb3\xbc\x1c\xbe\x40\
-\xf7\x64\x88\x54\xa0\x8d\xc5\x38\x8b\x12\x01\x1b\xbd\x1e\xa3\x34\
-\x7d\x72\x30\x18\xfc\xc5\x30\x0c\x5f\x69\x34\x1a\xab\x0f\x0d\x60\
-\x7b\xf1\x7f\x43\x6b\xfd\x0c\xf0\xeb\x42\x08\x94\x54\x68\x67\xe8\
-\x25\x7d\xb4\xb5\xb4\x9a\x2d\xec\x96\x61\xf9\xca\x1d\x2e\xbd\x71\
-\x9d\xb5\x6b\x77\x31\x3d\x47\xa8\x14\xc6\x59\x8c\xd5\xc8\x50\x82\
-\x11\xb5\xdd\x5a\x5f\xfc\x5a\x7e\x4f\x0d\xed\x3b\x0a\xf7\xbe\x3b\
-\x3e\x70\x8e\x02\x3f\x94\xf5\x82\x6d\x23\xb0\x58\x72\x93\xe3\xb4\
-\x43\xc9\x80\x20\x0e\xb8\x7b\x76\x9d\x0b\xea\x22\x9f\xe9\x9e\xa6\
-\x7b\xb8\x4b\x26\x32\x8c\xf4\xef\x9d\xa5\x29\x52\xc9\xaf\xc4\x71\
-\xfc\x15\x6b\xed\xcf\x01\x7f\xf0\x30\x0b\xf0\x69\xde\xdf\xb2\xd6\
-\xfe\xe7\xc6\x98\x86\x10\x02\xa5\x14\x36\x33\x24\x3a\x65\x90\x27\
-\x48\x14\x62\xa8\x58\x7e\xef\x36\xef\xbf\xfa\x1e\xa3\xdb\x39\x01\
-\x0d\xa4\x55\x58\x53\xc4\xe4\xc0\xe2\xb0\x90\xc9\x1d\x48\x7f\xfc\
-\xdf\x13\x79\x7e\x41\xf7\x39\xeb\x76\xcd\x10\xb0\x3e\x0d\x2c\x79\
-\x83\xba\x07\x48\x4d\x82\x72\x01\xa1\x0b\xfd\xcf\x01\xc6\x69\x74\
-\x23\xe5\xa9\x9f\x3d\xc1\x0b\x5f\x7a\x1e\x37\x6d\x19\x32\x42\x85\
-\x11\x42\x4b\x84\x35\xb4\xdb\x11\x33\x33\x33\x7f\x10\x86\xe1\x5f\
-\x9e\x9f\x9f\x5f\xff\x13\xcd\x03\x24\x49\xf2\x5f\x68\xad\xff\x86\
-\x31\xa6\x11\x04\x41\x05\xf6\x7a\x83\x3e\x59\x9a\xd3\xa2\x85\xd9\
-\x80\xcb\x6f\x5c\xe1\xfd\x3f\x3e\xcf\xf0\x66\x4a\xa0\x1b\x5e\xe5\
-\xe3\x3c\x05\xec\x84\x05\x03\x26\xf5\xe9\x9e\x47\xf5\x65\x8e\x2f\
-\x30\xc6\x55\x1e\x60\x1b\x6c\x88\xb1\xfc\x7f\x2c\xc6\x8f\x61\x12\
-\x8a\x90\xe2\x7f\xbf\x04\x90\xd6\x3a\x02\x11\x22\xa5\xc2\x0a\x8b\
-\x13\x05\xbb\x98\x4b\xec\x40\x72\xe1\x1b\x37\xb8\xfc\xe6\x2d\x44\
-\x1a\xd1\x50\x4d\x9c\x31\x04\xd2\xbf\x61\x92\x24\xf4\xfb\xfd\x9f\
-\x05\xfe\xe5\x9f\x68\x0f\x30\x1a\x8d\xfe\x3a\xf0\xdf\x38\xe7\xa2\
-\xd2\x55\xe7\x79\x4e\x92\x24\x38\x2c\x4a\x44\xf4\x6e\x8d\xb8\xfa\
-\xf6\x2d\xae\xbf\x73\x93\xe1\x9d\x21\x53\xb2\x45\x2e\x2d\x16\x03\
-\xb2\x40\x63\xd6\x61\x73\x8b\xb5\x05\x61\xc3\x5e\xee\xbc\xf8\xdb\
-\x6e\xe7\xf9\x14\x79\x3e\x6e\x0f\x0f\x60\x64\xe1\x01\x8a\xef\x51\
-\x50\xc3\x80\x92\x12\xa3\x35\xda\x1a\x0f\x30\x8d\xc5\x69\x50\xb2\
-\x41\x96\x39\x1a\x8f\xc2\x0b\xbf\xf8\x14\x8f\x7e\x6e\x09\x23\x13\
-\x94\x13\x28\x19\x90\x3b\x2f\x17\x98\x9e\x9e\x76\xf3\xf3\xf3\xaf\
-\x06\x41\xf0\x8b\x9d\x4e\x67\xf3\x4f\x8c\x07\x18\x0e\xe3\x76\xbf\
-\x3f\xfc\x49\x9d\xeb\x67\x9d\xb1\x51\x20\x7d\x7e\x1d\xc7\x23\x46\
-\x49\x8c\xc1\xe2\x0c\x6c\x2d\x6f\xf1\xde\x37\xcf\x71\xee\xd5\x8b\
-\x64\xeb\x9a\xe9\xe6\x34\x4e\x0a\x8c\xd0\x68\x97\x93\xe9\x0c\x6d\
-\x32\x1c\x0e\xa9\x24\x52\x08\x5c\x41\xd2\x54\x7f\x6a\xae\xdf\x5a\
-\xb0\x86\x5a\x18\xf0\x3b\xda\x16\x3b\xda\xd4\xfe\x94\x36\x61\x01\
-\x4b\xf1\x33\x05\x76\xb0\x05\xb6\x4f\xe3\x0c\x63\x1d\x22\x08\xc8\
-\xac\x26\x31\x39\x36\x10\x18\x67\x88\x5c\x83\xad\x3b\x03\xde\xfe\
-\xc6\x77\xb9\x71\xfe\x06\x81\x0b\xb0\xc6\x90\xeb\x0c\xe7\x1c\xc6\
-\x18\x7a\xbd\xbe\xd8\xda\xea\xfd\x98\x31\xe6\xff\x1c\x8d\x92\x8f\
-\xb5\x01\x35\x78\x70\xe3\x7d\xfe\x97\xb5\xd6\x4f\x0b\x21\xfe\x76\
-\x20\x03\x02\xc0\x68\x4d\x9a\x67\xe4\x46\x83\x54\x64\x79\xce\xf0\
-\xd2\x80\x4b\xdf\xfe\x80\x3b\x67\xef\xd2\xb1\x53\x68\x2c\x7d\x39\
-\x22\x5a\x0a\x79\xec\xe8\x71\xa4\x94\x15\x98\xdb\xce\xe7\xdd\xb8\
-\x4b\xa7\x96\xe3\x23\xaa\x9d\x3c\x79\x95\x21\x62\xd7\xef\x4d\x64\
-\x13\x63\xe1\x21\xdf\xfd\xfd\x84\x03\x99\x3b\xb4\x3a\x84\x6e\xa4\
-\xc8\x44\xd1\x89\x66\x10\x2d\x47\x6e\x73\x94\xf0\x22\x92\xd2\x59\
-\x1b\xe3\x7e\xa6\xd1\x50\xff\x28\x4d\xf3\xdf\x2e\x33\x95\xfb\x5a\
-\xec\x40\x02\x9c\x0f\xc3\xf0\x95\x07\x3a\x04\xa4\x69\xfe\xd7\x8c\
-\x31\x7f\xcf\x18\x33\x17\x04\xde\x46\xb5\xd1\xc4\xd9\x88\x24\x49\
-\xe8\x44\x5d\xcc\x10\xae\x9c\xbb\xc6\x07\x6f\x5e\x66\xe3\xda\x26\
-\x8d\xb4\x43\x40\xc4\x50\x0f\x99\x39\x39\xcd\xb3\x5f\x7c\x86\x27\
-\xbe\x70\x0c\x15\xca\x5d\x6f\x52\xd4\x5e\xac\xcc\xc0\xf9\x82\x8e\
-\x60\x77\xb9\x9e\x43\x80\x93\x7b\x7c\x6f\xdb\xe5\xef\x70\xb3\x62\
-\x2f\x03\x90\x08\xd3\xc4\x09\x87\x76\x1a\x11\x42\xd4\x0a\x7d\xc5\
-\x50\x38\xef\xa9\x2a\xa3\x12\x15\x3f\x71\x60\x77\xef\xb3\x8c\x33\
-\xc0\xef\x03\xff\x4b\x14\x45\xef\x3d\x70\x1e\x20\x8e\xd3\xbf\x66\
-\x8c\xf9\x3b\xce\xb9\xb9\x4a\x45\x63\x34\xa3\x2c\x45\x5b\x4d\x18\
-\xb6\xc9\x7a\x96\xab\x6f\x5e\xe3\xc2\xeb\x97\x18\xdc\x1b\x12\x98\
-\x08\xe5\x02\xd2\x3c\x45\x4d\x49\x1e\x7d\xf6\x38\x4f\xfe\xc8\xa3\
-\xb4\x17\x42\x2a\x96\x66\xc7\x8a\x89\x09\x03\x28\x1f\xb3\x03\xb1\
-\xc7\xee\x2a\xa4\x5f\x07\xa0\xad\xf6\x34\x9a\x4c\xa4\x08\x24\x11\
-\x0a\x89\x40\x38\x41\xe4\x02\x4f\x25\xd7\x8c\xb5\x9e\x96\x4e\x1a\
-\xf0\x47\x23\xce\x28\x6a\x19\xf6\x05\xe0\x05\xe0\x15\xe0\xc1\x31\
-\x80\xe1\x30\x46\x29\xf5\x57\xac\xb5\x7f\xcf\x39\x37\xa7\x94\xaa\
-\x24\x54\xa3\x34\xc1\x22\x69\xaa\x36\xc9\xbd\x84\x2b\x6f\x5e\xe1\
-\xd2\xab\x1f\x90\xdf\x33\x84\xb2\x49\x28\x43\xd0\x0a\x6b\x52\xc2\
-\xa6\xa4\x73\xa8\x81\x6c\x89\xa2\x75\x9b\x4a\xb4\x51\x4f\xcd\x84\
-\xc8\x76\x20\x61\xbf\xc3\x04\x58\xb9\x8f\x07\x38\xc0\xce\x53\x76\
-\x4f\xb3\x08\x6c\xa3\x4a\x35\x2d\x20\x84\xc5\x09\x90\x4e\x20\x11\
-\x3b\x48\xaa\x6d\x02\xeb\x3e\xd1\xbe\xa0\x92\xa5\x59\x6b\x2b\x6f\
-\x12\x3c\x18\x2e\x3f\x7d\x4a\x6b\xfb\x05\x63\xcc\xff\x5e\xde\xa4\
-\x31\x86\x2c\xcb\xc8\xb2\x8c\x10\x85\x32\x01\x9b\xd7\xb6\x38\xfb\
-\xea\x25\x6e\xbc\x77\x0b\x86\x82\x4e\xa3\x8b\xc1\x61\x4d\x51\x90\
-\x57\xa0\x6d\x8e\x41\xa3\x42\x48\x4c\x52\x34\x6d\xee\x44\xfa\xa5\
-\x63\x10\xb5\x1d\x2d\x84\xc0\x21\xc1\x85\xfb\x3e\xc8\xfb\xbd\x8c\
-\xde\x3d\xa4\x48\x2b\x68\x68\x59\xf4\x11\xe0\x85\x28\x58\x64\x20\
-\xd0\xd6\x54\xc6\x56\x77\xfd\xd5\xe7\x3f\xc0\x07\x89\xa2\xa0\xaa\
-\x56\x3e\x30\x06\x90\x65\xd9\x4f\x19\x63\xfe\x15\xd8\x76\x99\x94\
-\x58\x6b\xc9\xb2\x8c\x3c\xcf\xbd\xc5\x26\x29\x77\x2e\xdf\xe4\xf2\
-\xeb\xd7\x58\xbf\xd8\x27\x4a\x1a\xa8\x30\x20\x75\x39\xa9\xce\x08\
-\x08\x90\xc8\x8a\x92\x95\xf8\x94\xcf\xe9\xe2\x19\x16\xee\x5e\x94\
-\xcb\xed\xc0\x1a\x59\x79\x75\xe1\x2d\xa1\xb4\x88\x82\xf2\xdb\xcb\
-\x69\xbb\xfb\x36\x0c\xb1\x07\x6e\xb0\x38\xe2\x20\xf6\x35\x03\xe7\
-\xb3\x13\x93\x5b\x9f\x09\x38\x47\xc5\x2f\xef\x61\x04\xf7\xff\xac\
-\xfd\xce\x57\x4a\x3d\x18\x59\x40\x1c\xc7\xbf\xa4\xb5\xfe\x9f\x9c\
-\xa3\x2d\x90\x08\xa1\xc8\x4c\x46\x96\xa7\x18\x6d\x51\x36\x20\x1d\
-\xa4\xac\x5e\x5c\xe3\xea\x9b\x57\x58\xbb\xb6\x8e\x4a\x1b\x44\x81\
-\xd7\xe8\x6b\x9b\x21\x11\x48\x25\x70\xce\x62\x72\x47\xe4\x22\x42\
-\xd1\xf0\xa8\xdc\x16\xe8\x5e\x44\x08\xbd\x81\xd8\x7a\x0b\x95\x7c\
-\x50\x2c\xa5\xad\x85\x00\x51\x0b\xed\xbe\x30\xb4\x27\xd0\xdb\xcb\
-\x00\xf6\xc1\x06\x76\x8f\xac\xc2\x09\xb0\x01\x18\x63\xbd\x01\x48\
-\x85\xd0\xa0\x84\x42\x09\x57\xfd\x7f\xe3\x71\xff\xc3\x76\xbe\xc5\
-\x21\x10\x18\x6c\x30\x83\xed\x7e\x16\xdb\x3e\xed\xdf\x29\xb7\x48\
-\x25\xc7\x0c\x3c\xf8\x14\x17\xff\xdf\xb1\xd6\xfe\x77\xd6\xba\x13\
-\x52\x2a\x10\x82\x38\x4b\x89\xb3\x11\xc6\x18\x1a\xa2\x89\xee\xc3\
-\xd5\xef\xde\xe6\xc6\xdb\x37\xc8\xd7\x34\x81\x69\x61\x95\x25\x25\
-\xf1\x2e\xd4\x39\x30\x02\x6b\x33\x9c\x54\x08\x27\x10\x3a\x44\xa7\
-\x16\xed\x72\xaf\xcf\x13\x60\x45\x13\x69\x36\x61\xed\x5f\x21\xd7\
-\x7f\xa7\x70\xf5\xf7\x7f\xeb\x07\xc5\xe0\xea\x13\x7d\xb2\x06\xe7\
-\x24\x52\x64\xe8\xc6\x29\xcc\xa3\x4d\x74\xeb\x34\x16\x08\xad\xc7\
-\x01\xd6\xb8\xa2\xc3\xe9\x53\x32\x80\x24\x19\x7d\xd9\x18\xf3\x8f\
-\xac\x75\x27\xa5\xf4\x88\x37\xcd\x53\x06\xf9\x00\x81\x20\x92\x0d\
-\xf4\x86\xe1\xf2\x1b\x57\xb9\xf0\xe6\x65\xd2\xf5\x94\xa6\x6c\x60\
-\x0a\x55\xae\xcf\xed\x8b\x7d\x6c\x6d\x21\xe6\xf0\x85\x1c\x63\x34\
-\x5a\x7b\xaa\x57\x14\xfb\xdc\x0a\x0b\xd6\x21\xc7\x70\xc0\xa7\xde\
-\x94\xf3\xfd\xa1\x76\x45\x09\x56\x6d\x11\x12\x5d\x51\xbf\xf0\x1c\
-\x87\xb5\x16\xa9\xc4\x27\xef\x01\xf2\x3c\x6f\x39\x67\xbb\x42\xf0\
-\x4f\xf2\xdc\x7c\x59\x08\x39\x5d\xf5\xe1\xa7\x9a\x51\x12\x43\x00\
-\x0d\xd1\x60\xf3\xe6\x80\xab\xdf\xb9\xce\x07\xaf\x5d\x47\x0c\x24\
-\xed\x70\x8a\xdc\xa4\x15\x80\xa9\x57\xf1\x1c\xde\x9a\x85\x53\xde\
-\x20\x8c\xad\xba\x71\x04\x54\xcc\x9c\xc4\x8d\x6d\x61\x21\xec\x0f\
-\xa7\x01\x20\x7d\x58\x44\x20\x0b\x56\x43\x22\xfc\x46\x28\xd0\xbf\
-\xb5\xdb\xa1\x2c\xf8\x84\x16\xff\xb0\x73\xee\x6f\x59\xeb\x7e\x2d\
-\xcf\xf3\xa6\xb5\x96\x28\x6a\x62\xad\x25\x49\x32\x74\x6e\x10\x46\
-\x12\x64\x8a\x9b\x57\x56\x38\xf7\xea\x05\xee\x7d\xb0\x41\x23\x6d\
-\xd3\x90\x0d\xac\x35\x08\xa1\x8a\xf8\x5c\x1a\x80\xad\x64\x58\xb5\
-\x8c\xb9\x06\x92\x0a\x56\x8f\x3a\xf2\x2f\xd3\x28\x8b\xd3\x3f\x9c\
-\x06\x80\xf0\xe5\x67\x81\x57\x23\x39\x6b\xb1\xd6\xf8\x14\xb3\x48\
-\x01\x25\xa2\x02\x98\x9f\x88\x01\x58\x6b\x7f\xc5\x5a\xfb\x2b\xce\
-\xb9\x66\x18\x46\x68\x6d\xd0\x5a\x93\xc4\x29\x5a\x1b\x94\x0a\xb0\
-\x29\xac\x9f\xdf\xe4\xc2\x9b\x97\x58\xbf\xba\x41\xc3\xb6\x08\x55\
-\x48\x66\x53\x6c\xa9\xba\xd9\xa5\x08\x23\x85\x28\xc4\x98\x76\xcc\
-\x00\xac\x75\x08\x59\x54\xe5\xc4\xce\x0a\x9f\x14\xc1\x0f\xad\x01\
-\xc8\x62\x53\x48\x21\xb0\x42\x54\x4c\x64\x41\x04\x15\x85\xb0\x4f\
-\xc8\x00\xf2\x3c\x7f\x4a\x6b\xfd\x73\xc6\x98\x99\xd2\xfd\xe4\x79\
-\x8e\xce\x0d\x79\xae\x09\xc3\x90\xc1\x60\xc8\x95\xf7\xae\xb1\xfa\
-\xad\x4d\x7a\xab\x43\x9a\xf9\x14\x12\x49\x46\x82\x0e\x35\x58\x81\
-\xd2\x6a\x2c\x0d\xaa\x53\xa4\xce\x39\xac\x31\x08\xa7\x8a\xbc\xbf\
-\xb8\xd1\x42\x71\x6b\x31\xbe\xc3\xa7\x88\x87\xd6\x59\x84\x0d\x7f\
-\x38\x0d\x40\xfa\x7b\x15\xf8\x67\xe0\x8c\xad\xd4\xca\xe5\x2e\xb0\
-\xdb\x5a\xf6\x4f\xc4\x03\x6c\x69\x6d\x36\x9d\x73\x04\x4a\x91\x0d\
-\x35\x99\xd3\x64\xd6\x10\x06\x11\x7a\x13\xae\xbf\xba\xcc\xcd\x77\
-\x56\xc8\x57\x35\xd2\x19\xa4\x30\x68\x23\x41\x38\x94\xd3\x45\x39\
-\x56\xed\xda\x93\x27\x85\xf2\x7a\x7c\x40\x5a\x87\x28\xbc\x81\x11\
-\x06\x21\x23\xdf\xce\x25\x25\x18\x87\xb0\x20\xb4\xc5\xdb\xbf\xde\
-\x73\x0b\x89\x7d\x09\xdd\xfb\x4f\x03\xf7\xce\x1f\x0e\x4a\x2d\xef\
-\xf3\x3f\x19\xe7\xf1\x90\xf0\x0d\x2e\xd6\x81\x31\x39\x28\xe5\x03\
-\x62\x21\x6a\x15\x52\x7c\x52\x1e\xc0\xfc\x8c\xb5\xee\xe7\x9c\x73\
-\x10\x08\x8c\x36\xe4\xce\x20\x42\x49\x9a\xe4\xdc\x38\x7f\x83\x73\
-\xaf\x9f\x83\x4d\x45\x28\xda\x20\xbd\x78\x03\x24\xc2\x05\x28\x0b\
-\xd6\x19\x74\xc1\x7d\xd6\x35\x7c\xce\x79\x21\xb7\x35\x05\xe2\x35\
-\x0e\x67\x25\xd6\x39\x8c\x73\xc8\xb1\xce\x9d\x42\xb7\xe7\x3c\xdd\
-\x64\xf7\x65\x6e\xc4\xde\x84\xfa\x5e\x0b\xf6\x91\x72\xf4\x5d\x98\
-\x85\x8f\x19\x8a\x48\x21\x10\xa8\x42\x90\x2a\x2a\x0f\xe9\xbf\xde\
-\x29\x64\x39\x90\x01\x0c\x06\x83\xd9\xe1\x60\x38\x3f\x1c\x0c\xd0\
-\xda\xb7\x3e\x97\x62\x4a\x21\x04\x52\x4a\x8c\xf1\xe2\x87\x2c\x4b\
-\x9f\x12\x88\x43\xe5\x7c\x5d\xa5\x04\x9d\xb0\x89\x16\x0e\x6d\x34\
-\x33\x87\xa6\x68\x1d\x8a\xb8\xd7\xdf\x22\x94\x0a\x21\x34\x18\x4b\
-\x28\x1b\x38\x2d\x31\xb9\x2d\x5b\xee\xfc\x8e\xf7\xe5\x9a\x6a\x2f\
-\x96\x9e\xc0\x83\x3b\x51\x01\x3d\xff\x79\x0c\xce\x1a\x4f\x8e\x4c\
-\x84\x0d\x5c\xb0\xcf\x5e\xdd\xab\x7a\xe7\xf6\x29\x05\xec\x67\x50\
-\xfa\x7e\x6a\x44\xdf\xd3\xb5\xfd\x3c\x6a\x2a\x25\x67\x11\xd6\xd6\
-\xd2\x60\x5b\xb1\xa3\x07\x32\x80\x8d\x8d\x8d\x5f\xed\x6d\x6e\xfd\
-\x83\x5e\xaf\x87\x31\xa6\xca\xcb\xad\xb5\x94\xda\xfc\xb2\x5e\xbd\
-\xba\xba\x5a\x71\xfa\xc6\x18\x6c\xee\xb0\xca\x91\x1b\x4d\xa0\x22\
-\x9a\xa6\xc9\x90\x2d\xd6\xd2\x5b\x18\xbb\x4c\x23\x80\xd0\x86\xcc\
-\x44\x8e\xc0\xb5\x10\x2e\xc7\x5a\x3f\xb3\xc7\x21\x6a\x0d\x99\x35\
-\xb5\x6e\x51\xc3\x77\xa5\x48\xc3\x3a\xcf\xae\x15\xf4\x30\xb5\x85\
-\x13\x65\x61\xc4\x7e\x48\xe9\xec\x7e\x97\x79\x3f\x7a\x56\xec\xf7\
-\x7e\xe2\x63\x37\x80\x6a\xa7\xd7\x1b\x59\xad\xad\x14\xcd\xd6\x09\
-\xa4\x3b\xa0\x07\xc8\xb2\xec\xb1\x3f\xfa\xa3\x3f\xfa\xe9\x57\xbf\
-\xf9\x4d\x36\xd6\xd7\xb1\xc5\xf4\x0b\x6a\x3b\xb1\xac\x3a\x55\x61\
-\x40\x6b\xf2\x2c\xc3\x5a\x4b\xa8\xbc\x2a\xc6\x09\x41\xa0\x42\x22\
-\x22\xd2\xad\x91\xcf\x0a\x74\x4c\x94\x41\x90\x45\x88\x69\xc5\x8c\
-\x3a\x4c\x23\x90\x08\xed\x70\xa6\x24\xf1\x6b\x0b\xea\x5c\x41\x7b\
-\x16\xae\xce\x96\x2e\xb5\x50\xf7\x4a\x57\xa8\x75\x77\x2e\x90\x73\
-\xe6\xbe\x17\xf9\xc3\x36\xac\xd8\xc7\xd5\xef\xf9\xaa\xfb\x78\xdd\
-\x40\x49\x20\x8b\xa2\x70\xe9\x95\x4f\xae\xc0\x04\xdb\x21\xf1\x7b\
-\x09\x01\xc7\xe2\x38\xfe\xfc\x99\x33\xef\x30\xec\xf7\xab\xc2\x42\
-\x7d\xc1\x77\x2b\x56\x54\xc5\x0c\x67\x40\x2a\x9c\x90\x98\xc2\x20\
-\xd0\x1a\x29\x05\xb9\xd4\xa8\xdc\x22\x87\x21\xd3\xd1\x71\xda\xcd\
-\x05\x42\x11\x78\x24\xeb\x26\x1e\x71\xbd\x41\x93\xf1\x92\xae\x14\
-\x0a\x29\x8a\x66\x4e\xeb\x85\x98\xb6\xc8\x81\x8d\xb5\x45\xea\xa8\
-\xf7\x5c\x45\xb7\x9f\x09\x38\xee\xff\xf7\xec\x1e\x21\xa5\x88\xcb\
-\x1f\x73\x10\x18\xf3\x38\x95\xcb\xb7\xb2\x52\x33\xf9\x2c\xe9\x80\
-\x21\x40\x08\xf1\xce\xa5\x4b\x97\x7e\x73\x38\x1c\xfd\xcd\xe5\xe5\
-\x65\xa2\x28\xaa\x6a\xcc\xf5\x9d\x5f\x7e\xbd\xd3\x18\x8c\x2f\x8e\
-\x14\x61\x42\x06\x12\x6c\x0e\x52\x90\x09\x08\x0d\x44\x71\x87\xa5\
-\x66\xc6\xac\xf3\x7c\xbf\x33\x1a\x21\xf4\xf6\xae\x77\x5e\x7b\x87\
-\x73\x68\xe3\x7c\x09\x55\x4a\x5c\x0a\x22\x15\xe4\xb9\xf6\x29\x66\
-\x51\xfe\xc4\x5a\xac\x31\x3e\x04\x19\x53\x80\x3c\xbb\xf7\xf3\xdb\
-\x03\x04\xba\x0f\x0d\x0d\x7b\x19\x4e\xb0\x67\xd4\x10\xe2\x63\x5f\
-\xfe\xa2\x25\x9e\x1d\x46\x50\x35\xaf\xd4\x37\xcc\xe4\x1b\xa4\x69\
-\xda\x76\xce\x05\x42\x88\x97\x80\x7f\x0e\x5c\x10\x42\x7c\x00\xfc\
-\x69\xe0\x6d\x63\xcc\x4f\x6c\x6e\x6e\x76\x6e\xdd\xba\x35\xed\x1b\
-\x1a\x77\x1a\xb1\x28\x74\x78\xdb\x3a\xbb\x6d\x74\xed\x01\xc8\x36\
-\xd2\xae\x1c\x43\xed\xe1\x2b\xa9\x68\x84\x4d\x42\x15\x21\x91\x48\
-\xa7\x50\x05\x68\xdb\x7e\xbf\x22\xa7\x95\xde\x00\x4a\xd7\x16\x46\
-\x11\xd3\x73\x53\xb4\xa7\x3b\x48\x55\x4e\xfb\x30\x58\x33\xc0\xe9\
-\x75\x9c\xe9\x23\x30\xb4\x4d\x76\xa0\xa2\x8f\x3b\xc0\xef\x58\xd9\
-\xc4\x6d\x6e\xe2\x36\x5e\x25\x5f\xfd\x97\x4c\xe5\x77\x08\x6c\x80\
-\x43\xa1\x43\xf7\x21\xf1\xfc\x3e\xb3\x00\x27\x70\x84\x28\x99\x92\
-\x46\x8f\x92\x9c\xf8\x75\x46\xf3\xbf\xe0\xd9\x41\x57\x94\x83\x03\
-\x89\x94\xe2\xcf\x1f\x39\x72\xf8\xb7\x83\xc9\xf8\x6e\xad\xfd\xbf\
-\x9d\x73\x2f\x97\x8a\x54\xe7\xdc\x51\xe0\xa7\x8a\x49\x57\x4f\x05\
-\x41\xc0\xcc\xcc\x0c\x73\x73\x73\x63\x75\xe5\x3d\x5d\xfe\x1e\xff\
-\xde\xed\x26\xf7\xac\x79\x5b\xb1\x37\x8e\x12\xf5\x74\xda\xa7\x3c\
-\x46\x17\xcd\x99\x08\x10\x12\x87\x01\xa6\x41\x76\x0a\x76\x1c\xa4\
-\x8d\x3e\x39\x6e\x46\xe5\xc8\xae\x40\x2d\x3e\x82\x59\x38\x4a\xb6\
-\xfc\x3a\xc3\xb5\x37\x68\xcb\x15\x84\xed\xec\x69\x6a\x07\x72\x0e\
-\xb6\x00\x9d\xf5\xf6\xb4\x4a\xa6\xee\x76\x58\x71\x50\xec\xfa\x47\
-\x80\x9f\xb2\xd6\xfe\x5a\x9e\xe7\x2f\xd7\x91\x7d\xbd\xf8\x52\x16\
-\x59\x80\x9a\x5a\x75\xf7\x45\xdd\x6e\xb0\x14\xbb\xbe\x3e\xa9\xc1\
-\x2f\xc1\xe3\x4e\xa6\xaf\x70\x13\x42\xec\x8a\xb8\xcb\x9c\x77\x87\
-\x3f\x2d\x8a\x40\xdb\xf5\x03\x81\x20\x28\xe2\xa3\x44\x8b\x4f\x8e\
-\x09\x14\xd6\x81\x68\x11\x74\x9f\x41\xb4\x96\xc8\xc5\x29\xd2\x2c\
-\x41\xa5\xf7\x68\xc4\xee\xbe\xe9\x88\x8f\x14\x06\xd8\x9e\x57\x60\
-\x0b\x03\x28\x89\xa0\x3a\x6a\x0a\x8a\xf4\xed\x73\xc0\x3f\x2d\x73\
-\xf5\xba\x66\xac\x9c\x71\xa7\x94\xc2\x14\x71\xb4\x5c\xb0\xbd\x76\
-\xf5\xe4\xa2\xd7\x17\xb3\x2e\x67\xde\xeb\xf7\xb7\xcb\xbd\x45\xbf\
-\x9e\x27\x73\xb7\xdf\xaf\x46\x68\x04\x05\xdc\xb5\x45\x68\x29\x39\
-\x09\xcf\x89\x17\x5e\xc0\x09\x9c\x93\xc5\x43\x11\xc5\xae\x8c\x3f\
-\x39\x7a\xd6\x08\x32\x1b\x13\x23\x41\x1d\xa2\x35\xff\xa7\xe8\xc6\
-\xd7\xc8\xae\x5e\x02\xbb\xb6\x37\xa8\x3c\x00\x3e\x14\x35\x20\x30\
-\x26\x87\xc3\x03\xe1\x7a\x53\x6c\x65\x00\xc6\x98\xaa\x41\x62\x32\
-\xee\x94\xaf\xd5\x41\x5d\x3d\xef\xdf\xcb\x00\x26\x77\xf8\xe4\xe2\
-\x96\x06\x54\x37\xa4\x49\xa3\xaa\xf4\x6b\x48\xa4\xd8\x3d\x26\x6a\
-\x93\x83\xad\x79\x10\x59\x56\x0a\x8b\xdc\xb7\xf4\x8b\x4e\xe2\x9c\
-\x2c\x52\x46\x87\x72\xee\x13\x5b\x7f\x25\x1d\xa1\x72\xa4\x22\x67\
-\x60\x02\x68\x74\x69\xce\x7d\x8e\xec\xda\x37\x81\xb5\x8f\x95\x24\
-\xda\x1e\x54\xbd\x4d\xfa\x6c\x6f\xc2\xfa\x9a\x88\x71\x03\x28\x8d\
-\xa0\x5c\x80\xf2\xeb\x72\x31\xcb\xef\x8f\x33\x6f\x6e\xcf\x1d\x3c\
-\x26\xc0\x2c\x16\xa7\xdc\x9d\xbb\x2d\xfe\x64\xb8\x99\x24\x4b\x94\
-\x53\xb8\x31\x36\xa7\xe8\xbe\x51\x16\x27\x6d\x91\xe2\x19\x9c\xd1\
-\xdb\xa1\xc6\xba\xda\xfb\xdb\x42\x09\x54\xfe\xeb\x93\xd3\xe9\xc4\
-\x66\x44\xc7\x45\x04\x06\xa4\xc8\x48\x55\x48\xab\x31\x0b\x9d\x53\
-\x88\xe1\x1f\xf3\x71\x5a\x80\x2b\xe2\xbf\x1b\x9b\x65\xec\xc3\x80\
-\x64\x1b\x03\xb8\x7a\x31\xa8\xbe\xb8\x95\xd7\x2a\x5c\x7d\xf9\x5a\
-\x39\xf6\xa4\xf4\x14\x1f\x95\x92\x2c\x17\x5e\x29\x85\x52\xaa\x2a\
-\xa8\x88\x5a\xe9\xb6\x6e\x74\xbb\x85\x12\xe1\x44\xa5\xc9\x17\x35\
-\xb1\xbc\x00\x0c\xba\xba\x59\x6b\x0c\x5a\x1b\xaf\xae\xb5\x5e\x67\
-\xe7\x6a\x7d\xdd\x3e\xf6\x15\x35\x05\x25\xbf\x07\xb6\xa7\xce\x2c\
-\x7e\x78\xa0\xce\x95\x22\x48\x22\xa4\x55\x84\x2d\x4b\xe6\x34\x7d\
-\x61\x51\xd3\x5d\x58\x15\xb5\xa8\x3d\xee\xff\x1d\xdf\x4b\x0c\x10\
-\x55\x0d\xc4\xd9\xb2\x49\xad\x54\x3e\x4f\x78\x80\x12\xd0\x29\xa5\
-\x2a\x43\x98\xdc\x8d\x75\xd0\xb7\xdb\xf7\x27\x17\xbe\x34\x98\x28\
-\x8a\x08\x82\x60\xdb\xa3\x48\x6f\x44\xae\x8e\x01\x4a\x6f\x60\xdd\
-\x18\x10\xac\xff\x8e\x2b\x1f\x7c\x6d\xa8\x43\xd9\x3c\x21\x8a\xde\
-\xfc\x20\x8c\x08\xd4\xb6\xa2\xd8\xd6\xc8\x9e\xed\xc2\x48\x51\x1c\
-\xb1\xf7\x8f\xb0\x14\x0a\x84\xc3\xb8\x0c\x02\x51\x4c\x0c\x51\xe8\
-\xcc\x82\xd3\x08\xdc\x38\xae\x29\x3e\x5f\x3b\x87\xac\x71\x17\xe7\
-\x22\x5c\x6c\x31\x22\xc0\xe6\x86\x90\x0d\x10\x01\x46\x27\x28\x55\
-\x48\xdb\x9d\x40\xa2\x3c\x70\x3b\x80\x6a\x49\x59\x87\x75\x01\x42\
-\x2a\x04\x11\xce\x0a\x3f\xf3\x50\x6a\x84\x55\x68\xed\x4f\x37\x2b\
-\x3f\x66\x30\xb9\xf3\x26\x5d\xf7\x5e\x6e\x7e\x32\xce\xd7\xdd\xb9\
-\xb5\x96\x56\xab\x45\xd9\xdc\x51\xff\x79\x57\x2e\x72\x61\x84\xe5\
-\xeb\x5a\x6b\x84\x83\x24\x49\xaa\x42\x52\xe9\x71\xa4\x92\xa8\x20\
-\xa8\x24\xcd\x63\xc5\x27\x47\x55\xda\x2c\xaf\x30\xf4\xd3\x40\xca\
-\xde\x82\x3c\xcf\xab\xd0\xb4\x97\xb7\xf9\xe8\x44\x18\x68\x6b\x88\
-\xc2\x88\x54\x1b\xb6\x36\xd6\xd1\x79\x39\xe0\xc5\x6d\x13\x42\xb5\
-\x8f\xd4\x30\x01\x59\x94\x80\x89\x40\x58\x32\x19\xd0\xca\xfa\x74\
-\xb6\x86\x1c\x77\x02\x37\x41\xce\x14\x78\xfd\x80\xb5\x00\xc6\xbb\
-\x5a\xd9\x39\x03\x61\x47\x08\xa8\x3f\x8c\xc9\x0c\x60\xcf\x86\xc7\
-\xda\xa2\x97\xbb\x32\x08\x02\xc2\x30\xa4\xd9\x6c\x56\xef\x51\x7a\
-\x02\xad\x7d\x6c\x0e\xa3\xc8\x77\x6a\x1b\x9f\x71\x24\x49\xca\xd6\
-\xe6\x26\xbd\x7e\x8f\x51\x7f\xc8\x60\x38\x20\x8e\x13\x0f\xd4\x94\
-\xa7\x29\xc2\x28\xa4\xdd\x69\xd3\x6e\xb5\xe9\x4e\x4f\x33\x33\x3d\
-\x4d\xab\xdd\x22\x08\xfc\x42\xd7\xc3\x98\x10\x82\x20\x08\x2a\x2f\
-\x54\x7e\xb6\xf2\xfb\x07\x25\x58\x00\x8c\x35\x48\xa5\x90\x52\x91\
-\x67\x86\xd5\xd5\xbb\x0c\x46\x19\xb3\xf3\x87\x69\xb5\x3b\x4c\x88\
-\x0e\xab\x7f\x45\x56\xa2\xc2\x0c\x61\x42\x10\x8e\x48\x2a\x5a\xa9\
-\xa2\x39\x3a\x84\x5b\x2d\x68\xbb\x72\xe2\x68\x51\xbb\x70\x4e\x1c\
-\xcc\x04\xc4\xce\x46\x18\x37\xb1\xe8\x63\x59\x54\x7d\x41\x27\x6b\
-\xed\x1f\xad\xec\x28\xaa\x87\x1e\x45\x11\x51\x14\x55\x29\x63\x9d\
-\x3f\x28\x71\x80\x73\x8e\x5e\xaf\xcf\xfa\xfa\x3a\xcb\xcb\xcb\xdc\
-\xb8\x71\x83\x8d\x8d\x0d\x8c\x36\x45\x0c\xd7\xd5\x42\x55\x5e\x46\
-\x08\x82\x30\xa8\x16\xbb\xd5\x6a\x71\xf4\xe8\x51\x1e\x7d\xf4\x51\
-\x96\x96\x96\x68\xb7\xdb\x84\x61\x58\x81\x4d\x6b\xad\x9f\x00\x16\
-\x86\x44\x51\x54\x0d\x93\x28\x2b\x92\xfb\xa5\xa0\x1f\x52\x6c\xc7\
-\x62\xa1\x90\xb4\x0d\x7a\x23\x54\x7b\x9a\xf6\xec\x02\xa8\x68\xac\
-\xe2\x58\xd7\x07\x08\x23\x20\x4c\xc1\x84\x48\x21\x50\x52\xa0\x5c\
-\x86\x0a\xda\x30\x56\xe1\x2c\xe2\xb6\xa8\x33\x5c\xf7\xef\x01\xc6\
-\x77\xfc\x76\x1a\xe8\xdc\xce\xb0\x1d\xec\xb6\xa8\x1f\xc5\x00\xea\
-\xd9\x41\xa3\xd1\xa8\x16\xa1\x5e\x16\x2e\x31\x45\xb9\x70\x71\x1c\
-\x73\xe1\xdc\x79\xce\x9e\x3d\xcb\xf2\x9d\x3b\x5e\xab\x26\x04\x59\
-\x9a\x62\xad\x45\xd5\xb2\x05\x9f\xb3\xdb\x6a\x77\x6b\x9d\x57\x06\
-\xd4\xef\xf5\xb9\x77\xf7\x1e\x97\x2e\x5c\xa4\xd5\x69\xf3\xf8\xe3\
-\x8f\xf3\xf2\xcb\x2f\x33\x35\x35\x45\x96\x65\x28\xa5\x68\x36\x9b\
-\x95\x56\xa1\xd1\x68\x8c\x65\x26\xa5\x11\xdc\x3f\xc2\xf6\x9f\x49\
-\x3a\x87\x92\x21\x41\xd8\xa0\x31\x35\x8d\x96\x01\xc6\xba\x9d\x58\
-\xac\x58\x3f\x6d\x21\x33\x16\x69\x1c\x81\xf4\x2a\x9d\xdc\x38\x82\
-\xdc\xd6\x16\xde\x55\x73\x87\xfd\xac\x21\x7b\x20\x0f\xe0\x6a\xba\
-\xa5\x8a\x0c\xb2\x0e\x2b\xbd\x44\x7c\x72\x9d\xab\x10\x50\xdf\xfd\
-\xf5\x7a\xfe\x7e\x14\xae\x10\x82\x46\xa3\x41\xb3\xd9\x24\x28\x62\
-\x74\xb9\xf8\xe5\x43\x96\x52\xd2\xef\xf7\xb9\x72\xe5\x0a\xef\xbe\
-\xfb\x2e\x77\x57\xd7\xaa\xef\x19\x20\xcf\xfd\xc2\xb6\xdb\x6d\x5c\
-\xc1\x34\x4e\x02\xd1\x30\x08\x70\x85\x21\x08\x21\x68\x36\x1a\x58\
-\x6b\x19\x0e\x87\x8c\x92\x98\x8d\x8d\x0d\xce\x9d\x3b\xc7\x93\x4f\
-\x3e\xc9\x67\x3e\xf3\x19\x16\x17\x17\x89\xe3\x98\x30\x0c\xab\x9b\
-\x0d\x82\x80\x56\xab\xe5\x7b\x10\xd2\xb4\xc2\x05\x1f\x85\xc6\xae\
-\x38\x87\x62\x91\x22\x20\x52\x01\x41\x18\x61\x90\x24\xd6\xe1\x8c\
-\xa9\xa6\x6d\x4c\xfe\xbe\x74\x01\xb9\x35\x04\xc6\x1b\x8f\x95\x0a\
-\xa7\x0d\xd6\xe8\xed\x69\xe3\x25\x43\xe1\xca\x56\xf3\x72\x64\xed\
-\x01\x8c\x74\xd2\xfd\xef\x63\x4a\xc1\x6e\x08\x7f\xb2\xb4\xbb\x9b\
-\x37\x70\xce\xd1\x68\x34\x68\xb5\x5a\x44\x51\x54\xc5\xd9\xb2\xb1\
-\x33\x0c\x42\xd2\x2c\xe5\xda\xd5\xab\xbc\xff\xfe\x59\x6e\xde\xba\
-\xc9\xa0\x3f\x40\x15\x28\xbf\xdc\xe9\x61\xe8\xcf\xd4\x49\xe2\x78\
-\xbc\xa4\x5b\xfc\x9c\x31\x06\x57\x55\xf0\x8a\x29\x5a\x59\x56\x85\
-\x9d\xb2\xc3\xa5\xd7\xeb\xf1\xf6\xdb\x6f\xb3\x7c\x7b\x99\x67\x9f\
-\x7d\x96\x27\x9f\x7a\xb2\xf2\x02\xce\x39\x54\xa0\x50\x41\x40\xd4\
-\x68\xe0\x70\x3b\x58\xcd\x1d\x61\x67\xb7\x87\x2b\xbd\x5b\xce\xb3\
-\x0c\x14\x84\x81\x22\xc7\xa1\xad\xc5\xd9\x62\xb9\x0a\x66\x52\x8c\
-\x55\xba\x04\x18\x89\x76\xbe\xfd\xdb\x58\x50\x42\xd0\x72\x6a\x3b\
-\xf5\xb4\xdb\xd0\xcf\x15\x22\x17\x71\x00\xac\x22\x8a\xff\x43\xd4\
-\xa6\x96\xd9\x22\x0d\x2c\x4b\xc0\xce\x4e\x78\x80\x72\x17\xd6\xdb\
-\x87\xeb\xe9\xd8\x6e\xc5\x9b\x30\x0c\x99\x9a\x9a\xaa\x76\x59\x9d\
-\xd8\x91\x42\xd2\xdb\xda\xe2\xfd\xf7\xdf\xe7\xfd\xf7\xdf\x67\x7d\
-\x7d\x1d\xad\x75\x15\x0a\xca\x1d\x52\x2e\x4e\x69\x0c\xec\x92\x5e\
-\x56\xd9\xc3\x04\x03\x59\x97\x9f\x89\xa2\x04\xae\xb3\x9c\x5b\x37\
-\x6f\xd2\xef\xf5\x58\x5b\x5d\xe5\xa5\x97\x5f\xe6\xc8\xb1\xa3\x18\
-\xa3\x3d\x0d\x2a\x05\x4e\x0a\x9a\x9d\x0e\xce\xfa\xc9\x9c\x25\x3e\
-\xf9\x28\x99\x8f\x7f\x80\x96\x48\x0a\x8c\x4e\x69\x36\x1b\x98\x40\
-\x91\x66\x1a\x84\xaa\x58\xc6\x6d\x0f\xe0\x4a\x26\x98\x56\x26\xc8\
-\x01\x23\x2c\x99\x12\x68\x21\x98\x76\x9e\x17\x11\xce\x8b\x39\xa5\
-\xf4\x99\xa0\x2d\x72\x5b\x79\x00\x03\xf0\x84\x99\x28\xaa\xa8\xde\
-\x18\x8d\x36\x10\xec\xde\x25\x3d\x96\x05\xd4\xdd\x6f\x1d\xe4\x4d\
-\x86\x85\x30\x0c\xe9\x74\x3a\xb4\x5a\xe3\x67\xe2\x94\xa8\xbf\xdf\
-\xeb\xf3\xfa\xeb\xaf\xf3\xf6\xdb\x6f\x93\xa6\x29\xe5\x54\xaf\xaa\
-\x63\x67\x17\x0e\x41\x0a\x51\xd5\xfa\x77\xe0\x92\xaa\x94\xec\x76\
-\x14\x92\xea\xde\xab\xc4\x08\x1b\x1b\x1b\xf4\x7a\x3d\x36\xb7\x36\
-\xf9\x89\x9f\xfc\x49\x8e\x1e\x3d\x5a\x09\x42\x4a\xee\xa0\xd9\x6c\
-\x7a\x79\xba\xd6\x3e\x05\x2d\x3e\x53\xbd\xe0\xb5\x4b\xad\x15\x9c\
-\x2d\xc6\xc1\x08\xc2\x76\x17\xeb\x22\xfa\xb9\xa0\x1d\x58\x4f\x0d\
-\xec\xa6\x1b\x54\xaa\x88\xe9\x5e\xb2\x6d\x01\x6b\x72\xac\xce\xb7\
-\x1b\x3f\x0b\x4f\x21\x6a\x0d\x4c\x07\xc9\x56\x1c\x6e\x67\x0d\xc1\
-\x6d\x73\x28\xe3\x34\xd6\x2e\x06\x30\xb9\xf8\x93\x52\xec\x12\x60\
-\x75\x3a\x9d\xca\x60\xca\x54\x4f\x29\xc5\xfa\xfa\x3a\xaf\x7f\xfb\
-\x35\xce\x9c\x39\xc3\x70\x38\xa4\xd3\xe9\x54\xa8\xbc\x2e\x18\x2d\
-\x17\xac\x3c\x4c\x29\x33\xc6\xe3\x88\x49\x42\xae\x16\xcb\xea\x69\
-\x67\x3d\x5e\x97\x2e\xbc\x04\x7d\x65\x99\xfa\xda\xd5\x6b\x64\xd9\
-\x1f\xf2\xe5\x9f\xf9\x32\x27\x4e\x9c\x20\xd3\xb9\xc7\x13\xd6\x12\
-\x44\x11\xad\x56\xab\x48\x45\x93\xea\x3e\xf6\xe5\x08\xac\xc6\x59\
-\x8b\x12\x8a\xdc\x0a\x82\xa0\x81\xb1\x11\x99\x11\x08\x6b\x51\x05\
-\xdb\xc6\xc4\x34\x0f\xad\x0d\xb9\x35\x64\x4e\x22\x71\xa4\xca\xd1\
-\xd0\x8e\x19\x0d\x87\xaa\x83\xa7\x0a\x03\x2b\xb2\x02\x81\x40\xba\
-\x83\xcc\xf0\x32\x15\xeb\x59\x3f\xf3\x60\x2f\xd5\x56\xb0\x5f\xac\
-\xaf\x1b\x46\xb9\x78\x51\xf1\xe0\xca\xef\xd5\xdd\xe7\xfa\xfa\x3a\
-\xdf\xfa\xd6\xb7\x78\xe7\xbb\xdf\x25\x4b\x33\x9a\xcd\x66\x71\xa4\
-\x7a\x8a\x94\x92\x20\x08\x0a\x65\xb0\xaa\xb0\x82\x31\x06\xa5\x54\
-\x15\x4a\xaa\x70\x30\xb1\xd3\xcb\xdd\x5e\x07\x97\xa5\x57\x1a\x93\
-\x89\xd7\x5c\xba\x73\x8e\x5b\x37\x6e\xf0\xf5\xaf\x7d\x9d\x2f\x7d\
-\xe9\xc7\x78\xec\xd4\x29\xef\x0e\x0b\x65\x68\xf9\xf9\xb4\xd6\xc4\
-\x71\x3c\x56\xf4\xda\x75\x77\x59\x2f\xaa\x40\x4a\xa4\x03\x55\xf4\
-\xdd\x19\xed\x18\x4a\x55\x9c\x15\x50\xeb\x1f\x28\xbe\xce\xad\x24\
-\xb7\x01\xb9\x0b\x10\xd2\x91\x8b\x80\xdc\x86\xc4\x2e\x18\x43\xfe\
-\xc2\x89\xa2\xb0\x35\xbe\x63\xef\x8f\xa8\x72\x35\xdd\x5f\xad\xbd\
-\x7c\x82\x18\x1a\xf3\x00\x93\x96\x51\x8f\xbb\xf5\xd7\xca\x9d\x1f\
-\x86\xe1\x58\x3c\x6e\x34\x1a\xac\xaf\xaf\xf3\xe6\x9b\x6f\x72\xf6\
-\xec\x59\xb2\x34\x43\x4a\x59\x0d\x78\x28\x7f\x76\x38\x1c\x56\xbb\
-\xac\x6e\x50\xed\x76\x9b\x66\xb3\x49\xab\xd3\xae\x6a\x06\x75\x3c\
-\xa2\xf3\x9c\x34\x49\xc9\xb2\x8c\x24\x49\x48\x53\xff\x75\x69\x58\
-\xf5\xec\xa5\xfc\x4c\xa6\x40\xe5\x2a\x0c\xb9\x7c\xf1\x22\xc6\x68\
-\x82\x30\xe4\xd1\x47\x1f\x25\xcd\x32\x84\xf4\x1e\xa8\xd5\x6a\xed\
-\xe0\x08\xd8\x47\xa2\xe1\x10\x58\x6d\x90\x52\xa0\xac\x26\x72\x92\
-\x50\xa7\xa4\x22\xc0\xed\x55\x1e\x47\x22\x5c\x86\x00\x94\x13\x18\
-\x27\x51\x58\xa4\xdb\x3e\x9d\xa4\x04\xfe\xdb\x93\xca\xd8\x73\x5a\
-\xd9\xbe\x9f\x51\x4e\x72\x01\xdb\xc6\x24\x76\xa9\x77\x04\xbb\xed\
-\xb4\xdd\x02\x59\x73\x9b\x00\x00\x1b\x13\x49\x44\x41\x54\xf4\x7c\
-\x65\xca\xd7\x6e\xb7\x77\x94\x6f\x87\xc3\x21\xe7\xce\x9d\xe3\xcc\
-\x99\x33\x0c\x06\x03\xa4\xdc\x06\x79\x75\x26\xb0\x8c\xb1\xa5\x17\
-\x69\x36\x9b\x4c\x4d\x4d\x31\x35\x35\x45\xab\xd5\xa2\xd1\x6a\x12\
-\x86\x21\x61\x18\x56\x1c\x82\xb5\x96\x3c\xcb\x48\x93\x94\x24\x49\
-\x18\x8d\x46\x8c\x46\x23\x86\xc3\x21\x49\x92\x54\x8b\x57\xcf\x1a\
-\x2a\x03\xc6\x8f\x96\x53\x52\x72\xf3\xc6\x4d\xde\x7a\xf3\x2d\x3a\
-\x9d\x0e\xf3\xf3\xf3\x15\x33\x28\xa5\xa4\xd9\x6c\x32\x1a\x8d\xc6\
-\x48\xa8\xdd\xc5\x36\x12\x89\xc4\x5a\x8d\xb4\x19\x79\xdc\xa3\xd1\
-\x98\x66\xae\xa5\x48\x4d\x36\x56\xe4\xda\xfe\x4b\xa0\x45\x40\xcb\
-\xe6\x64\xce\x1f\x3d\x9b\x49\x43\x83\x98\xae\x4c\xc7\x54\xba\xde\
-\x0b\x94\xb3\x82\xbe\x57\x65\x60\x0d\x15\xb8\x71\xb7\xbf\x83\x09\
-\x74\xd6\x16\x20\xab\xb8\x51\x63\x28\x3b\x6b\xcb\x01\x8a\xcd\x66\
-\x93\x66\xb3\xb9\xed\x8e\x8d\x26\x0c\xbc\x27\xb8\x7a\xf5\x2a\x6f\
-\xbd\xf9\x26\x5b\x9b\x9b\x25\x0e\x46\x08\xe9\x3b\x53\x27\x5c\xb3\
-\x0c\x14\x73\xf3\x87\x98\xee\x4e\x33\xdd\x9d\x61\x6e\xee\x10\x73\
-\xb3\xb3\x4c\x75\xa7\xe8\xce\x74\x2b\x0f\x20\x6a\x1e\xc0\x1a\x4b\
-\x96\xa6\x0c\x86\x03\x36\xd7\xb7\x58\x5b\x5b\xa3\xb7\xb5\xc5\x68\
-\x34\x62\x63\x73\xbd\xc2\x18\x55\xfd\xdf\x39\x94\x54\x38\x6b\x30\
-\x5a\x23\x84\x24\x4f\x33\x2e\x9c\x3d\xcb\xec\xf4\x34\x5f\xfe\x33\
-\x7f\x66\x2c\x74\x34\x9b\xde\xf0\xca\x30\xb0\x2d\xf0\x74\xd5\x6c\
-\xe0\x52\x48\xea\x9c\x23\x2f\xfa\xee\x45\x32\x44\x38\xc7\xac\x0a\
-\x41\xd9\x71\x19\x57\xbd\xcc\x4d\x03\xe5\x72\xac\xca\x31\xc5\xfb\
-\xb6\xe8\xd3\x96\x09\xd2\x00\x05\x72\x37\xa2\x26\x63\x2f\xb7\xf3\
-\x7d\x5e\xa9\x94\x08\x1b\x20\x6c\x06\xe4\x18\x21\xb0\x32\x44\x58\
-\xe3\x49\xac\x89\xf0\x1a\x8c\x19\xcc\x98\xcb\xdf\xee\xbc\x01\x2a\
-\x8a\xb7\xda\xc9\xd6\x12\x04\x8e\x5e\xaf\xc7\x7b\xef\xbe\xc7\xca\
-\x9d\x15\x9f\xe3\x57\xad\x58\xa6\x68\x53\xf2\xbb\x50\x48\x49\xab\
-\xd5\x62\x76\xe1\x10\x73\x73\x73\xcc\x1f\x5a\xe0\xd8\x91\x63\x1c\
-\x5e\x5c\xa2\xd1\x68\x10\x04\x0a\x19\xf9\xb0\x91\x67\x19\x26\xd7\
-\xdb\x14\x73\x23\xa2\xd1\x69\xd2\x9d\x9d\xe1\xf0\xe1\x23\x2c\x1e\
-\x5e\xe2\xee\xdd\xbb\xac\xad\xae\x11\x86\x01\x9b\x51\x48\xaf\xd7\
-\x23\x4b\x92\xaa\xd8\x64\x8a\xd4\xb6\x32\x08\x21\x18\xf4\xfa\x5c\
-\x3a\x7f\x81\x27\x1e\x7f\x82\xe3\x27\x4f\x90\x16\x0c\x64\x18\x86\
-\xb4\x5a\x2d\x46\xa3\x91\x9f\xd4\x2d\x64\xd1\x59\x33\x3e\x54\x4a\
-\x0a\xaf\x3c\xb2\xe5\x6b\x3a\x47\xda\xbe\xc7\x22\xce\x14\x1d\xca\
-\xbb\x31\xc8\x4d\x9c\xd6\x10\x68\x72\x27\x09\x69\x41\x76\x97\x38\
-\x19\x32\xe3\xbc\xe7\x28\xa5\xeb\xa5\x66\xf1\xa0\x82\x10\xe5\x34\
-\xa1\x95\x28\x6b\xc9\xcb\x26\x19\x17\x20\xac\x02\x9b\x6f\x17\xe2\
-\x26\xb3\x80\xdd\xaa\x7b\x9e\x9f\xb0\x15\xc7\x3f\x29\xe7\x4a\x93\
-\x94\x8b\x17\x2f\xf2\xde\xbb\xef\x62\x8d\x21\x90\xb2\xd0\xdd\x7b\
-\x70\x26\xd4\xb6\xfa\xa7\xd3\xe9\xb0\xb8\xb8\xc8\xa1\xc5\x05\x1e\
-\x79\xe4\x11\x8e\x1d\x3d\xca\xf4\xf4\x8c\xdf\x9d\x59\x4e\x9a\x24\
-\x0c\xb7\x06\x7e\xc0\x43\x31\x21\x4b\x2a\x59\x01\x44\xff\xc1\x25\
-\x9d\x56\x8b\xe3\x27\x8e\x31\xbf\x38\xc7\xf4\x74\x97\x76\xa7\x41\
-\x78\x3b\x40\x29\x45\x6f\x6b\x8b\xe1\x60\x50\x11\x3d\xe5\x3d\xd5\
-\x33\x85\xdb\xb7\x6f\xf3\xfa\x6b\xaf\x71\xe4\x91\x63\x15\x5e\x48\
-\x92\xa4\xf2\x70\x71\x1c\x57\x55\xca\xdd\xf0\xd1\xf8\x11\x32\xb6\
-\x46\x20\xb9\x3d\xa9\x7b\xed\x32\xa4\xb1\x48\xfc\x71\x74\x39\x8a\
-\xc0\x80\x72\x01\xc2\x8e\x2a\xb0\x26\xdc\x76\x45\x68\x7c\xee\xc1\
-\x7d\x18\x40\x96\x21\x2b\x20\xa9\x70\x36\xc3\x9a\x01\x02\xbf\x09\
-\xdc\x84\xce\x20\xa8\xdf\x58\xdd\x10\x2a\x83\x90\xdb\x35\xfd\x72\
-\xf7\x97\x78\xe0\xce\x9d\x3b\xbc\xf9\xfa\x1b\x0c\x07\x03\x5a\xcd\
-\x26\x59\x9a\xfa\xf1\x44\x4e\xa3\x02\x55\x11\x4c\x33\xb3\xb3\x2c\
-\x1e\x3e\xcc\xfc\xfc\x3c\x27\x4e\x3e\xca\xc9\x93\x27\x09\xc3\x90\
-\x24\x8d\xd1\xc6\x9f\xa7\xbb\xb1\xb5\x41\x6e\x35\x8d\xa6\x67\x17\
-\xc3\x30\xc4\x58\x43\x9c\xc5\xe8\xbe\x7f\x9f\x4e\xbb\x43\xae\x13\
-\x82\x51\x9f\x66\xa3\xc5\xd1\x47\x96\xe8\x74\x5b\x7e\xe4\x89\x14\
-\xd5\x67\x8c\x47\x23\x7f\x1c\x7c\x8d\xe2\x0e\x02\x6f\x24\x79\x9e\
-\x73\xf5\xea\x15\xce\x9e\x3d\xcb\x13\x4f\x3c\x51\x65\x17\x4a\x29\
-\x1a\x8d\x06\x61\x10\x92\x17\x4c\xe3\x5e\xda\xc6\xfa\xeb\xe5\xff\
-\xe1\xc7\x1c\xed\x41\x21\x8b\x8c\xd0\x16\xad\xeb\xc2\x62\x30\x3e\
-\x23\x88\x16\x49\x9b\x4f\x14\x85\x9a\x52\x2e\xef\x57\xaf\x1c\x1a\
-\x79\xff\x49\xa0\xc5\xa8\x08\x21\x1d\x69\xeb\x18\x79\x18\x82\x18\
-\x20\x9d\x02\x7c\xd6\xb3\x2b\x08\x9c\x1c\x20\x58\x82\x28\x25\x64\
-\x55\xe4\xa9\xa7\x60\x46\x1b\x56\x96\xef\x70\xf3\xc6\x0d\xa2\x30\
-\xc4\x6a\x53\xe5\x9c\xd6\x39\xa4\xf5\x31\x3c\x8a\x22\xa6\x67\x66\
-\x58\x58\x58\xe0\xe4\xc9\x93\x3c\xf1\xe4\x93\x24\x49\xcc\x70\x34\
-\x60\x14\x0f\xb8\x73\x77\x05\xa1\x04\x47\x4f\x1c\xa3\xd5\x69\x23\
-\x85\x44\x2a\x59\x4d\xee\xaa\x0a\x38\x5a\x33\x8a\x63\xe2\xd1\xc8\
-\x63\x8f\x40\x22\x14\x74\xba\x6d\x4e\x9c\x38\x51\xb5\xa8\x25\x69\
-\x5a\xb5\xa2\x61\xb7\xc7\xad\xd6\x69\xdf\xc1\x60\xc0\x85\x0b\x17\
-\x78\xf4\xd1\x47\xc7\x52\x4c\x29\x25\x51\x23\x22\xcf\xb2\x1d\xcf\
-\x63\x92\x9d\x9c\xe4\x23\xac\xdd\x7b\xba\x98\x91\x06\x85\x2a\xd2\
-\x7c\xff\x7c\xb4\x68\x40\xeb\x14\xab\x47\xff\x52\x01\xd4\x6c\xf5\
-\xfc\xbc\xa6\x55\x1e\xc8\x00\xa4\x93\x64\x0a\xdf\x64\x2b\xa7\xc8\
-\xc2\x93\x38\x3a\x28\x13\xa0\x65\x31\x80\xda\x1a\x82\x82\x86\x0e\
-\xf6\xd2\xe8\xd7\xd9\xb5\x32\xa5\xab\xbf\xb6\xb5\xb9\xc9\xf5\x6b\
-\xd7\x48\x93\x84\x46\x14\x61\x8c\x25\x50\x01\x14\xad\x57\x5a\x6b\
-\x5a\x9d\x36\xf3\xf3\xf3\x2c\xcc\xcf\xb3\xb4\xb4\xc4\xb1\x63\xc7\
-\xd0\xa9\x67\xdf\x56\x56\x96\x19\xa5\x23\xe6\x97\x0e\x31\x73\x68\
-\xba\x00\x7d\xc6\x0f\x7a\xd4\xb6\xc2\x21\xa5\x0c\x2c\x50\x01\xdd\
-\xe9\x36\xad\x56\x83\x78\x14\xd3\x1f\xf6\xc8\xf2\x88\x4e\xb3\xcb\
-\xdc\xfc\x21\x7f\x1a\x88\xd6\xe8\x3c\xc7\x68\xcd\xf2\xf2\x32\xca\
-\xe1\x67\x03\x4c\x70\x1a\x49\x9c\xb0\xbc\xbc\xcc\xf2\xf2\x32\x4b\
-\x4b\x4b\x63\x9a\xc7\x40\x8d\xb3\x96\xbb\xe9\x1f\xeb\x6c\xe6\x47\
-\x92\xea\x8b\x6d\x75\xb2\xc0\x61\x85\xc5\xc8\x08\x9a\x47\x19\xb6\
-\x9e\xae\xa1\xf2\x6d\xc9\xda\xf6\x94\x9f\xfb\xbb\x9a\x99\x22\x0d\
-\x73\x04\x06\x65\x24\xa9\x0a\x30\x36\x02\x1d\x62\x83\x64\x6c\x42\
-\xfa\xbe\x44\x50\x9d\x02\x2e\x0d\xa0\xde\x08\x72\xef\xde\x5d\xae\
-\x5f\xbb\xe6\x63\xab\xb1\x04\x4a\x79\xed\x99\xb5\x38\x21\xb0\xce\
-\xd2\xed\x76\x59\x5c\x5c\xe4\xc8\x91\x23\x1c\x3f\x7e\xdc\x9f\xd9\
-\x93\xe7\x2c\xdf\xbe\xcd\xd6\xa0\xc7\xdc\xe1\x59\xa6\xa6\x3b\xa4\
-\x79\x4a\x92\x26\x7e\xe2\xe7\x2e\x06\xe9\xab\xc6\x5e\xcd\xd3\x88\
-\x1a\xa8\x50\x31\x8a\x47\x8c\x7a\x23\x24\x21\x53\xad\x29\xe6\xe6\
-\xe6\x48\x46\x71\xc5\x15\xdc\xbd\x7b\x17\x9b\xe7\x3b\xaa\x9c\x52\
-\x4a\xb4\x31\xdc\xbd\x7b\x97\xeb\xd7\xaf\x73\xf4\xe8\xd1\x8a\xaf\
-\xa8\x87\xb8\xc9\xb4\x78\xf2\x33\xed\xe8\x6b\xd8\x67\xad\xb4\xcd\
-\xfd\x0c\x83\x72\xf1\x31\x05\xe1\x1f\xa1\x6d\x3d\x2d\xb3\xe3\x8c\
-\xc3\x01\x88\xa0\xc4\x5a\x46\x42\x23\xa4\x20\x04\xb4\x1c\xe1\x18\
-\x61\x44\x6b\x4c\x18\x33\x5e\x0c\x32\x1e\x71\x7b\x22\xc2\x22\x95\
-\xc2\x5a\x3f\x5b\xbf\x64\xe8\x4a\xaa\xd4\x39\x3f\xe2\x65\x65\x79\
-\x85\xde\xe6\x96\xe7\xae\x85\x20\xd7\xda\x37\x64\xe2\xc8\x75\x4e\
-\x67\x6a\x8a\x99\x99\x2e\xf3\x87\xe7\x59\x3a\x72\x84\x66\x6b\x0a\
-\x87\xe2\xda\xbd\xcb\xdc\xde\xb8\xcd\xec\xa1\x69\xf2\x46\xc6\x8d\
-\x7b\xd7\x19\xe5\xb1\x17\x4a\x18\xb1\x8f\xd6\xd1\x8b\x19\x65\x61\
-\x08\xa6\x18\x0a\xe1\x06\x1a\x82\x25\x0e\x75\x16\x99\x9e\x3a\xc4\
-\xfc\x5c\xc6\x70\x30\xe4\xd0\xe2\x2c\xb7\xaf\xdc\x22\x8a\xa2\x31\
-\x96\xb0\xdc\xbd\x71\x7f\xc0\xed\x1b\x37\xe9\x3d\xfd\x0c\x51\x14\
-\x91\xe6\x1e\x21\x4b\x25\x2b\x7a\xba\x9e\x32\xd5\x2b\x86\xbb\xb3\
-\x84\x7b\xf3\x36\x91\x8d\x70\x42\x93\x39\x87\x33\x92\x40\x7a\x97\
-\x3f\x4a\x73\x52\xab\xc7\xc6\xb7\x6c\x07\x68\x79\x20\x41\x88\x9f\
-\x82\xea\x3d\x8e\xa7\x9e\xfc\xec\x61\x6d\x87\xd8\xa2\x20\x17\x85\
-\x0d\xda\xad\xa9\x71\x55\xf0\x18\xfb\x57\xea\xed\xe4\xf8\xc9\x5a\
-\x65\x18\xe8\xf7\xfb\xac\xac\xae\x14\xc2\x4b\x5b\x59\x96\x6f\xc7\
-\xf6\x7f\xa6\xa6\xa6\x58\x3c\x7c\x98\xd9\xd9\x59\xa6\xa6\xa7\x90\
-\x52\xb2\xb5\xb5\xc9\xf2\xdd\x9b\x18\x91\x11\x6b\xc1\xe6\xea\x3d\
-\x52\x9b\x82\xf4\xf9\x73\x60\xee\xff\x86\x7b\x5b\x9b\x64\x69\x4e\
-\xf3\x78\x87\x56\xbb\xc5\xec\xcc\x2c\x83\xe1\x21\x86\x49\x8f\xb5\
-\x5b\xab\x63\xbb\xba\x72\xdd\x45\x8e\xbb\xb5\xb9\xc9\xbd\x7b\xf7\
-\x38\x72\xe4\xc8\xb6\x81\xd8\x71\x3c\x54\xf2\x17\x1f\x66\x00\x1f\
-\xa6\xd2\xb1\xe5\x40\x02\x07\xa2\xf0\x94\xda\x58\x46\x49\x56\xc9\
-\xb8\x77\x9a\xfc\xc7\xd8\x39\xea\x07\xb4\xd0\xe9\x74\xe8\x76\xbb\
-\x4c\x4d\x4d\xed\x9e\x06\xee\xa6\x08\x2a\xab\x65\x79\x9e\x13\x45\
-\x11\xc3\xe1\x90\x95\x95\x15\xb2\x2c\x1b\xfb\x7e\x69\x08\x41\x14\
-\x30\x3b\x37\xc3\xdc\xfc\x22\xed\x76\x97\x28\x6a\xa0\x4d\xca\xf2\
-\xea\x0d\xd6\xfb\xcb\x88\x40\xd1\xdf\xdc\x20\x4e\x46\x5e\xf9\x1a\
-\xf8\xfd\x2d\x0f\x60\x00\x81\x68\xa2\xb5\x63\xa6\x3d\xc7\xe1\x99\
-\x63\x34\x5b\x4d\xa6\xba\x5d\xa6\xa7\xbb\xcc\xce\xce\xb2\x72\x67\
-\x65\xac\x6e\x20\xa5\xc4\x6a\x0d\x52\xb0\xb9\xb9\xc9\xea\xca\xca\
-\x18\x0e\xa8\x77\x07\xd7\xdd\xe5\x7e\x65\xe2\x0f\xc5\x00\xbb\x68\
-\x0d\x9c\x73\x3e\xdb\x69\xb7\xf7\x58\x68\xf1\xb1\x0f\x8f\x68\x45\
-\x11\x33\x33\x33\xcc\xce\xce\x5e\x6d\xb5\x5a\xeb\x7b\x52\xc1\x93\
-\x78\xa0\x4c\x93\xb4\xd6\x55\x19\xb5\xb7\xb5\xb5\xfd\x40\x6b\xe1\
-\xc1\x5a\x4b\xd4\x8c\xe8\xce\xcc\x10\x86\x11\x61\xd4\x40\x6b\xcd\
-\x30\xee\x71\x6f\xe3\x0e\xfd\x74\x83\x6c\x98\x61\x9d\xf1\x1e\x06\
-\x4b\x6e\x0d\x4a\x1e\xac\xfa\x15\xa8\x06\x71\x92\xd0\x0e\xa7\xe8\
-\xb6\x67\x51\xa1\xa2\xd5\x6c\xd1\x6c\x78\x00\xba\x72\x67\xa5\x5a\
-\x80\xaa\x03\xca\xf9\xf0\x36\x18\x0c\xd8\xdc\xdc\xac\x0c\xb7\xee\
-\xf6\x4b\x20\xb8\x9f\x36\xe2\xfe\xbc\x80\x1b\xa3\xaa\xa5\x94\x1c\
-\x3a\x34\xc7\xdc\xfc\xfc\xc0\x18\xfb\x9a\x31\xe6\xea\x38\xc0\xfc\
-\xf8\x07\x48\x05\xd2\xd7\x3e\x1a\x8d\xc6\xbf\x08\x23\xf1\xc7\x3b\
-\x40\xe0\x58\x33\xc6\x44\x7d\xbc\xb4\xde\x3c\xcf\x19\x0c\x06\x8c\
-\x46\xa3\x5d\x15\xc4\xd6\x5a\x9a\xcd\x06\xdd\xe9\x2e\x2a\x88\x68\
-\x44\x2d\xb4\x35\xf4\xfa\x1b\x6c\xf6\xd6\x58\x1b\xac\x14\x6c\x9a\
-\xad\xd4\xbb\xb6\x68\xe3\x3a\x88\x50\xd3\x09\x20\x57\x90\x05\x9c\
-\x3c\x76\x9a\xe9\xe6\x2c\xcd\x56\x93\x56\xab\x43\xb7\x3b\x3d\x76\
-\x90\x73\xf5\x70\x6b\x69\x61\x1c\xc7\x5e\x17\x60\x7d\x65\xb2\xdc\
-\x75\xfb\xb5\xb7\x1d\xd4\x0b\xd4\xc3\x90\x94\xb2\x38\x30\x7a\xea\
-\x9e\x94\xe2\x7f\x08\x83\xf0\xff\xe2\x53\xb8\x82\xfd\x6e\x70\x12\
-\x38\x39\xe7\x88\xe3\x98\xc1\x60\x50\x9d\x91\x33\xa9\x01\x34\xc6\
-\xd0\x6c\x15\x55\xc3\x20\xc4\x21\xc9\xb2\x84\x61\x32\x60\xb3\x7f\
-\x8f\xb5\xde\x3d\x0f\xcc\x6a\x93\x0c\x82\x20\x40\x67\x19\xa8\xfb\
-\x37\x00\x4d\x86\x30\x8a\xc0\xdc\xa6\x37\xdc\xa4\x19\xb4\xbd\x6e\
-\x2f\x8c\x68\xb7\x5a\x15\x39\x34\xc9\x0c\x96\x73\x03\xd3\xd4\x17\
-\x99\x54\xd1\xbc\x62\xc4\xb6\xdb\xb7\xfb\x9c\x03\x74\x90\xdd\x3f\
-\xf9\x5c\xa5\x14\x08\xec\x7b\x38\xf5\x2a\x9f\xd2\x15\x4c\xf6\x02\
-\xec\x96\xe7\x96\x35\xf3\x72\x37\x95\xcc\x5a\x9e\xa4\x63\x60\xa9\
-\xc4\x01\x8d\x66\x44\x18\x46\x08\xa9\x88\xe3\x18\x2b\x52\xf2\x3c\
-\x23\x8e\x07\xe4\x56\x63\x52\x2f\xaa\x90\x14\x47\xb7\x5b\x41\x9e\
-\x19\x8f\x52\xee\x77\x67\xa9\x1c\x25\x1c\xc3\x51\x9f\xfe\xa0\x47\
-\x37\x9a\xc3\x5a\x47\x14\x35\x69\x16\x8c\x62\xc9\xf9\x57\x8b\x51\
-\x50\xbd\x65\xe3\x48\x92\x24\xb4\xa7\x3a\x15\xe1\x54\xe7\x00\x26\
-\x25\xf0\xdf\x8b\x11\xd4\xbd\xa5\xd6\xda\x4f\x2d\xb1\xfa\x5e\xab\
-\xd9\xbc\xfd\xa9\x1a\xc0\x64\xfc\xaf\xb8\x73\x63\x31\xb9\x4f\x1d\
-\xb2\x2c\xf3\x8a\x1d\x07\x56\x1b\x4c\x96\x21\xac\xa9\x66\xef\x4a\
-\x21\xfc\x79\x6b\x46\xa3\x53\x98\x6a\x4f\x23\x9c\xc6\xb9\x84\x3c\
-\x1f\x61\x72\xed\xe7\x00\xc6\xa0\x42\x55\xb1\x89\x52\x49\xd2\x51\
-\xe2\x91\xb9\xb1\x7b\xa6\x80\x7b\x4f\x5f\x09\xd1\xb9\x23\x08\x15\
-\xc3\xad\x4d\xf4\xd4\x02\x01\x11\xca\x59\x44\xa0\x50\x61\xe0\xd3\
-\xdc\x72\x78\x72\xee\xf1\x8c\x15\x54\xbd\x08\x12\x7f\x4f\x56\x1b\
-\x82\x30\xc4\xa2\xc9\x8d\x2e\xf5\x3d\x63\xa1\xe3\x7b\x0b\x03\xdb\
-\x5e\x28\x08\x02\x4f\xf9\x8a\x4f\x77\x62\xe9\xae\x4c\xe0\xa4\xe5\
-\xd7\xd9\xa3\x8a\x35\x9b\xd4\xce\xd5\x0a\x24\x41\xa0\x3c\xab\x67\
-\x1c\x36\x31\x08\x05\x61\xe8\xa5\xdc\x59\xa2\x31\x79\x8d\x70\x92\
-\xa2\x42\xde\xee\x00\x53\x38\x4d\xae\x51\x2e\x20\x33\x39\xce\x3a\
-\xb2\x34\xf7\x47\xfe\xd4\x94\xc5\x52\x4a\x74\xee\x27\x93\xc9\xe2\
-\xff\xa9\x8f\x9d\xd7\x5a\x13\x94\x83\x28\x6b\xbb\xff\x7e\xdc\xff\
-\x5e\x73\x0f\xc6\xd2\xcf\xc9\xde\x0b\x3e\xfd\x2b\xd8\xad\xca\x55\
-\x09\x44\x9d\x1d\xc3\x01\x75\xc1\xa8\xa9\x29\x73\x27\xd9\x33\x21\
-\xfd\xac\x1e\x63\x2c\x5a\x1b\x30\x06\x25\x43\xb4\x76\xe8\xdc\xf8\
-\xe6\xc7\xf2\x14\x4d\xf1\xbd\x25\x3b\x06\xe3\x5b\xb5\x9c\x46\x89\
-\x00\x6b\x7c\x56\x51\x2f\xfe\x94\x7d\xf2\xd6\x79\xc5\xb2\xb3\xe5\
-\xe1\x8e\x6e\x8c\x06\x9e\x8c\xfd\xf7\x43\xff\xee\xf7\xb3\x93\xfc\
-\x41\xc9\x2e\x1e\x94\x57\xf8\xbe\x1a\xc0\x58\xbb\xb6\xb1\x63\xb1\
-\x7d\x6c\xb1\x27\x0f\x61\xaa\x35\x5d\xa6\x69\x82\x10\xfe\x30\xa7\
-\xf2\xd4\xcd\x56\xb3\x43\xbb\xd9\xc5\x66\x0e\xa1\x24\x0a\x89\x35\
-\x65\xf7\xaf\x07\x91\x7b\x9d\xaf\xb7\xdf\x3c\x3d\x21\x94\x1f\x32\
-\x16\x05\x44\x61\x13\x8a\xd1\xb1\x22\xf2\xe4\x4d\xa9\xf4\x11\x05\
-\xf9\x53\x8e\x89\x43\x40\x5a\xcc\x2e\xac\xa7\xb0\x42\x8a\x1d\x74\
-\xe9\x7e\xdd\xd0\x7b\x65\x51\xfb\x69\x2d\x0f\xe2\x61\x3e\x11\x03\
-\x98\x24\x84\x4c\x99\x1a\xd5\x2a\x6a\xa5\xb8\x73\xbf\xee\xe0\x2c\
-\x4d\xc9\xb2\x14\xad\xc1\x14\x2c\x57\x18\x36\x99\x9f\x3f\x8c\x70\
-\x8a\xd1\x20\xf1\x0d\x21\xc6\xf8\xae\x5f\xbc\xd4\xda\x1e\x64\x3e\
-\x97\xf0\xb1\x75\x7a\x76\x06\x25\x94\x07\x95\x42\x62\x9d\x65\x14\
-\x7b\xe9\x98\xb5\x96\xa8\xa8\x68\x6a\xad\x09\x83\xa0\x90\x89\x7b\
-\x41\x6a\x99\x8e\x1a\x63\x90\x4e\x8e\x79\x83\xfb\x4d\x07\x77\xfb\
-\xd9\xdd\x3c\xc7\x7e\x23\x76\x3e\xf5\x10\x50\x75\xfc\x1a\x8b\x55\
-\x76\x4c\x6c\xa9\x94\xf2\x0d\x97\xc5\xae\x99\xbc\x51\xe7\x1c\xbd\
-\x7e\x8f\x5e\x6f\x93\xc5\x85\x63\x6c\xf5\x86\x68\x63\x89\xe3\x94\
-\xa5\xc3\x47\x39\x72\xf8\x28\x57\xaf\x5e\xad\x4e\xd2\x12\x38\xb4\
-\xce\xab\x23\x5e\xef\x1b\x5d\x5b\x43\x24\x9b\x3c\x72\xec\x51\x40\
-\x92\xe7\x86\x46\x33\xc4\x3a\xc7\xbd\xbb\xf7\xfc\xb1\x73\x61\x88\
-\x31\x7e\xe7\x5b\x6b\xb0\x4e\x61\xec\xb6\x36\xb1\xac\x65\xec\x17\
-\x02\xec\x47\xe4\x29\x76\xc3\x51\xf5\x62\xd2\x03\x1f\x02\x26\x31\
-\x80\xb1\xc6\x0f\x6b\x96\xa2\x98\x36\x45\x21\xd3\x6a\x78\xf5\x4d\
-\x29\x22\x2d\x6a\xe2\x20\x58\x5b\x5d\xe3\xee\xdd\x7b\x9c\x7a\xec\
-\x29\x06\xc3\x84\x2c\xcf\x18\x0d\x46\x2c\x2c\x1c\xe6\xb1\x47\x4e\
-\x73\xfd\x83\x1b\xe4\xb1\x47\xe3\x4e\x68\xd2\x22\xc3\xa8\x8a\x22\
-\x62\xbb\x4f\xae\xea\xb4\x19\x7b\xad\x38\x0c\xdc\x3a\x84\x13\xcc\
-\xcd\x4f\x73\xe4\xf0\x31\x84\x90\x18\x63\x69\xb6\x5a\x64\x26\x65\
-\x75\x75\x05\x59\x00\x3f\xa3\x75\xa5\xda\x75\xc5\x0e\x9f\x6a\x4f\
-\xf9\x9e\xc4\x22\x2d\x73\x45\xf7\x90\x9d\xe0\x38\x3e\x8a\x07\xd8\
-\x4d\x25\xb4\xd7\xef\x95\xcf\x7a\xbf\xfe\xc4\x4f\xea\x92\xa5\x5b\
-\xac\xb3\x65\xf5\x9b\xd1\xc6\xa0\x8d\xc6\x14\x33\x78\x72\x9d\x13\
-\x44\x21\x8b\x47\x8f\x92\x59\x4b\x6a\x0c\x56\x4a\x32\xed\x47\xba\
-\x0b\x21\x19\x0d\x52\x6e\x5d\xbf\x4d\x1c\x8f\x68\xb7\x23\x40\x13\
-\xc7\x43\xf2\x2c\xe3\xb9\xc7\x5f\xe0\xf8\xe2\x49\xfa\x1b\x09\xf1\
-\x40\x93\x8c\x0c\x92\x90\x3c\xb5\x38\x23\xd0\xb9\xc3\xe4\x0e\x9d\
-\x43\x9e\x19\xf2\xcc\x92\xa7\x16\x93\x3a\x4c\x86\x3f\x11\x2c\xb5\
-\xa4\x23\xcd\xb0\x17\x13\xd8\x0e\xcf\x9e\x7e\x99\x66\x34\x85\xd6\
-\x0e\xa1\x04\xed\x66\x93\xfe\x7a\x8f\x2b\xe7\x2f\xa0\x9c\x43\x18\
-\x83\x74\x16\x67\x34\x4a\x0a\x8c\xf1\xc0\xb0\xd3\xe9\x70\x68\xee\
-\xd0\x58\x77\x93\xb5\xe3\x59\xcf\x7e\x5d\x53\xf5\x3f\xe5\xf7\x4a\
-\x65\x71\x59\x40\xaa\x44\xae\xb5\xe1\x16\x65\x18\x95\x52\xa6\x42\
-\x88\xbb\x0f\x44\x1a\xb8\x5b\xd7\x48\x9d\x46\x2d\x5d\x96\xd6\x9a\
-\x76\xbb\xcd\xdc\xdc\xac\x17\x7d\x2a\x85\xce\xfd\x4d\x87\x41\xe0\
-\x27\x7b\x4b\xc1\xf5\xeb\xd7\x59\x5d\x5d\xe5\xf4\xe9\xd3\x0c\x47\
-\x43\xf2\x3c\xe7\xce\xf2\x1d\x0e\x3f\xb2\xc0\x8f\xfe\xc8\x8f\x72\
-\xe7\xce\x0a\xb7\x97\x6f\xd1\x6c\xb7\x68\xb5\x9b\x85\xde\x60\x3b\
-\x0c\x8c\x9d\x95\x5b\x68\xe4\xca\x31\x70\x69\x96\xd2\xef\xf7\x99\
-\xee\x4e\xf3\xd4\x13\x4f\x72\xfa\xd4\x29\xac\x31\x58\x63\x39\x76\
-\xc4\xd7\xf7\x2f\x5e\xbc\x48\xbf\xdf\xf7\x82\xd0\x89\x81\x96\x65\
-\x16\xd3\x6c\x36\xe9\x4e\x77\x49\xd2\xd4\xe7\xff\xae\x18\x93\xe7\
-\xec\x0e\xaf\xf8\x61\x5e\xa0\xa4\x77\xe7\xe7\xe7\x99\x99\x99\xa9\
-\xe6\x12\x4c\x2a\xa9\x6a\xef\x69\xba\xdd\xee\xd7\x84\x10\xbf\xf9\
-\xc0\x84\x80\xbd\x72\xdb\xb2\x3e\x5e\x15\x7b\xa2\x88\xd9\xd9\x59\
-\x1a\x8d\x06\xa3\xd1\xa8\x32\x8e\x92\x58\x51\x52\x71\x6f\xed\x2e\
-\x17\xce\x9f\xe7\xf1\xd3\xa7\x99\x9b\x9d\x65\x38\x18\x60\xad\x65\
-\xf3\xde\x06\x27\x4f\x3c\xc6\x97\xbe\xf0\x25\x7e\xef\xf7\xbf\xca\
-\xbd\x8d\x7b\x0c\xfb\x03\xa6\xa7\xbb\x68\xbd\xb3\x51\xd3\xa3\x77\
-\x09\x56\x90\x65\x19\x71\x1c\x33\x1a\x8d\x88\xa2\x88\xc7\x1f\x7b\
-\x92\x67\x9f\x79\x0e\x67\x1d\x71\x9a\xb0\x74\xf8\x30\x87\xe6\xe6\
-\xb8\x7a\xf5\x2a\xef\x9e\x39\x83\x2b\x14\xbf\xa5\x6c\xbc\x5e\x10\
-\x6a\x4e\x75\x99\x9e\x9d\x21\x8c\x22\xb2\xdc\xcf\x2a\xd6\xda\x54\
-\x82\xd2\xdd\x76\xfb\x5e\x80\xae\x7c\xdf\x20\x08\x98\x9d\x9d\xe5\
-\xc8\x91\x23\x7b\x0f\xbd\xdc\xde\x4c\xa2\xd5\x6a\xe5\x61\x18\xbe\
-\xf1\xc0\x10\x41\x7b\x4d\xe9\xaa\x67\x00\x00\x69\x9a\x32\x3d\x3d\
-\xc3\xc2\xe2\x22\xe7\xcf\x9d\xa3\xd3\xf1\xe3\x4e\xb3\x3c\x43\x15\
-\x53\xc0\x8d\xb5\x9c\x7b\xff\x7d\x9e\x7a\xf2\x49\x9e\x7b\xfe\x79\
-\xd2\x24\xe5\xc6\xcd\x1b\x24\xc3\x04\x67\xe0\x85\xe7\x5f\x60\x6a\
-\xaa\xcb\x57\x7f\xef\x77\xf9\xe0\x83\x0f\x58\xe9\xaf\xd2\x6c\x45\
-\xa8\x22\x7f\x17\x78\xbe\xde\x68\x83\xd5\x16\x89\x9f\x3a\x12\xc7\
-\x31\x0b\x8b\x0b\x7c\xee\xb3\x9f\xe3\xc5\x17\x5f\xa4\xd5\x68\x91\
-\x26\x09\xad\x66\x8b\x47\x8e\x3f\x82\x73\x8e\x77\xde\x7e\x9b\x8d\
-\xf5\x75\xa8\xb5\x9f\x8d\xa5\x7b\xce\xd1\xee\xb4\x39\x72\xf4\xa8\
-\xbf\x67\xe9\x41\xa0\xd6\x1a\x59\x4c\x37\xa9\xbb\xf6\x0f\x93\xcd\
-\x51\xe2\xa2\x02\x54\x06\x41\x40\x9a\xa6\x63\x59\x44\xfd\x7d\x8a\
-\xa6\x17\x29\xa5\x3c\xfc\x40\xf2\x00\x93\x0c\xd6\x64\x41\x28\x49\
-\x12\x3a\x9d\x0e\xa7\x4f\x9f\xe6\xca\x07\x1f\x90\x26\x09\x81\x0a\
-\x8a\x3e\x74\x47\x20\x24\x28\xc9\xed\x5b\xb7\xf9\xda\xbf\xfd\x1a\
-\x87\x97\x96\x38\x7d\xea\x14\x59\x9a\x72\x7b\x79\x99\x61\x6f\x88\
-\xb3\xf0\xf4\xe3\x4f\x73\xfc\x57\x8f\xf2\xca\x2b\xaf\xf0\xed\xd7\
-\x5f\xe3\xee\xda\x6a\xb5\x50\x25\x28\x2c\xcf\xb8\x71\x06\xda\xed\
-\x36\x2f\xbf\xf8\x59\x3e\xfb\xd9\xcf\x72\xf2\xe4\x49\x3f\xfa\x25\
-\x4d\xe9\xb4\x3a\x3c\xfd\xd4\x53\x4c\x77\xbb\xbc\xfe\xed\xd7\x78\
-\xf7\x9d\x33\x24\xa3\x98\x50\xc9\xaa\xb7\xa1\x4c\x5d\x4b\x4e\xa0\
-\x3b\x33\xc3\xd2\x91\x23\x98\xb2\x32\x28\xbd\xb2\xd8\x18\xbd\x6b\
-\x8b\xd8\x87\x79\x80\x34\x4d\xc7\xf8\x92\xc9\x56\xf8\x12\x63\xd4\
-\x87\x62\x35\x1a\x8d\x20\xcf\xf3\xe9\x30\x0c\x7b\x0f\x04\x06\xd8\
-\x2b\x2d\xc9\xf3\x7c\x2c\x57\x16\x42\xe0\xac\xe5\xc8\x91\x23\x9c\
-\x3a\x75\x8a\x8b\x17\x2f\xee\x88\x91\x36\xcf\x31\xc6\xf2\xc1\xe5\
-\xcb\xfc\xc1\xef\xff\x3e\x5f\xf9\xc5\x5f\xe4\xe9\xa7\x9f\xc6\x59\
-\x58\xbb\xbb\x46\x6f\xb3\x4f\xbf\xd7\xe3\xd8\xf1\x63\xfc\xf8\x8f\
-\xff\x04\x4f\x3d\xf5\x14\x37\x6e\xdc\xe0\xf6\xed\xdb\xac\xaf\xaf\
-\x93\x26\x89\x7f\x48\xcd\x26\xf3\x73\x0b\x2c\x2c\x2c\x31\x3b\x3b\
-\xc3\x91\xa5\x23\x4c\xcf\x4c\x93\xe7\x1a\xe7\x34\x33\xd3\x33\x3c\
-\xf6\xd8\x63\xcc\x1f\x3a\xc4\x9b\x6f\xbc\xc1\x57\xbf\xfa\xbb\xdc\
-\xbd\x7b\x77\xd7\x05\x2c\x01\xda\xcc\xec\x2c\xa7\x4f\x9f\xf6\x5a\
-\x47\x9d\x7b\x72\x88\x6d\x8c\xe3\x26\x86\x64\x7e\x94\xfc\xbf\xec\
-\x2f\x58\x5d\x5d\xad\xf4\x13\x75\x97\x5f\x36\xc1\xd6\x79\x93\x20\
-\x08\x9e\x6c\xb5\x5a\xff\x29\xf0\x5f\x7f\xaa\x06\x50\xef\x89\x9f\
-\xec\x90\xad\x67\x04\x75\x6d\x60\x9c\x24\x74\xbb\x5d\x4e\x9f\x3e\
-\xcd\xf5\xeb\xd7\xc9\xd3\xcc\xbb\xed\xa2\x01\x41\x20\x08\x03\x45\
-\x96\xa6\xbc\xf6\xea\xb7\xc1\xc1\x2f\xfd\xb9\x3f\xc7\xf3\xcf\x3f\
-\xcf\xa5\xcb\x97\xb8\xb5\x7c\x9b\x5e\xbf\xc7\x85\x8b\x97\x98\xea\
-\x76\x59\x5a\x3a\xc6\xcc\xf4\x2c\x8f\x9f\x7a\xbc\x90\x71\x89\xe2\
-\xf8\x33\x9f\xac\xb4\x5a\x1d\x1a\x8d\x06\x49\x9c\xd0\xef\x0f\x08\
-\x83\x90\x23\x47\x8e\x70\xf2\xd1\x47\x99\x9b\x99\xe6\xed\xb7\xbe\
-\xc3\xef\xfd\xee\x57\xb9\x7e\xf5\x5a\x11\x42\x8a\x83\xa2\xa4\xf0\
-\x24\x93\xf3\x27\x97\x04\x41\xc0\xd2\xd1\xa3\x3c\x72\xe2\x04\xb9\
-\xd6\xbe\x09\x45\x88\xe2\x3c\x01\x5b\x1c\x39\xbb\xb7\xbb\xdf\xcb\
-\x18\xc2\x30\x2c\xd4\xce\x2b\xac\xad\xad\x55\xe1\xa6\x5c\xf4\xc9\
-\xa3\x75\x1a\x8d\x06\xce\xb9\xee\xb1\x63\xc7\x9e\xfe\xd4\x43\x40\
-\xbd\x77\x7f\xaf\x1b\xad\x1f\x0e\xe5\xa5\x53\x0e\xeb\x42\x0e\x1f\
-\x39\xc2\xd1\xa3\x47\xb9\x74\xe9\x12\x51\x10\x7a\x97\x6b\xbc\x40\
-\xd4\x16\xd5\xbd\x24\x8b\x79\xed\x5b\xaf\x92\x8e\x62\xbe\xf2\x17\
-\x7e\x99\x47\x1e\x3d\xc1\xdc\xc2\x21\x6e\xde\xba\xc9\xf2\x9d\x3b\
-\x6c\x6e\x6d\xb1\xd5\xeb\x11\x08\x59\x8c\x9a\x6b\x56\x0f\x2e\xcf\
-\x73\x72\x9d\xd3\x1f\xf4\xd8\xea\x39\x82\x40\x31\x3b\x3b\xc7\x89\
-\x13\x27\x38\x7e\xfc\x38\x42\x5b\xde\xf8\xd6\xb7\xf9\x9d\xdf\xf9\
-\x1d\xae\x5f\xbf\xee\x3f\xa3\x04\xac\xc3\x43\x3a\x85\xb1\x0e\x15\
-\x08\x9c\x10\x74\xa6\xa7\x79\xe6\xf9\xe7\x09\xa3\xb0\x8a\xd3\xe5\
-\xe1\x93\xd6\x98\xa2\x73\xfc\x00\x0d\x19\xb5\x99\x07\xe5\xb8\xbc\
-\x72\x52\x59\xdd\xfd\xd7\xa5\x69\xdf\x8b\xcc\xec\xfb\x02\x02\xf7\
-\xa3\x32\xc7\x26\x77\x16\x37\x32\x18\x0c\xe8\x74\x3a\x3c\xf3\xec\
-\xb3\xdc\xb9\x73\x87\x61\x7f\xe0\x17\xce\x3a\x8c\xdb\xa6\x90\xa5\
-\x94\xa4\x69\xca\x5b\xdf\xf9\x0e\x77\x7b\x9b\xfc\xdc\xcf\xff\x3c\
-\x2f\xbd\xf4\x12\xcf\x3d\xfb\x1c\xc7\x8f\x1d\xe7\xd6\xf2\x6d\x56\
-\x56\x56\x18\xf4\xfa\xc4\x71\x5c\x65\x1c\x65\xec\x2e\xdb\xc8\x8f\
-\x1e\x39\xcc\xd2\xd2\x12\x8b\x8b\x8b\x4c\x4f\x4f\xb3\xbe\xbe\xce\
-\xd7\xff\xf5\x1f\xf2\xd6\xeb\x6f\x70\xe3\xc6\x8d\x2a\xdf\x4e\xd3\
-\xd4\xe7\xdf\x81\x22\xcd\x33\xef\x39\xd2\x04\x21\x25\xa7\x1f\x7f\
-\x9c\xa3\xc7\x8e\x11\xd7\x06\x52\x7e\x5c\xe2\x0f\x21\x04\x0b\x0b\
-\x0b\xcc\xcc\xcc\x54\xdd\xcd\xa5\x94\xae\xf4\xb2\xf5\x91\xbb\x53\
-\x53\x53\x7d\xa5\xd4\xb9\x07\x02\x04\xd6\xb3\x80\xfd\x84\x90\x93\
-\x6d\x63\xb9\xd1\x1c\x39\x7a\x94\x17\x5e\x7c\x91\xb7\xde\x7c\xd3\
-\xa7\x68\xb2\x98\xc2\x51\xb2\x7b\xa5\x17\xc9\x73\xce\x9f\x3b\xc7\
-\xea\xea\x2a\xef\xbe\xf3\x0e\x3f\xfa\x85\x2f\xf0\xf4\x33\xcf\xf0\
-\xd9\x97\x5e\x66\x38\x1c\x32\xe8\xf5\x49\x8a\xd8\x5f\x75\x26\x15\
-\x63\xde\xba\xd3\xd3\x4c\x75\x3a\xc8\xa2\x29\xe5\xdf\xfe\xe1\xbf\
-\xe1\x6b\x5f\xff\x3a\xb7\xaf\x5e\xf3\x75\xfc\x02\xe4\xd5\x07\x45\
-\x96\xf4\x6e\x96\xe7\x64\x79\xce\xe3\x4f\x3c\xc1\x73\xcf\x3f\x5f\
-\x4d\x0f\xdd\x4d\xfc\x79\x50\xe1\x87\x31\xa6\x52\xdc\xd6\xfb\x28\
-\x4a\x23\xa8\xcf\x4e\xac\x0d\xce\xbe\x28\x84\xf8\xef\x1f\x28\x22\
-\xc8\xed\x32\x4b\xae\xbe\xe8\xf5\xe1\x8d\x52\x0a\xe2\x38\xa6\x11\
-\x35\x78\xea\x99\xa7\x49\x92\x84\x33\x67\xce\xe0\x32\x3d\x36\x6e\
-\xa5\xfe\xbb\x8d\x20\x64\xed\xce\x0a\xdf\xd8\xfa\x63\xce\x9c\x39\
-\xc3\xb1\x63\xc7\x78\xe1\xc5\x17\x79\xe2\x89\x27\x38\x76\xfc\x78\
-\xf5\x00\x45\x8d\x44\x31\x5a\x33\x1a\x0e\x39\xf3\xf6\xdb\xbc\x7b\
-\xe6\x5d\xae\x5d\xbf\xc6\xea\xea\x2a\xfd\x7e\x9f\x66\x18\x55\x21\
-\xaa\x5e\xd5\x0b\x82\xc0\x8f\x74\x6d\x44\x8c\xe2\x98\xc7\x4e\x9d\
-\xe2\x8b\x5f\xfa\x12\xed\x4e\x87\x51\x3c\x1a\x8b\xc7\xbb\xd1\xe0\
-\x07\x95\x7d\x95\xa9\x60\xbd\x8a\xba\x5b\x3d\xc1\x5a\x6b\xac\xb5\
-\x97\x80\x16\x30\x78\x60\x04\x21\x93\x9d\xc2\x7b\xa6\x43\x4a\x92\
-\xe5\xba\x42\xd2\x41\x10\xf2\xec\x73\xcf\x31\x1c\x8d\xb8\x7c\xf6\
-\x1c\x79\xae\x69\x34\x1a\x3b\x6e\x5c\xa7\x19\xcd\x20\x02\xeb\x58\
-\x5d\x5e\x61\xe5\xce\x1d\x3e\xb8\x7c\xb9\x90\x72\x4f\x33\x3d\x3d\
-\xcd\xd4\xd4\x54\xd5\x8d\x3c\x1c\x0e\xe9\x6f\xf5\x18\xf4\xfb\xc4\
-\x71\x42\xaf\xb7\x45\xaf\xd7\xa7\xd1\x88\x08\xa5\xaf\xfe\x09\x76\
-\x1e\x32\x01\xa0\x82\x80\x2c\xcf\x39\x7a\xec\x18\xcf\x3d\xff\x3c\
-\xb3\x73\xb3\x1e\xf5\xd7\x10\xb9\x9d\xd0\x35\x1c\xd4\x03\x08\xe1\
-\x37\x43\x1c\xc7\x4c\x4f\x4f\xd3\x6a\xb5\xc6\x3a\x8b\xca\xdd\x5f\
-\x7a\xa7\x2c\xcb\xd2\x46\xa3\xf1\x4d\xe7\xdc\x7f\x0c\xfc\xed\x07\
-\x06\x03\xec\xe6\xea\x77\x0d\x05\x66\x1b\x0f\x94\x2e\xb4\xd5\x6a\
-\xf1\xd2\x4b\x2f\x11\x38\x38\x7f\xf6\x5c\xf5\xa0\xeb\xb2\xec\x40\
-\xaa\xe2\xfd\xa0\x11\x86\x58\x60\x38\x18\xd2\xdb\xea\x71\xdd\x5e\
-\xaf\xaa\x8d\xa5\x98\x53\x6b\x8d\xcd\x35\xd8\x6d\x3c\xd0\x29\x2a\
-\x78\x6e\x97\x91\xea\x63\x0c\x9c\x75\x1c\x3e\x7c\x98\x17\x5e\x7a\
-\x89\x63\xc7\x8f\x57\x7d\x0c\x52\x6d\x2f\xc8\x64\xb8\xab\x0f\x8b\
-\xba\x5f\x03\xc8\xb2\x8c\x1b\x37\x6e\x70\xe7\xce\x9d\xb1\xc1\xd4\
-\x93\xf8\xa9\x98\x49\xd0\x3e\x7d\xfa\xf4\x3f\x88\xa2\xe8\xff\x78\
-\xa0\xa8\xe0\xdd\x48\xa1\x5d\xbd\x41\xd1\xaf\x67\x6c\x41\x12\xe1\
-\xc8\x9d\x66\xaa\x3b\xc5\x4b\x9f\xff\x1c\xda\x5a\xae\x5e\xbd\x8a\
-\x2e\x68\xd6\xd2\x6b\x58\xe7\xbc\x11\xe0\x70\xd6\xeb\xf4\xa4\x50\
-\x28\x21\x89\x84\xa7\x6d\xd1\x16\x6d\x7c\xc7\x4c\x28\x03\x44\x23\
-\xd8\x31\x42\xae\x12\xa7\x2a\x85\x31\x7e\x3a\x47\x50\xb4\x94\x6b\
-\x63\x09\xc3\x80\x63\xc7\x8f\xf1\x99\x17\x3e\xc3\xe1\xa5\xa5\xaa\
-\xca\x57\x8a\x3e\x76\x9b\x89\xf0\xbd\x34\x80\x94\xe0\xae\x94\xcb\
-\xd7\x43\xd1\xa4\x01\x18\x63\xaa\x59\x04\x9f\xb6\x26\x60\x5f\x03\
-\xd8\x8f\xf9\xc2\x79\x21\x46\x95\x25\x00\x16\x8b\xd5\x96\x46\xb3\
-\xc9\x8b\x9f\x7d\x99\x46\xab\xc9\x85\xf3\xe7\x49\x62\xdf\x41\x5c\
-\x92\x2c\xb9\xcb\x2b\xaf\x50\x0d\x84\x2a\xf5\x06\x62\xa2\x09\xc3\
-\x56\xd3\x0e\xc6\x06\x47\xd5\xff\xad\x0a\x50\x95\xe5\x39\xb9\xd1\
-\x4c\x75\xbb\x1c\x39\x72\x84\xcf\x7c\xf6\x25\x16\x0f\x1f\xae\x9a\
-\x3e\xaa\xc5\xb5\x7b\x17\xc0\x0e\x8a\x01\xca\xf7\x9f\x99\x99\xa9\
-\xe6\x26\x4f\x8e\xbc\x2d\x0d\xa0\x1c\x9a\x39\x37\x37\xf7\xe0\x18\
-\xc0\x6e\x72\xa5\x8f\x84\x05\x76\x51\x06\x69\x6b\x68\xb5\x5a\xbc\
-\xf0\xe2\x8b\x1c\x3e\x7c\x98\xb3\xef\xbf\xcf\xed\x5b\xb7\x7d\x5d\
-\x1e\x9f\x77\xab\x28\x44\x00\xda\x18\x3f\x86\x7d\xe2\x18\x99\xb1\
-\xd8\x2c\xbd\x1e\xc0\x14\x54\xb3\x90\x62\xfb\xf8\x97\xe2\xe3\xe5\
-\x56\x83\x92\x2c\xcc\x2f\xf2\xf8\x13\x4f\xf0\xf8\x13\x4f\xd0\x6c\
-\xb7\xbc\x2c\xbd\x36\xcb\xf0\xc3\xce\x3b\x3a\xe8\xe5\x9c\xab\x06\
-\x68\x96\x13\x4d\xca\x30\x36\x79\xb6\x72\x14\x45\x63\x95\xd6\x07\
-\x32\x0b\xf8\x28\x02\x88\xbd\xd2\xc4\xf2\x04\xaf\x20\x08\x38\xfe\
-\xc8\x23\xcc\xcc\xcc\x70\xfd\xda\x35\xae\x5e\xbd\x4a\x6f\x73\x8b\
-\x34\x4d\xab\xea\x99\x28\xe7\x0a\x15\xf4\xf2\xa4\xa2\xd6\xcf\xdf\
-\x29\xf8\x7a\xb1\x9d\x42\x55\xed\xdc\x0e\xa4\x52\x4c\x75\xa7\x38\
-\x76\xfc\x38\xa7\x4e\x9f\x66\x61\x61\x01\xa1\x64\x55\xe0\xa9\x01\
-\xaf\xea\x77\x27\x55\x3a\x1f\xcb\xc3\x0c\x02\xa6\xa6\xa6\x50\x4a\
-\x91\x24\x49\xc5\x10\x4e\x3e\xdb\xd2\xeb\x3d\x08\xd7\xae\xe5\xe0\
-\x8f\x9a\x0f\xef\x3d\x53\x77\x1b\xf9\x5a\x2c\xad\x76\x9b\x27\x9f\
-\x7a\x8a\x47\x4f\x9e\xe4\xe2\x85\x0b\xac\xad\xad\xb1\xb1\xb1\xe1\
-\x99\xb8\xf2\x54\x32\xe1\x4f\xb4\x2e\xd3\xa7\xb1\xcf\x52\x4e\x68\
-\x82\x2a\xb7\x8f\xa2\x88\x76\xc7\xd3\xc3\x0b\x8b\x8b\x9c\x3a\x75\
-\x8a\xd9\xd9\x59\xa2\x66\x03\x0b\xe4\x59\x46\x50\x7b\xd0\xe5\xfb\
-\xd6\x47\xdd\x7c\x9c\x57\x59\x47\x28\x5d\x7b\xbd\xaf\x70\x12\x50\
-\x97\xf7\x35\x33\x33\xf3\xe0\x18\xc0\x5e\xb1\x70\x3f\x01\xc4\x5e\
-\xc6\x20\xa5\xf0\x1c\x3b\xf8\x49\x9a\xce\x13\x3a\x53\xdd\x2e\x2f\
-\xbe\xf8\x22\xc3\xe1\x90\xbb\x77\xef\xb2\xba\xba\xca\xc6\xc6\x86\
-\x77\xd3\xc6\xe0\x72\x33\x56\x97\xd8\x3e\x62\x0e\x82\x62\x60\x54\
-\x39\x9f\xe8\xd0\xa1\x43\x2c\x2e\x2e\xb2\xb0\xb8\x48\xab\xdd\xf6\
-\x27\x91\xc8\xda\x58\x19\x31\x5e\xe3\xa8\xd3\xb0\x93\xc5\x9a\x8f\
-\xeb\x4a\xd3\x94\x95\x95\x15\xe2\x38\x1e\x3b\x27\x69\x52\x34\x5b\
-\xba\xfe\x28\x8a\x98\x9b\x9b\x7b\xb0\xa8\xe0\xfb\xf1\x00\x7b\x86\
-\x80\x09\xf5\x4b\x19\xd3\x93\x24\x21\x50\x8a\x4e\xb7\x4b\x7b\x6a\
-\x8a\xe3\x27\x4e\x90\x67\x19\xbd\x7e\x9f\xde\xe6\x16\x71\xaf\x4f\
-\x96\x65\x15\xa0\xaa\x52\x33\x01\x2a\x0a\x99\xea\x76\x99\x9b\x9d\
-\x65\x7a\x7a\x9a\x46\x79\x46\x01\x60\xf0\x61\xc7\x6a\x5b\x95\x7f\
-\x6d\x61\x7c\x75\x57\x5b\x3f\x03\xf1\xfb\x71\x59\x6b\x59\x5b\x5b\
-\x63\x75\x75\xb5\x32\xb0\xdd\x86\x6e\xda\x42\x8d\x34\x35\x35\xf5\
-\x60\x18\xc0\xe4\x28\xf6\xea\x6b\xb7\xf7\xe8\xb3\xb1\xb3\x68\x8b\
-\xb4\xb0\xdc\xae\xa2\x7e\xc3\x05\x58\x2b\x8f\x41\xd1\x38\x70\xbe\
-\x0b\x57\x04\x92\x28\x68\x72\xa8\xd9\xe0\xd0\xc2\x3c\xa1\x0a\x26\
-\x72\xfb\xed\x61\x95\x65\x9b\x56\x39\x87\xdf\x39\x47\x66\x72\xd8\
-\xad\x6d\x4c\x08\x7f\x2a\xa0\xd8\xe5\xdc\x9d\xd2\x05\x7f\x1f\x1e\
-\xa6\x50\xb2\x3a\x3c\xca\x9a\x62\x30\x85\x11\xd5\x00\xcb\xfa\x86\
-\x2a\x39\x89\x07\xa2\x18\x54\x8f\x53\x25\x68\x29\x49\x1c\xf3\x71\
-\xa3\xe5\xed\x69\xca\x93\xb4\x02\x99\xde\x5d\x25\x5b\xa1\xfe\xda\
-\xb1\xf1\x63\xf9\xa8\xdb\x35\x4b\x7d\x20\x1a\x2f\x1c\x3e\x4d\x2d\
-\xfb\x2b\xeb\x44\x53\x79\xce\xd1\xa7\x6e\x00\x33\x33\x33\xa4\x69\
-\x8a\x3f\x0e\x7e\x3b\x0d\x2b\x1f\xfc\x27\xf7\xb4\xf6\x9a\xd2\xed\
-\x8f\x43\xad\xa7\x89\x0f\xc2\xe2\xde\x0f\x47\x50\x27\x8c\x4a\x23\
-\x68\xb5\x5a\xeb\x42\x88\x4f\x5f\x13\x78\xf2\xe4\x49\x86\xc3\x21\
-\x57\xaf\x5e\x65\x38\x1c\x56\x93\x41\x1d\x6e\x4f\x0f\xf0\xfd\x30\
-\x8c\xfd\xce\x27\xda\x8d\x98\xfa\x50\xb2\xea\x00\x19\xcc\xf7\xe5\
-\x21\x17\x69\x68\x7d\xbc\xfd\xec\xec\xac\x9d\x9a\x9a\xfa\x83\x28\
-\x8a\x3e\xd5\x6a\xa0\x04\x98\x9b\x9b\xfb\xce\xd2\xd2\xd2\x3f\x5f\
-\x5a\x5a\xaa\xe8\xcc\x12\x8c\x7d\x62\x0f\xd0\xb1\xa7\xe6\xbe\xec\
-\xe7\x9f\xec\xb0\xfd\x41\xf1\x02\x65\xe6\x51\x0e\xa3\xe8\x74\x3a\
-\x9c\x38\x71\x22\x6e\x36\x9b\x7f\xf7\x81\x48\x03\x97\x96\x96\x6e\
-\xdc\xbb\x77\xef\x37\x16\x16\x16\x5a\xc6\x98\x5f\xbe\x71\xe3\x86\
-\xcf\xd1\x71\xa8\x20\xf8\x04\xad\x71\xef\xe6\xd0\x7a\xd1\xe7\xc3\
-\xfa\xee\x1e\x38\x03\x28\xe4\xee\x61\x18\x32\x3b\x3b\xcb\x63\x8f\
-\x3d\xc6\xd2\xd2\xd2\x1f\x85\x61\xf8\xd6\xa7\xfd\xd9\xc6\x9e\xde\
-\xe5\xcb\x97\xdb\x33\x33\x33\xbf\x75\xf9\xf2\xe5\x3f\xbb\xba\xba\
-\x2a\x47\xf1\x68\xc7\x79\x78\x63\xf0\x66\xaf\x7e\x4d\x71\xdf\x61\
-\xbe\x18\x89\x24\xf6\xfb\x66\x75\x00\x42\x29\xdb\x2a\xc7\xd8\xed\
-\xe9\x09\x76\xc7\x87\x63\x67\xfa\x7d\x52\x86\x1d\x04\x01\x0b\x8b\
-\x8b\x3c\x7e\xfa\x74\xbf\xdd\x6e\xff\xc5\x76\xbb\xfd\x8d\x56\xab\
-\x35\x7c\xa0\x0c\xa0\xbc\x86\xc3\xf8\xff\x5d\x5b\x5b\x9b\xeb\xf5\
-\x7a\xf4\x07\x83\x4f\x3d\x86\xfe\xa0\x5f\xad\x56\xab\x9a\x9a\xda\
-\x6a\xb5\xfe\xdb\x66\x23\xfc\xff\x1e\x3e\x95\x87\xd7\xc3\xeb\xe1\
-\xf5\xf0\x7a\x78\x3d\xbc\x1e\x5e\x9f\xe6\xf5\xff\x03\x77\x29\x6c\
-\xb0\xe2\x82\x0d\x90\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-"
-
-qt_resource_name = b"\
-\x00\x06\
-\x07\x03\x7d\xc3\
-\x00\x69\
-\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x08\
-\x0c\xf7\x59\xc7\
-\x00\x6e\
-\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x08\xc9\x59\xa7\
-\x00\x70\
-\x00\x72\x00\x65\x00\x76\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x08\xc8\x58\x67\
-\x00\x73\
-\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x07\x6c\xcf\xe7\
-\x00\x70\
-\x00\x72\x00\x65\x00\x76\x00\x5f\x00\x63\x00\x62\x00\x7a\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x09\x86\x40\x07\
-\x00\x63\
-\x00\x62\x00\x7a\x00\x72\x00\x65\x00\x61\x00\x64\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x07\x04\xa3\xe7\
-\x00\x6e\
-\x00\x65\x00\x78\x00\x74\x00\x5f\x00\x63\x00\x62\x00\x7a\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\xc1\x59\x87\
-\x00\x6f\
-\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x00\x2e\x58\x67\
-\x00\x73\
-\x00\x6e\x00\x61\x00\x70\x00\x73\x00\x68\x00\x6f\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x02\
-\x00\x00\x00\xc6\x00\x00\x00\x00\x00\x01\x00\x01\x21\xaa\
-\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xf4\x27\
-\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x00\xe8\xbc\
-\x00\x00\x00\x54\x00\x00\x00\x00\x00\x01\x00\x00\x96\x4d\
-\x00\x00\x00\x3e\x00\x00\x00\x00\x00\x01\x00\x00\x79\xc3\
-\x00\x00\x00\x28\x00\x00\x00\x00\x00\x01\x00\x00\x3a\xb6\
-\x00\x00\x00\x72\x00\x00\x00\x00\x00\x01\x00\x00\xa2\xb9\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-# qInitResources()
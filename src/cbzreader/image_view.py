@@ -1,14 +1,71 @@
+import weakref
+from collections import OrderedDict
+
 from PIL import Image
-from PIL.ImageQt import ImageQt
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QPainter, QPen, QPixmap
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPixmap, qRgb
 from PyQt5.QtWidgets import QLabel
 
+from . import startup_profile
+
+
+qimage_formats = {"L": (1, QImage.Format_Grayscale8),
+                  "P": (1, QImage.Format_Indexed8),
+                  "RGB": (3, QImage.Format_RGB888),
+                  "RGBA": (4, QImage.Format_RGBA8888)}
+"""(dict) For each PIL mode shared with Qt, number of bytes per pixel and
+Qt format."""
+
+
+class PackedImage(QImage):
+    """QImage reading its pixels directly from the packed buffer of a PIL
+    image.
+    """
+
+    def __init__(self, img):
+        """Wrap pixels of image.
+
+        Args:
+            img (Image): image in one of the modes of `qimage_formats`
+        """
+        depth, fmt = qimage_formats[img.mode]
+        w, h = img.size
+        self._data = img.tobytes()  # keep buffer alive as long as QImage
+        super().__init__(self._data, w, h, depth * w, fmt)
+        if img.mode == "P":
+            pal = img.getpalette()
+            self.setColorTable([qRgb(*pal[i:i + 3]) for i in range(0, len(pal), 3)])
+
+
+def pil_to_qimage(img):
+    """Convert image for display without per pixel conversion.
+
+    Notes: pixels are only converted for modes unknown to Qt.
+
+    Args:
+        img (Image): image to convert
+
+    Returns:
+        (QImage)
+    """
+    if img.mode not in qimage_formats or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+
+    return PackedImage(img)
+
 
 class ImageView(QLabel):
     """Display a single image whose size is adapted to window size
     """
 
+    upscaled = pyqtSignal()  # emitted when image has less pixels than its display area
+
+    pix_cache_size = 8
+    """(int) Maximum number of scaled pixmaps kept in memory."""
+
+    resize_settle_delay = 150
+    """(int) Time in ms without resize events before a resize is considered finished."""
+
     def __init__(self, *args):
         super().__init__(*args)
 
@@ -24,15 +81,40 @@ class ImageView(QLabel):
         self._ratio = 1.  # format ratio between img size and screen size
         self._transfo = Image.ROTATE_90  # transformation applied to the displayed image
 
+        self._qimg_key = None  # (img, transfo) used to create _qimg
+        self._qimg = None  # transformed image converted to Qt, before scaling
+        self._pix_cache = OrderedDict()  # (id(img), transfo, size, smooth): (weakref to img, pixmap)
+
+        self._resizing = False  # whether a resize is in progress
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.resize_settle_delay)
+        self._resize_timer.timeout.connect(self.resize_settled)
+
         self.setAlignment(Qt.AlignCenter)
 
     def set_image(self, img):
         self._img = img
         self.update_pixmap()
 
+    def image(self):
+        return self._img
+
     def transfo(self):
         return self._transfo
 
+    def target_size(self):
+        """Size of display area expressed in the frame of the image,
+        i.e. before applying current transformation.
+
+        Returns:
+            (int, int): width, height
+        """
+        if self._transfo in (Image.ROTATE_90, Image.ROTATE_270):
+            return self.height(), self.width()
+
+        return self.width(), self.height()
+
     def set_transfo(self, transfo):
         self._transfo = transfo
 
@@ -53,34 +135,92 @@ class ImageView(QLabel):
         self.update_pixmap()
 
 
-    def update_pixmap(self):
-        if self._img is None:
-            self.setPixmap(self._pix_none)
-        else:
+    def _transformed_qimage(self):
+        """Current image, transformed and converted to Qt.
+
+        Notes: conversion is kept for successive rescales of same image.
+
+        Returns:
+            (QImage)
+        """
+        key = (self._img, self._transfo)
+        if self._qimg_key is None or self._qimg_key[0] is not key[0] or self._qimg_key[1] != key[1]:
             if self._transfo is None:
                 img = self._img
             else:
                 img = self._img.transpose(self._transfo)
 
+            self._qimg = pil_to_qimage(img)
+            self._qimg_key = key
+
+        return self._qimg
+
+    def _scaled_pixmap(self, size, smooth):
+        """Current image scaled to given size.
+
+        Args:
+            size (int, int): width, height of pixmap
+            smooth (bool): whether to use smooth or fast transformation
+
+        Returns:
+            (QPixmap)
+        """
+        key = (id(self._img), self._transfo, size, smooth)
+        entry = self._pix_cache.get(key)
+        if entry is not None and entry[0]() is self._img:  # id not reused by another image
+            self._pix_cache.move_to_end(key)
+            return entry[1]
+
+        mode = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+        iq = self._transformed_qimage()
+        pix = QPixmap.fromImage(iq.scaled(size[0], size[1], Qt.IgnoreAspectRatio, mode))
+
+        # decoded page is not kept alive by its pixmaps, only by the cache of pages
+        self._pix_cache[key] = (weakref.ref(self._img), pix)
+        self._pix_cache.move_to_end(key)
+        while len(self._pix_cache) > self.pix_cache_size:
+            self._pix_cache.popitem(last=False)
+
+        return pix
+
+    def update_pixmap(self):
+        with startup_profile.span("update_pixmap"):
+            self._update_pixmap()
+
+    def _update_pixmap(self):
+        if self._img is None:
+            self.setPixmap(self._pix_none)
+        else:
             # find scale to fit screen
-            w, h = img.size
+            if self._transfo in (Image.ROTATE_90, Image.ROTATE_270):
+                h, w = self._img.size
+            else:
+                w, h = self._img.size
             wa = self.width() / float(w)
             ha = self.height() / float(h)
             ratio = min(wa, ha)
             self._ratio = ratio
 
-            # create Qt image
-            iq = ImageQt(img)
-            pix = QPixmap.fromImage(iq.scaled(int(w * ratio)
-                                              , int(h * ratio)
-                                              , Qt.IgnoreAspectRatio
-                                              , Qt.SmoothTransformation))
+            # smooth rescale is deferred until resize is finished
+            pix = self._scaled_pixmap((int(w * ratio), int(h * ratio)), not self._resizing)
 
             self.setPixmap(pix)
+            if ratio > 1 and not self._resizing:
+                self.upscaled.emit()
+
+    def resize_settled(self):
+        """Redraw with smooth transformation once resizing is finished.
+        """
+        self._resizing = False
+        self.update_pixmap()
 
     def resizeEvent(self, event):
         QLabel.resizeEvent(self, event)
+        self._resizing = True
+        self._resize_timer.start()
         self.update_pixmap()
 
     def paintEvent(self, event):
         QLabel.paintEvent(self, event)
+        if self._img is not None:  # first page on screen, end of start up
+            startup_profile.finish()
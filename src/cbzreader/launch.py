@@ -1,26 +1,39 @@
-from PyQt5.QtGui import QGuiApplication
+from argparse import ArgumentParser
+from pathlib import Path
 
-from cbzreader.cbz_reader import CBZReader
+from cbzreader import startup_profile
 
 
 def read(cbz_file):
-    qapp = QGuiApplication([])
+    # GUI modules are only imported when actually launched
+    with startup_profile.span("imports"):
+        from PyQt5.QtWidgets import QApplication
 
-    reader = CBZReader(cbz_file)
+        from cbzreader.reader import Reader
 
-    reader.show()
+    with startup_profile.span("QApplication"):
+        qapp = QApplication([])
+
+    reader = Reader(None if cbz_file is None else Path(cbz_file))
+    with startup_profile.span("show"):
+        reader.show()  # trace is written as soon as a page is painted
 
     qapp.exec_()
+    startup_profile.finish()  # no page ever displayed
 
 
 def launch():
-    from sys import argv
-    if len(argv) == 1:
-        filename = None
-    else:
-        filename = argv[1]
+    parser = ArgumentParser(prog="cbzreader-gui", description="Read and edit cbz books.")
+    parser.add_argument("book", nargs="?", default=None, help="path to cbz file to open")
+    parser.add_argument("--profile", metavar="TRACE", default=None,
+                        help="write timeline of start up in a Chrome trace file, "
+                             f"also enabled by {startup_profile.env_var} environment variable")
+    args = parser.parse_args()
+
+    if args.profile is not None and not startup_profile.recording():
+        startup_profile.enable(args.profile)
 
-    read(filename)
+    read(args.book)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,300 @@
+"""
+Persistent catalog of all books below a root directory, updated
+incrementally so that browsing a library never rescans the file system.
+"""
+import os
+from io import BytesIO
+from pathlib import Path
+from threading import RLock, Thread
+from time import time_ns
+
+from .dir_listing import mtime_margin_ns
+from .explorer import Explorer
+from .page_cache import PageCache
+from .sqlite_store import open_db
+from .user_cache import cache_dir
+
+schema_version = 1
+"""(int) Version of schema, catalogs of older versions are rebuilt."""
+
+schema = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL,
+    listed_at_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS books (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    nb_pages INTEGER,
+    thumbnail BLOB
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+CREATE INDEX IF NOT EXISTS books_dir ON books (dir);
+"""
+
+thumbnail_size = (160, 240)
+"""(int, int) Bounding box of first page thumbnails."""
+
+
+def escape_like(text):
+    """Escape special characters of a LIKE pattern.
+
+    Args:
+        text (str): literal text
+
+    Returns:
+        (str): to be used with ESCAPE '\\'
+    """
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def book_summary(pth, size=thumbnail_size):
+    """Number of pages and thumbnail of first page of a book.
+
+    Args:
+        pth (Path): path to book
+        size (int, int): bounding box of thumbnail
+
+    Returns:
+        (int, bytes|None): thumbnail is JPEG encoded, None if book is empty
+                           or its first page can not be read
+    """
+    ex = Explorer(pth, cache=PageCache(max_bytes=0))
+    try:
+        nb = ex.page_number()
+        if nb == 0:
+            return nb, None
+
+        try:
+            img = ex.thumbnail(0, size)  # in a mode JPEG can store
+        except UserWarning:
+            return nb, None
+
+        data = BytesIO()
+        img.save(data, 'jpeg')
+        return nb, data.getvalue()
+    finally:
+        ex.close()
+
+
+class Library:
+    """Books found below some root directories.
+
+    Each directory is only listed again when its modification time
+    changes, unchanged directories cost a single stat call.
+    """
+
+    def __init__(self, db_pth=None):
+        """Open or create catalog.
+
+        Args:
+            db_pth (Path): path to database, default in user cache dir
+        """
+        if db_pth is None:
+            db_pth = cache_dir() / "library.sqlite"
+
+        self._lock = RLock()
+        self._db = open_db(db_pth, schema, schema_version)
+
+    def close(self):
+        """Close underlying database.
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            self._db.close()
+
+    def scan(self, root, progress=None):
+        """Update catalog with content of directory tree.
+
+        Args:
+            root (Path): top directory of library
+            progress (callable): called with path of each book (re)indexed
+
+        Returns:
+            (int): number of books (re)indexed
+        """
+        root = Path(root).absolute()
+        nb = 0
+        todo = [(root, None)]
+        while todo:
+            dir_pth, parent = todo.pop()
+            try:
+                mtime_ns = dir_pth.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._forget_dir(dir_pth)
+                continue
+
+            with self._lock:
+                row = self._db.execute("SELECT mtime_ns, listed_at_ns FROM dirs WHERE path = ?",
+                                       (str(dir_pth),)).fetchone()
+
+            # no entry added or removed, unless listed too soon after a change
+            if row is not None and row[0] == mtime_ns and row[1] - mtime_ns > mtime_margin_ns:
+                subdirs = self._subdirs(dir_pth)
+            else:
+                listed_at_ns = time_ns()
+                subdirs, updated = self._scan_dir(dir_pth, progress)
+                nb += updated
+                with self._lock, self._db:
+                    self._db.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)",
+                                     (str(dir_pth), None if parent is None else str(parent), mtime_ns,
+                                      listed_at_ns))
+
+            todo.extend((pth, dir_pth) for pth in subdirs)
+
+        return nb
+
+    def scan_async(self, root, progress=None, done=None):
+        """Update catalog in a background thread.
+
+        Args:
+            root (Path): top directory of library
+            progress (callable): called with path of each book (re)indexed
+            done (callable): called with number of books (re)indexed at the end
+
+        Returns:
+            (Thread): already started
+        """
+        def run():
+            nb = self.scan(root, progress)
+            if done is not None:
+                done(nb)
+
+        th = Thread(target=run, name="cbz-library", daemon=True)
+        th.start()
+        return th
+
+    def _subdirs(self, dir_pth):
+        """Known sub directories of a directory.
+
+        Args:
+            dir_pth (Path): absolute path to directory
+
+        Returns:
+            (list of Path)
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT path FROM dirs WHERE parent = ?", (str(dir_pth),)).fetchall()
+
+        return [Path(pth) for pth, in rows]
+
+    def _scan_dir(self, dir_pth, progress):
+        """List directory and update its books.
+
+        Args:
+            dir_pth (Path): absolute path to directory
+            progress (callable): called with path of each book (re)indexed
+
+        Returns:
+            (list of Path, int): sub directories, number of books (re)indexed
+        """
+        subdirs = []
+        books = {}
+        for entry in os.scandir(dir_pth):
+            if entry.is_dir(follow_symlinks=False):  # no endless walk through symlink loops
+                subdirs.append(Path(entry.path))
+            elif entry.name.lower().endswith(".cbz") and entry.is_file():
+                stat = entry.stat()
+                books[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            known = dict((pth, (mtime_ns, size)) for pth, mtime_ns, size in self._db.execute(
+                "SELECT path, mtime_ns, size FROM books WHERE dir = ?", (str(dir_pth),)))
+
+        with self._lock, self._db:
+            for pth in set(known) - set(books):
+                self._db.execute("DELETE FROM books WHERE path = ?", (pth,))
+
+        nb = 0
+        for pth, (mtime_ns, size) in sorted(books.items()):
+            if known.get(pth) == (mtime_ns, size):
+                continue
+
+            try:
+                nb_pages, thumbnail = book_summary(Path(pth))
+            except Exception as err:  # corrupted archive, still list it
+                print(f"unable to index '{pth}': {err}")
+                nb_pages, thumbnail = None, None
+
+            with self._lock, self._db:
+                self._db.execute("INSERT OR REPLACE INTO books VALUES (?, ?, ?, ?, ?, ?)",
+                                 (pth, str(dir_pth), mtime_ns, size, nb_pages, thumbnail))
+            nb += 1
+            if progress is not None:
+                progress(Path(pth))
+
+        # forget directories that disappeared
+        for pth in set(self._subdirs(dir_pth)) - set(subdirs):
+            self._forget_dir(pth)
+
+        return subdirs, nb
+
+    def _forget_dir(self, dir_pth):
+        """Remove directory, its sub directories and their books.
+
+        Args:
+            dir_pth (Path): absolute path to directory
+
+        Returns:
+            (None)
+        """
+        prefix = str(dir_pth)
+        pattern = escape_like(prefix + os.sep) + "%"
+        with self._lock, self._db:
+            for table, col in (("dirs", "path"), ("books", "dir")):
+                self._db.execute(f"DELETE FROM {table} WHERE {col} = ? OR {col} LIKE ? ESCAPE '\\'",
+                                 (prefix, pattern))
+
+    def books(self, root=None):
+        """Books in catalog, sorted by path.
+
+        Args:
+            root (Path): only books below this directory, all if None
+
+        Returns:
+            (list of (Path, int|None)): path and number of pages of books
+        """
+        return self.search("", root)
+
+    def search(self, text, root=None):
+        """Books whose path contains some text, case insensitive.
+
+        Args:
+            text (str): text to look for
+            root (Path): only books below this directory, all if None
+
+        Returns:
+            (list of (Path, int|None)): path and number of pages of books
+        """
+        query = "SELECT path, nb_pages FROM books WHERE path LIKE ? ESCAPE '\\'"
+        args = ["%" + escape_like(text) + "%"]
+        if root is not None:
+            prefix = str(Path(root).absolute())
+            query += " AND (dir = ? OR dir LIKE ? ESCAPE '\\')"
+            args.extend([prefix, escape_like(prefix + os.sep) + "%"])
+
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY path", args).fetchall()
+
+        return [(Path(pth), nb_pages) for pth, nb_pages in rows]
+
+    def thumbnail(self, pth):
+        """Thumbnail of first page of book.
+
+        Args:
+            pth (Path): path to book
+
+        Returns:
+            (bytes|None): JPEG encoded, None if book is unknown or has none
+        """
+        with self._lock:
+            row = self._db.execute("SELECT thumbnail FROM books WHERE path = ?",
+                                   (str(Path(pth).absolute()),)).fetchone()
+
+        return None if row is None else row[0]
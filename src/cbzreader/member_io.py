@@ -0,0 +1,245 @@
+"""
+Access members of a zip archive straight from its content, without
+copying members stored uncompressed.
+"""
+import struct
+import zlib
+from io import SEEK_CUR, SEEK_END, SEEK_SET
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipInfo
+
+local_header = struct.Struct("<4s22xHH")
+"""Signature, file name length and extra field length of a local file header."""
+
+local_header_signature = b"PK\x03\x04"
+
+
+def member_data_view(buf, info):
+    """View on the data of a member of an archive, as stored.
+
+    Args:
+        buf (mmap|bytes): whole content of archive
+        info (ZipInfo): description of member
+
+    Returns:
+        (memoryview|None): None if local header is inconsistent
+    """
+    start = info.header_offset
+    if start + local_header.size > len(buf):
+        return None
+
+    sig, name_len, extra_len = local_header.unpack_from(buf, start)
+    if sig != local_header_signature:
+        return None
+
+    start += local_header.size + name_len + extra_len
+    end = start + info.compress_size
+    if end > len(buf):
+        return None
+
+    return memoryview(buf)[start:end]
+
+
+def stored_member_view(buf, info):
+    """View on the data of an uncompressed member of an archive.
+
+    Args:
+        buf (mmap|bytes): whole content of archive
+        info (ZipInfo): description of member
+
+    Returns:
+        (memoryview|None): None if member is compressed, encrypted or
+                           its local header is inconsistent
+    """
+    if info.compress_type != ZIP_STORED or info.flag_bits & 0x1:
+        return None
+
+    return member_data_view(buf, info)
+
+
+def inflate_member(buf, info):
+    """Decompress a deflated member of an archive.
+
+    Raises: BadZipFile if decompressed data does not match its checksum.
+
+    Args:
+        buf (mmap|bytes): whole content of archive
+        info (ZipInfo): description of member
+
+    Returns:
+        (bytes|None): None if member is not deflated, encrypted or its
+                      local header is inconsistent
+    """
+    if info.compress_type != ZIP_DEFLATED or info.flag_bits & 0x1:
+        return None
+
+    view = member_data_view(buf, info)
+    if view is None:
+        return None
+
+    with view:
+        data = zlib.decompress(view, -zlib.MAX_WBITS)
+
+    if zlib.crc32(data) != info.CRC:
+        raise BadZipFile(f"Bad CRC-32 for file '{info.filename}'")
+
+    return data
+
+
+def read_raw_member(fhr, info):
+    """Data of a member of an archive as stored, i.e. still compressed.
+
+    Raises: BadZipFile if local header is inconsistent.
+
+    Args:
+        fhr (file): archive opened in binary mode
+        info (ZipInfo): description of member
+
+    Returns:
+        (bytes)
+    """
+    fhr.seek(info.header_offset)
+    sig, name_len, extra_len = local_header.unpack(fhr.read(local_header.size))
+    if sig != local_header_signature:
+        raise BadZipFile(f"Bad magic number for file header of '{info.filename}'")
+
+    fhr.seek(name_len + extra_len, SEEK_CUR)
+    return fhr.read(info.compress_size)
+
+
+def write_raw_member(zf, info, name, data):
+    """Append a member to an archive being written without compressing
+    its data again.
+
+    Notes: zipfile has no public API for this, the steps of
+           ZipFile.open(mode='w') are reproduced with data written as is.
+           They rely on private attributes of ZipFile, checked by
+           test_member_io against each new Python version.
+
+    Args:
+        zf (ZipFile): archive opened in write mode
+        info (ZipInfo): description of member in source archive
+        name (str): name of member in new archive
+        data (bytes|memoryview): compressed data of member
+
+    Returns:
+        (ZipInfo): description of member in new archive
+    """
+    assert not info.flag_bits & 0x1  # encrypted data can not be copied as is
+
+    zinfo = ZipInfo(name, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zinfo.external_attr = info.external_attr
+    zip64 = zinfo.file_size > ZIP64_LIMIT or zinfo.compress_size > ZIP64_LIMIT
+
+    with zf._lock:
+        assert not zf._writing  # another member is being written through ZipFile.open
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zinfo.header_offset = zf.fp.tell()
+        zf.fp.write(zinfo.FileHeader(zip64))
+        zf.fp.write(data)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+
+    return zinfo
+
+
+class MemoryFile:
+    """Read only file object over a memoryview.
+
+    Contrary to BytesIO, the underlying buffer is not copied, only the
+    chunks actually read.
+    """
+
+    def __init__(self, view):
+        """Wrap a view.
+
+        Args:
+            view (memoryview): content of file
+        """
+        self._view = view
+        self._pos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        """Read at most size bytes, all remaining bytes if size is negative.
+
+        Args:
+            size (int): number of bytes
+
+        Returns:
+            (bytes)
+        """
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(len(self._view), self._pos + size)
+
+        data = self._view[self._pos:end].tobytes()
+        self._pos = max(self._pos, end)
+        return data
+
+    def seek(self, offset, whence=SEEK_SET):
+        """Move current position.
+
+        Args:
+            offset (int): displacement in bytes
+            whence (int): reference position
+
+        Returns:
+            (int): new position
+        """
+        if whence == SEEK_SET:
+            pos = offset
+        elif whence == SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos:d}")
+
+        self._pos = pos
+        return pos
+
+    def tell(self):
+        """Current position.
+
+        Returns:
+            (int)
+        """
+        return self._pos
+
+    def close(self):
+        """Release view on underlying buffer.
+
+        Returns:
+            (None)
+        """
+        self._view.release()
+
+    @property
+    def closed(self):
+        try:
+            len(self._view)
+        except ValueError:
+            return True
+
+        return False
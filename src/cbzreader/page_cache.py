@@ -0,0 +1,205 @@
+"""
+In memory cache of decoded pages, bounded by the total size of decoded
+images instead of their number.
+"""
+from collections import OrderedDict
+from threading import RLock
+
+default_max_bytes = 512 * 2 ** 20
+"""(int) Default memory budget of a cache in bytes."""
+
+mode_depth = {"1": 1, "L": 1, "P": 1, "LA": 2, "I;16": 2, "RGB": 3, "YCbCr": 3, "LAB": 3, "HSV": 3,
+              "RGBA": 4, "RGBX": 4, "CMYK": 4, "I": 4, "F": 4}
+
+
+def image_nbytes(img):
+    """Approximate memory footprint of decoded image.
+
+    Args:
+        img (Image): decoded image
+
+    Returns:
+        (int): number of bytes
+    """
+    w, h = img.size
+    return w * h * mode_depth.get(img.mode, len(img.getbands()))
+
+
+class PageCache:
+    """Least recently used cache of decoded images.
+
+    Entries are evicted, oldest first, as soon as the total number of
+    bytes of decoded images exceeds the budget.
+    """
+
+    def __init__(self, max_bytes=default_max_bytes):
+        """Create an empty cache.
+
+        Args:
+            max_bytes (int): memory budget in bytes
+        """
+        self._lock = RLock()
+        self._entries = OrderedDict()  # key: (img, nbytes), most recently used last
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def max_bytes(self):
+        """Memory budget of this cache.
+
+        Returns:
+            (int): number of bytes
+        """
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes):
+        """Change memory budget, evicting entries if needed.
+
+        Args:
+            max_bytes (int): new budget in bytes
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def nbytes(self):
+        """Memory currently used by cached images.
+
+        Returns:
+            (int): number of bytes
+        """
+        return self._nbytes
+
+    def stats(self):
+        """Counters to monitor cache efficiency.
+
+        Returns:
+            (dict): hits, misses, evictions, entries, nbytes and max_bytes
+        """
+        with self._lock:
+            return dict(hits=self.hits,
+                        misses=self.misses,
+                        evictions=self.evictions,
+                        entries=len(self._entries),
+                        nbytes=self._nbytes,
+                        max_bytes=self._max_bytes)
+
+    def get(self, key):
+        """Fetch image associated to key.
+
+        Args:
+            key (hashable): key of image
+
+        Returns:
+            (Image|None): None if nothing is found
+        """
+        with self._lock:
+            try:
+                img, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return img
+
+    def peek(self, key):
+        """Fetch image without counting a hit or a miss nor marking it
+        as recently used.
+
+        Args:
+            key (hashable): key of image
+
+        Returns:
+            (Image|None): None if nothing is found
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        return None if entry is None else entry[0]
+
+    def put(self, key, img):
+        """Store image in cache.
+
+        Notes: images bigger than the whole budget are not stored.
+
+        Args:
+            key (hashable): key of image
+            img (Image): decoded image
+
+        Returns:
+            (None)
+        """
+        nbytes = image_nbytes(img)
+        with self._lock:
+            self.discard(key)
+            if nbytes > self._max_bytes:
+                return
+
+            self._entries[key] = (img, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+
+    def discard(self, key):
+        """Remove image from cache if present.
+
+        Args:
+            key (hashable): key of image
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            try:
+                _, nbytes = self._entries.pop(key)
+            except KeyError:
+                return
+
+            self._nbytes -= nbytes
+
+    def discard_book(self, pth):
+        """Remove all pages associated to a given book.
+
+        Args:
+            pth (Path): path to book, first element of keys
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == pth]:
+                self.discard(key)
+
+    def clear(self):
+        """Remove all images from cache.
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _evict(self):
+        """Remove least recently used images until budget is respected.
+
+        Returns:
+            (None)
+        """
+        while self._nbytes > self._max_bytes:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
+            self.evictions += 1
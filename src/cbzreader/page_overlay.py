@@ -0,0 +1,140 @@
+"""
+Store edited versions of pages while a book is open, in memory first and
+on disk once a memory budget is exhausted.
+"""
+from pathlib import Path
+from threading import RLock
+
+from PIL import Image
+
+from .page_cache import image_nbytes
+
+default_max_bytes = 128 * 2 ** 20
+"""(int) Default amount of edited pages kept in memory in bytes."""
+
+
+class PageOverlay:
+    """Edited pages that take precedence over the content of the archive.
+
+    Pages are kept in memory as long as their total size stays below the
+    budget, further pages are spilled as lossless files in a private
+    temporary directory.
+    """
+
+    def __init__(self, max_bytes=default_max_bytes):
+        """Create an empty overlay.
+
+        Args:
+            max_bytes (int): memory budget in bytes before spilling on disk
+        """
+        self._lock = RLock()
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._mem = {}  # name: img
+        self._spilled = {}  # name: path of file on disk
+        self._spill_dir = None  # created only when needed
+        self._nb_spills = 0  # used to name spilled files uniquely
+
+    def __contains__(self, name):
+        return name in self._mem or name in self._spilled
+
+    def __len__(self):
+        return len(self._mem) + len(self._spilled)
+
+    def names(self):
+        """Names of all edited pages.
+
+        Returns:
+            (set of str)
+        """
+        with self._lock:
+            return set(self._mem) | set(self._spilled)
+
+    def get(self, name):
+        """Edited version of page.
+
+        Args:
+            name (str): name of page in archive
+
+        Returns:
+            (Image|None): None if page has not been edited
+        """
+        with self._lock:
+            try:
+                return self._mem[name]
+            except KeyError:
+                pass
+
+            try:
+                pth = self._spilled[name]
+            except KeyError:
+                return None
+
+        img = Image.open(str(pth))
+        img.load()
+        return img
+
+    def put(self, name, img):
+        """Store edited version of page.
+
+        Args:
+            name (str): name of page in archive
+            img (Image): new content of page
+
+        Returns:
+            (None)
+        """
+        nbytes = image_nbytes(img)
+        with self._lock:
+            self.discard(name)
+            if self._nbytes + nbytes <= self._max_bytes:
+                self._mem[name] = img
+                self._nbytes += nbytes
+                return
+
+            if self._spill_dir is None:
+                from tempfile import mkdtemp  # seldom needed, not worth its import time
+
+                self._spill_dir = Path(mkdtemp(prefix="cbzreader_"))
+
+            pth = self._spill_dir / f"page{self._nb_spills:05d}.png"
+            self._nb_spills += 1
+            img.save(str(pth))
+            self._spilled[name] = pth
+
+    def discard(self, name):
+        """Forget edited version of page if any.
+
+        Args:
+            name (str): name of page in archive
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            try:
+                img = self._mem.pop(name)
+                self._nbytes -= image_nbytes(img)
+            except KeyError:
+                pass
+
+            try:
+                self._spilled.pop(name).unlink()
+            except KeyError:
+                pass
+
+    def clear(self):
+        """Forget all edited pages and remove spilled files.
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            self._mem = {}
+            self._nbytes = 0
+            self._spilled = {}
+            if self._spill_dir is not None:
+                import shutil
+
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
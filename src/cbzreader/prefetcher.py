@@ -0,0 +1,158 @@
+"""
+Decode pages around the current one in a background thread so that
+turning a page only needs to display an already decoded image.
+"""
+from threading import Condition, Thread
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class Prefetcher(QObject):
+    """Read-ahead of pages of the current book of an explorer.
+
+    Decoded pages are stored in the cache of the explorer. The page the
+    GUI is waiting for, if any, is sent back through `page_ready`.
+    """
+
+    page_ready = pyqtSignal(int, object)  # page index, decoded image or None if bad format
+    _decoded = pyqtSignal(int, int, object)  # generation, page index, decoded image
+
+    def __init__(self, explorer, nb_ahead=3, nb_behind=1, parent=None):
+        """Create a prefetcher and start its worker thread.
+
+        Args:
+            explorer (Explorer): explorer used to decode pages
+            nb_ahead (int): number of pages decoded in direction of travel
+            nb_behind (int): number of pages decoded in opposite direction
+            parent (QObject): Qt parent
+        """
+        super().__init__(parent)
+
+        self._ex = explorer
+        self._nb_ahead = nb_ahead
+        self._nb_behind = nb_behind
+
+        self._cond = Condition()
+        self._gen = 0  # incremented each time pending work becomes stale
+        self._pending = []  # list of (page, notify, size) still to decode
+        self._busy = False  # whether worker is currently decoding a page
+        self._running = True
+
+        self._decoded.connect(self._on_decoded)
+
+        self._worker = Thread(target=self._run, name="cbz-prefetch", daemon=True)
+        self._worker.start()
+
+    def window(self, page, direction=1):
+        """Pages to decode around given page, most urgent first.
+
+        Args:
+            page (int): index of current page
+            direction (int): 1 if reading forward, -1 if reading backward
+
+        Returns:
+            (list of int)
+        """
+        nb = self._ex.page_number()
+        pages = [page]
+        pages.extend(page + direction * i for i in range(1, self._nb_ahead + 1))
+        pages.extend(page - direction * i for i in range(1, self._nb_behind + 1))
+
+        return [i for i in pages if 0 <= i < nb]
+
+    def schedule(self, page, direction=1, notify=False, size=None):
+        """Replace pending work by pages around given page.
+
+        Args:
+            page (int): index of current page
+            direction (int): 1 if reading forward, -1 if reading backward
+            notify (bool): whether to emit page_ready once page is decoded
+            size (int, int): size of display area, see Explorer.open_page
+
+        Returns:
+            (None)
+        """
+        pages = self.window(page, direction)
+        with self._cond:
+            self._gen += 1
+            self._pending = [(i, notify and i == page, size) for i in pages]
+            self._cond.notify_all()
+
+    def cancel(self, wait=True):
+        """Drop pending work.
+
+        Notes: must be called before the page list of the explorer is
+               modified or its book closed.
+
+        Args:
+            wait (bool): whether to wait for the page currently decoded
+
+        Returns:
+            (None)
+        """
+        with self._cond:
+            self._gen += 1
+            self._pending = []
+            if wait:
+                self._cond.wait_for(lambda: not self._busy)
+
+    def stop(self):
+        """Cancel pending work and terminate worker thread.
+
+        Returns:
+            (None)
+        """
+        with self._cond:
+            self._running = False
+            self._gen += 1
+            self._pending = []
+            self._cond.notify_all()
+
+        self._worker.join()
+
+    def _run(self):
+        """Main loop of worker thread.
+
+        Returns:
+            (None)
+        """
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or not self._running)
+                if not self._running:
+                    return
+
+                gen = self._gen
+                page, notify, size = self._pending.pop(0)
+                self._busy = True
+
+            try:
+                img = self._ex.open_page(page, size)
+            except UserWarning:  # bad image format
+                img = None
+            except Exception as err:  # keep worker alive whatever happens
+                print(f"prefetch of page {page} failed: {err}")
+                img = None
+
+            if notify:
+                self._decoded.emit(gen, page, img)
+
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def _on_decoded(self, gen, page, img):
+        """Forward decoded page to GUI unless request is stale.
+
+        Notes: runs in thread of prefetcher, the GUI thread.
+
+        Args:
+            gen (int): generation of request
+            page (int): index of page
+            img (Image|None): decoded image
+
+        Returns:
+            (None)
+        """
+        if gen == self._gen:
+            self.page_ready.emit(page, img)
@@ -1,30 +1,62 @@
 import pickle
 from pathlib import Path
 
-from PyQt5.QtCore import QCoreApplication, Qt
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (QFileDialog, QMainWindow, QMessageBox, QShortcut)
 
+from .book_index import BookIndex
+from . import startup_profile
+from .book_saver import BookSaver
+from .disk_page_cache import DiskPageCache
 from .explorer import Explorer
+from .prefetcher import Prefetcher
 from .reader_ui import setup_ui
+from .thumbnail_cache import ThumbnailCache
+from .thumbnail_view import ThumbnailLoader, ThumbnailModel
 
 
 class Reader(QMainWindow):
-    def __init__(self, parent=None):
+    preopen_margin = 3
+    """(int) Number of pages before the end of a book from which the next
+    book is opened in background."""
+
+    def __init__(self, pth=None, parent=None):
+        """Create reader window.
+
+        Args:
+            pth (Path): book to open, last book of previous session if None
+            parent (QWidget): Qt parent
+        """
         super().__init__(parent)
 
-        self._ex = Explorer()
+        self._index = BookIndex()
+        self._disk_cache = DiskPageCache()
+        self._ex = Explorer(index=self._index, disk_cache=self._disk_cache)
+        self._prefetch = Prefetcher(self._ex, parent=self)
+        self._prefetch.page_ready.connect(self.page_ready)
+        self._thumb_cache = ThumbnailCache()
+        self._thumb_loader = ThumbnailLoader(self._ex, self._thumb_cache, parent=self)
+        self._thumbs = ThumbnailModel(self._thumb_loader, parent=self)
+        self._saver = BookSaver(self._ex, parent=self)
+        self._saver.written.connect(self.book_written)
+        self._saver.failed.connect(self.save_failed)
         self._current_page = None
         self._file_modified = False
+        self._prefetch_on_show = False  # whether read ahead waits for window to be shown
 
         self.init_gui()
 
-        last_open = self.load_state()
-        if last_open is not None and last_open[0] is not None:
+        with startup_profile.span("load_state"):
+            last_open = self.load_state()
+        if pth is not None:
+            self.load(pth)
+        elif last_open is not None and last_open[0] is not None:
             if last_open[0].exists():
                 self.load(*last_open)
 
     def init_gui(self):
-        setup_ui(self)
+        with startup_profile.span("setup_ui"):
+            setup_ui(self)
         self.update_title()
 
         # menu file
@@ -39,6 +71,10 @@ class Reader(QMainWindow):
         self.ui.action_prev_page.triggered.connect(self.prev_page)
         self.ui.action_next_page.triggered.connect(self.next_page)
         self.ui.action_rotate.triggered.connect(self.rotate_page)
+        self.ui.view_page.upscaled.connect(self.refine_page)
+        self._saver.progress.connect(self.ui.save_progress.setValue)
+        self.ui.view_thumbnails.setModel(self._thumbs)
+        self.ui.view_thumbnails.page_selected.connect(self.go_to_page)
 
         # menu viewedit
         self.ui.action_info.triggered.connect(self.image_info)
@@ -52,9 +88,21 @@ class Reader(QMainWindow):
     def closeEvent(self, event):
         self.save_state()
         self.safe_close_file()
+        self._prefetch.stop()
+        self._thumb_loader.stop()
         self._ex.close()
+        self._thumb_cache.close()
+        self._disk_cache.close()
+        self._index.close()
         super().closeEvent(event)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._prefetch_on_show:  # view has its final size
+            self._prefetch_on_show = False
+            if self._ex.current_book() is not None:
+                self._prefetch.schedule(self._current_page, size=self.ui.view_page.target_size())
+
     def action_escape(self):
         if self.isFullScreen():  # close full screen
             self.toggle_full_screen()
@@ -86,9 +134,23 @@ class Reader(QMainWindow):
             cur_page = self._current_page + 1
             nb_pages = self._ex.page_number()
             title = f"{book_name} {cur_page:d} / {nb_pages:d}"
+            self.ui.view_thumbnails.set_current(self._current_page)
 
         self.setWindowTitle(title)
 
+    def cancel_background(self):
+        """Stop work on pages in background, needed before the pages
+        of the book change.
+        """
+        self._prefetch.cancel()
+        self._thumb_loader.cancel()
+
+    def pages_changed(self):
+        """Refresh views of the whole book once its pages have changed.
+        """
+        nb = 0 if self._ex.current_book() is None else self._ex.page_number()
+        self._thumbs.reset(nb)
+
     ########################################################
     #
     #	Viewer state
@@ -150,6 +212,8 @@ class Reader(QMainWindow):
     #
     ########################################################
     def safe_close_file(self):
+        self._saver.finish()  # complete pending save first
+
         # edition?
         if self._file_modified:
             msg = QMessageBox(self)
@@ -171,23 +235,41 @@ class Reader(QMainWindow):
             elif clicked == but_new:
                 self.action_save_as()
 
+            self._saver.finish()
+
+        self.cancel_background()
         self._ex.close_book()
+        self.pages_changed()
 
     def load(self, pth, current_page=0):
         """Load pth as current open book.
         """
+        if self._saver.busy():
+            print("wait for end of save")
+            return
+
         self.safe_close_file()
 
-        self._ex.set_book(pth)
+        with startup_profile.span("set_book"):
+            self._ex.set_book(pth)
         self._file_modified = False
+        self.pages_changed()
 
         current_page = max(0, current_page)
         current_page = min(self._ex.page_number() - 1, current_page)
         self._current_page = current_page
 
-        img = self._ex.open_page(self._current_page)
+        if not self.isVisible():  # view not laid out yet, use geometry restored by load_state
+            self.layout().activate()
+        with startup_profile.span("open_page"):
+            img = self._ex.open_page(self._current_page, self.ui.view_page.target_size())
         self.ui.view_page.set_image(img)
         self.update_title()
+        if self.isVisible():
+            self._prefetch.schedule(self._current_page, size=self.ui.view_page.target_size())
+        else:  # size of view might still change when shown
+            self._prefetch_on_show = True
+        self._ex.prefetch_siblings()
 
     def action_load(self):
         file_names, _ = QFileDialog.getOpenFileNames(self, "Select Files", "", "Books (*.cbz)")
@@ -212,14 +294,62 @@ class Reader(QMainWindow):
     def save(self, pth):
         """Save current archive under given name
         """
-        self.setEnabled(False)  # save is potentially a long operation
-        QCoreApplication.instance().processEvents()
+        if self._saver.busy():
+            print("save already in progress")
+            return
+
+        try:
+            self._saver.save(pth)
+        except OSError as err:  # e.g. encrypted pages, nothing started
+            self.save_failed(pth, str(err))
+            return
+
+        # book is written in background, reading goes on but edition is blocked
+        self.set_editable(False)
+        self.ui.save_progress.setRange(0, self._ex.page_number())
+        self.ui.save_progress.setValue(0)
+        self.statusBar().show()
+
+    def book_written(self, tmp_pth, pth):
+        """Move book written in background into place and open it.
+        """
+        self.cancel_background()
+        try:
+            self._ex.install_book(tmp_pth, pth)
+        except OSError as err:
+            if tmp_pth.exists():
+                tmp_pth.unlink()
+            self.save_failed(pth, str(err))
+            self.pages_changed()
+            if self._ex.current_book() is None:  # saved book could not be reopened
+                self._current_page = None
+                self.ui.view_page.set_image(None)
+                self.update_title()
+            else:
+                self._prefetch.schedule(self._current_page, size=self.ui.view_page.target_size())
+            return
 
-        self._ex.save_book(pth)
-        self.update_title()
         self._file_modified = False
+        self.pages_changed()
+        self.statusBar().hide()
+        self.set_editable(True)
+        self.update_title()
+        self._prefetch.schedule(self._current_page, size=self.ui.view_page.target_size())
 
-        self.setEnabled(True)
+    def save_failed(self, pth, msg):
+        """Report failed save, book stays modified.
+        """
+        self.statusBar().hide()
+        self.set_editable(True)
+        QMessageBox.warning(self, "Save failed", f"Unable to save '{pth}':\n{msg}")
+
+    def set_editable(self, editable):
+        """Enable or disable actions that modify or close current book.
+        """
+        for action in (self.ui.action_open, self.ui.action_prev_book, self.ui.action_next_book,
+                       self.ui.action_save, self.ui.action_save_as, self.ui.action_delete,
+                       self.ui.action_updown, self.ui.action_swap_left, self.ui.action_swap_right):
+            action.setEnabled(editable)
 
     def action_save(self):
         if self._current_page is None:
@@ -241,7 +371,7 @@ class Reader(QMainWindow):
                                               , "."
                                               , "Ebook Files (*.cbz);;All (*.*)")
 
-        if name is not None:
+        if name:
             self.save(Path(name))
 
     ########################################################
@@ -266,9 +396,7 @@ class Reader(QMainWindow):
             return
 
         self._current_page -= 1
-        img = self._ex.open_page(self._current_page)
-        self.ui.view_page.set_image(img)
-        self.update_title()
+        self.display_current(-1)
 
     def next_page(self):
         if self._current_page is None:
@@ -276,14 +404,69 @@ class Reader(QMainWindow):
             return
 
         if self._current_page == self._ex.page_number() - 1:
-            print("last page already")
+            self.next_book()  # already opened in background
             return
 
         self._current_page += 1
-        img = self._ex.open_page(self._current_page)
-        self.ui.view_page.set_image(img)
+        self.display_current(1)
+
+    def go_to_page(self, page):
+        """Display given page, e.g. selected among thumbnails.
+        """
+        if self._current_page is None or page == self._current_page:
+            return
+
+        direction = 1 if page > self._current_page else -1
+        self._current_page = page
+        self.display_current(direction)
+
+    def display_current(self, direction):
+        """Display current page if already decoded or wait for it
+        and read ahead in the direction of travel.
+        """
+        size = self.ui.view_page.target_size()
+        img = self._ex.cached_page(self._current_page, size, count=False)  # counted by prefetcher
+        if img is not None:
+            self.ui.view_page.set_image(img)
+
+        self._prefetch.schedule(self._current_page, direction, notify=img is None, size=size)
         self.update_title()
 
+        if direction > 0 and self._ex.page_number() - self._current_page <= self.preopen_margin:
+            self.preopen_next_book()
+
+    def preopen_next_book(self):
+        """Open next book in background so that turning the last page
+        of current book is as fast as any other page.
+        """
+        try:
+            pth = self._ex.next_book()
+        except (IndexError, OSError):
+            return
+
+        self._ex.preopen_book(pth, size=self.ui.view_page.target_size())
+
+    def page_ready(self, page, img):
+        """Display page decoded in the background if still needed.
+        """
+        if page == self._current_page:
+            self.ui.view_page.set_image(img)
+
+    def refine_page(self):
+        """Decode current page with more pixels if the one displayed
+        has been decoded at a reduced scale for a smaller display.
+        """
+        if self._current_page is None or self._ex.current_book() is None:
+            return
+
+        try:
+            img = self._ex.open_page(self._current_page, self.ui.view_page.target_size())
+        except UserWarning:
+            return
+
+        if img is not self.ui.view_page.image():
+            self.ui.view_page.set_image(img)
+
     ########################################################
     #
     #	edit
@@ -297,8 +480,8 @@ class Reader(QMainWindow):
             print("load a book first")
             return
 
-        img = self._ex.open_page(self._current_page)
-        info_str = f"size: {img.size[0]:d}, {img.size[1]:d}"
+        w, h = self._ex.page_size(self._current_page)
+        info_str = f"size: {w:d}, {h:d}"
 
         QMessageBox.information(self, "Image info", info_str)
 
@@ -309,7 +492,9 @@ class Reader(QMainWindow):
             print("load a book first")
             return
 
+        self.cancel_background()
         self._ex.delete_page(self._current_page)
+        self.pages_changed()
 
         if self._current_page == self._ex.page_number():
             self._current_page -= 1
@@ -317,14 +502,16 @@ class Reader(QMainWindow):
                 print("empty book")
                 self._file_modified = False
                 self._ex.close_book()
+                self.pages_changed()
                 self.ui.view_page.set_image(None)
                 self.update_title()
                 return
 
         self._file_modified = True
-        img = self._ex.open_page(self._current_page)
+        img = self._ex.open_page(self._current_page, self.ui.view_page.target_size())
         self.ui.view_page.set_image(img)
         self.update_title()
+        self._prefetch.schedule(self._current_page, size=self.ui.view_page.target_size())
 
     def image_updown(self):
         """Transpose image upside down
@@ -335,13 +522,16 @@ class Reader(QMainWindow):
             return
 
         # transpose image
+        self.cancel_background()
         self._ex.transpose(self._current_page)
+        self.pages_changed()
         self._file_modified = True
 
         # update view
-        img = self._ex.open_page(self._current_page)
+        img = self._ex.open_page(self._current_page, self.ui.view_page.target_size())
         self.ui.view_page.set_image(img)
         self.update_title()
+        self._prefetch.schedule(self._current_page, size=self.ui.view_page.target_size())
 
     def swap_left(self):
         """Swap page with previous one.
@@ -355,14 +545,17 @@ class Reader(QMainWindow):
             return
 
         # swap pages
+        self.cancel_background()
         self._ex.swap(self._current_page, self._current_page - 1)
+        self.pages_changed()
         self._current_page -= 1
         self._file_modified = True
 
         # update view
-        img = self._ex.open_page(self._current_page)
+        img = self._ex.open_page(self._current_page, self.ui.view_page.target_size())
         self.ui.view_page.set_image(img)
         self.update_title()
+        self._prefetch.schedule(self._current_page, size=self.ui.view_page.target_size())
 
     def swap_right(self):
         """Swap page with next one.
@@ -376,11 +569,14 @@ class Reader(QMainWindow):
             return
 
         # swap pages
+        self.cancel_background()
         self._ex.swap(self._current_page, self._current_page + 1)
+        self.pages_changed()
         self._current_page += 1
         self._file_modified = True
 
         # update view
-        img = self._ex.open_page(self._current_page)
+        img = self._ex.open_page(self._current_page, self.ui.view_page.target_size())
         self.ui.view_page.set_image(img)
         self.update_title()
+        self._prefetch.schedule(self._current_page, size=self.ui.view_page.target_size())
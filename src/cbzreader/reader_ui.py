@@ -1,46 +1,99 @@
+from pathlib import Path
+
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWidgets import (QAction, QShortcut)
+from PyQt5.QtWidgets import (QAction, QDockWidget, QProgressBar, QShortcut)
 
 from . import cbz_reader_cfg as sh
-from .icons_rc import qInitResources
 from .image_view import ImageView
+from .thumbnail_view import ThumbnailView
+
+
+icons_dir = Path(__file__).parent / "icons"
+
 
-qInitResources()
+def icon(name):
+    """Icon read from package data.
+
+    Notes: image file is only read when icon is first painted.
+
+    Args:
+        name (str): name of icon, without extension
+
+    Returns:
+        (QIcon)
+    """
+    return QIcon(str(icons_dir / f"{name}.png"))
 
 
 class UI:
     pass
 
 
+def set_icons(mw):
+    """Set icons of window and actions.
+
+    Notes: delayed until window has been painted once since reading
+           images is not needed to display the first page.
+
+    Args:
+        mw (QMainWindow): window whose ui has been set up
+
+    Returns:
+        (None)
+    """
+    mw.setWindowIcon(icon("cbzreader"))
+    for action, name in ((mw.ui.action_open, "open"),
+                         (mw.ui.action_prev_book, "prev_cbz"),
+                         (mw.ui.action_next_book, "next_cbz"),
+                         (mw.ui.action_save, "save"),
+                         (mw.ui.action_snapshot, "snapshot"),
+                         (mw.ui.action_next_page, "next"),
+                         (mw.ui.action_prev_page, "prev")):
+        action.setIcon(icon(name))
+
+
 def setup_ui(mw):
     mw.ui = UI()
 
     mw.setWindowTitle("cbzreader")
     mw.setMinimumSize(600, 600)
-    mw.setWindowIcon(QIcon(":images/cbzreader.png"))
 
     mw.ui.view_page = ImageView()
     mw.setCentralWidget(mw.ui.view_page)
 
+    # pages at a glance, hidden by default
+    mw.ui.view_thumbnails = ThumbnailView()
+    mw.ui.dock_thumbnails = QDockWidget("Pages", mw)
+    mw.ui.dock_thumbnails.setObjectName("dock_thumbnails")  # for saveState
+    mw.ui.dock_thumbnails.setWidget(mw.ui.view_thumbnails)
+    mw.addDockWidget(Qt.LeftDockWidgetArea, mw.ui.dock_thumbnails)
+    mw.ui.dock_thumbnails.hide()
+
+    # only visible while saving
+    mw.ui.save_progress = QProgressBar()
+    mw.statusBar().addPermanentWidget(mw.ui.save_progress)
+    mw.statusBar().hide()
+
     menubar = mw.menuBar()
 
     # Menu files
-    mw.ui.action_open = QAction(QIcon(":images/open.png"), '&Open', mw)
+    mw.ui.action_open = QAction('&Open', mw)
     QShortcut(sh.open, mw, mw.ui.action_open.trigger)
 
-    mw.ui.action_prev_book = QAction(QIcon(":images/prev_cbz.png"), "&Prev book", mw)
+    mw.ui.action_prev_book = QAction("&Prev book", mw)
     QShortcut(sh.prev_book, mw, mw.ui.action_prev_book.trigger)
 
-    mw.ui.action_next_book = QAction(QIcon(":images/next_cbz.png"), "&Next book", mw)
+    mw.ui.action_next_book = QAction("&Next book", mw)
     QShortcut(sh.next_book, mw, mw.ui.action_next_book.trigger)
 
-    mw.ui.action_save = QAction(QIcon(":images/save.png"), "&Save", mw)
+    mw.ui.action_save = QAction("&Save", mw)
     QShortcut(sh.save, mw, mw.ui.action_save.trigger)
 
     mw.ui.action_save_as = QAction("Save as", mw)
     QShortcut(sh.save_as, mw, mw.ui.action_save_as.trigger)
 
-    mw.ui.action_snapshot = QAction(QIcon(":images/snapshot.png"), "Snapshot", mw)
+    mw.ui.action_snapshot = QAction("Snapshot", mw)
     QShortcut(sh.snapshot, mw, mw.ui.action_snapshot.trigger)
 
     mw.ui.action_close = QAction("&Close", mw)
@@ -62,16 +115,19 @@ def setup_ui(mw):
     for txt in sh.full_screen:
         QShortcut(txt, mw, mw.ui.action_full_screen.trigger)
 
-    mw.ui.action_next_page = QAction(QIcon(":images/next.png"), "&Next", mw)
+    mw.ui.action_next_page = QAction("&Next", mw)
     for txt in sh.next:
         QShortcut(txt, mw, mw.ui.action_next_page.trigger)
 
-    mw.ui.action_prev_page = QAction(QIcon(":images/prev.png"), "&Prev", mw)
+    mw.ui.action_prev_page = QAction("&Prev", mw)
     QShortcut(sh.prev, mw, mw.ui.action_prev_page.trigger)
 
     mw.ui.action_rotate = QAction('&Rotate', mw)
     QShortcut(sh.rotate, mw, mw.ui.action_rotate.trigger)
 
+    mw.ui.action_thumbnails = mw.ui.dock_thumbnails.toggleViewAction()
+    QShortcut(sh.thumbnails, mw, mw.ui.action_thumbnails.trigger)
+
     mw.ui.action_show_mouse = QAction("&Show mouse", mw)
     mw.ui.action_show_mouse.setCheckable(True)
     mw.ui.action_show_mouse.setChecked(True)
@@ -83,6 +139,7 @@ def setup_ui(mw):
     menu_view.addAction(mw.ui.action_next_page)
     menu_view.addSeparator()
     menu_view.addAction(mw.ui.action_rotate)
+    menu_view.addAction(mw.ui.action_thumbnails)
     menu_view.addSeparator()
     menu_view.addAction(mw.ui.action_show_mouse)
 
@@ -102,4 +159,6 @@ def setup_ui(mw):
     menu_edit = menubar.addMenu('&Edit')
     menu_edit.addAction(mw.ui.action_info)
     menu_edit.addAction(mw.ui.action_delete)
-    menu_edit.addAction(mw.ui.action_updown)
\ No newline at end of file
+    menu_edit.addAction(mw.ui.action_updown)
+
+    QTimer.singleShot(0, lambda: set_icons(mw))
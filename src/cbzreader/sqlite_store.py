@@ -0,0 +1,137 @@
+"""
+Helpers shared by the SQLite databases of the user cache: opening them
+from several threads, rebuilding them when their schema changes and
+bounding the total size of their rows.
+"""
+import sqlite3
+from time import time_ns
+
+
+def open_db(db_pth, schema, schema_version, on_rebuild=None):
+    """Open or create database, shared by the threads of a process.
+
+    Notes: content is only a cache, all tables of a database written
+           with another version of schema are dropped.
+
+    Args:
+        db_pth (Path): path to database
+        schema (str): statements creating missing tables and indices
+        schema_version (int): version of schema
+        on_rebuild (callable): called without arguments once tables have
+                               been dropped, e.g. to remove files they
+                               referenced
+
+    Returns:
+        (sqlite3.Connection): to be used under a lock
+    """
+    db = sqlite3.connect(str(db_pth), timeout=30, check_same_thread=False)
+    with db:
+        version, = db.execute("PRAGMA user_version").fetchone()
+        if version != schema_version:
+            tables = [name for name, in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+            for name in tables:
+                db.execute(f"DROP TABLE IF EXISTS {name}")
+            db.execute(f"PRAGMA user_version = {schema_version:d}")
+            if on_rebuild is not None:
+                on_rebuild()
+
+        db.executescript(schema)
+
+    return db
+
+
+class LruTable:
+    """Rows of a table bounded by their total size, least recently used
+    rows are evicted first.
+
+    The two last columns of the table must be `nbytes`, the size of the
+    row, and `last_used`, the time it was last used. The total size is
+    always read from the database, which might be shared by several
+    processes.
+    """
+
+    def __init__(self, db, lock, table, key_columns, max_bytes):
+        """Manage table of an already opened database.
+
+        Args:
+            db (sqlite3.Connection): database, see open_db
+            lock (RLock): lock protecting any use of db
+            table (str): name of table
+            key_columns (tuple of str): columns identifying a row, first
+                                        columns of table
+            max_bytes (int): maximal total size of rows
+        """
+        self._db = db
+        self._lock = lock
+        self._table = table
+        self._key_columns = key_columns
+        self._where = " AND ".join(f"{col} = ?" for col in key_columns)
+        self._max_bytes = max_bytes
+
+    def max_bytes(self):
+        """Budget of table.
+
+        Returns:
+            (int): number of bytes
+        """
+        return self._max_bytes
+
+    def nbytes(self):
+        """Total size of rows.
+
+        Returns:
+            (int): number of bytes
+        """
+        with self._lock:
+            nbytes, = self._db.execute(f"SELECT COALESCE(SUM(nbytes), 0) FROM {self._table}").fetchone()
+
+        return nbytes
+
+    def touch(self, key):
+        """Mark row as recently used.
+
+        Args:
+            key (tuple): values of key columns
+
+        Returns:
+            (None)
+        """
+        with self._lock, self._db:
+            self._db.execute(f"UPDATE {self._table} SET last_used = ? WHERE {self._where}", (time_ns(), *key))
+
+    def put(self, row, nbytes):
+        """Insert or replace row, evicting least recently used ones if needed.
+
+        Notes: rows larger than the whole budget are not stored.
+
+        Args:
+            row (tuple): values of all columns but `nbytes` and `last_used`,
+                         starting with key columns
+            nbytes (int): size of row
+
+        Returns:
+            (list of tuple): keys of evicted rows
+        """
+        if nbytes > self._max_bytes:
+            return []
+
+        cols = ", ".join(self._key_columns)
+        marks = ", ".join("?" * (len(row) + 2))
+        evicted = []
+        with self._lock, self._db:
+            # insert starts a write transaction, no other process changes total until commit
+            self._db.execute(f"INSERT OR REPLACE INTO {self._table} VALUES ({marks})",
+                             (*row, nbytes, time_ns()))
+            total = self.nbytes()
+            while total > self._max_bytes:
+                oldest = self._db.execute(f"SELECT {cols}, nbytes FROM {self._table} "
+                                          "ORDER BY last_used LIMIT 1").fetchone()
+                if oldest is None:
+                    break
+
+                *old_key, old_nbytes = oldest
+                self._db.execute(f"DELETE FROM {self._table} WHERE {self._where}", old_key)
+                total -= old_nbytes
+                evicted.append(tuple(old_key))
+
+        return evicted
@@ -0,0 +1,119 @@
+"""
+Opt-in timeline of the start up of the reader, written as a Chrome trace
+file to be opened with chrome://tracing or https://ui.perfetto.dev.
+
+Recording starts when this module is imported with the CBZREADER_PROFILE
+environment variable set to the path of the trace file, or when `enable`
+is called, and stops once the first page has been displayed.
+"""
+import json
+import os
+from contextlib import contextmanager, nullcontext
+from threading import get_ident
+from time import perf_counter_ns
+
+env_var = "CBZREADER_PROFILE"
+
+_events = None  # recorded events, None if not recording
+_out_pth = None  # path to trace file
+_no_span = nullcontext()
+
+
+def enable(pth):
+    """Start recording.
+
+    Args:
+        pth (Path): path to trace file written by `finish`
+
+    Returns:
+        (None)
+    """
+    global _events, _out_pth
+    _events = []
+    _out_pth = pth
+    mark("profile enabled")
+
+
+def recording():
+    """Whether events are currently recorded.
+
+    Returns:
+        (bool)
+    """
+    return _events is not None
+
+
+def _now():
+    """Current time in microseconds, the unit of Chrome traces.
+
+    Returns:
+        (float)
+    """
+    return perf_counter_ns() / 1e3
+
+
+def mark(name):
+    """Record an instant event.
+
+    Args:
+        name (str): name of event
+
+    Returns:
+        (None)
+    """
+    events = _events
+    if events is not None:
+        events.append(dict(name=name, ph="i", s="p", ts=_now(), pid=os.getpid(), tid=get_ident()))
+
+
+@contextmanager
+def _span(name, events):
+    start = _now()
+    try:
+        yield
+    finally:
+        events.append(dict(name=name, ph="X", ts=start, dur=_now() - start, pid=os.getpid(), tid=get_ident()))
+
+
+def span(name):
+    """Context manager recording the duration of a stage.
+
+    Notes: costs a global lookup when not recording.
+
+    Args:
+        name (str): name of stage
+
+    Returns:
+        (context manager)
+    """
+    events = _events
+    if events is None:
+        return _no_span
+
+    return _span(name, events)
+
+
+def finish():
+    """Stop recording and write trace file.
+
+    Notes: does nothing if not recording.
+
+    Returns:
+        (None)
+    """
+    global _events
+    events = _events
+    if events is None:
+        return
+
+    mark("profile finished")
+    _events = None
+
+    with open(_out_pth, 'w') as fhw:
+        json.dump(dict(traceEvents=events, displayTimeUnit="ms"), fhw, indent=1)
+
+    print(f"startup profile written in '{_out_pth}'")
+
+
+if os.environ.get(env_var):
+    enable(os.environ[env_var])
@@ -0,0 +1,95 @@
+"""
+Persistent cache of page thumbnails, keyed by page content so that
+identical pages of different books share their thumbnail.
+"""
+from threading import RLock
+
+from .sqlite_store import LruTable, open_db
+from .user_cache import cache_dir
+
+schema_version = 1
+"""(int) Version of schema, caches of older versions are emptied."""
+
+schema = """
+CREATE TABLE IF NOT EXISTS thumbnails (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    nbytes INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS thumbnails_last_used ON thumbnails (last_used);
+"""
+
+default_max_bytes = 64 * 2 ** 20
+"""(int) Default budget of cache on disk, in bytes."""
+
+
+class ThumbnailCache:
+    """Encoded thumbnails bounded by their total size.
+
+    Least recently used thumbnails are evicted once the budget is
+    exceeded.
+    """
+
+    def __init__(self, db_pth=None, max_bytes=default_max_bytes):
+        """Open or create cache.
+
+        Args:
+            db_pth (Path): path to database, default in user cache dir
+            max_bytes (int): maximal total size of thumbnails
+        """
+        if db_pth is None:
+            db_pth = cache_dir() / "thumbnails.sqlite"
+
+        self._lock = RLock()
+        self._db = open_db(db_pth, schema, schema_version)
+        self._table = LruTable(self._db, self._lock, "thumbnails", ("key",), max_bytes)
+
+    def close(self):
+        """Close underlying database.
+
+        Returns:
+            (None)
+        """
+        with self._lock:
+            self._db.close()
+
+    def nbytes(self):
+        """Total size of stored thumbnails.
+
+        Returns:
+            (int)
+        """
+        return self._table.nbytes()
+
+    def get(self, key):
+        """Stored thumbnail, marked as recently used.
+
+        Args:
+            key (str): identifier of thumbnail
+
+        Returns:
+            (bytes|None): None if unknown
+        """
+        with self._lock:
+            row = self._db.execute("SELECT data FROM thumbnails WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            self._table.touch((key,))
+
+        return row[0]
+
+    def put(self, key, data):
+        """Store thumbnail, evicting least recently used ones if needed.
+
+        Notes: thumbnails bigger than the whole budget are not stored.
+
+        Args:
+            key (str): identifier of thumbnail
+            data (bytes): encoded thumbnail
+
+        Returns:
+            (None)
+        """
+        self._table.put((key, data), len(data))
@@ -0,0 +1,331 @@
+"""
+Grid of the pages of the current book, rendered in background and only
+for the cells actually visible.
+"""
+from collections import OrderedDict
+from io import BytesIO
+from threading import Condition, Thread
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QObject, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QPixmap
+from PyQt5.QtWidgets import QListView
+
+thumbnail_size = (120, 180)
+"""(int, int) Bounding box of page thumbnails."""
+
+
+class ThumbnailLoader(QObject):
+    """Render thumbnails of pages of the current book of an explorer in
+    a pool of worker threads.
+
+    Thumbnails are looked up in a persistent cache first, most recently
+    requested pages are rendered first.
+    """
+
+    thumbnail_ready = pyqtSignal(int, object)  # page index, QImage, null if bad format
+    _rendered = pyqtSignal(int, int, object)  # generation, page index, QImage
+
+    def __init__(self, explorer, cache=None, size=thumbnail_size, nb_workers=2, parent=None):
+        """Create a loader and start its worker threads.
+
+        Args:
+            explorer (Explorer): explorer used to read pages
+            cache (ThumbnailCache): persistent cache of thumbnails, if None
+                                    thumbnails are always rendered
+            size (int, int): bounding box of thumbnails
+            nb_workers (int): number of worker threads
+            parent (QObject): Qt parent
+        """
+        super().__init__(parent)
+
+        self._ex = explorer
+        self._cache = cache
+        self._size = size
+
+        self._cond = Condition()
+        self._gen = 0  # incremented each time pending work becomes stale
+        self._pending = []  # pages still to render, most urgent last
+        self._busy = 0  # number of workers currently rendering a page
+        self._running = True
+
+        self._rendered.connect(self._on_rendered)
+
+        self._workers = [Thread(target=self._run, name=f"cbz-thumbnail-{i:d}", daemon=True)
+                         for i in range(nb_workers)]
+        for th in self._workers:
+            th.start()
+
+    def size(self):
+        """Bounding box of thumbnails.
+
+        Returns:
+            (int, int)
+        """
+        return self._size
+
+    def request(self, page):
+        """Render thumbnail of page, before any other pending one.
+
+        Args:
+            page (int): index of page in current book
+
+        Returns:
+            (None)
+        """
+        with self._cond:
+            self._pending.append(page)
+            self._cond.notify()
+
+    def cancel(self, wait=True):
+        """Drop pending work.
+
+        Notes: must be called before the page list of the explorer is
+               modified or its book closed.
+
+        Args:
+            wait (bool): whether to wait for pages currently rendered
+
+        Returns:
+            (None)
+        """
+        with self._cond:
+            self._gen += 1
+            self._pending = []
+            if wait:
+                self._cond.wait_for(lambda: self._busy == 0)
+
+    def stop(self):
+        """Cancel pending work and terminate worker threads.
+
+        Returns:
+            (None)
+        """
+        with self._cond:
+            self._running = False
+            self._gen += 1
+            self._pending = []
+            self._cond.notify_all()
+
+        for th in self._workers:
+            th.join()
+
+    def render(self, page):
+        """Thumbnail of page, from cache if possible.
+
+        Notes: safe to call from several threads.
+
+        Args:
+            page (int): index of page in current book
+
+        Returns:
+            (bytes): JPEG encoded, empty if bad image format
+        """
+        key = self._ex.page_key(page)
+        if key is not None and self._cache is not None:
+            key = f"{key}-{self._size[0]:d}x{self._size[1]:d}"
+            data = self._cache.get(key)
+            if data is not None:
+                return data
+
+        try:
+            img = self._ex.thumbnail(page, self._size)
+        except UserWarning:
+            return b""
+
+        buf = BytesIO()
+        img.save(buf, "JPEG", quality=85)
+        data = buf.getvalue()
+        if key is not None and self._cache is not None:  # edited pages are not cached
+            self._cache.put(key, data)
+
+        return data
+
+    def _run(self):
+        """Main loop of worker threads.
+
+        Returns:
+            (None)
+        """
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or not self._running)
+                if not self._running:
+                    return
+
+                gen = self._gen
+                page = self._pending.pop()
+                self._busy += 1
+
+            try:
+                img = QImage.fromData(self.render(page), "JPEG")
+            except Exception as err:  # keep worker alive whatever happens
+                print(f"thumbnail of page {page} failed: {err}")
+                img = QImage()
+
+            self._rendered.emit(gen, page, img)
+
+            with self._cond:
+                self._busy -= 1
+                self._cond.notify_all()
+
+    def _on_rendered(self, gen, page, img):
+        """Forward thumbnail to GUI unless request is stale.
+
+        Notes: runs in thread of loader, the GUI thread.
+
+        Args:
+            gen (int): generation of request
+            page (int): index of page
+            img (QImage): thumbnail
+
+        Returns:
+            (None)
+        """
+        if gen == self._gen:
+            self.thumbnail_ready.emit(page, img)
+
+
+class ThumbnailModel(QAbstractListModel):
+    """Pages of current book, with their thumbnail once rendered.
+
+    Thumbnails are only requested when a view asks for them, i.e. for
+    visible cells.
+    """
+
+    pix_cache_size = 512
+    """(int) Maximal number of thumbnails kept in memory."""
+
+    def __init__(self, loader, parent=None):
+        """Create an empty model.
+
+        Args:
+            loader (ThumbnailLoader): source of thumbnails
+            parent (QObject): Qt parent
+        """
+        super().__init__(parent)
+
+        self._loader = loader
+        self._nb = 0
+        self._pixmaps = OrderedDict()  # page: QPixmap, least recently used first
+        self._requested = set()  # pages whose thumbnail is being rendered
+
+        w, h = loader.size()
+        self._pix_none = QPixmap(w, h)
+        self._pix_none.fill(QColor(80, 80, 80))
+
+        loader.thumbnail_ready.connect(self.thumbnail_ready)
+
+    def reset(self, nb_pages):
+        """Forget all thumbnails, e.g. when pages of book change.
+
+        Notes: pending work of loader must have been cancelled first.
+
+        Args:
+            nb_pages (int): number of pages in current book
+
+        Returns:
+            (None)
+        """
+        self.beginResetModel()
+        self._nb = nb_pages
+        self._pixmaps.clear()
+        self._requested.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._nb
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        page = index.row()
+        if role == Qt.DisplayRole:
+            return f"{page + 1:d}"
+
+        if role == Qt.DecorationRole:
+            try:
+                self._pixmaps.move_to_end(page)
+                return self._pixmaps[page]
+            except KeyError:
+                pass
+
+            if page not in self._requested:
+                self._requested.add(page)
+                self._loader.request(page)
+
+            return self._pix_none
+
+        if role == Qt.SizeHintRole:
+            return QSize(*self._loader.size())
+
+        return None
+
+    def thumbnail_ready(self, page, img):
+        """Store rendered thumbnail and refresh its cell.
+
+        Args:
+            page (int): index of page
+            img (QImage): thumbnail, null if bad format
+
+        Returns:
+            (None)
+        """
+        self._requested.discard(page)
+        if page >= self._nb:
+            return
+
+        self._pixmaps[page] = self._pix_none if img.isNull() else QPixmap.fromImage(img)
+        while len(self._pixmaps) > self.pix_cache_size:
+            self._pixmaps.popitem(last=False)  # requested again if it becomes visible
+
+        index = self.index(page)
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+
+class ThumbnailView(QListView):
+    """Grid of thumbnails, laid out in batches so that only visible
+    cells are ever rendered.
+    """
+
+    page_selected = pyqtSignal(int)  # page index
+
+    cell_margin = 8
+    """(int) Room in pixels around thumbnails in their grid cell."""
+
+    def __init__(self, size=thumbnail_size, parent=None):
+        """Create an empty view.
+
+        Args:
+            size (int, int): bounding box of thumbnails, see ThumbnailLoader
+            parent (QWidget): Qt parent
+        """
+        super().__init__(parent)
+
+        self.setViewMode(QListView.IconMode)
+        w, h = size
+        self.setIconSize(QSize(w, h))  # thumbnails are drawn as small icons otherwise
+        self.setGridSize(QSize(w + self.cell_margin, h + self.fontMetrics().height() + self.cell_margin))
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)  # no need to query every cell for its size
+        self.setLayoutMode(QListView.Batched)
+
+        self.clicked.connect(lambda index: self.page_selected.emit(index.row()))
+
+    def set_current(self, page):
+        """Highlight page and make it visible.
+
+        Args:
+            page (int): index of page
+
+        Returns:
+            (None)
+        """
+        if self.model() is None or not 0 <= page < self.model().rowCount():
+            return
+
+        index = self.model().index(page)
+        self.setCurrentIndex(index)
+        if self.isVisible():
+            self.scrollTo(index)
@@ -0,0 +1,32 @@
+"""
+Location of files cached by cbzreader between sessions.
+"""
+import os
+import sys
+from pathlib import Path
+
+
+def cache_dir():
+    """Directory where persistent caches are stored.
+
+    Notes: follows platform conventions, can be overridden with the
+           CBZREADER_CACHE_DIR environment variable. Directory is
+           created if needed.
+
+    Returns:
+        (Path)
+    """
+    try:
+        pth = Path(os.environ["CBZREADER_CACHE_DIR"])
+    except KeyError:
+        if sys.platform == "win32":
+            root = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+        elif sys.platform == "darwin":
+            root = Path.home() / "Library" / "Caches"
+        else:
+            root = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+
+        pth = Path(root) / "cbzreader"
+
+    pth.mkdir(parents=True, exist_ok=True)
+    return pth
@@ -26,3 +26,34 @@ def pytest_collection_modifyitems(config, items):
             if "slow" in item.keywords:
                 item.add_marker(skip_slow)
 # #}
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # widgets are created without display
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: long running test, needs --runslow option to run")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture()
+def wait_for(qapp):
+    """Process Qt events until a condition holds, fail after a timeout."""
+    from time import monotonic
+
+    def wait(cond, timeout=5.):
+        t0 = monotonic()
+        while not cond():
+            qapp.processEvents()
+            assert monotonic() - t0 < timeout
+
+    return wait
@@ -0,0 +1,72 @@
+"""
+Helpers to create small synthetic cbz files for tests.
+"""
+from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from PIL import Image
+
+page_sizes = {"1080p": (1080, 1920), "4K": (2160, 3840), "8K": (4320, 7680)}
+"""(dict) Portrait pages the size of common screens, width, height."""
+
+
+def make_page(ind, size=(60, 80), mode="RGB"):
+    """Create a synthetic page whose content depends on its index.
+
+    Args:
+        ind (int): index of page
+        size (int, int): width, height of page
+        mode (str): PIL mode of image
+
+    Returns:
+        (Image)
+    """
+    img = Image.new("RGB", size, ((ind * 37) % 256, (ind * 91) % 256, 128))
+    for i in range(min(size)):
+        img.putpixel((i, i), (255, 255, 255))
+
+    if mode != "RGB":
+        img = img.convert(mode)
+
+    return img
+
+
+def make_book(pth, nb_pages, size=(60, 80), fmt="jpeg", compression=ZIP_DEFLATED, mode="RGB"):
+    """Write a synthetic book on disk.
+
+    Args:
+        pth (Path): path to archive to create
+        nb_pages (int): number of pages in book
+        size (int, int): width, height of each page
+        fmt (str): image format used to write pages
+        compression (int): zip compression used for members
+        mode (str): PIL mode of pages
+
+    Returns:
+        (Path): pth
+    """
+    ext = {"jpeg": "jpg"}.get(fmt, fmt)
+    with ZipFile(pth, 'w', compression) as cbz:
+        for i in range(nb_pages):
+            data = BytesIO()
+            make_page(i, size, mode).save(data, fmt)
+            cbz.writestr(f"p{i:05d}.{ext}", data.getvalue())
+
+    return pth
+
+
+def mark_first_page_encrypted(pth):
+    """Set encryption flag of first member of a book, as if it needed a
+    password to be read.
+
+    Args:
+        pth (Path): path to book written by make_book
+
+    Returns:
+        (Path): pth
+    """
+    data = bytearray(pth.read_bytes())
+    data[6] |= 0x1  # flags of local header, first in archive
+    data[data.index(b"PK\x01\x02") + 8] |= 0x1  # flags of central directory entry
+    pth.write_bytes(bytes(data))
+    return pth
@@ -0,0 +1,83 @@
+import errno
+import os
+
+import pytest
+
+from cbzreader import atomic_save
+from cbzreader.atomic_save import replace_book, temp_book_path
+from cbzreader.explorer import Explorer
+from small_books import make_book
+
+
+@pytest.mark.skipif(os.name != "posix", reason="posix permissions")
+def test_temp_book_path_keeps_permissions_of_target(tmp_path):
+    pth = tmp_path / "book.cbz"
+    pth.write_bytes(b"old")
+    pth.chmod(0o640)
+
+    tmp1 = temp_book_path(pth)
+    tmp2 = temp_book_path(pth)
+    assert tmp1 != tmp2
+    assert tmp1.parent == tmp_path
+    assert tmp1.stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(os.name != "posix", reason="posix permissions")
+def test_temp_book_path_does_not_change_umask_of_process(tmp_path, monkeypatch):
+    def no_umask(mask):
+        raise AssertionError("umask changed while other threads might create files")
+
+    monkeypatch.setattr(os, "umask", no_umask)
+    tmp = temp_book_path(tmp_path / "new.cbz")
+    assert tmp.stat().st_mode & 0o777 == atomic_save.default_mode()
+
+
+def test_replace_book_is_atomic(tmp_path):
+    pth = tmp_path / "book.cbz"
+    pth.write_bytes(b"old")
+    tmp_pth = temp_book_path(pth)
+    tmp_pth.write_bytes(b"new")
+
+    replace_book(tmp_pth, pth)
+    assert pth.read_bytes() == b"new"
+    assert sorted(tmp_path.iterdir()) == [pth]
+
+
+def test_replace_book_streams_across_devices(tmp_path, monkeypatch):
+    pth = tmp_path / "dst" / "book.cbz"
+    pth.parent.mkdir()
+    pth.write_bytes(b"old")
+    tmp_pth = tmp_path / "other.tmp"
+    tmp_pth.write_bytes(b"new")
+
+    replace = os.replace
+
+    def cross_device_replace(src, dst):
+        if os.path.dirname(src) != os.path.dirname(dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        replace(src, dst)
+
+    monkeypatch.setattr(atomic_save.os, "replace", cross_device_replace)
+    replace_book(tmp_pth, pth)
+
+    assert pth.read_bytes() == b"new"
+    assert not tmp_pth.exists()
+    assert sorted(pth.parent.iterdir()) == [pth]
+
+
+def test_save_book_leaves_no_temp_file_on_error(tmp_path, monkeypatch):
+    pth = make_book(tmp_path / "book.cbz", 3)
+    orig = pth.read_bytes()
+    ex = Explorer(pth)
+    ex.transpose(0)
+
+    def encode_image(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("cbzreader.explorer.encode_image", encode_image)
+    with pytest.raises(OSError):
+        ex.save_book(pth, nb_workers=1)
+
+    assert sorted(tmp_path.iterdir()) == [pth]
+    assert pth.read_bytes() == orig
+    ex.close()
@@ -0,0 +1,58 @@
+import os
+from zipfile import ZipFile
+
+from cbzreader.book_index import BookIndex
+from small_books import make_book
+
+
+def test_book_index_round_trip(tmp_path):
+    pth = make_book(tmp_path / "book.cbz", 3)
+    with ZipFile(pth) as cbz:
+        infos = cbz.infolist()
+
+    index = BookIndex(tmp_path / "index.sqlite")
+    assert index.lookup(pth) is None
+
+    index.store(pth, infos)
+    index.update_pages(pth, {infos[1].filename: ("JPEG", (60, 80))})
+    entries = index.lookup(pth)
+
+    assert [info.filename for info, _, _ in entries] == [info.filename for info in infos]
+    assert [info.header_offset for info, _, _ in entries] == [info.header_offset for info in infos]
+    assert [info.date_time for info, _, _ in entries] == [info.date_time for info in infos]
+    assert [info.external_attr for info, _, _ in entries] == [info.external_attr for info in infos]
+    assert entries[0][1:] == (None, None)
+    assert entries[1][1:] == ("JPEG", (60, 80))
+    index.close()
+
+
+def test_book_index_invalidated_when_book_changes(tmp_path):
+    pth = make_book(tmp_path / "book.cbz", 3)
+    with ZipFile(pth) as cbz:
+        infos = cbz.infolist()
+
+    index = BookIndex(tmp_path / "index.sqlite")
+    index.store(pth, infos)
+
+    stat = pth.stat()
+    os.utime(pth, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert index.lookup(pth) is None
+    index.close()
+
+
+def test_book_index_rebuilds_index_of_older_schema(tmp_path):
+    import sqlite3
+
+    db = sqlite3.connect(str(tmp_path / "index.sqlite"))
+    db.execute("CREATE TABLE pages (path TEXT, ind INTEGER)")
+    db.commit()
+    db.close()
+
+    pth = make_book(tmp_path / "book.cbz", 2)
+    with ZipFile(pth) as cbz:
+        infos = cbz.infolist()
+
+    index = BookIndex(tmp_path / "index.sqlite")
+    index.store(pth, infos)
+    assert len(index.lookup(pth)) == 2
+    index.close()
@@ -0,0 +1,56 @@
+from zipfile import ZipFile
+
+from cbzreader.book_saver import BookSaver
+from cbzreader.explorer import Explorer
+from small_books import make_book
+
+
+def test_book_saver_writes_snapshot_in_background(qapp, wait_for, tmp_path):
+    ex = Explorer(make_book(tmp_path / "book.cbz", 5))
+    ex.delete_page(0)
+
+    saver = BookSaver(ex)
+    written = []
+    steps = []
+    saver.written.connect(lambda tmp_pth, pth: written.append((tmp_pth, pth)))
+    saver.progress.connect(lambda nb, total: steps.append((nb, total)))
+
+    saver.save(tmp_path / "new.cbz", nb_workers=1)
+    assert saver.busy()
+    ex.transpose(0)  # edition after snapshot is not saved
+
+    wait_for(lambda: written)
+    assert not saver.busy()
+    assert steps[-1] == (4, 4)
+
+    (tmp_pth, pth), = written
+    assert pth == tmp_path / "new.cbz"
+    assert tmp_pth.parent == tmp_path
+    with ZipFile(tmp_pth) as cbz:
+        assert len(cbz.namelist()) == 4
+        assert cbz.testzip() is None
+
+    ex.install_book(tmp_pth, pth)
+    assert not tmp_pth.exists()
+    assert ex.current_book() == pth
+    assert ex.page_number() == 4
+    ex.close()
+
+
+def test_book_saver_reports_failure(qapp, tmp_path, monkeypatch):
+    ex = Explorer(make_book(tmp_path / "book.cbz", 3))
+
+    def write_book(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ex, "write_book", write_book)
+
+    saver = BookSaver(ex)
+    failed = []
+    saver.failed.connect(lambda pth, msg: failed.append((pth, msg)))
+    saver.save(tmp_path / "new.cbz")
+    saver.finish()
+
+    assert failed == [(tmp_path / "new.cbz", "disk full")]
+    assert sorted(pth.name for pth in tmp_path.iterdir()) == ["book.cbz"]
+    ex.close()
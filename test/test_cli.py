@@ -0,0 +1,83 @@
+import subprocess
+import sys
+from zipfile import ZipFile
+
+import pytest
+
+from cbzreader.cli import main, parse_pages
+from small_books import make_book
+
+
+def test_parse_pages():
+    assert parse_pages("1", 5) == [0]
+    assert parse_pages("4,1-2", 5) == [0, 1, 3]
+    assert parse_pages("-1", 5) == [4]
+    assert parse_pages("3--1", 5) == [2, 3, 4]
+    with pytest.raises(ValueError):
+        parse_pages("6", 5)
+    with pytest.raises(ValueError):
+        parse_pages("0", 5)
+
+
+def test_cli_info_and_list(tmp_path, capsys):
+    pth = make_book(tmp_path / "book.cbz", 3)
+
+    assert main(["info", str(pth)]) == 0
+    assert capsys.readouterr().out.startswith(f"{pth}: 3 pages, ")
+
+    assert main(["list", str(pth)]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+    assert lines[0].split()[0] == "1"
+    assert lines[0].endswith("60x80")
+
+
+def test_cli_library(tmp_path, capsys, monkeypatch):
+    monkeypatch.setenv("CBZREADER_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "lib" / "a").mkdir(parents=True)
+    make_book(tmp_path / "lib" / "a" / "one.cbz", 3)
+    make_book(tmp_path / "lib" / "two.cbz", 2)
+
+    assert main(["library", str(tmp_path / "lib"), "--search", "one"]) == 0
+    assert capsys.readouterr().out.splitlines() == [f"{tmp_path / 'lib' / 'a' / 'one.cbz'}: 3 pages"]
+
+
+def test_cli_extract(tmp_path):
+    pth = make_book(tmp_path / "book.cbz", 3)
+
+    assert main(["extract", str(pth), "-o", str(tmp_path / "out"), "-p", "2-3"]) == 0
+    with ZipFile(pth) as cbz:
+        orig = [cbz.read(name) for name in sorted(cbz.namelist())]
+
+    out_dir = tmp_path / "out" / "book"
+    assert sorted(p.name for p in out_dir.iterdir()) == ["page0001.jpg", "page0002.jpg"]
+    assert (out_dir / "page0002.jpg").read_bytes() == orig[2]
+
+
+def test_cli_edits_books_in_parallel(tmp_path):
+    books = [make_book(tmp_path / f"book{i}.cbz", 4) for i in range(3)]
+
+    assert main(["--jobs", "2", "delete-pages", "-p", "1,-1"] + [str(pth) for pth in books]) == 0
+    for pth in books:
+        with ZipFile(pth) as cbz:
+            assert cbz.namelist() == ["page0000.jpg", "page0001.jpg"]
+
+    assert main(["rotate", "-p", "1", str(books[0]), "-o", str(tmp_path / "rot.cbz")]) == 0
+    assert main(["verify", str(tmp_path / "rot.cbz")]) == 0
+
+
+def test_cli_reports_bad_books(tmp_path, capsys):
+    pth = tmp_path / "bad.cbz"
+    pth.write_bytes(b"not a zip")
+
+    assert main(["verify", str(pth), str(make_book(tmp_path / "book.cbz", 2))]) == 1
+    out, err = capsys.readouterr()
+    assert err.startswith(f"{pth}: ")
+    assert "OK" in out
+
+
+def test_cli_does_not_import_qt(tmp_path):
+    pth = make_book(tmp_path / "book.cbz", 2)
+    code = ("import sys; from cbzreader.cli import main; main(['verify', sys.argv[1]]); "
+            "assert 'PyQt5' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code, str(pth)], check=True)
@@ -0,0 +1,45 @@
+import os
+
+from cbzreader.dir_listing import DirListing
+
+
+def touch(pth):
+    pth.write_bytes(b"")
+    return pth
+
+
+def age_dir(pth, nb_s=10):
+    stat = pth.stat()
+    os.utime(pth, ns=(stat.st_atime_ns, stat.st_mtime_ns - nb_s * 10 ** 9))
+
+
+def test_dir_listing_finds_neighbours(tmp_path):
+    for name in ("b.cbz", "a.cbz", "d.cbz", "c.txt", ".hidden.cbz"):
+        touch(tmp_path / name)
+
+    listing = DirListing()
+    assert listing.books(tmp_path) == [tmp_path / "a.cbz", tmp_path / "b.cbz", tmp_path / "d.cbz"]
+    assert listing.neighbours(tmp_path / "a.cbz") == (None, tmp_path / "b.cbz")
+    assert listing.neighbours(tmp_path / "b.cbz") == (tmp_path / "a.cbz", tmp_path / "d.cbz")
+    assert listing.neighbours(tmp_path / "c.cbz") == (tmp_path / "b.cbz", tmp_path / "d.cbz")
+    assert listing.neighbours(tmp_path / "d.cbz") == (tmp_path / "b.cbz", None)
+
+
+def test_dir_listing_reuses_listing_until_dir_changes(tmp_path):
+    touch(tmp_path / "a.cbz")
+    age_dir(tmp_path)
+
+    listing = DirListing()
+    books = listing.books(tmp_path)
+    assert listing.books(tmp_path) is books
+
+    touch(tmp_path / "b.cbz")
+    assert listing.books(tmp_path) == [tmp_path / "a.cbz", tmp_path / "b.cbz"]
+
+
+def test_dir_listing_does_not_trust_recent_changes(tmp_path):
+    touch(tmp_path / "a.cbz")
+
+    listing = DirListing()
+    books = listing.books(tmp_path)
+    assert listing.books(tmp_path) is not books
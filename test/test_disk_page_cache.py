@@ -0,0 +1,116 @@
+from PIL import Image
+
+from cbzreader.disk_page_cache import DiskPageCache
+from cbzreader.explorer import Explorer
+from cbzreader.page_cache import PageCache
+from small_books import make_book
+
+
+def test_disk_page_cache_persists(tmp_path):
+    cache = DiskPageCache(tmp_path / "pages")
+    assert cache.get("a") is None
+
+    img = Image.new("RGB", (20, 30), (10, 20, 30))
+    cache.put("a", img, (20, 30))
+    cache.flush()
+    cache.close()
+
+    cache = DiskPageCache(tmp_path / "pages")
+    assert cache.nbytes() == 20 * 30 * 3
+    stored, full_size = cache.get("a")
+    assert full_size == (20, 30)
+    assert stored.mode == "RGB"
+    assert stored.tobytes() == img.tobytes()
+    cache.close()
+
+
+def test_disk_page_cache_serves_reduced_pages_for_small_displays(tmp_path):
+    cache = DiskPageCache(tmp_path / "pages")
+    cache.put("a", Image.new("RGB", (50, 100)), (200, 400))
+    cache.flush()
+
+    assert cache.get("a") is None  # full resolution needed
+    assert cache.get("a", (400, 400)) is None  # draft too small
+    stored, full_size = cache.get("a", (50, 50))
+    assert stored.size == (50, 100)
+    assert full_size == (200, 400)
+    cache.close()
+
+
+def test_disk_page_cache_evicts_least_recently_used(tmp_path):
+    nbytes = 10 * 10 * 3
+    cache = DiskPageCache(tmp_path / "pages", max_bytes=2 * nbytes)
+    for key in "abc":
+        cache.put(key, Image.new("RGB", (10, 10)), (10, 10))
+        cache.flush()
+
+    assert cache.nbytes() == 2 * nbytes
+    assert cache.get("a") is None
+    assert sorted(pth.name for pth in (tmp_path / "pages").glob("*.raw")) == ["b-10.raw", "c-10.raw"]
+    cache.close()
+
+
+def test_explorer_shares_decoded_pages_between_books(tmp_path, monkeypatch):
+    make_book(tmp_path / "a.cbz", 3)
+    (tmp_path / "b.cbz").write_bytes((tmp_path / "a.cbz").read_bytes())  # repack of same issue
+    disk_cache = DiskPageCache(tmp_path / "pages")
+
+    ex = Explorer(tmp_path / "a.cbz", cache=PageCache(0), disk_cache=disk_cache)
+    ref = ex.open_page(1).tobytes()
+    disk_cache.flush()
+
+    def no_decode(*args):
+        raise AssertionError("page decoded again")
+
+    monkeypatch.setattr(Image, "open", no_decode)
+    ex.set_book(tmp_path / "b.cbz")
+    assert ex.open_page(1).tobytes() == ref
+
+    monkeypatch.undo()  # edits start from the original page, not its display copy
+    ex.transpose(1)  # edited pages do not use the disk cache
+    assert ex.open_page(1).tobytes() != ref
+    ex.close()
+    disk_cache.close()
+
+
+def test_disk_page_cache_keeps_grayscale_and_skips_palette_pages(tmp_path):
+    cache = DiskPageCache(tmp_path / "pages")
+    cache.put("gray", Image.new("L", (20, 30), 80), (20, 30))
+    cache.put("pal", Image.new("P", (20, 30)), (20, 30))
+    cache.flush()
+
+    stored, _ = cache.get("gray")
+    assert stored.mode == "L"
+    assert cache.nbytes() == 20 * 30
+    assert cache.get("pal") is None
+    cache.close()
+
+
+def test_disk_page_cache_removes_pages_of_older_schema(tmp_path):
+    import sqlite3
+
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "a-10.raw").write_bytes(b"0" * 300)
+    db = sqlite3.connect(str(tmp_path / "pages" / "index.sqlite"))
+    db.execute("CREATE TABLE pages (key TEXT, width INTEGER, nbytes INTEGER)")
+    db.execute("INSERT INTO pages VALUES ('a', 10, 300)")
+    db.commit()
+    db.close()
+
+    cache = DiskPageCache(tmp_path / "pages")
+    assert cache.nbytes() == 0
+    assert list((tmp_path / "pages").glob("*.raw")) == []
+    cache.close()
+
+
+def test_disk_page_cache_budget_is_shared_by_readers(tmp_path):
+    nbytes = 10 * 10 * 3
+    caches = [DiskPageCache(tmp_path / "pages", max_bytes=2 * nbytes) for _ in range(2)]
+    for cache, key in zip(caches + caches[:1], "abc"):
+        cache.put(key, Image.new("RGB", (10, 10)), (10, 10))
+        cache.flush()
+
+    assert caches[1].nbytes() == 2 * nbytes
+    assert sorted(pth.name for pth in (tmp_path / "pages").glob("*.raw")) == ["b-10.raw", "c-10.raw"]
+    for cache in caches:
+        cache.close()
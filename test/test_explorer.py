@@ -0,0 +1,384 @@
+from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import pytest
+from PIL import Image
+
+from cbzreader.explorer import Explorer
+from small_books import make_book, make_page, mark_first_page_encrypted
+
+
+@pytest.fixture()
+def book(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return make_book(tmp_path / "book.cbz", 5)
+
+
+def test_explorer_open_book(book):
+    ex = Explorer(book)
+    assert ex.current_book() == book
+    assert ex.page_number() == 5
+
+    ex.close()
+    assert ex.current_book() is None
+
+
+def test_explorer_keeps_archive_open_between_pages(book):
+    ex = Explorer(book)
+    cbz = ex._cbz
+    for i in range(ex.page_number()):
+        img = ex.open_page(i)
+        assert img.size == (60, 80)
+
+    assert ex._cbz is cbz
+
+    ex.close_book()
+    assert ex._cbz is None
+    assert cbz.fp is None
+    ex.close()
+
+
+def test_explorer_page_data_is_thread_safe(book):
+    from concurrent.futures import ThreadPoolExecutor
+
+    ex = Explorer(book)
+    with ThreadPoolExecutor(4) as pool:
+        datas = list(pool.map(ex.page_data, [i % 5 for i in range(40)]))
+
+    assert len(set(datas)) == 5
+    ex.close()
+
+
+def test_explorer_does_not_write_in_working_dir(book):
+    ex = Explorer(book)
+    for i in range(ex.page_number()):
+        ex.open_page(i)
+    ex.transpose(2)
+    ex.close()
+
+    assert list(book.parent.iterdir()) == [book]
+
+
+def test_explorer_open_page_uses_cache(book):
+    ex = Explorer(book)
+    img = ex.open_page(1)
+    assert ex.open_page(1) is img
+    assert ex.cache().stats()["hits"] == 1
+
+    ex.transpose(1)
+    assert ex.open_page(1) is not img
+
+    ex.close_book()
+    ex.set_book(book)
+    assert ex.open_page(1).getpixel((0, 0)) == img.getpixel((0, 0))
+    ex.close()
+
+
+def test_explorer_serves_stored_pages_from_memory_map(tmp_path):
+    from cbzreader.member_io import MemoryFile
+
+    pth = make_book(tmp_path / "stored.cbz", 3, compression=ZIP_STORED)
+    ex = Explorer(pth)
+    assert isinstance(ex._page_file(1), MemoryFile)
+
+    img = ex.open_page(1)
+    assert img.size == (60, 80)
+    assert img.tobytes() == Image.open(BytesIO(ex.page_data(1))).convert("RGB").tobytes()
+
+    ex.close()  # release views before unmapping archive
+    assert ex._cbz_map is None
+
+
+def test_explorer_serves_deflated_pages_from_memory(book):
+    ex = Explorer(book)
+    assert isinstance(ex._page_file(1), BytesIO)
+    ex.close()
+
+
+def test_explorer_counts_each_page_lookup_once(tmp_path):
+    pth = make_book(tmp_path / "big.cbz", 2, size=(800, 1200))
+    ex = Explorer(pth)
+
+    def counts():
+        stats = ex.cache().stats()
+        return stats["hits"], stats["misses"]
+
+    assert ex.cached_page(0, size=(300, 300), count=False) is None
+    assert counts() == (0, 0)
+    ex.open_page(0, size=(300, 300))  # decoded as draft
+    assert counts() == (0, 1)
+    ex.open_page(0, size=(300, 300))  # draft found after full resolution missed
+    assert counts() == (1, 1)
+    assert ex.cached_page(0, size=(400, 600)) is None  # draft too small
+    assert counts() == (1, 2)
+    ex.close()
+
+
+def test_explorer_decodes_jpeg_at_reduced_scale(tmp_path):
+    pth = make_book(tmp_path / "big.cbz", 2, size=(800, 1200))
+    ex = Explorer(pth)
+
+    img = ex.open_page(0, size=(300, 300))
+    assert img.size == (200, 300)
+    assert ex.page_size(0) == (800, 1200)
+    assert ex.cached_page(0, size=(150, 200)) is img
+    assert ex.cached_page(0, size=(400, 600)) is None
+    assert ex.cached_page(0) is None
+
+    assert ex.open_page(0).size == (800, 1200)
+    assert ex.open_page(0, size=(150, 200)).size == (800, 1200)
+    ex.close()
+
+
+def test_explorer_page_size_reads_header_only(tmp_path):
+    pth = make_book(tmp_path / "big.cbz", 2, size=(800, 1200), fmt="png")
+    ex = Explorer(pth)
+
+    assert ex.page_size(1) == (800, 1200)
+    assert len(ex.cache()) == 0
+    ex.close()
+
+
+def test_explorer_reopens_known_book_without_parsing_archive(tmp_path):
+    from cbzreader.book_index import BookIndex
+
+    index = BookIndex(tmp_path / "index.sqlite")
+    pth = make_book(tmp_path / "book.cbz", 4)
+    ex = Explorer(pth, index=index)
+    pages = list(ex._pages)
+    img = ex.open_page(2)
+    ex.close_book()
+
+    ex = Explorer(pth, index=index)
+    assert ex._cbz is None
+    assert ex._pages == pages
+    assert ex.page_size(2) == (60, 80)
+    assert ex.page_data(2) == ZipFile(pth).read(pages[2])
+    assert ex.open_page(2).tobytes() == img.tobytes()
+    assert ex._cbz is None
+
+    ex.save_book(tmp_path / "copy.cbz")
+    with ZipFile(pth) as src, ZipFile(tmp_path / "copy.cbz") as cbz:
+        assert [info.date_time for info in cbz.infolist()] == [info.date_time for info in src.infolist()]
+    ex.close()
+    index.close()
+
+
+def test_explorer_sibling_books(tmp_path):
+    for name in ("a", "b", "c"):
+        make_book(tmp_path / f"{name}.cbz", 1)
+
+    ex = Explorer(tmp_path / "b.cbz")
+    ex.prefetch_siblings()
+    assert ex.prev_book() == tmp_path / "a.cbz"
+    assert ex.next_book() == tmp_path / "c.cbz"
+
+    ex.set_book(tmp_path / "c.cbz")
+    with pytest.raises(IndexError):
+        ex.next_book()
+    ex.close()
+
+
+def test_explorer_takes_over_preopened_book(tmp_path):
+    make_book(tmp_path / "a.cbz", 3)
+    make_book(tmp_path / "b.cbz", 3)
+
+    ex = Explorer(tmp_path / "a.cbz")
+    ex.preopen_book(tmp_path / "b.cbz")
+    _, pre_ex, th = ex._preopened
+    th.join()
+    cbz = pre_ex._cbz
+
+    ex.set_book(tmp_path / "b.cbz")
+    assert ex._preopened is None
+    assert ex._cbz is cbz
+    assert ex.cached_page(0) is not None
+    assert ex.cached_page(1) is not None
+    assert ex.cached_page(2) is None
+    assert ex.open_page(2).size == (60, 80)
+    ex.close()
+
+
+def test_explorer_closes_preopened_book_not_used(tmp_path):
+    for name in ("a", "b", "c"):
+        make_book(tmp_path / f"{name}.cbz", 1)
+
+    ex = Explorer(tmp_path / "a.cbz")
+    ex.preopen_book(tmp_path / "b.cbz")
+    pre_ex = ex._preopened[1]
+
+    ex.set_book(tmp_path / "c.cbz")
+    assert ex._preopened is None
+    assert pre_ex.current_book() is None
+    ex.close()
+
+
+@pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_STORED])
+def test_explorer_save_copies_untouched_pages(tmp_path, monkeypatch, compression):
+    monkeypatch.chdir(tmp_path)
+    pth = make_book(tmp_path / "book.cbz", 4, fmt="png", compression=compression)
+    with ZipFile(pth) as cbz:
+        orig = [cbz.read(name) for name in sorted(cbz.namelist())]
+
+    ex = Explorer(pth)
+    ex.delete_page(0)
+    ex.transpose(1)
+    ex.save_book(tmp_path / "new.cbz")
+    ex.close()
+
+    with ZipFile(tmp_path / "new.cbz") as cbz:
+        assert cbz.testzip() is None
+        assert cbz.namelist() == ["page0000.png", "page0001.png", "page0002.png"]
+        assert cbz.read("page0000.png") == orig[1]
+        assert cbz.read("page0002.png") == orig[3]
+        assert cbz.getinfo("page0002.png").compress_type == compression
+
+        img = Image.open(BytesIO(cbz.read("page0001.png")))
+        ref = Image.open(BytesIO(orig[2])).transpose(Image.ROTATE_180)
+        assert img.tobytes() == ref.tobytes()
+
+
+def test_explorer_refuses_to_save_encrypted_pages(tmp_path):
+    pth = mark_first_page_encrypted(make_book(tmp_path / "book.cbz", 3))
+    data = pth.read_bytes()
+
+    ex = Explorer(pth)
+    ex.transpose(1)
+    with pytest.raises(OSError):
+        ex.snapshot()
+    with pytest.raises(OSError):
+        ex.save_book(pth)
+    ex.close()
+
+    assert pth.read_bytes() == data
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["book.cbz"]
+
+
+def test_save_book_encodes_edited_pages_in_workers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pth = make_book(tmp_path / "book.cbz", 6, fmt="png")
+    with ZipFile(pth) as cbz:
+        orig = [cbz.read(name) for name in sorted(cbz.namelist())]
+
+    ex = Explorer(pth)
+    for i in range(5):
+        ex.transpose(i)
+
+    steps = []
+    ex.save_book(tmp_path / "new.cbz", progress=lambda nb, total: steps.append((nb, total)), nb_workers=2)
+    ex.close()
+
+    assert steps == [(i + 1, 6) for i in range(6)]
+    with ZipFile(tmp_path / "new.cbz") as cbz:
+        assert cbz.testzip() is None
+        assert cbz.namelist() == [f"page{i:04d}.png" for i in range(6)]
+        assert cbz.read("page0005.png") == orig[5]
+        for i in range(5):
+            img = Image.open(BytesIO(cbz.read(f"page{i:04d}.png")))
+            ref = Image.open(BytesIO(orig[i])).transpose(Image.ROTATE_180)
+            assert img.tobytes() == ref.tobytes()
+
+
+def test_explorer_thumbnail_uses_draft_and_key_ignores_edited_pages(tmp_path):
+    pth = make_book(tmp_path / "book.cbz", 3, size=(400, 600))
+    ex = Explorer(pth)
+
+    img = ex.thumbnail(0, (40, 60))
+    assert img.mode == "RGB"
+    assert img.size == (40, 60)
+    assert ex.cache().get((pth, ex.page_name(0))) is None
+
+    key = ex.page_key(1)
+    assert key is not None
+    assert key != ex.page_key(0) or ex.page_data(0) == ex.page_data(1)
+
+    ex.transpose(1)
+    assert ex.page_key(1) is None
+    assert ex.thumbnail(1, (40, 60)).size == (40, 60)
+    ex.close()
+
+
+@pytest.mark.parametrize("fmt, mode, expected", [("jpeg", "L", "L"), ("gif", "P", "P"), ("png", "RGBA", "RGBA"),
+                                                 ("jpeg", "CMYK", "RGB")])
+def test_explorer_keeps_displayable_modes(tmp_path, fmt, mode, expected):
+    pth = make_book(tmp_path / "book.cbz", 2, size=(40, 60), fmt=fmt, mode=mode)
+    ex = Explorer(pth)
+
+    img = ex.open_page(0)
+    assert img.mode == expected
+    assert img.tobytes() == Image.open(BytesIO(ex.page_data(0))).convert(expected).tobytes()
+    assert ex.thumbnail(0, (20, 30)).mode in ("L", "RGB")
+
+    ex.transpose(1)
+    out = tmp_path / "out.cbz"
+    ex.save_book(out, nb_workers=1)
+    ex.close()
+    with ZipFile(out) as cbz:
+        assert Image.open(BytesIO(cbz.read(cbz.namelist()[1]))).size == (40, 60)
+
+
+def test_explorer_stores_gray_color_pages_on_one_channel(tmp_path):
+    pth = tmp_path / "book.cbz"
+    with ZipFile(pth, 'w') as cbz:
+        for i, color in enumerate([False, True]):
+            img = make_page(i, (200, 300))
+            if not color:
+                img = img.convert("L").convert("RGB")  # gray scan stored in color
+
+            data = BytesIO()
+            img.save(data, "JPEG")
+            cbz.writestr(f"p{i:d}.jpg", data.getvalue())
+
+    ex = Explorer(pth)
+    gray = ex.open_page(0)
+    assert gray.mode == "L"
+    assert ex.cache().nbytes() == 200 * 300
+    ref = Image.open(BytesIO(ex.page_data(0))).convert("L")
+    assert max(abs(a - b) for a, b in zip(gray.tobytes(), ref.tobytes())) <= 1
+    assert ex.open_page(1).mode == "RGB"
+    ex.close()
+
+
+def test_explorer_keeps_edits_if_book_can_not_be_replaced(tmp_path, monkeypatch):
+    pth = make_book(tmp_path / "book.cbz", 3)
+    ex = Explorer(pth)
+    ex.delete_page(0)
+    ex.transpose(0)
+    edited = ex.open_page(0).tobytes()
+
+    def refuse(tmp_pth, pth):
+        raise PermissionError("read only")
+
+    monkeypatch.setattr("cbzreader.explorer.replace_book", refuse)
+    with pytest.raises(PermissionError):
+        ex.save_book(pth)
+
+    assert ex.current_book() == pth
+    assert ex.page_number() == 2
+    assert ex.open_page(0).tobytes() == edited
+    assert ex.page_data(1) == ZipFile(pth).read("p00002.jpg")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["book.cbz"]
+    ex.close()
+
+
+def test_explorer_edits_keep_color_missed_by_gray_check(tmp_path):
+    img = Image.new("RGB", (1200, 1800), (200, 200, 200))
+    img.paste((255, 0, 0), (11, 16, 27, 32))  # between pixels sampled by is_grayscale
+    data = BytesIO()
+    img.save(data, "PNG")
+    pth = tmp_path / "book.cbz"
+    with ZipFile(pth, 'w') as cbz:
+        cbz.writestr("p0.png", data.getvalue())
+
+    ex = Explorer(pth)
+    assert ex.open_page(0).mode == "L"  # display copy only
+
+    ex.transpose(0)
+    assert ex.open_page(0).mode == "RGB"
+    ex.save_book(pth)
+    ex.close()
+
+    with ZipFile(pth) as cbz:
+        saved = Image.open(BytesIO(cbz.read(cbz.namelist()[0])))
+        assert saved.mode == "RGB"
+        assert saved.getpixel((1200 - 1 - 15, 1800 - 1 - 20)) == (255, 0, 0)
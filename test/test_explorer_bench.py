@@ -0,0 +1,42 @@
+from time import perf_counter
+
+import pytest
+
+from cbzreader.explorer import Explorer
+from small_books import make_book
+
+
+def page_latency(pth, nb_turns=50):
+    """Mean time to read a page from archive.
+
+    Args:
+        pth (Path): path to book
+        nb_turns (int): number of pages to read
+
+    Returns:
+        (float): time in seconds
+    """
+    ex = Explorer(pth)
+    nb_turns = min(nb_turns, ex.page_number())
+
+    t0 = perf_counter()
+    for i in range(nb_turns):
+        ex.page_data(i)
+    dt = (perf_counter() - t0) / nb_turns
+
+    ex.close()
+    return dt
+
+
+@pytest.mark.slow
+def test_bench_page_latency_against_page_number(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    latencies = {}
+    for nb in (10, 100, 1000):
+        pth = make_book(tmp_path / f"book{nb:04d}.cbz", nb, size=(8, 8))
+        latencies[nb] = page_latency(pth)
+        print(f"{nb:5d} pages: {latencies[nb] * 1e3:.3f} ms/page")
+
+    # central directory is parsed once per book, not once per page
+    assert latencies[1000] < latencies[10] * 10
@@ -0,0 +1,101 @@
+import pytest
+from PIL import Image
+from PyQt5.QtGui import QImage
+
+from cbzreader.image_view import ImageView, pil_to_qimage
+
+
+def test_image_view_reuses_scaled_pixmaps(qapp):
+    view = ImageView()
+    view.resize(200, 300)
+    view.resize_settled()
+    view.set_image(Image.new("RGB", (400, 600)))
+    pix = view.pixmap()
+    qimg = view._qimg
+
+    view.update_pixmap()
+    assert view.pixmap().cacheKey() == pix.cacheKey()
+    assert view._qimg is qimg
+
+    view.rotate()
+    assert view._qimg is not qimg
+    assert len(view._pix_cache) == 2
+
+
+def test_image_view_pixmaps_do_not_keep_images_alive(qapp):
+    import gc
+    import weakref
+
+    view = ImageView()
+    view.resize(200, 300)
+    view.resize_settled()
+    img = Image.new("RGB", (400, 600))
+    ref = weakref.ref(img)
+    view.set_image(img)
+    view.set_image(Image.new("RGB", (400, 600), (255, 0, 0)))
+    del img
+    gc.collect()
+    assert ref() is None
+    assert len(view._pix_cache) == 2
+
+    for _ in range(3):  # another image might get the id of the dead one
+        view.set_image(Image.new("RGB", (400, 600), (0, 255, 0)))
+        assert view.pixmap().toImage().pixelColor(10, 10).green() == 255
+
+
+def test_image_view_defers_smooth_rescale_until_resize_settles(qapp):
+    view = ImageView()
+    view.set_transfo(None)
+    view.set_image(Image.new("RGB", (400, 600)))
+    view.show()
+
+    view.resize(100, 150)
+    assert view._resizing
+    sizes = [(size, smooth) for _, _, size, smooth in view._pix_cache]
+    assert ((100, 150), False) in sizes
+    assert ((100, 150), True) not in sizes
+
+    view.resize_settled()
+    assert not view._resizing
+    assert view.pixmap().size().width() == 100
+    sizes = [(size, smooth) for _, _, size, smooth in view._pix_cache]
+    assert ((100, 150), True) in sizes
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L", "P", "RGBA", "CMYK", "1"])
+def test_pil_to_qimage_preserves_pixels(qapp, mode):
+    img = Image.new("RGB", (7, 5), (10, 20, 30))  # odd width to check stride
+    img.putpixel((6, 4), (200, 100, 50))
+    img = img.convert(mode)
+    qimg = pil_to_qimage(img)
+
+    assert (qimg.width(), qimg.height()) == (7, 5)
+    rgb = img.convert("RGB")
+    for x, y in [(0, 0), (6, 4), (3, 2)]:
+        col = qimg.pixelColor(x, y)
+        assert (col.red(), col.green(), col.blue()) == rgb.getpixel((x, y))
+
+
+def test_pil_to_qimage_keeps_grayscale_pages_on_one_byte(qapp):
+    img = Image.new("L", (7, 5), 120)
+    qimg = pil_to_qimage(img)
+
+    assert qimg.format() == QImage.Format_Grayscale8
+    assert qimg.pixelColor(3, 2).red() == 120
+
+
+def test_image_view_ends_startup_profile_once_page_is_painted(qapp, wait_for, tmp_path):
+    from cbzreader import startup_profile
+
+    startup_profile.enable(tmp_path / "trace.json")
+    try:
+        view = ImageView()
+        view.resize(200, 300)
+        view.set_image(Image.new("RGB", (400, 600)))
+        assert startup_profile.recording()
+
+        view.show()
+        wait_for(lambda: not startup_profile.recording())
+        assert (tmp_path / "trace.json").exists()
+    finally:
+        startup_profile.finish()
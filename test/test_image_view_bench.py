@@ -0,0 +1,38 @@
+from time import perf_counter
+
+import pytest
+from PIL import Image
+from PIL.ImageQt import ImageQt
+from PyQt5.QtGui import QPixmap
+
+from cbzreader.image_view import pil_to_qimage
+from small_books import page_sizes
+
+
+def conversion_time(convert, img, nb=5):
+    """Mean time to display image as a pixmap.
+
+    Args:
+        convert (callable): function that converts PIL image into QImage
+        img (Image): image to convert
+        nb (int): number of repetitions
+
+    Returns:
+        (float): time in seconds
+    """
+    t0 = perf_counter()
+    for _ in range(nb):
+        QPixmap.fromImage(convert(img))
+
+    return (perf_counter() - t0) / nb
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("size_name", sorted(page_sizes))
+def test_bench_pil_to_qimage_against_image_qt(qapp, size_name):
+    img = Image.new("RGB", page_sizes[size_name], (10, 20, 30))
+    t_ref = conversion_time(ImageQt, img)
+    t_new = conversion_time(pil_to_qimage, img)
+    print(f"{size_name}: ImageQt {t_ref * 1e3:.1f} ms, pil_to_qimage {t_new * 1e3:.1f} ms")
+
+    assert t_new < t_ref
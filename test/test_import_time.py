@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+import pytest
+
+core_modules = ["cbzreader.explorer", "cbzreader.cli", "cbzreader.library", "cbzreader.book_index",
+                "cbzreader.dir_listing", "cbzreader.atomic_save"]
+
+import_budget = 0.1
+"""(float) Maximal time in seconds to import cbzreader.explorer."""
+
+
+def imported_modules(module):
+    """Modules loaded by importing a module in a fresh interpreter.
+
+    Args:
+        module (str): name of module to import
+
+    Returns:
+        (set of str)
+    """
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return set(out.split())
+
+
+def import_time(module, nb_runs=5):
+    """Best cumulative import time of a module in a fresh interpreter.
+
+    Args:
+        module (str): name of module to import
+        nb_runs (int): number of interpreters started
+
+    Returns:
+        (float): time in seconds
+    """
+    times = []
+    for _ in range(nb_runs):
+        err = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                             check=True, capture_output=True, text=True).stderr
+        line, = [line for line in err.splitlines() if line.endswith(f"| {module}")]
+        times.append(int(line.split("|")[1]) * 1e-6)
+
+    return min(times)
+
+
+@pytest.mark.parametrize("module", core_modules)
+def test_core_modules_do_not_import_gui(module):
+    modules = imported_modules(module)
+    assert "PyQt5" not in modules
+
+
+@pytest.mark.slow
+def test_bench_explorer_import_time():
+    dt = import_time("cbzreader.explorer")
+    print(f"import cbzreader.explorer: {dt * 1e3:.1f} ms")
+    assert dt < import_budget
@@ -0,0 +1,85 @@
+import os
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from cbzreader.library import Library
+from small_books import make_book
+
+
+def test_library_scan_finds_books_in_nested_dirs(tmp_path):
+    root = tmp_path / "lib"
+    (root / "a" / "b").mkdir(parents=True)
+    make_book(root / "top.cbz", 2)
+    make_book(root / "a" / "b" / "deep_one.cbz", 3, size=(300, 450))
+
+    lib = Library(tmp_path / "lib.sqlite")
+    assert lib.scan(root) == 2
+    assert lib.books() == [(root / "a" / "b" / "deep_one.cbz", 3), (root / "top.cbz", 2)]
+    assert lib.search("DEEP") == [(root / "a" / "b" / "deep_one.cbz", 3)]
+    assert lib.books(root / "a") == [(root / "a" / "b" / "deep_one.cbz", 3)]
+
+    thumb = Image.open(BytesIO(lib.thumbnail(root / "a" / "b" / "deep_one.cbz")))
+    assert thumb.size == (160, 240)
+    lib.close()
+
+
+def test_library_scan_is_incremental(tmp_path):
+    root = tmp_path / "lib"
+    (root / "a").mkdir(parents=True)
+    (root / "b").mkdir(parents=True)
+    make_book(root / "a" / "one.cbz", 2)
+    make_book(root / "b" / "two.cbz", 2)
+
+    lib = Library(tmp_path / "lib.sqlite")
+    lib.scan(root)
+    assert lib.scan(root) == 0
+
+    make_book(root / "b" / "three.cbz", 2)
+    (root / "a" / "one.cbz").unlink()
+    (root / "a").rmdir()
+    assert lib.scan(root) == 1
+    assert [pth.name for pth, _ in lib.books()] == ["three.cbz", "two.cbz"]
+    lib.close()
+
+
+def test_library_scan_rescans_dirs_listed_right_after_a_change(tmp_path):
+    root = tmp_path / "lib"
+    root.mkdir()
+    make_book(root / "one.cbz", 2)
+
+    lib = Library(tmp_path / "lib.sqlite")
+    lib.scan(root)
+
+    stat = root.stat()
+    make_book(root / "two.cbz", 2)
+    os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # coarse timestamps hide the change
+    assert lib.scan(root) == 1
+    assert [pth.name for pth, _ in lib.books()] == ["one.cbz", "two.cbz"]
+    lib.close()
+
+
+def test_library_scan_does_not_follow_symlinked_dirs(tmp_path):
+    root = tmp_path / "lib"
+    (root / "a").mkdir(parents=True)
+    make_book(root / "a" / "one.cbz", 2)
+    (root / "a" / "loop").symlink_to(root)
+
+    lib = Library(tmp_path / "lib.sqlite")
+    assert lib.scan(root) == 1
+    assert lib.books() == [(root / "a" / "one.cbz", 2)]
+    lib.close()
+
+
+@pytest.mark.parametrize("fmt, mode", [("gif", "P"), ("png", "RGBA"), ("jpeg", "L")])
+def test_library_indexes_books_whatever_the_mode_of_pages(tmp_path, fmt, mode):
+    root = tmp_path / "lib"
+    root.mkdir()
+    make_book(root / "book.cbz", 2, size=(300, 450), fmt=fmt, mode=mode)
+
+    lib = Library(tmp_path / "lib.sqlite")
+    lib.scan(root)
+    assert lib.books() == [(root / "book.cbz", 2)]
+    assert Image.open(BytesIO(lib.thumbnail(root / "book.cbz"))).size == (160, 240)
+    lib.close()
@@ -0,0 +1,66 @@
+from io import BytesIO, SEEK_END
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import pytest
+
+from cbzreader.member_io import MemoryFile, read_raw_member, stored_member_view, write_raw_member
+
+
+def make_zip(compression):
+    buf = BytesIO()
+    with ZipFile(buf, 'w', compression) as zf:
+        zf.writestr("a.txt", b"first member")
+        zf.writestr("b.txt", b"second member" * 10)
+
+    return buf.getvalue()
+
+
+def test_stored_member_view_finds_member_data():
+    data = make_zip(ZIP_STORED)
+    with ZipFile(BytesIO(data)) as zf:
+        for name in ("a.txt", "b.txt"):
+            view = stored_member_view(data, zf.getinfo(name))
+            assert view.tobytes() == zf.read(name)
+
+
+def test_stored_member_view_ignores_compressed_members():
+    data = make_zip(ZIP_DEFLATED)
+    with ZipFile(BytesIO(data)) as zf:
+        assert stored_member_view(data, zf.getinfo("b.txt")) is None
+
+
+def test_memory_file_behaves_like_a_file():
+    fhr = MemoryFile(memoryview(b"0123456789"))
+    assert fhr.read(3) == b"012"
+    assert fhr.tell() == 3
+    fhr.seek(-2, SEEK_END)
+    assert fhr.read() == b"89"
+    assert fhr.read(5) == b""
+
+    fhr.close()
+    assert fhr.closed
+
+
+def test_zipfile_internals_used_by_write_raw_member_still_exist():
+    zf = ZipFile(BytesIO(), 'w')
+    for attr in ("_lock", "_writecheck", "_didModify", "_writing", "start_dir", "fp", "filelist", "NameToInfo"):
+        assert hasattr(zf, attr), f"ZipFile.{attr} is gone, write_raw_member must be updated"
+    zf.close()
+
+
+def test_write_raw_member_copies_compressed_data():
+    src = BytesIO()
+    with ZipFile(src, 'w', ZIP_DEFLATED) as zf:
+        zf.writestr("a.txt", b"abc" * 100)
+
+    dst = BytesIO()
+    with ZipFile(src) as zfr, ZipFile(dst, 'w') as zfw:
+        info = zfr.getinfo("a.txt")
+        write_raw_member(zfw, info, "b.txt", read_raw_member(zfr.fp, info))
+        with zfw.open("c.txt", 'w'):
+            with pytest.raises(AssertionError):
+                write_raw_member(zfw, info, "d.txt", b"")
+
+    with ZipFile(dst) as zf:
+        assert zf.testzip() is None
+        assert zf.read("b.txt") == b"abc" * 100
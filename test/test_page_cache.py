@@ -0,0 +1,62 @@
+from PIL import Image
+
+from cbzreader.page_cache import PageCache, image_nbytes
+
+
+def test_image_nbytes_depends_on_mode():
+    assert image_nbytes(Image.new("RGB", (10, 20))) == 600
+    assert image_nbytes(Image.new("L", (10, 20))) == 200
+
+
+def test_page_cache_evicts_by_bytes():
+    cache = PageCache(max_bytes=1000)
+    cache.put("a", Image.new("RGB", (10, 20)))
+    cache.put("b", Image.new("RGB", (10, 20)))
+    assert cache.nbytes() == 1200 - 600
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+    cache.put("c", Image.new("L", (10, 20)))
+    assert len(cache) == 2
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_page_cache_peek_is_not_counted():
+    cache = PageCache(max_bytes=1000)
+    cache.put("a", Image.new("L", (10, 20)))
+    cache.put("b", Image.new("L", (10, 20)))
+    assert cache.peek("a") is not None
+    assert cache.peek("c") is None
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["misses"] == 0
+
+    cache.put("c", Image.new("L", (10, 70)))  # peek did not mark "a" as recently used
+    assert "a" not in cache
+    assert "b" in cache
+
+
+def test_page_cache_keeps_recently_used():
+    cache = PageCache(max_bytes=1000)
+    cache.put("a", Image.new("L", (10, 30)))
+    cache.put("b", Image.new("L", (10, 30)))
+    cache.get("a")
+    cache.put("c", Image.new("L", (10, 30)))
+    cache.put("d", Image.new("L", (10, 30)))
+
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_page_cache_set_max_bytes_evicts():
+    cache = PageCache()
+    for i in range(5):
+        cache.put(i, Image.new("L", (10, 10)))
+
+    cache.set_max_bytes(250)
+    assert len(cache) == 2
+    assert 4 in cache
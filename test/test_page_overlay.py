@@ -0,0 +1,32 @@
+from PIL import Image
+
+from cbzreader.page_overlay import PageOverlay
+
+
+def test_page_overlay_keeps_small_pages_in_memory():
+    overlay = PageOverlay()
+    img = Image.new("RGB", (10, 10))
+    overlay.put("a.jpg", img)
+
+    assert "a.jpg" in overlay
+    assert overlay.get("a.jpg") is img
+    assert overlay.get("b.jpg") is None
+    assert overlay._spill_dir is None
+
+
+def test_page_overlay_spills_on_disk_when_budget_exceeded():
+    overlay = PageOverlay(max_bytes=400)
+    overlay.put("a.jpg", Image.new("RGB", (10, 10), (1, 2, 3)))
+    overlay.put("b.jpg", Image.new("RGB", (10, 10), (4, 5, 6)))
+
+    spill_dir = overlay._spill_dir
+    assert spill_dir.exists()
+    assert overlay.names() == {"a.jpg", "b.jpg"}
+    assert overlay.get("b.jpg").getpixel((0, 0)) == (4, 5, 6)
+
+    overlay.discard("b.jpg")
+    assert "b.jpg" not in overlay
+
+    overlay.clear()
+    assert len(overlay) == 0
+    assert not spill_dir.exists()
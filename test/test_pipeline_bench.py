@@ -0,0 +1,213 @@
+"""
+Timings of each stage of a page turn, from opening a book to displaying a
+page, compared to baselines stored in bench_baselines.json.
+
+A stage fails if it becomes more than `regression_factor` times slower
+than its baseline. Record new baselines, e.g. on a new machine, with:
+
+    CBZREADER_BENCH_SAVE=1 pytest --runslow test/test_pipeline_bench.py
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+from time import perf_counter
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+from cbzreader.explorer import Explorer
+from cbzreader.image_view import ImageView
+from cbzreader.page_cache import PageCache
+from small_books import make_book, page_sizes
+
+baselines_pth = Path(__file__).parent / "bench_baselines.json"
+
+save_env_var = "CBZREADER_BENCH_SAVE"
+
+regression_factor = 2.
+"""(float) Slow down relative to baseline above which a stage fails."""
+
+regression_slack = 1e-3
+"""(float) Absolute slow down in seconds always tolerated, timer noise."""
+
+display_size = (1920, 1080)
+"""(int, int) Display area used when pages are opened for display."""
+
+nb_pages_axis = (10, 200, 2000)
+compressions = {"stored": ZIP_STORED, "deflated": ZIP_DEFLATED}
+formats = ("jpeg", "png", "gif")
+
+
+def best_time(func, setup=None, nb=5):
+    """Shortest duration of several calls, less noisy than their mean.
+
+    Args:
+        func (callable): function to time, called without arguments
+        setup (callable): function called before each call, not timed
+        nb (int): number of calls
+
+    Returns:
+        (float): time in seconds
+    """
+    best = None
+    for _ in range(nb):
+        if setup is not None:
+            setup()
+
+        t0 = perf_counter()
+        func()
+        dt = perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+
+    return best
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    try:
+        ref = json.loads(baselines_pth.read_text())
+    except FileNotFoundError:
+        ref = {}
+
+    measured = {}
+    yield ref, measured
+
+    if os.environ.get(save_env_var):
+        ref.update(measured)
+        baselines_pth.write_text(json.dumps(ref, indent=1, sort_keys=True) + "\n")
+
+
+@pytest.fixture
+def check_time(request, baselines):
+    """Compare duration of current benchmark to its baseline."""
+    ref, measured = baselines
+    name = request.node.name
+
+    def check(dt):
+        measured[name] = dt
+        print(f"{name}: {dt * 1e3:.2f} ms")
+        if os.environ.get(save_env_var) or name not in ref:
+            return
+
+        limit = ref[name] * regression_factor + regression_slack
+        assert dt <= limit, f"{name} took {dt * 1e3:.2f} ms, baseline {ref[name] * 1e3:.2f} ms"
+
+    return check
+
+
+@pytest.fixture(scope="module")
+def books(tmp_path_factory):
+    """Synthetic books, written once for the whole module."""
+    root = tmp_path_factory.mktemp("books")
+    made = {}
+
+    def book(nb_pages, compression="deflated", fmt="jpeg", size=(64, 96)):
+        key = (nb_pages, compression, fmt, size)
+        if key not in made:
+            dir_pth = root / f"{len(made):02d}"
+            dir_pth.mkdir()
+            made[key] = make_book(dir_pth / "book0.cbz", nb_pages, size=size, fmt=fmt,
+                                  compression=compressions[compression])
+
+        return made[key]
+
+    return book
+
+
+def uncached_explorer():
+    """Explorer that decodes pages each time they are opened.
+
+    Returns:
+        (Explorer)
+    """
+    return Explorer(cache=PageCache(max_bytes=0))
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("compression", sorted(compressions))
+@pytest.mark.parametrize("nb_pages", nb_pages_axis)
+def test_bench_set_book(books, check_time, nb_pages, compression):
+    pth = books(nb_pages, compression)
+    ex = uncached_explorer()
+
+    check_time(best_time(lambda: ex.set_book(pth), setup=ex.close_book))
+    ex.close()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("compression", sorted(compressions))
+@pytest.mark.parametrize("nb_pages", nb_pages_axis)
+def test_bench_page_data(books, check_time, nb_pages, compression):
+    ex = uncached_explorer()
+    ex.set_book(books(nb_pages, compression))
+    nb = min(ex.page_number(), 50)
+
+    def read_pages():
+        for i in range(nb):
+            ex.page_data(i)
+
+    check_time(best_time(read_pages) / nb)
+    ex.close()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("display", ["full", "screen"])
+@pytest.mark.parametrize("size_name", sorted(page_sizes))
+@pytest.mark.parametrize("fmt", formats)
+def test_bench_open_page(books, check_time, fmt, size_name, display):
+    ex = uncached_explorer()
+    ex.set_book(books(1, fmt=fmt, size=page_sizes[size_name]))
+    size = None if display == "full" else display_size
+
+    check_time(best_time(lambda: ex.open_page(0, size), nb=3))
+    ex.close()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("nb_pages", nb_pages_axis)
+def test_bench_save_book(books, check_time, tmp_path, nb_pages):
+    pth = books(nb_pages)
+    out = tmp_path / "out.cbz"
+    ex = uncached_explorer()
+
+    def edit():
+        ex.set_book(pth)
+        ex.transpose(0)
+
+    check_time(best_time(lambda: ex.save_book(out), setup=edit, nb=3))
+    ex.close()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("nb_pages", nb_pages_axis)
+def test_bench_next_book(books, check_time, nb_pages):
+    pth = books(nb_pages)
+    for i in (1, 2):
+        shutil.copy(pth, pth.with_name(f"book{i:d}.cbz"))
+
+    ex = uncached_explorer()
+
+    def turn():
+        ex.set_book(ex.next_book())
+        ex.open_page(0, display_size)
+
+    check_time(best_time(turn, setup=lambda: ex.set_book(pth)))
+    ex.close()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("size_name", sorted(page_sizes))
+@pytest.mark.parametrize("fmt", formats)
+def test_bench_update_pixmap(qapp, books, check_time, fmt, size_name):
+    ex = uncached_explorer()
+    ex.set_book(books(1, fmt=fmt, size=page_sizes[size_name]))
+    imgs = [ex.open_page(0), ex.open_page(0)]  # distinct images, no conversion reused
+    ex.close()
+
+    view = ImageView()
+    view.pix_cache_size = 0
+    view.resize(*display_size)
+    turns = iter(range(1000))
+
+    check_time(best_time(lambda: view.set_image(imgs[next(turns) % 2]), nb=4))
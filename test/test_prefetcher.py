@@ -0,0 +1,53 @@
+import pytest
+
+from cbzreader.explorer import Explorer
+from cbzreader.prefetcher import Prefetcher
+from small_books import make_book
+
+
+@pytest.fixture()
+def explorer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ex = Explorer(make_book(tmp_path / "book.cbz", 10))
+    yield ex
+    ex.close()
+
+
+def test_prefetcher_window_follows_direction(qapp, explorer):
+    pf = Prefetcher(explorer, nb_ahead=2, nb_behind=1)
+    assert pf.window(5, 1) == [5, 6, 7, 4]
+    assert pf.window(5, -1) == [5, 4, 3, 6]
+    assert pf.window(9, 1) == [9, 8]
+    pf.stop()
+
+
+def test_prefetcher_decodes_ahead_and_notifies(qapp, wait_for, explorer):
+    pf = Prefetcher(explorer, nb_ahead=2, nb_behind=1)
+    received = []
+    pf.page_ready.connect(lambda page, img: received.append((page, img)))
+
+    pf.schedule(3, 1, notify=True)
+    wait_for(lambda: len(received) > 0)
+    wait_for(lambda: explorer.cached_page(2) is not None)
+
+    page, img = received[0]
+    assert page == 3
+    assert img is explorer.cached_page(3)
+    assert explorer.cached_page(4) is not None
+    assert explorer.cached_page(2) is not None
+    pf.stop()
+
+
+def test_prefetcher_drops_stale_notifications(qapp, wait_for, explorer):
+    pf = Prefetcher(explorer)
+    received = []
+    pf.page_ready.connect(lambda page, img: received.append(page))
+
+    pf.schedule(0, notify=True)
+    pf.cancel()
+    pf.schedule(7, notify=True)
+    wait_for(lambda: 7 in received)
+    pf.stop()
+    qapp.processEvents()
+
+    assert received == [7]
@@ -0,0 +1,109 @@
+import pytest
+
+from small_books import make_book, mark_first_page_encrypted
+
+
+@pytest.fixture()
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("CBZREADER_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path
+
+
+def test_reader_keeps_book_open_if_save_can_not_replace_it(qapp, wait_for, home, monkeypatch):
+    from cbzreader.reader import Reader
+
+    warnings = []
+    monkeypatch.setattr("cbzreader.reader.QMessageBox.warning", lambda *args: warnings.append(args[2]))
+
+    def refuse(tmp_pth, pth):
+        raise PermissionError("read only")
+
+    monkeypatch.setattr("cbzreader.explorer.replace_book", refuse)
+
+    pth = make_book(home / "book.cbz", 4)
+    reader = Reader()
+    reader.load(pth)
+    reader.delete_current()
+    reader.save(pth)
+    wait_for(lambda: warnings)
+
+    assert "read only" in warnings[0]
+    assert reader._ex.current_book() == pth
+    assert reader._ex.page_number() == 3
+    assert reader._file_modified
+    assert reader.ui.action_save.isEnabled()
+    reader._file_modified = False  # no question on close
+    reader.close()
+
+
+def test_reader_opens_requested_book_instead_of_last_one(qapp, home, monkeypatch):
+    import pickle
+
+    from cbzreader.explorer import Explorer
+    from cbzreader.reader import Reader
+
+    last = make_book(home / "last.cbz", 2)
+    pth = make_book(home / "book.cbz", 3)
+    with open(home / ".cbz_reader.cfg", 'wb') as fhw:
+        pickle.dump({"last": (last, 1)}, fhw)
+
+    opened = []
+    set_book = Explorer.set_book
+    monkeypatch.setattr(Explorer, "set_book", lambda ex, book: opened.append(book) or set_book(ex, book))
+
+    reader = Reader(pth)
+    assert opened == [pth]
+    assert reader.windowTitle() == "book.cbz 1 / 3"
+    reader.close()
+
+
+def test_reader_decodes_first_page_at_restored_size(qapp, wait_for, home, monkeypatch):
+    from cbzreader.explorer import Explorer
+    from cbzreader.prefetcher import Prefetcher
+    from cbzreader.reader import Reader
+
+    reader = Reader()
+    reader.resize(1800, 2400)
+    reader.close()  # geometry stored for next session
+
+    opened = []
+    open_page = Explorer.open_page
+    monkeypatch.setattr(Explorer, "open_page",
+                        lambda ex, page, size=None: opened.append((page, size)) or open_page(ex, page, size))
+    scheduled = []
+    schedule = Prefetcher.schedule
+    monkeypatch.setattr(Prefetcher, "schedule",
+                        lambda pf, page, *args, **kwds: scheduled.append(kwds.get("size"))
+                        or schedule(pf, page, *args, **kwds))
+
+    reader = Reader(make_book(home / "book.cbz", 4))
+    assert scheduled == []  # no read ahead before size of view is known
+    reader.show()
+    wait_for(lambda: scheduled)
+
+    size = reader.ui.view_page.target_size()
+    assert max(size) > 2000
+    assert opened[0] == (0, size)
+    assert scheduled == [size]
+    reader.close()
+
+
+def test_reader_reports_books_it_can_not_save(qapp, home, monkeypatch):
+    from cbzreader.reader import Reader
+
+    warnings = []
+    monkeypatch.setattr("cbzreader.reader.QMessageBox.warning", lambda *args: warnings.append(args[2]))
+
+    pth = mark_first_page_encrypted(make_book(home / "book.cbz", 3))
+    reader = Reader()
+    reader.load(pth, 2)
+    reader.delete_current()
+    reader.save(pth)
+
+    assert "Encrypted" in warnings[0]
+    assert not reader._saver.busy()
+    assert reader.ui.action_save.isEnabled()
+    assert reader.ui.action_delete.isEnabled()
+    reader._file_modified = False  # no question on close
+    reader.close()
@@ -0,0 +1,22 @@
+from PyQt5.QtWidgets import QMainWindow
+
+from cbzreader.reader_ui import icon, icons_dir, setup_ui
+
+
+def test_icons_are_package_data(qapp):
+    names = sorted(pth.stem for pth in icons_dir.glob("*.png"))
+    assert "cbzreader" in names
+
+    for name in names:
+        assert not icon(name).isNull()
+
+
+def test_setup_ui_sets_icons_once_event_loop_runs(qapp):
+    mw = QMainWindow()
+    setup_ui(mw)
+    assert mw.ui.action_open.icon().isNull()
+
+    qapp.processEvents()
+    for action in (mw.ui.action_open, mw.ui.action_save, mw.ui.action_next_page):
+        assert not action.icon().isNull()
+    assert not mw.windowIcon().isNull()
@@ -0,0 +1,74 @@
+import sqlite3
+from threading import RLock
+
+from cbzreader.sqlite_store import LruTable, open_db
+
+schema = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT NOT NULL,
+    ind INTEGER NOT NULL,
+    nbytes INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (key, ind)
+);
+"""
+
+
+def test_open_db_drops_tables_of_other_schema_versions(tmp_path):
+    db = sqlite3.connect(str(tmp_path / "db.sqlite"))
+    db.execute("CREATE TABLE items (key TEXT)")
+    db.execute("CREATE TABLE other (key TEXT)")
+    db.commit()
+    db.close()
+
+    rebuilt = []
+    db = open_db(tmp_path / "db.sqlite", schema, 2, on_rebuild=lambda: rebuilt.append(True))
+    assert rebuilt == [True]
+    tables = [name for name, in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    assert tables == ["items"]
+    db.execute("INSERT INTO items VALUES ('a', 0, 1, 0)")
+    db.commit()
+    db.close()
+
+    db = open_db(tmp_path / "db.sqlite", schema, 2, on_rebuild=lambda: rebuilt.append(True))
+    assert rebuilt == [True]  # same version, content kept
+    assert db.execute("SELECT COUNT(*) FROM items").fetchone() == (1,)
+    db.close()
+
+
+def test_lru_table_evicts_least_recently_used(tmp_path):
+    lock = RLock()
+    db = open_db(tmp_path / "db.sqlite", schema, 1)
+    table = LruTable(db, lock, "items", ("key", "ind"), max_bytes=25)
+
+    assert table.put(("a", 0), 10) == []
+    assert table.put(("a", 1), 10) == []
+    table.touch(("a", 0))
+    assert table.put(("b", 0), 10) == [("a", 1)]
+    assert table.nbytes() == 20
+
+    assert table.put(("b", 0), 5) == []  # replaced, not counted twice
+    assert table.nbytes() == 15
+    assert table.put(("c", 0), 100) == []  # larger than whole budget
+    assert table.nbytes() == 15
+    db.close()
+
+
+def test_lru_table_budget_is_shared_by_connections(tmp_path):
+    tables = []
+    for _ in range(2):  # e.g. two readers running at the same time
+        db = open_db(tmp_path / "db.sqlite", schema, 1)
+        tables.append(LruTable(db, RLock(), "items", ("key", "ind"), max_bytes=25))
+    first, second = tables
+
+    first.put(("a", 0), 10)
+    second.put(("b", 0), 10)
+    assert first.put(("c", 0), 10) == [("a", 0)]
+    assert second.nbytes() == 20
+
+    second._db.execute("DELETE FROM items")  # evicted by other reader
+    second._db.commit()
+    assert first.put(("d", 0), 10) == []
+    assert first.nbytes() == 10
+    for table in tables:
+        table._db.close()
@@ -0,0 +1,42 @@
+import json
+from threading import Thread
+
+from cbzreader import startup_profile
+
+
+def test_startup_profile_does_nothing_unless_enabled(tmp_path):
+    assert not startup_profile.recording()
+    with startup_profile.span("stage"):
+        pass
+    startup_profile.mark("event")
+    startup_profile.finish()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_startup_profile_writes_chrome_trace(tmp_path):
+    pth = tmp_path / "trace.json"
+    startup_profile.enable(pth)
+    assert startup_profile.recording()
+
+    with startup_profile.span("outer"):
+        with startup_profile.span("inner"):
+            pass
+
+    th = Thread(target=startup_profile.mark, args=("from thread",))
+    th.start()
+    th.join()
+
+    startup_profile.finish()
+    assert not startup_profile.recording()
+    with startup_profile.span("after"):
+        pass
+
+    events = json.loads(pth.read_text())["traceEvents"]
+    names = [evt["name"] for evt in events]
+    assert names == ["profile enabled", "inner", "outer", "from thread", "profile finished"]
+
+    inner, outer = events[1:3]
+    assert inner["ph"] == outer["ph"] == "X"
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert events[3]["tid"] != outer["tid"]
@@ -0,0 +1,35 @@
+from cbzreader.thumbnail_cache import ThumbnailCache
+
+
+def test_thumbnail_cache_persists(tmp_path):
+    cache = ThumbnailCache(tmp_path / "thumbs.sqlite")
+    assert cache.get("a") is None
+    cache.put("a", b"data")
+    assert cache.get("a") == b"data"
+    cache.close()
+
+    cache = ThumbnailCache(tmp_path / "thumbs.sqlite")
+    assert cache.get("a") == b"data"
+    assert cache.nbytes() == 4
+    cache.close()
+
+
+def test_thumbnail_cache_evicts_least_recently_used(tmp_path):
+    cache = ThumbnailCache(tmp_path / "thumbs.sqlite", max_bytes=25)
+    for key in "abc":
+        cache.put(key, key.encode() * 10)
+    assert cache.get("a") is None  # over budget
+    assert cache.nbytes() == 20
+
+    cache.get("b")
+    cache.put("d", b"d" * 10)
+    assert cache.get("c") is None
+    assert cache.get("b") is not None
+    assert cache.get("d") is not None
+
+    cache.put("d", b"d" * 5)  # replaced, not counted twice
+    assert cache.nbytes() == 15
+
+    cache.put("e", b"e" * 100)  # larger than whole budget
+    assert cache.get("e") is None
+    cache.close()
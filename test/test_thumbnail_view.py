@@ -0,0 +1,88 @@
+from PyQt5.QtCore import QSize, Qt
+
+from cbzreader.explorer import Explorer
+from cbzreader.thumbnail_cache import ThumbnailCache
+from cbzreader.thumbnail_view import ThumbnailLoader, ThumbnailModel, ThumbnailView, thumbnail_size
+from small_books import make_book
+
+
+def test_thumbnail_loader_fills_persistent_cache(qapp, wait_for, tmp_path):
+    ex = Explorer(make_book(tmp_path / "book.cbz", 4, size=(300, 400)))
+    cache = ThumbnailCache(tmp_path / "thumbs.sqlite")
+    loader = ThumbnailLoader(ex, cache, size=(30, 40))
+
+    ready = {}
+    loader.thumbnail_ready.connect(lambda page, img: ready.__setitem__(page, img))
+    for page in range(4):
+        loader.request(page)
+
+    wait_for(lambda: len(ready) == 4)
+    assert ready[2].width() == 30
+    assert cache.nbytes() > 0
+
+    # second render comes from cache, not from pages
+    ex.thumbnail = None
+    assert loader.render(0)[:2] == b"\xff\xd8"
+
+    loader.stop()
+    cache.close()
+    ex.close()
+
+
+def test_thumbnail_model_only_requests_visible_cells(qapp, wait_for, tmp_path):
+    ex = Explorer(make_book(tmp_path / "book.cbz", 200, size=(30, 40)))
+    loader = ThumbnailLoader(ex, size=(30, 40))
+    requested = []
+    request = loader.request
+    loader.request = lambda page: (requested.append(page), request(page))
+
+    model = ThumbnailModel(loader)
+    view = ThumbnailView(size=(30, 40))
+    view.setModel(model)
+    view.resize(100, 150)
+    model.reset(ex.page_number())
+    view.show()
+
+    wait_for(lambda: requested and not model._requested)
+    assert 0 < len(requested) < 50
+    assert model.data(model.index(0), Qt.DecorationRole).width() == 30
+
+    loader.cancel()
+    model.reset(0)
+    assert model.rowCount() == 0
+
+    view.close()
+    loader.stop()
+    ex.close()
+
+
+def test_thumbnail_view_paints_thumbnails_at_full_size(qapp, wait_for, tmp_path):
+    ex = Explorer(make_book(tmp_path / "book.cbz", 1, size=(300, 400)))
+    loader = ThumbnailLoader(ex)
+    model = ThumbnailModel(loader)
+    view = ThumbnailView()
+    view.setModel(model)
+    view.resize(400, 400)
+    model.reset(ex.page_number())
+    view.show()
+
+    wait_for(lambda: model._pixmaps)
+    qapp.processEvents()
+    assert view.viewOptions().decorationSize == QSize(*thumbnail_size)
+
+    # page 0 is dark blue, find its extent in the painted view
+    img = view.viewport().grab().toImage()
+    xs, ys = [], []
+    for y in range(0, img.height(), 2):
+        for x in range(0, img.width(), 2):
+            col = img.pixelColor(x, y)
+            if col.red() < 40 and col.green() < 40 and col.blue() > 90:
+                xs.append(x)
+                ys.append(y)
+
+    assert max(xs) - min(xs) >= thumbnail_size[0] - 10  # 120x160 thumbnail of a 300x400 page
+    assert max(ys) - min(ys) >= 150
+
+    view.close()
+    loader.stop()
+    ex.close()